@@ -13,12 +13,15 @@ from sqlalchemy.orm import Session
 from api.dependencies import require_admin, get_db
 from models.public.user import User
 from schemas.admin_schemas import (
+    AdminStatsAICache,
     AdminStatsOverview,
     AdminStatsSubscriptions,
     AdminStatsRegistrations,
     AdminStatsRecentActivity,
+    AdminStatsRenderCache,
 )
 from services.admin_stats_service import AdminStatsService
+from services.listing_render_cache import listing_render_cache
 from shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -109,3 +112,41 @@ def get_recent_activity(
     logger.info(f"Admin {current_user.email} requested recent activity (limit={limit})")
     stats = AdminStatsService.get_recent_activity(db, limit=limit)
     return AdminStatsRecentActivity(**stats)
+
+
+@router.get(
+    "/ai-cache",
+    response_model=AdminStatsAICache,
+    summary="Get AI result cache statistics",
+    description="Get AI analysis cache hit rate (this process) and stored entries.",
+)
+def get_ai_cache(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin),
+) -> AdminStatsAICache:
+    """
+    Get AI analysis result cache statistics.
+
+    Requires admin role.
+    """
+    logger.info(f"Admin {current_user.email} requested AI cache stats")
+    stats = AdminStatsService.get_ai_cache_stats(db)
+    return AdminStatsAICache(**stats)
+
+
+@router.get(
+    "/render-cache",
+    response_model=AdminStatsRenderCache,
+    summary="Get listing render cache statistics",
+    description="Get the hit rate of the title/description/aspects render cache (this process).",
+)
+def get_render_cache(
+    current_user: User = Depends(require_admin),
+) -> AdminStatsRenderCache:
+    """
+    Get listing render cache statistics.
+
+    Requires admin role.
+    """
+    logger.info(f"Admin {current_user.email} requested render cache stats")
+    return AdminStatsRenderCache(**listing_render_cache.stats())
@@ -10,6 +10,7 @@ Business Rules (Updated 2025-12-09):
 - Support multilingue (EN par défaut, FR disponible)
 - Extensible: nouveaux attributs automatiquement disponibles
 - Données en cache côté client recommandé
+- Servies depuis le catalogue de référence en mémoire (services/reference_catalog.py)
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
@@ -38,6 +39,7 @@ from models.public.stretch import Stretch
 from models.public.trend import Trend
 from models.public.condition_sup import ConditionSup
 from models.public.unique_feature import UniqueFeature
+from services.reference_catalog import get_reference_catalog
 from shared.clothing_visibility_config import ALL_CLOTHING_ATTRIBUTES, CLOTHING_VISIBILITY_CONFIG
 from shared.database import get_db
 
@@ -206,7 +208,7 @@ def _get_label_for_item(item, config: dict, lang: str) -> str:
     Récupère le label d'un item selon la langue et la configuration.
 
     Args:
-        item: L'objet modèle SQLAlchemy
+        item: L'entrée du catalogue de référence (ou objet modèle SQLAlchemy)
         config: Configuration de l'attribut
         lang: Code langue (en, fr, de, etc.)
 
@@ -301,20 +303,16 @@ def get_attributes(
             detail=f"Attribute type '{attribute_type}' not found. Available types: {', '.join(ATTRIBUTE_MODELS.keys())}"
         )
 
-    model = ATTRIBUTE_MODELS[attribute_type]
     config = ATTRIBUTE_CONFIG[attribute_type]
 
-    # Construire la requête
-    query = db.query(model)
+    # Lecture depuis le catalogue de référence en mémoire (aucune requête)
+    table = get_reference_catalog(db).table(attribute_type)
 
     # Appliquer la recherche si supportée et fournie
     if search and config.get("supports_search", False):
-        search_field = config.get("search_field", "name")
-        field_attr = getattr(model, search_field)
-        query = query.filter(field_attr.ilike(f"%{search}%"))
-
-    # Appliquer la limite
-    items = query.limit(limit).all()
+        items = table.search(config.get("search_field", "name"), search, limit)
+    else:
+        items = list(table)[:limit]
 
     # Construire les résultats
     result = []
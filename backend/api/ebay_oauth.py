@@ -29,6 +29,7 @@ from models.public.user import User
 from models.user.ebay_credentials import EbayCredentials
 from shared.exceptions import EbayError
 from shared.html_templates import build_oauth_success_html, build_oauth_error_html
+from shared.tenant_resource_cache import tenant_resource_cache
 from services.ebay.ebay_oauth_service import (
     extract_user_id_from_state,
     generate_auth_url,
@@ -191,7 +192,7 @@ def disconnect_ebay(
     Returns:
         dict: Success status
     """
-    db, _ = db_user
+    db, current_user = db_user
     ebay_creds = db.query(EbayCredentials).first()
 
     if not ebay_creds:
@@ -209,6 +210,9 @@ def disconnect_ebay(
 
     db.commit()
 
+    # Drop cached credentials used by Temporal activities
+    tenant_resource_cache.invalidate(current_user.id, "ebay")
+
     return {"success": True, "message": "eBay account disconnected successfully"}
 
 
@@ -16,6 +16,7 @@ Author: Claude
 Date: 2026-01-22
 """
 
+import time
 from datetime import datetime
 from typing import Any
 
@@ -50,6 +51,7 @@ class PendingActionProductResponse(BaseModel):
     brand: str | None = None
     status: str
     image_url: str | None = None
+    thumbnail_url: str | None = None
 
 
 class PendingActionResponse(BaseModel):
@@ -154,7 +156,11 @@ async def _trigger_batch_cleanup_workflows(actions: list[PendingAction], user_id
 
     Groups by marketplace:
     - Vinted → ONE VintedBatchCleanupWorkflow (sequential, no parallel plugin calls)
-    - eBay → Individual EbayCleanupWorkflow per product (direct API, parallel OK)
+    - eBay → ONE EbayBatchActionWorkflow "cleanup" (direct API, parallel items)
+
+    Workflow IDs are suffixed with a timestamp (like start_batch_action): two
+    confirmations of the same number of products must not collide while the
+    first batch is still running.
 
     Fire-and-forget: logs warnings on failure but never raises.
     """
@@ -185,7 +191,7 @@ async def _trigger_batch_cleanup_workflows(actions: list[PendingAction], user_id
             await client.start_workflow(
                 VintedBatchCleanupWorkflow.run,
                 VintedBatchCleanupParams(user_id=user_id, product_ids=vinted_product_ids),
-                id=f"vinted-batch-cleanup-user-{user_id}-{len(vinted_product_ids)}p",
+                id=f"vinted-batch-cleanup-user-{user_id}-{int(time.time() * 1000)}",
                 task_queue=config.temporal_vinted_task_queue,
             )
             logger.info(
@@ -194,30 +200,29 @@ async def _trigger_batch_cleanup_workflows(actions: list[PendingAction], user_id
         except Exception as e:
             logger.warning(f"Failed to start Vinted batch cleanup: {e}")
 
-    # eBay: individual workflows (direct API, parallel OK)
+    # eBay: ONE batch workflow (direct API, items processed in parallel)
     if ebay_product_ids:
         try:
             from temporal.client import get_temporal_client
-            from temporal.workflows.ebay.cleanup_workflow import (
-                EbayCleanupWorkflow,
-                EbayCleanupParams,
-            )
+            from temporal.workflows.batch_action_workflow import BatchActionParams
+            from temporal.workflows.ebay.batch_action_workflow import EbayBatchActionWorkflow
 
             client = await get_temporal_client()
-            for product_id in ebay_product_ids:
-                try:
-                    await client.start_workflow(
-                        EbayCleanupWorkflow.run,
-                        EbayCleanupParams(user_id=user_id, product_id=product_id),
-                        id=f"ebay-cleanup-product-{product_id}",
-                        task_queue=config.temporal_task_queue,
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to start eBay cleanup for product #{product_id}: {e}")
-
-            logger.info(f"Started eBay cleanup workflows for {len(ebay_product_ids)} products")
+            await client.start_workflow(
+                EbayBatchActionWorkflow.run,
+                BatchActionParams(
+                    user_id=user_id,
+                    action="cleanup",
+                    product_ids=ebay_product_ids,
+                ),
+                id=f"ebay-batch-cleanup-user-{user_id}-{int(time.time() * 1000)}",
+                task_queue=config.temporal_task_queue,
+            )
+            logger.info(
+                f"Started eBay batch cleanup workflow for {len(ebay_product_ids)} products"
+            )
         except Exception as e:
-            logger.warning(f"Failed to start eBay cleanup workflows: {e}")
+            logger.warning(f"Failed to start eBay batch cleanup: {e}")
 
 
 # =============================================================================
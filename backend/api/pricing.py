@@ -18,13 +18,27 @@ import time
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
-from api.dependencies import get_current_user, get_user_db
+from api.dependencies import get_current_user, get_db, get_user_db, require_admin
 from models.public.user import User
 from repositories.brand_group_repository import BrandGroupRepository
 from repositories.model_repository import ModelRepository
-from schemas.pricing import PriceInput, PriceOutput
+from models.user.product import ProductStatus
+from schemas.pricing import (
+    PriceInput,
+    PriceOutput,
+    PricingCoefficientsInfo,
+    RepriceAllRequest,
+    RepriceAllResponse,
+    RepriceItem,
+)
+from services.pricing.bulk_pricing import BulkPricingService
+from services.pricing.coefficient_snapshot import (
+    get_pricing_coefficients,
+    invalidate_pricing_coefficients,
+)
 from services.pricing.pricing_generation_service import PricingGenerationService
 from services.pricing_service import PricingService
+from shared.access_control import ensure_can_modify
 from shared.exceptions import (
     BrandGroupGenerationError,
     GroupDeterminationError,
@@ -179,3 +193,125 @@ async def calculate_price(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="An unexpected error occurred during price calculation"
         )
+
+
+@router.post(
+    "/coefficients/reload",
+    response_model=PricingCoefficientsInfo,
+    status_code=status.HTTP_200_OK,
+    summary="Reload pricing coefficients (admin)",
+    description="Reload the in-memory coefficient snapshot after editing condition/origin/decade/trend/feature/fit coefficients"
+)
+def reload_pricing_coefficients(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_admin),
+) -> PricingCoefficientsInfo:
+    """
+    Reload the pricing coefficient snapshot of this process.
+
+    Other processes pick up the change within the snapshot TTL.
+
+    Requires admin role.
+    """
+    invalidate_pricing_coefficients()
+    coefficients = get_pricing_coefficients(db)
+
+    logger.info(
+        f"[API:pricing] Admin {current_user.email} reloaded coefficients "
+        f"(version={coefficients.version})"
+    )
+
+    return PricingCoefficientsInfo(
+        version=coefficients.version,
+        conditions=len(coefficients.condition),
+        origins=len(coefficients.origin),
+        decades=len(coefficients.decade),
+        trends=len(coefficients.trend),
+        features=len(coefficients.feature),
+        fits=len(coefficients.fit),
+    )
+
+
+@router.post(
+    "/reprice-all",
+    response_model=RepriceAllResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Reprice the whole inventory",
+    description="Compute the 3 price levels of every product in set-based queries, optionally writing one level"
+)
+def reprice_all(
+    request: RepriceAllRequest,
+    db_user: tuple[Session, User] = Depends(get_user_db),
+) -> RepriceAllResponse:
+    """
+    Reprice all products of the user (bulk pricing engine).
+
+    Uses existing BrandGroups/Models only (no LLM generation): products
+    without BrandGroup are reported as NO_BRAND_GROUP. With apply=true the
+    chosen level is written with an optimistic version check; products
+    edited meanwhile are reported as conflicts and left unchanged.
+
+    Business Rules:
+    - apply=true: SUPPORT cannot write (read-only role)
+    - SOLD products are immutable: "sold" is rejected with apply=true
+
+    Raises:
+        HTTPException 400: Unknown product status, or "sold" with apply=true
+        HTTPException 403: apply=true by SUPPORT
+    """
+    db, user = db_user
+    start_time = time.time()
+
+    if request.apply:
+        ensure_can_modify(user, "produit")
+
+    try:
+        statuses = [ProductStatus(s) for s in request.statuses]
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if request.apply and ProductStatus.SOLD in statuses:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="SOLD products are immutable: remove 'sold' from statuses or use apply=false",
+        )
+
+    items = BulkPricingService.load_tenant_items(db, statuses=statuses)
+    results = BulkPricingService.price_items(db, items)
+
+    updated: set[int] = set()
+    conflicts: set[int] = set()
+    if request.apply:
+        updated, conflicts = BulkPricingService.apply_prices(db, results, request.price_level)
+        db.commit()
+
+    elapsed_ms = round((time.time() - start_time) * 1000, 2)
+    logger.info(
+        f"[API:pricing] Reprice-all user={user.id}: {len(results)} products, "
+        f"{len(updated)} updated, {len(conflicts)} conflicts ({elapsed_ms}ms)"
+    )
+
+    return RepriceAllResponse(
+        total=len(results),
+        priced=sum(1 for r in results if r.status == "OK"),
+        no_brand_group=sum(1 for r in results if r.status == "NO_BRAND_GROUP"),
+        errors=sum(1 for r in results if r.status == "ERROR"),
+        updated=len(updated),
+        conflicts=len(conflicts),
+        elapsed_ms=elapsed_ms,
+        items=[
+            RepriceItem(
+                product_id=r.item.product_id,
+                status=r.status,
+                error=r.error,
+                group=r.group,
+                current_price=r.item.current_price,
+                quick_price=r.quick_price,
+                standard_price=r.standard_price,
+                premium_price=r.premium_price,
+                applied=r.item.product_id in updated,
+                conflict=r.item.product_id in conflicts,
+            )
+            for r in results
+        ],
+    )
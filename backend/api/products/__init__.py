@@ -7,10 +7,13 @@ Structure:
 - crud.py: Basic CRUD operations (create, read, update, delete, status)
 - images.py: Image management (upload, delete, reorder)
 - ai.py: AI-powered features (description generation, image analysis)
+- export.py: Streaming catalog export (CSV / NDJSON)
+- bulk_import.py: Bulk catalog import (CSV / NDJSON)
 
 Author: Claude
 Date: 2025-12-09
 Refactored: 2026-01-05 - Split into multiple modules
+Updated: 2026-02-04 - Catalog export and import routers
 """
 
 from fastapi import APIRouter
@@ -18,11 +21,16 @@ from fastapi import APIRouter
 from api.products.crud import router as crud_router
 from api.products.images import router as images_router
 from api.products.ai import router as ai_router
+from api.products.export import router as export_router
+from api.products.bulk_import import router as import_router
 
 # Main router that combines all sub-routers
 router = APIRouter(prefix="/products", tags=["Products"])
 
 # Include all sub-routers
+# export/import first: /export must not be matched by crud's GET /{product_id}
+router.include_router(export_router)
+router.include_router(import_router)
 router.include_router(crud_router)
 router.include_router(images_router)
 router.include_router(ai_router)
@@ -1,19 +1,26 @@
 """
 Product AI Routes
 
-Routes for AI-powered product features: image analysis.
+Routes for AI-powered product features: image analysis (single product,
+direct upload, batch via Temporal).
 
 Author: Claude
 Date: 2025-12-09
 Refactored: 2026-01-05 - Split from api/products.py
 """
 
+import time
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
 from sqlalchemy.orm import Session
 
 from api.dependencies import get_user_db
+from schemas.ai_schemas import (
+    AIBatchAnalysisRequest,
+    AIBatchAnalysisResponse,
+    AIBatchSignalResponse,
+)
 from services.product_service import ProductService
 from shared.access_control import ensure_user_owns_resource, ensure_can_modify
 from shared.logging import get_logger
@@ -53,12 +60,13 @@ async def analyze_product_images(
         403 FORBIDDEN: Si USER essaie d'analyser le produit d'un autre ou si SUPPORT
         404 NOT FOUND: Si produit non trouvé
         401 UNAUTHORIZED: Si pas authentifié
+        503 SERVICE UNAVAILABLE: Si trop d'analyses IA en cours
         500 INTERNAL SERVER ERROR: Si erreur API Gemini
     """
     from schemas.ai_schemas import AIVisionAnalysisResponse
     from services.ai import AIVisionService
     from shared.config import settings
-    from shared.exceptions import AIGenerationError, AIQuotaExceededError
+    from shared.exceptions import AIGenerationError, AIQuotaExceededError, AIServiceBusyError
 
     db, current_user = user_db
 
@@ -128,6 +136,12 @@ async def analyze_product_images(
             status_code=status.HTTP_402_PAYMENT_REQUIRED,
             detail=str(e),
         )
+    except AIServiceBusyError as e:
+        logger.warning(f"[API:products] analyze_images rejected (AI busy): {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+        )
     except AIGenerationError as e:
         logger.error(f"[API:products] analyze_images failed: {e}", exc_info=True)
         raise HTTPException(
@@ -161,12 +175,13 @@ async def analyze_images_direct(
         400 BAD REQUEST: Si aucune image fournie
         402 PAYMENT REQUIRED: Si crédits insuffisants
         401 UNAUTHORIZED: Si pas authentifié
+        503 SERVICE UNAVAILABLE: Si trop d'analyses IA en cours
         500 INTERNAL SERVER ERROR: Si erreur API Gemini
     """
     from schemas.ai_schemas import AIVisionAnalysisResponse
     from services.ai import AIVisionService
     from shared.config import settings
-    from shared.exceptions import AIGenerationError, AIQuotaExceededError
+    from shared.exceptions import AIGenerationError, AIQuotaExceededError, AIServiceBusyError
 
     db, current_user = user_db
 
@@ -248,9 +263,205 @@ async def analyze_images_direct(
             status_code=status.HTTP_402_PAYMENT_REQUIRED,
             detail=str(e),
         )
+    except AIServiceBusyError as e:
+        logger.warning(f"[API:products] analyze_images_direct rejected (AI busy): {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+        )
     except AIGenerationError as e:
         logger.error(f"[API:products] analyze_images_direct failed: {e}", exc_info=True)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e),
         )
+
+
+# =============================================================================
+# BATCH ANALYSIS (Temporal)
+# =============================================================================
+
+
+@router.post(
+    "/batch-analyze-images",
+    response_model=AIBatchAnalysisResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def start_batch_analysis(
+    request: AIBatchAnalysisRequest,
+    user_db: tuple = Depends(get_user_db),
+):
+    """
+    Lance l'analyse IA d'un lot de produits (AIBatchAnalysisWorkflow).
+
+    Business Rules:
+    - SUPPORT: lecture seule (ne peut pas analyser)
+    - Les produits introuvables ou sans photo sont ignorés (skipped_product_ids)
+    - Les crédits du lot entier sont réservés au lancement; ceux non
+      consommés (cache, échecs, annulation) sont rendus en fin de lot
+    - Résultats poussés par produit via Socket.IO ("ai_batch_result")
+    - Progression: GET /workflows/{workflow_id}/progress
+    - Pause/reprise: POST /products/batch-analyze-images/{workflow_id}/pause|resume
+    - Annulation: POST /workflows/{workflow_id}/cancel
+
+    Raises:
+        400 BAD REQUEST: Si aucun produit analysable
+        402 PAYMENT REQUIRED: Si crédits insuffisants pour le lot
+        403 FORBIDDEN: Si SUPPORT
+        503 SERVICE UNAVAILABLE: Si Temporal est désactivé
+    """
+    from models.user.product import Product
+    from models.user.product_image import ProductImage
+    from services.ai import AIVisionService
+    from shared.config import settings
+    from shared.exceptions import AIQuotaExceededError
+    from temporal.client import get_temporal_client
+    from temporal.config import get_temporal_config
+    from temporal.workflows.ai import AIBatchAnalysisParams, AIBatchAnalysisWorkflow
+
+    db, current_user = user_db
+    ensure_can_modify(current_user, "produit")
+
+    config = get_temporal_config()
+    if not config.temporal_enabled:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Temporal is disabled",
+        )
+
+    # Deduplicate while keeping order
+    requested_ids = list(dict.fromkeys(request.product_ids))
+
+    # One query: existing products with at least one photo (labels excluded)
+    analyzable = {
+        row.id
+        for row in db.query(Product.id)
+        .join(ProductImage, ProductImage.product_id == Product.id)
+        .filter(
+            Product.id.in_(requested_ids),
+            Product.deleted_at.is_(None),
+            ProductImage.is_label.is_(False),
+        )
+        .distinct()
+        .all()
+    }
+    product_ids = [pid for pid in requested_ids if pid in analyzable]
+    skipped = [pid for pid in requested_ids if pid not in analyzable]
+
+    if not product_ids:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Aucun produit du lot n'a de photo à analyser.",
+        )
+
+    monthly_credits = 0
+    max_images = 5
+    if current_user.subscription_quota:
+        monthly_credits = current_user.subscription_quota.ai_credits_monthly or 0
+        max_images = current_user.subscription_quota.ai_max_images_per_analysis or 5
+
+    try:
+        reserved = AIVisionService.reserve_credits(
+            db, current_user.id, monthly_credits, len(product_ids)
+        )
+    except AIQuotaExceededError as e:
+        raise HTTPException(
+            status_code=status.HTTP_402_PAYMENT_REQUIRED,
+            detail=str(e),
+        )
+
+    params = AIBatchAnalysisParams(
+        user_id=current_user.id,
+        action="analyze",
+        product_ids=product_ids,
+        max_parallel=min(request.max_parallel, settings.gemini_max_concurrent_calls),
+        reserved_credits=reserved,
+        max_images=max_images,
+    )
+    workflow_id = f"ai-batch-analyze-user-{current_user.id}-{int(time.time() * 1000)}"
+
+    try:
+        client = await get_temporal_client()
+        await client.start_workflow(
+            AIBatchAnalysisWorkflow.run,
+            params,
+            id=workflow_id,
+            task_queue=config.temporal_task_queue,
+        )
+    except Exception as e:
+        AIVisionService.release_credits(db, current_user.id, reserved)
+        logger.error(
+            f"[API:products] batch_analyze start failed for user {current_user.id}: {e}"
+        )
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to start batch analysis: {str(e)}",
+        )
+
+    logger.info(
+        f"[API:products] batch_analyze started {workflow_id}: "
+        f"{len(product_ids)} products, {len(skipped)} skipped"
+    )
+
+    return AIBatchAnalysisResponse(
+        workflow_id=workflow_id,
+        total=len(product_ids),
+        reserved_credits=reserved,
+        skipped_product_ids=skipped,
+    )
+
+
+async def _signal_batch_analysis(workflow_id: str, user_id: int, signal: str) -> None:
+    """Send a signal to one of the user's batch analysis workflows."""
+    from temporal.client import get_temporal_client
+    from temporal.config import get_temporal_config
+
+    if not get_temporal_config().temporal_enabled:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Temporal is disabled",
+        )
+
+    if not workflow_id.startswith(f"ai-batch-analyze-user-{user_id}-"):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not authorized to access this workflow",
+        )
+
+    try:
+        client = await get_temporal_client()
+        await client.get_workflow_handle(workflow_id).signal(signal)
+    except Exception as e:
+        logger.error(f"[API:products] batch_analyze {signal} failed for {workflow_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to {signal} batch analysis: {str(e)}",
+        )
+
+
+@router.post(
+    "/batch-analyze-images/{workflow_id}/pause",
+    response_model=AIBatchSignalResponse,
+)
+async def pause_batch_analysis(
+    workflow_id: str,
+    user_db: tuple = Depends(get_user_db),
+):
+    """Met en pause une analyse par lot (les analyses en cours se terminent)."""
+    _, current_user = user_db
+    await _signal_batch_analysis(workflow_id, current_user.id, "pause")
+    return AIBatchSignalResponse(workflow_id=workflow_id, status="pause_requested")
+
+
+@router.post(
+    "/batch-analyze-images/{workflow_id}/resume",
+    response_model=AIBatchSignalResponse,
+)
+async def resume_batch_analysis(
+    workflow_id: str,
+    user_db: tuple = Depends(get_user_db),
+):
+    """Reprend une analyse par lot mise en pause."""
+    _, current_user = user_db
+    await _signal_batch_analysis(workflow_id, current_user.id, "resume")
+    return AIBatchSignalResponse(workflow_id=workflow_id, status="resume_requested")
@@ -0,0 +1,93 @@
+"""
+Product Import Routes
+
+Bulk catalog import: POST /products/import (CSV or NDJSON file).
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+from typing import Literal
+
+from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
+
+from api.dependencies import get_user_db
+from models.public.user import UserRole
+from schemas.product_schemas import ProductImportResponse
+from services.product_import import ProductImportService
+from shared.access_control import ensure_can_modify
+from shared.logging import get_logger
+from shared.subscription_limits import check_product_limit
+
+logger = get_logger(__name__)
+
+router = APIRouter()
+
+
+@router.post("/import", response_model=ProductImportResponse)
+def import_products(
+    file: UploadFile = File(..., description="Fichier CSV ou NDJSON (UTF-8)"),
+    import_format: Literal["csv", "ndjson"] = Query("csv", alias="format", description="csv ou ndjson"),
+    user_db: tuple = Depends(get_user_db),
+) -> ProductImportResponse:
+    """
+    Importe un catalogue de produits en masse.
+
+    Business Rules (2026-02-04):
+    - Authentification requise, schema user_X uniquement
+    - Mêmes règles que POST /products (attributs validés contre le catalogue,
+      taille ajustée, status DRAFT), produits sans prix tarifés automatiquement
+    - Lignes invalides ignorées et rapportées (numéro de ligne + erreurs)
+    - Limite de produits: les lignes au-delà du quota sont rejetées (sauf ADMIN)
+
+    Format:
+        - CSV: en-tête avec les noms de colonnes (title, description, price,
+          category, brand, condition, colors, materials...), listes séparées par "|"
+        - NDJSON: un objet JSON par ligne, listes en tableaux
+
+    Raises:
+        400 BAD REQUEST: Si le fichier est illisible
+        403 FORBIDDEN: Si limite de produits atteinte ou si SUPPORT
+    """
+    db, current_user = user_db
+
+    logger.info(
+        f"[API:products] import_products: user_id={current_user.id}, "
+        f"format={import_format}, filename={file.filename}"
+    )
+
+    # SUPPORT ne peut pas créer de produits (lecture seule)
+    ensure_can_modify(current_user, "produit")
+
+    max_new_products = None
+    if current_user.role != UserRole.ADMIN:
+        current_count, max_allowed = check_product_limit(current_user, db)
+        max_new_products = max_allowed - current_count
+
+    try:
+        report = ProductImportService.import_stream(
+            db, file.file, import_format, max_new_products=max_new_products
+        )
+        db.commit()
+    except (ValueError, UnicodeDecodeError) as e:
+        db.rollback()
+        logger.error(
+            f"[API:products] import_products failed: user_id={current_user.id}, error={e}",
+            exc_info=True
+        )
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Fichier invalide: {e}")
+
+    logger.info(
+        f"[API:products] import_products success: user_id={current_user.id}, "
+        f"imported={report.imported}/{report.total}, elapsed_ms={report.elapsed_ms}"
+    )
+
+    return ProductImportResponse(
+        total=report.total,
+        imported=report.imported,
+        failed=report.failed,
+        priced=report.priced,
+        ignored_columns=report.ignored_columns,
+        errors=[{"row": e.row, "error": e.error} for e in report.errors],
+        elapsed_ms=report.elapsed_ms,
+    )
@@ -6,26 +6,32 @@ Basic CRUD operations for products: create, read, update, delete, status.
 Author: Claude
 Date: 2025-12-09
 Refactored: 2026-01-05 - Split from api/products.py
+Updated: 2026-02-04 - Bulk status/field updates applied in one UPDATE
+Updated: 2026-02-04 - GET /products/grid served from the product_list_items projection
 """
 
 import math
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from api.dependencies import get_current_user, get_user_db
 from models.public.user import User, UserRole
 from models.user.product import ProductStatus
 from schemas.product_schemas import (
+    BulkProductUpdateRequest,
     BulkStatusUpdateRequest,
     BulkStatusUpdateResponse,
     BulkStatusUpdateResult,
     ProductCreate,
+    ProductGridResponse,
+    ProductListItemResponse,
     ProductListResponse,
     ProductResponse,
     ProductUpdate,
 )
 from models.user.pending_action import PendingActionType
+from services.product_list_projection import ProductListProjection
 from services.product_service import ProductService
 from services.pending_action_service import PendingActionService
 from shared.subscription_limits import check_product_limit
@@ -225,6 +231,50 @@ def list_products(
     )
 
 
+@router.get("/grid", response_model=ProductGridResponse, status_code=status.HTTP_200_OK)
+def list_products_grid(
+    page: int = Query(1, ge=1, description="Numéro de page (1-indexed, défaut: 1)"),
+    limit: int = Query(20, ge=1, le=100, description="Nombre max de résultats (max 100)"),
+    status_filter: ProductStatus | None = Query(None, alias="status", description="Filtre par status"),
+    category: str | None = Query(None, description="Filtre par catégorie"),
+    brand: str | None = Query(None, description="Filtre par marque"),
+    search: str | None = Query(None, description="Recherche par ID, titre ou marque"),
+    user_db: tuple = Depends(get_user_db),
+) -> Response:
+    """
+    Liste allégée des produits pour la grille (mêmes filtres que GET /products).
+
+    Business Rules (2026-02-04):
+    - Authentification requise, schema user_X uniquement
+    - Lue depuis la projection product_list_items (maintenue par triggers):
+      une requête indexée, pas de chargement des relations
+    - Colonnes affichées par la liste uniquement (première photo, couleurs,
+      matières, liens Vinted/eBay); le détail reste sur GET /products/{id}
+    - Ignore les produits supprimés, tri created_at DESC
+    - Pagination: page/limit (max 100 items par page)
+
+    La réponse est construite sans validation (model_construct) et
+    sérialisée directement: pas de seconde validation par FastAPI.
+    """
+    db, current_user = user_db
+
+    skip = (page - 1) * limit
+    rows, total = ProductListProjection.list_items(
+        db, skip=skip, limit=limit, status=status_filter, category=category, brand=brand, search=search
+    )
+
+    total_pages = math.ceil(total / limit) if total > 0 else 1
+
+    grid = ProductGridResponse.model_construct(
+        items=[ProductListItemResponse.from_row(row) for row in rows],
+        total=total,
+        page=page,
+        page_size=limit,
+        total_pages=total_pages,
+    )
+    return Response(content=grid.model_dump_json(), media_type="application/json")
+
+
 @router.get("/{product_id}", response_model=ProductResponse, status_code=status.HTTP_200_OK)
 def get_product(
     product_id: int,
@@ -404,81 +454,100 @@ def bulk_update_status(
     # SUPPORT ne peut pas modifier (lecture seule)
     ensure_can_modify(current_user, "produit")
 
-    # Convert string status to enum
-    status_map = {
-        'draft': ProductStatus.DRAFT,
-        'published': ProductStatus.PUBLISHED,
-        'sold': ProductStatus.SOLD,
-        'archived': ProductStatus.ARCHIVED,
-    }
-    target_status = status_map[request.status]
-
-    results: list[BulkStatusUpdateResult] = []
-    success_count = 0
-    error_count = 0
-    sold_product_ids: list[int] = []
-
-    for product_id in request.product_ids:
-        try:
-            # Get product to verify ownership
-            product = ProductService.get_product_by_id(db, product_id)
-
-            if not product:
-                results.append(BulkStatusUpdateResult(
-                    product_id=product_id,
-                    success=False,
-                    error=f"Produit {product_id} non trouvé"
-                ))
-                error_count += 1
-                continue
-
-            # Verify ownership (ADMIN can modify all, USER only their own)
-            try:
-                ensure_user_owns_resource(current_user, product, "produit", allow_support=False)
-            except HTTPException:
-                results.append(BulkStatusUpdateResult(
-                    product_id=product_id,
-                    success=False,
-                    error="Vous n'êtes pas propriétaire de ce produit"
-                ))
-                error_count += 1
-                continue
-
-            # Update status (validates transitions and publication requirements)
-            ProductService.update_product_status(db, product_id, target_status)
-
-            results.append(BulkStatusUpdateResult(
-                product_id=product_id,
-                success=True,
-                error=None
-            ))
-            success_count += 1
-
-            if target_status == ProductStatus.SOLD:
-                sold_product_ids.append(product_id)
-
-        except ValueError as e:
-            results.append(BulkStatusUpdateResult(
-                product_id=product_id,
-                success=False,
-                error=str(e)
-            ))
-            error_count += 1
+    target_status = ProductStatus(request.status)
+
+    # One SELECT + one UPDATE for all products (ownership: schema isolation)
+    updated, errors = ProductService.bulk_update(
+        db, request.product_ids, new_status=target_status
+    )
 
     # Create pending actions for Vinted listings on products marked SOLD
-    for pid in sold_product_ids:
-        _create_vinted_cleanup_pending_action(db, pid)
+    if target_status == ProductStatus.SOLD:
+        for pid in sorted(updated):
+            _create_vinted_cleanup_pending_action(db, pid)
+
+    response = _bulk_update_response(request.product_ids, updated, errors)
 
     logger.info(
         f"[API:products] bulk_update_status completed: user_id={current_user.id}, "
-        f"success={success_count}, errors={error_count}"
+        f"success={response.success_count}, errors={response.error_count}"
     )
 
+    return response
+
+
+@router.patch("/bulk", response_model=BulkStatusUpdateResponse, status_code=status.HTTP_200_OK)
+def bulk_update_products(
+    request: BulkProductUpdateRequest,
+    user_db: tuple = Depends(get_user_db),
+) -> BulkStatusUpdateResponse:
+    """
+    Applique les mêmes champs (et/ou statut) à plusieurs produits en une requête.
+
+    Business Rules (2026-02-04):
+    - Authentification requise, SUPPORT en lecture seule
+    - Max 1000 produits, un seul UPDATE en base
+    - Champs: ceux de PUT /products/{id}, sauf couleurs/matières/états (M2M)
+    - Mêmes règles que la mise à jour unitaire: produits SOLD non modifiables,
+      transitions de statut, validation pour PUBLISHED, attributs FK validés
+    - Verrouillage optimiste: expected_versions (optionnel) par produit
+    - Retourne succès/erreur pour chaque produit
+
+    Raises:
+        400 BAD REQUEST: Si un champ ou attribut FK est invalide
+        403 FORBIDDEN: Si SUPPORT essaie de modifier
+    """
+    db, current_user = user_db
+
+    logger.info(
+        f"[API:products] bulk_update_products: user_id={current_user.id}, "
+        f"product_count={len(request.product_ids)}, status={request.status}"
+    )
+
+    ensure_can_modify(current_user, "produit")
+
+    update_dict = request.updates.model_dump(exclude_unset=True) if request.updates else {}
+    target_status = ProductStatus(request.status) if request.status else None
+
+    try:
+        updated, errors = ProductService.bulk_update(
+            db, request.product_ids, update_dict, target_status, request.expected_versions
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if target_status == ProductStatus.SOLD:
+        for pid in sorted(updated):
+            _create_vinted_cleanup_pending_action(db, pid)
+
+    response = _bulk_update_response(request.product_ids, updated, errors)
+
+    logger.info(
+        f"[API:products] bulk_update_products completed: user_id={current_user.id}, "
+        f"success={response.success_count}, errors={response.error_count}"
+    )
+
+    return response
+
+
+def _bulk_update_response(
+    product_ids: list[int], updated: set[int], errors: dict[int, str]
+) -> BulkStatusUpdateResponse:
+    """Per-product results of a bulk update, in request order."""
+    results = [
+        BulkStatusUpdateResult(
+            product_id=product_id,
+            success=product_id in updated,
+            error=None if product_id in updated else errors.get(product_id),
+        )
+        for product_id in product_ids
+    ]
+    success_count = sum(1 for result in results if result.success)
     return BulkStatusUpdateResponse(
-        total=len(request.product_ids),
+        total=len(product_ids),
         success_count=success_count,
-        error_count=error_count,
-        results=results
+        error_count=len(results) - success_count,
+        results=results,
     )
 
 
@@ -0,0 +1,81 @@
+"""
+Product Export Routes
+
+Streaming catalog export: GET /products/export (CSV or NDJSON, optional gzip).
+
+The rows are read while the response streams, through a server-side cursor
+on a tenant session owned by the stream: the get_user_db session is closed
+as soon as the route returns, before the body is sent.
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+from datetime import datetime
+from typing import Iterator, Literal
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+from api.dependencies import get_user_db
+from models.user.product import ProductStatus
+from services.product_export import ProductExportService
+from shared.database import get_tenant_session
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+router = APIRouter()
+
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "ndjson": "application/x-ndjson"}
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_products(
+    export_format: Literal["csv", "ndjson"] = Query("csv", alias="format", description="csv ou ndjson"),
+    gzip: bool = Query(False, description="Compresser l'export (gzip)"),
+    status_filter: ProductStatus | None = Query(None, alias="status", description="Filtre par status"),
+    category: str | None = Query(None, description="Filtre par catégorie"),
+    brand: str | None = Query(None, description="Filtre par marque"),
+    user_db: tuple = Depends(get_user_db),
+) -> StreamingResponse:
+    """
+    Exporte le catalogue du user en streaming.
+
+    Business Rules (2026-02-04):
+    - Authentification requise, schema user_X uniquement
+    - Ignore les produits supprimés (deleted_at NOT NULL)
+    - Tri par ID
+    - Colonnes CSV: identifiants, fiche technique, images, liens Vinted/eBay
+    - Mémoire constante: curseur serveur + sérialisation par lots
+
+    Query Parameters:
+        - format: csv (défaut) ou ndjson
+        - gzip: true pour un fichier .gz
+        - status, category, brand: filtres (comme GET /products)
+    """
+    _, current_user = user_db  # schema validated by get_user_db
+    user_id = current_user.id
+    stmt = ProductExportService.build_query(status=status_filter, category=category, brand=brand)
+
+    logger.info(f"[API:products] export: user_id={user_id}, format={export_format}, gzip={gzip}")
+
+    def stream() -> Iterator[str]:
+        db = get_tenant_session(user_id)
+        try:
+            records = ProductExportService.iter_records(db, stmt)
+            if export_format == "csv":
+                yield from ProductExportService.iter_csv(records)
+            else:
+                yield from ProductExportService.iter_ndjson(records)
+        finally:
+            db.close()
+
+    body = ProductExportService.gzip_chunks(stream()) if gzip else stream()
+    filename = f"stoflow-products-{datetime.now():%Y%m%d}.{export_format}" + (".gz" if gzip else "")
+
+    return StreamingResponse(
+        body,
+        media_type="application/gzip" if gzip else MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
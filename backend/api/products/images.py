@@ -80,19 +80,21 @@ async def upload_product_image(
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-    # Sauvegarder l'image sur R2
+    # Sauvegarder l'image sur R2 (+ variantes thumbnail/medium)
     try:
-        image_url = await FileService.save_product_image(user_id, product_id, file)
+        stored = await FileService.save_product_image_with_variants(user_id, product_id, file)
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     # Ajouter en table product_images
     try:
-        image_dict = ProductService.add_image(db, product_id, image_url, display_order)
+        image_dict = ProductService.add_image(
+            db, product_id, stored.url, display_order, **stored.metadata()
+        )
         return ProductImageItem(**image_dict)
     except ValueError as e:
         # Si erreur BDD, supprimer le fichier uploadé sur R2
-        await FileService.delete_product_image(image_url)
+        await FileService.delete_product_image(stored.url, stored.variant_urls())
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
@@ -139,14 +141,17 @@ async def delete_product_image(
 
     # Vérifier que l'image existe dans le produit (using service, not JSONB)
     images = ProductService.get_images(db, product_id)
-    if not any(img.get("url") == image_url for img in images):
+    image = next((img for img in images if img.get("url") == image_url), None)
+    if image is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Image not found in product {product_id}",
         )
 
-    # Supprimer le fichier R2
-    await FileService.delete_product_image(image_url)
+    # Supprimer le fichier R2 (+ variantes)
+    await FileService.delete_product_image(
+        image_url, list((image.get("variants") or {}).values())
+    )
 
     # Supprimer l'entrée table product_images
     deleted = ProductService.delete_image(db, product_id, image_url)
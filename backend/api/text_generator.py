@@ -7,6 +7,7 @@ Uses ProductTextGeneratorService (pure Python templates, no LLM).
 Endpoints:
 - POST /products/text/generate - Generate from existing product
 - POST /products/text/preview - Preview from raw attributes
+- POST /products/text/generate-bulk - Generate (and apply) for many products, NDJSON
 
 Architecture:
 - Service layer pattern: route delegates to ProductTextGeneratorService
@@ -15,22 +16,34 @@ Architecture:
 
 Created: 2026-01-13
 Author: Claude
+Updated: 2026-02-04 - Bulk generation endpoint (BulkTextGenerationService),
+    streamed chunk by chunk
 """
 
+import json
 import time
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from api.dependencies import get_current_user, get_user_db
 from models.public.user import User
-from models.user.product import Product
+from models.user.product import Product, ProductStatus
 from schemas.text_generator import (
+    TextBulkGenerateInput,
     TextGenerateInput,
     TextGeneratorOutput,
     TextPreviewInput,
 )
-from services.product_text_generator import ProductTextGeneratorService
+from services.bulk_text_generation import BulkTextGenerationService
+from services.product_text_generator import (
+    DESCRIPTION_STYLE_KEYS,
+    TITLE_FORMAT_KEYS,
+    ProductTextGeneratorService,
+)
+from shared.access_control import ensure_can_modify
+from shared.database import get_tenant_session
 from shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -106,27 +119,13 @@ async def generate_text(
 
         # Filter by specific format if requested
         if input.title_format is not None:
-            format_keys = {
-                1: "minimaliste",
-                2: "standard_vinted",
-                3: "seo_mots_cles",
-                4: "vintage_collectionneur",
-                5: "technique_professionnel"
-            }
-            key = format_keys.get(input.title_format)
+            key = TITLE_FORMAT_KEYS.get(input.title_format)
             if key and key in result["titles"]:
                 result["titles"] = {key: result["titles"][key]}
 
         # Filter by specific style if requested
         if input.description_style is not None:
-            style_keys = {
-                1: "catalogue_structure",
-                2: "descriptif_redige",
-                3: "fiche_technique",
-                4: "vendeur_pro",
-                5: "visuel_emoji"
-            }
-            key = style_keys.get(input.description_style)
+            key = DESCRIPTION_STYLE_KEYS.get(input.description_style)
             if key and key in result["descriptions"]:
                 result["descriptions"] = {key: result["descriptions"][key]}
 
@@ -162,6 +161,131 @@ async def generate_text(
         )
 
 
+@router.post(
+    "/generate-bulk",
+    status_code=status.HTTP_200_OK,
+    summary="Generate text for many products",
+    description=(
+        "Generates titles and descriptions for products selected by IDs or filters, "
+        "optionally writes them, and streams one NDJSON line per product"
+    ),
+    response_class=StreamingResponse,
+)
+async def generate_text_bulk(
+    input: TextBulkGenerateInput,
+    db_user: tuple[Session, User] = Depends(get_user_db),
+    current_user: User = Depends(get_current_user)
+) -> StreamingResponse:
+    """
+    Generate SEO titles and descriptions for many products.
+
+    The selection is processed in chunks of BULK_TEXT_CHUNK_SIZE products:
+    each chunk is loaded in one query (M2M attributes eager-loaded), its
+    texts are generated in one pass and, with apply=true, written with a
+    bulk UPDATE (optimistic version check) and committed; its lines are
+    streamed right after. The chunks run on a tenant session owned by the
+    stream: the get_user_db session is closed as soon as the route returns.
+
+    Response (application/x-ndjson), one JSON object per line:
+    - per product: product_id, titles, descriptions, applied, conflict
+      (error="NOT_FOUND" for requested IDs that do not exist, error="SOLD"
+      for SOLD products with apply=true)
+    - last line: {"summary": {total, not_found, sold, updated, conflicts, elapsed_ms}},
+      or {"error": ...} if a chunk failed (the chunks already streamed are
+      committed)
+
+    Business Rules:
+    - apply=true: SUPPORT cannot write (read-only role)
+    - SOLD products are immutable: never written (status="sold" is
+      rejected with apply=true by TextBulkGenerateInput)
+    - limit applies to filter selections; with product_ids every requested
+      product is processed
+
+    Args:
+        input: TextBulkGenerateInput with the selection and format/style
+        db_user: Database session with user schema set
+        current_user: Authenticated user
+
+    Returns:
+        StreamingResponse with the NDJSON lines
+
+    Raises:
+        HTTPException 403: apply=true by SUPPORT
+    """
+    _, user = db_user  # schema validated by get_user_db
+    user_id = user.id
+    start_time = time.time()
+
+    if input.apply:
+        ensure_can_modify(user, "produit")
+
+    logger.info(
+        "[API:text_generator] Bulk generate request",
+        extra={
+            "user_id": user_id,
+            "product_ids": len(input.product_ids or []),
+            "title_format": input.title_format,
+            "description_style": input.description_style,
+            "apply": input.apply
+        }
+    )
+
+    def ndjson_lines():
+        summary = dict.fromkeys(("total", "not_found", "sold", "updated", "conflicts"), 0)
+        db = get_tenant_session(user_id)
+        try:
+            for results in BulkTextGenerationService.iter_chunks(
+                db,
+                product_ids=input.product_ids,
+                status=ProductStatus(input.status) if input.status else None,
+                category=input.category,
+                brand=input.brand,
+                limit=input.limit,
+                title_format=input.title_format,
+                description_style=input.description_style,
+                apply=input.apply,
+            ):
+                for r in results:
+                    line = {"product_id": r.product_id}
+                    if r.error == "NOT_FOUND":
+                        summary["not_found"] += 1
+                    else:
+                        summary["total"] += 1
+                    if r.error:
+                        summary["sold"] += r.error == "SOLD"
+                        line["error"] = r.error
+                    else:
+                        summary["updated"] += r.applied
+                        summary["conflicts"] += r.conflict
+                        line.update(
+                            titles=r.titles,
+                            descriptions=r.descriptions,
+                            applied=r.applied,
+                            conflict=r.conflict,
+                        )
+                    yield json.dumps(line, ensure_ascii=False) + "\n"
+        except Exception as e:
+            db.rollback()
+            logger.error(
+                f"[API:text_generator] Bulk generate failed: {e}",
+                exc_info=True,
+                extra={"user_id": user_id, **summary}
+            )
+            yield json.dumps({"error": "An error occurred while generating texts"}) + "\n"
+            return
+        finally:
+            db.close()
+
+        summary["elapsed_ms"] = round((time.time() - start_time) * 1000, 2)
+        logger.info(
+            "[API:text_generator] Bulk generate successful",
+            extra={"user_id": user_id, **summary}
+        )
+        yield json.dumps({"summary": summary}) + "\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 @router.post(
     "/preview",
     response_model=TextGeneratorOutput,
@@ -1,7 +1,7 @@
 """
 User Settings API
 
-Endpoints for managing user preferences (text generator settings).
+Endpoints for managing user preferences (text generator, AI settings).
 """
 
 from fastapi import APIRouter, Depends, status
@@ -9,7 +9,12 @@ from sqlalchemy.orm import Session
 
 from api.dependencies import get_current_user
 from models.public.user import User
-from schemas.user_settings import TextGeneratorSettings, TextGeneratorSettingsUpdate
+from schemas.user_settings import (
+    AISettings,
+    AISettingsUpdate,
+    TextGeneratorSettings,
+    TextGeneratorSettingsUpdate,
+)
 from shared.database import get_db
 from shared.logging import get_logger
 
@@ -77,3 +82,47 @@ async def update_text_generator_settings(
         default_title_format=current_user.default_title_format,
         default_description_style=current_user.default_description_style,
     )
+
+
+@router.get("/ai", response_model=AISettings)
+async def get_ai_settings(
+    current_user: User = Depends(get_current_user),
+) -> AISettings:
+    """
+    Get user's AI analysis preferences.
+
+    Returns:
+        AISettings: Current AI preferences
+    """
+    return AISettings(ai_result_cache_enabled=current_user.ai_result_cache_enabled)
+
+
+@router.patch("/ai", response_model=AISettings)
+async def update_ai_settings(
+    settings: AISettingsUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+) -> AISettings:
+    """
+    Update user's AI analysis preferences.
+
+    With ai_result_cache_enabled=false, every analysis calls the model (and
+    consumes a credit), and results are not stored in the shared cache.
+
+    Args:
+        settings: Fields to update
+
+    Returns:
+        AISettings: Updated AI preferences
+    """
+    if settings.ai_result_cache_enabled is not None:
+        current_user.ai_result_cache_enabled = settings.ai_result_cache_enabled
+        db.commit()
+        db.refresh(current_user)
+
+    logger.info(
+        f"Updated AI settings for user_id={current_user.id}: "
+        f"ai_result_cache_enabled={current_user.ai_result_cache_enabled}"
+    )
+
+    return AISettings(ai_result_cache_enabled=current_user.ai_result_cache_enabled)
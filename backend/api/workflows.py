@@ -5,14 +5,24 @@ Marketplace-agnostic endpoints for managing Temporal workflows:
 - GET /workflows: List active workflows (with marketplace filter)
 - GET /workflows/{workflow_id}/progress: Query workflow progress
 - POST /workflows/{workflow_id}/cancel: Cancel a running workflow
+- POST /workflows/batch-actions: Apply one action to many products in ONE workflow
 
 These endpoints replace the per-marketplace job listing/management endpoints.
 
+Progress is pushed in real time as "workflow_progress" Socket.IO events
+(see temporal/progress.py). The progress endpoint is kept as a fallback
+for clients without an active socket.
+
 Author: Claude
 Date: 2026-01-27
+Updated: 2026-02-04 - Listing includes executions started without search attributes
 """
 
-from typing import Optional
+import base64
+import binascii
+import time
+from functools import lru_cache
+from typing import Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
@@ -41,7 +51,8 @@ class WorkflowListResponse(BaseModel):
     """Response for listing workflows."""
 
     workflows: list[WorkflowSummary] = Field(default_factory=list)
-    total: int = Field(0, description="Total matching workflows")
+    total: int = Field(0, description="Number of workflows in this page")
+    next_page_token: Optional[str] = Field(None, description="Token for the next page (None if last page)")
 
 
 class WorkflowProgressResponse(BaseModel):
@@ -60,6 +71,17 @@ class WorkflowStartResponse(BaseModel):
     status: str = Field("started", description="Always 'started'")
 
 
+class BatchActionRequest(BaseModel):
+    """Request to apply one marketplace action to many products."""
+
+    marketplace: Literal["vinted", "ebay", "etsy"] = Field(..., description="Target marketplace")
+    action: str = Field(..., description="Action: publish, update, delete (eBay: cleanup)")
+    product_ids: list[int] = Field(..., min_length=1, max_length=10000, description="Products to process")
+    max_parallel: int = Field(5, ge=1, le=20, description="Max concurrent items")
+    marketplace_id: str = Field("EBAY_FR", description="eBay marketplace (eBay only)")
+    check_conditions: bool = Field(True, description="Check deletion conditions (Vinted delete only)")
+
+
 class CancelResponse(BaseModel):
     """Response for cancel request."""
 
@@ -69,32 +91,109 @@ class CancelResponse(BaseModel):
 
 # ===== HELPERS =====
 
+# Short-lived per-user cache of list results (frontend polls this endpoint)
+LIST_CACHE_TTL_SECONDS = 3.0
+_list_cache: dict[tuple, tuple[WorkflowListResponse, float]] = {}
+
+
+def _store_list_cache(key: tuple, response: WorkflowListResponse) -> None:
+    """Cache a list page, pruning expired entries so the dict stays small."""
+    now = time.monotonic()
+    if len(_list_cache) > 1000:
+        for stale in [k for k, (_, ts) in _list_cache.items() if now - ts >= LIST_CACHE_TTL_SECONDS]:
+            _list_cache.pop(stale, None)
+    _list_cache[key] = (response, now)
+
+
+def _invalidate_list_cache(user_id: int) -> None:
+    """Drop cached list pages of a user (after cancel)."""
+    for key in [k for k in _list_cache if k[0] == user_id]:
+        _list_cache.pop(key, None)
+
+
+def _encode_page_token(token: Optional[bytes]) -> Optional[str]:
+    return base64.urlsafe_b64encode(token).decode("ascii") if token else None
 
-def _extract_marketplace(workflow_id: str) -> Optional[str]:
-    """Extract marketplace from workflow ID convention: {marketplace}-{action}-user-..."""
-    for mp in ("vinted", "ebay", "etsy"):
+
+def _decode_page_token(token: Optional[str]) -> Optional[bytes]:
+    if not token:
+        return None
+    try:
+        return base64.urlsafe_b64decode(token.encode("ascii"))
+    except (ValueError, binascii.Error):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid page_token",
+        )
+
+
+def _build_legacy_list_query(
+    user_id: int, workflow_status: str, marketplace: Optional[str]
+) -> str:
+    """LIKE-based query, used when custom search attributes are unavailable."""
+    query_parts = [
+        f'ExecutionStatus = "{workflow_status}"',
+        f'WorkflowId LIKE "%user-{user_id}%"',
+    ]
+    if marketplace:
+        query_parts.append(f'WorkflowType LIKE "{marketplace.capitalize()}%"')
+    return " AND ".join(query_parts)
+
+
+def _extract_marketplace(workflow_id: str, workflow_type: str = "") -> Optional[str]:
+    """Marketplace of a workflow type, else from the ID convention: {marketplace}-{action}-user-..."""
+    from temporal.search_attributes import parse_workflow_type
+
+    marketplace, _ = parse_workflow_type(workflow_type)
+    if marketplace:
+        return marketplace
+    for mp in ("vinted", "ebay", "etsy", "ai"):
         if workflow_id.startswith(mp):
             return mp
     return None
 
 
+@lru_cache(maxsize=1)
+def _known_workflow_types() -> tuple[str, ...]:
+    """Names of every registered workflow type (legacy listing clause)."""
+    import temporal.workflows as workflows
+
+    names = set()
+    for export in workflows.__all__:
+        value = getattr(workflows, export)
+        classes = value if isinstance(value, list) else [value]
+        names.update(
+            cls.__name__ for cls in classes
+            if hasattr(cls, "__temporal_workflow_definition")
+        )
+    return tuple(sorted(names))
+
+
 # ===== ENDPOINTS =====
 
 
 @router.get("", response_model=WorkflowListResponse)
 async def list_workflows(
     user_db: tuple = Depends(get_user_db),
-    marketplace: Optional[str] = Query(None, description="Filter by marketplace (vinted, ebay, etsy)"),
+    marketplace: Optional[str] = Query(None, description="Filter by marketplace (vinted, ebay, etsy, ai)"),
+    action_type: Optional[str] = Query(None, description="Filter by action (publish, sync, ...)"),
     workflow_status: str = Query("Running", description="Execution status filter (Running, Completed, Failed)"),
-    limit: int = Query(20, ge=1, le=100, description="Max results"),
+    limit: int = Query(20, ge=1, le=100, description="Max results (page size)"),
+    page_token: Optional[str] = Query(None, description="next_page_token of the previous page"),
 ):
     """
     List Temporal workflows for the current user.
 
-    Supports filtering by marketplace and execution status.
+    Supports filtering by marketplace, action and execution status.
+    Uses indexed search attributes (UserId, Marketplace, ActionType) and
+    server-side pagination. Executions started before the attributes were
+    registered (no UserId) are matched by WorkflowId/WorkflowType while
+    temporal_list_legacy_executions is on. Results are cached per user for
+    a few seconds.
     """
     from temporal.client import get_temporal_client
     from temporal.config import get_temporal_config
+    from temporal.search_attributes import build_list_query, is_indexed_listing_enabled
 
     config = get_temporal_config()
 
@@ -106,41 +205,52 @@ async def list_workflows(
 
     db, current_user = user_db
 
-    # Build Temporal query
-    query_parts = [
-        f'ExecutionStatus = "{workflow_status}"',
-    ]
-
-    # Filter by user (all our workflow IDs contain user-{id})
-    query_parts.append(f'WorkflowId LIKE "%user-{current_user.id}%"')
-
-    # Filter by marketplace via workflow type prefix
-    if marketplace:
-        mp_prefix = marketplace.capitalize()
-        query_parts.append(f'WorkflowType LIKE "{mp_prefix}%"')
-
-    query = " AND ".join(query_parts)
+    cache_key = (current_user.id, marketplace, action_type, workflow_status, limit, page_token)
+    cached = _list_cache.get(cache_key)
+    if cached and time.monotonic() - cached[1] < LIST_CACHE_TTL_SECONDS:
+        return cached[0]
 
     try:
         client = await get_temporal_client()
-        workflows = []
-
-        async for wf in client.list_workflows(query=query):
-            if len(workflows) >= limit:
-                break
-
-            workflows.append(
-                WorkflowSummary(
-                    workflow_id=wf.id,
-                    workflow_type=wf.workflow_type,
-                    status=wf.status.name if wf.status else workflow_status,
-                    start_time=wf.start_time.isoformat() if wf.start_time else None,
-                    marketplace=_extract_marketplace(wf.id),
-                )
+
+        if is_indexed_listing_enabled():
+            query = build_list_query(
+                current_user.id, workflow_status, marketplace, action_type,
+                legacy_workflow_types=(
+                    _known_workflow_types() if config.temporal_list_legacy_executions else None
+                ),
+            )
+        else:
+            query = _build_legacy_list_query(current_user.id, workflow_status, marketplace)
+
+        iterator = client.list_workflows(
+            query=query,
+            page_size=limit,
+            next_page_token=_decode_page_token(page_token),
+        )
+        await iterator.fetch_next_page()
+
+        workflows = [
+            WorkflowSummary(
+                workflow_id=wf.id,
+                workflow_type=wf.workflow_type,
+                status=wf.status.name if wf.status else workflow_status,
+                start_time=wf.start_time.isoformat() if wf.start_time else None,
+                marketplace=_extract_marketplace(wf.id, wf.workflow_type),
             )
+            for wf in (iterator.current_page or [])[:limit]
+        ]
 
-        return WorkflowListResponse(workflows=workflows, total=len(workflows))
+        response = WorkflowListResponse(
+            workflows=workflows,
+            total=len(workflows),
+            next_page_token=_encode_page_token(iterator.next_page_token),
+        )
+        _store_list_cache(cache_key, response)
+        return response
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to list workflows for user {current_user.id}: {e}")
         raise HTTPException(
@@ -149,6 +259,94 @@ async def list_workflows(
         )
 
 
+@router.post("/batch-actions", response_model=WorkflowStartResponse)
+async def start_batch_action(
+    request: BatchActionRequest,
+    user_db: tuple = Depends(get_user_db),
+):
+    """
+    Apply one action to many products in a single batch workflow.
+
+    Replaces N single-product workflow starts (bulk publish, mass delist...).
+    Per-item progress via the get_item_result query, global progress via
+    GET /workflows/{workflow_id}/progress or Socket.IO push.
+    """
+    from temporal.client import get_temporal_client
+    from temporal.config import get_temporal_config
+    from temporal.workflows.batch_action_workflow import BatchActionParams
+    from temporal.workflows.ebay.batch_action_workflow import EbayBatchActionWorkflow
+    from temporal.workflows.etsy.batch_action_workflow import EtsyBatchActionWorkflow
+    from temporal.workflows.vinted.batch_action_workflow import VintedBatchActionWorkflow
+
+    config = get_temporal_config()
+
+    if not config.temporal_enabled:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Temporal is disabled",
+        )
+
+    db, current_user = user_db
+
+    workflow_classes = {
+        "vinted": (VintedBatchActionWorkflow, config.temporal_vinted_task_queue),
+        "ebay": (EbayBatchActionWorkflow, config.temporal_task_queue),
+        "etsy": (EtsyBatchActionWorkflow, config.temporal_task_queue),
+    }
+    workflow_class, task_queue = workflow_classes[request.marketplace]
+
+    if request.action not in workflow_class.ACTIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"Action '{request.action}' not supported for {request.marketplace} "
+                f"(supported: {', '.join(workflow_class.ACTIONS)})"
+            ),
+        )
+
+    shop_id = 0
+    if request.marketplace == "vinted":
+        from api.vinted.shared import get_active_vinted_connection
+
+        shop_id = get_active_vinted_connection(db, current_user.id).vinted_user_id
+
+    # Deduplicate while keeping order
+    product_ids = list(dict.fromkeys(request.product_ids))
+
+    params = BatchActionParams(
+        user_id=current_user.id,
+        action=request.action,
+        product_ids=product_ids,
+        max_parallel=request.max_parallel,
+        shop_id=shop_id,
+        marketplace_id=request.marketplace_id,
+        check_conditions=request.check_conditions,
+    )
+    workflow_id = (
+        f"{request.marketplace}-batch-{request.action}-user-{current_user.id}-{int(time.time() * 1000)}"
+    )
+
+    try:
+        client = await get_temporal_client()
+        await client.start_workflow(
+            workflow_class.run,
+            params,
+            id=workflow_id,
+            task_queue=task_queue,
+        )
+    except Exception as e:
+        logger.error(f"Failed to start batch workflow for user {current_user.id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to start batch workflow: {str(e)}",
+        )
+
+    logger.info(f"Started batch workflow {workflow_id} ({len(product_ids)} products)")
+    _invalidate_list_cache(current_user.id)
+
+    return WorkflowStartResponse(workflow_id=workflow_id, status="started")
+
+
 @router.get("/{workflow_id}/progress", response_model=WorkflowProgressResponse)
 async def get_workflow_progress(
     workflow_id: str,
@@ -159,6 +357,9 @@ async def get_workflow_progress(
 
     All workflows implement get_progress() query returning
     {status, result, error}.
+
+    Fallback only: the same payload is pushed as "workflow_progress"
+    Socket.IO events while the workflow runs.
     """
     from temporal.client import get_temporal_client
     from temporal.config import get_temporal_config
@@ -243,6 +444,7 @@ async def cancel_workflow(
             await handle.cancel()
 
         logger.info(f"Sent cancel to workflow {workflow_id}")
+        _invalidate_list_cache(current_user.id)
 
         return CancelResponse(
             workflow_id=workflow_id,
@@ -56,6 +56,7 @@ from middleware.error_handler import (
 from middleware.rate_limit import RateLimitMiddleware
 from middleware.security_headers import SecurityHeadersMiddleware
 from services.r2_service import r2_service
+from services.reference_catalog import ReferenceCatalogListener
 from services.datadome_scheduler import (
     start_datadome_scheduler,
     stop_datadome_scheduler,
@@ -73,9 +74,9 @@ from temporal.worker import get_worker_manager
 from temporal.workflows import (
     EbaySyncWorkflow, EbayCleanupWorkflow,
     VintedSyncWorkflow, VintedCleanupWorkflow, VintedBatchCleanupWorkflow, VintedProSellerScanWorkflow,
-    EBAY_ACTION_WORKFLOWS, ETSY_ACTION_WORKFLOWS, VINTED_ACTION_WORKFLOWS,
+    EBAY_ACTION_WORKFLOWS, ETSY_ACTION_WORKFLOWS, VINTED_ACTION_WORKFLOWS, AI_WORKFLOWS,
 )
-from temporal.activities import EBAY_ACTIVITIES, VINTED_ACTIVITIES, EBAY_ACTION_ACTIVITIES, VINTED_ACTION_ACTIVITIES, ETSY_ACTION_ACTIVITIES
+from temporal.activities import EBAY_ACTIVITIES, VINTED_ACTIVITIES, EBAY_ACTION_ACTIVITIES, VINTED_ACTION_ACTIVITIES, ETSY_ACTION_ACTIVITIES, AI_ACTIVITIES
 
 # Configuration du logging
 logger = setup_logging()
@@ -146,6 +147,18 @@ async def lifespan(app: FastAPI):
         else:
             logger.warning(f"⚠️ {error_msg}")
 
+    # ===== REFERENCE CATALOG (2026-02-04) =====
+    # In-memory product_attributes tables, reloaded on NOTIFY reference_data_changed
+    reference_listener = None
+    if settings.reference_catalog_listen_enabled:
+        reference_listener = ReferenceCatalogListener()
+        reference_listener.start()
+    else:
+        logger.info(
+            f"📚 Reference catalog listener DISABLED "
+            f"(TTL reload every {settings.reference_catalog_ttl_seconds}s)"
+        )
+
     # ===== DATADOME SCHEDULER (2025-12-19) =====
     # DISABLED: En stand-by - sera réactivé avec logique basée sur compteur de requêtes
     # TODO: Réactiver quand la logique de ping par nombre de requêtes sera implémentée
@@ -158,16 +171,17 @@ async def lifespan(app: FastAPI):
 
     if temporal_config.temporal_enabled:
         try:
-            # --- Main worker: eBay + Etsy (high concurrency) ---
+            # --- Main worker: eBay + Etsy + AI (high concurrency) ---
             worker_manager = get_worker_manager()
 
             worker_manager.register_workflow(EbaySyncWorkflow)
             worker_manager.register_workflow(EbayCleanupWorkflow)
-            for wf in EBAY_ACTION_WORKFLOWS + ETSY_ACTION_WORKFLOWS:
+            for wf in EBAY_ACTION_WORKFLOWS + ETSY_ACTION_WORKFLOWS + AI_WORKFLOWS:
                 worker_manager.register_workflow(wf)
             worker_manager.register_activities(EBAY_ACTIVITIES)
             worker_manager.register_activities(EBAY_ACTION_ACTIVITIES)
             worker_manager.register_activities(ETSY_ACTION_ACTIVITIES)
+            worker_manager.register_activities(AI_ACTIVITIES)
 
             await worker_manager.start()
             logger.info(
@@ -180,6 +194,7 @@ async def lifespan(app: FastAPI):
             from concurrent.futures import ThreadPoolExecutor
             from temporalio.worker import Worker, UnsandboxedWorkflowRunner
             from temporal.client import get_temporal_client
+            from temporal.progress import get_worker_interceptors
 
             _vinted_executor = ThreadPoolExecutor(
                 max_workers=1,
@@ -196,6 +211,7 @@ async def lifespan(app: FastAPI):
                 max_concurrent_workflow_tasks=5,
                 max_concurrent_activities=1,
                 workflow_runner=UnsandboxedWorkflowRunner(),
+                interceptors=get_worker_interceptors(),
             )
             _cleanup_worker_task = asyncio.create_task(_vinted_worker.run())
             logger.info(
@@ -230,6 +246,9 @@ async def lifespan(app: FastAPI):
                 pass
             logger.info("⏱️ Temporal Vinted worker stopped")
 
+    if reference_listener is not None:
+        await asyncio.to_thread(reference_listener.stop)
+
     # Note: DataDome scheduler shutdown is currently disabled (stand-by mode)
 
 
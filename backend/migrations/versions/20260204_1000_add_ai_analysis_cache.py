@@ -0,0 +1,97 @@
+"""add ai_analysis_cache table and users.ai_result_cache_enabled
+
+Content-addressed cache of AI vision results (public.ai_analysis_cache),
+keyed by SHA256(model + vocabulary version + image hashes), with a
+last_used_at index for TTL/LRU purge.
+
+Per-user opt-out: public.users.ai_result_cache_enabled (default true).
+
+Revision ID: ai_cache_001
+Revises: sz_cleanup_wl
+Create Date: 2026-02-04
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy import text
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'ai_cache_001'
+down_revision: Union[str, None] = 'sz_cleanup_wl'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def column_exists(conn, schema, table, column):
+    """Check if a column exists in a table."""
+    result = conn.execute(text("""
+        SELECT EXISTS (
+            SELECT 1 FROM information_schema.columns
+            WHERE table_schema = :schema
+            AND table_name = :table
+            AND column_name = :column
+        )
+    """), {"schema": schema, "table": table, "column": column})
+    return result.scalar()
+
+
+def table_exists(conn, schema, table):
+    """Check if a table exists."""
+    result = conn.execute(text("""
+        SELECT EXISTS (
+            SELECT 1 FROM information_schema.tables
+            WHERE table_schema = :schema
+            AND table_name = :table
+        )
+    """), {"schema": schema, "table": table})
+    return result.scalar()
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    if not table_exists(conn, 'public', 'ai_analysis_cache'):
+        op.create_table(
+            'ai_analysis_cache',
+            sa.Column('cache_key', sa.String(64), primary_key=True),
+            sa.Column('model', sa.String(100), nullable=False),
+            sa.Column('vocabulary_version', sa.String(16), nullable=False),
+            sa.Column('result', postgresql.JSONB(), nullable=False),
+            sa.Column('hit_count', sa.Integer(), nullable=False, server_default='0'),
+            sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+            sa.Column('last_used_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+            schema='public'
+        )
+        op.create_index(
+            'idx_ai_analysis_cache_last_used_at',
+            'ai_analysis_cache',
+            ['last_used_at'],
+            schema='public'
+        )
+        print("  ✓ Created ai_analysis_cache table")
+    else:
+        print("  - ai_analysis_cache table already exists, skipping")
+
+    if not column_exists(conn, 'public', 'users', 'ai_result_cache_enabled'):
+        op.add_column(
+            'users',
+            sa.Column(
+                'ai_result_cache_enabled',
+                sa.Boolean(),
+                nullable=False,
+                server_default=sa.true(),
+                comment='Reuse cached AI analyses of identical images (no credit charged)'
+            ),
+            schema='public'
+        )
+        print("  ✓ Added ai_result_cache_enabled column")
+    else:
+        print("  - ai_result_cache_enabled column already exists, skipping")
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'ai_result_cache_enabled', schema='public')
+    op.drop_index('idx_ai_analysis_cache_last_used_at', table_name='ai_analysis_cache', schema='public')
+    op.drop_table('ai_analysis_cache', schema='public')
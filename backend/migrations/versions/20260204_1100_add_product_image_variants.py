@@ -0,0 +1,73 @@
+"""add product_images.variants column
+
+Adds a variants JSONB column to all tenant product_images tables:
+URLs of the responsive size variants generated at ingest
+({"thumbnail": url, "medium": url}). NULL until generated (new uploads,
+scripts/backfill_image_variants.py for existing images).
+
+Revision ID: img_variants_001
+Revises: ai_cache_001
+Create Date: 2026-02-04
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision: str = 'img_variants_001'
+down_revision: Union[str, None] = 'ai_cache_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _get_tenant_schemas(conn) -> list[str]:
+    """Get all tenant schemas (user_X) + template_tenant."""
+    result = conn.execute(text(
+        "SELECT schema_name FROM information_schema.schemata "
+        "WHERE schema_name LIKE 'user_%' OR schema_name = 'template_tenant' "
+        "ORDER BY schema_name"
+    ))
+    return [row[0] for row in result]
+
+
+def _table_exists(conn, schema: str) -> bool:
+    return conn.execute(text(
+        "SELECT EXISTS ("
+        "  SELECT 1 FROM information_schema.tables "
+        "  WHERE table_schema = :schema AND table_name = 'product_images'"
+        ")"
+    ), {"schema": schema}).scalar()
+
+
+def _column_exists(conn, schema: str) -> bool:
+    return conn.execute(text(
+        "SELECT EXISTS ("
+        "  SELECT 1 FROM information_schema.columns "
+        "  WHERE table_schema = :schema "
+        "    AND table_name = 'product_images' "
+        "    AND column_name = 'variants'"
+        ")"
+    ), {"schema": schema}).scalar()
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    for schema in _get_tenant_schemas(conn):
+        if not _table_exists(conn, schema) or _column_exists(conn, schema):
+            continue
+
+        conn.execute(text(
+            f'ALTER TABLE "{schema}".product_images ADD COLUMN variants JSONB'
+        ))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+
+    for schema in _get_tenant_schemas(conn):
+        if _column_exists(conn, schema):
+            conn.execute(text(
+                f'ALTER TABLE "{schema}".product_images DROP COLUMN variants'
+            ))
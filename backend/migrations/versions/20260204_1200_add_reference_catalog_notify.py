@@ -0,0 +1,102 @@
+"""add NOTIFY triggers on reference tables
+
+Adds statement-level triggers on the product_attributes reference tables
+(brands, categories, colors, conditions, sizes_normalized...) that send
+pg_notify('reference_data_changed', <table name>) after any write, so the
+in-memory reference catalog (services/reference_catalog.py) of every API
+process reloads the changed table instead of waiting for its TTL.
+
+Revision ID: ref_catalog_notify_001
+Revises: img_variants_001
+Create Date: 2026-02-04
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision: str = 'ref_catalog_notify_001'
+down_revision: Union[str, None] = 'img_variants_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEMA = 'product_attributes'
+TRIGGER_NAME = 'trg_reference_data_changed'
+
+# Tables cached by services/reference_catalog.py (REFERENCE_TABLES)
+REFERENCE_TABLES = [
+    'brands',
+    'categories',
+    'closures',
+    'colors',
+    'conditions',
+    'condition_sups',
+    'decades',
+    'fits',
+    'genders',
+    'lengths',
+    'linings',
+    'materials',
+    'necklines',
+    'origins',
+    'patterns',
+    'rises',
+    'seasons',
+    'sizes_normalized',
+    'sleeve_lengths',
+    'sports',
+    'stretches',
+    'trends',
+    'unique_features',
+]
+
+
+def _table_exists(conn, table: str) -> bool:
+    return conn.execute(text(
+        "SELECT EXISTS ("
+        "  SELECT 1 FROM information_schema.tables "
+        "  WHERE table_schema = :schema AND table_name = :table"
+        ")"
+    ), {"schema": SCHEMA, "table": table}).scalar()
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # One notification per statement (a bulk import sends a single NOTIFY,
+    # identical payloads of a transaction are merged by Postgres)
+    conn.execute(text(f"""
+        CREATE OR REPLACE FUNCTION {SCHEMA}.notify_reference_data_changed()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            PERFORM pg_notify('reference_data_changed', TG_TABLE_NAME);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """))
+
+    for table in REFERENCE_TABLES:
+        if not _table_exists(conn, table):
+            continue
+
+        conn.execute(text(
+            f'DROP TRIGGER IF EXISTS {TRIGGER_NAME} ON {SCHEMA}."{table}"'
+        ))
+        conn.execute(text(
+            f'CREATE TRIGGER {TRIGGER_NAME} '
+            f'AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {SCHEMA}."{table}" '
+            f'FOR EACH STATEMENT EXECUTE FUNCTION {SCHEMA}.notify_reference_data_changed()'
+        ))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+
+    for table in REFERENCE_TABLES:
+        if _table_exists(conn, table):
+            conn.execute(text(
+                f'DROP TRIGGER IF EXISTS {TRIGGER_NAME} ON {SCHEMA}."{table}"'
+            ))
+
+    conn.execute(text(f"DROP FUNCTION IF EXISTS {SCHEMA}.notify_reference_data_changed()"))
@@ -0,0 +1,260 @@
+"""add product_list_items projection
+
+Adds a trigger-maintained read model of the product list to all tenant
+schemas: product_list_items, one row per non-deleted product with the
+columns the list / grid renders (scalars, first photo, Vinted/eBay link,
+color and material names). GET /products/grid reads it with a single
+indexed query instead of loading full Product objects and their
+relationships.
+
+- public.refresh_product_list_items(schema, product_ids): recomputes (or
+  removes) the rows of the given products
+- public.product_list_items_trigger(): statement-level trigger function
+  (transition tables), one refresh per statement whatever the row count
+- Triggers on products, product_images, product_colors, product_materials,
+  vinted_products and ebay_products; existing products are backfilled
+
+Revision ID: product_list_items_001
+Revises: ref_catalog_notify_001
+Create Date: 2026-02-04
+"""
+from typing import Sequence, Union
+
+from alembic import op
+from sqlalchemy import text
+
+# revision identifiers, used by Alembic.
+revision: str = 'product_list_items_001'
+down_revision: Union[str, None] = 'ref_catalog_notify_001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Source tables -> column holding the product ID
+SOURCE_TABLES = {
+    'products': 'id',
+    'product_images': 'product_id',
+    'product_colors': 'product_id',
+    'product_materials': 'product_id',
+    'vinted_products': 'product_id',
+    'ebay_products': 'product_id',
+}
+
+# (trigger name suffix, event, REFERENCING clause)
+TRIGGER_EVENTS = [
+    ('ins', 'INSERT', 'REFERENCING NEW TABLE AS new_rows'),
+    ('upd', 'UPDATE', 'REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows'),
+    ('del', 'DELETE', 'REFERENCING OLD TABLE AS old_rows'),
+]
+
+# Copied text columns are TEXT: never narrower than their source column
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS "{schema}".product_list_items (
+    product_id INTEGER PRIMARY KEY,
+    title TEXT,
+    brand TEXT,
+    category TEXT,
+    price NUMERIC(10, 2),
+    status TEXT NOT NULL,
+    stock_quantity INTEGER NOT NULL,
+    size_normalized TEXT,
+    condition INTEGER,
+    image_url TEXT,
+    thumbnail_url TEXT,
+    colors TEXT[] NOT NULL DEFAULT '{{}}',
+    materials TEXT[] NOT NULL DEFAULT '{{}}',
+    vinted_id BIGINT,
+    vinted_status TEXT,
+    ebay_id INTEGER,
+    ebay_status TEXT,
+    created_at TIMESTAMPTZ NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL
+)
+"""
+
+CREATE_INDEXES_SQL = [
+    'CREATE INDEX IF NOT EXISTS idx_product_list_items_created_at ON "{schema}".product_list_items (created_at)',
+    'CREATE INDEX IF NOT EXISTS idx_product_list_items_status ON "{schema}".product_list_items (status)',
+    'CREATE INDEX IF NOT EXISTS idx_product_list_items_brand ON "{schema}".product_list_items (brand)',
+    'CREATE INDEX IF NOT EXISTS idx_product_list_items_category ON "{schema}".product_list_items (category)',
+]
+
+CREATE_REFRESH_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION public.refresh_product_list_items(target_schema text, product_ids integer[])
+RETURNS void AS $$
+BEGIN
+    IF product_ids IS NULL OR cardinality(product_ids) = 0 THEN
+        RETURN;
+    END IF;
+
+    -- Deleted and soft-deleted products leave the list
+    EXECUTE format(
+        'DELETE FROM %1$I.product_list_items l '
+        'WHERE l.product_id = ANY($1) AND NOT EXISTS ('
+        '  SELECT 1 FROM %1$I.products p WHERE p.id = l.product_id AND p.deleted_at IS NULL)',
+        target_schema
+    ) USING product_ids;
+
+    EXECUTE format($sql$
+        INSERT INTO %1$I.product_list_items AS l (
+            product_id, title, brand, category, price, status, stock_quantity,
+            size_normalized, condition, image_url, thumbnail_url, colors, materials,
+            vinted_id, vinted_status, ebay_id, ebay_status, created_at, updated_at
+        )
+        SELECT
+            p.id, p.title, p.brand, p.category, p.price, p.status::text, p.stock_quantity,
+            p.size_normalized, p.condition,
+            img.url, coalesce(img.variants ->> 'thumbnail', img.url),
+            ARRAY(
+                SELECT c.color FROM %1$I.product_colors c
+                WHERE c.product_id = p.id ORDER BY c.is_primary DESC, c.color
+            ),
+            ARRAY(
+                SELECT m.material FROM %1$I.product_materials m
+                WHERE m.product_id = p.id ORDER BY m.percentage DESC NULLS LAST, m.material
+            ),
+            v.vinted_id, v.status, e.id, e.status, p.created_at, p.updated_at
+        FROM %1$I.products p
+        LEFT JOIN LATERAL (
+            SELECT i.url, i.variants FROM %1$I.product_images i
+            WHERE i.product_id = p.id ORDER BY i.is_label, i."order", i.id LIMIT 1
+        ) img ON true
+        LEFT JOIN LATERAL (
+            SELECT vp.vinted_id, vp.status FROM %1$I.vinted_products vp
+            WHERE vp.product_id = p.id ORDER BY vp.vinted_id LIMIT 1
+        ) v ON true
+        LEFT JOIN LATERAL (
+            SELECT ep.id, ep.status FROM %1$I.ebay_products ep
+            WHERE ep.product_id = p.id ORDER BY ep.id LIMIT 1
+        ) e ON true
+        WHERE p.id = ANY($1) AND p.deleted_at IS NULL
+        ON CONFLICT (product_id) DO UPDATE SET
+            title = EXCLUDED.title,
+            brand = EXCLUDED.brand,
+            category = EXCLUDED.category,
+            price = EXCLUDED.price,
+            status = EXCLUDED.status,
+            stock_quantity = EXCLUDED.stock_quantity,
+            size_normalized = EXCLUDED.size_normalized,
+            condition = EXCLUDED.condition,
+            image_url = EXCLUDED.image_url,
+            thumbnail_url = EXCLUDED.thumbnail_url,
+            colors = EXCLUDED.colors,
+            materials = EXCLUDED.materials,
+            vinted_id = EXCLUDED.vinted_id,
+            vinted_status = EXCLUDED.vinted_status,
+            ebay_id = EXCLUDED.ebay_id,
+            ebay_status = EXCLUDED.ebay_status,
+            created_at = EXCLUDED.created_at,
+            updated_at = EXCLUDED.updated_at
+    $sql$, target_schema) USING product_ids;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+# TG_ARGV[0]: product ID column of the source table ('id' or 'product_id')
+CREATE_TRIGGER_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION public.product_list_items_trigger()
+RETURNS TRIGGER AS $$
+DECLARE
+    product_ids integer[];
+BEGIN
+    IF TG_ARGV[0] = 'id' THEN
+        IF TG_OP = 'DELETE' THEN
+            SELECT array_agg(id) INTO product_ids FROM old_rows;
+        ELSE
+            SELECT array_agg(id) INTO product_ids FROM new_rows;
+        END IF;
+    ELSIF TG_OP = 'INSERT' THEN
+        SELECT array_agg(DISTINCT product_id) INTO product_ids
+        FROM new_rows WHERE product_id IS NOT NULL;
+    ELSIF TG_OP = 'DELETE' THEN
+        SELECT array_agg(DISTINCT product_id) INTO product_ids
+        FROM old_rows WHERE product_id IS NOT NULL;
+    ELSE
+        -- product_id may change (marketplace link moved): refresh both sides
+        SELECT array_agg(DISTINCT changed.product_id) INTO product_ids
+        FROM (
+            SELECT product_id FROM new_rows UNION SELECT product_id FROM old_rows
+        ) changed
+        WHERE changed.product_id IS NOT NULL;
+    END IF;
+
+    PERFORM public.refresh_product_list_items(TG_TABLE_SCHEMA, product_ids);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def _get_tenant_schemas(conn) -> list[str]:
+    """Get all tenant schemas (user_X) + template_tenant."""
+    result = conn.execute(text(
+        "SELECT schema_name FROM information_schema.schemata "
+        "WHERE schema_name LIKE 'user_%' OR schema_name = 'template_tenant' "
+        "ORDER BY schema_name"
+    ))
+    return [row[0] for row in result]
+
+
+def _existing_tables(conn, schema: str) -> set[str]:
+    result = conn.execute(text(
+        "SELECT table_name FROM information_schema.tables "
+        "WHERE table_schema = :schema AND table_name = ANY(:tables)"
+    ), {"schema": schema, "tables": [*SOURCE_TABLES, 'product_list_items']})
+    return {row[0] for row in result}
+
+
+def _drop_triggers(conn, schema: str, tables: set[str]) -> None:
+    for table in SOURCE_TABLES:
+        if table not in tables:
+            continue
+        for suffix, _, _ in TRIGGER_EVENTS:
+            conn.execute(text(
+                f'DROP TRIGGER IF EXISTS trg_product_list_items_{suffix} ON "{schema}".{table}'
+            ))
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+
+    # 1. Functions in public schema (shared by all tenants)
+    conn.execute(text(CREATE_REFRESH_FUNCTION_SQL))
+    conn.execute(text(CREATE_TRIGGER_FUNCTION_SQL))
+
+    # 2. Fan-out: projection table, triggers and backfill in each tenant schema
+    for schema in _get_tenant_schemas(conn):
+        tables = _existing_tables(conn, schema)
+        if not set(SOURCE_TABLES) <= tables:
+            # Incomplete schema: the refresh would fail on the missing tables
+            continue
+
+        conn.execute(text(CREATE_TABLE_SQL.format(schema=schema)))
+        for index_sql in CREATE_INDEXES_SQL:
+            conn.execute(text(index_sql.format(schema=schema)))
+
+        _drop_triggers(conn, schema, tables)
+        for table, id_column in SOURCE_TABLES.items():
+            for suffix, event, referencing in TRIGGER_EVENTS:
+                conn.execute(text(
+                    f'CREATE TRIGGER trg_product_list_items_{suffix} '
+                    f'AFTER {event} ON "{schema}".{table} {referencing} '
+                    f"FOR EACH STATEMENT EXECUTE FUNCTION public.product_list_items_trigger('{id_column}')"
+                ))
+
+        conn.execute(
+            text("SELECT public.refresh_product_list_items(:schema, ARRAY(SELECT id FROM "
+                 f'"{schema}".products))'),
+            {"schema": schema},
+        )
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+
+    for schema in _get_tenant_schemas(conn):
+        tables = _existing_tables(conn, schema)
+        _drop_triggers(conn, schema, tables)
+        conn.execute(text(f'DROP TABLE IF EXISTS "{schema}".product_list_items'))
+
+    conn.execute(text("DROP FUNCTION IF EXISTS public.product_list_items_trigger()"))
+    conn.execute(text("DROP FUNCTION IF EXISTS public.refresh_product_list_items(text, integer[])"))
@@ -14,6 +14,7 @@ Updated (2024-12-24): Ajout des modèles Documentation (doc_categories, doc_arti
 
 # Public schema models
 from models.public.admin_audit_log import AdminAuditLog
+from models.public.ai_analysis_cache import AIAnalysisCache
 from models.public.doc_article import DocArticle
 from models.public.doc_category import DocCategory
 from models.public.ebay_aspect_mapping import AspectMapping
@@ -59,6 +60,7 @@ from models.public.vinted_prospect import VintedProspect
 __all__ = [
     # Public schema
     "AdminAuditLog",
+    "AIAnalysisCache",
     "User",
     "UserRole",
     "SubscriptionTier",
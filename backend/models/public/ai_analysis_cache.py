@@ -0,0 +1,66 @@
+"""
+AI Analysis Cache Model - Résultats d'analyse IA réutilisables
+
+Cache content-addressed des analyses d'images (AIVisionService): un même jeu
+d'images (doublons, relistes, imports Vinted) analysé avec le même
+vocabulaire et le même modèle renvoie le résultat stocké, sans appel Gemini
+ni consommation de crédit.
+
+Architecture:
+- cache_key: SHA256(modèle + version du vocabulaire + SHA256 de chaque image)
+- result: VisionExtractedAttributes sérialisé (JSON)
+- last_used_at: politique TTL/LRU (purge des entrées les moins récemment utilisées)
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from shared.database import Base
+from shared.datetime_utils import utc_now
+
+
+class AIAnalysisCache(Base):
+    """Résultat d'analyse IA indexé par le hash du jeu d'images."""
+
+    __tablename__ = "ai_analysis_cache"
+    __table_args__ = (
+        Index("idx_ai_analysis_cache_last_used_at", "last_used_at"),
+        {"schema": "public"},
+    )
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+
+    model: Mapped[str] = mapped_column(String(100), nullable=False)
+    vocabulary_version: Mapped[str] = mapped_column(String(16), nullable=False)
+
+    result: Mapped[dict] = mapped_column(
+        JSONB,
+        nullable=False,
+        doc="VisionExtractedAttributes (JSON)"
+    )
+
+    hit_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utc_now,
+        nullable=False
+    )
+    last_used_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=utc_now,
+        nullable=False,
+        doc="Dernière écriture ou lecture (TTL/LRU)"
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<AIAnalysisCache cache_key={self.cache_key[:8]}... "
+            f"model='{self.model}' hits={self.hit_count}>"
+        )
@@ -113,6 +113,7 @@ class User(Base):
         ai_credits_purchased: Crédits IA achetés (cumulables, n'expirent jamais)
         ai_credits_used_this_month: Crédits IA utilisés ce mois-ci
         ai_credits_last_reset_date: Date du dernier reset mensuel
+        ai_result_cache_enabled: Réutiliser les analyses IA en cache (opt-out)
 
         created_at: Date de création
         updated_at: Date de dernière modification
@@ -281,6 +282,15 @@ class User(Base):
         comment="Last monthly reset date"
     )
 
+    # AI analysis result cache opt-out (Added: 2026-02-04)
+    ai_result_cache_enabled: Mapped[bool] = mapped_column(
+        Boolean,
+        default=True,
+        server_default="true",
+        nullable=False,
+        comment="Reuse cached AI analyses of identical images (no credit charged)"
+    )
+
     # Note: Vinted connection data is stored in VintedConnection table (user_{id}.vinted_connection)
     # See models/user/vinted_connection.py for the source of truth
 
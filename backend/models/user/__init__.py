@@ -19,6 +19,7 @@ from models.user.product_attributes_m2m import (
     ProductMaterial,
     ProductConditionSup,
 )
+from models.user.product_list_item import ProductListItem
 # PublicationHistory removed (2026-01-21): Obsolete, replaced by MarketplaceJob
 from models.user.vinted_connection import VintedConnection, DataDomeStatus
 from models.user.vinted_conversation import VintedConversation, VintedMessage
@@ -35,6 +36,7 @@ __all__ = [
     "ProductColor",
     "ProductMaterial",
     "ProductConditionSup",
+    "ProductListItem",
     "VintedProduct",
     "VintedConnection",
     "DataDomeStatus",
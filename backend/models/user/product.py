@@ -529,6 +529,14 @@ class Product(Base):
             return sorted_imgs[0].url if sorted_imgs else None
         return None
 
+    @property
+    def thumbnail_url(self) -> str | None:
+        """Return the thumbnail variant URL of the first image (falls back to image_url)."""
+        if self.product_images:
+            first = min(self.product_images, key=lambda i: i.order or 0)
+            return first.thumbnail_url
+        return None
+
     @property
     def images(self) -> list[dict]:
         """
@@ -548,6 +556,9 @@ class Product(Base):
                 "file_size": img.file_size,
                 "width": img.width,
                 "height": img.height,
+                "variants": img.variants,
+                "thumbnail_url": img.thumbnail_url,
+                "medium_url": img.medium_url,
                 "created_at": img.created_at,
                 "updated_at": img.updated_at,
             }
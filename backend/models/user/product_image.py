@@ -9,6 +9,7 @@ from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
 from sqlalchemy import Integer, String, Boolean, Text, ForeignKey, ARRAY
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from shared.database import Base
@@ -33,6 +34,7 @@ class ProductImage(Base):
         file_size: File size in bytes
         width: Image width in pixels
         height: Image height in pixels
+        variants: Size variant URLs ({"thumbnail": url, "medium": url}), NULL if not generated
         created_at: Creation timestamp
         updated_at: Last update timestamp
     """
@@ -64,6 +66,7 @@ class ProductImage(Base):
     file_size: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     width: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     height: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    variants: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -81,6 +84,16 @@ class ProductImage(Base):
     # Relationship to Product
     product: Mapped["Product"] = relationship("Product", back_populates="product_images")
 
+    @property
+    def thumbnail_url(self) -> str:
+        """Thumbnail variant URL (falls back to the full-size image)."""
+        return (self.variants or {}).get("thumbnail") or self.url
+
+    @property
+    def medium_url(self) -> str:
+        """Medium variant URL (falls back to the full-size image)."""
+        return (self.variants or {}).get("medium") or self.url
+
     def __repr__(self) -> str:
         return (
             f"<ProductImage(id={self.id}, product_id={self.product_id}, "
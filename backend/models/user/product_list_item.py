@@ -0,0 +1,77 @@
+"""
+Product List Item Model.
+
+Read model of the product list / grid: one row per non-deleted product with
+exactly the columns the list renders (scalars, first image, marketplace
+links, color and material names).
+
+Maintained by PostgreSQL triggers on products, product_images,
+product_colors, product_materials, vinted_products and ebay_products
+(public.refresh_product_list_items, see services/product_list_projection.py).
+Never written by the application.
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+from sqlalchemy import ARRAY, DECIMAL, BigInteger, DateTime, Enum as SQLEnum, Index, Integer, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from models.user.product import ProductStatus
+from shared.database import Base
+
+
+class ProductListItem(Base):
+    """
+    Denormalized product list row (projection of Product).
+
+    Attributes:
+        product_id: Product ID (PK, products.id)
+        title, brand, category, price, status, stock_quantity,
+        size_normalized, condition: Product scalars
+        image_url: URL of the first photo (by order, price labels last)
+        thumbnail_url: Thumbnail variant of that image (falls back to image_url)
+        colors: Color names, primary first
+        materials: Material names, highest percentage first
+        vinted_id, vinted_status: Vinted listing (if linked)
+        ebay_id, ebay_status: eBay listing (if linked)
+        created_at, updated_at: Product timestamps
+    """
+
+    __tablename__ = "product_list_items"
+    __table_args__ = (
+        Index("idx_product_list_items_created_at", "created_at"),
+        Index("idx_product_list_items_status", "status"),
+        Index("idx_product_list_items_brand", "brand"),
+        Index("idx_product_list_items_category", "category"),
+        {"schema": "tenant"},  # Placeholder for schema_translate_map
+    )
+
+    product_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    title: Mapped[str | None] = mapped_column(Text)
+    brand: Mapped[str | None] = mapped_column(Text)
+    category: Mapped[str | None] = mapped_column(Text)
+    price: Mapped[Decimal | None] = mapped_column(DECIMAL(10, 2))
+    # Enum name stored as text (no dependency on the product_status type)
+    status: Mapped[ProductStatus] = mapped_column(
+        SQLEnum(ProductStatus, native_enum=False, length=20), nullable=False
+    )
+    stock_quantity: Mapped[int] = mapped_column(Integer, nullable=False)
+    size_normalized: Mapped[str | None] = mapped_column(Text)
+    condition: Mapped[int | None] = mapped_column(Integer)
+    image_url: Mapped[str | None] = mapped_column(Text)
+    thumbnail_url: Mapped[str | None] = mapped_column(Text)
+    colors: Mapped[list[str]] = mapped_column(ARRAY(Text), nullable=False, server_default="{}")
+    materials: Mapped[list[str]] = mapped_column(ARRAY(Text), nullable=False, server_default="{}")
+    vinted_id: Mapped[int | None] = mapped_column(BigInteger)
+    vinted_status: Mapped[str | None] = mapped_column(Text)
+    ebay_id: Mapped[int | None] = mapped_column(Integer)
+    ebay_status: Mapped[str | None] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<ProductListItem(product_id={self.product_id}, status={self.status})>"
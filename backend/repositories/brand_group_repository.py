@@ -13,9 +13,9 @@ Created: 2026-01-12
 Author: Claude
 """
 
-from typing import Optional
+from typing import Iterable, Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.orm import Session
 
 from models.public.brand_group import BrandGroup
@@ -91,6 +91,31 @@ class BrandGroupRepository:
         )
         return db.execute(stmt).scalar_one_or_none()
 
+    @staticmethod
+    def get_by_brand_group_pairs(
+        db: Session, pairs: Iterable[tuple[str, str]], chunk_size: int = 5000
+    ) -> dict[tuple[str, str], BrandGroup]:
+        """
+        Retrieve many BrandGroups in set-based queries (bulk pricing).
+
+        Args:
+            db: SQLAlchemy Session
+            pairs: (brand, group) combinations
+            chunk_size: Max pairs per query
+
+        Returns:
+            Dict (brand, group) -> BrandGroup (missing pairs are absent)
+        """
+        pairs = list(set(pairs))
+        found: dict[tuple[str, str], BrandGroup] = {}
+        for start in range(0, len(pairs), chunk_size):
+            stmt = select(BrandGroup).where(
+                tuple_(BrandGroup.brand, BrandGroup.group).in_(pairs[start:start + chunk_size])
+            )
+            for brand_group in db.execute(stmt).scalars():
+                found[(brand_group.brand, brand_group.group)] = brand_group
+        return found
+
     @staticmethod
     def update(db: Session, brand_group: BrandGroup) -> BrandGroup:
         """
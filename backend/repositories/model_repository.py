@@ -13,9 +13,9 @@ Created: 2026-01-12
 Author: Claude
 """
 
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.orm import Session
 
 from models.product_attributes.model import Model
@@ -93,6 +93,31 @@ class ModelRepository:
         )
         return db.execute(stmt).scalar_one_or_none()
 
+    @staticmethod
+    def get_by_keys(
+        db: Session, keys: Iterable[tuple[str, str, str]], chunk_size: int = 5000
+    ) -> dict[tuple[str, str, str], Model]:
+        """
+        Retrieve many Models in set-based queries (bulk pricing).
+
+        Args:
+            db: SQLAlchemy Session
+            keys: (brand, group, name) combinations
+            chunk_size: Max keys per query
+
+        Returns:
+            Dict (brand, group, name) -> Model (missing keys are absent)
+        """
+        keys = list(set(keys))
+        found: dict[tuple[str, str, str], Model] = {}
+        for start in range(0, len(keys), chunk_size):
+            stmt = select(Model).where(
+                tuple_(Model.brand, Model.group, Model.name).in_(keys[start:start + chunk_size])
+            )
+            for model in db.execute(stmt).scalars():
+                found[(model.brand, model.group, model.name)] = model
+        return found
+
     @staticmethod
     def get_all_by_brand_and_group(
         db: Session, brand: str, group: str
@@ -15,11 +15,15 @@ Tables gérées:
 - seasons
 - sizes
 
+Les recherches par nom passent par le catalogue de référence en mémoire
+(services/reference_catalog.py): un nom inconnu ne coûte aucune requête,
+un nom connu est chargé par clé primaire (identity map de la session).
+
 Created: 2026-01-06
 Author: Claude
 """
 
-from typing import List, Optional
+from typing import List, Optional, Type, TypeVar
 
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
@@ -38,6 +42,27 @@ from shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+T = TypeVar("T")
+
+
+def _get_by_name(db: Session, table: str, model: Type[T], name: str) -> Optional[T]:
+    """
+    Instance ORM d'un attribut par nom (insensible à la casse).
+
+    Résolu dans le catalogue de référence: par clé primaire, ou par name_en
+    pour les tables dont la clé n'est pas le nom (conditions).
+    """
+    # Import local: services/__init__ importe ProductService, qui importe ce module
+    from services.reference_catalog import get_reference_catalog
+
+    reference = get_reference_catalog(db).table(table)
+    entry = reference.get(name) if reference.key_field in ("name", "name_en") else None
+    if entry is None:
+        entry = reference.find_by("name_en", name)
+    if entry is None:
+        return None
+    return db.get(model, entry[reference.key_field])
+
 
 class ProductAttributeRepository:
     """
@@ -63,8 +88,7 @@ class ProductAttributeRepository:
         Returns:
             Brand si trouvée, None sinon
         """
-        stmt = select(Brand).where(Brand.name == name)
-        return db.execute(stmt).scalar_one_or_none()
+        return _get_by_name(db, "brands", Brand, name)
 
     @staticmethod
     def get_brand_by_id(db: Session, brand_id: int) -> Optional[Brand]:
@@ -94,6 +118,9 @@ class ProductAttributeRepository:
             Brand existante ou nouvellement créée
         """
         brand = ProductAttributeRepository.get_brand_by_name(db, name)
+        if not brand:
+            # Catalogue éventuellement pas encore rechargé (marque créée à l'instant)
+            brand = db.execute(select(Brand).where(Brand.name == name)).scalar_one_or_none()
         if not brand:
             brand = Brand(name=name)
             db.add(brand)
@@ -153,8 +180,7 @@ class ProductAttributeRepository:
         Returns:
             SizeNormalized si trouvée, None sinon
         """
-        stmt = select(SizeNormalized).where(SizeNormalized.name_en == name_en)
-        return db.execute(stmt).scalar_one_or_none()
+        return _get_by_name(db, "sizes", SizeNormalized, name_en)
 
     @staticmethod
     def list_sizes_normalized(db: Session, limit: int = 200) -> List[SizeNormalized]:
@@ -187,8 +213,7 @@ class ProductAttributeRepository:
         Returns:
             Color si trouvée, None sinon
         """
-        stmt = select(Color).where(Color.name_en == name_en)
-        return db.execute(stmt).scalar_one_or_none()
+        return _get_by_name(db, "colors", Color, name_en)
 
     @staticmethod
     def list_colors(db: Session, limit: int = 100) -> List[Color]:
@@ -221,8 +246,7 @@ class ProductAttributeRepository:
         Returns:
             Condition si trouvée, None sinon
         """
-        stmt = select(Condition).where(Condition.name_en == name_en)
-        return db.execute(stmt).scalar_one_or_none()
+        return _get_by_name(db, "conditions", Condition, name_en)
 
     @staticmethod
     def list_conditions(db: Session) -> List[Condition]:
@@ -254,8 +278,7 @@ class ProductAttributeRepository:
         Returns:
             Material si trouvé, None sinon
         """
-        stmt = select(Material).where(Material.name_en == name_en)
-        return db.execute(stmt).scalar_one_or_none()
+        return _get_by_name(db, "materials", Material, name_en)
 
     @staticmethod
     def list_materials(db: Session, limit: int = 200) -> List[Material]:
@@ -288,8 +311,7 @@ class ProductAttributeRepository:
         Returns:
             Category si trouvée, None sinon
         """
-        stmt = select(Category).where(Category.name_en == name_en)
-        return db.execute(stmt).scalar_one_or_none()
+        return _get_by_name(db, "categories", Category, name_en)
 
     @staticmethod
     def list_categories(db: Session, limit: int = 500) -> List[Category]:
@@ -343,8 +365,7 @@ class ProductAttributeRepository:
         Returns:
             Fit si trouvé, None sinon
         """
-        stmt = select(Fit).where(Fit.name_en == name_en)
-        return db.execute(stmt).scalar_one_or_none()
+        return _get_by_name(db, "fits", Fit, name_en)
 
     @staticmethod
     def list_fits(db: Session) -> List[Fit]:
@@ -376,8 +397,7 @@ class ProductAttributeRepository:
         Returns:
             Gender si trouvé, None sinon
         """
-        stmt = select(Gender).where(Gender.name_en == name_en)
-        return db.execute(stmt).scalar_one_or_none()
+        return _get_by_name(db, "genders", Gender, name_en)
 
     @staticmethod
     def list_genders(db: Session) -> List[Gender]:
@@ -409,8 +429,7 @@ class ProductAttributeRepository:
         Returns:
             Season si trouvée, None sinon
         """
-        stmt = select(Season).where(Season.name_en == name_en)
-        return db.execute(stmt).scalar_one_or_none()
+        return _get_by_name(db, "seasons", Season, name_en)
 
     @staticmethod
     def list_seasons(db: Session) -> List[Season]:
@@ -506,8 +525,7 @@ class ProductAttributeRepository:
         Returns:
             Stretch si trouvé, None sinon
         """
-        stmt = select(Stretch).where(Stretch.name_en == name_en)
-        return db.execute(stmt).scalar_one_or_none()
+        return _get_by_name(db, "stretches", Stretch, name_en)
 
     @staticmethod
     def list_stretches(db: Session, limit: int = 100) -> List[Stretch]:
@@ -531,7 +549,7 @@ class ProductAttributeRepository:
     @staticmethod
     def attribute_exists(db: Session, attr_type: str, value: str) -> bool:
         """
-        Vérifie si un attribut existe.
+        Vérifie si un attribut existe (catalogue de référence, aucune requête).
 
         Args:
             db: Session SQLAlchemy
@@ -541,23 +559,28 @@ class ProductAttributeRepository:
         Returns:
             bool: True si l'attribut existe
         """
-        attr_getters = {
-            "brand": ProductAttributeRepository.get_brand_by_name,
-            "color": ProductAttributeRepository.get_color_by_name,
-            "condition": ProductAttributeRepository.get_condition_by_name,
-            "material": ProductAttributeRepository.get_material_by_name,
-            "size": ProductAttributeRepository.get_size_normalized_by_name,
-            "category": ProductAttributeRepository.get_category_by_name,
-            "fit": ProductAttributeRepository.get_fit_by_name,
-            "gender": ProductAttributeRepository.get_gender_by_name,
-            "season": ProductAttributeRepository.get_season_by_name,
+        attr_tables = {
+            "brand": "brands",
+            "color": "colors",
+            "condition": "conditions",
+            "material": "materials",
+            "size": "sizes",
+            "category": "categories",
+            "fit": "fits",
+            "gender": "genders",
+            "season": "seasons",
         }
 
-        getter = attr_getters.get(attr_type.lower())
-        if not getter:
+        table = attr_tables.get(attr_type.lower())
+        if not table:
             return False
 
-        return getter(db, value) is not None
+        from services.reference_catalog import get_reference_catalog
+
+        reference = get_reference_catalog(db).table(table)
+        if reference.key_field in ("name", "name_en") and reference.get(value) is not None:
+            return True
+        return reference.find_by("name_en", value) is not None
 
 
 __all__ = ["ProductAttributeRepository"]
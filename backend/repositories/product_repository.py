@@ -12,13 +12,15 @@ Architecture:
 
 Created: 2026-01-06
 Author: Claude
+Updated: 2026-02-04 - bulk_update_versioned (UPDATE ... FROM (VALUES ...) partagé)
 """
 
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Sequence, Set, Tuple
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import Integer, and_, column, func, or_, select, update, values
 from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.types import TypeEngine
 
 from models.user.product import Product, ProductStatus
 from shared.datetime_utils import utc_now
@@ -26,6 +28,9 @@ from shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Max lignes par requête UPDATE ... FROM (VALUES ...)
+BULK_UPDATE_CHUNK_SIZE = 1000
+
 
 class ProductRepository:
     """
@@ -394,5 +399,61 @@ class ProductRepository:
         )
         return list(db.execute(stmt).scalars().all())
 
+    @staticmethod
+    def bulk_update_versioned(
+        db: Session,
+        rows: Sequence[tuple],
+        value_types: Optional[dict[str, TypeEngine]] = None,
+        set_values: Optional[dict[str, Any]] = None,
+        conditions: Sequence[Any] = (),
+    ) -> Set[int]:
+        """
+        Met à jour N produits avec verrouillage optimiste, par lots.
+
+        Une requête UPDATE ... FROM (VALUES ...) RETURNING id par lot de
+        BULK_UPDATE_CHUNK_SIZE lignes: un produit n'est modifié que si son
+        version_number vaut encore la version attendue, et version_number
+        est incrémenté (comme ProductService). Ne commit pas.
+
+        Args:
+            db: Session SQLAlchemy (schéma user configuré)
+            rows: Tuples (id, version attendue, *valeurs de value_types)
+            value_types: Colonnes par produit (nom -> type), dans l'ordre des tuples
+            set_values: Valeurs communes à tous les produits (colonne -> valeur)
+            conditions: Conditions WHERE supplémentaires (ex: statut != SOLD)
+
+        Returns:
+            IDs des produits modifiés (les autres: version changée ou condition fausse)
+        """
+        value_types = value_types or {}
+        table = Product.__table__
+        updated: Set[int] = set()
+
+        for start in range(0, len(rows), BULK_UPDATE_CHUNK_SIZE):
+            expected = values(
+                column("id", Integer),
+                column("version", Integer),
+                *(column(name, type_) for name, type_ in value_types.items()),
+                name="expected",
+            ).data(list(rows[start:start + BULK_UPDATE_CHUNK_SIZE]))
+
+            stmt = (
+                update(table)
+                .where(
+                    table.c.id == expected.c.id,
+                    table.c.version_number == expected.c.version,
+                    *conditions,
+                )
+                .values(
+                    **{name: expected.c[name] for name in value_types},
+                    **(set_values or {}),
+                    version_number=table.c.version_number + 1,
+                )
+                .returning(table.c.id)
+            )
+            updated.update(db.execute(stmt).scalars())
+
+        return updated
+
 
-__all__ = ["ProductRepository"]
+__all__ = ["BULK_UPDATE_CHUNK_SIZE", "ProductRepository"]
@@ -5,20 +5,22 @@ Repository pour accéder à la table vinted_mapping et la fonction get_vinted_ca
 Gère le mapping bidirectionnel entre catégories Stoflow et catégories Vinted.
 
 Business Rules (2025-12-18):
-- Stoflow → Vinted: utilise get_vinted_category() avec matching d'attributs
+- Stoflow → Vinted: matching d'attributs de get_vinted_category(), exécuté en
+  mémoire par VintedCategoryMatcher (index chargé depuis vinted.mapping)
 - Vinted → Stoflow: lookup inverse dans vinted_mapping (vinted_id → my_category)
 - Fallback via is_default si pas de match exact
 
 Architecture:
 - Accès direct à la table vinted.mapping
-- Appelle la fonction PostgreSQL get_vinted_category pour le matching intelligent
+- Matching intelligent via services/vinted/vinted_category_matcher.py
+  (port Python de la fonction PostgreSQL get_vinted_category, 0 requête par produit)
 - Gère les attributs optionnels (fit, length, rise, material, etc.)
 
 Author: Claude
 Date: 2025-12-18
 """
 
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
@@ -34,6 +36,11 @@ class VintedMappingRepository:
     Utilise la table vinted_mapping et la fonction get_vinted_category.
     """
 
+    @staticmethod
+    def _normalize(value: Optional[str]) -> Optional[str]:
+        """Normalize a matching input like the SQL call did (lowercase, empty → None)."""
+        return value.lower() if value else None
+
     def __init__(self, db: Session):
         """
         Initialize repository with database session.
@@ -60,9 +67,10 @@ class VintedMappingRepository:
         sleeve_length: Optional[str] = None
     ) -> Optional[int]:
         """
-        Get Vinted category ID from Stoflow category using get_vinted_category function.
+        Get Vinted category ID from Stoflow category (get_vinted_category matching).
 
-        Uses the PostgreSQL function which performs intelligent matching:
+        Runs the matching of the PostgreSQL function in memory
+        (VintedCategoryMatcher), with identical results:
         1. Best match with attributes (weighted scoring)
         2. Fallback to is_default=true mapping
 
@@ -85,34 +93,21 @@ class VintedMappingRepository:
             >>> vinted_id = repo.get_vinted_category_id("jeans", "men", fit="slim")
             >>> print(vinted_id)  # Ex: 1193
         """
+        # Import local: services/__init__ importe les services Vinted, qui importent ce module
+        from services.vinted.vinted_category_matcher import get_vinted_category_matcher
+
         try:
-            result = self.db.execute(
-                text("""
-                    SELECT public.get_vinted_category(
-                        :category,
-                        :gender,
-                        :fit,
-                        :length,
-                        :rise,
-                        :material,
-                        :pattern,
-                        :neckline,
-                        :sleeve_length
-                    )
-                """),
-                {
-                    "category": category.lower() if category else None,
-                    "gender": gender.lower() if gender else None,
-                    "fit": fit.lower() if fit else None,
-                    "length": length.lower() if length else None,
-                    "rise": rise.lower() if rise else None,
-                    "material": material.lower() if material else None,
-                    "pattern": pattern.lower() if pattern else None,
-                    "neckline": neckline.lower() if neckline else None,
-                    "sleeve_length": sleeve_length.lower() if sleeve_length else None,
-                }
+            vinted_id = get_vinted_category_matcher(self.db).match(
+                self._normalize(category),
+                self._normalize(gender),
+                fit=self._normalize(fit),
+                length=self._normalize(length),
+                rise=self._normalize(rise),
+                material=self._normalize(material),
+                pattern=self._normalize(pattern),
+                neckline=self._normalize(neckline),
+                sleeve_length=self._normalize(sleeve_length),
             )
-            vinted_id = result.scalar()
 
             if vinted_id:
                 logger.debug(
@@ -152,38 +147,64 @@ class VintedMappingRepository:
             **attributes
         )
 
-        if not vinted_id:
+        from services.vinted.vinted_category_matcher import get_vinted_category_matcher
+
+        try:
+            return get_vinted_category_matcher(self.db).details(vinted_id, gender)
+        except Exception as e:
+            logger.error(f"Error getting Vinted category details: {e}")
             return {
-                "vinted_id": None,
+                "vinted_id": vinted_id,
                 "title": None,
                 "path": None,
                 "gender": gender
             }
 
-        # Get category details from vinted_categories
-        result = self.db.execute(
-            text("""
-                SELECT id, title, path, gender
-                FROM vinted.categories
-                WHERE id = :vinted_id
-            """),
-            {"vinted_id": vinted_id}
-        ).fetchone()
+    def get_vinted_categories_with_details(
+        self,
+        items: List[Mapping[str, Optional[str]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Batch version of get_vinted_category_with_details (bulk publish).
 
-        if result:
-            return {
-                "vinted_id": result.id,
-                "title": result.title,
-                "path": result.path,
-                "gender": result.gender
-            }
+        Matches the whole list against the in-memory index: no query once
+        the matcher is loaded, identical inputs are matched once.
+
+        Args:
+            items: Dicts with category, gender and optional attributes
+                   (fit, length, rise, material, pattern, neckline, sleeve_length)
+
+        Returns:
+            One details dict per item, in input order
+        """
+        from services.vinted.vinted_category_matcher import (
+            MATCH_FIELDS,
+            get_vinted_category_matcher,
+        )
 
-        return {
-            "vinted_id": vinted_id,
-            "title": None,
-            "path": None,
-            "gender": gender
-        }
+        try:
+            matcher = get_vinted_category_matcher(self.db)
+        except Exception as e:
+            logger.error(f"Error loading Vinted category matcher: {e}")
+            return [
+                {"vinted_id": None, "title": None, "path": None, "gender": item.get("gender")}
+                for item in items
+            ]
+
+        queries = [
+            {name: self._normalize(item.get(name)) for name in MATCH_FIELDS}
+            for item in items
+        ]
+        vinted_ids = matcher.match_many(queries)
+
+        unmapped = sum(1 for vinted_id in vinted_ids if not vinted_id)
+        if unmapped:
+            logger.warning(f"No Vinted mapping found for {unmapped}/{len(items)} items")
+
+        return [
+            matcher.details(vinted_id, item.get("gender"))
+            for item, vinted_id in zip(items, vinted_ids)
+        ]
 
     # =========================================================================
     # VINTED → STOFLOW (Import)
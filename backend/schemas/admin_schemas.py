@@ -332,6 +332,25 @@ class AdminStatsRecentActivity(BaseModel):
     new_registrations: List[AdminNewRegistration] = Field(..., description="New registrations (last 7 days)")
 
 
+class AdminStatsAICache(BaseModel):
+    """AI analysis result cache statistics."""
+
+    hits: int = Field(..., description="Cache hits since process start")
+    misses: int = Field(..., description="Cache misses since process start")
+    hit_rate: float = Field(..., description="Hit rate since process start (0-1)")
+    entries: int = Field(..., description="Stored results")
+    total_hits: int = Field(..., description="Hits served by stored results (all processes)")
+
+
+class AdminStatsRenderCache(BaseModel):
+    """Listing render cache statistics (this process)."""
+
+    hits: int = Field(..., description="Cache hits since process start")
+    misses: int = Field(..., description="Cache misses since process start")
+    hit_rate: float = Field(..., description="Hit rate since process start (0-1)")
+    entries: int = Field(..., description="Cached product x marketplace renders")
+
+
 # ============================================================================
 # Admin Audit Log Schemas
 # ============================================================================
@@ -141,3 +141,39 @@ class AIVisionAnalysisResponse(BaseModel):
             }
         }
     }
+
+
+# =============================================================================
+# GEMINI VISION - Analyse par lot
+# =============================================================================
+
+
+class AIBatchAnalysisRequest(BaseModel):
+    """Requête d'analyse IA d'un lot de produits."""
+
+    product_ids: list[int] = Field(
+        ..., min_length=1, max_length=1000, description="Produits à analyser"
+    )
+    max_parallel: int = Field(
+        4, ge=1, le=20,
+        description="Analyses simultanées (plafonné à gemini_max_concurrent_calls)",
+    )
+
+
+class AIBatchAnalysisResponse(BaseModel):
+    """Réponse du lancement d'une analyse IA par lot."""
+
+    workflow_id: str = Field(..., description="ID du workflow Temporal")
+    total: int = Field(..., description="Nombre de produits à analyser")
+    reserved_credits: int = Field(..., description="Crédits réservés pour le lot")
+    skipped_product_ids: list[int] = Field(
+        default_factory=list,
+        description="Produits ignorés (introuvables ou sans photo)",
+    )
+
+
+class AIBatchSignalResponse(BaseModel):
+    """Réponse d'un signal envoyé à une analyse par lot (pause/reprise)."""
+
+    workflow_id: str = Field(..., description="ID du workflow Temporal")
+    status: str = Field(..., description="Statut du signal")
@@ -14,7 +14,7 @@ Author: Claude
 """
 
 from decimal import Decimal
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -165,3 +165,56 @@ class PriceOutput(BaseModel):
     model_name: Optional[str] = Field(None, description="Model name if provided")
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class PricingCoefficientsInfo(BaseModel):
+    """Version and size of the in-memory pricing coefficient snapshot."""
+
+    version: int = Field(..., description="Snapshot version (changes when coefficients change)")
+    conditions: int = Field(..., description="Condition coefficients loaded")
+    origins: int = Field(..., description="Origin coefficients loaded")
+    decades: int = Field(..., description="Decade coefficients loaded")
+    trends: int = Field(..., description="Trend coefficients loaded")
+    features: int = Field(..., description="Unique feature coefficients loaded")
+    fits: int = Field(..., description="Fit coefficients loaded")
+
+
+class RepriceAllRequest(BaseModel):
+    """Request schema for whole-inventory repricing."""
+
+    statuses: list[str] = Field(
+        default_factory=lambda: ["draft", "published"],
+        description="Product statuses to reprice",
+    )
+    price_level: Literal["quick", "standard", "premium"] = Field(
+        "standard", description="Price level written to products when apply=true"
+    )
+    apply: bool = Field(False, description="Write the new prices (false = dry run)")
+
+
+class RepriceItem(BaseModel):
+    """Computed prices of one product."""
+
+    product_id: int
+    status: str = Field(..., description="OK, NO_BRAND_GROUP or ERROR")
+    error: Optional[str] = None
+    group: Optional[str] = None
+    current_price: Optional[Decimal] = None
+    quick_price: Optional[Decimal] = None
+    standard_price: Optional[Decimal] = None
+    premium_price: Optional[Decimal] = None
+    applied: bool = Field(False, description="Price written to the product")
+    conflict: bool = Field(False, description="Product modified concurrently (not written)")
+
+
+class RepriceAllResponse(BaseModel):
+    """Response schema for whole-inventory repricing."""
+
+    total: int
+    priced: int = Field(..., description="Products with computed prices")
+    no_brand_group: int
+    errors: int
+    updated: int = Field(0, description="Products whose price was written")
+    conflicts: int = Field(0, description="Products skipped by the optimistic version check")
+    elapsed_ms: float
+    items: list[RepriceItem]
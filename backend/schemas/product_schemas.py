@@ -7,7 +7,7 @@ Schemas Pydantic pour la validation des requêtes/réponses API Product.
 from datetime import datetime
 from decimal import Decimal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 # ===== PRODUCT IMAGE SCHEMAS =====
@@ -21,6 +21,7 @@ class ProductImageItem(BaseModel):
     - Label detection (internal price tags)
     - SEO metadata (alt text, tags)
     - File metadata (size, dimensions, MIME type)
+    - Responsive variants (thumbnail 320px, medium 800px)
     """
 
     # Core fields
@@ -37,6 +38,11 @@ class ProductImageItem(BaseModel):
     width: int | None = Field(None, ge=1, description="Image width in pixels")
     height: int | None = Field(None, ge=1, description="Image height in pixels")
 
+    # Responsive variants (URL of the full-size image when not generated)
+    variants: dict[str, str] | None = Field(None, description="Size variant URLs by name (thumbnail, medium)")
+    thumbnail_url: str | None = Field(None, description="Thumbnail URL (320px, for lists and grids)")
+    medium_url: str | None = Field(None, description="Medium URL (800px, for product pages)")
+
     # Timestamps
     created_at: datetime = Field(..., description="Creation timestamp (ISO 8601)")
     updated_at: datetime = Field(..., description="Last update timestamp (ISO 8601)")
@@ -54,6 +60,12 @@ class ProductImageItem(BaseModel):
                 "file_size": 245678,
                 "width": 1200,
                 "height": 1600,
+                "variants": {
+                    "thumbnail": "https://cdn.stoflow.io/1/products/5/abc123_thumbnail.webp",
+                    "medium": "https://cdn.stoflow.io/1/products/5/abc123_medium.webp"
+                },
+                "thumbnail_url": "https://cdn.stoflow.io/1/products/5/abc123_thumbnail.webp",
+                "medium_url": "https://cdn.stoflow.io/1/products/5/abc123_medium.webp",
                 "created_at": "2026-01-15T10:00:00Z",
                 "updated_at": "2026-01-15T10:00:00Z"
             }
@@ -561,6 +573,84 @@ class ProductListResponse(BaseModel):
     }
 
 
+# ===== PRODUCT GRID SCHEMAS =====
+
+
+class ProductListItemResponse(BaseModel):
+    """
+    Schema pour une ligne de la grille produits (projection product_list_items).
+
+    Uniquement les colonnes affichées par la liste: pas de description,
+    d'attributs détaillés ni de liste d'images.
+    """
+
+    id: int
+    title: str | None
+    brand: str | None
+    category: str | None
+    price: Decimal | None
+    status: str
+    stock_quantity: int
+    size_normalized: str | None
+    condition: int | None
+    image_url: str | None = Field(None, description="First photo URL")
+    thumbnail_url: str | None = Field(None, description="Thumbnail of the first photo")
+    colors: list[str] = Field(default_factory=list, description="Colors, primary first")
+    primary_color: str | None = Field(None, description="Primary/dominant color")
+    materials: list[str] = Field(default_factory=list, description="Materials, main first")
+    vinted_id: int | None = Field(None, description="Vinted product ID if linked")
+    vinted_status: str | None = None
+    ebay_id: int | None = Field(None, description="eBay product ID if linked")
+    ebay_status: str | None = None
+    created_at: datetime
+    updated_at: datetime
+
+    @classmethod
+    def from_row(cls, row) -> "ProductListItemResponse":
+        """
+        Build from a product_list_items row without validation.
+
+        The row comes from typed DB columns: model_construct() skips the
+        validation cost (the hot path of the grid).
+        """
+        return cls.model_construct(
+            id=row.product_id,
+            title=row.title,
+            brand=row.brand,
+            category=row.category,
+            price=row.price,
+            status=row.status.value,
+            stock_quantity=row.stock_quantity,
+            size_normalized=row.size_normalized,
+            condition=row.condition,
+            image_url=row.image_url,
+            thumbnail_url=row.thumbnail_url,
+            colors=row.colors,
+            primary_color=row.colors[0] if row.colors else None,
+            materials=row.materials,
+            vinted_id=row.vinted_id,
+            vinted_status=row.vinted_status,
+            ebay_id=row.ebay_id,
+            ebay_status=row.ebay_status,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+
+
+class ProductGridResponse(BaseModel):
+    """
+    Schema pour la réponse paginée de la grille produits.
+
+    Même pagination que ProductListResponse, lignes allégées.
+    """
+
+    items: list[ProductListItemResponse]
+    total: int
+    page: int
+    page_size: int
+    total_pages: int
+
+
 # ===== BULK STATUS UPDATE SCHEMAS =====
 
 
@@ -613,3 +703,69 @@ class BulkStatusUpdateResponse(BaseModel):
     success_count: int = Field(..., description="Products successfully updated")
     error_count: int = Field(..., description="Products that failed")
     results: list[BulkStatusUpdateResult] = Field(..., description="Per-product results")
+
+
+
+class BulkProductUpdateRequest(BaseModel):
+    """
+    Request schema for bulk product update (same change for all products).
+
+    Business Rules:
+    - Max 1000 products per request, applied in one UPDATE
+    - updates: ProductUpdate fields without M2M (colors, materials, condition_sups)
+    - status: optional status change (same transitions as bulk status)
+    - expected_versions: optional optimistic locking (product_id -> version_number)
+    """
+
+    product_ids: list[int] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="List of product IDs to update (max 1000)"
+    )
+    updates: ProductUpdate | None = Field(None, description="Fields to set on every product")
+    status: str | None = Field(None, description="New status: draft, published, sold, archived")
+    expected_versions: dict[int, int] | None = Field(
+        None, description="version_number seen by the client, per product ID"
+    )
+
+    @field_validator('status')
+    @classmethod
+    def validate_status(cls, v: str | None) -> str | None:
+        if v is None:
+            return v
+        allowed = ['draft', 'published', 'sold', 'archived']
+        if v.lower() not in allowed:
+            raise ValueError(f"Status must be one of: {', '.join(allowed)}")
+        return v.lower()
+
+    @model_validator(mode='after')
+    def check_change(self) -> 'BulkProductUpdateRequest':
+        if self.status is None and not (self.updates and self.updates.model_fields_set):
+            raise ValueError("updates or status is required")
+        return self
+
+# ===== BULK IMPORT SCHEMAS =====
+
+
+class ProductImportRowError(BaseModel):
+    """Errors of one rejected row of an import file."""
+
+    row: int = Field(..., description="Row number (1 = first data row)")
+    error: str = Field(..., description="Errors, separated by '; '")
+
+
+class ProductImportResponse(BaseModel):
+    """
+    Response schema for bulk import.
+
+    Valid rows are imported (status DRAFT), invalid rows reported.
+    """
+
+    total: int = Field(..., description="Data rows read")
+    imported: int = Field(..., description="Products created")
+    failed: int = Field(..., description="Rows rejected")
+    priced: int = Field(..., description="Products priced automatically (no price in file)")
+    ignored_columns: list[str] = Field(..., description="Unknown columns, ignored")
+    errors: list[ProductImportRowError] = Field(..., description="Per-row errors (first 1000)")
+    elapsed_ms: float = Field(..., description="Import duration (ms)")
@@ -8,14 +8,16 @@ Architecture:
 - TextGenerateInput: Request schema for generating text from existing product
 - TextPreviewInput: Request schema for preview from raw attributes (before save)
 - TextGeneratorOutput: Response schema with all generated titles and descriptions
+- TextBulkGenerateInput: Request schema for bulk generation (NDJSON response)
 
 Created: 2026-01-13
 Author: Claude
+Updated: 2026-02-04 - TextBulkGenerateInput (/products/text/generate-bulk)
 """
 
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 
 class TextGenerateInput(BaseModel):
@@ -124,3 +126,55 @@ class TextGeneratorOutput(BaseModel):
     )
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class TextBulkGenerateInput(BaseModel):
+    """
+    Input schema for generating text for many products.
+
+    Used with the /products/text/generate-bulk endpoint. Products are
+    selected by IDs and/or filters; with apply=true the chosen title
+    format and/or description style is written to the products.
+    """
+
+    product_ids: Optional[list[int]] = Field(
+        None,
+        min_length=1,
+        max_length=2000,
+        description="Product IDs (None = every product matching the filters)"
+    )
+    status: Optional[str] = Field(
+        None,
+        pattern=r'^(draft|published|sold|archived)$',
+        description="Filter by status"
+    )
+    category: Optional[str] = Field(None, description="Filter by category")
+    brand: Optional[str] = Field(None, description="Filter by brand")
+    limit: int = Field(
+        500,
+        ge=1,
+        le=2000,
+        description="Max products of a filter selection (ordered by id, ignored with product_ids)"
+    )
+    title_format: Optional[int] = Field(
+        None,
+        ge=1,
+        le=5,
+        description="Title format (None = all 5 formats, required to apply titles)"
+    )
+    description_style: Optional[int] = Field(
+        None,
+        ge=1,
+        le=5,
+        description="Description style (None = all 5 styles, required to apply descriptions)"
+    )
+    apply: bool = Field(False, description="Write the generated texts to the products (false = preview)")
+
+    @model_validator(mode='after')
+    def check_apply_target(self) -> 'TextBulkGenerateInput':
+        """apply=true needs the format and/or style to write, and no SOLD filter."""
+        if self.apply and self.title_format is None and self.description_style is None:
+            raise ValueError("apply requires title_format and/or description_style")
+        if self.apply and self.status == "sold":
+            raise ValueError("SOLD products are immutable: status 'sold' requires apply=false")
+        return self
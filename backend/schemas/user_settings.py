@@ -1,7 +1,7 @@
 """
 User Settings Schemas
 
-Pydantic schemas for user preferences (text generator settings).
+Pydantic schemas for user preferences (text generator, AI settings).
 """
 
 from typing import Optional
@@ -43,3 +43,23 @@ class TextGeneratorSettingsUpdate(BaseModel):
         le=3,
         description="Default description style: 1=Professional, 2=Storytelling, 3=Minimalist"
     )
+
+
+class AISettings(BaseModel):
+    """User preferences for AI analysis."""
+
+    ai_result_cache_enabled: bool = Field(
+        ...,
+        description="Reuse cached analyses of identical images (no credit charged)"
+    )
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class AISettingsUpdate(BaseModel):
+    """Update schema for AI settings."""
+
+    ai_result_cache_enabled: Optional[bool] = Field(
+        None,
+        description="Reuse cached analyses of identical images (no credit charged)"
+    )
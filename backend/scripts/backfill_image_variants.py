@@ -0,0 +1,378 @@
+#!/usr/bin/env python3
+"""
+Backfill Responsive Image Variants
+
+Generates the thumbnail/medium variants of product images stored in R2
+before variants were generated at ingest (product_images.variants IS NULL).
+Each image is downloaded from the CDN, its variants are built in the image
+thread pool and uploaded next to the original ({uuid}_thumbnail.webp, ...),
+then product_images.variants (and width/height/file_size if missing) is updated.
+Images whose variants could not be generated or uploaded are left NULL, so
+the next run retries them.
+
+Usage:
+    cd backend
+    source venv/bin/activate
+    python scripts/backfill_image_variants.py --user-id 1 --dry-run
+    python scripts/backfill_image_variants.py --user-id 1
+    python scripts/backfill_image_variants.py --user-id 1 --workers 20
+
+Options:
+    --user-id       User ID to backfill (required)
+    --dry-run       Show what would be done without making changes
+    --workers       Number of parallel workers (default: 10)
+    --batch-size    Number of images per progress update (default: 100)
+    --product-id    Backfill only a specific product (for testing)
+    --limit         Limit total number of images to process
+
+Created: 2026-02-04
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+from psycopg2.extras import RealDictCursor
+from psycopg2.pool import ThreadedConnectionPool
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from services.file_service import FileService
+from services.r2_service import r2_service
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+DOWNLOAD_TIMEOUT_SECONDS = 30.0
+
+# Database configuration (from environment or defaults for dev)
+DB_CONFIG = {
+    "host": os.getenv("DB_HOST", "localhost"),
+    "port": int(os.getenv("DB_PORT", 5433)),
+    "dbname": os.getenv("DB_NAME", "stoflow_db"),
+    "user": os.getenv("DB_USER", "stoflow_user"),
+    "password": os.getenv("DB_PASSWORD", "stoflow_dev_password_2024"),
+}
+
+
+class BackfillStats:
+    """Track backfill statistics (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.images_processed = 0
+        self.images_updated = 0
+        self.images_skipped = 0
+        self.variants_uploaded = 0
+        self.images_failed: List[Tuple[str, str]] = []  # (url, error)
+        self.start_time = time.time()
+
+    def increment(self, field: str, value: int = 1):
+        """Thread-safe increment."""
+        with self._lock:
+            setattr(self, field, getattr(self, field) + value)
+
+    def add_failed_image(self, url: str, error: str):
+        """Thread-safe add failed image."""
+        with self._lock:
+            self.images_failed.append((url, error))
+
+    def report(self) -> str:
+        """Generate final report."""
+        duration = time.time() - self.start_time
+        minutes = int(duration // 60)
+        seconds = int(duration % 60)
+
+        report = f"""
+╔══════════════════════════════════════════════════════════════╗
+║                 VARIANTS BACKFILL REPORT                     ║
+╠══════════════════════════════════════════════════════════════╣
+║  Images processed    : {self.images_processed:>6}                              ║
+║  Images updated      : {self.images_updated:>6}                              ║
+║  Images skipped      : {self.images_skipped:>6}                              ║
+║  Images failed       : {len(self.images_failed):>6}                              ║
+║  Variants uploaded   : {self.variants_uploaded:>6}                              ║
+╠══════════════════════════════════════════════════════════════╣
+║  Duration            : {minutes:>3}m {seconds:02d}s                              ║
+╚══════════════════════════════════════════════════════════════╝
+"""
+        if self.images_failed:
+            report += "\nFailed images:\n"
+            for url, error in self.images_failed[:20]:  # Show first 20
+                report += f"  - {url[:60]}... ({error})\n"
+            if len(self.images_failed) > 20:
+                report += f"  ... and {len(self.images_failed) - 20} more\n"
+
+        return report
+
+
+def get_images_without_variants(
+    conn, user_id: int, product_id: Optional[int] = None, limit: Optional[int] = None
+) -> List[Dict]:
+    """
+    Get CDN images that have no variants yet.
+
+    Args:
+        conn: Database connection
+        user_id: User ID (schema)
+        product_id: Optional specific product ID
+        limit: Optional limit on number of images
+
+    Returns:
+        List of images (id, product_id, url, width, height, file_size)
+    """
+    schema = f"user_{user_id}"
+
+    query = f"""
+        SELECT id, product_id, url, width, height, file_size
+        FROM {schema}.product_images
+        WHERE variants IS NULL
+          AND url LIKE 'http%%'
+    """
+    params: list = []
+
+    if product_id:
+        query += " AND product_id = %s"
+        params.append(product_id)
+
+    query += " ORDER BY product_id, \"order\""
+
+    if limit:
+        query += " LIMIT %s"
+        params.append(limit)
+
+    with conn.cursor(cursor_factory=RealDictCursor) as cur:
+        cur.execute(query, params)
+        return cur.fetchall()
+
+
+def update_image_variants(
+    conn,
+    user_id: int,
+    image_id: int,
+    variants: Dict[str, str],
+    size: Optional[Tuple[int, int]],
+    file_size: int,
+) -> None:
+    """
+    Record the variants of an image (and missing dimensions/size).
+
+    Args:
+        conn: Database connection
+        user_id: User ID (schema)
+        image_id: product_images.id
+        variants: {variant_name: url}
+        size: (width, height) of the full-size image
+        file_size: Full-size image bytes
+    """
+    schema = f"user_{user_id}"
+    width, height = size if size else (None, None)
+
+    query = f"""
+        UPDATE {schema}.product_images
+        SET variants = %s::jsonb,
+            width = COALESCE(width, %s),
+            height = COALESCE(height, %s),
+            file_size = COALESCE(file_size, %s),
+            updated_at = NOW()
+        WHERE id = %s
+    """
+
+    with conn.cursor() as cur:
+        cur.execute(query, (json.dumps(variants), width, height, file_size, image_id))
+
+    conn.commit()
+
+
+async def backfill_image(
+    pool: ThreadedConnectionPool,
+    client: httpx.AsyncClient,
+    user_id: int,
+    image: Dict,
+    stats: BackfillStats,
+    semaphore: asyncio.Semaphore,
+    dry_run: bool = False,
+) -> bool:
+    """
+    Generate and record the variants of one image.
+
+    Args:
+        pool: Database connection pool
+        client: Shared HTTP client (CDN downloads)
+        user_id: User ID
+        image: Image dict (id, product_id, url, ...)
+        stats: Backfill statistics tracker
+        semaphore: Semaphore for limiting concurrency
+        dry_run: If True, don't make changes
+
+    Returns:
+        True if variants were recorded
+    """
+    async with semaphore:
+        url = image["url"]
+
+        if dry_run:
+            logger.info(f"  [dry-run] Would generate variants for image {image['id']}: {url[:60]}")
+            stats.increment("images_skipped")
+            return False
+
+        try:
+            response = await client.get(url)
+            response.raise_for_status()
+            content = response.content
+        except Exception as e:
+            stats.add_failed_image(url, f"Download: {str(e)[:40]}")
+            logger.error(f"  Error downloading {url}: {e}")
+            return False
+
+        size, variants = await FileService.store_variants(url, content)
+        if variants is None:
+            # Generation or upload failed: variants stay NULL (retried next run)
+            stats.add_failed_image(url, "Variant generation/upload failed")
+            return False
+        if not variants:
+            # Image already small: {} is recorded, no variant needed
+            stats.increment("images_skipped")
+
+        conn = await asyncio.to_thread(pool.getconn)
+        try:
+            await asyncio.to_thread(
+                update_image_variants, conn, user_id, image["id"], variants, size, len(content)
+            )
+        finally:
+            pool.putconn(conn)
+
+        if variants:
+            stats.increment("images_updated")
+            stats.increment("variants_uploaded", len(variants))
+            logger.debug(f"  Image {image['id']}: {', '.join(variants)}")
+        return True
+
+
+async def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Backfill responsive image variants (thumbnail/medium)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    # Dry run for user 1
+    python scripts/backfill_image_variants.py --user-id 1 --dry-run
+
+    # Backfill single product (test)
+    python scripts/backfill_image_variants.py --user-id 1 --product-id 409
+
+    # Full backfill with 20 parallel workers
+    python scripts/backfill_image_variants.py --user-id 1 --workers 20
+        """,
+    )
+    parser.add_argument("--user-id", type=int, required=True, help="User ID to backfill")
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Show what would be done"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=10, help="Number of parallel workers (default: 10)"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=100, help="Images per progress update (default: 100)"
+    )
+    parser.add_argument(
+        "--product-id", type=int, help="Backfill only specific product ID"
+    )
+    parser.add_argument(
+        "--limit", type=int, help="Limit total images to process"
+    )
+
+    args = parser.parse_args()
+
+    print(f"""
+╔══════════════════════════════════════════════════════════════╗
+║          RESPONSIVE IMAGE VARIANTS BACKFILL                  ║
+╠══════════════════════════════════════════════════════════════╣
+║  User ID    : {args.user_id:<10}                                    ║
+║  Workers    : {args.workers:<10}                                    ║
+║  Batch size : {args.batch_size:<10}                                    ║
+║  Dry run    : {str(args.dry_run):<10}                                    ║
+╚══════════════════════════════════════════════════════════════╝
+""")
+
+    if args.dry_run:
+        logger.info("=== DRY RUN MODE - No changes will be made ===")
+
+    # Check R2 availability
+    if not args.dry_run and not r2_service.is_available:
+        logger.error("R2 service not available. Check configuration.")
+        logger.error("Required env vars: R2_ACCESS_KEY_ID, R2_SECRET_ACCESS_KEY, R2_ENDPOINT")
+        sys.exit(1)
+
+    # Create connection pool for parallel access
+    try:
+        pool = ThreadedConnectionPool(
+            minconn=2,
+            maxconn=args.workers + 2,
+            **DB_CONFIG
+        )
+        conn = pool.getconn()
+        logger.info(f"Connected to database: {DB_CONFIG['dbname']} (pool: {args.workers + 2} connections)")
+    except Exception as e:
+        logger.error(f"Database connection failed: {e}")
+        sys.exit(1)
+
+    stats = BackfillStats()
+    semaphore = asyncio.Semaphore(args.workers)
+
+    try:
+        images = get_images_without_variants(conn, args.user_id, args.product_id, args.limit)
+        pool.putconn(conn)
+
+        if not images:
+            logger.info("No images without variants found")
+            return
+
+        logger.info(f"Found {len(images)} images without variants")
+        logger.info(f"Starting backfill with {args.workers} parallel workers...")
+
+        async with httpx.AsyncClient(
+            timeout=DOWNLOAD_TIMEOUT_SECONDS, follow_redirects=True
+        ) as client:
+
+            async def process_with_progress(image, total):
+                try:
+                    await backfill_image(
+                        pool, client, args.user_id, image, stats, semaphore, args.dry_run
+                    )
+                except Exception as e:
+                    logger.error(f"Error processing image {image['id']}: {e}")
+                    stats.add_failed_image(image["url"], str(e)[:50])
+                stats.increment("images_processed")
+
+                # Progress update every batch_size images
+                if stats.images_processed % args.batch_size == 0 or stats.images_processed == total:
+                    pct = (stats.images_processed / total) * 100
+                    elapsed = time.time() - stats.start_time
+                    rate = stats.images_processed / elapsed if elapsed > 0 else 0
+                    logger.info(
+                        f"Progress: {stats.images_processed}/{total} ({pct:.1f}%) - "
+                        f"Images: {stats.images_updated} updated, {len(stats.images_failed)} failed - "
+                        f"Rate: {rate:.1f} img/s"
+                    )
+
+            await asyncio.gather(*(process_with_progress(image, len(images)) for image in images))
+
+    finally:
+        pool.closeall()
+
+    # Final report
+    print(stats.report())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
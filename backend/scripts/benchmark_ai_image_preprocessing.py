@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+AI Image Preprocessing Benchmark
+
+Compares the AI vision image preparation before/after the image loader:
+- Download: sequential (fresh client per analysis) vs concurrent (shared pool),
+  against a simulated CDN with fixed latency.
+- Downscale: payload size and estimated image tokens sent to Gemini.
+
+Token estimate (Gemini <= 2.5): 258 tokens if both sides <= 384px, else
+258 tokens per 768x768 tile. Gemini 3 bills a fixed budget per image
+(media_resolution), so there the gain is payload/latency only.
+
+Usage:
+    cd backend
+    python scripts/benchmark_ai_image_preprocessing.py [--images-dir DIR] [--analyses 10] [--latency-ms 80] [--max-side 1536]
+
+Without --images-dir, a fixture set of 2000x1500 photos (the FileService
+upload maximum) is generated.
+
+Created: 2026-02-04
+"""
+
+import argparse
+import asyncio
+import math
+import os
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from PIL import Image, ImageDraw
+
+from services.ai import image_loader
+from services.ai.image_loader import build_image_parts, download_images
+
+IMAGES_PER_ANALYSIS = 5
+
+
+def estimate_tokens(content: bytes) -> int:
+    width, height = Image.open(BytesIO(content)).size
+    if width <= 384 and height <= 384:
+        return 258
+    return math.ceil(width / 768) * math.ceil(height / 768) * 258
+
+
+def generate_fixtures(count: int) -> list[bytes]:
+    """Photo-like JPEGs (noise + shapes, so compression is realistic)."""
+    fixtures = []
+    for i in range(count):
+        img = Image.merge(
+            "RGB",
+            [Image.effect_noise((2000, 1500), 40 + 10 * c).point(lambda v, c=c: v // (c + 1)) for c in range(3)],
+        )
+        draw = ImageDraw.Draw(img)
+        draw.rectangle((300 + i * 10, 200, 1700, 1300), outline=(20, 20, 20), width=25)
+        output = BytesIO()
+        img.save(output, format="JPEG", quality=90)
+        fixtures.append(output.getvalue())
+    return fixtures
+
+
+def load_fixtures(images_dir: Path) -> list[bytes]:
+    return [
+        path.read_bytes()
+        for path in sorted(images_dir.iterdir())
+        if path.suffix.lower() in {".jpg", ".jpeg", ".png", ".webp"}
+    ]
+
+
+def make_transport(fixtures: list[bytes], latency: float) -> httpx.MockTransport:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        index = int(request.url.path.strip("/").split(".")[0])
+        return httpx.Response(200, content=fixtures[index], headers={"content-type": "image/jpeg"})
+
+    return httpx.MockTransport(handler)
+
+
+async def sequential_download(transport: httpx.MockTransport, urls: list[str]) -> list[bytes]:
+    """Previous behavior: new client per analysis, one request after another."""
+    contents = []
+    async with httpx.AsyncClient(transport=transport) as client:
+        for url in urls:
+            response = await client.get(url)
+            contents.append(response.content)
+    return contents
+
+
+async def run(args) -> None:
+    fixtures = (
+        load_fixtures(Path(args.images_dir)) if args.images_dir
+        else generate_fixtures(IMAGES_PER_ANALYSIS)
+    )
+    if not fixtures:
+        sys.exit("No images found")
+
+    transport = make_transport(fixtures, args.latency_ms / 1000)
+    urls = [f"https://cdn.test/{i % len(fixtures)}.jpg" for i in range(IMAGES_PER_ANALYSIS)]
+
+    # Download
+    start = time.perf_counter()
+    for _ in range(args.analyses):
+        await sequential_download(transport, urls)
+    sequential_s = (time.perf_counter() - start) / args.analyses
+
+    shared_client = httpx.AsyncClient(transport=transport)
+    with patch.object(image_loader, "get_http_client", return_value=shared_client):
+        start = time.perf_counter()
+        for _ in range(args.analyses):
+            downloaded = await download_images(urls)
+        concurrent_s = (time.perf_counter() - start) / args.analyses
+    await shared_client.aclose()
+
+    # Downscale
+    with patch.object(image_loader.settings, "ai_image_downscale_enabled", True), \
+         patch.object(image_loader.settings, "ai_image_max_side", args.max_side):
+        start = time.perf_counter()
+        parts = await build_image_parts(downloaded)
+        downscale_s = time.perf_counter() - start
+
+    bytes_before = sum(len(content) for content, _ in downloaded)
+    bytes_after = sum(len(part.inline_data.data) for part in parts)
+    tokens_before = sum(estimate_tokens(content) for content, _ in downloaded)
+    tokens_after = sum(estimate_tokens(part.inline_data.data) for part in parts)
+
+    print(f"Fixture set: {len(fixtures)} images, {IMAGES_PER_ANALYSIS} per analysis, "
+          f"CDN latency {args.latency_ms}ms, {args.analyses} analyses")
+    print()
+    print("Download per analysis")
+    print(f"  sequential (before): {sequential_s * 1000:8.1f} ms")
+    print(f"  concurrent (after):  {concurrent_s * 1000:8.1f} ms  (x{sequential_s / concurrent_s:.1f})")
+    print()
+    print(f"Downscale to {args.max_side}px (thread pool): {downscale_s * 1000:.1f} ms per analysis")
+    print(f"  payload: {bytes_before / 1024:8.0f} KB -> {bytes_after / 1024:8.0f} KB "
+          f"(-{(1 - bytes_after / bytes_before) * 100:.0f}%)")
+    print(f"  Expert images tokens (tile estimate): {tokens_before} -> {tokens_after} "
+          f"(-{(1 - tokens_after / tokens_before) * 100:.0f}%)")
+    print("  Router reuses the first 2 Parts: no second download/resize")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark AI image preprocessing")
+    parser.add_argument("--images-dir", help="Directory of real product images (optional)")
+    parser.add_argument("--analyses", type=int, default=10, help="Analyses to average over")
+    parser.add_argument("--latency-ms", type=float, default=80.0, help="Simulated CDN latency")
+    parser.add_argument("--max-side", type=int, default=1536, help="Downscale target (pixels)")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Bulk Pricing Benchmark
+
+Compares whole-inventory repricing:
+- Scalar: PricingService.calculate_price() per product, with 2 lookups per
+  product (BrandGroup + Model) against an in-memory store that sleeps
+  --query-ms per lookup (simulated DB round-trip)
+- Bulk: BulkPricingService.compute() over the same products (the set-based
+  queries of price_items() are 2 round-trips for the whole inventory)
+
+Also checks that both paths give the same 3 prices for every product.
+No database needed: products, BrandGroups, Models and coefficients are
+synthetic (fixed seed).
+
+Usage:
+    cd backend
+    python scripts/benchmark_bulk_pricing.py [--products 50000] [--brands 300] [--query-ms 0.5] [--scalar-sample 5000]
+
+--scalar-sample limits the (slow) scalar run; its time is extrapolated
+to --products.
+
+Created: 2026-02-04
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from decimal import Decimal
+from types import MappingProxyType
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.product_attributes.model import Model
+from models.public.brand_group import BrandGroup
+from schemas.pricing import PriceInput
+from services.pricing.bulk_pricing import BulkPricingItem, BulkPricingService
+from services.pricing.coefficient_snapshot import PricingCoefficients
+from services.pricing.group_determination import determine_group
+from services.pricing_service import PricingService
+
+CATEGORIES = [
+    ("jeans", ("denim",)),
+    ("jacket", ("leather",)),
+    ("jacket", ("cotton",)),
+    ("shirt", ("silk",)),
+    ("t-shirt", ("cotton",)),
+    ("sweater", ("wool",)),
+    ("pants", ("cotton", "elastane")),
+]
+ORIGINS = ["France", "Italy", "USA", "Japan", "China", "Portugal"]
+DECADES = ["1970s", "1980s", "1990s", "2000s", "2010s"]
+TRENDS = ["Y2K", "Workwear", "Minimalist", "Grunge"]
+FEATURES = ["Selvedge", "Deadstock", "Made in USA", "Chain stitch"]
+FITS = ["Slim", "Regular", "Loose", "Oversized"]
+MODELS = ["501", "505", "Trucker", "Classic", "Heritage"]
+
+
+def build_coefficients() -> PricingCoefficients:
+    def coefs(names, low, high):
+        return MappingProxyType({
+            name: Decimal(str(round(random.uniform(low, high), 2))) for name in names
+        })
+
+    return PricingCoefficients(
+        version=1,
+        condition=MappingProxyType({note: Decimal(str(round(0.2 + note * 0.095, 2))) for note in range(11)}),
+        origin=coefs(ORIGINS, -0.10, 0.20),
+        decade=coefs(DECADES, 0.0, 0.25),
+        trend=coefs(TRENDS, 0.0, 0.20),
+        feature=coefs(FEATURES, 0.0, 0.15),
+        fit=coefs(FITS, -0.05, 0.10),
+    )
+
+
+def build_reference(brands: list[str]) -> tuple[dict, dict]:
+    brand_groups, models = {}, {}
+    for brand in brands:
+        for category, materials in CATEGORIES:
+            group = determine_group(category, list(materials))
+            if random.random() < 0.05:
+                continue  # Missing BrandGroup (NO_BRAND_GROUP)
+            brand_groups[(brand, group)] = BrandGroup(
+                id=len(brand_groups) + 1,
+                brand=brand,
+                group=group,
+                base_price=Decimal(str(random.randint(15, 120))),
+                expected_origins=random.sample(ORIGINS, 2),
+                expected_decades=random.sample(DECADES, 1),
+                expected_trends=random.sample(TRENDS, 1),
+            )
+            for name in random.sample(MODELS, 2):
+                models[(brand, group, name)] = Model(
+                    brand=brand,
+                    group=group,
+                    name=name,
+                    coefficient=Decimal(str(round(random.uniform(0.8, 1.8), 2))),
+                    expected_features=random.sample(FEATURES, 1),
+                )
+    return brand_groups, models
+
+
+def build_items(count: int, brands: list[str]) -> list[BulkPricingItem]:
+    items = []
+    for product_id in range(1, count + 1):
+        category, materials = random.choice(CATEGORIES)
+        items.append(BulkPricingItem(
+            product_id=product_id,
+            brand=random.choice(brands),
+            category=category,
+            materials=materials,
+            model_name=random.choice(MODELS + [None]),
+            condition=random.randint(0, 10),
+            origin=random.choice(ORIGINS),
+            decade=random.choice(DECADES),
+            trend=random.choice(TRENDS + [None]),
+            unique_features=tuple(random.sample(FEATURES, random.randint(0, 2))),
+            fit=random.choice(FITS),
+            current_price=Decimal("30.00"),
+            version_number=1,
+        ))
+    return items
+
+
+class _Store:
+    """In-memory repositories with a simulated round-trip per lookup."""
+
+    def __init__(self, brand_groups: dict, models: dict, query_seconds: float):
+        self.brand_groups = brand_groups
+        self.models = models
+        self.query_seconds = query_seconds
+
+    def get_by_brand_and_group(self, db, brand, group):
+        time.sleep(self.query_seconds)
+        return self.brand_groups.get((brand, group))
+
+    def get_by_brand_group_and_name(self, db, brand, group, name):
+        time.sleep(self.query_seconds)
+        return self.models.get((brand, group, name))
+
+
+class _SnapshotPricingService(PricingService):
+    def __init__(self, store: _Store, coefficients: PricingCoefficients):
+        super().__init__(db=None, brand_group_repo=store, model_repo=store, generation_service=None)
+        self._coefficients = coefficients
+
+    def _load_pricing_coefficients(self) -> PricingCoefficients:
+        return self._coefficients
+
+
+async def run_scalar(service: PricingService, items: list[BulkPricingItem]) -> dict:
+    prices = {}
+    for item in items:
+        output = await service.calculate_price(PriceInput(
+            brand=item.brand,
+            category=item.category,
+            materials=list(item.materials),
+            model_name=item.model_name,
+            condition_score=item.condition,
+            supplements=[],
+            condition_sensitivity=Decimal("1.0"),
+            actual_origin=item.origin,
+            expected_origins=[],
+            actual_decade=item.decade,
+            expected_decades=[],
+            actual_trends=[item.trend] if item.trend else [],
+            expected_trends=[],
+            actual_features=list(item.unique_features),
+            expected_features=[],
+            actual_fit=item.fit,
+            expected_fits=[],
+        ))
+        prices[item.product_id] = (output.quick_price, output.standard_price, output.premium_price)
+    return prices
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bulk vs scalar pricing")
+    parser.add_argument("--products", type=int, default=50000)
+    parser.add_argument("--brands", type=int, default=300)
+    parser.add_argument("--query-ms", type=float, default=0.5, help="Simulated DB round-trip per lookup")
+    parser.add_argument("--scalar-sample", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    brands = [f"Brand {i}" for i in range(args.brands)]
+    coefficients = build_coefficients()
+    brand_groups, models = build_reference(brands)
+    items = build_items(args.products, brands)
+    print(f"{len(items)} products, {len(brand_groups)} brand groups, {len(models)} models")
+
+    start = time.perf_counter()
+    bulk_results = BulkPricingService.compute(items, brand_groups, models, coefficients)
+    bulk_seconds = time.perf_counter() - start
+    print(f"Bulk:   {bulk_seconds:8.2f}s  ({len(items) / bulk_seconds:,.0f} products/s)")
+
+    # Scalar path on products whose BrandGroup/Model exist (it would generate the others)
+    sample = [
+        r.item for r in bulk_results
+        if r.status == "OK"
+        and (r.item.model_name is None or (r.item.brand, r.group, r.item.model_name) in models)
+    ][:args.scalar_sample]
+    service = _SnapshotPricingService(_Store(brand_groups, models, args.query_ms / 1000), coefficients)
+    start = time.perf_counter()
+    scalar_prices = asyncio.run(run_scalar(service, sample))
+    scalar_seconds = time.perf_counter() - start
+    extrapolated = scalar_seconds / len(sample) * len(items) if sample else 0.0
+    print(f"Scalar: {scalar_seconds:8.2f}s for {len(sample)} products "
+          f"(~{extrapolated:.1f}s for {len(items)}, x{extrapolated / bulk_seconds:.0f})")
+
+    bulk_prices = {
+        r.item.product_id: (r.quick_price, r.standard_price, r.premium_price)
+        for r in bulk_results
+    }
+    mismatches = [pid for pid, prices in scalar_prices.items() if bulk_prices[pid] != prices]
+    print(f"Parity: {len(scalar_prices) - len(mismatches)}/{len(scalar_prices)} identical")
+    if mismatches:
+        print(f"  Mismatching product ids: {mismatches[:20]}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
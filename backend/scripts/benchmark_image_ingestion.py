@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Image Ingestion Benchmark
+
+Measures the throughput (images/sec) of a Vinted photo import:
+- Sequential (previous pipeline): one photo after another, fresh HTTP client
+  per photo, Pillow optimization and boto3 put_object on the event loop,
+  0.5s pause between photos (--no-pause to drop it)
+- Pipeline: VintedImageDownloader (bounded concurrency, shared HTTP client,
+  optimization in the thread pool, boto3 off the event loop)
+
+A local S3-compatible stand-in (HTTP server, fixed latency) serves the source
+photos (GET) and receives the uploads (PUT), so boto3 runs its real code path.
+
+Usage:
+    cd backend
+    python scripts/benchmark_image_ingestion.py [--products 4] [--photos 8] [--latency-ms 60] [--concurrency 4] [--no-pause]
+
+Created: 2026-02-04
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from PIL import Image, ImageDraw
+
+from services import file_service, r2_service as r2_module
+from services.file_service import FileService
+from services.r2_service import R2Service
+from services.vinted import vinted_image_downloader
+from services.vinted.vinted_image_downloader import VintedImageDownloader
+from shared.config import settings
+
+BUCKET = "benchmark"
+
+
+def generate_fixtures(count: int) -> list[bytes]:
+    """Photo-like 1600x1200 WebP images (Vinted serves WebP)."""
+    fixtures = []
+    for i in range(count):
+        img = Image.merge(
+            "RGB",
+            [Image.effect_noise((1600, 1200), 40 + 10 * c).point(lambda v, c=c: v // (c + 1)) for c in range(3)],
+        )
+        draw = ImageDraw.Draw(img)
+        draw.rectangle((200 + i * 10, 150, 1400, 1050), outline=(20, 20, 20), width=20)
+        output = BytesIO()
+        img.save(output, format="WEBP", quality=85)
+        fixtures.append(output.getvalue())
+    return fixtures
+
+
+def start_stand_in(fixtures: list[bytes], latency: float) -> tuple[ThreadingHTTPServer, dict]:
+    """S3-compatible stand-in: GET /src/{i}.webp serves fixtures, PUT stores objects."""
+    stored: dict[str, int] = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            time.sleep(latency)
+            index = int(self.path.rsplit("/", 1)[-1].split(".")[0])
+            body = fixtures[index % len(fixtures)]
+            self.send_response(200)
+            self.send_header("Content-Type", "image/webp")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_PUT(self):
+            length = int(self.headers.get("Content-Length", 0))
+            self.rfile.read(length)
+            time.sleep(latency)
+            stored[self.path] = length
+            self.send_response(200)
+            self.send_header("ETag", '"bench"')
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, stored
+
+
+def photos_data(base_url: str, product: int, photos: int) -> str:
+    return json.dumps([
+        {"full_size_url": f"{base_url}/src/{product * photos + i}.webp"} for i in range(photos)
+    ])
+
+
+async def run_sequential(r2: R2Service, base_url: str, products: int, photos: int, pause: bool) -> int:
+    """Previous pipeline: everything in line on the event loop."""
+    done = 0
+    for product in range(products):
+        for i, photo in enumerate(json.loads(photos_data(base_url, product, photos))):
+            if i > 0 and pause:
+                await asyncio.sleep(0.5)
+            async with httpx.AsyncClient(timeout=45.0) as client:
+                response = await client.get(photo["full_size_url"])
+                response.raise_for_status()
+            content, extension = FileService._optimize_image(response.content, "webp")
+            r2._client.put_object(
+                Bucket=BUCKET, Key=f"1/products/{product}/{i}.{extension}",
+                Body=content, ContentType="image/jpeg",
+            )
+            done += 1
+    return done
+
+
+async def run_pipeline(base_url: str, products: int, photos: int) -> int:
+    done = 0
+    for product in range(products):
+        result = await VintedImageDownloader.download_and_attach_images(
+            db=None, user_id=1, product_id=product,
+            photos_data=photos_data(base_url, product, photos),
+        )
+        done += result["images_copied"]
+    return done
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark image ingestion throughput")
+    parser.add_argument("--products", type=int, default=4)
+    parser.add_argument("--photos", type=int, default=8, help="Photos per product")
+    parser.add_argument("--latency-ms", type=float, default=60.0, help="Stand-in latency per request")
+    parser.add_argument("--concurrency", type=int, default=4, help="Parallel photos per product")
+    parser.add_argument("--no-pause", action="store_true", help="Sequential run without the 0.5s pause")
+    args = parser.parse_args()
+
+    fixtures = generate_fixtures(8)
+    server, stored = start_stand_in(fixtures, args.latency_ms / 1000)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    total = args.products * args.photos
+    print(f"{total} photos ({args.products} products x {args.photos}), "
+          f"{sum(map(len, fixtures)) / len(fixtures) / 1024:.0f}KB average, "
+          f"{args.latency_ms:.0f}ms stand-in latency")
+
+    with patch.multiple(
+        settings,
+        r2_account_id="benchmark",
+        r2_access_key_id="benchmark",
+        r2_secret_access_key="benchmark",
+        r2_endpoint=base_url,
+        r2_bucket_name=BUCKET,
+        r2_public_url="https://cdn.benchmark",
+        vinted_image_download_concurrency=args.concurrency,
+    ):
+        r2 = R2Service()
+        with patch.object(file_service, "r2_service", r2), \
+                patch.object(r2_module, "r2_service", r2), \
+                patch.object(vinted_image_downloader.ProductService, "add_image"):
+            start = time.perf_counter()
+            done = asyncio.run(run_sequential(r2, base_url, args.products, args.photos, not args.no_pause))
+            sequential = time.perf_counter() - start
+            print(f"Sequential: {done} images in {sequential:6.2f}s  ({done / sequential:5.1f} images/s)")
+
+            start = time.perf_counter()
+            done = asyncio.run(run_pipeline(base_url, args.products, args.photos))
+            pipeline = time.perf_counter() - start
+            print(f"Pipeline:   {done} images in {pipeline:6.2f}s  ({done / pipeline:5.1f} images/s, "
+                  f"x{sequential / pipeline:.1f})")
+
+    server.shutdown()
+    print(f"Objects stored by the stand-in: {len(stored)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Product List Benchmark
+
+Compares the page latency of the two product list paths on a user's schema:
+- list:  GET /products      (ProductService.list_products + ProductListResponse)
+- grid:  GET /products/grid (ProductListProjection.list_items + ProductGridResponse)
+
+Each measure covers the query and the JSON serialization of one page, for
+the first, middle and last pages, and reports p50 / p95 in ms.
+
+--seed N inserts N synthetic products (with one image, two colors and one
+material each, so the triggers fill the projection) before measuring, then
+rolls everything back: the schema is left unchanged.
+
+Usage:
+    cd backend
+    python scripts/benchmark_product_list.py --user-id 1 [--seed 50000] [--runs 20] [--limit 20]
+
+Created: 2026-02-04
+"""
+
+import argparse
+import math
+import os
+import statistics
+import sys
+import time
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+
+from schemas.product_schemas import (
+    ProductGridResponse,
+    ProductListItemResponse,
+    ProductListResponse,
+)
+from services.product_list_projection import ProductListProjection
+from services.product_service import ProductService
+from shared.database import get_tenant_schema, get_tenant_session
+
+
+def seed_products(db, count: int) -> None:
+    """Insert synthetic products with set-based statements (not committed)."""
+    schema = get_tenant_schema(db)
+    started = time.perf_counter()
+    db.execute(text(f"""
+        INSERT INTO "{schema}".products (title, description, price, category, brand, condition,
+                                         size_normalized, stock_quantity, status, created_at, updated_at)
+        SELECT 'Benchmark product ' || n, 'Benchmark', 10 + n % 90, 'Jeans', 'Levi''s', 8,
+               'M', 1, 'DRAFT', now() - n * interval '1 minute', now()
+        FROM generate_series(1, :count) n
+    """), {"count": count})
+    db.execute(text(f"""
+        INSERT INTO "{schema}".product_images (product_id, url, "order", is_label, created_at, updated_at)
+        SELECT id, 'https://cdn.example.com/' || id || '.jpg', 0, false, now(), now()
+        FROM "{schema}".products WHERE title LIKE 'Benchmark product %'
+    """))
+    db.execute(text(f"""
+        INSERT INTO "{schema}".product_colors (product_id, color, is_primary)
+        SELECT p.id, c.color, c.is_primary
+        FROM "{schema}".products p
+        CROSS JOIN (VALUES ('Blue', true), ('Black', false)) c(color, is_primary)
+        WHERE p.title LIKE 'Benchmark product %'
+    """))
+    db.execute(text(f"""
+        INSERT INTO "{schema}".product_materials (product_id, material, percentage)
+        SELECT id, 'Cotton', 100
+        FROM "{schema}".products WHERE title LIKE 'Benchmark product %'
+    """))
+    print(f"Seeded {count} products in {time.perf_counter() - started:.1f}s")
+
+
+def page_list(db, skip: int, limit: int) -> int:
+    products, total = ProductService.list_products(db, skip=skip, limit=limit)
+    response = ProductListResponse(
+        products=products, total=total, page=skip // limit + 1, page_size=limit,
+        total_pages=math.ceil(total / limit) if total else 1,
+    )
+    return len(response.model_dump_json())
+
+
+def page_grid(db, skip: int, limit: int) -> int:
+    rows, total = ProductListProjection.list_items(db, skip=skip, limit=limit)
+    response = ProductGridResponse.model_construct(
+        items=[ProductListItemResponse.from_row(row) for row in rows],
+        total=total, page=skip // limit + 1, page_size=limit,
+        total_pages=math.ceil(total / limit) if total else 1,
+    )
+    return len(response.model_dump_json())
+
+
+def measure(db, page_fn, skip: int, limit: int, runs: int) -> tuple[float, float, int]:
+    """Return (p50 ms, p95 ms, response bytes) for one page."""
+    size = page_fn(db, skip, limit)  # Warm-up (plan cache, connection)
+    timings = []
+    for _ in range(runs):
+        db.expunge_all()  # No identity map reuse between runs
+        started = time.perf_counter()
+        page_fn(db, skip, limit)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    p95 = timings[min(len(timings) - 1, math.ceil(len(timings) * 0.95) - 1)]
+    return statistics.median(timings), p95, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark product list vs grid page latency")
+    parser.add_argument("--user-id", type=int, required=True)
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic products to insert (rolled back)")
+    parser.add_argument("--runs", type=int, default=20, help="Measures per page")
+    parser.add_argument("--limit", type=int, default=20, help="Page size")
+    args = parser.parse_args()
+
+    db = get_tenant_session(args.user_id)
+    try:
+        if args.seed:
+            seed_products(db, args.seed)
+        db.execute(text("ANALYZE"))
+
+        _, total = ProductListProjection.list_items(db, limit=1)
+        last_skip = max(0, (math.ceil(total / args.limit) - 1) * args.limit)
+        pages = {"first": 0, "middle": last_skip // 2 // args.limit * args.limit, "last": last_skip}
+        print(f"Products: {total}, page size: {args.limit}, runs: {args.runs}\n")
+
+        print(f"{'page':<8}{'path':<6}{'p50 ms':>10}{'p95 ms':>10}{'bytes':>10}")
+        for name, skip in pages.items():
+            for path, page_fn in (("list", page_list), ("grid", page_grid)):
+                p50, p95, size = measure(db, page_fn, skip, args.limit, args.runs)
+                print(f"{name:<8}{path:<6}{p50:>10.1f}{p95:>10.1f}{size:>10}")
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Text Templates Benchmark
+
+Compares listing text rendering for a bulk preview/export:
+- Texts, per format: the 5 titles and 5 descriptions of
+  ProductTextGeneratorService rendered with one call per format (one
+  attribute snapshot per call)
+- Texts, generate_all_batch(): one snapshot per product shared by the 10
+  precompiled templates
+- eBay HTML, per product: a new EbayDescriptionService per product
+  (MarketplaceConfig query every time, sleeping --query-ms)
+- eBay HTML, batch: one service for all products (language memoized,
+  page shell compiled once per language and shop)
+
+Also checks that both paths give identical texts. Products are plain
+objects (not ORM rows), so the listing render cache never serves them:
+every text is rendered.
+
+Usage:
+    cd backend
+    python scripts/benchmark_text_templates.py [--products 2000] [--query-ms 0.5] [--rounds 3]
+
+Created: 2026-02-04
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.ebay import ebay_description_service
+from services.ebay.ebay_description_service import EbayDescriptionService
+from services.product_text_generator import (
+    DescriptionStyle,
+    ProductTextGeneratorService,
+    TitleFormat,
+)
+from services.reference_catalog import ReferenceCatalog
+
+BRANDS = ["Levi's", "Carhartt", "Ralph Lauren", "Nike", "unbranded", None]
+CATEGORIES = ["Jeans", "Jacket", "Shirt", "T-shirt", "Sweater", "Shorts", "Robe"]
+COLORS = ["Blue", "Black", "White", "Red", "Green", "Beige"]
+MATERIALS = ["Cotton", "Denim", "Wool", "Leather", "Polyester"]
+FITS = ["Slim", "Regular", "Loose", "Oversized", None]
+DECADES = ["1970s", "1980s", "1990s", "2000s", None]
+TRENDS = ["Y2K", "Workwear", "Minimalist", "Grunge", None]
+PATTERNS = ["Uni", "Striped", "Checked", None]
+SEASONS = ["Summer", "Winter", "All seasons", None]
+FEATURES = ["Selvedge", "Deadstock", "Made in USA", "Chain stitch"]
+CONDITION_SUPS = ["Small stain", "Faded", "Missing button"]
+
+TITLE_KEYS = {
+    "minimaliste": TitleFormat.MINIMALISTE,
+    "standard_vinted": TitleFormat.STANDARD_VINTED,
+    "seo_mots_cles": TitleFormat.SEO_MOTS_CLES,
+    "vintage_collectionneur": TitleFormat.VINTAGE_COLLECTIONNEUR,
+    "technique_professionnel": TitleFormat.TECHNIQUE_PROFESSIONNEL,
+}
+DESCRIPTION_KEYS = {
+    "catalogue_structure": DescriptionStyle.CATALOGUE_STRUCTURE,
+    "descriptif_redige": DescriptionStyle.DESCRIPTIF_REDIGE,
+    "fiche_technique": DescriptionStyle.FICHE_TECHNIQUE,
+    "vendeur_pro": DescriptionStyle.VENDEUR_PRO,
+    "visuel_emoji": DescriptionStyle.VISUEL_EMOJI,
+}
+
+CATALOG = ReferenceCatalog.from_rows({
+    "categories": [
+        {"name_en": name, "name_fr": name, "parent_category": "Pants" if name == "Jeans" else None}
+        for name in CATEGORIES
+    ],
+    "colors": [{"name_en": name, "name_fr": name.lower()} for name in COLORS],
+    "conditions": [{"note": note, "name_en": f"Condition {note}"} for note in range(11)],
+    "genders": [{"name_en": "men", "name_fr": "Homme"}, {"name_en": "women", "name_fr": "Femme"}],
+})
+
+
+def build_products(count: int) -> list[SimpleNamespace]:
+    products = []
+    for product_id in range(1, count + 1):
+        products.append(SimpleNamespace(
+            id=product_id,
+            brand=random.choice(BRANDS),
+            model=random.choice(["501", "Detroit", None]),
+            category=random.choice(CATEGORIES),
+            gender=random.choice(["men", "women"]),
+            size_normalized=random.choice(["S", "M", "L", "W32"]),
+            size_original=random.choice(["M", "W32/L34", None]),
+            colors=random.sample(COLORS, random.randint(0, 2)),
+            materials=random.sample(MATERIALS, random.randint(0, 1)),
+            material=random.choice(MATERIALS),
+            fit=random.choice(FITS),
+            decade=random.choice(DECADES),
+            trend=random.choice(TRENDS),
+            pattern=random.choice(PATTERNS),
+            season=random.choice(SEASONS),
+            origin=random.choice(["France", "USA", "Italy", None]),
+            condition=random.randint(0, 10),
+            condition_sup=random.sample(CONDITION_SUPS, random.randint(0, 2)),
+            unique_feature=random.sample(FEATURES, random.randint(0, 2)),
+            rise=None, closure=None, stretch=None, length=None, neckline=None,
+            sleeve_length=None, lining=None, sport=None, marking=None, location=None,
+            **{f"dim{i}": random.choice([None, random.randint(20, 110)]) for i in range(1, 7)},
+        ))
+    return products
+
+
+def render_per_format(products: list) -> list[dict]:
+    service = ProductTextGeneratorService
+    return [
+        {
+            "titles": {key: service.generate_title(p, fmt) for key, fmt in TITLE_KEYS.items()},
+            "descriptions": {
+                key: service.generate_description(p, style) for key, style in DESCRIPTION_KEYS.items()
+            },
+        }
+        for p in products
+    ]
+
+
+class _Db:
+    """MarketplaceConfig lookups with a simulated round-trip."""
+
+    def __init__(self, query_seconds: float):
+        self.query_seconds = query_seconds
+        self.queries = 0
+
+    def query(self, model):
+        return self
+
+    def filter(self, *criteria):
+        return self
+
+    def first(self):
+        self.queries += 1
+        time.sleep(self.query_seconds)
+        return SimpleNamespace(get_language=lambda: "fr")
+
+
+def timed(label: str, products: list, render, rounds: int):
+    best, result = None, None
+    for _ in range(rounds):
+        start = time.perf_counter()
+        result = render()
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    print(f"{label:<28} {best:8.3f}s  ({len(products) / best:,.0f} products/s)")
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark precompiled text templates")
+    parser.add_argument("--products", type=int, default=2000)
+    parser.add_argument("--query-ms", type=float, default=0.5, help="Simulated DB round-trip per query")
+    parser.add_argument("--rounds", type=int, default=3, help="Best of N runs")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    products = build_products(args.products)
+    print(f"{len(products)} products, 10 text formats + 1 eBay HTML description each")
+
+    per_format_seconds, per_format = timed(
+        "Texts, per format:", products, lambda: render_per_format(products), args.rounds,
+    )
+    batch_seconds, batch = timed(
+        "Texts, generate_all_batch:", products,
+        lambda: ProductTextGeneratorService.generate_all_batch(products), args.rounds,
+    )
+    print(f"  x{per_format_seconds / batch_seconds:.2f}")
+
+    query_seconds = args.query_ms / 1000
+    with patch.object(ebay_description_service, "get_reference_catalog", return_value=CATALOG):
+        db = _Db(query_seconds)
+        per_product_seconds, per_product_html = timed(
+            "eBay HTML, per product:", products,
+            lambda: [EbayDescriptionService(db).generate_description(p, "EBAY_FR") for p in products],
+            args.rounds,
+        )
+        per_product_queries = db.queries // args.rounds
+
+        db = _Db(query_seconds)
+
+        def render_batch():
+            service = EbayDescriptionService(db)
+            return [service.generate_description(p, "EBAY_FR") for p in products]
+
+        batch_html_seconds, batch_html = timed("eBay HTML, batch:", products, render_batch, args.rounds)
+        batch_queries = db.queries // args.rounds
+    print(f"  x{per_product_seconds / batch_html_seconds:.2f} "
+          f"({per_product_queries} → {batch_queries} MarketplaceConfig queries)")
+
+    mismatches = [
+        p.id for p, a, b, c, d in zip(products, per_format, batch, per_product_html, batch_html)
+        if a != b or c != d
+    ]
+    print(f"Parity: {len(products) - len(mismatches)}/{len(products)} identical")
+    if mismatches:
+        print(f"  Mismatching product ids: {mismatches[:20]}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
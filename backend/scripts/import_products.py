@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Bulk Product Import
+
+Imports a CSV / NDJSON catalog into a user's products with
+ProductImportService (COPY staging + set-based validation and insert),
+then prints the report and the throughput.
+
+The subscription quota is not applied (admin tool).
+
+Usage:
+    cd backend
+    python scripts/import_products.py --user-id 1 --file catalog.csv [--format csv|ndjson] [--dry-run]
+
+--dry-run runs the whole import (validation, pricing, insert) then rolls
+back: the report shows what would be imported.
+
+Created: 2026-02-04
+"""
+
+import argparse
+import os
+import sys
+
+# Add backend to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.product_import import IMPORT_FORMATS, ProductImportService
+from shared.database import get_tenant_session
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import products from a CSV / NDJSON file")
+    parser.add_argument("--user-id", type=int, required=True)
+    parser.add_argument("--file", required=True)
+    parser.add_argument("--format", choices=IMPORT_FORMATS, default=None, help="Default: file extension")
+    parser.add_argument("--dry-run", action="store_true", help="Roll back after the import")
+    args = parser.parse_args()
+
+    import_format = args.format or ("ndjson" if args.file.endswith((".ndjson", ".jsonl")) else "csv")
+
+    db = get_tenant_session(args.user_id)
+    try:
+        with open(args.file, "rb") as stream:
+            report = ProductImportService.import_stream(db, stream, import_format)
+        if args.dry_run:
+            db.rollback()
+        else:
+            db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    print(f"Rows:      {report.total}")
+    print(f"Imported:  {report.imported}{' (dry run, rolled back)' if args.dry_run else ''}")
+    print(f"Rejected:  {report.failed}")
+    print(f"Priced:    {report.priced}")
+    if report.ignored_columns:
+        print(f"Ignored columns: {', '.join(report.ignored_columns)}")
+    seconds = report.elapsed_ms / 1000
+    if seconds:
+        print(f"Time:      {seconds:.2f}s ({report.total / seconds * 60:,.0f} rows/min)")
+    for error in report.errors[:50]:
+        print(f"  row {error.row}: {error.error}")
+    if len(report.errors) > 50:
+        print(f"  ... {len(report.errors) - 50} more")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,8 @@ Where ADJUSTMENTS = origin_adj + decade_adj + trend_adj + feature_adj + fit_adj
 
 Created: 2026-01-22
 Updated: 2026-01-22 - Added fit adjustment
+Updated: 2026-02-04 - Coefficients from the shared pricing snapshot
+Updated: 2026-02-04 - Bulk pricing engine (set-based lookups, same rounding as PricingService)
 """
 
 import argparse
@@ -23,33 +25,18 @@ import os
 import sys
 from dataclasses import dataclass
 from datetime import datetime
-from decimal import Decimal, InvalidOperation
+from decimal import Decimal
 from typing import Optional
 
 # Add backend to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlalchemy import create_engine, select, text
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
 
-from models.public.brand_group import BrandGroup
-from models.public.condition import Condition
-from models.public.decade import Decade
-from models.public.fit import Fit
-from models.public.origin import Origin
-from models.public.trend import Trend
-from models.public.unique_feature import UniqueFeature
-from models.product_attributes.model import Model
-from models.user.product import Product, ProductStatus
-from services.pricing.group_determination import determine_group
-from services.pricing.adjustment_calculators import (
-    calculateConditionMultiplier,
-    calculateDecadeAdjustment,
-    calculateFeatureAdjustment,
-    calculateFitAdjustment,
-    calculateOriginAdjustment,
-    calculateTrendAdjustment,
-)
+from models.user.product import ProductStatus
+from services.pricing.bulk_pricing import BulkPricingItem, BulkPricingResult, BulkPricingService
+from services.pricing.coefficient_snapshot import PricingCoefficients, get_pricing_coefficients
 from shared.config import settings
 
 
@@ -101,56 +88,17 @@ class PriceComparisonAnalyzer:
         self.Session = sessionmaker(bind=self.engine)
         self._current_user_id: Optional[int] = None
 
-        # Coefficient caches
-        self._condition_coeffs: dict[int, Decimal] = {}
-        self._origin_coeffs: dict[str, Decimal] = {}
-        self._decade_coeffs: dict[str, Decimal] = {}
-        self._trend_coeffs: dict[str, Decimal] = {}
-        self._feature_coeffs: dict[str, Decimal] = {}
-        self._fit_coeffs: dict[str, Decimal] = {}
+        # Shared coefficient snapshot (loaded once per process)
+        self._coefficients: Optional[PricingCoefficients] = None
 
     def _load_coefficients(self, db: Session) -> None:
-        """Load all pricing coefficients from database."""
-        # Conditions (note -> coefficient)
-        conditions = db.execute(select(Condition)).scalars().all()
-        self._condition_coeffs = {
-            c.note: c.coefficient for c in conditions if c.coefficient is not None
-        }
-
-        # Origins (name_en -> pricing_coefficient)
-        origins = db.execute(select(Origin)).scalars().all()
-        self._origin_coeffs = {
-            o.name_en: o.pricing_coefficient for o in origins
-        }
-
-        # Decades (name_en -> pricing_coefficient)
-        decades = db.execute(select(Decade)).scalars().all()
-        self._decade_coeffs = {
-            d.name_en: d.pricing_coefficient for d in decades
-        }
-
-        # Trends (name_en -> pricing_coefficient)
-        trends = db.execute(select(Trend)).scalars().all()
-        self._trend_coeffs = {
-            t.name_en: t.pricing_coefficient for t in trends
-        }
-
-        # Unique features (name_en -> pricing_coefficient)
-        features = db.execute(select(UniqueFeature)).scalars().all()
-        self._feature_coeffs = {
-            f.name_en: f.pricing_coefficient for f in features
-        }
-
-        # Fits (name_en -> pricing_coefficient)
-        fits = db.execute(select(Fit)).scalars().all()
-        self._fit_coeffs = {
-            f.name_en: f.pricing_coefficient for f in fits
-        }
-
-        print(f"  Loaded coefficients: {len(self._condition_coeffs)} conditions, "
-              f"{len(self._origin_coeffs)} origins, {len(self._decade_coeffs)} decades, "
-              f"{len(self._trend_coeffs)} trends, {len(self._feature_coeffs)} features, "
-              f"{len(self._fit_coeffs)} fits")
+        """Load the pricing coefficient snapshot (same one as PricingService)."""
+        self._coefficients = get_pricing_coefficients(db)
+        c = self._coefficients
+        print(f"  Loaded coefficients v{c.version}: {len(c.condition)} conditions, "
+              f"{len(c.origin)} origins, {len(c.decade)} decades, "
+              f"{len(c.trend)} trends, {len(c.feature)} features, "
+              f"{len(c.fit)} fits")
 
     def _get_user_schemas(self, db: Session) -> list[int]:
         """Get list of user IDs that have schemas."""
@@ -169,211 +117,64 @@ class PriceComparisonAnalyzer:
                 continue
         return user_ids
 
-    def _get_published_products(self, user_id: int) -> list[Product]:
-        """Get all published products for a user using schema_translate_map."""
+    def _get_published_items(self, user_id: int) -> list[BulkPricingItem]:
+        """Get the pricing attributes of all published products of a user."""
         # Create execution options with schema translation
         schema_map = {"tenant": f"user_{user_id}"}
 
-        # Create a connection with schema translation
         with self.engine.connect() as conn:
-            # Use execution options to translate schema
             conn = conn.execution_options(schema_translate_map=schema_map)
 
             # Set search path for FKs resolution
             conn.execute(text(f"SET search_path TO user_{user_id}, product_attributes, public"))
 
-            # Create session with this connection
             session = Session(bind=conn)
-
             try:
-                # Query products with status PUBLISHED
-                stmt = select(Product).where(
-                    Product.status == ProductStatus.PUBLISHED,
-                    Product.deleted_at.is_(None)
+                return BulkPricingService.load_tenant_items(
+                    session, statuses=[ProductStatus.PUBLISHED]
                 )
-                results = list(session.execute(stmt).scalars().all())
-
-                # Eager load M2M relationships while session is active
-                for p in results:
-                    # Access properties to trigger lazy loading
-                    _ = p.materials
-                    _ = p.unique_feature
-
-                return results
             finally:
                 session.close()
 
-    def _get_brand_group(self, db: Session, brand: str, group: str) -> Optional[BrandGroup]:
-        """Fetch BrandGroup from database."""
-        stmt = select(BrandGroup).where(
-            BrandGroup.brand == brand,
-            BrandGroup.group == group
-        )
-        return db.execute(stmt).scalar_one_or_none()
-
-    def _get_model(self, db: Session, brand: str, group: str, model_name: str) -> Optional[Model]:
-        """Fetch Model from database."""
-        stmt = select(Model).where(
-            Model.brand == brand,
-            Model.group == group,
-            Model.name == model_name
-        )
-        return db.execute(stmt).scalar_one_or_none()
-
-    def calculate_product_price(
-        self,
-        db: Session,
-        product: Product
-    ) -> PriceCalculationResult:
-        """
-        Calculate price for a single product using the new algorithm.
-
-        Formula: PRICE = BASE_PRICE × MODEL_COEFF × CONDITION_MULT × (1 + ADJUSTMENTS)
-        """
-        # Extract product attributes
-        brand = product.brand or "Unknown"
-        category = product.category
-        model_name = product.model
-        condition = product.condition
-        origin = product.origin
-        decade = product.decade
-        trend = product.trend
-        fit = product.fit if hasattr(product, 'fit') else None
-        unique_features = product.unique_feature or []
-        materials = product.materials  # Property from M2M relationship
-
+    @staticmethod
+    def _to_comparison_result(priced: BulkPricingResult) -> PriceCalculationResult:
+        """Convert a bulk pricing result into a report row."""
+        item = priced.item
         result = PriceCalculationResult(
-            product_id=product.id,
-            title=product.title[:50] if product.title else "",
-            brand=brand,
-            category=category,
-            model_name=model_name,
-            condition=condition,
-            origin=origin,
-            decade=decade,
-            trend=trend,
-            fit=fit,
-            unique_features=unique_features,
-            materials=materials,
-            group=None,
-            base_price=None,
-            model_coeff=Decimal("1.0"),
-            condition_mult=Decimal("1.0"),
-            origin_adj=Decimal("0.0"),
-            decade_adj=Decimal("0.0"),
-            trend_adj=Decimal("0.0"),
-            feature_adj=Decimal("0.0"),
-            fit_adj=Decimal("0.0"),
-            total_adjustment=Decimal("0.0"),
-            current_price=product.price,
-            calculated_price=None,
+            product_id=item.product_id,
+            title=item.title[:50],
+            brand=item.brand,
+            category=item.category,
+            model_name=item.model_name,
+            condition=item.condition,
+            origin=item.origin,
+            decade=item.decade,
+            trend=item.trend,
+            fit=item.fit,
+            unique_features=list(item.unique_features),
+            materials=list(item.materials),
+            group=priced.group,
+            base_price=priced.base_price,
+            model_coeff=priced.model_coeff,
+            condition_mult=priced.condition_mult,
+            origin_adj=priced.origin_adj,
+            decade_adj=priced.decade_adj,
+            trend_adj=priced.trend_adj,
+            feature_adj=priced.feature_adj,
+            fit_adj=priced.fit_adj,
+            total_adjustment=priced.total_adjustment,
+            current_price=item.current_price,
+            calculated_price=priced.standard_price,
             difference=None,
             difference_pct=None,
-            status="OK",
-            error_message=None
+            status=priced.status,
+            error_message=priced.error,
         )
 
-        try:
-            # Step 1: Determine group
-            try:
-                group = determine_group(category, materials)
-                result.group = group
-            except ValueError as e:
-                result.status = "ERROR"
-                result.error_message = f"Group determination failed: {e}"
-                return result
-
-            # Step 2: Get BrandGroup
-            brand_group = self._get_brand_group(db, brand, group)
-            if not brand_group:
-                result.status = "NO_BRAND_GROUP"
-                result.error_message = f"No BrandGroup for {brand} + {group}"
-                return result
-
-            result.base_price = brand_group.base_price
-
-            # Step 3: Get Model (if provided)
-            model = None
-            if model_name:
-                model = self._get_model(db, brand, group, model_name)
-                if model:
-                    result.model_coeff = model.coefficient
-
-            # Step 4: Calculate condition multiplier
-            if condition is not None:
-                condition_coeff = self._condition_coeffs.get(condition, Decimal("1.0"))
-                result.condition_mult = calculateConditionMultiplier(condition_coeff)
-
-            # Step 5: Calculate adjustments using DIFF logic
-            # Adjustment = actual - MAX(expected)
-
-            # Origin adjustment
-            expected_origins = brand_group.expected_origins or []
-            result.origin_adj = calculateOriginAdjustment(
-                origin,
-                expected_origins,
-                self._origin_coeffs
-            )
-
-            # Decade adjustment
-            expected_decades = brand_group.expected_decades or []
-            result.decade_adj = calculateDecadeAdjustment(
-                decade,
-                expected_decades,
-                self._decade_coeffs
-            )
-
-            # Trend adjustment
-            expected_trends = brand_group.expected_trends or []
-            actual_trends = [trend] if trend else []
-            result.trend_adj = calculateTrendAdjustment(
-                actual_trends,
-                expected_trends,
-                self._trend_coeffs
-            )
-
-            # Feature adjustment
-            expected_features = []
-            if model:
-                expected_features = model.expected_features or []
-            result.feature_adj = calculateFeatureAdjustment(
-                unique_features,
-                expected_features,
-                self._feature_coeffs
-            )
-
-            # Fit adjustment
-            result.fit_adj = calculateFitAdjustment(
-                fit,
-                [],  # No expected fits for now
-                self._fit_coeffs
-            )
-
-            # Step 6: Calculate total adjustment and final price
-            result.total_adjustment = (
-                result.origin_adj +
-                result.decade_adj +
-                result.trend_adj +
-                result.feature_adj +
-                result.fit_adj
-            )
-
-            # Formula: PRICE = BASE_PRICE × MODEL_COEFF × CONDITION_MULT × (1 + ADJUSTMENTS)
-            result.calculated_price = (
-                result.base_price *
-                result.model_coeff *
-                result.condition_mult *
-                (1 + result.total_adjustment)
-            ).quantize(Decimal("0.01"))
-
-            # Step 7: Compare with current price
-            if result.current_price > 0:
-                result.difference = result.calculated_price - result.current_price
-                result.difference_pct = (result.difference / result.current_price * 100).quantize(Decimal("0.01"))
-
-        except Exception as e:
-            result.status = "ERROR"
-            result.error_message = str(e)
+        # Compare with current price
+        if result.calculated_price is not None and result.current_price > 0:
+            result.difference = result.calculated_price - result.current_price
+            result.difference_pct = (result.difference / result.current_price * 100).quantize(Decimal("0.01"))
 
         return result
 
@@ -394,18 +195,19 @@ class PriceComparisonAnalyzer:
         """
         results = []
 
-        # Load coefficients once (from public/product_attributes schemas)
-        with self.Session() as db:
-            self._load_coefficients(db)
+        # Load coefficients once per process (shared snapshot)
+        if self._coefficients is None:
+            with self.Session() as db:
+                self._load_coefficients(db)
 
         # Get products using separate connection with schema translation
-        products = self._get_published_products(user_id)
-        print(f"  Found {len(products)} published products for user {user_id}")
+        items = self._get_published_items(user_id)
+        print(f"  Found {len(items)} published products for user {user_id}")
 
-        # Calculate prices using a new session
+        # Calculate prices in bulk (set-based BrandGroup/Model lookups)
         with self.Session() as db:
-            for product in products:
-                result = self.calculate_product_price(db, product)
+            for priced in BulkPricingService.price_items(db, items):
+                result = self._to_comparison_result(priced)
 
                 # Determine status based on threshold
                 if result.calculated_price and result.difference_pct:
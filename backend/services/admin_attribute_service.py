@@ -14,6 +14,12 @@ from models.public.brand import Brand
 from models.public.category import Category
 from models.public.color import Color
 from models.public.material import Material
+from services.ai.attribute_vocabulary import invalidate_attribute_vocabulary
+from services.pricing.coefficient_snapshot import invalidate_pricing_coefficients
+from services.reference_catalog import (
+    PRICING_COEFFICIENT_TABLES,
+    invalidate_reference_catalog,
+)
 from shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -58,6 +64,17 @@ class AdminAttributeService:
             raise ValueError(f"Unknown attribute type: {attr_type}")
         return config["model"]
 
+    @staticmethod
+    def _invalidate_caches(attr_type: str) -> None:
+        """Drop process-wide caches built from reference data."""
+        # Other processes reload on the NOTIFY sent by the table trigger
+        invalidate_reference_catalog([attr_type])
+        # Brands are not part of the AI vocabulary (free text, matched after)
+        if attr_type != "brands":
+            invalidate_attribute_vocabulary()
+        if attr_type in PRICING_COEFFICIENT_TABLES:
+            invalidate_pricing_coefficients()
+
     @classmethod
     def get_pk_field(cls, attr_type: str) -> str:
         """Get primary key field name for attribute type."""
@@ -174,6 +191,7 @@ class AdminAttributeService:
         db.add(item)
         db.commit()
         db.refresh(item)
+        AdminAttributeService._invalidate_caches(attr_type)
 
         logger.info(f"Admin created {attr_type[:-1]}: {pk_value}")
         return item
@@ -208,6 +226,7 @@ class AdminAttributeService:
 
         db.commit()
         db.refresh(item)
+        AdminAttributeService._invalidate_caches(attr_type)
 
         logger.info(f"Admin updated {attr_type[:-1]}: {pk}")
         return item
@@ -237,6 +256,7 @@ class AdminAttributeService:
         try:
             db.delete(item)
             db.commit()
+            AdminAttributeService._invalidate_caches(attr_type)
             logger.info(f"Admin deleted {attr_type[:-1]}: {pk}")
             return True
         except Exception as e:
@@ -11,7 +11,9 @@ from typing import Optional
 from sqlalchemy import func, and_, case
 from sqlalchemy.orm import Session
 
+from models.public.ai_analysis_cache import AIAnalysisCache
 from models.public.user import User, UserRole, SubscriptionTier
+from services.ai.result_cache import ai_result_cache
 from shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -262,3 +264,22 @@ class AdminStatsService:
                 for user in new_registrations
             ],
         }
+
+    @staticmethod
+    def get_ai_cache_stats(db: Session) -> dict:
+        """
+        Get AI analysis result cache statistics.
+
+        Returns:
+            dict with process hit/miss counters and stored entries
+        """
+        entries, total_hits = db.query(
+            func.count(AIAnalysisCache.cache_key),
+            func.coalesce(func.sum(AIAnalysisCache.hit_count), 0),
+        ).one()
+
+        return {
+            **ai_result_cache.stats(),
+            "entries": entries,
+            "total_hits": int(total_hits),
+        }
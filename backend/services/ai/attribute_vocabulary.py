@@ -0,0 +1,151 @@
+"""
+AI Attribute Vocabulary
+
+Process-wide, versioned snapshot of the reference data used by the AI vision
+pipeline (categories, colors, materials, fits...), with the router schema and
+the Expert prompts/response schemas precomputed per parent category group.
+
+An analysis therefore runs zero reference-data queries: the snapshot is built
+once (~23 queries) and reused until:
+- AdminAttributeService creates/updates/deletes an attribute
+  (invalidate_attribute_vocabulary())
+- VOCABULARY_TTL_SECONDS elapses (changes made by other processes/migrations)
+
+The version is a content hash: identical vocabularies have the same version
+in every process (usable in cache keys).
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy.orm import Session
+
+from shared.clothing_visibility_config import CLOTHING_VISIBILITY_CONFIG
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+VOCABULARY_TTL_SECONDS = 600
+
+
+@dataclass(frozen=True)
+class ExpertPrompt:
+    """Precomputed Expert step inputs for one attribute subset."""
+
+    db_keys: frozenset
+    prompt: str
+    response_schema: dict
+
+
+@dataclass(frozen=True)
+class AttributeVocabulary:
+    """Immutable vocabulary snapshot (do not mutate the returned lists/dicts)."""
+
+    version: str
+    attributes: dict[str, list[str]]
+    category_parents: dict[str, str]  # leaf name_en -> parent group (lowercase)
+    router_schema: dict
+    expert_prompts: dict[Optional[str], ExpertPrompt]  # parent group (None = unknown)
+    full_prompt: ExpertPrompt  # Router fallback: all attributes
+
+    def parent_group(self, category_name_en: str) -> Optional[str]:
+        """Parent category group of a leaf category (None if unknown)."""
+        return self.category_parents.get(category_name_en)
+
+    def expert_prompt(self, parent_group: Optional[str]) -> ExpertPrompt:
+        """Expert prompt/schema for a parent group (unknown groups share one)."""
+        if parent_group not in CLOTHING_VISIBILITY_CONFIG:
+            parent_group = None
+        return self.expert_prompts[parent_group]
+
+
+_vocabulary: Optional[AttributeVocabulary] = None
+_loaded_at = 0.0
+_lock = threading.Lock()
+
+
+def _compute_version(attributes: dict[str, list[str]], category_parents: dict[str, str]) -> str:
+    payload = json.dumps(
+        {"attributes": attributes, "category_parents": category_parents},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def build_attribute_vocabulary(db: Session) -> AttributeVocabulary:
+    """Load reference data and precompute router/Expert prompts and schemas."""
+    # Import here to avoid circular imports (vision_service uses this module)
+    from models.public.category import Category
+    from services.ai.vision_service import AIVisionService
+
+    attributes = AIVisionService._fetch_product_attributes(db)
+    category_parents = {
+        row.name_en: row.parent_category.lower()
+        for row in db.query(Category.name_en, Category.parent_category)
+        .filter(Category.parent_category.isnot(None))
+        .all()
+    }
+
+    def expert(db_keys: set[str]) -> ExpertPrompt:
+        subset = {k: v for k, v in attributes.items() if k in db_keys}
+        return ExpertPrompt(
+            db_keys=frozenset(db_keys),
+            prompt=AIVisionService._build_prompt(subset),
+            response_schema=AIVisionService._build_response_schema(subset),
+        )
+
+    expert_prompts = {
+        group: expert(AIVisionService._get_filtered_db_keys(group))
+        for group in [*CLOTHING_VISIBILITY_CONFIG, None]
+    }
+
+    vocabulary = AttributeVocabulary(
+        version=_compute_version(attributes, category_parents),
+        attributes=attributes,
+        category_parents=category_parents,
+        router_schema=AIVisionService._build_router_schema(attributes["categories"]),
+        expert_prompts=expert_prompts,
+        full_prompt=expert(set(attributes)),
+    )
+
+    logger.info(
+        f"[AttributeVocabulary] Built version {vocabulary.version}: "
+        f"{sum(len(v) for v in attributes.values())} values, "
+        f"{len(expert_prompts)} expert prompts"
+    )
+    return vocabulary
+
+
+def get_attribute_vocabulary(db: Session) -> AttributeVocabulary:
+    """Return the cached vocabulary, building it if missing or expired."""
+    global _vocabulary, _loaded_at
+
+    with _lock:
+        if _vocabulary is not None and time.monotonic() - _loaded_at < VOCABULARY_TTL_SECONDS:
+            return _vocabulary
+
+    vocabulary = build_attribute_vocabulary(db)
+
+    with _lock:
+        _vocabulary = vocabulary
+        _loaded_at = time.monotonic()
+
+    return vocabulary
+
+
+def invalidate_attribute_vocabulary() -> None:
+    """Drop the cached vocabulary (rebuilt on next analysis)."""
+    global _vocabulary
+
+    with _lock:
+        _vocabulary = None
+
+    logger.info("[AttributeVocabulary] Invalidated")
@@ -0,0 +1,161 @@
+"""
+AI Image Loader
+
+Prepares product images for the AI vision pipeline:
+- Concurrent downloads from the R2 CDN through one shared HTTP pool
+  (per event loop), instead of one request after another on a fresh client.
+- Optional downscale/re-encode (Pillow, in a thread pool) to the resolution
+  actually useful to the model (ai_image_max_side): smaller upload payload
+  and, for tile-based models (Gemini <= 2.5), fewer image tokens.
+
+The resulting Parts are built once and reused by both pipeline steps
+(Router sends the first 2, Expert sends all).
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+import asyncio
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Optional
+
+import httpx
+from google.genai import types
+from PIL import Image, ImageOps
+
+from shared.config import settings
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+DOWNLOAD_TIMEOUT_SECONDS = 30.0
+JPEG_QUALITY = 85
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Shared download client of the running event loop (keep-alive pool)."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=DOWNLOAD_TIMEOUT_SECONDS,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=settings.ai_image_download_concurrency,
+                max_keepalive_connections=settings.ai_image_download_concurrency,
+            ),
+        )
+        _clients[loop] = client
+    return client
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.ai_image_workers,
+                    thread_name_prefix="ai-image",
+                )
+    return _executor
+
+
+async def _download_one(client: httpx.AsyncClient, url: str) -> Optional[tuple[bytes, str]]:
+    try:
+        response = await client.get(url)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.warning(f"[ImageLoader] Failed to download image {url}: {e}")
+        return None
+
+    logger.debug(f"[ImageLoader] Downloaded image: {url}")
+    return response.content, response.headers.get("content-type", "image/jpeg")
+
+
+async def download_images(urls: list[str]) -> list[tuple[bytes, str]]:
+    """
+    Download images concurrently (failed downloads are skipped, order kept).
+
+    Args:
+        urls: Image URLs
+
+    Returns:
+        List of (content, mime_type)
+    """
+    client = get_http_client()
+    results = await asyncio.gather(*(_download_one(client, url) for url in urls if url))
+    return [r for r in results if r is not None]
+
+
+def downscale_image(content: bytes, mime_type: str, max_side: int) -> tuple[bytes, str]:
+    """
+    Resize an image so its longest side is at most max_side (JPEG re-encode).
+
+    Images already small enough, or that Pillow cannot read, are returned
+    unchanged (Gemini gets the original bytes).
+
+    Returns:
+        Tuple of (content, mime_type)
+    """
+    try:
+        img = Image.open(BytesIO(content))
+        if max(img.size) <= max_side:
+            return content, mime_type
+
+        # JPEG: let the decoder scale down by 1/2, 1/4... when possible (faster)
+        img.draft("RGB", (max_side, max_side))
+
+        img = ImageOps.exif_transpose(img)
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        img.thumbnail((max_side, max_side), Image.Resampling.LANCZOS)
+
+        output = BytesIO()
+        img.save(output, format="JPEG", quality=JPEG_QUALITY)
+    except Exception as e:
+        logger.warning(f"[ImageLoader] Downscale skipped: {e}")
+        return content, mime_type
+
+    resized = output.getvalue()
+    if len(resized) >= len(content):
+        return content, mime_type
+    return resized, "image/jpeg"
+
+
+async def build_image_parts(images: list[tuple[bytes, str]]) -> list[types.Part]:
+    """
+    Build Gemini Parts, downscaling in the thread pool when enabled.
+
+    Args:
+        images: List of (content, mime_type)
+
+    Returns:
+        List of types.Part (same order)
+    """
+    if settings.ai_image_downscale_enabled:
+        loop = asyncio.get_running_loop()
+        executor = _get_executor()
+        images = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor, downscale_image, content, mime_type, settings.ai_image_max_side
+                )
+                for content, mime_type in images
+            )
+        )
+
+    return [
+        types.Part.from_bytes(data=content, mime_type=mime_type)
+        for content, mime_type in images
+    ]
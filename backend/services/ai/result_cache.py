@@ -0,0 +1,182 @@
+"""
+AI Analysis Result Cache
+
+Content-addressed cache of AI vision results (public.ai_analysis_cache).
+
+Key = SHA256(model, vocabulary version, SHA256 of each image in order):
+- identical images (duplicates, relists, Vinted imports) hit the cache
+- a new model or a vocabulary change (admin attribute edit) misses it, so
+  a cached result never references values unknown to the current prompt
+- image order matters (the Router uses the first 2 images)
+
+Policy:
+- TTL: entries unused for ai_cache_ttl_seconds are ignored then purged
+- LRU: purge() keeps at most ai_cache_max_entries (least recently used
+  first); it runs every PURGE_EVERY_PUTS stored results
+- Disabled globally with ai_cache_enabled, per user with
+  User.ai_result_cache_enabled
+
+Hit rate is exposed by stats() (admin stats endpoint).
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+import hashlib
+import threading
+from datetime import timedelta
+from typing import Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from models.public.ai_analysis_cache import AIAnalysisCache
+from schemas.ai_schemas import VisionExtractedAttributes
+from shared.config import settings
+from shared.datetime_utils import utc_now
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+# purge() runs opportunistically every N stored results
+PURGE_EVERY_PUTS = 500
+
+
+def compute_cache_key(images: list[bytes], model: str, vocabulary_version: str) -> str:
+    """Content hash of an image set for a model and vocabulary version."""
+    digest = hashlib.sha256()
+    digest.update(f"{model}\0{vocabulary_version}\0".encode())
+    for content in images:
+        digest.update(hashlib.sha256(content).digest())
+    return digest.hexdigest()
+
+
+class AIResultCache:
+    """Postgres-backed result cache with process-level hit/miss counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._puts = 0
+
+    def get(self, db: Session, cache_key: str) -> Optional[VisionExtractedAttributes]:
+        """
+        Return the cached result (and refresh its LRU timestamp) or None.
+
+        Errors are logged and treated as a miss: the cache never blocks an
+        analysis.
+        """
+        now = utc_now()
+        try:
+            entry = db.get(AIAnalysisCache, cache_key)
+            if entry is None or entry.last_used_at < now - timedelta(seconds=settings.ai_cache_ttl_seconds):
+                self._record(hit=False)
+                return None
+
+            result = VisionExtractedAttributes(**entry.result)
+            entry.hit_count += 1
+            entry.last_used_at = now
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"[AIResultCache] Lookup failed for {cache_key[:12]}: {e}")
+            self._record(hit=False)
+            return None
+
+        self._record(hit=True)
+        logger.info(f"[AIResultCache] Hit {cache_key[:12]} (hits={entry.hit_count})")
+        return result
+
+    def put(
+        self,
+        db: Session,
+        cache_key: str,
+        model: str,
+        vocabulary_version: str,
+        result: VisionExtractedAttributes,
+    ) -> None:
+        """Store (or replace) a result. Errors are logged, never raised."""
+        now = utc_now()
+        values = {
+            "cache_key": cache_key,
+            "model": model,
+            "vocabulary_version": vocabulary_version,
+            "result": result.model_dump(mode="json"),
+            "hit_count": 0,
+            "created_at": now,
+            "last_used_at": now,
+        }
+        stmt = insert(AIAnalysisCache).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AIAnalysisCache.cache_key],
+            set_={k: stmt.excluded[k] for k in ("result", "vocabulary_version", "last_used_at")},
+        )
+        try:
+            db.execute(stmt)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"[AIResultCache] Store failed for {cache_key[:12]}: {e}")
+            return
+
+        with self._lock:
+            self._puts += 1
+            should_purge = self._puts % PURGE_EVERY_PUTS == 0
+
+        if should_purge:
+            try:
+                self.purge(db)
+            except Exception as e:
+                db.rollback()
+                logger.warning(f"[AIResultCache] Purge failed: {e}")
+
+    @staticmethod
+    def purge(db: Session, max_entries: Optional[int] = None) -> int:
+        """
+        Delete expired entries, then the least recently used beyond max_entries.
+
+        Returns:
+            Number of deleted entries
+        """
+        max_entries = settings.ai_cache_max_entries if max_entries is None else max_entries
+        cutoff = utc_now() - timedelta(seconds=settings.ai_cache_ttl_seconds)
+
+        expired = db.execute(
+            delete(AIAnalysisCache).where(AIAnalysisCache.last_used_at < cutoff)
+        ).rowcount
+
+        keep = (
+            select(AIAnalysisCache.cache_key)
+            .order_by(AIAnalysisCache.last_used_at.desc())
+            .limit(max_entries)
+        )
+        evicted = db.execute(
+            delete(AIAnalysisCache).where(AIAnalysisCache.cache_key.not_in(keep))
+        ).rowcount
+        db.commit()
+
+        logger.info(f"[AIResultCache] Purged {expired} expired, {evicted} LRU entries")
+        return expired + evicted
+
+    def _record(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def stats(self) -> dict:
+        """Hit/miss counters of this process since start."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / total, 3) if total else 0.0,
+            }
+
+
+# Global instance
+ai_result_cache = AIResultCache()
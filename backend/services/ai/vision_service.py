@@ -8,13 +8,13 @@ Business Rules:
 - Télécharge les images depuis R2 CDN
 - Log chaque génération dans AIGenerationLog
 - Décrémente les crédits utilisés
+- Jeu d'images déjà analysé: résultat en cache, sans appel IA ni crédit
 """
 
 import time
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-import httpx
 from google import genai
 from google.genai import types
 from sqlalchemy.orm import Session
@@ -22,13 +22,17 @@ from sqlalchemy.orm import Session
 from models.public.user import User
 from models.user.ai_generation_log import AIGenerationLog
 from schemas.ai_schemas import VisionExtractedAttributes
+from services.ai.attribute_vocabulary import AttributeVocabulary, get_attribute_vocabulary
+from services.ai.image_loader import build_image_parts, download_images
+from services.ai.result_cache import ai_result_cache, compute_cache_key
 from shared.clothing_visibility_config import (
     ALWAYS_INCLUDED_DB_KEYS,
     CLOTHING_ATTR_TO_DB_KEY,
     CLOTHING_VISIBILITY_CONFIG,
 )
 from shared.config import settings
-from shared.exceptions import AIGenerationError, AIQuotaExceededError
+from shared.exceptions import AIGenerationError, AIQuotaExceededError, AIServiceBusyError
+from shared.gemini_client import generate_content, get_gemini_client
 from shared.logging import get_logger
 
 if TYPE_CHECKING:
@@ -144,6 +148,7 @@ Generate a precise JSON object adhering strictly to the provided schema."""
         user_id: int,
         monthly_credits: int = 0,
         max_images: int = 5,
+        credits_reserved: bool = False,
     ) -> tuple[VisionExtractedAttributes, int, Decimal, int]:
         """
         Analyse les images d'un produit et extrait les attributs.
@@ -154,6 +159,8 @@ Generate a precise JSON object adhering strictly to the provided schema."""
             user_id: ID de l'utilisateur
             monthly_credits: Crédits mensuels de l'abonnement
             max_images: Nombre max d'images à analyser (selon abonnement)
+            credits_reserved: Crédit déjà réservé (analyse par lot, voir
+                reserve_credits): ni vérification ni consommation
 
         Returns:
             tuple: (attributes, tokens_used, cost, images_analyzed)
@@ -172,8 +179,13 @@ Generate a precise JSON object adhering strictly to the provided schema."""
         if not product.images:
             raise AIGenerationError("Le produit n'a pas d'images à analyser.")
 
-        # 2. Vérifier les crédits
-        AIVisionService._check_credits(db, user_id, monthly_credits)
+        # 2. Vérifier les crédits (sauf si déjà réservés par le lot)
+        if credits_reserved:
+            user = db.query(User).filter(User.id == user_id).first()
+            if not user:
+                raise AIQuotaExceededError("Utilisateur non trouvé.")
+        else:
+            user = AIVisionService._check_credits(db, user_id, monthly_credits)
 
         # 3. Récupérer les images (max selon abonnement)
         # Exclure les images label (is_label=True) - ne garder que les photos produit
@@ -190,18 +202,19 @@ Generate a precise JSON object adhering strictly to the provided schema."""
         )
 
         # 4. Télécharger les images
-        image_parts = await AIVisionService._download_images(images_to_analyze)
+        images = await AIVisionService._download_images(images_to_analyze)
 
-        if not image_parts:
+        if not images:
             raise AIGenerationError("Impossible de télécharger les images du produit.")
 
-        # 5. Call Gemini and process response
-        return AIVisionService._call_gemini_and_process(
-            db, image_parts, user_id, product_id, images_analyzed, start_time
+        # 5. Cached result or Gemini call
+        return await AIVisionService._analyze_with_cache(
+            db, images, user, product_id, images_analyzed, start_time,
+            consume_credit=not credits_reserved,
         )
 
     @staticmethod
-    def _check_credits(db: Session, user_id: int, monthly_credits: int) -> None:
+    def _check_credits(db: Session, user_id: int, monthly_credits: int) -> User:
         """Vérifie que l'utilisateur a des crédits disponibles."""
         user = db.query(User).filter(User.id == user_id).first()
 
@@ -216,6 +229,8 @@ Generate a precise JSON object adhering strictly to the provided schema."""
                 "ou acheter des crédits supplémentaires."
             )
 
+        return user
+
     @staticmethod
     def _consume_credit(db: Session, user_id: int) -> None:
         """Décrémente les crédits utilisés."""
@@ -223,56 +238,151 @@ Generate a precise JSON object adhering strictly to the provided schema."""
         if user:
             user.ai_credits_used_this_month += 1
 
+    @staticmethod
+    def reserve_credits(db: Session, user_id: int, monthly_credits: int, count: int) -> int:
+        """
+        Réserve count crédits d'un coup (analyse par lot).
+
+        Les crédits sont comptés comme utilisés immédiatement (ligne User
+        verrouillée), puis les crédits non consommés (cache, échecs,
+        annulation) sont rendus par release_credits en fin de lot.
+
+        Raises:
+            AIQuotaExceededError: Si crédits insuffisants pour tout le lot
+        """
+        user = db.query(User).filter(User.id == user_id).with_for_update().first()
+
+        if not user:
+            raise AIQuotaExceededError("Utilisateur non trouvé.")
+
+        remaining = user.get_remaining_ai_credits(monthly_credits)
+        if remaining < count:
+            db.rollback()
+            raise AIQuotaExceededError(
+                f"Crédits IA insuffisants pour {count} analyses ({remaining} restants). "
+                "Veuillez upgrader votre abonnement ou acheter des crédits supplémentaires."
+            )
+
+        user.ai_credits_used_this_month += count
+        db.commit()
+
+        logger.info(f"[AIVisionService] Reserved {count} credits for user_id={user_id}")
+        return count
+
+    @staticmethod
+    def release_credits(db: Session, user_id: int, count: int) -> None:
+        """Rend count crédits réservés et non consommés."""
+        if count <= 0:
+            return
+
+        user = db.query(User).filter(User.id == user_id).with_for_update().first()
+        if user:
+            user.ai_credits_used_this_month = max(0, user.ai_credits_used_this_month - count)
+            db.commit()
+
+        logger.info(f"[AIVisionService] Released {count} credits for user_id={user_id}")
+
     @staticmethod
     async def _download_images(
         images: list[dict],
-    ) -> list[types.Part]:
+    ) -> list[tuple[bytes, str]]:
         """
-        Télécharge les images depuis les URLs R2 CDN.
+        Télécharge les images depuis les URLs R2 CDN (en parallèle, pool HTTP partagé).
 
         Args:
             images: Liste des images JSONB [{url, order, created_at}]
 
         Returns:
-            Liste de types.Part contenant les images
+            Liste de tuples (contenu_bytes, mime_type)
         """
-        image_parts = []
+        return await download_images([img.get("url", "") for img in images])
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            for idx, img in enumerate(images):
-                try:
-                    image_url = img.get("url", "")
-                    if not image_url:
-                        continue
+    @staticmethod
+    async def _analyze_with_cache(
+        db: Session,
+        images: list[tuple[bytes, str]],
+        user: User,
+        product_id: int | None,
+        images_analyzed: int,
+        start_time: float,
+        consume_credit: bool = True,
+    ) -> tuple[VisionExtractedAttributes, int, Decimal, int]:
+        """
+        Return a cached analysis of the same image set, or run the pipeline.
 
-                    response = await client.get(image_url)
-                    response.raise_for_status()
+        Cache hit: no Gemini call, no credit consumed (tokens=0, cost=0),
+        logged in AIGenerationLog with cached=True.
+        Cache miss: images are resized into Parts, the 2-step pipeline runs
+        and its result is stored.
 
-                    # Détecter le type MIME
-                    content_type = response.headers.get(
-                        "content-type", "image/jpeg"
-                    )
+        The cache is skipped when disabled globally (ai_cache_enabled) or by
+        the user (User.ai_result_cache_enabled).
 
-                    # Créer le Part pour Gemini
-                    part = types.Part.from_bytes(
-                        data=response.content,
-                        mime_type=content_type,
-                    )
-                    image_parts.append(part)
+        Args:
+            db: SQLAlchemy session
+            images: List of (content_bytes, mime_type), original bytes
+            user: User (from _check_credits)
+            product_id: Product ID (None for direct upload analysis)
+            images_analyzed: Number of images being analyzed
+            start_time: time.time() at the start of the analysis
+            consume_credit: False when the credit was reserved beforehand
 
-                    logger.debug(
-                        f"[AIVisionService] Downloaded image: {image_url}"
-                    )
+        Returns:
+            tuple: (attributes, tokens_used, cost, images_analyzed)
+        """
+        user_id = user.id
+        cache_key = None
 
-                except httpx.HTTPError as e:
-                    logger.warning(
-                        f"[AIVisionService] Failed to download image "
-                        f"{img.get('url', 'unknown')}: {e}"
-                    )
-                    # Continue avec les autres images
-                    continue
+        if settings.ai_cache_enabled and user.ai_result_cache_enabled:
+            vocabulary_version = get_attribute_vocabulary(db).version
+            cache_key = compute_cache_key(
+                [content for content, _ in images], settings.gemini_model, vocabulary_version
+            )
+            cached = ai_result_cache.get(db, cache_key)
+            if cached is not None:
+                AIVisionService._log_cache_hit(db, product_id, cache_key, cached, start_time)
+                return cached, 0, Decimal("0"), images_analyzed
+
+        image_parts = await build_image_parts(images)
+        result = await AIVisionService._call_gemini_and_process(
+            db, image_parts, user_id, product_id, images_analyzed, start_time,
+            consume_credit=consume_credit,
+        )
+
+        if cache_key:
+            ai_result_cache.put(
+                db, cache_key, settings.gemini_model, vocabulary_version, result[0]
+            )
+        return result
 
-        return image_parts
+    @staticmethod
+    def _log_cache_hit(
+        db: Session,
+        product_id: int | None,
+        cache_key: str,
+        attributes: VisionExtractedAttributes,
+        start_time: float,
+    ) -> None:
+        """Log a cached analysis (no tokens, no cost, no credit)."""
+        generation_time_ms = int((time.time() - start_time) * 1000)
+
+        db.add(AIGenerationLog(
+            product_id=product_id,
+            model=settings.gemini_model,
+            prompt_tokens=0,
+            completion_tokens=0,
+            total_tokens=0,
+            total_cost=Decimal("0"),
+            cached=True,
+            generation_time_ms=generation_time_ms,
+            response_data={"cache_key": cache_key, **attributes.model_dump(mode="json")},
+        ))
+        db.commit()
+
+        logger.info(
+            f"[AIVisionService] Analysis served from cache: product_id={product_id}, "
+            f"time={generation_time_ms}ms"
+        )
 
     @staticmethod
     def _fetch_product_attributes(db: Session) -> dict[str, list[str]]:
@@ -344,25 +454,17 @@ Generate a precise JSON object adhering strictly to the provided schema."""
         return attributes
 
     @staticmethod
-    def _call_router(
-        client,
-        router_images: list,
-        leaf_categories: list[str],
-    ) -> tuple[str, float, int, int] | None:
+    def _build_router_schema(leaf_categories: list[str]) -> dict:
         """
-        Pipeline Step 1 — Router: identify the clothing category from first images.
+        Build the Router response schema (category enum + confidence).
 
         Args:
-            client: Gemini client instance
-            router_images: First 2 image Parts (face + back)
             leaf_categories: List of valid leaf category names (enum)
 
         Returns:
-            (category_name, confidence, input_tokens, output_tokens) or None on failure
+            Gemini-compatible JSON schema dict
         """
-        import json
-
-        router_schema = {
+        return {
             "type": "OBJECT",
             "properties": {
                 "category": {"type": "STRING", "enum": leaf_categories},
@@ -371,6 +473,25 @@ Generate a precise JSON object adhering strictly to the provided schema."""
             "required": ["category", "confidence"],
         }
 
+    @staticmethod
+    async def _call_router(
+        client,
+        router_images: list,
+        router_schema: dict,
+    ) -> tuple[str, float, int, int] | None:
+        """
+        Pipeline Step 1 — Router: identify the clothing category from first images.
+
+        Args:
+            client: Gemini client instance (process-wide)
+            router_images: First 2 image Parts (face + back)
+            router_schema: Precomputed Router schema (see _build_router_schema)
+
+        Returns:
+            (category_name, confidence, input_tokens, output_tokens) or None on failure
+        """
+        import json
+
         router_prompt = (
             "Identify the exact clothing category of this item. "
             "Choose the most specific matching category from the schema enum. "
@@ -380,9 +501,10 @@ Generate a precise JSON object adhering strictly to the provided schema."""
         try:
             contents = router_images + [router_prompt]
 
-            response = client.models.generate_content(
+            response = await generate_content(
                 model=settings.gemini_model,
                 contents=contents,
+                client=client,
                 config=types.GenerateContentConfig(
                     system_instruction=(
                         "You are a clothing category classifier. "
@@ -420,37 +542,35 @@ Generate a precise JSON object adhering strictly to the provided schema."""
             )
             return (category, confidence, input_tokens, output_tokens)
 
+        except AIServiceBusyError:
+            # Saturated: the expert call would wait too, fail fast
+            raise
         except Exception as e:
             logger.warning(f"[AIVisionService] Router failed: {e}")
             return None
 
     @staticmethod
-    def _resolve_parent_group(db: Session, category_name_en: str) -> str | None:
+    def _resolve_parent_group(
+        vocabulary: AttributeVocabulary, category_name_en: str
+    ) -> str | None:
         """
         Pipeline Step 2a — Resolve the parent category group for a leaf category.
 
         Args:
-            db: SQLAlchemy session
+            vocabulary: Cached attribute vocabulary (category -> parent map)
             category_name_en: English name of the detected leaf category
 
         Returns:
             Parent category name_en (lowercase) or None if not found
         """
-        from models.public.category import Category
-
-        category = (
-            db.query(Category.parent_category)
-            .filter(Category.name_en == category_name_en)
-            .first()
-        )
+        parent_group = vocabulary.parent_group(category_name_en)
 
-        if not category or not category.parent_category:
+        if not parent_group:
             logger.debug(
                 f"[AIVisionService] No parent group for category '{category_name_en}'"
             )
             return None
 
-        parent_group = category.parent_category.lower()
         logger.debug(
             f"[AIVisionService] Resolved parent group: "
             f"'{category_name_en}' -> '{parent_group}'"
@@ -477,7 +597,7 @@ Generate a precise JSON object adhering strictly to the provided schema."""
                 db_key = CLOTHING_ATTR_TO_DB_KEY.get(attr)
                 if db_key:
                     filtered.add(db_key)
-            logger.info(
+            logger.debug(
                 f"[AIVisionService] Filtered attributes for '{parent_group}': "
                 f"{sorted(filtered)}"
             )
@@ -485,7 +605,7 @@ Generate a precise JSON object adhering strictly to the provided schema."""
             # Unknown group: include ALL clothing attribute DB keys (safe fallback)
             for db_key in CLOTHING_ATTR_TO_DB_KEY.values():
                 filtered.add(db_key)
-            logger.info(
+            logger.debug(
                 f"[AIVisionService] Unknown parent group '{parent_group}', "
                 f"using all clothing attributes"
             )
@@ -609,13 +729,14 @@ REFERENCE VALUES (use exact names):
 Analyze ALL provided images."""
 
     @staticmethod
-    def _call_gemini_and_process(
+    async def _call_gemini_and_process(
         db: Session,
         image_parts: list,
         user_id: int,
         product_id: int | None,
         images_analyzed: int,
         start_time: float,
+        consume_credit: bool = True,
     ) -> tuple[VisionExtractedAttributes, int, Decimal, int]:
         """
         2-step AI pipeline: Router (category detection) + Expert (full extraction).
@@ -626,6 +747,14 @@ Analyze ALL provided images."""
 
         Falls back to single-call behavior (all attributes) if the router fails.
 
+        Reference data, Router schema and Expert prompts/schemas come from the
+        cached AttributeVocabulary (precomputed per parent group): no
+        reference query and no prompt building per analysis.
+
+        Gemini calls go through the SDK async API with the process-wide
+        client and concurrency limiter (shared.gemini_client), so the event
+        loop is never blocked during the model calls.
+
         Args:
             db: SQLAlchemy session
             image_parts: List of Gemini Part objects (images)
@@ -633,27 +762,25 @@ Analyze ALL provided images."""
             product_id: Product ID (None for direct upload analysis)
             images_analyzed: Number of images being analyzed
             start_time: time.time() at the start of the analysis
+            consume_credit: False when the credit was reserved beforehand
+                (batch analysis)
 
         Returns:
             tuple: (attributes, tokens_used, cost, images_analyzed)
         """
         import json
 
-        # 1. Create Gemini client
-        client = genai.Client(
-            api_key=settings.gemini_api_key,
-            http_options=types.HttpOptions(
-                timeout=settings.gemini_timeout_seconds * 1000
-            ),
-        )
+        # 1. Process-wide Gemini client
+        client = get_gemini_client()
 
-        # 2. Fetch ALL product attributes from DB
-        all_attributes = AIVisionService._fetch_product_attributes(db)
+        # 2. Cached attribute vocabulary (built once, invalidated on admin edits)
+        vocabulary = get_attribute_vocabulary(db)
 
         # 3. STEP 1 — Router: send first 2 images to detect category
+        #    (same Parts as the Expert step: downloaded/resized once)
         router_images = image_parts[:2]
-        router_result = AIVisionService._call_router(
-            client, router_images, all_attributes["categories"]
+        router_result = await AIVisionService._call_router(
+            client, router_images, vocabulary.router_schema
         )
 
         total_input_tokens = 0
@@ -675,33 +802,32 @@ Analyze ALL provided images."""
 
             # 4. STEP 2 — Backend filter: resolve parent group and filter attributes
             parent_group = AIVisionService._resolve_parent_group(
-                db, detected_category
+                vocabulary, detected_category
+            )
+            expert = vocabulary.expert_prompt(parent_group)
+            logger.info(
+                f"[AIVisionService] Expert attributes for '{parent_group}': "
+                f"{sorted(expert.db_keys)}"
             )
-            filtered_db_keys = AIVisionService._get_filtered_db_keys(parent_group)
-            filtered_attributes = {
-                k: v for k, v in all_attributes.items() if k in filtered_db_keys
-            }
         else:
             # Fallback: use ALL attributes (legacy single-call behavior)
             pipeline_version = 1
             fallback_reason = "router_failed"
-            filtered_attributes = all_attributes
+            expert = vocabulary.full_prompt
             logger.info(
                 "[AIVisionService] Router fallback: using all attributes"
             )
 
         # 5. STEP 3 — Expert: send ALL images + filtered attributes
-        prompt = AIVisionService._build_prompt(filtered_attributes)
-        response_schema = AIVisionService._build_response_schema(
-            filtered_attributes
-        )
+        response_schema = expert.response_schema
 
         try:
-            contents = image_parts + [prompt]
+            contents = image_parts + [expert.prompt]
 
-            response = client.models.generate_content(
+            response = await generate_content(
                 model=settings.gemini_model,
                 contents=contents,
+                client=client,
                 config=types.GenerateContentConfig(
                     system_instruction=AIVisionService.SYSTEM_INSTRUCTION,
                     response_mime_type="application/json",
@@ -775,7 +901,8 @@ Analyze ALL provided images."""
             )
             db.add(log)
 
-            AIVisionService._consume_credit(db, user_id)
+            if consume_credit:
+                AIVisionService._consume_credit(db, user_id)
             db.commit()
 
             logger.info(
@@ -788,6 +915,9 @@ Analyze ALL provided images."""
 
             return extracted_attributes, total_tokens, cost, images_analyzed
 
+        except AIGenerationError:
+            # Busy limiter, call timeout, empty response: message already user-facing
+            raise
         except genai.errors.ClientError as e:
             logger.error(f"[AIVisionService] Gemini client error: {e}", exc_info=True)
             raise AIGenerationError("Clé API Gemini invalide ou erreur client")
@@ -938,7 +1068,7 @@ Analyze ALL provided images."""
             raise AIGenerationError("Aucune image fournie pour l'analyse.")
 
         # 2. Vérifier les crédits
-        AIVisionService._check_credits(db, user_id, monthly_credits)
+        user = AIVisionService._check_credits(db, user_id, monthly_credits)
 
         # 3. Utiliser les images fournies (déjà limitées par l'API selon abonnement)
         images_to_analyze = image_files
@@ -949,19 +1079,7 @@ Analyze ALL provided images."""
             f"for user_id={user_id}"
         )
 
-        # 4. Créer les Parts Gemini à partir des bytes
-        image_parts = []
-        for content, mime_type in images_to_analyze:
-            part = types.Part.from_bytes(
-                data=content,
-                mime_type=mime_type,
-            )
-            image_parts.append(part)
-
-        if not image_parts:
-            raise AIGenerationError("Impossible de traiter les images.")
-
-        # 5. Call Gemini and process response
-        return AIVisionService._call_gemini_and_process(
-            db, image_parts, user_id, None, images_analyzed, start_time
+        # 4. Cached result or Gemini call
+        return await AIVisionService._analyze_with_cache(
+            db, images_to_analyze, user, None, images_analyzed, start_time
         )
@@ -17,36 +17,48 @@ from typing import Dict
 
 from sqlalchemy.orm import Session
 
-from models.public.brand import Brand
-from models.public.category import Category
-from models.public.color import Color
-from models.public.condition import Condition
-from models.public.fit import Fit
-from models.public.gender import Gender
-from models.public.material import Material
-from models.public.season import Season
-from models.public.size_normalized import SizeNormalized
+from services.reference_catalog import ReferenceCatalog, get_reference_catalog
+
+
+def _build_mappings(catalog: ReferenceCatalog) -> Dict[str, Dict[str, str]]:
+    """Mappings bidirectionnels FR ↔ EN de tous les attributs (un snapshot)."""
+    mappings: Dict[str, Dict[str, str]] = {}
+
+    for attr_name, table_name in AttributeMappingService.ATTRIBUTE_TABLES.items():
+        mapping: Dict[str, str] = {}
+        for entry in catalog.table(table_name):
+            # Brand n'a que 'name', Condition a pour clé 'note' (valeur DB = name_en)
+            db_value = entry.get("name_en") or entry.get("name")
+            if not db_value:
+                continue
+            display_value = entry.get("name_fr") or db_value
+
+            mapping[display_value] = db_value  # FR → EN
+            mapping[db_value] = display_value  # EN → FR
+        mappings[attr_name] = mapping
+
+    return mappings
 
 
 class AttributeMappingService:
     """Service pour gérer le mapping FR/EN des attributs."""
 
-    # Map des attributs avec leur modèle SQLAlchemy
-    ATTRIBUTE_MODELS = {
-        "brand": Brand,
-        "category": Category,
-        "color": Color,
-        "condition": Condition,
-        "fit": Fit,
-        "gender": Gender,
-        "material": Material,
-        "season": Season,
-        "size": Size,
+    # Map des attributs avec leur table du catalogue de référence
+    ATTRIBUTE_TABLES = {
+        "brand": "brands",
+        "category": "categories",
+        "color": "colors",
+        "condition": "conditions",
+        "fit": "fits",
+        "gender": "genders",
+        "material": "materials",
+        "season": "seasons",
+        "size": "sizes",
     }
 
     def __init__(self, db: Session):
         """
-        Initialise le service et charge tous les mappings.
+        Initialise le service avec les mappings du catalogue de référence.
 
         Args:
             db: Session SQLAlchemy
@@ -57,57 +69,16 @@ class AttributeMappingService:
 
     def _load_all_mappings(self) -> None:
         """
-        Charge tous les mappings FR/EN depuis la DB.
+        Charge tous les mappings FR/EN depuis le catalogue de référence.
 
         Business Rules:
         - Mapping bidirectionnel : FR → EN ET EN → FR
         - Si name_fr NULL → Utiliser name_en comme fallback
+        - Construits une fois par version du catalogue et partagés
+          (aucune requête par instance, ne pas muter self.mappings)
         """
-        for attr_name, model_class in self.ATTRIBUTE_MODELS.items():
-            self.mappings[attr_name] = {}
-
-            # Déterminer les colonnes à query selon le modèle
-            if attr_name in ["brand", "size"]:
-                # Brand et Size ont 'name' (pas name_en)
-                results = self.db.query(
-                    model_class.name,
-                    model_class.name_fr
-                ).all()
-
-                for name_en, name_fr in results:
-                    display_value = name_fr if name_fr else name_en
-
-                    # Mapping bidirectionnel
-                    self.mappings[attr_name][display_value] = name_en  # FR → EN
-                    self.mappings[attr_name][name_en] = display_value  # EN → FR
-
-            elif attr_name == "condition":
-                # Condition a 'name' (pas name_en) + description_fr
-                results = self.db.query(
-                    model_class.name,
-                    model_class.description_fr
-                ).all()
-
-                for name, description_fr in results:
-                    display_value = description_fr if description_fr else name
-
-                    # Mapping bidirectionnel
-                    self.mappings[attr_name][display_value] = name  # FR → EN
-                    self.mappings[attr_name][name] = display_value  # EN → FR
-
-            else:
-                # Autres modèles ont name_en + name_fr
-                results = self.db.query(
-                    model_class.name_en,
-                    model_class.name_fr
-                ).all()
-
-                for name_en, name_fr in results:
-                    display_value = name_fr if name_fr else name_en
-
-                    # Mapping bidirectionnel
-                    self.mappings[attr_name][display_value] = name_en  # FR → EN
-                    self.mappings[attr_name][name_en] = display_value  # EN → FR
+        catalog = get_reference_catalog(self.db)
+        self.mappings = catalog.memo("attribute_mapping.fr_en", _build_mappings)
 
     def to_db_value(self, attr_name: str, display_value: str | None) -> str | None:
         """
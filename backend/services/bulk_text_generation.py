@@ -0,0 +1,288 @@
+"""
+Bulk Text Generation Service
+
+Generates titles/descriptions for many products in a few queries instead
+of one /products/text/generate round trip (and product load) per product:
+
+1. Products: one SELECT (by ids or filter) + one selectin query per M2M
+   relation (colors, materials, condition_sups)
+2. Texts: one pass of ProductTextGeneratorService.generate_all_batch()
+   (precompiled templates, listing render cache)
+3. Optional write: ProductRepository.bulk_update_versioned() (one
+   UPDATE ... FROM (VALUES ...) per chunk, optimistic version check);
+   SOLD products are immutable and reported as errors
+
+iter_chunks() runs the three steps per chunk of BULK_TEXT_CHUNK_SIZE
+products (committed per chunk with apply), so results can be streamed as
+soon as a chunk is done.
+
+Author: Claude
+Date: 2026-02-04
+Updated: 2026-02-04 - Chunked processing (iter_chunks), limit only for filter selections
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterator, Optional
+
+from sqlalchemy import String, Text, select
+from sqlalchemy.orm import Session, selectinload
+
+from models.user.product import Product, ProductStatus
+from repositories.product_repository import ProductRepository
+from services.product_text_generator import (
+    DESCRIPTION_STYLE_KEYS,
+    TITLE_FORMAT_KEYS,
+    ProductTextGeneratorService,
+)
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Max products per bulk request
+BULK_TEXT_MAX_PRODUCTS = 2000
+
+# Products loaded, generated (and written) at a time by iter_chunks()
+BULK_TEXT_CHUNK_SIZE = 200
+
+
+@dataclass
+class BulkTextResult:
+    """Generated texts of one product."""
+
+    product_id: int
+    version_number: Optional[int] = None
+    status: Optional[ProductStatus] = None
+    current_title: Optional[str] = None
+    current_description: Optional[str] = None
+    titles: dict[str, str] = field(default_factory=dict)
+    descriptions: dict[str, str] = field(default_factory=dict)
+    error: Optional[str] = None  # "NOT_FOUND", "SOLD" (apply_texts)
+    applied: bool = False
+    conflict: bool = False
+
+
+class BulkTextGenerationService:
+    """Load, generate and write texts for a selection of products."""
+
+    @staticmethod
+    def load_products(
+        db: Session,
+        product_ids: Optional[list[int]] = None,
+        status: Optional[ProductStatus] = None,
+        category: Optional[str] = None,
+        brand: Optional[str] = None,
+        limit: int = BULK_TEXT_MAX_PRODUCTS,
+        after_id: Optional[int] = None,
+    ) -> list[Product]:
+        """
+        Load the selected products with their M2M attributes (one query each).
+
+        Args:
+            db: Session with the user schema configured
+            product_ids: Explicit selection (filters below still apply)
+            status, category, brand: Filters (like ProductRepository.list)
+            limit: Max products of a filter selection (ignored with
+                product_ids: every requested product is loaded)
+            after_id: Only products with a greater id (keyset pagination)
+
+        Returns:
+            Non-deleted products, ordered by id
+        """
+        conditions = [Product.deleted_at.is_(None)]
+        if product_ids:
+            conditions.append(Product.id.in_(product_ids))
+        if after_id is not None:
+            conditions.append(Product.id > after_id)
+        if status:
+            conditions.append(Product.status == status)
+        if category:
+            conditions.append(Product.category == category)
+        if brand:
+            conditions.append(Product.brand == brand)
+
+        stmt = (
+            select(Product)
+            .options(
+                selectinload(Product.product_colors),
+                selectinload(Product.product_materials),
+                selectinload(Product.product_condition_sups),
+            )
+            .where(*conditions)
+            .order_by(Product.id)
+        )
+        if not product_ids:
+            stmt = stmt.limit(limit)
+        return list(db.execute(stmt).scalars().all())
+
+    @staticmethod
+    def iter_chunks(
+        db: Session,
+        product_ids: Optional[list[int]] = None,
+        status: Optional[ProductStatus] = None,
+        category: Optional[str] = None,
+        brand: Optional[str] = None,
+        limit: int = BULK_TEXT_MAX_PRODUCTS,
+        title_format: Optional[int] = None,
+        description_style: Optional[int] = None,
+        apply: bool = False,
+        chunk_size: int = BULK_TEXT_CHUNK_SIZE,
+    ) -> Iterator[list[BulkTextResult]]:
+        """
+        Load, generate and (with apply) write the selection chunk by chunk.
+
+        product_ids are processed in request order, chunk_size ids at a time
+        (missing ids reported with their chunk); a filter selection is read
+        by id (keyset) up to limit products. With apply, each chunk is
+        committed before its results are yielded.
+
+        Args:
+            db: Session with the user schema configured
+            product_ids, status, category, brand, limit: Selection (load_products)
+            title_format, description_style: Format/style (generate, apply_texts)
+            apply: Write the chosen format/style (apply_texts + commit)
+            chunk_size: Products per chunk
+
+        Yields:
+            Results of one chunk (generate(), updated by apply_texts())
+        """
+        filters = {"status": status, "category": category, "brand": brand}
+
+        def selections() -> Iterator[tuple[list[Product], Optional[list[int]]]]:
+            if product_ids:
+                requested = list(dict.fromkeys(product_ids))
+                for start in range(0, len(requested), chunk_size):
+                    chunk_ids = requested[start:start + chunk_size]
+                    yield BulkTextGenerationService.load_products(
+                        db, product_ids=chunk_ids, **filters
+                    ), chunk_ids
+                return
+
+            after_id, remaining = None, limit
+            while remaining > 0:
+                products = BulkTextGenerationService.load_products(
+                    db, limit=min(chunk_size, remaining), after_id=after_id, **filters
+                )
+                if not products:
+                    return
+                # Read before the chunk is committed (expired attributes reload)
+                after_id, remaining = products[-1].id, remaining - len(products)
+                yield products, None
+
+        for products, chunk_ids in selections():
+            results = BulkTextGenerationService.generate(
+                products, title_format, description_style, product_ids=chunk_ids
+            )
+            if apply:
+                BulkTextGenerationService.apply_texts(db, results, title_format, description_style)
+                db.commit()
+            yield results
+
+    @staticmethod
+    def generate(
+        products: list[Product],
+        title_format: Optional[int] = None,
+        description_style: Optional[int] = None,
+        product_ids: Optional[list[int]] = None,
+    ) -> list[BulkTextResult]:
+        """
+        Generate the texts of every product in one pass.
+
+        Args:
+            products: Products from load_products()
+            title_format: Keep only this title format (None = all 5)
+            description_style: Keep only this description style (None = all 5)
+            product_ids: Requested ids: the missing ones get a NOT_FOUND result
+
+        Returns:
+            One result per product (then per missing id)
+        """
+        title_key = TITLE_FORMAT_KEYS.get(title_format)
+        description_key = DESCRIPTION_STYLE_KEYS.get(description_style)
+
+        results = []
+        texts = ProductTextGeneratorService.generate_all_batch(products)
+        for product, generated in zip(products, texts):
+            titles = generated["titles"]
+            descriptions = generated["descriptions"]
+            results.append(BulkTextResult(
+                product_id=product.id,
+                version_number=product.version_number,
+                status=product.status,
+                current_title=product.title,
+                current_description=product.description,
+                titles={title_key: titles[title_key]} if title_key else titles,
+                descriptions=(
+                    {description_key: descriptions[description_key]}
+                    if description_key else descriptions
+                ),
+            ))
+
+        if product_ids:
+            found = {product.id for product in products}
+            results.extend(
+                BulkTextResult(product_id=product_id, error="NOT_FOUND")
+                for product_id in dict.fromkeys(product_ids)
+                if product_id not in found
+            )
+        return results
+
+    @staticmethod
+    def apply_texts(
+        db: Session,
+        results: list[BulkTextResult],
+        title_format: Optional[int] = None,
+        description_style: Optional[int] = None,
+    ) -> tuple[set[int], set[int]]:
+        """
+        Write the chosen title format and/or description style.
+
+        ProductRepository.bulk_update_versioned(): a product is updated only
+        if its version_number is still the one read by load_products()
+        (version_number is incremented, like ProductService updates) and it
+        is not SOLD. SOLD products are immutable: their result gets
+        error="SOLD" (not a conflict). Products whose texts are unchanged are
+        skipped. Sets applied/conflict on the results. Does not commit.
+
+        Args:
+            db: Session with the user schema configured
+            results: Results of generate()
+            title_format: Title format written to products.title (None = keep)
+            description_style: Style written to products.description (None = keep)
+
+        Returns:
+            (updated product ids, conflicting product ids)
+        """
+        title_key = TITLE_FORMAT_KEYS.get(title_format)
+        description_key = DESCRIPTION_STYLE_KEYS.get(description_style)
+        if not title_key and not description_key:
+            raise ValueError("A title_format or description_style is required to apply texts")
+
+        rows = []
+        for r in results:
+            if r.status == ProductStatus.SOLD:
+                r.error = "SOLD"
+            if r.error:
+                continue
+            # Empty generation (no attributes): keep the current text
+            title = (r.titles.get(title_key) if title_key else None) or r.current_title
+            description = (
+                r.descriptions.get(description_key) if description_key else None
+            ) or r.current_description
+            if (title, description) != (r.current_title, r.current_description):
+                rows.append((r.product_id, r.version_number, title, description))
+
+        updated = ProductRepository.bulk_update_versioned(
+            db,
+            rows,
+            value_types={"title": String(), "description": Text()},
+            conditions=[Product.__table__.c.status != ProductStatus.SOLD],
+        )
+
+        conflicts = {product_id for product_id, _, _, _ in rows} - updated
+        for r in results:
+            r.applied = r.product_id in updated
+            r.conflict = r.product_id in conflicts
+
+        if conflicts:
+            logger.warning(f"[BulkText] {len(conflicts)} products modified concurrently, skipped")
+        return updated, conflicts
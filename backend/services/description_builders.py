@@ -11,12 +11,24 @@ Styles:
 4. Vendeur Pro - Hybrid, condition & measures upfront
 5. Visuel Emoji - One emoji per attribute, scannable
 
+Styles are precompiled templates (services/text_templates.py) rendered
+against a ProductFields snapshot: generate_all builds the snapshot once
+and every title format and description style reads from it.
+
 Author: Claude
 Date: 2026-01-27 - Extracted from product_text_generator.py
+Updated: 2026-02-04 - Styles ported to precompiled templates + ProductFields
+Updated: 2026-02-04 - FICHE_TECHNIQUE_COLUMNS (catalog CSV export)
 """
 
 from typing import Any, Optional
 
+from services.text_templates import (
+    compile_lines,
+    compile_section,
+    render_sections,
+)
+
 
 # Condition score (0-10) to French text mapping
 CONDITION_MAP = {
@@ -62,247 +74,237 @@ def safe_get(product: Any, attr: str, default: str = "") -> str:
     return str(value)
 
 
+
+
+# Attributes read by the templates (safe_get values)
+_SCALAR_FIELDS = (
+    "brand", "model", "category", "gender", "size_normalized", "colors",
+    "material", "fit", "rise", "length", "sleeve_length", "neckline",
+    "closure", "pattern", "trend", "season", "sport", "lining", "stretch",
+    "unique_feature", "marking", "decade", "origin", "location",
+)
+_LIST_FIELDS = ("colors", "condition_sup", "unique_feature")
+_DIM_FIELDS = ("dim1", "dim2", "dim3", "dim4", "dim5", "dim6")
+
+
+class ProductFields(dict):
+    """
+    Product values read by the templates, computed once per product.
+
+    Built in one pass over the product, so one snapshot serves every
+    title format and description style of a product:
+    - "brand", "colors"...: safe_get(product, attr)
+    - "colors[]", "condition_sup[]", "unique_feature[]": items as strings
+      (empty unless the attribute is a non-empty list)
+    - "colors_list", "condition_sup_list", "unique_feature_list": the same
+      items, ", "-joined
+    - "condition_text": get_condition_text(product.condition)
+    - "dim1".."dim6": the measure as a string ("" when unset or 0)
+    - "<field>:lower": lowercase value of <field> (computed on first use)
+    """
+
+    __slots__ = ("product",)
+
+    def __init__(self, product: Any):
+        super().__init__()
+        self.product = product
+
+        for attr in _SCALAR_FIELDS:
+            value = getattr(product, attr, None)
+            if value is None:
+                self[attr] = ""
+            elif type(value) is str:
+                self[attr] = value
+            else:
+                self[attr] = safe_get(product, attr)
+
+        for attr in _LIST_FIELDS:
+            items = getattr(product, attr, None)
+            items = tuple(str(item) for item in items) if items and isinstance(items, list) else ()
+            self[attr + "[]"] = items
+            self[attr + "_list"] = ", ".join(items)
+
+        for attr in _DIM_FIELDS:
+            dim = getattr(product, attr, None)
+            self[attr] = str(dim) if dim else ""
+
+        self["condition_text"] = get_condition_text(getattr(product, "condition", None))
+
+    @classmethod
+    def of(cls, product: Any) -> "ProductFields":
+        """Snapshot of a product (returned as is if already a snapshot)."""
+        return product if isinstance(product, cls) else cls(product)
+
+    def __missing__(self, key: str) -> str:
+        if key.endswith(":lower"):
+            value = self[key[:-6]].lower()
+        else:
+            value = safe_get(self.product, key)
+        self[key] = value
+        return value
+
+
+# =========================================================================
+# SHARED TEMPLATES
+# =========================================================================
+
+_MEASURES = [
+    ("dim1", "Poitrine (PTP) : {} cm"), ("dim2", "Longueur : {} cm"),
+    ("dim3", "Épaules : {} cm"), ("dim4", "Manches : {} cm"),
+    ("dim5", "Tour de taille : {} cm"), ("dim6", "Entrejambe : {} cm"),
+]
+
+
 # =========================================================================
 # STYLE 1: CATALOGUE STRUCTURE
 # =========================================================================
 
+_CATALOGUE_STRUCTURE = (
+    compile_section("📋 INFORMATIONS GÉNÉRALES", [
+        ("brand", "Marque : {}"),
+        ("model", "Modèle : {}"),
+        ("category", "Type : {}"),
+        ("gender", "Genre : {}"),
+        ("decade", "Époque : {}"),
+        ("origin", "Origine : {}"),
+        ("location", "Localisation : {}"),
+    ]),
+    compile_section("🎨 STYLE & DESIGN", [
+        ("colors_list", "Couleur(s) : {}"),
+        ("trend", "Tendance : {}"),
+        ("pattern", "Motif : {}"),
+        ("season", "Saison : {}"),
+        ("sport", "Sport : {}"),
+        ("fit", "Coupe : {}"),
+        ("rise", "Taille : {}"),
+        ("length", "Longueur : {}"),
+        ("sleeve_length", "Manches : {}"),
+        ("neckline", "Col : {}"),
+        ("closure", "Fermeture : {}"),
+    ]),
+    compile_section("🧵 MATIÈRES & FABRICATION", [
+        ("material", "Matière principale : {}"),
+        ("lining", "Doublure : {}"),
+        ("stretch", "Élasticité : {}"),
+        ("unique_feature_list", "Caractéristiques : {}"),
+        ("marking", "Marquage : {}"),
+    ]),
+    compile_section("💎 ÉTAT", [
+        ("condition_text", "État général : {}"),
+        ("condition_sup_list", "Détails : {}"),
+    ]),
+    compile_section("📏 MESURES (en cm)", _MEASURES),
+)
+
+
 def build_catalogue_structure(product: Any) -> str:
     """
     Catalogue Structure - Sections with emojis, grouped by theme.
 
     Structure: INFOS GENERALES -> STYLE & DESIGN -> MATIERES -> ETAT -> MESURES
     """
-    sections = []
-
-    # INFORMATIONS GENERALES
-    general = []
-    brand = safe_get(product, "brand")
-    if brand:
-        general.append(f"Marque : {brand}")
-    model = safe_get(product, "model")
-    if model:
-        general.append(f"Modèle : {model}")
-    category = safe_get(product, "category")
-    if category:
-        general.append(f"Type : {category}")
-    gender = safe_get(product, "gender")
-    if gender:
-        general.append(f"Genre : {gender}")
-    decade = safe_get(product, "decade")
-    if decade:
-        general.append(f"Époque : {decade}")
-    origin = safe_get(product, "origin")
-    if origin:
-        general.append(f"Origine : {origin}")
-    location = safe_get(product, "location")
-    if location:
-        general.append(f"Localisation : {location}")
-    if general:
-        sections.append("📋 INFORMATIONS GÉNÉRALES\n" + "\n".join(general))
-
-    # STYLE & DESIGN
-    style = []
-    colors = getattr(product, "colors", None)
-    if colors and isinstance(colors, list) and colors:
-        style.append(f"Couleur(s) : {', '.join(str(c) for c in colors)}")
-    trend = safe_get(product, "trend")
-    if trend:
-        style.append(f"Tendance : {trend}")
-    pattern = safe_get(product, "pattern")
-    if pattern:
-        style.append(f"Motif : {pattern}")
-    season = safe_get(product, "season")
-    if season:
-        style.append(f"Saison : {season}")
-    sport = safe_get(product, "sport")
-    if sport:
-        style.append(f"Sport : {sport}")
-    fit = safe_get(product, "fit")
-    if fit:
-        style.append(f"Coupe : {fit}")
-    rise = safe_get(product, "rise")
-    if rise:
-        style.append(f"Taille : {rise}")
-    length = safe_get(product, "length")
-    if length:
-        style.append(f"Longueur : {length}")
-    sleeve_length = safe_get(product, "sleeve_length")
-    if sleeve_length:
-        style.append(f"Manches : {sleeve_length}")
-    neckline = safe_get(product, "neckline")
-    if neckline:
-        style.append(f"Col : {neckline}")
-    closure = safe_get(product, "closure")
-    if closure:
-        style.append(f"Fermeture : {closure}")
-    if style:
-        sections.append("🎨 STYLE & DESIGN\n" + "\n".join(style))
-
-    # MATIERES & FABRICATION
-    materials = []
-    material = safe_get(product, "material")
-    if material:
-        materials.append(f"Matière principale : {material}")
-    lining = safe_get(product, "lining")
-    if lining:
-        materials.append(f"Doublure : {lining}")
-    stretch = safe_get(product, "stretch")
-    if stretch:
-        materials.append(f"Élasticité : {stretch}")
-    unique_features = getattr(product, "unique_feature", None)
-    if unique_features and isinstance(unique_features, list) and unique_features:
-        materials.append(f"Caractéristiques : {', '.join(str(f) for f in unique_features)}")
-    marking = safe_get(product, "marking")
-    if marking:
-        materials.append(f"Marquage : {marking}")
-    if materials:
-        sections.append("🧵 MATIÈRES & FABRICATION\n" + "\n".join(materials))
-
-    # ETAT
-    condition_lines = []
-    condition = getattr(product, "condition", None)
-    condition_text = get_condition_text(condition)
-    if condition_text:
-        condition_lines.append(f"État général : {condition_text}")
-    condition_sup = getattr(product, "condition_sup", None)
-    if condition_sup and isinstance(condition_sup, list) and condition_sup:
-        condition_lines.append(f"Détails : {', '.join(str(s) for s in condition_sup)}")
-    if condition_lines:
-        sections.append("💎 ÉTAT\n" + "\n".join(condition_lines))
-
-    # MESURES
-    measures = _build_measures_list(product)
-    if measures:
-        sections.append("📏 MESURES (en cm)\n" + "\n".join(measures))
-
-    return "\n\n".join(sections)
+    return render_sections(_CATALOGUE_STRUCTURE, ProductFields.of(product))
 
 
 # =========================================================================
 # STYLE 2: DESCRIPTIF REDIGE
 # =========================================================================
 
+_REDIGE_INTRO = compile_lines([
+    ("brand", "de la marque {}"),
+    ("model", "modèle {}"),
+])
+
+_REDIGE_TECH = compile_lines([
+    ("material:lower", "La matière principale est le {}"),
+    ("lining:lower", "Doublure en {}"),
+    ("stretch:lower", "Élasticité {}"),
+    ("closure:lower", "Fermeture {}"),
+    ("unique_feature_list", "Caractéristiques notables : {}"),
+])
+
+_REDIGE_ORIGIN = compile_lines([
+    ("decade", "des années {}"),
+    ("origin", "origine {}"),
+])
+
+_REDIGE_MEASURES = compile_lines([
+    ("dim1", "Poitrine : {} cm"), ("dim2", "Longueur : {} cm"),
+    ("dim3", "Épaules : {} cm"), ("dim4", "Manches : {} cm"),
+    ("dim5", "Tour de taille : {} cm"), ("dim6", "Entrejambe : {} cm"),
+])
+
+
 def build_descriptif_redige(product: Any) -> str:
     """
     Descriptif Redige - Flowing prose, e-commerce tone.
 
     Structure: Introduction -> Style -> Technical details -> Condition & size -> Measures
     """
+    fields = ProductFields.of(product)
     paragraphs = []
 
     # Introduction
-    brand = safe_get(product, "brand")
-    model = safe_get(product, "model")
-    category = safe_get(product, "category")
-    gender = safe_get(product, "gender")
-
+    category = fields["category"]
     if category:
-        intro_parts = []
-        if brand:
-            intro_parts.append(f"de la marque {brand}")
-        if model:
-            intro_parts.append(f"modèle {model}")
         article = "cette" if category.endswith("e") else "ce"
         intro = f"Voici {article} {category}"
+        intro_parts = _REDIGE_INTRO.render(fields)
         if intro_parts:
             intro += " " + ", ".join(intro_parts)
-        if gender:
-            intro += f", pour {gender.lower()}"
-        intro += "."
-        paragraphs.append(intro)
+        if fields["gender"]:
+            intro += f", pour {fields['gender:lower']}"
+        paragraphs.append(intro + ".")
 
     # Style & Design
-    trend = safe_get(product, "trend")
-    pattern = safe_get(product, "pattern")
-    fit = safe_get(product, "fit")
-    colors = getattr(product, "colors", None)
-    season = safe_get(product, "season")
+    pattern = fields["pattern:lower"]
+    colors = fields["colors[]"]
+    color_text = " et ".join(colors[:2])
 
-    has_style_anchor = trend or fit or (pattern and pattern.lower() != "uni")
-
-    if has_style_anchor:
+    if fields["trend"] or fields["fit"] or (pattern and pattern != "uni"):
         style_parts = []
-        if trend:
-            style_parts.append(f"s'inscrit dans la tendance {trend.lower()}")
-        if pattern and pattern.lower() != "uni":
-            style_parts.append(f"avec un motif {pattern.lower()}")
-        if fit:
-            style_parts.append(f"coupe {fit.lower()}")
-        if colors and isinstance(colors, list) and colors:
-            color_text = " et ".join(str(c) for c in colors[:2])
+        if fields["trend"]:
+            style_parts.append(f"s'inscrit dans la tendance {fields['trend:lower']}")
+        if pattern and pattern != "uni":
+            style_parts.append(f"avec un motif {pattern}")
+        if fields["fit"]:
+            style_parts.append(f"coupe {fields['fit:lower']}")
+        if colors:
             style_parts.append(f"dans des tons {color_text.lower()}")
-        if season:
-            style_parts.append(f"parfait pour {season.lower()}")
+        if fields["season"]:
+            style_parts.append(f"parfait pour {fields['season:lower']}")
         paragraphs.append("Cette pièce " + ", ".join(style_parts) + ".")
-    elif colors and isinstance(colors, list) and colors:
-        color_text = " et ".join(str(c) for c in colors[:2])
+    elif colors:
         paragraphs.append(f"Coloris : {color_text}.")
 
     # Technical details
-    material = safe_get(product, "material")
-    lining = safe_get(product, "lining")
-    stretch = safe_get(product, "stretch")
-    closure = safe_get(product, "closure")
-    unique_features = getattr(product, "unique_feature", None)
-
-    tech_sentences = []
-    if material:
-        tech_sentences.append(f"La matière principale est le {material.lower()}")
-    if lining:
-        tech_sentences.append(f"Doublure en {lining.lower()}")
-    if stretch:
-        tech_sentences.append(f"Élasticité {stretch.lower()}")
-    if closure:
-        tech_sentences.append(f"Fermeture {closure.lower()}")
-    if unique_features and isinstance(unique_features, list) and unique_features:
-        features_text = ", ".join(str(f) for f in unique_features)
-        tech_sentences.append(f"Caractéristiques notables : {features_text}")
-
+    tech_sentences = _REDIGE_TECH.render(fields)
     if tech_sentences:
         paragraphs.append(". ".join(tech_sentences) + ".")
 
     # Origin & era
-    origin = safe_get(product, "origin")
-    decade = safe_get(product, "decade")
-    if origin or decade:
-        origin_parts = []
-        if decade:
-            origin_parts.append(f"des années {decade}")
-        if origin:
-            origin_parts.append(f"origine {origin}")
+    origin_parts = _REDIGE_ORIGIN.render(fields)
+    if origin_parts:
         paragraphs.append("Pièce " + ", ".join(origin_parts) + ".")
 
     # Condition & size
-    condition = getattr(product, "condition", None)
-    condition_text = get_condition_text(condition)
-    condition_sup = getattr(product, "condition_sup", None)
-    size = safe_get(product, "size_normalized")
-
     state_sentences = []
+    condition_text = fields["condition_text"]
     if condition_text:
         state_sentence = f"État : {condition_text}"
-        if condition_sup and isinstance(condition_sup, list) and condition_sup:
-            state_sentence += f" ({', '.join(str(s) for s in condition_sup)})"
+        if fields["condition_sup_list"]:
+            state_sentence += f" ({fields['condition_sup_list']})"
         state_sentences.append(state_sentence)
-    if size:
-        state_sentences.append(f"Taille : {size}")
+    if fields["size_normalized"]:
+        state_sentences.append(f"Taille : {fields['size_normalized']}")
 
     if state_sentences:
         paragraphs.append(". ".join(state_sentences) + ".")
 
     # Measures
-    dim_labels = [
-        ("dim1", "Poitrine"), ("dim2", "Longueur"), ("dim3", "Épaules"),
-        ("dim4", "Manches"), ("dim5", "Tour de taille"), ("dim6", "Entrejambe"),
-    ]
-    measures = []
-    for attr, label in dim_labels:
-        val = getattr(product, attr, None)
-        if val:
-            measures.append(f"{label} : {val} cm")
-
+    measures = _REDIGE_MEASURES.join(fields, " | ")
     if measures:
-        paragraphs.append("Mesures : " + " | ".join(measures) + ".")
+        paragraphs.append("Mesures : " + measures + ".")
 
     return "\n\n".join(paragraphs)
 
@@ -311,282 +313,149 @@ def build_descriptif_redige(product: Any) -> str:
 # STYLE 3: FICHE TECHNIQUE
 # =========================================================================
 
+_FICHE_TECHNIQUE = compile_lines([
+    ("brand", "Marque : {}"),
+    ("model", "Modèle : {}"),
+    ("category", "Type : {}"),
+    ("gender", "Genre : {}"),
+    ("size_normalized", "Taille : {}"),
+    ("colors_list", "Couleur(s) : {}"),
+    ("material", "Matière : {}"),
+    ("lining", "Doublure : {}"),
+    ("stretch", "Élasticité : {}"),
+    ("fit", "Coupe : {}"),
+    ("rise", "Taille haute/basse : {}"),
+    ("length", "Longueur vêtement : {}"),
+    ("sleeve_length", "Longueur manches : {}"),
+    ("neckline", "Col : {}"),
+    ("closure", "Fermeture : {}"),
+    ("pattern", "Motif : {}"),
+    ("trend", "Tendance : {}"),
+    ("season", "Saison : {}"),
+    ("sport", "Sport : {}"),
+    ("condition_text", "État : {}"),
+    ("condition_sup_list", "Détails état : {}"),
+    ("unique_feature_list", "Caractéristiques : {}"),
+    ("marking", "Marquage : {}"),
+    ("origin", "Origine : {}"),
+    ("decade", "Époque : {}"),
+    ("location", "Localisation : {}"),
+    ("dim1", "PTP (cm) : {}"),
+    ("dim2", "Longueur (cm) : {}"),
+    ("dim3", "Épaules (cm) : {}"),
+    ("dim4", "Manches (cm) : {}"),
+    ("dim5", "Tour taille (cm) : {}"),
+    ("dim6", "Entrejambe (cm) : {}"),
+])
+
+
+# CSV export columns: (ProductFields key, label) of the fiche technique lines
+FICHE_TECHNIQUE_COLUMNS = tuple(
+    (field, prefix.rstrip(" :")) for field, prefix, _, _ in _FICHE_TECHNIQUE.lines
+)
+
+
 def build_fiche_technique(product: Any) -> str:
     """
     Fiche Technique - Pure list for export/CSV and pro marketplaces.
 
     One line per attribute, no sections, no emojis.
     """
-    lines = []
-
-    attribute_map = [
-        ("brand", "Marque"),
-        ("model", "Modèle"),
-        ("category", "Type"),
-        ("gender", "Genre"),
-        ("size_normalized", "Taille"),
-        ("colors", "Couleur(s)"),
-        ("material", "Matière"),
-        ("lining", "Doublure"),
-        ("stretch", "Élasticité"),
-        ("fit", "Coupe"),
-        ("rise", "Taille haute/basse"),
-        ("length", "Longueur vêtement"),
-        ("sleeve_length", "Longueur manches"),
-        ("neckline", "Col"),
-        ("closure", "Fermeture"),
-        ("pattern", "Motif"),
-        ("trend", "Tendance"),
-        ("season", "Saison"),
-        ("sport", "Sport"),
-        ("condition", "État"),
-        ("condition_sup", "Détails état"),
-        ("unique_feature", "Caractéristiques"),
-        ("marking", "Marquage"),
-        ("origin", "Origine"),
-        ("decade", "Époque"),
-        ("location", "Localisation"),
-        ("dim1", "PTP (cm)"),
-        ("dim2", "Longueur (cm)"),
-        ("dim3", "Épaules (cm)"),
-        ("dim4", "Manches (cm)"),
-        ("dim5", "Tour taille (cm)"),
-        ("dim6", "Entrejambe (cm)"),
-    ]
-
-    for attr, label in attribute_map:
-        if attr == "condition":
-            condition = getattr(product, "condition", None)
-            condition_text = get_condition_text(condition)
-            if condition_text:
-                lines.append(f"{label} : {condition_text}")
-        elif attr == "condition_sup":
-            sup = getattr(product, "condition_sup", None)
-            if sup and isinstance(sup, list) and sup:
-                lines.append(f"{label} : {', '.join(str(s) for s in sup)}")
-        elif attr == "unique_feature":
-            features = getattr(product, "unique_feature", None)
-            if features and isinstance(features, list) and features:
-                lines.append(f"{label} : {', '.join(str(f) for f in features)}")
-        elif attr == "colors":
-            colors = getattr(product, "colors", None)
-            if colors and isinstance(colors, list) and colors:
-                lines.append(f"{label} : {', '.join(str(c) for c in colors)}")
-        elif attr.startswith("dim"):
-            dim_value = getattr(product, attr, None)
-            if dim_value:
-                lines.append(f"{label} : {dim_value}")
-        else:
-            value = safe_get(product, attr)
-            if value:
-                lines.append(f"{label} : {value}")
-
-    return "\n".join(lines)
+    return _FICHE_TECHNIQUE.join(ProductFields.of(product), "\n")
 
 
 # =========================================================================
 # STYLE 4: VENDEUR PRO
 # =========================================================================
 
+_VENDEUR_PRO = (
+    compile_section("⭐ MARQUE & MODÈLE", [
+        ("brand", "Marque : {}"),
+        ("model", "Modèle : {}"),
+        ("category", "Type : {}"),
+    ]),
+    compile_section("🔎 ÉTAT DÉTAILLÉ", [
+        ("condition_text", "État général : {}"),
+        ("condition_sup[]", "  → {}"),
+    ]),
+    compile_section("📏 DIMENSIONS", [
+        ("size_normalized", "Taille étiquette : {}"),
+        *_MEASURES,
+    ]),
+    compile_section("🧵 CARACTÉRISTIQUES TECHNIQUES", [
+        ("material", "Matière : {}"),
+        ("lining", "Doublure : {}"),
+        ("stretch", "Élasticité : {}"),
+        ("fit", "Coupe : {}"),
+        ("closure", "Fermeture : {}"),
+        ("colors_list", "Couleur(s) : {}"),
+        ("pattern", "Motif : {}"),
+        ("unique_feature_list", "Spécificités : {}"),
+    ]),
+    compile_section("✨ INFOS SUPPLÉMENTAIRES", [
+        ("gender", "Genre : {}"),
+        ("trend", "Style : {}"),
+        ("season", "Saison : {}"),
+        ("decade", "Époque : {}"),
+        ("origin", "Origine : {}"),
+        ("location", "Localisation : {}"),
+    ]),
+)
+
+
 def build_vendeur_pro(product: Any) -> str:
     """
     Vendeur Pro - Hybrid with condition and measures upfront.
 
     Structure: MARQUE & MODELE -> ETAT DETAILLE -> DIMENSIONS -> CARACTERISTIQUES -> INFOS
     """
-    sections = []
-
-    # MARQUE & MODELE
-    header = []
-    brand = safe_get(product, "brand")
-    if brand:
-        header.append(f"Marque : {brand}")
-    model = safe_get(product, "model")
-    if model:
-        header.append(f"Modèle : {model}")
-    category = safe_get(product, "category")
-    if category:
-        header.append(f"Type : {category}")
-    if header:
-        sections.append("⭐ MARQUE & MODÈLE\n" + "\n".join(header))
-
-    # ETAT DETAILLE
-    condition_lines = []
-    condition = getattr(product, "condition", None)
-    condition_text = get_condition_text(condition)
-    if condition_text:
-        condition_lines.append(f"État général : {condition_text}")
-    condition_sup = getattr(product, "condition_sup", None)
-    if condition_sup and isinstance(condition_sup, list) and condition_sup:
-        for detail in condition_sup:
-            condition_lines.append(f"  → {detail}")
-    if condition_lines:
-        sections.append("🔎 ÉTAT DÉTAILLÉ\n" + "\n".join(condition_lines))
-
-    # DIMENSIONS
-    measures = []
-    size = safe_get(product, "size_normalized")
-    if size:
-        measures.append(f"Taille étiquette : {size}")
-    measures.extend(_build_measures_list(product))
-    if measures:
-        sections.append("📏 DIMENSIONS\n" + "\n".join(measures))
-
-    # CARACTERISTIQUES TECHNIQUES
-    tech = []
-    material = safe_get(product, "material")
-    if material:
-        tech.append(f"Matière : {material}")
-    lining = safe_get(product, "lining")
-    if lining:
-        tech.append(f"Doublure : {lining}")
-    stretch = safe_get(product, "stretch")
-    if stretch:
-        tech.append(f"Élasticité : {stretch}")
-    fit = safe_get(product, "fit")
-    if fit:
-        tech.append(f"Coupe : {fit}")
-    closure = safe_get(product, "closure")
-    if closure:
-        tech.append(f"Fermeture : {closure}")
-    colors = getattr(product, "colors", None)
-    if colors and isinstance(colors, list) and colors:
-        tech.append(f"Couleur(s) : {', '.join(str(c) for c in colors)}")
-    pattern = safe_get(product, "pattern")
-    if pattern:
-        tech.append(f"Motif : {pattern}")
-    unique_features = getattr(product, "unique_feature", None)
-    if unique_features and isinstance(unique_features, list) and unique_features:
-        tech.append(f"Spécificités : {', '.join(str(f) for f in unique_features)}")
-    if tech:
-        sections.append("🧵 CARACTÉRISTIQUES TECHNIQUES\n" + "\n".join(tech))
-
-    # INFOS SUPPLEMENTAIRES
-    info = []
-    gender = safe_get(product, "gender")
-    if gender:
-        info.append(f"Genre : {gender}")
-    trend = safe_get(product, "trend")
-    if trend:
-        info.append(f"Style : {trend}")
-    season = safe_get(product, "season")
-    if season:
-        info.append(f"Saison : {season}")
-    decade = safe_get(product, "decade")
-    if decade:
-        info.append(f"Époque : {decade}")
-    origin = safe_get(product, "origin")
-    if origin:
-        info.append(f"Origine : {origin}")
-    location = safe_get(product, "location")
-    if location:
-        info.append(f"Localisation : {location}")
-    if info:
-        sections.append("✨ INFOS SUPPLÉMENTAIRES\n" + "\n".join(info))
-
-    return "\n\n".join(sections)
+    return render_sections(_VENDEUR_PRO, ProductFields.of(product))
 
 
 # =========================================================================
 # STYLE 5: VISUEL EMOJI
 # =========================================================================
 
+_VISUEL_EMOJI = compile_lines([
+    ("brand", "🏷️ Marque : {}"),
+    ("model", "🆔 Modèle : {}"),
+    ("category", "👕 Type : {}"),
+    ("gender", "👤 Genre : {}"),
+    ("size_normalized", "📐 Taille : {}"),
+    ("colors_list", "🎨 Couleur(s) : {}"),
+    ("material", "🧵 Matière : {}"),
+    ("lining", "🪡 Doublure : {}"),
+    ("fit", "✂️ Coupe : {}"),
+    ("rise", "📍 Hauteur : {}"),
+    ("length", "📏 Longueur : {}"),
+    ("sleeve_length", "💪 Manches : {}"),
+    ("neckline", "👔 Col : {}"),
+    ("closure", "🔘 Fermeture : {}"),
+    ("pattern", "🔲 Motif : {}"),
+    ("stretch", "🔄 Élasticité : {}"),
+    ("condition_text", "💎 État : {}"),
+    ("condition_sup_list", "🔍 Détails : {}"),
+    ("unique_feature_list", "⭐ Spécial : {}"),
+    ("marking", "🏷️ Marquage : {}"),
+    ("trend", "📈 Tendance : {}"),
+    ("season", "🌤️ Saison : {}"),
+    ("sport", "⚽ Sport : {}"),
+    ("decade", "📅 Époque : {}"),
+    ("origin", "🌍 Origine : {}"),
+    ("location", "📍 Localisation : {}"),
+    ("dim1", "📊 PTP : {} cm"),
+    ("dim2", "📊 Longueur : {} cm"),
+    ("dim3", "📊 Épaules : {} cm"),
+    ("dim4", "📊 Manches : {} cm"),
+    ("dim5", "📊 Tour taille : {} cm"),
+    ("dim6", "📊 Entrejambe : {} cm"),
+])
+
+
 def build_visuel_emoji(product: Any) -> str:
     """
     Visuel Emoji - One emoji per attribute, easy to scan.
 
     One line per attribute with unique emoji.
     """
-    lines = []
-
-    # Emoji mapping for each attribute
-    emoji_attrs = [
-        ("brand", "🏷️ Marque"),
-        ("model", "🆔 Modèle"),
-        ("category", "👕 Type"),
-        ("gender", "👤 Genre"),
-        ("size_normalized", "📐 Taille"),
-    ]
-    for attr, label in emoji_attrs:
-        val = safe_get(product, attr)
-        if val:
-            lines.append(f"{label} : {val}")
-
-    colors = getattr(product, "colors", None)
-    if colors and isinstance(colors, list) and colors:
-        lines.append(f"🎨 Couleur(s) : {', '.join(str(c) for c in colors)}")
-
-    simple_emoji_attrs = [
-        ("material", "🧵 Matière"),
-        ("lining", "🪡 Doublure"),
-        ("fit", "✂️ Coupe"),
-        ("rise", "📍 Hauteur"),
-        ("length", "📏 Longueur"),
-        ("sleeve_length", "💪 Manches"),
-        ("neckline", "👔 Col"),
-        ("closure", "🔘 Fermeture"),
-        ("pattern", "🔲 Motif"),
-        ("stretch", "🔄 Élasticité"),
-    ]
-    for attr, label in simple_emoji_attrs:
-        val = safe_get(product, attr)
-        if val:
-            lines.append(f"{label} : {val}")
-
-    # Condition
-    condition = getattr(product, "condition", None)
-    condition_text = get_condition_text(condition)
-    if condition_text:
-        lines.append(f"💎 État : {condition_text}")
-
-    condition_sup = getattr(product, "condition_sup", None)
-    if condition_sup and isinstance(condition_sup, list) and condition_sup:
-        lines.append(f"🔍 Détails : {', '.join(str(s) for s in condition_sup)}")
-
-    unique_features = getattr(product, "unique_feature", None)
-    if unique_features and isinstance(unique_features, list) and unique_features:
-        lines.append(f"⭐ Spécial : {', '.join(str(f) for f in unique_features)}")
-
-    extra_emoji_attrs = [
-        ("marking", "🏷️ Marquage"),
-        ("trend", "📈 Tendance"),
-        ("season", "🌤️ Saison"),
-        ("sport", "⚽ Sport"),
-        ("decade", "📅 Époque"),
-        ("origin", "🌍 Origine"),
-        ("location", "📍 Localisation"),
-    ]
-    for attr, label in extra_emoji_attrs:
-        val = safe_get(product, attr)
-        if val:
-            lines.append(f"{label} : {val}")
-
-    # Measures
-    dim_labels = [
-        ("dim1", "📊 PTP"), ("dim2", "📊 Longueur"), ("dim3", "📊 Épaules"),
-        ("dim4", "📊 Manches"), ("dim5", "📊 Tour taille"), ("dim6", "📊 Entrejambe"),
-    ]
-    for attr, label in dim_labels:
-        val = getattr(product, attr, None)
-        if val:
-            lines.append(f"{label} : {val} cm")
-
-    return "\n".join(lines)
-
-
-# =========================================================================
-# SHARED HELPERS
-# =========================================================================
-
-def _build_measures_list(product: Any) -> list[str]:
-    """Build list of measurement strings from product dimensions."""
-    dim_labels = [
-        ("dim1", "Poitrine (PTP)"), ("dim2", "Longueur"), ("dim3", "Épaules"),
-        ("dim4", "Manches"), ("dim5", "Tour de taille"), ("dim6", "Entrejambe"),
-    ]
-    measures = []
-    for attr, label in dim_labels:
-        val = getattr(product, attr, None)
-        if val:
-            measures.append(f"{label} : {val} cm")
-    return measures
+    return _VISUEL_EMOJI.join(ProductFields.of(product), "\n")
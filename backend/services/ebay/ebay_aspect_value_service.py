@@ -5,8 +5,11 @@ Translates aspect values to marketplace-specific languages.
 
 Process:
 1. Product has a value (e.g., color='bleu', size='M')
-2. Lookup GB reference value from product_attributes tables
+2. Lookup GB reference value in the product_attributes tables
+   (in-memory reference catalog, no query)
 3. Translate GB value to target marketplace via ebay.aspect_* tables
+   (rows cached per instance, fetched with one IN query per aspect table
+   by get_aspect_values() for bulk conversion)
 
 Example:
     >>> service = EbayAspectValueService(session)
@@ -17,9 +20,8 @@ Author: Claude
 Date: 2025-12-22
 """
 
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from models.ebay.aspect_value import (
@@ -40,6 +42,7 @@ from models.ebay.aspect_value import (
     AspectType,
     AspectWaistSize,
 )
+from services.reference_catalog import get_reference_catalog
 from shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -170,6 +173,8 @@ class EbayAspectValueService:
         """
         self.session = session
         self._cache: Dict[str, str] = {}
+        # aspect_model → {ebay_gb: row, or None if the table has no such row}
+        self._aspects: Dict[type, Dict[str, Optional[object]]] = {}
 
     def get_aspect_value(
         self,
@@ -211,16 +216,7 @@ class EbayAspectValueService:
 
         try:
             # Step 1: Get GB reference value
-            if config.get('attribut_table'):
-                gb_value = self._get_gb_value_from_attribut(
-                    field_value,
-                    config['attribut_table'],
-                    config['search_columns'],
-                    config['gb_column']
-                )
-            else:
-                # Direct value (assume it's already in GB format)
-                gb_value = field_value
+            gb_value = self._get_gb_value(field_value, config)
 
             if not gb_value:
                 logger.debug(f"No GB value found for {aspect_key}='{field_value}'")
@@ -263,6 +259,72 @@ class EbayAspectValueService:
             )
             return None
 
+    def get_aspect_values(
+        self,
+        requests: Iterable[Tuple[str, str, str]]
+    ) -> Dict[Tuple[str, str, str], Optional[str]]:
+        """
+        Batch version of get_aspect_value (bulk conversion, several marketplaces).
+
+        GB values are resolved in the in-memory reference catalog, then the
+        ebay.aspect_* rows of all GB values are fetched with one IN query per
+        aspect table (shared by every marketplace), instead of one query per
+        aspect, value and marketplace.
+
+        Args:
+            requests: (field_value, aspect_key, marketplace_id) tuples
+
+        Returns:
+            Dict {(field_value, aspect_key, marketplace_id): translated value or None}
+
+        Examples:
+            >>> service.get_aspect_values([
+            ...     ('bleu', 'color', 'EBAY_DE'), ('bleu', 'color', 'EBAY_FR'),
+            ... ])
+            {('bleu', 'color', 'EBAY_DE'): 'Blau', ('bleu', 'color', 'EBAY_FR'): 'Bleu'}
+        """
+        requests = list(dict.fromkeys(requests))
+
+        # Step 1 for every distinct value, GB values grouped by aspect table
+        pending: Dict[type, Set[str]] = {}
+        for field_value, aspect_key, _ in requests:
+            config = self.ASPECT_CONFIG.get(aspect_key.lower()) if aspect_key else None
+            if not field_value or not config or not config.get('aspect_model'):
+                continue
+            try:
+                gb_value = self._get_gb_value(field_value, config)
+            except Exception as e:
+                logger.debug(f"GB lookup failed for {aspect_key}='{field_value}': {e}")
+                continue
+            if gb_value:
+                pending.setdefault(config['aspect_model'], set()).add(gb_value)
+
+        # Step 2: one query per aspect table
+        for aspect_model, gb_values in pending.items():
+            try:
+                self._load_aspects(aspect_model, gb_values)
+            except Exception as e:
+                # Per-value lookups below retry (and log) individually
+                logger.error(f"Error loading {aspect_model.__tablename__}: {e}", exc_info=True)
+
+        return {
+            request: self.get_aspect_value(*request)
+            for request in requests
+        }
+
+    def _get_gb_value(self, field_value: str, config: dict) -> Optional[str]:
+        """Step 1 for an ASPECT_CONFIG entry (direct value if no attribut table)."""
+        if config.get('attribut_table'):
+            return self._get_gb_value_from_attribut(
+                field_value,
+                config['attribut_table'],
+                config['search_columns'],
+                config['gb_column']
+            )
+
+        # Direct value (assume it's already in GB format)
+        return field_value
+
     def _get_gb_value_from_attribut(
         self,
         field_value: str,
@@ -273,37 +335,28 @@ class EbayAspectValueService:
         """
         Step 1: Get GB reference value from product_attributes table.
 
+        Read from the in-memory reference catalog (case-insensitive, first
+        search column with a match), no query once the catalog is loaded.
+
         Args:
             field_value: Value to search for
-            table_name: Table name in product_attributes schema
-            search_columns: Columns to search in (OR logic)
+            table_name: Reference table (catalog name, e.g. 'colors', 'sizes')
+            search_columns: Columns to search in (first match wins)
             gb_column: Column containing the GB value
 
         Returns:
             GB reference value or None
         """
-        # Build OR conditions for search columns
-        conditions = " OR ".join([
-            f"LOWER({col}) = LOWER(:field_value)"
-            for col in search_columns
-        ])
-
-        query = text(f"""
-            SELECT {gb_column}
-            FROM product_attributes.{table_name}
-            WHERE {conditions}
-            LIMIT 1
-        """)
-
         try:
-            result = self.session.execute(
-                query, {'field_value': field_value}
-            ).fetchone()
+            table = get_reference_catalog(self.session).table(table_name)
+        except KeyError:
+            logger.debug(f"Attribut lookup failed: unknown table {table_name}")
+            return None
 
-            if result and result[0]:
-                return result[0]
-        except Exception as e:
-            logger.debug(f"Attribut lookup failed for {table_name}: {e}")
+        for column in search_columns:
+            entry = table.find_by(column, field_value)
+            if entry is not None:
+                return entry.get(gb_column) or None
 
         return None
 
@@ -324,15 +377,44 @@ class EbayAspectValueService:
         Returns:
             Translated value or None
         """
-        aspect = self.session.query(aspect_model).filter(
-            aspect_model.ebay_gb == gb_value
-        ).first()
+        aspects = self._aspects.get(aspect_model, {})
+        if gb_value not in aspects:
+            aspects = self._load_aspects(aspect_model, [gb_value])
 
+        aspect = aspects[gb_value]
         if aspect:
             return aspect.get_translation(marketplace_id)
 
         return None
 
+    def _load_aspects(
+        self,
+        aspect_model,
+        gb_values: Iterable[str]
+    ) -> Dict[str, Optional[object]]:
+        """
+        Fetch the ebay.aspect_* rows of GB values not cached yet (one IN query).
+
+        Args:
+            aspect_model: SQLAlchemy model class
+            gb_values: GB reference values
+
+        Returns:
+            Cached rows of the aspect table ({ebay_gb: row or None})
+        """
+        aspects = self._aspects.setdefault(aspect_model, {})
+        missing: List[str] = [value for value in set(gb_values) if value not in aspects]
+
+        if missing:
+            rows = self.session.query(aspect_model).filter(
+                aspect_model.ebay_gb.in_(missing)
+            ).all()
+            found = {row.ebay_gb: row for row in rows}
+            for value in missing:
+                aspects[value] = found.get(value)
+
+        return aspects
+
     def translate_direct(
         self,
         gb_value: str,
@@ -393,22 +475,14 @@ class EbayAspectValueService:
         Returns:
             Waist size (e.g., '82 cm') or None
         """
-        query = text("""
-            SELECT ebay_gb_waist_size
-            FROM product_attributes.sizes_normalized
-            WHERE LOWER(name_en) = LOWER(:size_value)
-            LIMIT 1
-        """)
-
         try:
-            result = self.session.execute(
-                query, {'size_value': size_value}
-            ).fetchone()
-
-            if result and result[0]:
-                return result[0]
+            size = get_reference_catalog(self.session).get("sizes", size_value)
         except Exception as e:
             logger.debug(f"Waist size lookup failed: {e}")
+            return None
+
+        if size and size.get("ebay_gb_waist_size"):
+            return size["ebay_gb_waist_size"]
 
         return None
 
@@ -422,28 +496,21 @@ class EbayAspectValueService:
         Returns:
             Inside leg (e.g., '77 cm') or None
         """
-        query = text("""
-            SELECT ebay_gb_inside_leg
-            FROM product_attributes.sizes_normalized
-            WHERE LOWER(name_en) = LOWER(:size_value)
-            LIMIT 1
-        """)
-
         try:
-            result = self.session.execute(
-                query, {'size_value': size_value}
-            ).fetchone()
-
-            if result and result[0]:
-                return result[0]
+            size = get_reference_catalog(self.session).get("sizes", size_value)
         except Exception as e:
             logger.debug(f"Inside leg lookup failed: {e}")
+            return None
+
+        if size and size.get("ebay_gb_inside_leg"):
+            return size["ebay_gb_inside_leg"]
 
         return None
 
     def clear_cache(self):
-        """Clear the internal translation cache."""
+        """Clear the internal translation and aspect row caches."""
         self._cache.clear()
+        self._aspects.clear()
 
 
 # Singleton-style cached instance for performance
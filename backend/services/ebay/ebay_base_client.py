@@ -23,6 +23,8 @@ Date: 2025-12-10
 import base64
 import os
 import time
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Any, Dict, Optional
 
 import requests
@@ -38,11 +40,35 @@ from shared.exceptions import (
 )
 from shared.http_client import RateLimiter
 from shared.logging import get_logger
+from shared.tenant_resource_cache import tenant_resource_cache
 from shared.timing import timed_operation, measure_operation
 
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True)
+class EbayCredentialsSnapshot:
+    """
+    Copie détachée des credentials eBay d'un user.
+
+    Peut être mise en cache entre sessions (contrairement au modèle ORM) et
+    passée au client pour éviter la requête ebay_credentials à chaque
+    instanciation (activities Temporal).
+    """
+
+    id: int
+    refresh_token: Optional[str]
+    refresh_token_expires_at: Optional[datetime]
+
+    @classmethod
+    def from_model(cls, creds: EbayCredentials) -> "EbayCredentialsSnapshot":
+        return cls(
+            id=creds.id,
+            refresh_token=creds.refresh_token,
+            refresh_token_expires_at=creds.refresh_token_expires_at,
+        )
+
+
 class EbayBaseClient:
     """
     Client de base eBay multi-tenant avec OAuth2.
@@ -90,6 +116,8 @@ class EbayBaseClient:
         user_id: int,
         marketplace_id: Optional[str] = None,
         sandbox: bool = False,
+        credentials: Optional[EbayCredentialsSnapshot] = None,
+        marketplace_config: Optional[MarketplaceConfig] = None,
     ):
         """
         Initialise le client eBay pour un user spécifique.
@@ -100,6 +128,8 @@ class EbayBaseClient:
             marketplace_id: Marketplace optionnelle (EBAY_FR, EBAY_GB, etc.)
                            Si fournie, Content-Language sera automatiquement défini
             sandbox: Utiliser l'environnement sandbox (défaut: production)
+            credentials: Credentials préchargés (cache activities), évite la requête DB
+            marketplace_config: MarketplaceConfig préchargée (détachée), évite la requête DB
         """
         self.db = db
         self.user_id = user_id
@@ -110,11 +140,11 @@ class EbayBaseClient:
         self.api_base = self.API_BASE_SANDBOX if self.sandbox else self.API_BASE_PRODUCTION
 
         # Load credentials depuis ebay_credentials
-        self._load_credentials()
+        self._load_credentials(credentials)
 
         # Load marketplace config si marketplace_id fourni
-        self.marketplace_config: Optional[MarketplaceConfig] = None
-        if marketplace_id:
+        self.marketplace_config: Optional[MarketplaceConfig] = marketplace_config
+        if marketplace_id and self.marketplace_config is None:
             self.marketplace_config = (
                 db.query(MarketplaceConfig)
                 .filter(MarketplaceConfig.marketplace_id == marketplace_id)
@@ -123,15 +153,18 @@ class EbayBaseClient:
             if not self.marketplace_config:
                 raise ValueError(f"Marketplace inconnue: {marketplace_id}")
 
-    def _load_credentials(self) -> None:
+    def _load_credentials(self, snapshot: Optional[EbayCredentialsSnapshot] = None) -> None:
         """
         Charge les credentials eBay depuis ebay_credentials (user schema).
 
+        Args:
+            snapshot: Credentials préchargés (pas de requête DB si fourni)
+
         Raises:
             ValueError: Si le user n'a pas de credentials eBay configurés
         """
         # Récupérer credentials depuis ebay_credentials (user schema)
-        ebay_creds = self.db.query(EbayCredentials).first()
+        ebay_creds = snapshot or self.db.query(EbayCredentials).first()
 
         if not ebay_creds:
             raise ValueError(
@@ -159,7 +192,10 @@ class EbayBaseClient:
         # Stocker les credentials
         self.refresh_token = ebay_creds.refresh_token
         self.refresh_token_expires_at = ebay_creds.refresh_token_expires_at
-        self.ebay_credentials = ebay_creds  # Garder référence pour updates
+        # Garder référence pour updates (modèle ORM chargé à la demande si snapshot)
+        self.ebay_credentials: Optional[EbayCredentials] = (
+            None if snapshot else ebay_creds
+        )
 
     def _check_refresh_token_expiry(self) -> None:
         """
@@ -263,11 +299,16 @@ class EbayBaseClient:
         new_refresh_token_expires_at = now + timedelta(seconds=refresh_token_expires_in)
 
         # Mettre à jour en DB
+        if self.ebay_credentials is None:
+            self.ebay_credentials = self.db.query(EbayCredentials).first()
         self.ebay_credentials.refresh_token = new_refresh_token
         self.ebay_credentials.refresh_token_expires_at = new_refresh_token_expires_at
 
         self.db.commit()
 
+        # Les snapshots en cache portent l'ancien refresh token
+        tenant_resource_cache.invalidate(self.user_id, "ebay")
+
         # Mettre à jour instance locale
         self.refresh_token = new_refresh_token
         self.refresh_token_expires_at = new_refresh_token_expires_at
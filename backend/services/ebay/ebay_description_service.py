@@ -11,22 +11,26 @@ Generates multilingual HTML descriptions for eBay listings with:
 - Footer
 - 40 SEO tags
 
+Static HTML (page shell, characteristic labels) is compiled once per
+language and shop; only the product blocks are rendered per listing.
+
 Ported from pythonApiWOO/services/ebay/ebay_description_multilang_service.py
 """
 
+from functools import lru_cache
+
 from sqlalchemy.orm import Session
 
-from models.public.category import Category
-from models.public.color import Color
-from models.public.condition import Condition
 from models.public.ebay_marketplace_config import MarketplaceConfig
-from models.public.gender import Gender
 from models.user.product import Product
 from services.ebay.ebay_description_tags import build_ebay_tags
 from services.ebay.ebay_description_translations import (
     MEASUREMENT_LABELS,
     TRANSLATIONS,
 )
+from services.listing_render_cache import listing_render_cache
+from services.reference_catalog import get_reference_catalog
+from services.text_templates import LineTemplate, compile_lines
 from shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -42,6 +46,8 @@ class EbayDescriptionService:
 
     def __init__(self, db: Session):
         self.db = db
+        # marketplace_id → language (one MarketplaceConfig query per marketplace)
+        self._languages: dict[str, str] = {}
 
     def generate_description(
         self,
@@ -60,6 +66,18 @@ class EbayDescriptionService:
         Returns:
             Complete HTML string for eBay description field.
         """
+        return listing_render_cache.get_or_render(
+            product, marketplace_id, f"description:{shop_name}",
+            lambda: self._render_description(product, marketplace_id, shop_name),
+        )
+
+    def _render_description(
+        self,
+        product: Product,
+        marketplace_id: str,
+        shop_name: str,
+    ) -> str:
+        """Build the HTML description (uncached, see generate_description)."""
         lang = self._get_language(marketplace_id)
         t = TRANSLATIONS.get(lang, TRANSLATIONS["en"])
 
@@ -70,7 +88,7 @@ class EbayDescriptionService:
         tags_html = build_ebay_tags(product, lang)
 
         html = self._assemble_html(
-            shop_name, t, seo_intro, characteristics_html,
+            shop_name, lang, seo_intro, characteristics_html,
             measurements_html, tags_html,
         )
 
@@ -82,7 +100,13 @@ class EbayDescriptionService:
     # ========== PRIVATE METHODS ==========
 
     def _get_language(self, marketplace_id: str) -> str:
-        """Get ISO 639-1 language code from marketplace config."""
+        """Get ISO 639-1 language code from marketplace config (memoized)."""
+        if marketplace_id not in self._languages:
+            self._languages[marketplace_id] = self._load_language(marketplace_id)
+        return self._languages[marketplace_id]
+
+    def _load_language(self, marketplace_id: str) -> str:
+        """Query the marketplace config for its language."""
         config = (
             self.db.query(MarketplaceConfig)
             .filter(MarketplaceConfig.marketplace_id == marketplace_id)
@@ -96,20 +120,16 @@ class EbayDescriptionService:
         )
         return "en"
 
-    def _translate_attribute(self, model_class, name_en_value: str, lang: str) -> str:
+    def _translate_attribute(self, table: str, name_en_value: str, lang: str) -> str:
         """
-        Translate an attribute value via DB lookup.
+        Translate an attribute value via the reference catalog.
 
-        Works with Color, Category, Gender models (all have name_en PK).
+        Works with colors, categories, genders tables (all have name_en PK).
         Falls back to name_en if translation is missing.
         """
         if lang == "en":
             return name_en_value
-        obj = (
-            self.db.query(model_class)
-            .filter(model_class.name_en == name_en_value)
-            .first()
-        )
+        obj = get_reference_catalog(self.db).get(table, name_en_value)
         if obj:
             translated = getattr(obj, f"name_{lang}", None)
             if translated:
@@ -117,17 +137,10 @@ class EbayDescriptionService:
         return name_en_value
 
     def _get_condition_text(self, condition_note: int | None, lang: str) -> str:
-        """Get translated condition name from DB."""
+        """Get translated condition name from the reference catalog."""
         if condition_note is None:
             return ""
-        condition_obj = (
-            self.db.query(Condition)
-            .filter(Condition.note == condition_note)
-            .first()
-        )
-        if condition_obj:
-            return condition_obj.get_name(lang)
-        return ""
+        return get_reference_catalog(self.db).translate("conditions", condition_note, lang) or ""
 
     def _get_category_type(self, product: Product) -> str:
         """
@@ -139,12 +152,8 @@ class EbayDescriptionService:
         if not product.category:
             return "tops"
 
-        # Get category and its parent from DB
-        category_obj = (
-            self.db.query(Category)
-            .filter(Category.name_en == product.category)
-            .first()
-        )
+        # Get category and its parent from the reference catalog
+        category_obj = get_reference_catalog(self.db).get("categories", product.category)
         parent_name = ""
         if category_obj and category_obj.parent_category:
             parent_name = category_obj.parent_category.lower()
@@ -175,7 +184,7 @@ class EbayDescriptionService:
 
         # Translate category
         category_name = self._translate_attribute(
-            Category, product.category, lang
+            "categories", product.category, lang
         ) if product.category else "Item"
 
         # Condition text
@@ -218,50 +227,34 @@ class EbayDescriptionService:
         self, product: Product, lang: str, t: dict[str, str],
     ) -> str:
         """Build HTML for the characteristics section."""
-        lines: list[str] = []
-
-        # Brand
-        if product.brand and product.brand.lower() != "unbranded":
-            lines.append(f'<p style="margin:5px 0;"><b>{t["brand"]}:</b> {product.brand}</p>')
-
-        # Model
-        if product.model:
-            lines.append(f'<p style="margin:5px 0;"><b>{t["model"]}:</b> {product.model}</p>')
-
-        # Fit
-        if product.fit:
-            lines.append(f'<p style="margin:5px 0;"><b>{t["fit"]}:</b> {product.fit.capitalize()}</p>')
-
-        # Color (first, translated)
-        if product.colors:
-            color_translated = self._translate_attribute(Color, product.colors[0], lang)
-            lines.append(f'<p style="margin:5px 0;"><b>{t["color"]}:</b> {color_translated.capitalize()}</p>')
-
-        # Material (first)
-        if product.materials:
-            lines.append(f'<p style="margin:5px 0;"><b>{t["material"]}:</b> {product.materials[0].capitalize()}</p>')
-
-        # Condition (with badge)
+        brand = product.brand
         condition_text = self._get_condition_text(product.condition, lang)
-        if condition_text:
-            badge_bg = self._get_condition_color(product.condition)
-            lines.append(
-                f'<p style="margin:5px 0;"><b>{t["condition"]}:</b> '
-                f'<span style="background:{badge_bg};color:#fff;padding:2px 8px;'
-                f'border-radius:10px;font-size:11px;">{condition_text}</span></p>'
-            )
 
-        # Era/Decade
-        if product.decade:
-            era_text = self._format_era(product.decade, lang, t)
-            lines.append(f'<p style="margin:5px 0;"><b>{t["era"]}:</b> {era_text}</p>')
+        values = {
+            "brand": brand if brand and brand.lower() != "unbranded" else None,
+            "model": str(product.model) if product.model else None,
+            "fit": product.fit.capitalize() if product.fit else None,
+            # Color (first, translated) / Material (first)
+            "color": (
+                self._translate_attribute("colors", product.colors[0], lang).capitalize()
+                if product.colors else None
+            ),
+            "material": product.materials[0].capitalize() if product.materials else None,
+            # Condition (with badge)
+            "condition": (
+                f'<span style="background:{self._get_condition_color(product.condition)};'
+                f'color:#fff;padding:2px 8px;border-radius:10px;font-size:11px;">'
+                f'{condition_text}</span>'
+                if condition_text else None
+            ),
+            "era": self._format_era(product.decade, lang, t) if product.decade else None,
+            "gender": (
+                self._translate_attribute("genders", product.gender, lang).capitalize()
+                if product.gender else None
+            ),
+        }
 
-        # Gender (translated)
-        if product.gender:
-            gender_translated = self._translate_attribute(Gender, product.gender, lang)
-            lines.append(f'<p style="margin:5px 0;"><b>{t["gender"]}:</b> {gender_translated.capitalize()}</p>')
-
-        return "\n".join(lines)
+        return _characteristics_template(lang).join(values, "\n")
 
     def _build_measurements(
         self,
@@ -340,14 +333,51 @@ class EbayDescriptionService:
     @staticmethod
     def _assemble_html(
         shop_name: str,
-        t: dict[str, str],
+        lang: str,
         seo_intro: str,
         characteristics_html: str,
         measurements_html: str,
         tags_html: str,
     ) -> str:
         """Assemble all sections into the final HTML description."""
-        return f'''<div style="max-width:1000px;margin:0 auto;font-family:Arial,sans-serif;color:#333;">
+        head, after_intro, after_characteristics, after_measurements, tail = _page_chunks(
+            lang, shop_name
+        )
+        return "".join((
+            head, seo_intro,
+            after_intro, characteristics_html,
+            after_characteristics, measurements_html,
+            after_measurements, tags_html,
+            tail,
+        ))
+
+
+# ========== PRECOMPILED TEMPLATES (once per language) ==========
+
+_CHARACTERISTIC_FIELDS = ("brand", "model", "fit", "color", "material", "condition", "era", "gender")
+
+# Dynamic blocks of the page (split points of the compiled shell)
+_SLOT = "\x00"
+
+
+@lru_cache(maxsize=32)
+def _characteristics_template(lang: str) -> LineTemplate:
+    """Characteristics lines with the labels of a language."""
+    t = TRANSLATIONS.get(lang, TRANSLATIONS["en"])
+    return compile_lines(
+        (field, f'<p style="margin:5px 0;"><b>{t[field]}:</b> {{}}</p>')
+        for field in _CHARACTERISTIC_FIELDS
+    )
+
+
+@lru_cache(maxsize=64)
+def _page_chunks(lang: str, shop_name: str) -> tuple[str, ...]:
+    """
+    Static HTML of the page for a language and shop, split around the
+    4 dynamic blocks (SEO intro, characteristics, measurements, tags).
+    """
+    t = TRANSLATIONS.get(lang, TRANSLATIONS["en"])
+    page = f'''<div style="max-width:1000px;margin:0 auto;font-family:Arial,sans-serif;color:#333;">
 
 <!-- Header -->
 <div style="background:#000;padding:25px;text-align:center;border-bottom:5px solid #FFC905;">
@@ -357,7 +387,7 @@ class EbayDescriptionService:
 
 <!-- SEO Intro -->
 <div style="background:#fff;padding:20px;margin:15px 0;border-left:5px solid #FFC905;">
-<p style="margin:0;font-size:15px;line-height:1.7;">{seo_intro}</p>
+<p style="margin:0;font-size:15px;line-height:1.7;">{_SLOT}</p>
 </div>
 
 <!-- Main Info -->
@@ -365,12 +395,12 @@ class EbayDescriptionService:
 
 <div style="flex:1;min-width:280px;background:#f8f9fa;border:2px solid #e9ecef;border-radius:8px;padding:15px;">
 <h2 style="color:#000;font-size:18px;margin:0 0 10px;border-bottom:3px solid #FFC905;padding-bottom:8px;">{t['characteristics']}</h2>
-{characteristics_html}
+{_SLOT}
 </div>
 
 <div style="flex:1;min-width:280px;background:#f8f9fa;border:2px solid #e9ecef;border-radius:8px;padding:15px;">
 <h2 style="color:#000;font-size:18px;margin:0 0 10px;border-bottom:3px solid #FFC905;padding-bottom:8px;">{t['measurements_title']}</h2>
-{measurements_html}
+{_SLOT}
 </div>
 
 </div>
@@ -393,7 +423,8 @@ class EbayDescriptionService:
 <!-- SEO Tags -->
 <div style="background:#f8f9fa;border:2px solid #e9ecef;border-radius:8px;padding:15px;margin:15px 0;">
 <p style="margin:0 0 8px;font-weight:bold;font-size:14px;">SEO Tags:</p>
-<p style="margin:0;font-size:12px;color:#666;line-height:1.8;">{tags_html}</p>
+<p style="margin:0;font-size:12px;color:#666;line-height:1.8;">{_SLOT}</p>
 </div>
 
 </div>'''
+    return tuple(page.split(_SLOT))
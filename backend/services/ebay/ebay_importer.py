@@ -25,7 +25,9 @@ from typing import Optional
 from sqlalchemy.orm import Session
 
 from models.public.ebay_aspect_mapping import AspectMapping
+from models.public.ebay_marketplace_config import MarketplaceConfig
 from models.user.ebay_product import EbayProduct
+from services.ebay.ebay_base_client import EbayCredentialsSnapshot
 from services.ebay.ebay_inventory_client import EbayInventoryClient
 from services.ebay.ebay_offer_client import EbayOfferClient
 from services.ebay.ebay_offer_enrichment import EbayOfferEnrichment
@@ -43,6 +45,9 @@ class EbayImporter:
         db: Session,
         user_id: int,
         marketplace_id: str = "EBAY_FR",
+        credentials: Optional[EbayCredentialsSnapshot] = None,
+        marketplace_config: Optional[MarketplaceConfig] = None,
+        aspect_reverse_map: Optional[dict] = None,
     ):
         """
         Initialise l'importeur avec les credentials OAuth eBay.
@@ -51,15 +56,26 @@ class EbayImporter:
             db: Session SQLAlchemy
             user_id: ID utilisateur Stoflow
             marketplace_id: Marketplace eBay (EBAY_FR, EBAY_GB, etc.)
+            credentials: Credentials préchargés (cache activities)
+            marketplace_config: MarketplaceConfig préchargée (détachée)
+            aspect_reverse_map: Mapping aspects préchargé (cache activities)
         """
         self.db = db
         self.user_id = user_id
         self.marketplace_id = marketplace_id
-        self.inventory_client = EbayInventoryClient(db, user_id, marketplace_id)
-        self.offer_client = EbayOfferClient(db, user_id, marketplace_id)
+        self.inventory_client = EbayInventoryClient(
+            db, user_id, marketplace_id,
+            credentials=credentials, marketplace_config=marketplace_config,
+        )
+        self.offer_client = EbayOfferClient(
+            db, user_id, marketplace_id,
+            credentials=credentials, marketplace_config=marketplace_config,
+        )
 
         # Load aspect reverse mapping from DB (all languages → aspect_key)
-        self._aspect_reverse_map = AspectMapping.get_reverse_mapping(db)
+        if aspect_reverse_map is None:
+            aspect_reverse_map = AspectMapping.get_reverse_mapping(db)
+        self._aspect_reverse_map = aspect_reverse_map
         logger.debug(f"Loaded {len(self._aspect_reverse_map)} aspect mappings")
 
         # Compose enrichment service
@@ -25,6 +25,7 @@ from services.ebay.ebay_oauth_config import (
 )
 from services.ebay.ebay_account_parser import update_ebay_credentials_from_seller_info
 from shared.logging import get_logger
+from shared.tenant_resource_cache import tenant_resource_cache
 
 logger = get_logger(__name__)
 
@@ -351,6 +352,7 @@ def process_oauth_callback(
 
     # Save tokens to DB
     ebay_creds = save_tokens_to_db(db, tokens, sandbox)
+    tenant_resource_cache.invalidate(user_id, "ebay")
 
     # Fetch and save account info (non-blocking)
     # Note: execution_options already applied, fetch_and_save_account_info will reapply
@@ -19,7 +19,6 @@ from typing import Any, Dict, List, Optional
 
 from sqlalchemy.orm import Session
 
-from models.public.condition import Condition
 from models.public.ebay_aspect_mapping import AspectMapping
 from models.public.ebay_category_mapping import EbayCategoryMapping
 from models.public.ebay_marketplace_config import MarketplaceConfig
@@ -32,12 +31,23 @@ from services.ebay.ebay_aspect_value_service import (
 from services.ebay.ebay_description_service import EbayDescriptionService
 from services.ebay.ebay_mapper import EbayMapper
 from services.ebay.ebay_seo_title_service import EbaySeoTitleService
+from services.listing_render_cache import listing_render_cache
+from services.reference_catalog import get_reference_catalog
 from shared.exceptions import ProductValidationError
 from shared.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def _build_condition_mapping(catalog) -> dict[int, str]:
+    """{condition_note: ebay_condition} of a reference catalog snapshot."""
+    mapping = {
+        c.note: c.ebay_condition for c in catalog.table("conditions") if c.ebay_condition
+    }
+    logger.debug(f"Loaded {len(mapping)} condition mappings")
+    return mapping
+
+
 class EbayProductConversionService:
     """
     Service de conversion Product → eBay.
@@ -71,7 +81,7 @@ class EbayProductConversionService:
         self.db = db
         self.user_id = user_id
 
-        # Load condition mapping from DB (condition_note → ebay_condition)
+        # Condition mapping from the reference catalog (condition_note → ebay_condition)
         self._condition_map = self._load_condition_mapping()
 
         # Initialize aspect value service for multilingual translations
@@ -83,6 +93,44 @@ class EbayProductConversionService:
         # Initialize description service for multilingual HTML descriptions
         self._description_service = EbayDescriptionService(db)
 
+    def prefetch_aspect_values(
+        self,
+        products: List[Product],
+        marketplace_ids: List[str],
+    ) -> None:
+        """
+        Pre-translate the aspect values of many products converted with this
+        instance.
+
+        Resolves every (value, aspect, marketplace) that _build_aspects will
+        ask for with EbayAspectValueService.get_aspect_values (one query per
+        aspect table), so the per-product conversions only hit the cache.
+        The cache lives on the instance: publication currently converts one
+        product per Temporal activity (new instance), where it does not apply.
+
+        Args:
+            products: Products to convert
+            marketplace_ids: Target marketplaces (ex: ["EBAY_FR", "EBAY_DE"])
+        """
+        requests = []
+        for product in products:
+            values = [(color, "color") for color in product.colors or []]
+            values += [(material, "material") for material in product.materials or []]
+            values += [
+                (product.size_original, "size"),
+                (product.fit, "fit"),
+                (getattr(product, "pattern", None), "pattern"),
+                (self._map_gender(product.gender) if product.gender else None, "department"),
+            ]
+            requests.extend(
+                (value, aspect_key, marketplace_id)
+                for value, aspect_key in values
+                if value
+                for marketplace_id in marketplace_ids
+            )
+
+        self._aspect_value_service.get_aspect_values(requests)
+
     def convert_to_inventory_item(
         self,
         product: Product,
@@ -315,6 +363,15 @@ class EbayProductConversionService:
         Date: 2025-12-10
         Updated: 2025-12-22 - Ajout traduction des VALEURS via EbayAspectValueService
         """
+        return listing_render_cache.get_or_render(
+            product, marketplace_id, "aspects",
+            lambda: self._render_aspects(product, marketplace_id),
+        )
+
+    def _render_aspects(
+        self, product: Product, marketplace_id: str
+    ) -> Dict[str, List[str]]:
+        """Build the localized aspects (uncached, see _build_aspects)."""
         # Load aspect NAME translations for this marketplace
         aspect_name_translations = AspectMapping.get_all_for_marketplace(
             self.db, marketplace_id
@@ -413,20 +470,14 @@ class EbayProductConversionService:
 
     def _load_condition_mapping(self) -> dict[int, str]:
         """
-        Load condition mapping from product_attributes.conditions table.
+        Load condition mapping from the product_attributes.conditions catalog table.
+
+        Built once per catalog version and shared (do not mutate).
 
         Returns:
             dict: {condition_note (int): ebay_condition (str)}
         """
-        conditions = self.db.query(Condition).all()
-        mapping = {}
-
-        for c in conditions:
-            if c.ebay_condition:
-                mapping[c.note] = c.ebay_condition
-
-        logger.debug(f"Loaded {len(mapping)} condition mappings from DB")
-        return mapping
+        return get_reference_catalog(self.db).memo("ebay.condition_mapping", _build_condition_mapping)
 
     def _map_condition(self, condition: int | None) -> str:
         """
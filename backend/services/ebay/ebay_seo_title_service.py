@@ -14,12 +14,10 @@ Examples:
 
 from sqlalchemy.orm import Session
 
-from models.public.category import Category
-from models.public.color import Color
-from models.public.condition import Condition
 from models.public.ebay_marketplace_config import MarketplaceConfig
-from models.public.gender import Gender
 from models.user.product import Product
+from services.listing_render_cache import listing_render_cache
+from services.reference_catalog import get_reference_catalog
 from shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -47,6 +45,13 @@ class EbaySeoTitleService:
         Returns:
             SEO-optimized title string (max 80 chars).
         """
+        return listing_render_cache.get_or_render(
+            product, marketplace_id, "seo_title",
+            lambda: self._render_seo_title(product, marketplace_id),
+        )
+
+    def _render_seo_title(self, product: Product, marketplace_id: str) -> str:
+        """Build the SEO title (uncached, see generate_seo_title)."""
         lang = self._get_language(marketplace_id)
         components: list[str] = []
 
@@ -60,7 +65,7 @@ class EbaySeoTitleService:
 
         # 3. Category (translated)
         if product.category:
-            translated = self._translate_attribute(Category, product.category, lang)
+            translated = self._translate_attribute("categories", product.category, lang)
             components.append(translated)
 
         # 4. Size (international code, no translation)
@@ -69,22 +74,20 @@ class EbaySeoTitleService:
 
         # 5. Color (first color only, translated)
         if product.colors:
-            translated = self._translate_attribute(Color, product.colors[0], lang)
+            translated = self._translate_attribute("colors", product.colors[0], lang)
             components.append(translated)
 
         # 6. Condition (lookup by note int, translated via get_name)
         if product.condition is not None:
-            condition_obj = (
-                self.db.query(Condition)
-                .filter(Condition.note == product.condition)
-                .first()
+            condition_name = get_reference_catalog(self.db).translate(
+                "conditions", product.condition, lang
             )
-            if condition_obj:
-                components.append(condition_obj.get_name(lang))
+            if condition_name:
+                components.append(condition_name)
 
         # 7. Gender (translated)
         if product.gender:
-            translated = self._translate_attribute(Gender, product.gender, lang)
+            translated = self._translate_attribute("genders", product.gender, lang)
             components.append(translated)
 
         # 8. Decade (international code, no translation)
@@ -122,15 +125,15 @@ class EbaySeoTitleService:
         )
         return "en"
 
-    def _translate_attribute(self, model_class, name_en_value: str, lang: str) -> str:
+    def _translate_attribute(self, table: str, name_en_value: str, lang: str) -> str:
         """
-        Translate an attribute value to the target language via DB lookup.
+        Translate an attribute value to the target language via the reference catalog.
 
-        Works with Color, Category, Gender (all have name_en as PK).
+        Works with colors, categories, genders (all have name_en as PK).
         Falls back to name_en if translation column is missing or empty.
 
         Args:
-            model_class: SQLAlchemy model with name_en PK and name_{lang} columns.
+            table: Reference catalog table (e.g. "colors").
             name_en_value: English value (PK) to look up.
             lang: Target language code (e.g. "fr", "de").
 
@@ -140,11 +143,7 @@ class EbaySeoTitleService:
         if lang == "en":
             return name_en_value
 
-        obj = (
-            self.db.query(model_class)
-            .filter(model_class.name_en == name_en_value)
-            .first()
-        )
+        obj = get_reference_catalog(self.db).get(table, name_en_value)
 
         if obj:
             translated = getattr(obj, f"name_{lang}", None)
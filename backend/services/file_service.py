@@ -13,8 +13,27 @@ Business Rules (2025-12-23):
 Updated 2026-01-05:
 - Added download_and_upload_from_url() for importing images from external URLs (Vinted)
 - Added WebP support for URL imports (Vinted uses WebP images)
+
+Updated 2026-02-04:
+- Image optimization (Pillow decode/resize/encode) runs in a thread pool
+  (image_processing_workers) instead of blocking the event loop; Pillow
+  releases the GIL during these operations, so images are processed in parallel
+- download_and_upload_from_url() accepts a shared httpx client (keep-alive
+  connections reused across the photos of an import)
+- Responsive variants (thumbnail 320px, medium 800px, WebP by default) are
+  generated at ingest and stored next to the original under predictable keys
+  ({uuid}_thumbnail.webp, {uuid}_medium.webp); save_product_image_with_variants()
+  and download_and_store_from_url() return a StoredImage (URLs + metadata for
+  ProductImage). Variant generation is best-effort: the image is kept without
+  variants if it fails (variants NULL, retried by the backfill script); the
+  variants uploaded before a failed upload are deleted. variants {} means the
+  image is too small to need any.
 """
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from io import BytesIO
 from typing import Optional, Tuple
 
@@ -25,10 +44,55 @@ from sqlalchemy.orm import Session
 
 from models.user.product import Product
 from services.r2_service import r2_service
+from shared.config import settings
 from shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Process-wide thread pool for image optimization."""
+    global _executor
+
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.image_processing_workers,
+                    thread_name_prefix="image-optimize",
+                )
+    return _executor
+
+
+@dataclass(frozen=True)
+class StoredImage:
+    """Image stored in R2: full-size URL, its size variants and metadata."""
+
+    url: str
+    file_size: int
+    mime_type: str = "image/jpeg"
+    width: Optional[int] = None
+    height: Optional[int] = None
+    # None = not generated (disabled/failed, picked up by the backfill)
+    variants: Optional[dict[str, str]] = None
+
+    def metadata(self) -> dict:
+        """ProductImage columns to record along with the URL."""
+        return {
+            "mime_type": self.mime_type,
+            "file_size": self.file_size,
+            "width": self.width,
+            "height": self.height,
+            "variants": self.variants,
+        }
+
+    def variant_urls(self) -> list[str]:
+        """URLs of the uploaded variants (for deletion)."""
+        return list((self.variants or {}).values())
+
 
 class FileService:
     """Service pour gérer les uploads de fichiers vers R2."""
@@ -44,6 +108,11 @@ class FileService:
     # Supported formats for URL import (includes WebP from Vinted)
     URL_IMPORT_FORMATS = {"jpeg", "png", "webp"}
 
+    # Responsive variants: name -> max width/height in pixels (largest first)
+    IMAGE_VARIANTS = {"medium": 800, "thumbnail": 320}
+    VARIANT_QUALITY = 80
+    VARIANT_FORMATS = {"webp": ("WEBP", "image/webp"), "jpeg": ("JPEG", "image/jpeg")}
+
     @staticmethod
     def _detect_image_format(content: bytes) -> Optional[str]:
         """
@@ -128,6 +197,134 @@ class FileService:
 
         return optimized_content, "jpeg"
 
+    @staticmethod
+    async def optimize_image_async(content: bytes, original_format: str) -> Tuple[bytes, str]:
+        """
+        Run _optimize_image() in the image thread pool (non-blocking).
+
+        Args:
+            content: Original image bytes
+            original_format: 'jpeg', 'png' or 'webp'
+
+        Returns:
+            Tuple of (optimized_bytes, output_format)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_executor(), FileService._optimize_image, content, original_format
+        )
+
+    @staticmethod
+    def _build_variants(
+        content: bytes, variant_format: str
+    ) -> Tuple[Tuple[int, int], list[Tuple[str, bytes]]]:
+        """
+        Decode an optimized image and encode its size variants (CPU-bound).
+
+        Each variant is resized from the previous (larger) one; variants that
+        would not be smaller than the image itself are skipped.
+
+        Args:
+            content: Optimized (full-size) JPEG bytes
+            variant_format: 'webp' or 'jpeg'
+
+        Returns:
+            Tuple of ((width, height) of the full image, [(variant_name, bytes)])
+        """
+        pil_format, _ = FileService.VARIANT_FORMATS[variant_format]
+        img = Image.open(BytesIO(content))
+        size = img.size
+
+        # JPEG: let the decoder downscale by 1/2..1/8 (much faster than full decode)
+        largest = max(FileService.IMAGE_VARIANTS.values())
+        img.draft("RGB", (largest, largest))
+        img = img.convert("RGB")
+
+        variants = []
+        for name, max_dimension in FileService.IMAGE_VARIANTS.items():
+            if max(size) <= max_dimension:
+                continue
+            img.thumbnail((max_dimension, max_dimension), Image.Resampling.LANCZOS)
+            output = BytesIO()
+            img.save(output, format=pil_format, quality=FileService.VARIANT_QUALITY)
+            variants.append((name, output.getvalue()))
+
+        return size, variants
+
+    @staticmethod
+    async def store_variants(
+        image_url: str, content: bytes
+    ) -> Tuple[Optional[Tuple[int, int]], Optional[dict[str, str]]]:
+        """
+        Build the variants of a stored image and upload them next to it.
+
+        Best-effort: failures are logged and the image is kept without variants.
+        If one upload fails, the variants already uploaded are deleted.
+
+        Args:
+            image_url: R2 public URL of the full-size image
+            content: Optimized (full-size) image bytes
+
+        Returns:
+            Tuple of ((width, height) or None, {variant_name: url}), the
+            variants being None if not generated (disabled or failed) and {}
+            if the image is too small to need any
+        """
+        if not settings.image_variants_enabled:
+            return None, None
+
+        variant_format = settings.image_variant_format
+        try:
+            loop = asyncio.get_running_loop()
+            size, built = await loop.run_in_executor(
+                _get_executor(), FileService._build_variants, content, variant_format
+            )
+        except Exception as e:
+            logger.warning(f"[FileService] Variant generation failed for {image_url}: {e}")
+            return None, None
+
+        _, content_type = FileService.VARIANT_FORMATS[variant_format]
+
+        async def upload(name: str, data: bytes) -> Tuple[str, str]:
+            key = r2_service.variant_object_key(image_url, name, variant_format)
+            return name, await r2_service.upload_object(key, data, content_type)
+
+        results = await asyncio.gather(
+            *(upload(name, data) for name, data in built), return_exceptions=True
+        )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            logger.warning(f"[FileService] Variant upload failed for {image_url}: {errors[0]}")
+            # Don't leave a partial set of variants behind
+            for result in results:
+                if not isinstance(result, BaseException):
+                    await r2_service.delete_image(result[1])
+            return size, None
+
+        return size, dict(results)
+
+    @staticmethod
+    async def _store_optimized(
+        user_id: int, product_id: int, content: bytes, extension: str
+    ) -> StoredImage:
+        """Upload an optimized image to R2, then its size variants."""
+        image_url = await r2_service.upload_image(
+            user_id=user_id,
+            product_id=product_id,
+            content=content,
+            extension=extension,
+            content_type="image/jpeg",
+        )
+        size, variants = await FileService.store_variants(image_url, content)
+
+        return StoredImage(
+            url=image_url,
+            file_size=len(content),
+            width=size[0] if size else None,
+            height=size[1] if size else None,
+            variants=variants,
+        )
+
     @staticmethod
     async def _validate_and_optimize(file: UploadFile) -> Tuple[bytes, str, str]:
         """
@@ -182,8 +379,8 @@ class FileService:
         if file_size == 0:
             raise ValueError("File is empty")
 
-        # Optimize image (resize + compress)
-        optimized_content, output_format = FileService._optimize_image(
+        # Optimize image (resize + compress, in the thread pool)
+        optimized_content, output_format = await FileService.optimize_image_async(
             content_full, image_type
         )
 
@@ -204,6 +401,28 @@ class FileService:
         Returns:
             str: R2 public URL
 
+        Raises:
+            ValueError: If validation fails
+            RuntimeError: If R2 is not configured
+        """
+        stored = await FileService.save_product_image_with_variants(user_id, product_id, file)
+        return stored.url
+
+    @staticmethod
+    async def save_product_image_with_variants(
+        user_id: int, product_id: int, file: UploadFile
+    ) -> StoredImage:
+        """
+        Save product image and its size variants to Cloudflare R2.
+
+        Args:
+            user_id: User ID for path isolation
+            product_id: Product ID
+            file: Uploaded file (FastAPI UploadFile)
+
+        Returns:
+            StoredImage: URLs (full size + variants) and metadata
+
         Raises:
             ValueError: If validation fails
             RuntimeError: If R2 is not configured
@@ -221,31 +440,28 @@ class FileService:
 
         # Validate and optimize image
         content, extension, content_type = await FileService._validate_and_optimize(file)
-        file_size = len(content)
 
-        # Upload to R2
-        image_url = await r2_service.upload_image(
-            user_id=user_id,
-            product_id=product_id,
-            content=content,
-            extension=extension,
-            content_type=content_type,
-        )
+        # Upload to R2 (full size, then variants)
+        stored = await FileService._store_optimized(user_id, product_id, content, extension)
 
         logger.info(
             f"[FileService] Image uploaded: user_id={user_id}, "
-            f"product_id={product_id}, url={image_url}, size={file_size/1024:.1f}KB"
+            f"product_id={product_id}, url={stored.url}, size={stored.file_size/1024:.1f}KB, "
+            f"variants={len(stored.variant_urls())}"
         )
 
-        return image_url
+        return stored
 
     @staticmethod
-    async def delete_product_image(image_url: str) -> bool:
+    async def delete_product_image(
+        image_url: str, variant_urls: Optional[list[str]] = None
+    ) -> bool:
         """
-        Delete image from R2.
+        Delete image (and its size variants) from R2.
 
         Args:
             image_url: R2 public URL of the image
+            variant_urls: R2 public URLs of its variants (ProductImage.variants)
 
         Returns:
             bool: True if deleted, False if didn't exist
@@ -257,6 +473,9 @@ class FileService:
         result = await r2_service.delete_image(image_url)
         if result:
             logger.info(f"[FileService] Image deleted: {image_url}")
+
+        for variant_url in variant_urls or []:
+            await r2_service.delete_image(variant_url)
         return result
 
     @staticmethod
@@ -288,7 +507,8 @@ class FileService:
         user_id: int,
         product_id: int,
         image_url: str,
-        timeout: float = 30.0
+        timeout: float = 30.0,
+        client: Optional[httpx.AsyncClient] = None,
     ) -> str:
         """
         Download image from external URL and upload to R2.
@@ -302,10 +522,37 @@ class FileService:
             product_id: Product ID
             image_url: External URL of the image to download (e.g., Vinted CDN)
             timeout: HTTP timeout in seconds (default 30s)
+            client: Shared HTTP client (connection reuse); a new one is used if None
 
         Returns:
             str: R2 public URL of the uploaded image
 
+        Raises:
+            ValueError: If image validation fails (format, size)
+            RuntimeError: If R2 is not configured or download fails
+        """
+        stored = await FileService.download_and_store_from_url(
+            user_id, product_id, image_url, timeout=timeout, client=client
+        )
+        return stored.url
+
+    @staticmethod
+    async def download_and_store_from_url(
+        user_id: int,
+        product_id: int,
+        image_url: str,
+        timeout: float = 30.0,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> StoredImage:
+        """
+        Download image from external URL and store it (with its variants) in R2.
+
+        Same as download_and_upload_from_url() but returns the variant URLs and
+        metadata to record on ProductImage.
+
+        Returns:
+            StoredImage: URLs (full size + variants) and metadata
+
         Raises:
             ValueError: If image validation fails (format, size)
             RuntimeError: If R2 is not configured or download fails
@@ -323,10 +570,13 @@ class FileService:
 
         # Download image from external URL
         try:
-            async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-                response = await client.get(image_url)
-                response.raise_for_status()
-                content = response.content
+            if client is not None:
+                response = await client.get(image_url, timeout=timeout)
+            else:
+                async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as new_client:
+                    response = await new_client.get(image_url)
+            response.raise_for_status()
+            content = response.content
         except httpx.TimeoutException:
             raise RuntimeError(f"Timeout ({timeout}s) downloading image from {image_url[:100]}")
         except httpx.HTTPStatusError as e:
@@ -359,24 +609,21 @@ class FileService:
             f"[FileService] Downloaded {len(content)/1024:.1f}KB, format={image_type}"
         )
 
-        # Optimize image (resize + compress)
-        optimized_content, output_format = FileService._optimize_image(
+        # Optimize image (resize + compress, in the thread pool)
+        optimized_content, output_format = await FileService.optimize_image_async(
             content, image_type
         )
 
-        # Upload to R2
-        r2_url = await r2_service.upload_image(
-            user_id=user_id,
-            product_id=product_id,
-            content=optimized_content,
-            extension=output_format,
-            content_type="image/jpeg",
+        # Upload to R2 (full size, then variants)
+        stored = await FileService._store_optimized(
+            user_id, product_id, optimized_content, output_format
         )
 
         logger.info(
             f"[FileService] Image uploaded from URL: user_id={user_id}, "
             f"product_id={product_id}, source={image_url[:50]}..., "
-            f"dest={r2_url}, size={len(optimized_content)/1024:.1f}KB"
+            f"dest={stored.url}, size={stored.file_size/1024:.1f}KB, "
+            f"variants={len(stored.variant_urls())}"
         )
 
-        return r2_url
+        return stored
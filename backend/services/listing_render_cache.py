@@ -0,0 +1,166 @@
+"""
+Listing Render Cache
+
+Process-wide LRU cache of the texts rendered for a product listing:
+eBay SEO title, HTML description and aspects (per marketplace), Vinted
+title and description, text generator formats.
+
+Key = (tenant schema, product_id, version_number, marketplace, template version):
+- version_number is incremented by every product edit (ProductService,
+  ProductStatusManager, bulk pricing), so an edited product misses the
+  cache and is rendered again: no explicit invalidation
+- template version = RENDER_TEMPLATE_VERSION (bump it when a title,
+  description or aspect builder changes its output) + reference catalog
+  version (attribute translations)
+- one entry per key holds every rendered part ("title", "description",
+  "aspects"...), shared by publish, update and preview
+
+Rendered every time (never cached):
+- objects that are not persistent ORM rows (preview from raw attributes, mocks)
+- products with unflushed changes, sessions without a tenant schema
+
+Policy:
+- LRU bound: listing_render_cache_max_entries keys
+- TTL: listing_render_cache_ttl_seconds (bounds staleness of the ebay.*
+  translation tables, which are not part of the key)
+- Disabled globally with listing_render_cache_enabled
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from sqlalchemy import inspect
+from sqlalchemy.exc import NoInspectionAvailable
+
+from services.reference_catalog import get_reference_catalog
+from shared.config import settings
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Bump when a renderer (title, description, aspects) changes its output
+RENDER_TEMPLATE_VERSION = 1
+
+RenderKey = Tuple[str, int, int, str, str]
+T = TypeVar("T")
+
+
+class ListingRenderCache:
+    """In-memory LRU of rendered listing parts, with hit/miss counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # key → (stored_at, {part: value})
+        self._entries: "OrderedDict[RenderKey, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def key_for(product: Any, marketplace: str) -> Optional[RenderKey]:
+        """Cache key of a product, or None if its render must not be cached."""
+        try:
+            state = inspect(product)
+        except NoInspectionAvailable:
+            return None
+
+        session = state.session
+        if session is None or not state.persistent or state.modified:
+            return None
+
+        try:
+            bind = session.get_bind()
+            tenant = bind.get_execution_options().get("schema_translate_map", {}).get("tenant")
+            catalog_version = get_reference_catalog(session).version
+        except Exception as e:
+            logger.debug(f"[ListingRenderCache] No key for product {product.id}: {e}")
+            return None
+
+        if not tenant:
+            return None
+
+        return (
+            tenant,
+            product.id,
+            product.version_number,
+            marketplace,
+            f"{RENDER_TEMPLATE_VERSION}.{catalog_version}",
+        )
+
+    def get_or_render(
+        self,
+        product: Any,
+        marketplace: str,
+        part: str,
+        render: Callable[[], T],
+    ) -> T:
+        """
+        Return the cached part of a product listing, rendering it on a miss.
+
+        Args:
+            product: Product (ORM instance)
+            marketplace: Marketplace of the render (ex: "EBAY_FR", "vinted")
+            part: Rendered part (ex: "title", "description", "aspects")
+            render: Builds the part (called on a miss or when not cacheable)
+
+        Returns:
+            Rendered part (dict/list values are copies: callers may mutate them)
+        """
+        if not settings.listing_render_cache_enabled:
+            return render()
+
+        key = self.key_for(product, marketplace)
+        if key is None:
+            return render()
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] >= settings.listing_render_cache_ttl_seconds:
+                del self._entries[key]
+                entry = None
+            if entry is not None and part in entry[1]:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return copy.deepcopy(entry[1][part])
+            self._misses += 1
+
+        value = render()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = (now, {})
+                self._entries[key] = entry
+            entry[1][part] = copy.deepcopy(value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > settings.listing_render_cache_max_entries:
+                self._entries.popitem(last=False)
+
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> dict:
+        """Process-level counters (entries, hits, misses, hit rate)."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / total, 4) if total else 0.0,
+            }
+
+
+listing_render_cache = ListingRenderCache()
@@ -22,6 +22,11 @@ from models.product_attributes.model import Model
 # Adjustment caps for features
 MAX_FEATURE_ADJUSTMENT = Decimal("0.30")
 
+# Price level multipliers (standard = 1.0)
+QUICK_PRICE_MULTIPLIER = Decimal("0.75")
+PREMIUM_PRICE_MULTIPLIER = Decimal("1.30")
+PRICE_QUANTUM = Decimal("0.01")
+
 
 def calculateModelCoefficient(model: Optional[Model]) -> Decimal:
     """
@@ -336,3 +341,30 @@ def calculateFitAdjustment(
 
     # Return difference
     return actual_coef - expected_coef
+
+
+def calculatePriceLevels(
+    base_price: Decimal,
+    model_coeff: Decimal,
+    condition_mult: Decimal,
+    total_adjustment: Decimal,
+) -> tuple[Decimal, Decimal, Decimal]:
+    """
+    Apply the pricing formula and derive the 3 price levels.
+
+    Formula: PRICE = BASE_PRICE × MODEL_COEFF × CONDITION_MULT × (1 + ADJUSTMENTS)
+    Levels: quick = PRICE × 0.75, standard = PRICE, premium = PRICE × 1.30,
+    each rounded to the cent (Decimal context rounding, ROUND_HALF_EVEN).
+
+    Shared by PricingService (one product) and BulkPricingService (many),
+    so both paths round identically.
+
+    Returns:
+        Tuple (quick, standard, premium).
+    """
+    adjusted_price = base_price * model_coeff * condition_mult * (1 + total_adjustment)
+    return (
+        (adjusted_price * QUICK_PRICE_MULTIPLIER).quantize(PRICE_QUANTUM),
+        adjusted_price.quantize(PRICE_QUANTUM),
+        (adjusted_price * PREMIUM_PRICE_MULTIPLIER).quantize(PRICE_QUANTUM),
+    )
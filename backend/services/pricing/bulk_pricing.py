@@ -0,0 +1,400 @@
+"""
+Bulk Pricing Service
+
+Prices a whole inventory in a few set-based queries instead of one
+PricingService.calculate_price() call (and ~2 SELECTs) per product:
+
+1. Products: one column query + one product_materials query (no ORM objects)
+2. BrandGroups: one query for all distinct (brand, group) pairs
+3. Models: one query for all distinct (brand, group, model) keys
+4. Coefficients: the shared in-memory snapshot (coefficient_snapshot)
+
+The computation itself is pure and batched: each adjustment is computed
+once per distinct combination of the attributes it depends on (e.g. origin
+adjustment per origin + BrandGroup), then reused across products. It uses
+the same calculators and the same Decimal rounding (calculatePriceLevels)
+as PricingService, so bulk and single-product prices are identical to the
+cent.
+
+Differences with PricingService.calculate_price():
+- No LLM generation: a missing BrandGroup gives status NO_BRAND_GROUP
+  (generate it through /pricing/calculate first), a missing Model keeps
+  the default coefficient 1.0
+- Expected values always come from the BrandGroup/Model (no overrides)
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal, InvalidOperation
+from typing import Iterable, Optional
+
+from sqlalchemy import Numeric, select
+from sqlalchemy.orm import Session
+
+from models.product_attributes.model import Model
+from models.public.brand_group import BrandGroup
+from models.user.product import Product, ProductStatus
+from models.user.product_attributes_m2m import ProductMaterial
+from repositories.brand_group_repository import BrandGroupRepository
+from repositories.model_repository import ModelRepository
+from repositories.product_repository import ProductRepository
+from services.pricing.adjustment_calculators import (
+    calculateConditionMultiplier,
+    calculateDecadeAdjustment,
+    calculateFeatureAdjustment,
+    calculateFitAdjustment,
+    calculateOriginAdjustment,
+    calculatePriceLevels,
+    calculateTrendAdjustment,
+)
+from services.pricing.coefficient_snapshot import PricingCoefficients, get_pricing_coefficients
+from services.pricing.group_determination import determine_group
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+PRICE_LEVELS = ("quick", "standard", "premium")
+
+
+@dataclass(frozen=True)
+class BulkPricingItem:
+    """Pricing attributes of one product (plain values, no ORM object)."""
+
+    product_id: int
+    brand: str
+    category: str
+    materials: tuple[str, ...] = ()
+    model_name: Optional[str] = None
+    condition: Optional[int] = None
+    origin: Optional[str] = None
+    decade: Optional[str] = None
+    trend: Optional[str] = None
+    unique_features: tuple[str, ...] = ()
+    fit: Optional[str] = None
+    current_price: Optional[Decimal] = None
+    version_number: Optional[int] = None
+    title: str = ""
+
+
+@dataclass
+class BulkPricingResult:
+    """Computed prices and breakdown of one product."""
+
+    item: BulkPricingItem
+    status: str = "OK"  # "OK", "NO_BRAND_GROUP", "ERROR"
+    error: Optional[str] = None
+    group: Optional[str] = None
+    base_price: Optional[Decimal] = None
+    model_coeff: Decimal = Decimal("1.0")
+    condition_mult: Decimal = Decimal("1.0")
+    origin_adj: Decimal = Decimal("0.0")
+    decade_adj: Decimal = Decimal("0.0")
+    trend_adj: Decimal = Decimal("0.0")
+    feature_adj: Decimal = Decimal("0.0")
+    fit_adj: Decimal = Decimal("0.0")
+    total_adjustment: Decimal = Decimal("0.0")
+    quick_price: Optional[Decimal] = None
+    standard_price: Optional[Decimal] = None
+    premium_price: Optional[Decimal] = None
+
+    def price(self, level: str) -> Optional[Decimal]:
+        """Price of a level ("quick", "standard", "premium")."""
+        return getattr(self, f"{level}_price")
+
+
+_MISSING = object()
+
+
+class BulkPricingService:
+    """Set-based pricing of many products (reprice-all, price analysis)."""
+
+    @staticmethod
+    def load_tenant_items(
+        db: Session,
+        statuses: Optional[Iterable[ProductStatus]] = None,
+        product_ids: Optional[Iterable[int]] = None,
+    ) -> list[BulkPricingItem]:
+        """
+        Load the pricing attributes of the tenant's products (2 queries).
+
+        Args:
+            db: Session with the user schema configured
+            statuses: Only these statuses (all statuses if None)
+            product_ids: Only these products (all if None)
+
+        Returns:
+            Items ordered by product id (deleted products excluded)
+        """
+        filters = [Product.deleted_at.is_(None)]
+        if statuses:
+            filters.append(Product.status.in_(list(statuses)))
+        if product_ids is not None:
+            filters.append(Product.id.in_(list(product_ids)))
+
+        rows = db.execute(
+            select(
+                Product.id, Product.title, Product.brand, Product.category, Product.model,
+                Product.condition, Product.origin, Product.decade, Product.trend,
+                Product.unique_feature, Product.fit, Product.price, Product.version_number,
+            )
+            .where(*filters)
+            .order_by(Product.id)
+        ).all()
+
+        materials: dict[int, list[str]] = {}
+        material_rows = db.execute(
+            select(ProductMaterial.product_id, ProductMaterial.material).where(
+                ProductMaterial.product_id.in_(select(Product.id).where(*filters))
+            )
+        ).all()
+        for product_id, material in material_rows:
+            materials.setdefault(product_id, []).append(material)
+
+        return [
+            BulkPricingItem(
+                product_id=row.id,
+                brand=row.brand or "Unknown",
+                category=row.category,
+                materials=tuple(materials.get(row.id, ())),
+                model_name=row.model,
+                condition=row.condition,
+                origin=row.origin,
+                decade=row.decade,
+                trend=row.trend,
+                unique_features=tuple(row.unique_feature or ()),
+                fit=row.fit,
+                current_price=row.price,
+                version_number=row.version_number,
+                title=row.title or "",
+            )
+            for row in rows
+        ]
+
+    @staticmethod
+    def _determine_groups(items: list[BulkPricingItem]) -> dict[tuple, object]:
+        """(category, sorted materials) -> group, or the ValueError raised."""
+        groups: dict[tuple, object] = {}
+        for item in items:
+            key = (item.category, tuple(sorted(item.materials)))
+            if key not in groups:
+                try:
+                    groups[key] = determine_group(item.category, list(item.materials))
+                except ValueError as e:
+                    groups[key] = e
+        return groups
+
+    @staticmethod
+    def compute(
+        items: list[BulkPricingItem],
+        brand_groups: dict[tuple[str, str], BrandGroup],
+        models: dict[tuple[str, str, str], Model],
+        coefficients: PricingCoefficients,
+        groups: Optional[dict[tuple, object]] = None,
+    ) -> list[BulkPricingResult]:
+        """
+        Price items from preloaded reference data (no I/O).
+
+        Args:
+            items: Products to price
+            brand_groups: (brand, group) -> BrandGroup
+            models: (brand, group, model) -> Model
+            coefficients: Pricing coefficient snapshot
+            groups: Precomputed (category, sorted materials) -> group
+
+        Returns:
+            One result per item, in the same order
+        """
+        if groups is None:
+            groups = BulkPricingService._determine_groups(items)
+
+        # Each component only depends on a few attributes: compute it once
+        # per distinct combination (e.g. origin adjustment per origin + brand group)
+        memo: dict[tuple, object] = {}
+
+        def cached(key: tuple, compute):
+            value = memo.get(key, _MISSING)
+            if value is _MISSING:
+                value = memo[key] = compute()
+            return value
+
+        results = []
+        for item in items:
+            group = groups[(item.category, tuple(sorted(item.materials)))]
+            if isinstance(group, ValueError):
+                results.append(BulkPricingResult(
+                    item=item, status="ERROR", error=f"Group determination failed: {group}"
+                ))
+                continue
+
+            brand_group = brand_groups.get((item.brand, group))
+            if brand_group is None:
+                results.append(BulkPricingResult(
+                    item=item, status="NO_BRAND_GROUP", group=group,
+                    error=f"No BrandGroup for {item.brand} + {group}",
+                ))
+                continue
+
+            try:
+                results.append(BulkPricingService._compute_one(
+                    item, group, brand_group, models, coefficients, cached
+                ))
+            except (ValueError, KeyError, InvalidOperation, OverflowError, TypeError) as e:
+                results.append(BulkPricingResult(item=item, status="ERROR", error=str(e), group=group))
+
+        logger.debug(f"[BulkPricing] Priced {len(items)} products ({len(memo)} computed components)")
+        return results
+
+    @staticmethod
+    def _compute_one(
+        item: BulkPricingItem,
+        group: str,
+        brand_group: BrandGroup,
+        models: dict[tuple[str, str, str], Model],
+        coefficients: PricingCoefficients,
+        cached,
+    ) -> BulkPricingResult:
+        """Same formula and calculators as PricingService.calculate_price()."""
+        bg_key = (item.brand, group)
+        model = models.get((item.brand, group, item.model_name)) if item.model_name else None
+        model_coeff = model.coefficient if model else Decimal("1.0")
+
+        condition_mult = cached(
+            ("condition", item.condition),
+            lambda: calculateConditionMultiplier(
+                coefficients.condition.get(item.condition, Decimal("1.0"))
+            ),
+        )
+        origin_adj = cached(
+            ("origin", item.origin, bg_key),
+            lambda: calculateOriginAdjustment(
+                item.origin, brand_group.expected_origins or [], coefficients.origin
+            ),
+        )
+        decade_adj = cached(
+            ("decade", item.decade, bg_key),
+            lambda: calculateDecadeAdjustment(
+                item.decade, brand_group.expected_decades or [], coefficients.decade
+            ),
+        )
+        trend_adj = cached(
+            ("trend", item.trend, bg_key),
+            lambda: calculateTrendAdjustment(
+                [item.trend] if item.trend else [],
+                brand_group.expected_trends or [],
+                coefficients.trend,
+            ),
+        )
+        feature_adj = cached(
+            ("feature", item.unique_features, bg_key, item.model_name if model else None),
+            lambda: calculateFeatureAdjustment(
+                list(item.unique_features),
+                (model.expected_features or []) if model else [],
+                coefficients.feature,
+            ),
+        )
+        fit_adj = cached(
+            ("fit", item.fit),
+            lambda: calculateFitAdjustment(item.fit, [], coefficients.fit),
+        )
+
+        total_adjustment = origin_adj + decade_adj + trend_adj + feature_adj + fit_adj
+        base_price = brand_group.base_price
+        quick_price, standard_price, premium_price = cached(
+            ("levels", base_price, model_coeff, condition_mult, total_adjustment),
+            lambda: calculatePriceLevels(base_price, model_coeff, condition_mult, total_adjustment),
+        )
+
+        return BulkPricingResult(
+            item=item,
+            group=group,
+            base_price=base_price,
+            model_coeff=model_coeff,
+            condition_mult=condition_mult,
+            origin_adj=origin_adj,
+            decade_adj=decade_adj,
+            trend_adj=trend_adj,
+            feature_adj=feature_adj,
+            fit_adj=fit_adj,
+            total_adjustment=total_adjustment,
+            quick_price=quick_price,
+            standard_price=standard_price,
+            premium_price=premium_price,
+        )
+
+    @staticmethod
+    def price_items(db: Session, items: list[BulkPricingItem]) -> list[BulkPricingResult]:
+        """
+        Price items, loading BrandGroups/Models in set-based queries.
+
+        Args:
+            db: Session (public/product_attributes tables are read)
+            items: Products to price
+
+        Returns:
+            One result per item, in the same order
+        """
+        groups = BulkPricingService._determine_groups(items)
+
+        pairs = set()
+        model_keys = set()
+        for item in items:
+            group = groups[(item.category, tuple(sorted(item.materials)))]
+            if isinstance(group, ValueError):
+                continue
+            pairs.add((item.brand, group))
+            if item.model_name:
+                model_keys.add((item.brand, group, item.model_name))
+
+        brand_groups = BrandGroupRepository.get_by_brand_group_pairs(db, pairs) if pairs else {}
+        models = ModelRepository.get_by_keys(db, model_keys) if model_keys else {}
+        coefficients = get_pricing_coefficients(db)
+
+        logger.info(
+            f"[BulkPricing] {len(items)} products: {len(brand_groups)}/{len(pairs)} brand groups, "
+            f"{len(models)}/{len(model_keys)} models found"
+        )
+        return BulkPricingService.compute(items, brand_groups, models, coefficients, groups)
+
+    @staticmethod
+    def apply_prices(
+        db: Session, results: list[BulkPricingResult], level: str = "standard"
+    ) -> tuple[set[int], set[int]]:
+        """
+        Write the computed prices with an optimistic version check.
+
+        ProductRepository.bulk_update_versioned(): a product is updated only
+        if its version_number is still the one read by load_tenant_items()
+        (version_number is incremented, like ProductService updates) and it
+        is not SOLD (SOLD products are immutable). Unchanged prices and
+        non-OK results are skipped. Does not commit.
+
+        Args:
+            db: Session with the user schema configured
+            results: Results of price_items()
+            level: Price level to apply
+
+        Returns:
+            (updated product ids, conflicting product ids)
+        """
+        if level not in PRICE_LEVELS:
+            raise ValueError(f"Unknown price level: {level}")
+
+        rows = [
+            (r.item.product_id, r.item.version_number, r.price(level))
+            for r in results
+            if r.status == "OK" and r.price(level) != r.item.current_price
+        ]
+
+        updated = ProductRepository.bulk_update_versioned(
+            db,
+            rows,
+            value_types={"price": Numeric(10, 2)},
+            conditions=[Product.__table__.c.status != ProductStatus.SOLD],
+        )
+
+        conflicts = {product_id for product_id, _, _ in rows} - updated
+        if conflicts:
+            logger.warning(f"[BulkPricing] {len(conflicts)} products modified concurrently, skipped")
+        return updated, conflicts
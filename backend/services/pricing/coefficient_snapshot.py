@@ -0,0 +1,149 @@
+"""
+Pricing Coefficient Snapshot
+
+Process-wide, immutable snapshot of the pricing coefficients stored in the
+reference tables (conditions, origins, decades, trends, unique features,
+fits). A price calculation reads the snapshot instead of running six
+full-table SELECTs, so it is pure CPU once the snapshot is loaded.
+
+The snapshot is rebuilt when:
+- invalidate_pricing_coefficients() is called (admin reload endpoint,
+  AdminAttributeService writes, ReferenceCatalogListener NOTIFY on a
+  coefficient table)
+- COEFFICIENTS_TTL_SECONDS elapses (edits made by migrations/SQL/other processes)
+
+version is a process-local number, incremented only when a rebuild finds
+different coefficients (a TTL reload of unchanged data keeps the version).
+
+Shared by PricingService (api/pricing) and scripts/price_comparison_analysis.py.
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models.public.condition import Condition
+from models.public.decade import Decade
+from models.public.fit import Fit
+from models.public.origin import Origin
+from models.public.trend import Trend
+from models.public.unique_feature import UniqueFeature
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+COEFFICIENTS_TTL_SECONDS = 300
+
+
+@dataclass(frozen=True)
+class PricingCoefficients:
+    """Immutable coefficient tables (read-only mappings)."""
+
+    version: int
+    condition: Mapping[int, Decimal]  # note (0-10) -> coefficient
+    origin: Mapping[str, Decimal]  # name_en -> pricing_coefficient
+    decade: Mapping[str, Decimal]
+    trend: Mapping[str, Decimal]
+    feature: Mapping[str, Decimal]
+    fit: Mapping[str, Decimal]
+
+    def same_content(self, other: "PricingCoefficients") -> bool:
+        return (
+            self.condition == other.condition
+            and self.origin == other.origin
+            and self.decade == other.decade
+            and self.trend == other.trend
+            and self.feature == other.feature
+            and self.fit == other.fit
+        )
+
+
+_snapshot: Optional[PricingCoefficients] = None
+_loaded_at = 0.0
+_version = 0
+_lock = threading.Lock()
+
+
+def load_pricing_coefficients(db: Session, version: int = 0) -> PricingCoefficients:
+    """Read all coefficient tables (6 queries) into a new snapshot."""
+
+    def by_name(model) -> Mapping[str, Decimal]:
+        rows = db.execute(select(model.name_en, model.pricing_coefficient)).all()
+        return MappingProxyType({name: coef for name, coef in rows})
+
+    conditions = db.execute(select(Condition.note, Condition.coefficient)).all()
+
+    snapshot = PricingCoefficients(
+        version=version,
+        condition=MappingProxyType(
+            {note: coef for note, coef in conditions if coef is not None}
+        ),
+        origin=by_name(Origin),
+        decade=by_name(Decade),
+        trend=by_name(Trend),
+        feature=by_name(UniqueFeature),
+        fit=by_name(Fit),
+    )
+
+    logger.debug(
+        f"[PricingCoefficients] Loaded: "
+        f"{len(snapshot.condition)} conditions, "
+        f"{len(snapshot.origin)} origins, "
+        f"{len(snapshot.decade)} decades, "
+        f"{len(snapshot.trend)} trends, "
+        f"{len(snapshot.feature)} features, "
+        f"{len(snapshot.fit)} fits"
+    )
+    return snapshot
+
+
+def get_pricing_coefficients(db: Session) -> PricingCoefficients:
+    """Return the shared snapshot, (re)loading it if missing or expired."""
+    global _snapshot, _loaded_at, _version
+
+    with _lock:
+        if _snapshot is not None and time.monotonic() - _loaded_at < COEFFICIENTS_TTL_SECONDS:
+            return _snapshot
+        previous = _snapshot
+
+    loaded = load_pricing_coefficients(db)
+
+    with _lock:
+        current = _snapshot if _snapshot is not None else previous
+        if current is not None and current.same_content(loaded):
+            snapshot = current
+        else:
+            _version += 1
+            snapshot = PricingCoefficients(
+                version=_version,
+                condition=loaded.condition,
+                origin=loaded.origin,
+                decade=loaded.decade,
+                trend=loaded.trend,
+                feature=loaded.feature,
+                fit=loaded.fit,
+            )
+            logger.info(f"[PricingCoefficients] Snapshot version {_version}")
+        _snapshot = snapshot
+        _loaded_at = time.monotonic()
+
+    return snapshot
+
+
+def invalidate_pricing_coefficients() -> None:
+    """Force a reload on next use (the version changes only if data changed)."""
+    global _loaded_at
+
+    with _lock:
+        _loaded_at = 0.0
+
+    logger.info("[PricingCoefficients] Invalidated")
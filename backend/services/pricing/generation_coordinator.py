@@ -0,0 +1,207 @@
+"""
+Pricing Generation Coordinator
+
+Single-flight generation of BrandGroup/Model pricing data: for a given key
+(brand + group [+ model]) at most ONE LLM generation runs at a time, across
+concurrent requests and across workers/processes.
+
+- In-process: the first request (leader) generates; concurrent requests for
+  the same key await the leader's result instead of calling the LLM.
+- Cross-process: the leader takes a Postgres transaction-level advisory lock
+  (pg_try_advisory_xact_lock) on the key. Other workers poll the table until
+  the row appears or the lock is free, then re-check before generating.
+  The lock is released when the leader's transaction ends (commit/rollback).
+- Negative cache: fallback results (LLM failure, invalid response) are kept
+  in memory for pricing_generation_negative_ttl_seconds, so a failing brand
+  does not hammer the LLM. Fallbacks are not persisted: once the TTL expires,
+  the next request retries the generation. Exceptions are NOT cached: the
+  generation service turns every LLM failure into a fallback, so what still
+  raises is a save/DB/network error, which the next request may not hit.
+
+If the lock cannot be obtained within pricing_generation_lock_timeout_seconds
+the request generates anyway; the unique constraints of brand_groups/models
+still prevent duplicate rows.
+
+Author: Claude
+Date: 2026-02-04
+Updated: 2026-02-04 - Negative cache limited to fallbacks, fresh error per waiter
+"""
+
+import asyncio
+import hashlib
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from shared.config import settings
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Delay between two checks while another worker holds the key lock
+LOCK_POLL_SECONDS = 0.25
+
+
+@dataclass(frozen=True)
+class GenerationOutcome:
+    """Result of a generation: persisted row or transient fallback."""
+
+    value: Any
+    persisted: bool
+
+
+def advisory_lock_id(key: tuple[str, ...]) -> int:
+    """Stable signed 64-bit advisory lock id of a generation key."""
+    digest = hashlib.sha256("\0".join(("pricing", *key)).encode()).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+def _fresh_error(error: Exception) -> Exception:
+    """Copy of an exception (same type, args and attributes, no traceback)."""
+    # __init__ is skipped: pricing errors take (brand, group, reason), not their message
+    fresh = type(error).__new__(type(error))
+    fresh.args = error.args
+    fresh.__dict__.update(error.__dict__)
+    return fresh
+
+
+class PricingGenerationCoordinator:
+    """Single-flight + negative cache for pricing data generation."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # key -> (expires_at, fallback value)
+        self._negative: dict[tuple[str, ...], tuple[float, Any]] = {}
+        # asyncio futures are bound to one event loop: one in-flight map per loop
+        self._inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def get_or_generate(
+        self,
+        db: Session,
+        key: tuple[str, ...],
+        fetch: Callable[[], Optional[Any]],
+        generate: Callable[[], Awaitable[GenerationOutcome]],
+    ) -> Any:
+        """
+        Return the existing row, a recent fallback, or generate once.
+
+        Args:
+            db: Session of the caller (used for the advisory lock)
+            key: Generation key, e.g. ("brand_group", brand, group)
+            fetch: Looks the row up in the caller's session (None if missing)
+            generate: Generates the data; persists and commits it unless it
+                is a fallback (GenerationOutcome.persisted=False)
+
+        Returns:
+            Row from the caller's session, or the (transient) fallback object
+
+        Raises:
+            Whatever generate raised (a copy of it for concurrent waiters)
+        """
+        negative = self._get_negative(key)
+        if negative is not None:
+            logger.info(f"[PricingGeneration] Negative cache hit for {key}")
+            return negative
+
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.setdefault(loop, {})
+
+        leader = inflight.get(key)
+        if leader is not None:
+            logger.info(f"[PricingGeneration] Waiting for in-flight generation of {key}")
+            try:
+                outcome = await asyncio.shield(leader)
+            except Exception as e:
+                # Each waiter raises its own instance (own traceback/context)
+                raise _fresh_error(e) from e
+            if not outcome.persisted:
+                return outcome.value
+            found = fetch()
+            if found is not None:
+                return found
+
+        future = loop.create_future()
+        inflight[key] = future
+        try:
+            outcome = await self._lead(db, key, fetch, generate)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Retrieved: no "never retrieved" warning without waiters
+            raise
+        else:
+            if not outcome.persisted:
+                self._set_negative(key, outcome.value)
+            future.set_result(outcome)
+            return outcome.value
+        finally:
+            if inflight.get(key) is future:
+                del inflight[key]
+
+    async def _lead(
+        self,
+        db: Session,
+        key: tuple[str, ...],
+        fetch: Callable[[], Optional[Any]],
+        generate: Callable[[], Awaitable[GenerationOutcome]],
+    ) -> GenerationOutcome:
+        lock_id = advisory_lock_id(key)
+        deadline = time.monotonic() + settings.pricing_generation_lock_timeout_seconds
+
+        while not db.execute(
+            text("SELECT pg_try_advisory_xact_lock(:lock_id)"), {"lock_id": lock_id}
+        ).scalar():
+            await asyncio.sleep(LOCK_POLL_SECONDS)
+            found = fetch()
+            if found is not None:
+                # Generated by another worker
+                return GenerationOutcome(found, persisted=True)
+            if time.monotonic() >= deadline:
+                logger.warning(
+                    f"[PricingGeneration] Lock wait timeout for {key}, generating anyway"
+                )
+                break
+
+        # Re-check under the lock: another worker may have just committed
+        found = fetch()
+        if found is not None:
+            db.commit()  # Release the advisory lock
+            return GenerationOutcome(found, persisted=True)
+
+        outcome = await generate()
+        if not outcome.persisted:
+            db.commit()  # Release the advisory lock (nothing to save)
+        return outcome
+
+    def _get_negative(self, key: tuple[str, ...]) -> Optional[Any]:
+        with self._lock:
+            entry = self._negative.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._negative[key]
+                return None
+            return value
+
+    def _set_negative(self, key: tuple[str, ...], value: Any) -> None:
+        ttl = settings.pricing_generation_negative_ttl_seconds
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._negative[key] = (time.monotonic() + ttl, value)
+
+    def clear(self) -> None:
+        """Drop the negative cache (tests, admin edits of pricing data)."""
+        with self._lock:
+            self._negative.clear()
+
+
+# Global instance
+pricing_generation_coordinator = PricingGenerationCoordinator()
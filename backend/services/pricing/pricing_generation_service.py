@@ -7,7 +7,9 @@ Handles BrandGroup and Model data generation with validation and fallback logic.
 Business Rules:
 - Generate BrandGroup: base_price (5-500€), condition_sensitivity (0.5-1.5)
 - Generate Model: coefficient (0.5-3.0), expected_features list
-- Graceful degradation: use fallback values on LLM failure
+- Graceful degradation: use fallback values on LLM failure (including a
+  saturated Gemini limiter or a call timeout)
+- Non-blocking: Gemini async API through shared.gemini_client
 - No external database calls: service generates, repository saves
 """
 
@@ -22,8 +24,8 @@ from google.genai import types
 
 from models.public.brand_group import BrandGroup
 from models.product_attributes.model import Model
-from shared.config import settings
 from shared.exceptions import AIGenerationError
+from shared.gemini_client import generate_content, get_gemini_client
 from shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -66,19 +68,17 @@ class PricingGenerationService:
         logger.info(f"Generating BrandGroup for {brand} + {group}")
 
         try:
-            # Initialize Gemini client with timeout
-            client = genai.Client(
-                api_key=settings.gemini_api_key,
-                http_options=types.HttpOptions(timeout=settings.gemini_timeout_seconds * 1000),
-            )
+            # Process-wide Gemini client (async API + concurrency limiter)
+            client = get_gemini_client()
 
             # Build prompt
             prompt = PricingGenerationService._build_brand_group_prompt(brand, group)
 
             # Call Gemini API with structured output
-            response = client.models.generate_content(
+            response = await generate_content(
                 model="gemini-3-flash-preview",  # Latest flash model
                 contents=[prompt],
+                client=client,
                 config=types.GenerateContentConfig(
                     response_mime_type="application/json",
                     temperature=0.7,  # Balanced creativity for pricing
@@ -355,6 +355,7 @@ Generate realistic secondhand pricing data:"""
             expected_decades=[],  # No expectations = no decade adjustments
             expected_trends=[],  # No expectations = no trend adjustments
             condition_sensitivity=Decimal("1.0"),  # Standard sensitivity
+            generated_by_ai=False,
         )
 
     # ===== MODEL GENERATION =====
@@ -381,11 +382,8 @@ Generate realistic secondhand pricing data:"""
         logger.info(f"Generating Model for {brand} + {group} + {model}")
 
         try:
-            # Initialize Gemini client with timeout
-            client = genai.Client(
-                api_key=settings.gemini_api_key,
-                http_options=types.HttpOptions(timeout=settings.gemini_timeout_seconds * 1000),
-            )
+            # Process-wide Gemini client (async API + concurrency limiter)
+            client = get_gemini_client()
 
             # Build prompt with base_price context
             prompt = PricingGenerationService._build_model_prompt(
@@ -393,9 +391,10 @@ Generate realistic secondhand pricing data:"""
             )
 
             # Call Gemini API with structured output
-            response = client.models.generate_content(
+            response = await generate_content(
                 model="gemini-3-flash-preview",  # Latest flash model
                 contents=[prompt],
+                client=client,
                 config=types.GenerateContentConfig(
                     response_mime_type="application/json",
                     temperature=0.7,  # Balanced creativity for pricing
@@ -613,4 +612,5 @@ Generate realistic model pricing data:"""
             name=model,
             coefficient=Decimal("1.0"),  # Standard multiplier (no premium/discount)
             expected_features=[],  # No expectations = no feature adjustments
+            generated_by_ai=False,  # Marks a fallback (not saved by PricingService)
         )
@@ -7,10 +7,12 @@ Handles data fetching/generation, applies adjustments, and returns detailed brea
 Architecture:
 - Service layer orchestrating repositories, generation, and calculators
 - Fetch-or-generate pattern for BrandGroup and Model data
+  (single-flight per key, fallbacks cached briefly, see generation_coordinator)
 - Clean separation: data fetching → calculation → output
 - Error handling with graceful fallbacks
 
 Updated 2026-01-22: All coefficients now loaded from database.
+Updated 2026-02-04: Coefficients read from a process-wide snapshot.
 Formula: PRICE = BASE_PRICE × MODEL_COEFF × CONDITION_MULT × (1 + ADJUSTMENTS)
 
 Created: 2026-01-12
@@ -20,16 +22,10 @@ Author: Claude
 from decimal import Decimal, InvalidOperation
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from models.public.brand_group import BrandGroup
-from models.public.condition import Condition
-from models.public.decade import Decade
-from models.public.origin import Origin
-from models.public.fit import Fit
-from models.public.trend import Trend
-from models.public.unique_feature import UniqueFeature
 from models.product_attributes.model import Model
 from repositories.brand_group_repository import BrandGroupRepository
 from repositories.model_repository import ModelRepository
@@ -47,8 +43,17 @@ from services.pricing.adjustment_calculators import (
     calculateFitAdjustment,
     calculateModelCoefficient,
     calculateOriginAdjustment,
+    calculatePriceLevels,
     calculateTrendAdjustment,
 )
+from services.pricing.coefficient_snapshot import (
+    PricingCoefficients,
+    get_pricing_coefficients,
+)
+from services.pricing.generation_coordinator import (
+    GenerationOutcome,
+    pricing_generation_coordinator,
+)
 from services.pricing.group_determination import determine_group
 from services.pricing.pricing_generation_service import PricingGenerationService
 from shared.exceptions import (
@@ -95,79 +100,17 @@ class PricingService:
         self.model_repo = model_repo
         self.generation_service = generation_service
 
-    def _load_pricing_coefficients(self) -> dict[str, dict[str, Decimal]]:
+    def _load_pricing_coefficients(self) -> PricingCoefficients:
         """
-        Load pricing coefficients from database tables.
-
-        Fetches coefficients from:
-        - product_attributes.conditions (condition_coefficients by note)
-        - product_attributes.origins (origin_coefficients)
-        - product_attributes.decades (decade_coefficients)
-        - product_attributes.trends (trend_coefficients)
-        - product_attributes.unique_features (feature_coefficients)
+        Return the process-wide pricing coefficient snapshot.
 
-        Returns:
-            dict with keys:
-            - condition_coefficients: Dict[int, Decimal] mapping note to coefficient
-            - origin_coefficients: Dict[str, Decimal] mapping origin name to coefficient
-            - decade_coefficients: Dict[str, Decimal] mapping decade name to coefficient
-            - trend_coefficients: Dict[str, Decimal] mapping trend name to coefficient
-            - feature_coefficients: Dict[str, Decimal] mapping feature name to coefficient
+        Coefficients come from product_attributes.conditions (by note),
+        origins, decades, trends, unique_features and fits. The snapshot is
+        shared by all PricingService instances and reloaded on invalidation
+        or TTL (see services/pricing/coefficient_snapshot.py), so a price
+        calculation runs no coefficient query.
         """
-        # Load condition coefficients (by note 0-10)
-        conditions = self.db.execute(select(Condition)).scalars().all()
-        condition_coefficients = {
-            c.note: c.coefficient for c in conditions if c.coefficient is not None
-        }
-
-        # Load origin coefficients
-        origins = self.db.execute(select(Origin)).scalars().all()
-        origin_coefficients = {
-            o.name_en: o.pricing_coefficient for o in origins
-        }
-
-        # Load decade coefficients
-        decades = self.db.execute(select(Decade)).scalars().all()
-        decade_coefficients = {
-            d.name_en: d.pricing_coefficient for d in decades
-        }
-
-        # Load trend coefficients
-        trends = self.db.execute(select(Trend)).scalars().all()
-        trend_coefficients = {
-            t.name_en: t.pricing_coefficient for t in trends
-        }
-
-        # Load feature coefficients
-        features = self.db.execute(select(UniqueFeature)).scalars().all()
-        feature_coefficients = {
-            f.name_en: f.pricing_coefficient for f in features
-        }
-
-        # Load fit coefficients
-        fits = self.db.execute(select(Fit)).scalars().all()
-        fit_coefficients = {
-            f.name_en: f.pricing_coefficient for f in fits
-        }
-
-        logger.debug(
-            f"[PricingService] Loaded pricing coefficients: "
-            f"{len(condition_coefficients)} conditions, "
-            f"{len(origin_coefficients)} origins, "
-            f"{len(decade_coefficients)} decades, "
-            f"{len(trend_coefficients)} trends, "
-            f"{len(feature_coefficients)} features, "
-            f"{len(fit_coefficients)} fits"
-        )
-
-        return {
-            "condition_coefficients": condition_coefficients,
-            "origin_coefficients": origin_coefficients,
-            "decade_coefficients": decade_coefficients,
-            "trend_coefficients": trend_coefficients,
-            "feature_coefficients": feature_coefficients,
-            "fit_coefficients": fit_coefficients,
-        }
+        return get_pricing_coefficients(self.db)
 
     @staticmethod
     def _build_single_detail(
@@ -238,6 +181,97 @@ class PricingService:
             expected_coef=expected_coef,
         )
 
+    async def _generate_brand_group(self, brand: str, group: str) -> GenerationOutcome:
+        """
+        Generate a BrandGroup and save it (fallback values are not saved).
+
+        Raises:
+            BrandGroupGenerationError: If generation or save fails
+        """
+        try:
+            result = await self.generation_service.generate_brand_group(brand, group)
+            if result.is_fallback:
+                logger.warning(
+                    f"[PricingService] BrandGroup fallback for {brand} + {group} (not saved)"
+                )
+                return GenerationOutcome(result.brand_group, persisted=False)
+
+            # Save to DB (extract BrandGroup from GenerationResult)
+            brand_group = self.brand_group_repo.create(self.db, result.brand_group)
+            self.db.commit()
+            logger.info(
+                f"[PricingService] BrandGroup generated and saved: "
+                f"{brand} + {group}, base_price={brand_group.base_price}"
+            )
+            return GenerationOutcome(brand_group, persisted=True)
+        except IntegrityError:
+            # Saved meanwhile by another worker (lock wait timeout)
+            self.db.rollback()
+            existing = self.brand_group_repo.get_by_brand_and_group(self.db, brand, group)
+            if existing is None:
+                raise BrandGroupGenerationError(brand, group, "concurrent insert conflict")
+            return GenerationOutcome(existing, persisted=True)
+        except Exception as e:
+            self.db.rollback()
+            logger.error(
+                f"[PricingService] Failed to generate BrandGroup: {e}",
+                exc_info=True,
+                extra={
+                    "brand": brand,
+                    "group": group
+                }
+            )
+            raise BrandGroupGenerationError(brand, group, str(e)) from e
+
+    async def _generate_model(
+        self, brand: str, group: str, model_name: str, base_price: Decimal
+    ) -> GenerationOutcome:
+        """
+        Generate a Model and save it (fallback values are not saved).
+
+        Raises:
+            ModelGenerationError: If generation or save fails
+        """
+        try:
+            model = await self.generation_service.generate_model(
+                brand, group, model_name, base_price
+            )
+            if not model.generated_by_ai:
+                logger.warning(
+                    f"[PricingService] Model fallback for {brand} + {group} + {model_name} (not saved)"
+                )
+                return GenerationOutcome(model, persisted=False)
+
+            # Save to DB
+            model = self.model_repo.create(self.db, model)
+            self.db.commit()
+            logger.info(
+                f"[PricingService] Model generated and saved: "
+                f"{brand} + {group} + {model_name}, coefficient={model.coefficient}"
+            )
+            return GenerationOutcome(model, persisted=True)
+        except IntegrityError:
+            # Saved meanwhile by another worker (lock wait timeout)
+            self.db.rollback()
+            existing = self.model_repo.get_by_brand_group_and_name(
+                self.db, brand, group, model_name
+            )
+            if existing is None:
+                raise ModelGenerationError(brand, group, model_name, "concurrent insert conflict")
+            return GenerationOutcome(existing, persisted=True)
+        except Exception as e:
+            self.db.rollback()
+            logger.error(
+                f"[PricingService] Failed to generate Model: {e}",
+                exc_info=True,
+                extra={
+                    "brand": brand,
+                    "group": group,
+                    "model": model_name
+                }
+            )
+            raise ModelGenerationError(brand, group, model_name, str(e)) from e
+
     async def fetch_or_generate_pricing_data(
         self,
         brand: str,
@@ -252,6 +286,10 @@ class PricingService:
         1. Determine group from category and materials
         2. Fetch BrandGroup from DB, generate if missing
         3. If model_name provided: fetch Model from DB, generate if missing
+
+        Generation is single-flight per key (concurrent requests and workers
+        wait for the first one). LLM fallbacks are returned but not saved,
+        and are reused for a short time (negative cache).
         4. Return pricing data with base_price and model_coeff
 
         Args:
@@ -292,35 +330,19 @@ class PricingService:
             f"brand={brand}, group={group}, model_name={model_name}"
         )
 
-        # Step 2: Fetch or generate BrandGroup
+        # Step 2: Fetch or generate BrandGroup (single-flight per brand + group)
         brand_group = self.brand_group_repo.get_by_brand_and_group(self.db, brand, group)
 
         if brand_group is None:
             logger.info(
                 f"[PricingService] BrandGroup not found for {brand} + {group}, generating..."
             )
-            try:
-                result = await self.generation_service.generate_brand_group(
-                    brand, group
-                )
-                # Save to DB (extract BrandGroup from GenerationResult)
-                brand_group = self.brand_group_repo.create(self.db, result.brand_group)
-                self.db.commit()
-                logger.info(
-                    f"[PricingService] BrandGroup generated and saved: "
-                    f"{brand} + {group}, base_price={brand_group.base_price}"
-                )
-            except Exception as e:
-                self.db.rollback()
-                logger.error(
-                    f"[PricingService] Failed to generate BrandGroup: {e}",
-                    exc_info=True,
-                    extra={
-                        "brand": brand,
-                        "group": group
-                    }
-                )
-                raise BrandGroupGenerationError(brand, group, str(e)) from e
+            brand_group = await pricing_generation_coordinator.get_or_generate(
+                self.db,
+                ("brand_group", brand, group),
+                fetch=lambda: self.brand_group_repo.get_by_brand_and_group(self.db, brand, group),
+                generate=lambda: self._generate_brand_group(brand, group),
+            )
 
         # Extract base_price
         base_price = brand_group.base_price
@@ -329,7 +351,13 @@ class PricingService:
         model = None
         model_coeff = Decimal("1.0")  # Default coefficient if no model
 
-        if model_name:
+        if model_name and brand_group.id is None:
+            # Fallback BrandGroup (not saved): a Model row could not reference it,
+            # and the LLM is failing for this brand anyway
+            logger.info(
+                f"[PricingService] Skipping Model {model_name}: BrandGroup {brand} + {group} is a fallback"
+            )
+        elif model_name:
             model = self.model_repo.get_by_brand_group_and_name(
                 self.db, brand, group, model_name
             )
@@ -338,29 +366,14 @@ class PricingService:
                 logger.info(
                     f"[PricingService] Model not found for {brand} + {group} + {model_name}, generating..."
                 )
-                try:
-                    model = await self.generation_service.generate_model(
-                        brand, group, model_name, base_price
-                    )
-                    # Save to DB
-                    model = self.model_repo.create(self.db, model)
-                    self.db.commit()
-                    logger.info(
-                        f"[PricingService] Model generated and saved: "
-                        f"{brand} + {group} + {model_name}, coefficient={model.coefficient}"
-                    )
-                except Exception as e:
-                    self.db.rollback()
-                    logger.error(
-                        f"[PricingService] Failed to generate Model: {e}",
-                        exc_info=True,
-                        extra={
-                            "brand": brand,
-                            "group": group,
-                            "model": model_name
-                        }
-                    )
-                    raise ModelGenerationError(brand, group, model_name, str(e)) from e
+                model = await pricing_generation_coordinator.get_or_generate(
+                    self.db,
+                    ("model", brand, group, model_name),
+                    fetch=lambda: self.model_repo.get_by_brand_group_and_name(
+                        self.db, brand, group, model_name
+                    ),
+                    generate=lambda: self._generate_model(brand, group, model_name, base_price),
+                )
 
             # Extract coefficient
             model_coeff = model.coefficient
@@ -428,13 +441,13 @@ class PricingService:
             else:
                 model_coeff = Decimal("1.0")
 
-            # Step 3: Load pricing coefficients from database
+            # Step 3: Pricing coefficients (shared in-memory snapshot)
             coefficients = self._load_pricing_coefficients()
 
             # Step 4: Calculate condition multiplier and all adjustments
             try:
                 # Get condition coefficient from DB (based on condition_score as note)
-                condition_coefficient = coefficients["condition_coefficients"].get(
+                condition_coefficient = coefficients.condition.get(
                     input_data.condition_score, Decimal("1.0")
                 )
                 condition_mult = calculateConditionMultiplier(condition_coefficient)
@@ -443,19 +456,19 @@ class PricingService:
                 origin_adj = calculateOriginAdjustment(
                     input_data.actual_origin,
                     input_data.expected_origins or brand_group.expected_origins,
-                    coefficients["origin_coefficients"],
+                    coefficients.origin,
                 )
 
                 decade_adj = calculateDecadeAdjustment(
                     input_data.actual_decade,
                     input_data.expected_decades or brand_group.expected_decades,
-                    coefficients["decade_coefficients"],
+                    coefficients.decade,
                 )
 
                 trend_adj = calculateTrendAdjustment(
                     input_data.actual_trends,
                     input_data.expected_trends or brand_group.expected_trends,
-                    coefficients["trend_coefficients"],
+                    coefficients.trend,
                 )
 
                 # For feature adjustment, use expected_features from Model if input is empty
@@ -466,14 +479,14 @@ class PricingService:
                 feature_adj = calculateFeatureAdjustment(
                     input_data.actual_features,
                     expected_features,
-                    coefficients["feature_coefficients"],
+                    coefficients.feature,
                 )
 
                 # Calculate fit adjustment
                 fit_adj = calculateFitAdjustment(
                     input_data.actual_fit,
                     input_data.expected_fits or [],
-                    coefficients["fit_coefficients"],
+                    coefficients.fit,
                 )
             except (ValueError, KeyError, InvalidOperation) as e:
                 logger.error(
@@ -491,12 +504,11 @@ class PricingService:
             # PRICE = BASE_PRICE × MODEL_COEFF × CONDITION_MULT × (1 + ADJUSTMENTS)
             try:
                 total_adjustment = origin_adj + decade_adj + trend_adj + feature_adj + fit_adj
-                adjusted_price = base_price * model_coeff * condition_mult * (1 + total_adjustment)
 
                 # Step 6: Calculate 3 price levels with quantization
-                quick_price = (adjusted_price * Decimal("0.75")).quantize(Decimal("0.01"))
-                standard_price = adjusted_price.quantize(Decimal("0.01"))
-                premium_price = (adjusted_price * Decimal("1.30")).quantize(Decimal("0.01"))
+                quick_price, standard_price, premium_price = calculatePriceLevels(
+                    base_price, model_coeff, condition_mult, total_adjustment
+                )
             except (InvalidOperation, OverflowError) as e:
                 logger.error(
                     f"[PricingService] Price calculation failed: {e}",
@@ -523,27 +535,27 @@ class PricingService:
             origin_detail = self._build_single_detail(
                 input_data.actual_origin,
                 input_data.expected_origins or brand_group.expected_origins,
-                coefficients["origin_coefficients"],
+                coefficients.origin,
             )
             decade_detail = self._build_single_detail(
                 input_data.actual_decade,
                 input_data.expected_decades or brand_group.expected_decades,
-                coefficients["decade_coefficients"],
+                coefficients.decade,
             )
             trend_detail = self._build_list_detail(
                 input_data.actual_trends,
                 input_data.expected_trends or brand_group.expected_trends,
-                coefficients["trend_coefficients"],
+                coefficients.trend,
             )
             feature_detail = self._build_list_detail(
                 input_data.actual_features,
                 expected_features,
-                coefficients["feature_coefficients"],
+                coefficients.feature,
             )
             fit_detail = self._build_single_detail(
                 input_data.actual_fit,
                 input_data.expected_fits or [],
-                coefficients["fit_coefficients"],
+                coefficients.fit,
             )
 
             # Step 8: Build output
@@ -0,0 +1,264 @@
+"""
+Product Export Service
+
+Streams a tenant's catalog as CSV or NDJSON with flat memory use, whatever
+the catalog size:
+
+1. One SELECT over products LEFT JOIN vinted_products / ebay_products, with
+   colors, materials, condition supplements and image URLs aggregated per
+   product (correlated subqueries: one row per product, no ORM objects)
+2. Server-side cursor (yield_per): rows are fetched EXPORT_YIELD_PER at a time
+3. Rows serialized incrementally, EXPORT_FLUSH_ROWS per yielded chunk,
+   optionally gzip-compressed on the fly
+
+CSV columns: product identifiers, the fiche technique lines
+(FICHE_TECHNIQUE_COLUMNS, same values as build_fiche_technique), images
+and marketplace links. NDJSON lines carry the same keys, lists kept as
+JSON arrays.
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Iterable, Iterator, Optional
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session
+
+from models.user.ebay_product import EbayProduct
+from models.user.product import Product, ProductStatus
+from models.user.product_attributes_m2m import (
+    ProductColor,
+    ProductConditionSup,
+    ProductMaterial,
+)
+from models.user.product_image import ProductImage
+from models.user.vinted_product import VintedProduct
+from services.description_builders import FICHE_TECHNIQUE_COLUMNS, ProductFields
+
+# Rows fetched per round trip of the server-side cursor
+EXPORT_YIELD_PER = 1000
+
+# Rows serialized per yielded chunk
+EXPORT_FLUSH_ROWS = 500
+
+# Export columns: (record key, CSV header)
+EXPORT_COLUMNS = (
+    ("id", "ID"),
+    ("status", "Statut"),
+    ("title", "Titre"),
+    ("price", "Prix"),
+    ("stock_quantity", "Stock"),
+    *FICHE_TECHNIQUE_COLUMNS,
+    ("size_original", "Taille étiquette"),
+    ("description", "Description"),
+    ("images", "Images"),
+    ("vinted_id", "Vinted ID"),
+    ("vinted_status", "Vinted statut"),
+    ("vinted_url", "Vinted URL"),
+    ("ebay_listing_id", "eBay listing ID"),
+    ("ebay_marketplace", "eBay marketplace"),
+    ("ebay_status", "eBay statut"),
+    ("created_at", "Créé le"),
+    ("updated_at", "Modifié le"),
+)
+
+# Separator of list values in CSV cells
+CSV_LIST_SEPARATOR = " | "
+
+
+def _aggregate(value_column, product_column, *order_by) -> Any:
+    """Correlated array_agg(value ORDER BY ...) of a product's child rows."""
+    return (
+        select(func.array_agg(aggregate_order_by(value_column, *order_by)))
+        .where(product_column == Product.id)
+        .scalar_subquery()
+    )
+
+
+class ProductExportService:
+    """Streaming catalog export (CSV / NDJSON)."""
+
+    @staticmethod
+    def build_query(
+        status: Optional[ProductStatus] = None,
+        category: Optional[str] = None,
+        brand: Optional[str] = None,
+    ) -> Select:
+        """
+        Export query: one row per non-deleted product, ordered by id.
+
+        Row labels match the attributes read by ProductFields (colors,
+        material, condition_sup...), so a row renders like a Product.
+        """
+        colors = _aggregate(
+            ProductColor.color, ProductColor.product_id,
+            ProductColor.is_primary.desc(), ProductColor.color,
+        )
+        materials = _aggregate(
+            ProductMaterial.material, ProductMaterial.product_id,
+            ProductMaterial.percentage.desc().nulls_last(), ProductMaterial.material,
+        )
+        condition_sups = _aggregate(
+            ProductConditionSup.condition_sup, ProductConditionSup.product_id,
+            ProductConditionSup.condition_sup,
+        )
+        images = (
+            select(func.array_agg(aggregate_order_by(ProductImage.url, ProductImage.order)))
+            .where(ProductImage.product_id == Product.id, ProductImage.is_label.is_(False))
+            .scalar_subquery()
+        )
+
+        stmt = (
+            select(
+                Product.id, Product.status, Product.title, Product.description,
+                Product.price, Product.stock_quantity,
+                Product.brand, Product.model, Product.category, Product.gender,
+                Product.size_normalized, Product.size_original, Product.fit,
+                Product.rise, Product.length, Product.sleeve_length, Product.neckline,
+                Product.closure, Product.pattern, Product.trend, Product.season,
+                Product.sport, Product.lining, Product.stretch, Product.unique_feature,
+                Product.marking, Product.decade, Product.origin, Product.location,
+                Product.condition,
+                Product.dim1, Product.dim2, Product.dim3,
+                Product.dim4, Product.dim5, Product.dim6,
+                Product.created_at, Product.updated_at,
+                colors.label("colors"),
+                materials.label("materials"),
+                condition_sups.label("condition_sup"),
+                images.label("images"),
+                VintedProduct.vinted_id, VintedProduct.status.label("vinted_status"),
+                VintedProduct.url.label("vinted_url"),
+                EbayProduct.ebay_listing_id, EbayProduct.marketplace_id.label("ebay_marketplace"),
+                EbayProduct.status.label("ebay_status"),
+            )
+            .outerjoin(VintedProduct, VintedProduct.product_id == Product.id)
+            .outerjoin(EbayProduct, EbayProduct.product_id == Product.id)
+            .where(Product.deleted_at.is_(None))
+            .order_by(Product.id)
+        )
+        if status:
+            stmt = stmt.where(Product.status == status)
+        if category:
+            stmt = stmt.where(Product.category == category)
+        if brand:
+            stmt = stmt.where(Product.brand == brand)
+        return stmt
+
+    @staticmethod
+    def iter_records(
+        db: Session,
+        stmt: Select,
+        yield_per: int = EXPORT_YIELD_PER,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Export records, read through a server-side cursor.
+
+        yield_per implies stream_results: only one batch of rows is held in
+        memory at a time.
+        """
+        result = db.execute(stmt, execution_options={"yield_per": yield_per})
+        for row in result:
+            yield ProductExportService.record(row)
+
+    @staticmethod
+    def record(row: Any) -> dict[str, Any]:
+        """
+        Export record of a row: fiche technique values + raw columns.
+
+        Materials are exported joined (all of them, not only the first).
+        """
+        materials = row.materials or []
+        fields = ProductFields(row)
+        fields["material"] = ", ".join(materials)
+
+        record = {
+            "id": row.id,
+            "status": row.status.value if isinstance(row.status, ProductStatus) else row.status,
+            "title": row.title,
+            "price": row.price,
+            "stock_quantity": row.stock_quantity,
+        }
+        for key, _ in FICHE_TECHNIQUE_COLUMNS:
+            record[key] = fields[key]
+        record.update(
+            size_original=row.size_original,
+            description=row.description,
+            images=row.images or [],
+            vinted_id=row.vinted_id,
+            vinted_status=row.vinted_status,
+            vinted_url=row.vinted_url,
+            ebay_listing_id=row.ebay_listing_id,
+            ebay_marketplace=row.ebay_marketplace,
+            ebay_status=row.ebay_status,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
+        return record
+
+    @staticmethod
+    def iter_csv(records: Iterable[dict[str, Any]]) -> Iterator[str]:
+        """CSV chunks: header line, then EXPORT_FLUSH_ROWS rows per chunk."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow([header for _, header in EXPORT_COLUMNS])
+
+        pending = 0
+        for record in records:
+            writer.writerow([_csv_value(record[key]) for key, _ in EXPORT_COLUMNS])
+            pending += 1
+            if pending >= EXPORT_FLUSH_ROWS:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                pending = 0
+        yield buffer.getvalue()
+
+    @staticmethod
+    def iter_ndjson(records: Iterable[dict[str, Any]]) -> Iterator[str]:
+        """NDJSON chunks: one JSON object per line, EXPORT_FLUSH_ROWS lines per chunk."""
+        lines = []
+        for record in records:
+            lines.append(json.dumps(record, ensure_ascii=False, default=_json_default))
+            if len(lines) >= EXPORT_FLUSH_ROWS:
+                yield "\n".join(lines) + "\n"
+                lines = []
+        if lines:
+            yield "\n".join(lines) + "\n"
+
+    @staticmethod
+    def gzip_chunks(chunks: Iterable[str]) -> Iterator[bytes]:
+        """Compress text chunks into one gzip stream, chunk by chunk."""
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for chunk in chunks:
+            compressed = compressor.compress(chunk.encode("utf-8"))
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+
+def _csv_value(value: Any) -> Any:
+    """CSV cell: lists joined, datetimes ISO, None as empty."""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return CSV_LIST_SEPARATOR.join(str(item) for item in value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    """JSON encoding of Decimal prices and timestamps."""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Not JSON serializable: {type(value).__name__}")
@@ -37,7 +37,7 @@ class ProductImageService:
         product_id: int,
         image_url: str,
         display_order: int | None = None,
-        **kwargs  # NEW: mime_type, file_size, width, height, alt_text, tags, is_label
+        **kwargs  # NEW: mime_type, file_size, width, height, variants, alt_text, tags, is_label
     ) -> dict:
         """
         Add an image to a product.
@@ -53,7 +53,7 @@ class ProductImageService:
             product_id: Product ID
             image_url: Image URL (CDN)
             display_order: Display order (auto if None)
-            **kwargs: Optional metadata (mime_type, file_size, width, height, alt_text, tags, is_label)
+            **kwargs: Optional metadata (mime_type, file_size, width, height, variants, alt_text, tags, is_label)
 
         Returns:
             dict: Created image (compatible with old JSONB format for API)
@@ -306,6 +306,9 @@ def _image_to_dict(image: ProductImage) -> dict:
         "file_size": image.file_size,
         "width": image.width,
         "height": image.height,
+        "variants": image.variants,
+        "thumbnail_url": image.thumbnail_url,
+        "medium_url": image.medium_url,
         "created_at": image.created_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
         "updated_at": image.updated_at.strftime("%Y-%m-%dT%H:%M:%SZ"),
     }
@@ -0,0 +1,665 @@
+"""
+Product Import Service
+
+Bulk catalog import (CSV / NDJSON) in a constant number of statements,
+instead of one ProductService.create_product() (and one flush per color,
+material and condition supplement) per product:
+
+1. Parsing: the file is read as a stream, row-local rules applied in Python
+   (size adjusted from dim1/dim6, size_length extracted, lists cleaned)
+2. Staging: rows are streamed with COPY FROM STDIN into a temporary table
+   (all columns text, so COPY never rejects a row)
+3. Validation: set-based UPDATEs on the staging table flag each row with its
+   errors: required fields, formats, lengths, HTML, and every reference
+   attribute (brand, category, colors...) checked and normalized
+   case-insensitively against the product_attributes tables
+4. Pricing: valid rows without price are priced with BulkPricingService
+5. Insert: one INSERT ... SELECT for the products, one per M2M table
+
+Same rules as ProductService.create_product() (ProductCreate constraints,
+DRAFT status, auto-created sizes_original, first color primary), except:
+- reference values are matched case-insensitively (all attributes, not only
+  brand) and stored with the catalog spelling
+- a product without price and without pricing group is rejected (no LLM
+  generation, like BulkPricingService)
+
+Invalid rows are skipped and reported (row number + errors); valid rows are
+imported. The caller commits.
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+import csv
+import io
+import json
+import time
+from dataclasses import dataclass, field
+from typing import IO, Any, Iterator, Optional
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    Numeric,
+    Table,
+    Text,
+    cast,
+    column,
+    exists,
+    func,
+    insert,
+    literal,
+    select,
+    true,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.orm import Session
+
+from models.public.brand import Brand
+from models.public.category import Category
+from models.public.closure import Closure
+from models.public.color import Color
+from models.public.condition import Condition
+from models.public.condition_sup import ConditionSup
+from models.public.decade import Decade
+from models.public.fit import Fit
+from models.public.gender import Gender
+from models.public.length import Length
+from models.public.lining import Lining
+from models.public.material import Material
+from models.public.neckline import Neckline
+from models.public.origin import Origin
+from models.public.pattern import Pattern
+from models.public.rise import Rise
+from models.public.season import Season
+from models.public.size_length import SizeLength
+from models.public.size_normalized import SizeNormalized
+from models.public.size_original import SizeOriginal
+from models.public.sleeve_length import SleeveLength
+from models.public.sport import Sport
+from models.public.stretch import Stretch
+from models.public.trend import Trend
+from models.user.product import Product, ProductStatus
+from models.user.product_attributes_m2m import (
+    ProductColor,
+    ProductConditionSup,
+    ProductMaterial,
+)
+from repositories.product_repository import BULK_UPDATE_CHUNK_SIZE
+from repositories.size_original_repository import SizeOriginalRepository
+from services.pricing.bulk_pricing import BulkPricingItem, BulkPricingService
+from services.product_utils import ProductUtils
+from services.size_resolution_service import SizeResolutionService
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+# Separator of list values (colors, materials, condition_sups, unique_feature)
+LIST_SEPARATOR = "|"
+
+# Max row errors returned in the report (all are counted)
+MAX_REPORTED_ERRORS = 1000
+
+# Scalar reference attributes: product column -> catalog column
+REFERENCE_COLUMNS = {
+    "brand": Brand.name,
+    "category": Category.name_en,
+    "size_normalized": SizeNormalized.name_en,
+    "size_length": SizeLength.name_en,
+    "fit": Fit.name_en,
+    "gender": Gender.name_en,
+    "season": Season.name_en,
+    "sport": Sport.name_en,
+    "neckline": Neckline.name_en,
+    "length": Length.name_en,
+    "pattern": Pattern.name_en,
+    "rise": Rise.name_en,
+    "closure": Closure.name_en,
+    "sleeve_length": SleeveLength.name_en,
+    "origin": Origin.name_en,
+    "decade": Decade.name_en,
+    "trend": Trend.name_en,
+    "stretch": Stretch.name_en,
+    "lining": Lining.name_en,
+}
+
+# M2M attributes: list column -> (catalog column, M2M table, value column, max items)
+LIST_COLUMNS = {
+    "colors": (Color.name_en, ProductColor.__table__, "color", 5),
+    "materials": (Material.name_en, ProductMaterial.__table__, "material", 3),
+    "condition_sups": (ConditionSup.name_en, ProductConditionSup.__table__, "condition_sup", 10),
+}
+
+# Accepted columns (CSV header / NDJSON keys)
+IMPORT_COLUMNS = (
+    "title", "description", "price", "category", "condition", "brand", "model",
+    *(name for name in REFERENCE_COLUMNS if name not in ("brand", "category")),
+    "size_original", "location", "marking", "unique_feature",
+    "dim1", "dim2", "dim3", "dim4", "dim5", "dim6", "stock_quantity",
+    *LIST_COLUMNS,
+)
+
+# ProductCreate constraints
+REQUIRED_COLUMNS = ("title", "description", "category", "condition", "location")
+MAX_LENGTHS = {"title": 500, "description": 5000, "model": 100, "location": 100, "marking": 500}
+NO_HTML_COLUMNS = ("title", "description", "unique_feature", *LIST_COLUMNS)
+INTEGER_COLUMNS = ("condition", "dim1", "dim2", "dim3", "dim4", "dim5", "dim6", "stock_quantity")
+
+_PRICE_PATTERN = r"^[0-9]{1,8}(\.[0-9]{1,2})?$"
+_INTEGER_PATTERN = r"^[0-9]{1,6}$"
+
+# Staging tables (session-local temporary tables, no tenant schema)
+_staging_metadata = MetaData()
+
+_STAGING = Table(
+    "product_import_staging",
+    _staging_metadata,
+    Column("line", Integer, primary_key=True),
+    *(Column(name, Text) for name in IMPORT_COLUMNS),
+    Column("product_id", Integer),
+    Column("error", Text),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+_ITEMS = Table(
+    "product_import_items",
+    _staging_metadata,
+    Column("line", Integer, nullable=False),
+    Column("kind", Text, nullable=False),
+    Column("position", Integer, nullable=False),
+    Column("value", Text, nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
+
+
+@dataclass
+class ProductImportError:
+    """Errors of one rejected row (row 1 = first data row)."""
+
+    row: int
+    error: str
+
+
+@dataclass
+class ProductImportReport:
+    """Result of an import."""
+
+    total: int = 0
+    imported: int = 0
+    failed: int = 0
+    priced: int = 0  # Imported without price, priced by BulkPricingService
+    ignored_columns: list[str] = field(default_factory=list)
+    errors: list[ProductImportError] = field(default_factory=list)
+    elapsed_ms: float = 0.0
+
+
+class _CopyBuffer:
+    """Read-only file over the staging rows, consumed by COPY FROM STDIN."""
+
+    def __init__(self, rows: Iterator[list[Any]]):
+        self._rows = rows
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+        self._done = False
+
+    def read(self, size: int = -1) -> str:
+        while not self._done and (size < 0 or self._buffer.tell() < size):
+            row = next(self._rows, None)
+            if row is None:
+                self._done = True
+            else:
+                self._writer.writerow(row)
+        data = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data
+
+
+def _list_value(value: Any) -> Optional[str]:
+    """List cell (array or "a | b" string): trimmed items, empty ones dropped."""
+    if value is None:
+        return None
+    items = value if isinstance(value, list) else str(value).split(LIST_SEPARATOR)
+    items = [str(item).strip() for item in items if item is not None and str(item).strip()]
+    return LIST_SEPARATOR.join(items) or None
+
+
+def _scalar_value(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def _exact_match(catalog_column, value) -> Any:
+    """
+    EXISTS (catalog row spelled exactly like value).
+
+    On an alias of the catalog table: the UPDATE ... FROM <catalog> of the
+    normalization would otherwise correlate it away.
+    """
+    catalog = catalog_column.table.alias()
+    return exists().where(catalog.c[catalog_column.name] == value)
+
+
+def _flag(condition, message) -> Any:
+    """UPDATE appending message to the error of the staging rows matching condition."""
+    return (
+        update(_STAGING)
+        .where(condition)
+        .values(error=func.concat_ws("; ", _STAGING.c.error, message))
+    )
+
+
+class ProductImportService:
+    """COPY-staged, set-based bulk import of products."""
+
+    @staticmethod
+    def parse_rows(
+        stream: IO[bytes],
+        import_format: str,
+        report: ProductImportReport,
+    ) -> Iterator[list[Any]]:
+        """
+        Stream the staging rows of a file: [line, *IMPORT_COLUMNS values].
+
+        Unparseable rows are added to report.errors, unknown columns to
+        report.ignored_columns. Row-local create_product rules are applied
+        here (size from dim1/dim6, size_length of bottoms, lists cleaned).
+        """
+        text_stream = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        if import_format == "csv":
+            reader = csv.DictReader(text_stream)
+            report.ignored_columns = [
+                name for name in (reader.fieldnames or []) if name not in IMPORT_COLUMNS
+            ]
+            records = ((line, record, None) for line, record in enumerate(reader, start=1))
+        else:
+            records = ProductImportService._ndjson_records(text_stream, report)
+
+        for line, record, error in records:
+            report.total += 1
+            if error:
+                report.errors.append(ProductImportError(row=line, error=error))
+                continue
+            yield [line, *ProductImportService._staging_values(record)]
+
+    @staticmethod
+    def _ndjson_records(text_stream: IO[str], report: ProductImportReport) -> Iterator[tuple]:
+        ignored: dict[str, None] = {}
+        line = 0
+        for raw in text_stream:
+            if not raw.strip():
+                continue
+            line += 1
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                yield line, None, "Invalid JSON"
+                continue
+            if not isinstance(record, dict):
+                yield line, None, "JSON object expected"
+                continue
+            ignored.update(dict.fromkeys(key for key in record if key not in IMPORT_COLUMNS))
+            yield line, record, None
+        report.ignored_columns = list(ignored)
+
+    @staticmethod
+    def _staging_values(record: dict[str, Any]) -> list[Optional[str]]:
+        """Staging values of a record, in IMPORT_COLUMNS order."""
+        row = {name: _scalar_value(record.get(name)) for name in IMPORT_COLUMNS}
+        for name in LIST_COLUMNS:
+            row[name] = _list_value(record.get(name))
+
+        features = _list_value(record.get("unique_feature"))
+        row["unique_feature"] = (
+            json.dumps(features.split(LIST_SEPARATOR), ensure_ascii=False) if features else None
+        )
+
+        # ProductService.create_product: size from measures, length of bottoms
+        dim1 = (row["dim1"] or "").strip() or None
+        dim6 = (row["dim6"] or "").strip() or None
+        size_original = ProductUtils.adjust_size((row["size_original"] or "").strip() or None, dim1, dim6)
+        if size_original:
+            row["size_original"] = SizeOriginalRepository.normalize_name(size_original)
+        if not (row["size_length"] or "").strip():
+            row["size_length"] = SizeResolutionService.extract_length_from_existing(
+                row["size_normalized"], row["size_original"], row["category"]
+            )
+        return [row[name] for name in IMPORT_COLUMNS]
+
+    @staticmethod
+    def import_stream(
+        db: Session,
+        stream: IO[bytes],
+        import_format: str = "csv",
+        max_new_products: Optional[int] = None,
+    ) -> ProductImportReport:
+        """
+        Import a CSV / NDJSON file into the tenant's products.
+
+        Args:
+            db: Session with the user schema configured (not committed)
+            stream: Binary file (UTF-8). CSV: header with IMPORT_COLUMNS names,
+                lists separated by "|". NDJSON: one object per line, lists as
+                arrays or "|"-separated strings.
+            import_format: "csv" or "ndjson"
+            max_new_products: Subscription quota left (None = no limit): valid
+                rows beyond it are rejected
+
+        Returns:
+            ProductImportReport (errors sorted by row, first MAX_REPORTED_ERRORS)
+        """
+        if import_format not in IMPORT_FORMATS:
+            raise ValueError(f"Unknown import format: {import_format}")
+
+        start = time.perf_counter()
+        report = ProductImportReport()
+        # Created in the caller's transaction: a rollback drops them too
+        _staging_metadata.create_all(db.connection())
+
+        ProductImportService._copy(db, ProductImportService.parse_rows(stream, import_format, report))
+        ProductImportService._validate(db)
+        report.priced = ProductImportService._price_missing(db)
+        if max_new_products is not None:
+            ProductImportService._apply_quota(db, max_new_products)
+        report.imported = ProductImportService._insert(db)
+        ProductImportService._collect_errors(db, report)
+
+        _staging_metadata.drop_all(db.connection())
+
+        report.failed = report.total - report.imported
+        report.elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
+        logger.info(
+            f"[ProductImport] {report.imported}/{report.total} products imported, "
+            f"{report.failed} rejected, {report.priced} priced, {report.elapsed_ms}ms"
+        )
+        return report
+
+    @staticmethod
+    def _copy(db: Session, rows: Iterator[list[Any]]) -> None:
+        """Stream the rows into the staging table (COPY FROM STDIN, CSV)."""
+        columns = ", ".join(["line", *IMPORT_COLUMNS])
+        cursor = db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {_STAGING.name} ({columns}) FROM STDIN WITH (FORMAT csv)",
+                _CopyBuffer(rows),
+            )
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _validate(db: Session) -> None:
+        """Flag invalid staging rows and normalize reference values (set-based)."""
+        s = _STAGING.c
+        statements = [
+            # Blank cells are missing values
+            update(_STAGING).values({
+                name: func.nullif(func.btrim(s[name]), "") for name in IMPORT_COLUMNS
+            }),
+        ]
+
+        for name in REQUIRED_COLUMNS:
+            statements.append(_flag(s[name].is_(None), f"{name} is required"))
+        for name, max_length in MAX_LENGTHS.items():
+            statements.append(_flag(
+                func.char_length(s[name]) > max_length, f"{name} exceeds {max_length} characters"
+            ))
+        for name in NO_HTML_COLUMNS:
+            statements.append(_flag(s[name].regexp_match("[<>]"), f"{name}: HTML tags are not allowed"))
+
+        # Malformed numbers are flagged then cleared, so later casts are safe
+        numeric_patterns = [("price", _PRICE_PATTERN), *((n, _INTEGER_PATTERN) for n in INTEGER_COLUMNS)]
+        for name, pattern in numeric_patterns:
+            invalid = s[name].isnot(None) & ~s[name].regexp_match(pattern)
+            statements.append(
+                _flag(invalid, func.concat(f"Invalid {name}: ", s[name])).values({name: None})
+            )
+        statements.append(_flag(cast(s.price, Numeric) <= 0, "price must be positive"))
+        statements.append(_flag(
+            s.condition.isnot(None)
+            & ~exists().where(Condition.note == cast(s.condition, Integer)),
+            func.concat("Invalid condition: ", s.condition),
+        ))
+
+        for name, catalog_column in REFERENCE_COLUMNS.items():
+            statements.extend(ProductImportService._reference_checks(s[name], catalog_column, name))
+
+        # sizes_original is auto-created: only reuse the catalog spelling
+        statements.append(
+            update(_STAGING)
+            .where(
+                func.upper(SizeOriginal.name) == func.upper(s.size_original),
+                SizeOriginal.name != s.size_original,
+            )
+            .values(size_original=SizeOriginal.name)
+        )
+
+        statements.extend(ProductImportService._list_checks())
+
+        for statement in statements:
+            db.execute(statement)
+
+    @staticmethod
+    def _reference_checks(value, catalog_column, name: str) -> list:
+        """Normalize value to the catalog spelling, then flag unknown values."""
+        exact = _exact_match(catalog_column, value)
+        return [
+            update(_STAGING)
+            .where(func.lower(catalog_column) == func.lower(value), catalog_column != value, ~exact)
+            .values({value.name: catalog_column}),
+            _flag(value.isnot(None) & ~exact, func.concat(f"Invalid {name}: ", value)),
+        ]
+
+    @staticmethod
+    def _list_checks() -> list:
+        """Explode the lists into the items table, normalize and check them."""
+        s, i = _STAGING.c, _ITEMS.c
+        statements = []
+        for kind, (catalog_column, _, _, max_items) in LIST_COLUMNS.items():
+            items = (
+                func.unnest(func.string_to_array(s[kind], LIST_SEPARATOR))
+                .table_valued("value", with_ordinality="position")
+                .render_derived()
+            )
+            statements.append(
+                insert(_ITEMS).from_select(
+                    ["line", "kind", "position", "value"],
+                    select(s.line, literal(kind), items.c.position, items.c.value)
+                    .select_from(_STAGING)
+                    .join(items, true())
+                    .where(s[kind].isnot(None)),
+                )
+            )
+
+            exact = _exact_match(catalog_column, i.value)
+            statements.append(
+                update(_ITEMS)
+                .where(
+                    i.kind == kind,
+                    func.lower(catalog_column) == func.lower(i.value),
+                    catalog_column != i.value,
+                    ~exact,
+                )
+                .values(value=catalog_column)
+            )
+
+            line_items = select(_ITEMS).where(i.line == s.line, i.kind == kind)
+            invalid = (
+                select(func.string_agg(i.value, ", "))
+                .where(i.line == s.line, i.kind == kind, ~exact)
+                .scalar_subquery()
+            )
+            statements.append(_flag(
+                exists(line_items.where(~exact)), func.concat(f"Invalid {kind}: ", invalid)
+            ))
+            statements.append(_flag(
+                select(func.count()).where(i.line == s.line, i.kind == kind).scalar_subquery() > max_items,
+                f"Too many {kind} (max {max_items})",
+            ))
+            statements.append(_flag(
+                select(func.count() - func.count(i.value.distinct()))
+                .where(i.line == s.line, i.kind == kind)
+                .scalar_subquery() > 0,
+                f"Duplicate {kind} are not allowed",
+            ))
+        return statements
+
+    @staticmethod
+    def _price_missing(db: Session) -> int:
+        """
+        Price the valid rows without price (BulkPricingService, standard level).
+
+        Rows without pricing group (or brand) are rejected, like
+        ProductCreate without price when the price cannot be computed.
+        """
+        s, i = _STAGING.c, _ITEMS.c
+        materials = (
+            select(func.array_agg(i.value))
+            .where(i.line == s.line, i.kind == "materials")
+            .scalar_subquery()
+        )
+        rows = db.execute(
+            select(
+                s.line, s.brand, s.category, s.model, s.condition, s.origin, s.decade,
+                s.trend, s.fit, s.unique_feature, materials.label("materials"),
+            ).where(s.error.is_(None), s.price.is_(None), s.brand.isnot(None))
+        ).all()
+
+        prices = []
+        if rows:
+            items = [
+                BulkPricingItem(
+                    product_id=row.line,
+                    brand=row.brand,
+                    category=row.category,
+                    materials=tuple(row.materials or ()),
+                    model_name=row.model,
+                    condition=int(row.condition),
+                    origin=row.origin,
+                    decade=row.decade,
+                    trend=row.trend,
+                    unique_features=tuple(json.loads(row.unique_feature) if row.unique_feature else ()),
+                    fit=row.fit,
+                )
+                for row in rows
+            ]
+            prices = [
+                (result.item.product_id, str(result.standard_price))
+                for result in BulkPricingService.price_items(db, items)
+                if result.status == "OK" and result.standard_price
+            ]
+
+        for start in range(0, len(prices), BULK_UPDATE_CHUNK_SIZE):
+            new_prices = values(
+                column("line", Integer), column("price", Text), name="new_prices"
+            ).data(prices[start:start + BULK_UPDATE_CHUNK_SIZE])
+            db.execute(
+                update(_STAGING).where(s.line == new_prices.c.line).values(price=new_prices.c.price)
+            )
+
+        db.execute(_flag(
+            s.error.is_(None) & s.price.is_(None),
+            "price is required (no pricing group for this brand/category)",
+        ))
+        return len(prices)
+
+    @staticmethod
+    def _apply_quota(db: Session, max_new_products: int) -> None:
+        """Reject the valid rows beyond the subscription quota (by row order)."""
+        s = _STAGING.c
+        first_over = (
+            select(s.line)
+            .where(s.error.is_(None))
+            .order_by(s.line)
+            .offset(max(max_new_products, 0))
+            .limit(1)
+            .scalar_subquery()
+        )
+        db.execute(_flag(
+            s.error.is_(None) & (s.line >= first_over), "Product limit reached"
+        ))
+
+    @staticmethod
+    def _insert(db: Session) -> int:
+        """Insert the valid rows: sizes_original, products, then M2M rows."""
+        s, i = _STAGING.c, _ITEMS.c
+        valid = s.error.is_(None)
+
+        db.execute(
+            pg_insert(SizeOriginal.__table__)
+            .from_select(
+                ["name", "created_at"],
+                select(s.size_original, func.now())
+                .where(valid, s.size_original.isnot(None))
+                .distinct(),
+            )
+            .on_conflict_do_nothing()
+        )
+
+        products = Product.__table__
+        columns = {
+            "title": s.title,
+            "description": s.description,
+            "price": cast(s.price, Numeric(10, 2)),
+            "condition": cast(s.condition, Integer),
+            "unique_feature": cast(s.unique_feature, JSONB),
+            "stock_quantity": func.coalesce(cast(s.stock_quantity, Integer), 1),
+            "status": literal(ProductStatus.DRAFT, products.c.status.type),
+            "version_number": literal(1),
+            **{f"dim{n}": cast(s[f"dim{n}"], Integer) for n in range(1, 7)},
+        }
+        for name in (*REFERENCE_COLUMNS, "size_original", "model", "location", "marking"):
+            columns[name] = s[name]
+
+        # Ids are assigned in ORDER BY order: sorted ids match sorted lines
+        product_ids = db.execute(
+            insert(products)
+            .from_select(list(columns), select(*columns.values()).where(valid).order_by(s.line))
+            .returning(products.c.id)
+        ).scalars().all()
+        lines = db.execute(select(s.line).where(valid).order_by(s.line)).scalars().all()
+        assignments = list(zip(lines, sorted(product_ids)))
+
+        for start in range(0, len(assignments), BULK_UPDATE_CHUNK_SIZE):
+            new_ids = values(
+                column("line", Integer), column("id", Integer), name="new_ids"
+            ).data(assignments[start:start + BULK_UPDATE_CHUNK_SIZE])
+            db.execute(update(_STAGING).where(s.line == new_ids.c.line).values(product_id=new_ids.c.id))
+
+        for kind, (_, m2m_table, value_column, _) in LIST_COLUMNS.items():
+            item_columns = {"product_id": s.product_id, value_column: i.value}
+            if kind == "colors":
+                item_columns["is_primary"] = i.position == 1  # First color = primary
+            db.execute(
+                insert(m2m_table).from_select(
+                    list(item_columns),
+                    select(*item_columns.values())
+                    .join_from(_ITEMS, _STAGING, i.line == s.line)
+                    .where(valid, i.kind == kind),
+                )
+            )
+
+        return len(product_ids)
+
+    @staticmethod
+    def _collect_errors(db: Session, report: ProductImportReport) -> None:
+        """Merge the staging errors with the parsing errors (sorted by row)."""
+        s = _STAGING.c
+        rows = db.execute(
+            select(s.line, s.error)
+            .where(s.error.isnot(None))
+            .order_by(s.line)
+            .limit(MAX_REPORTED_ERRORS)
+        ).all()
+        errors = report.errors + [ProductImportError(row=row.line, error=row.error) for row in rows]
+        report.errors = sorted(errors, key=lambda e: e.row)[:MAX_REPORTED_ERRORS]
@@ -0,0 +1,199 @@
+"""
+Product List Projection
+
+Read side of the product list / grid (GET /products/grid).
+
+ProductRepository.list() loads full Product objects with five selectinload
+relationships (images, colors, materials, Vinted, eBay) then serializes them
+through ProductResponse: 6 queries and the ORM objects of every relationship
+per page. The list only renders a dozen columns, so those are kept denormalized in
+the tenant table product_list_items (ProductListItem), one row per
+non-deleted product:
+
+- maintained by PostgreSQL statement-level triggers on the source tables,
+  which call public.refresh_product_list_items(schema, product_ids)
+  (migration product_list_items_001): always consistent with the products,
+  whatever wrote them (API, bulk import, workers, SQL)
+- read with one Core SELECT (+ count) on indexed columns, rows returned as
+  plain named tuples (no identity map, no relationship loading)
+
+LIKE ... INCLUDING ALL does not copy triggers: schemas created after the
+migration get them with install_triggers() (UserSchemaService).
+
+The latency of both paths has not been measured yet: compare them with
+scripts/benchmark_product_list.py (optionally on 50k seeded products)
+before switching the frontend list to the grid endpoint.
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+from typing import Optional
+
+from sqlalchemy import Row, and_, func, or_, select, text
+from sqlalchemy.orm import Session
+
+from models.user.product import ProductStatus
+from models.user.product_list_item import ProductListItem
+from shared.database import get_tenant_schema
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Source tables -> column holding the product ID (trigger argument)
+PROJECTION_SOURCES = {
+    "products": "id",
+    "product_images": "product_id",
+    "product_colors": "product_id",
+    "product_materials": "product_id",
+    "vinted_products": "product_id",
+    "ebay_products": "product_id",
+}
+
+# (trigger name suffix, event, REFERENCING clause)
+TRIGGER_EVENTS = [
+    ("ins", "INSERT", "REFERENCING NEW TABLE AS new_rows"),
+    ("upd", "UPDATE", "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows"),
+    ("del", "DELETE", "REFERENCING OLD TABLE AS old_rows"),
+]
+
+_items = ProductListItem.__table__
+
+
+class ProductListProjection:
+    """Queries and maintenance of the product_list_items projection."""
+
+    @staticmethod
+    def list_items(
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        status: Optional[ProductStatus] = None,
+        category: Optional[str] = None,
+        brand: Optional[str] = None,
+        search: Optional[str] = None,
+    ) -> tuple[list[Row], int]:
+        """
+        List projection rows with the filters of ProductRepository.list().
+
+        Business Rules:
+        - Only non-deleted products (deleted ones are not in the projection)
+        - Sort: created_at DESC (newest first), product_id DESC as tie-breaker
+        - Search: title or brand (ILIKE), or product ID if numeric
+
+        Args:
+            db: SQLAlchemy Session (tenant schema configured)
+            skip: Number of rows to skip (pagination)
+            limit: Max number of rows
+            status: Filter by status (optional)
+            category: Filter by category (optional)
+            brand: Filter by brand (optional)
+            search: Search by ID, title or brand (optional)
+
+        Returns:
+            Tuple (list of rows, total count)
+        """
+        conditions = []
+
+        if status:
+            conditions.append(_items.c.status == status)
+        if category:
+            conditions.append(_items.c.category == category)
+        if brand:
+            conditions.append(_items.c.brand == brand)
+
+        if search:
+            search_term = search.strip()
+            search_conditions = [
+                _items.c.title.ilike(f"%{search_term}%"),
+                _items.c.brand.ilike(f"%{search_term}%"),
+            ]
+            if search_term.isdigit():
+                search_conditions.append(_items.c.product_id == int(search_term))
+            conditions.append(or_(*search_conditions))
+
+        count_stmt = select(func.count()).select_from(_items)
+        stmt = select(_items)
+        if conditions:
+            count_stmt = count_stmt.where(and_(*conditions))
+            stmt = stmt.where(and_(*conditions))
+
+        total = db.execute(count_stmt).scalar_one() or 0
+        if total == 0:
+            return [], 0
+
+        stmt = (
+            stmt.order_by(_items.c.created_at.desc(), _items.c.product_id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(db.execute(stmt).all()), total
+
+    @staticmethod
+    def install_triggers(db: Session, schema: str) -> None:
+        """
+        Install the projection triggers on the source tables of a schema.
+
+        Idempotent (triggers dropped then recreated). Tables missing from the
+        schema are skipped. The caller commits.
+
+        Args:
+            db: SQLAlchemy Session
+            schema: Tenant schema (user_X)
+        """
+        existing = set(db.execute(
+            text(
+                "SELECT table_name FROM information_schema.tables "
+                "WHERE table_schema = :schema AND table_name = ANY(:tables)"
+            ),
+            {"schema": schema, "tables": list(PROJECTION_SOURCES)},
+        ).scalars())
+
+        for table, id_column in PROJECTION_SOURCES.items():
+            if table not in existing:
+                logger.warning(f"[ProductListProjection] {schema}.{table} not found, no trigger")
+                continue
+            for suffix, event, referencing in TRIGGER_EVENTS:
+                db.execute(text(
+                    f'DROP TRIGGER IF EXISTS trg_product_list_items_{suffix} ON "{schema}".{table}'
+                ))
+                db.execute(text(
+                    f"CREATE TRIGGER trg_product_list_items_{suffix} "
+                    f'AFTER {event} ON "{schema}".{table} {referencing} '
+                    f"FOR EACH STATEMENT EXECUTE FUNCTION public.product_list_items_trigger('{id_column}')"
+                ))
+
+    @staticmethod
+    def rebuild(db: Session, product_ids: Optional[list[int]] = None) -> None:
+        """
+        Recompute projection rows from the source tables.
+
+        Not needed in normal operation (triggers); for repairs, e.g. after a
+        restore or a write made with triggers disabled. The caller commits.
+
+        Args:
+            db: SQLAlchemy Session (tenant schema configured)
+            product_ids: Products to recompute (None = all products)
+
+        Raises:
+            ValueError: If the session has no tenant schema
+        """
+        schema = get_tenant_schema(db)
+        if not schema:
+            raise ValueError("Session has no tenant schema (schema_translate_map)")
+
+        if product_ids is None:
+            # Projected IDs included so that orphan rows are removed
+            db.execute(
+                text(
+                    "SELECT public.refresh_product_list_items(:schema, ARRAY("
+                    f'SELECT id FROM "{schema}".products '
+                    f'UNION SELECT product_id FROM "{schema}".product_list_items))'
+                ),
+                {"schema": schema},
+            )
+        elif product_ids:
+            db.execute(
+                text("SELECT public.refresh_product_list_items(:schema, CAST(:ids AS integer[]))"),
+                {"schema": schema, "ids": list(product_ids)},
+            )
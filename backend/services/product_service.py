@@ -16,12 +16,16 @@ Refactored: 2026-01-06
 - Extracted image operations to ProductImageService
 - Extracted status management to ProductStatusManager
 - Migrated DB operations to ProductRepository
+
+Updated: 2026-02-04 - Diff-based M2M updates, bulk_update (ProductRepository.bulk_update_versioned)
+Updated: 2026-02-04 - bulk_update: publication checked on the updated values,
+    SOLD/out-of-stock errors for rows rejected by the UPDATE
 """
 
 from typing import Optional
 
-from sqlalchemy import update
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session, lazyload
 
 from models.user.product import Product, ProductStatus
 from models.user.product_attributes_m2m import (
@@ -34,7 +38,7 @@ from repositories.product_repository import ProductRepository
 from schemas.product_schemas import ProductCreate, ProductUpdate
 from services.pricing_service import PricingService
 from services.product_image_service import ProductImageService
-from services.product_status_manager import ProductStatusManager
+from services.product_status_manager import MVP_STATUSES, ProductStatusManager
 from services.product_utils import ProductUtils
 from services.size_resolution_service import SizeResolutionService
 from services.validators import AttributeValidator
@@ -45,6 +49,25 @@ from shared.timing import timed_operation
 
 logger = get_logger(__name__)
 
+# Fields that bulk_update cannot apply (per-product M2M diffs, status handled apart)
+BULK_UNSUPPORTED_FIELDS = frozenset({
+    "colors", "color", "materials", "material", "material_details",
+    "condition_sups", "condition_sup", "status",
+})
+
+
+class _UpdatedProductView:
+    """Read-only view of a product with pending field values applied."""
+
+    def __init__(self, product: Product, values: dict):
+        self._product = product
+        self._values = values
+
+    def __getattr__(self, name):
+        if name in self._values:
+            return self._values[name]
+        return getattr(self._product, name)
+
 
 class ProductService:
     """Service for product management."""
@@ -424,6 +447,11 @@ class ProductService:
             material_percentages, validated_condition_sups,
         )
         if m2m_updated:
+            if not update_dict:
+                # M2M-only edit: bump the version anyway (listing render cache is keyed on it)
+                ProductService._apply_optimistic_update(
+                    db, product_id, product.version_number, {}
+                )
             db.refresh(product)
 
         # Status change (after data update so validation uses fresh data)
@@ -471,7 +499,11 @@ class ProductService:
 
     @staticmethod
     def add_image(
-        db: Session, product_id: int, image_url: str, display_order: int | None = None
+        db: Session,
+        product_id: int,
+        image_url: str,
+        display_order: int | None = None,
+        **metadata,
     ) -> dict:
         """
         Add an image to a product. Delegates to ProductImageService.
@@ -481,11 +513,13 @@ class ProductService:
             product_id: Product ID
             image_url: Image URL (CDN)
             display_order: Display order (auto if None)
+            **metadata: Optional ProductImage metadata (mime_type, file_size,
+                        width, height, variants)
 
         Returns:
             dict: Created image {url, order, created_at}
         """
-        return ProductImageService.add_image(db, product_id, image_url, display_order)
+        return ProductImageService.add_image(db, product_id, image_url, display_order, **metadata)
 
     @staticmethod
     def delete_image(db: Session, product_id: int, image_url: str) -> bool:
@@ -557,6 +591,194 @@ class ProductService:
         """
         return ProductStatusManager.update_status(db, product_id, new_status)
 
+    # ===== BULK UPDATE (Added 2026-02-04) =====
+
+    @staticmethod
+    def bulk_update(
+        db: Session,
+        product_ids: list[int],
+        update_dict: Optional[dict] = None,
+        new_status: Optional[ProductStatus] = None,
+        expected_versions: Optional[dict[int, int]] = None,
+    ) -> tuple[set[int], dict[int, str]]:
+        """
+        Apply the same field and/or status change to N products in one UPDATE
+        (per chunk, ProductRepository.bulk_update_versioned).
+
+        Same rules as update_product / update_product_status, checked on the
+        products loaded by one SELECT:
+        - SOLD products are immutable (field changes, also checked by the UPDATE)
+        - status transitions (VALID_TRANSITIONS) and publication requirements
+        - FK attributes validated once for all products
+        - Optimistic locking: a product is updated only if its version_number
+          is still the expected one (expected_versions, default: the version
+          read), and version_number is incremented
+        - SOLD: stock set to 0 and sold_at stamped, only if stock > 0
+
+        M2M fields are not supported (per-product diffs: use update_product).
+        size_original is not adjusted from dimensions (they differ per product).
+        Does not commit.
+
+        Args:
+            db: SQLAlchemy Session
+            product_ids: Products to update
+            update_dict: Field values (ProductUpdate fields, without M2M/status)
+            new_status: Target status (optional)
+            expected_versions: product_id -> version_number seen by the client
+
+        Returns:
+            (updated product ids, error message by product id)
+
+        Raises:
+            ValueError: If nothing to update, unsupported field, invalid FK or status
+        """
+        update_dict = dict(update_dict or {})
+        expected_versions = expected_versions or {}
+
+        if not update_dict and new_status is None:
+            raise ValueError("No field or status to update")
+        unsupported = BULK_UNSUPPORTED_FIELDS.intersection(update_dict)
+        if unsupported:
+            raise ValueError(f"Fields not supported in bulk updates: {', '.join(sorted(unsupported))}")
+        if new_status is not None and new_status not in MVP_STATUSES:
+            raise ValueError(
+                f"Status {new_status} not allowed in MVP. "
+                f"Allowed: {', '.join([s.value for s in MVP_STATUSES])}"
+            )
+
+        if update_dict.get('size_original'):
+            from repositories.size_original_repository import SizeOriginalRepository
+            SizeOriginalRepository.get_or_create(db, update_dict['size_original'])
+        AttributeValidator.validate_product_attributes(db, update_dict, partial=True)
+
+        products = {
+            product.id: product
+            for product in db.execute(
+                select(Product)
+                .where(Product.id.in_(product_ids), Product.deleted_at.is_(None))
+                .options(
+                    lazyload(Product.product_colors),
+                    lazyload(Product.product_materials),
+                    lazyload(Product.product_condition_sups),
+                )
+            ).scalars()
+        }
+
+        errors: dict[int, str] = {}
+        rows = []
+        for product_id in dict.fromkeys(product_ids):
+            product = products.get(product_id)
+            try:
+                if product is None:
+                    raise ValueError(f"Product {product_id} not found")
+                ProductService._check_bulk_update(product, update_dict, new_status)
+            except ValueError as e:
+                errors[product_id] = str(e)
+                continue
+            rows.append((product_id, expected_versions.get(product_id, product.version_number)))
+
+        table = Product.__table__
+        set_values = dict(update_dict)
+        conditions = []
+        if update_dict:
+            conditions.append(table.c.status != ProductStatus.SOLD)  # SOLD is immutable
+        if new_status is not None:
+            set_values["status"] = new_status
+            if new_status == ProductStatus.SOLD:
+                set_values.update(stock_quantity=0, sold_at=func.now())
+                conditions.append(table.c.stock_quantity > 0)  # Atomic stock check
+
+        updated = ProductRepository.bulk_update_versioned(
+            db, rows, set_values=set_values, conditions=conditions
+        )
+
+        rejected = []
+        for product_id, _ in rows:
+            if product_id in updated:
+                db.expire(products[product_id])
+            else:
+                rejected.append(product_id)
+        if rejected:
+            errors.update(ProductService._bulk_rejection_errors(db, rejected, update_dict, new_status))
+
+        logger.info(
+            f"[ProductService] bulk_update: {len(updated)}/{len(product_ids)} products updated, "
+            f"fields={sorted(update_dict)}, status={new_status.value if new_status else None}"
+        )
+        return updated, errors
+
+    @staticmethod
+    def _check_bulk_update(
+        product: Product, update_dict: dict, new_status: Optional[ProductStatus]
+    ) -> None:
+        """
+        Check the update_product / update_status rules for one product.
+
+        Raises:
+            ValueError: If the product cannot receive the change
+        """
+        if update_dict and ProductStatusManager.is_immutable(product):
+            raise ValueError(
+                "Cannot modify SOLD product. Product is locked after sale. "
+                "Contact support if price/data correction needed."
+            )
+        if new_status is None or (product.status == new_status and update_dict):
+            return
+
+        if not ProductStatusManager.can_transition(product.status, new_status):
+            raise ValueError(
+                f"Invalid transition: {product.status.value} -> {new_status.value}"
+            )
+        if new_status == ProductStatus.PUBLISHED:
+            # Like update_product: validated on the data after the update
+            ProductStatusManager._validate_for_publication(
+                _UpdatedProductView(product, update_dict)
+            )
+        if new_status == ProductStatus.SOLD and not product.stock_quantity:
+            raise ValueError("Cannot mark product as SOLD: already out of stock.")
+
+    @staticmethod
+    def _bulk_rejection_errors(
+        db: Session,
+        product_ids: list[int],
+        update_dict: dict,
+        new_status: Optional[ProductStatus],
+    ) -> dict[int, str]:
+        """
+        Explain why the bulk UPDATE skipped products (one SELECT).
+
+        The UPDATE conditions are re-checked on the current rows, like
+        ProductStatusManager does after a failed atomic SOLD update: sold
+        meanwhile (immutable), out of stock, otherwise a version conflict.
+
+        Returns:
+            Error message by product id
+        """
+        table = Product.__table__
+        current = {
+            row.id: row
+            for row in db.execute(
+                select(table.c.id, table.c.status, table.c.stock_quantity)
+                .where(table.c.id.in_(product_ids))
+            )
+        }
+
+        errors = {}
+        for product_id in product_ids:
+            row = current.get(product_id)
+            if row is not None and update_dict and row.status == ProductStatus.SOLD:
+                errors[product_id] = (
+                    "Cannot modify SOLD product. Product is locked after sale. "
+                    "Contact support if price/data correction needed."
+                )
+            elif row is not None and new_status == ProductStatus.SOLD and not row.stock_quantity:
+                errors[product_id] = "Cannot mark product as SOLD: already out of stock."
+            else:
+                errors[product_id] = (
+                    f"Product {product_id} was modified by another user. Please refresh and try again."
+                )
+        return errors
+
     # ===== M2M HELPER METHODS (Added 2026-01-07) =====
 
     @staticmethod
@@ -757,13 +979,13 @@ class ProductService:
         validated_condition_sups: Optional[list],
     ) -> bool:
         """
-        Apply M2M relation updates (REPLACE strategy).
+        Apply M2M relation updates (DIFF strategy: only the delta is written).
 
         Acquires FOR UPDATE lock on the product row to prevent concurrent
         M2M modifications (Issue #23 - Business Logic Audit).
 
         Returns:
-            True if any M2M update was applied
+            True if any M2M entry was changed
         """
         has_updates = (
             validated_colors is not None
@@ -780,18 +1002,18 @@ class ProductService:
         updated = False
 
         if validated_colors is not None:
-            ProductService._replace_product_colors(db, product_id, validated_colors)
-            updated = True
+            if ProductService._replace_product_colors(db, product_id, validated_colors):
+                updated = True
 
         if validated_materials is not None:
-            ProductService._replace_product_materials(
+            if ProductService._replace_product_materials(
                 db, product_id, validated_materials, material_percentages
-            )
-            updated = True
+            ):
+                updated = True
 
         if validated_condition_sups is not None:
-            ProductService._replace_product_condition_sups(db, product_id, validated_condition_sups)
-            updated = True
+            if ProductService._replace_product_condition_sups(db, product_id, validated_condition_sups):
+                updated = True
 
         return updated
 
@@ -800,9 +1022,9 @@ class ProductService:
         db: Session,
         product_id: int,
         new_colors: list[str]
-    ) -> None:
+    ) -> bool:
         """
-        Replace all ProductColor entries for a product (REPLACE strategy).
+        Replace the ProductColor entries of a product (DIFF strategy).
 
         Args:
             db: SQLAlchemy Session
@@ -810,16 +1032,56 @@ class ProductService:
             new_colors: New list of color names (validated)
 
         Strategy:
-            - Delete all existing color entries
-            - Create new entries (first = primary)
+            - Read the current entries (1 SELECT)
+            - Delete the removed colors, insert the added ones (first = primary)
+            - Move is_primary only if the first color changed
+            - Nothing written if the list is unchanged
+
+        Returns:
+            True if any entry was changed
         """
-        # Delete existing entries
-        db.query(ProductColor).filter(ProductColor.product_id == product_id).delete()
+        current = dict(
+            db.execute(
+                select(ProductColor.color, ProductColor.is_primary)
+                .where(ProductColor.product_id == product_id)
+            ).all()
+        )
+        primary = new_colors[0] if new_colors else None
+
+        removed = [color for color in current if color not in new_colors]
+        added = [color for color in dict.fromkeys(new_colors) if color not in current]
+        # Unset the old primary before setting the new one (uq_product_colors_primary)
+        primary_changes = sorted(
+            (
+                {"product_id": product_id, "color": color, "is_primary": color == primary}
+                for color, is_primary in current.items()
+                if color in new_colors and is_primary != (color == primary)
+            ),
+            key=lambda row: row["is_primary"],
+        )
 
-        # Create new entries
-        ProductService._create_product_colors(db, product_id, new_colors)
+        if removed:
+            db.execute(
+                delete(ProductColor).where(
+                    ProductColor.product_id == product_id,
+                    ProductColor.color.in_(removed),
+                )
+            )
+        if primary_changes:
+            db.execute(update(ProductColor), primary_changes)
+        if added:
+            db.execute(
+                insert(ProductColor),
+                [
+                    {"product_id": product_id, "color": color, "is_primary": color == primary}
+                    for color in added
+                ],
+            )
 
-        logger.debug(f"[ProductService] Replaced colors for product_id={product_id}: {new_colors}")
+        changed = bool(removed or added or primary_changes)
+        if changed:
+            logger.debug(f"[ProductService] Replaced colors for product_id={product_id}: {new_colors}")
+        return changed
 
     @staticmethod
     def _replace_product_materials(
@@ -827,45 +1089,105 @@ class ProductService:
         product_id: int,
         new_materials: list[str],
         percentages: dict[str, int | None]
-    ) -> None:
+    ) -> bool:
         """
-        Replace all ProductMaterial entries for a product (REPLACE strategy).
+        Replace the ProductMaterial entries of a product (DIFF strategy).
+
+        Deletes the removed materials, inserts the added ones and updates
+        the percentages that changed (one statement each, only if needed).
 
         Args:
             db: SQLAlchemy Session
             product_id: Product ID
             new_materials: New list of material names (validated)
             percentages: Dict mapping material_name -> percentage
+
+        Returns:
+            True if any entry was changed
         """
-        # Delete existing entries
-        db.query(ProductMaterial).filter(ProductMaterial.product_id == product_id).delete()
+        current = dict(
+            db.execute(
+                select(ProductMaterial.material, ProductMaterial.percentage)
+                .where(ProductMaterial.product_id == product_id)
+            ).all()
+        )
 
-        # Create new entries
-        ProductService._create_product_materials(db, product_id, new_materials, percentages)
+        removed = [material for material in current if material not in new_materials]
+        added = [material for material in dict.fromkeys(new_materials) if material not in current]
+        changed_percentages = [
+            {"product_id": product_id, "material": material, "percentage": percentages.get(material)}
+            for material, percentage in current.items()
+            if material in new_materials and percentage != percentages.get(material)
+        ]
+
+        if removed:
+            db.execute(
+                delete(ProductMaterial).where(
+                    ProductMaterial.product_id == product_id,
+                    ProductMaterial.material.in_(removed),
+                )
+            )
+        if changed_percentages:
+            db.execute(update(ProductMaterial), changed_percentages)
+        if added:
+            db.execute(
+                insert(ProductMaterial),
+                [
+                    {"product_id": product_id, "material": material, "percentage": percentages.get(material)}
+                    for material in added
+                ],
+            )
 
-        logger.debug(f"[ProductService] Replaced materials for product_id={product_id}: {new_materials}")
+        changed = bool(removed or added or changed_percentages)
+        if changed:
+            logger.debug(f"[ProductService] Replaced materials for product_id={product_id}: {new_materials}")
+        return changed
 
     @staticmethod
     def _replace_product_condition_sups(
         db: Session,
         product_id: int,
         new_condition_sups: list[str]
-    ) -> None:
+    ) -> bool:
         """
-        Replace all ProductConditionSup entries for a product (REPLACE strategy).
+        Replace the ProductConditionSup entries of a product (DIFF strategy).
 
         Args:
             db: SQLAlchemy Session
             product_id: Product ID
             new_condition_sups: New list of condition_sup names (validated)
+
+        Returns:
+            True if any entry was changed
         """
-        # Delete existing entries
-        db.query(ProductConditionSup).filter(ProductConditionSup.product_id == product_id).delete()
+        current = set(
+            db.execute(
+                select(ProductConditionSup.condition_sup)
+                .where(ProductConditionSup.product_id == product_id)
+            ).scalars()
+        )
 
-        # Create new entries
-        ProductService._create_product_condition_sups(db, product_id, new_condition_sups)
+        removed = [name for name in current if name not in new_condition_sups]
+        added = [name for name in dict.fromkeys(new_condition_sups) if name not in current]
 
-        logger.debug(f"[ProductService] Replaced condition_sups for product_id={product_id}: {new_condition_sups}")
+        if removed:
+            db.execute(
+                delete(ProductConditionSup).where(
+                    ProductConditionSup.product_id == product_id,
+                    ProductConditionSup.condition_sup.in_(removed),
+                )
+            )
+        if added:
+            db.execute(
+                insert(ProductConditionSup),
+                [{"product_id": product_id, "condition_sup": name} for name in added],
+            )
 
+        changed = bool(removed or added)
+        if changed:
+            logger.debug(
+                f"[ProductService] Replaced condition_sups for product_id={product_id}: {new_condition_sups}"
+            )
+        return changed
 
 __all__ = ["ProductService"]
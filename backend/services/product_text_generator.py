@@ -9,7 +9,7 @@ Key features:
 - 5 description styles (Catalogue Structure, Descriptif Redige, Fiche Technique, Vendeur Pro, Visuel Emoji)
 - Intelligent handling of missing attributes (silent skip)
 - Max 80 chars for titles, 5000 chars for descriptions
-- Response time < 100ms (pure Python string formatting)
+- Response time < 100ms (precompiled templates, see services/text_templates.py)
 
 Business Rules:
 - Titles: max 80 characters (Vinted/eBay limit)
@@ -18,12 +18,15 @@ Business Rules:
 - No double spaces or orphan punctuation
 
 Updated: 2026-01-27 - Extracted description builders to description_builders.py
+Updated: 2026-02-04 - Title formats as precompiled templates, generate_all_batch()
+Updated: 2026-02-04 - TITLE_FORMAT_KEYS / DESCRIPTION_STYLE_KEYS (shared with the API)
 """
 
 from enum import IntEnum
 from typing import Any
 
 from services.description_builders import (
+    ProductFields,
     build_catalogue_structure,
     build_descriptif_redige,
     build_fiche_technique,
@@ -32,6 +35,8 @@ from services.description_builders import (
     get_condition_text,
     safe_get,
 )
+from services.listing_render_cache import listing_render_cache
+from services.text_templates import compile_lines
 from shared.logging import get_logger
 
 logger = get_logger(__name__)
@@ -57,6 +62,82 @@ class DescriptionStyle(IntEnum):
     VISUEL_EMOJI = 5
 
 
+# Response keys of the formats (generate_all)
+TITLE_FORMAT_KEYS = {
+    TitleFormat.MINIMALISTE: "minimaliste",
+    TitleFormat.STANDARD_VINTED: "standard_vinted",
+    TitleFormat.SEO_MOTS_CLES: "seo_mots_cles",
+    TitleFormat.VINTAGE_COLLECTIONNEUR: "vintage_collectionneur",
+    TitleFormat.TECHNIQUE_PROFESSIONNEL: "technique_professionnel",
+}
+DESCRIPTION_STYLE_KEYS = {
+    DescriptionStyle.CATALOGUE_STRUCTURE: "catalogue_structure",
+    DescriptionStyle.DESCRIPTIF_REDIGE: "descriptif_redige",
+    DescriptionStyle.FICHE_TECHNIQUE: "fiche_technique",
+    DescriptionStyle.VENDEUR_PRO: "vendeur_pro",
+    DescriptionStyle.VISUEL_EMOJI: "visuel_emoji",
+}
+
+# Title formats: parts joined with spaces, missing attributes skipped
+_TITLE_TEMPLATES = {
+    TitleFormat.MINIMALISTE: compile_lines([
+        ("brand", "{}"),
+        ("model", "{}"),
+        ("category", "{}"),
+        ("gender", "{}"),
+        ("size_normalized", "{}"),
+        ("colors", "{}"),
+    ]),
+    TitleFormat.STANDARD_VINTED: compile_lines([
+        ("brand", "{}"),
+        ("category", "{}"),
+        ("fit", "{}"),
+        ("material", "{}"),
+        ("colors", "{}"),
+        ("size_normalized", "{}"),
+        ("condition_text", "{}"),
+    ]),
+    TitleFormat.SEO_MOTS_CLES: compile_lines([
+        ("category", "{}"),
+        ("brand", "{}"),
+        ("gender", "{}"),
+        ("pattern", "{}"),
+        ("neckline", "{}"),
+        ("sleeve_length", "{}"),
+        ("material", "{}"),
+        ("size_normalized", "{}"),
+    ]),
+    TitleFormat.VINTAGE_COLLECTIONNEUR: compile_lines([
+        ("decade", "Vintage"),
+        ("decade", "{}"),
+        ("brand", "{}"),
+        ("category", "{}"),
+        ("origin", "{}"),
+        ("unique_feature", "{}"),
+        ("size_normalized", "{}"),
+        ("trend", "{}"),
+    ]),
+    TitleFormat.TECHNIQUE_PROFESSIONNEL: compile_lines([
+        ("brand", "{}"),
+        ("category", "{}"),
+        ("model", "{}"),
+        ("material", "{}"),
+        ("colors", "{}"),
+        ("size_normalized", "{}"),
+        ("condition_text", "{}"),
+        ("dim1", "PTP {}cm"),
+    ]),
+}
+
+_DESCRIPTION_BUILDERS = {
+    DescriptionStyle.CATALOGUE_STRUCTURE: build_catalogue_structure,
+    DescriptionStyle.DESCRIPTIF_REDIGE: build_descriptif_redige,
+    DescriptionStyle.FICHE_TECHNIQUE: build_fiche_technique,
+    DescriptionStyle.VENDEUR_PRO: build_vendeur_pro,
+    DescriptionStyle.VISUEL_EMOJI: build_visuel_emoji,
+}
+
+
 class ProductTextGeneratorService:
     """
     Service for generating SEO-optimized product titles and descriptions.
@@ -104,67 +185,8 @@ class ProductTextGeneratorService:
         Returns:
             Clean title string (max 80 chars), missing attributes silently skipped
         """
-        parts = []
-
-        if format == TitleFormat.MINIMALISTE:
-            parts = [
-                safe_get(product, "brand"),
-                safe_get(product, "model"),
-                safe_get(product, "category"),
-                safe_get(product, "gender"),
-                safe_get(product, "size_normalized"),
-                safe_get(product, "colors"),
-            ]
-
-        elif format == TitleFormat.STANDARD_VINTED:
-            parts = [
-                safe_get(product, "brand"),
-                safe_get(product, "category"),
-                safe_get(product, "fit"),
-                safe_get(product, "material"),
-                safe_get(product, "colors"),
-                safe_get(product, "size_normalized"),
-                get_condition_text(getattr(product, "condition", None)),
-            ]
-
-        elif format == TitleFormat.SEO_MOTS_CLES:
-            parts = [
-                safe_get(product, "category"),
-                safe_get(product, "brand"),
-                safe_get(product, "gender"),
-                safe_get(product, "pattern"),
-                safe_get(product, "neckline"),
-                safe_get(product, "sleeve_length"),
-                safe_get(product, "material"),
-                safe_get(product, "size_normalized"),
-            ]
-
-        elif format == TitleFormat.VINTAGE_COLLECTIONNEUR:
-            parts = [
-                "Vintage" if safe_get(product, "decade") else "",
-                safe_get(product, "decade"),
-                safe_get(product, "brand"),
-                safe_get(product, "category"),
-                safe_get(product, "origin"),
-                safe_get(product, "unique_feature"),
-                safe_get(product, "size_normalized"),
-                safe_get(product, "trend"),
-            ]
-
-        elif format == TitleFormat.TECHNIQUE_PROFESSIONNEL:
-            parts = [
-                safe_get(product, "brand"),
-                safe_get(product, "category"),
-                safe_get(product, "model"),
-                safe_get(product, "material"),
-                safe_get(product, "colors"),
-                safe_get(product, "size_normalized"),
-                get_condition_text(getattr(product, "condition", None)),
-                f"PTP {getattr(product, 'dim1', '')}cm" if getattr(product, "dim1", None) else "",
-            ]
-
-        non_empty_parts = [p for p in parts if p]
-        raw_title = " ".join(non_empty_parts)
+        template = _TITLE_TEMPLATES.get(format)
+        raw_title = template.join(ProductFields.of(product), " ") if template else ""
 
         return ProductTextGeneratorService._clean_title(raw_title)
 
@@ -182,15 +204,7 @@ class ProductTextGeneratorService:
         Returns:
             Description string (max 5000 chars), segments with missing attributes removed
         """
-        builders = {
-            DescriptionStyle.CATALOGUE_STRUCTURE: build_catalogue_structure,
-            DescriptionStyle.DESCRIPTIF_REDIGE: build_descriptif_redige,
-            DescriptionStyle.FICHE_TECHNIQUE: build_fiche_technique,
-            DescriptionStyle.VENDEUR_PRO: build_vendeur_pro,
-            DescriptionStyle.VISUEL_EMOJI: build_visuel_emoji,
-        }
-
-        builder = builders.get(style, build_catalogue_structure)
+        builder = _DESCRIPTION_BUILDERS.get(style, build_catalogue_structure)
         description = builder(product)
 
         # Clean up
@@ -211,39 +225,62 @@ class ProductTextGeneratorService:
         Returns:
             dict with "titles" and "descriptions" sub-dicts
         """
+        return listing_render_cache.get_or_render(
+            product, "stoflow", "texts",
+            lambda: ProductTextGeneratorService._render_all(product),
+        )
+
+    @staticmethod
+    def _render_all(product: Any) -> dict:
+        """Build every title and description (uncached, see generate_all)."""
         service = ProductTextGeneratorService
+        # One attribute snapshot shared by the 10 formats
+        fields = ProductFields(product)
 
         return {
             "titles": {
-                "minimaliste": service.generate_title(product, TitleFormat.MINIMALISTE),
-                "standard_vinted": service.generate_title(product, TitleFormat.STANDARD_VINTED),
-                "seo_mots_cles": service.generate_title(product, TitleFormat.SEO_MOTS_CLES),
+                "minimaliste": service.generate_title(fields, TitleFormat.MINIMALISTE),
+                "standard_vinted": service.generate_title(fields, TitleFormat.STANDARD_VINTED),
+                "seo_mots_cles": service.generate_title(fields, TitleFormat.SEO_MOTS_CLES),
                 "vintage_collectionneur": service.generate_title(
-                    product, TitleFormat.VINTAGE_COLLECTIONNEUR
+                    fields, TitleFormat.VINTAGE_COLLECTIONNEUR
                 ),
                 "technique_professionnel": service.generate_title(
-                    product, TitleFormat.TECHNIQUE_PROFESSIONNEL
+                    fields, TitleFormat.TECHNIQUE_PROFESSIONNEL
                 ),
             },
             "descriptions": {
                 "catalogue_structure": service.generate_description(
-                    product, DescriptionStyle.CATALOGUE_STRUCTURE
+                    fields, DescriptionStyle.CATALOGUE_STRUCTURE
                 ),
                 "descriptif_redige": service.generate_description(
-                    product, DescriptionStyle.DESCRIPTIF_REDIGE
+                    fields, DescriptionStyle.DESCRIPTIF_REDIGE
                 ),
                 "fiche_technique": service.generate_description(
-                    product, DescriptionStyle.FICHE_TECHNIQUE
+                    fields, DescriptionStyle.FICHE_TECHNIQUE
                 ),
                 "vendeur_pro": service.generate_description(
-                    product, DescriptionStyle.VENDEUR_PRO
+                    fields, DescriptionStyle.VENDEUR_PRO
                 ),
                 "visuel_emoji": service.generate_description(
-                    product, DescriptionStyle.VISUEL_EMOJI
+                    fields, DescriptionStyle.VISUEL_EMOJI
                 ),
             },
         }
 
+    @staticmethod
+    def generate_all_batch(products: list[Any]) -> list[dict]:
+        """
+        Generate all title formats and description styles for many products.
+
+        Bulk preview/export path: one pass over the products with the
+        precompiled templates, cached renders reused.
+
+        Returns:
+            One generate_all() dict per product, in input order
+        """
+        return [ProductTextGeneratorService.generate_all(product) for product in products]
+
     @staticmethod
     def generate_preview(attributes: dict) -> dict:
         """
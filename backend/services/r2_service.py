@@ -6,10 +6,18 @@ Service for managing file uploads to Cloudflare R2 (S3-compatible).
 Business Rules:
 - Images stored in bucket: stoflow-images
 - Path structure: {user_id}/products/{product_id}/{filename}
+- Size variants next to the original: {uuid}_{variant}.{ext} (e.g. abc_thumbnail.webp)
 - Returns public URLs for serving images via CDN
 - Fallback to local storage if R2 not configured
+
+Updated 2026-02-04:
+- boto3 calls run in a worker thread (asyncio.to_thread): uploads no longer
+  block the event loop
+- One shared client with a larger connection pool (r2_max_pool_connections),
+  so concurrent uploads reuse keep-alive connections
 """
 
+import asyncio
 import uuid
 from typing import Optional
 
@@ -52,6 +60,7 @@ class R2Service:
                 config=Config(
                     signature_version="s3v4",
                     retries={"max_attempts": 3, "mode": "adaptive"},
+                    max_pool_connections=settings.r2_max_pool_connections,
                 ),
                 region_name="auto",  # R2 uses 'auto' region
             )
@@ -86,6 +95,26 @@ class R2Service:
         unique_id = uuid.uuid4().hex
         return f"{user_id}/products/{product_id}/{unique_id}.{extension}"
 
+    def variant_object_key(self, image_url: str, variant: str, extension: str) -> Optional[str]:
+        """
+        Predictable key of a size variant, next to the original object.
+
+        Example: .../1/products/5/abc.jpeg + thumbnail/webp -> 1/products/5/abc_thumbnail.webp
+
+        Args:
+            image_url: Public URL or object key of the original image
+            variant: Variant name (thumbnail, medium)
+            extension: Variant file extension
+
+        Returns:
+            str: Object key of the variant, or None if the key can't be extracted
+        """
+        object_key = self._extract_object_key(image_url)
+        if not object_key:
+            return None
+        stem = object_key.rsplit(".", 1)[0]
+        return f"{stem}_{variant}.{extension}"
+
     async def upload_image(
         self,
         user_id: int,
@@ -115,41 +144,57 @@ class R2Service:
             return None
 
         object_key = self._generate_object_key(user_id, product_id, extension)
+        public_url = await self.upload_object(object_key, content, content_type)
+
+        logger.info(
+            f"[R2Service] Image uploaded: user_id={user_id}, "
+            f"product_id={product_id}, key={object_key}, "
+            f"size={len(content)/1024:.1f}KB"
+        )
+
+        return public_url
+
+    async def upload_object(
+        self, object_key: str, content: bytes, content_type: str = "image/jpeg"
+    ) -> str:
+        """
+        Upload bytes under a given object key (e.g. a size variant).
+
+        Args:
+            object_key: Object key in the bucket
+            content: Object bytes
+            content_type: MIME type
+
+        Returns:
+            str: Public URL of the object
+
+        Raises:
+            RuntimeError: If R2 is not available
+            ClientError, BotoCoreError: If upload fails
+        """
+        if not self.is_available:
+            raise RuntimeError("R2 not available - cannot upload")
 
         try:
-            self._client.put_object(
+            # boto3 is blocking: run it off the event loop (the client is thread-safe)
+            await asyncio.to_thread(
+                self._client.put_object,
                 Bucket=settings.r2_bucket_name,
                 Key=object_key,
                 Body=content,
                 ContentType=content_type,
                 # R2 doesn't require ACL for public access (configured at bucket level)
             )
-
-            # Build public URL
-            public_url = self._get_public_url(object_key)
-
-            logger.info(
-                f"[R2Service] Image uploaded: user_id={user_id}, "
-                f"product_id={product_id}, key={object_key}, "
-                f"size={len(content)/1024:.1f}KB"
-            )
-
-            return public_url
-
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            logger.error(
-                f"[R2Service] Upload failed: user_id={user_id}, "
-                f"product_id={product_id}, error={error_code}: {e}"
-            )
+            logger.error(f"[R2Service] Upload failed: key={object_key}, error={error_code}: {e}")
             raise
         except BotoCoreError as e:
-            logger.error(
-                f"[R2Service] Unexpected upload error: user_id={user_id}, "
-                f"product_id={product_id}, error={e}"
-            )
+            logger.error(f"[R2Service] Unexpected upload error: key={object_key}, error={e}")
             raise
 
+        return self._get_public_url(object_key)
+
     def _get_public_url(self, object_key: str) -> str:
         """
         Get public URL for an object.
@@ -201,7 +246,8 @@ class R2Service:
             return False
 
         try:
-            self._client.delete_object(
+            await asyncio.to_thread(
+                self._client.delete_object,
                 Bucket=settings.r2_bucket_name,
                 Key=object_key,
             )
@@ -267,7 +313,7 @@ class R2Service:
             return False
 
         try:
-            self._client.head_bucket(Bucket=settings.r2_bucket_name)
+            await asyncio.to_thread(self._client.head_bucket, Bucket=settings.r2_bucket_name)
             logger.info("[R2Service] Connection check passed")
             return True
         except ClientError as e:
@@ -0,0 +1,463 @@
+"""
+Reference Catalog
+
+Process-wide, versioned in-memory copy of the reference tables of the
+product_attributes schema (brands, categories, colors, conditions, sizes...).
+Lookups are O(1) dict accesses, case-insensitive, by primary key or by any
+column (name_fr, vinted_id...), so mapping/translation code runs zero
+reference-data queries once the catalog is warm.
+
+Tables are loaded as plain rows (Core SELECT, no ORM instances): entries are
+read-only and can be shared by every thread/request.
+
+A table is reloaded when:
+- Postgres notifies a change on the reference_data_changed channel
+  (statement-level triggers, see migration ref_catalog_notify_001), received
+  by ReferenceCatalogListener (started in main.py lifespan), which also
+  invalidates the pricing coefficient snapshot when a coefficient table
+  (PRICING_COEFFICIENT_TABLES) changes
+- invalidate_reference_catalog() is called (AdminAttributeService writes)
+- settings.reference_catalog_ttl_seconds elapses (safety net if a
+  notification is lost, e.g. listener reconnecting)
+
+Refreshes are single-flight: while one thread reloads the stale tables, the
+others keep reading the previous snapshot. version is a process-local number,
+incremented only when a reload finds different rows.
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+import select
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import select as sa_select
+from sqlalchemy.orm import Session
+
+from models.public.brand import Brand
+from models.public.category import Category
+from models.public.closure import Closure
+from models.public.color import Color
+from models.public.condition import Condition
+from models.public.condition_sup import ConditionSup
+from models.public.decade import Decade
+from models.public.fit import Fit
+from models.public.gender import Gender
+from models.public.length import Length
+from models.public.lining import Lining
+from models.public.material import Material
+from models.public.neckline import Neckline
+from models.public.origin import Origin
+from models.public.pattern import Pattern
+from models.public.rise import Rise
+from models.public.season import Season
+from models.public.size_normalized import SizeNormalized
+from models.public.sleeve_length import SleeveLength
+from models.public.sport import Sport
+from models.public.stretch import Stretch
+from models.public.trend import Trend
+from models.public.unique_feature import UniqueFeature
+from services.pricing.coefficient_snapshot import invalidate_pricing_coefficients
+from shared.config import settings
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+NOTIFY_CHANNEL = "reference_data_changed"
+
+# Catalog table name (same names as /api/attributes/{type}) -> model
+REFERENCE_TABLES = {
+    "brands": Brand,
+    "categories": Category,
+    "closures": Closure,
+    "colors": Color,
+    "conditions": Condition,
+    "condition_sups": ConditionSup,
+    "decades": Decade,
+    "fits": Fit,
+    "genders": Gender,
+    "lengths": Length,
+    "linings": Lining,
+    "materials": Material,
+    "necklines": Neckline,
+    "origins": Origin,
+    "patterns": Pattern,
+    "rises": Rise,
+    "seasons": Season,
+    "sizes": SizeNormalized,
+    "sleeve_lengths": SleeveLength,
+    "sports": Sport,
+    "stretches": Stretch,
+    "trends": Trend,
+    "unique_features": UniqueFeature,
+}
+
+# Postgres table name (NOTIFY payload) -> catalog table name
+_TABLES_BY_SQL_NAME = {model.__tablename__: name for name, model in REFERENCE_TABLES.items()}
+
+# Catalog tables read by the pricing coefficient snapshot (services/pricing)
+PRICING_COEFFICIENT_TABLES = frozenset(
+    {"conditions", "origins", "decades", "trends", "unique_features", "fits"}
+)
+
+# Label when no translation is filled (Condition.get_name() behaviour)
+_LABEL_FALLBACKS = {"conditions": "Condition {}"}
+
+
+def _fold(value: Any) -> str:
+    return str(value).strip().casefold()
+
+
+class ReferenceEntry(Mapping):
+    """
+    Read-only reference row: entry["name_fr"] or entry.name_fr.
+
+    Unknown columns raise AttributeError (getattr(entry, "x", None) works).
+    """
+
+    __slots__ = ("_table", "_key", "_data")
+
+    def __init__(self, table: str, key: Any, data: dict):
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_key", key)
+        object.__setattr__(self, "_data", data)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._data[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ReferenceEntry is read-only")
+
+    def __repr__(self) -> str:
+        return f"<ReferenceEntry({self._table}, {self._data!r})>"
+
+    def get_name(self, lang: str = "en") -> str:
+        """Translated name: name_{lang}, then name_en, then name (brands)."""
+        value = self._data.get(f"name_{lang}") or self._data.get("name_en") or self._data.get("name")
+        if value:
+            return value
+        return _LABEL_FALLBACKS.get(self._table, "{}").format(self._key)
+
+
+class ReferenceTable:
+    """Rows of one reference table, indexed by primary key (and lazily by column)."""
+
+    def __init__(self, name: str, key_field: str, rows: Iterable[dict]):
+        self.name = name
+        self.key_field = key_field
+        self._entries = tuple(ReferenceEntry(name, row[key_field], dict(row)) for row in rows)
+        self._by_key = {entry[key_field]: entry for entry in self._entries}
+        self._by_folded_key: dict[str, ReferenceEntry] = {}
+        for entry in self._entries:
+            self._by_folded_key.setdefault(_fold(entry[key_field]), entry)
+        self._indexes: dict[str, dict[str, ReferenceEntry]] = {}
+
+    def __iter__(self) -> Iterator[ReferenceEntry]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ReferenceTable):
+            return NotImplemented
+        return self._entries == other._entries
+
+    def get(self, key: Any) -> Optional[ReferenceEntry]:
+        """Entry by primary key: exact match, then case-insensitive."""
+        if key is None:
+            return None
+        entry = self._by_key.get(key)
+        if entry is None:
+            entry = self._by_folded_key.get(_fold(key))
+        return entry
+
+    def find_by(self, field_name: str, value: Any) -> Optional[ReferenceEntry]:
+        """
+        First entry whose column equals value (case-insensitive, compared as str).
+
+        The index of a column is built on first use (vinted_id, name_fr...).
+        """
+        if value is None:
+            return None
+        index = self._indexes.get(field_name)
+        if index is None:
+            index = {}
+            for entry in self._entries:
+                column_value = entry.get(field_name)
+                if column_value is not None:
+                    index.setdefault(_fold(column_value), entry)
+            self._indexes[field_name] = index
+        return index.get(_fold(value))
+
+    def label(self, key: Any, lang: str = "en") -> Optional[str]:
+        """Translated name of an entry (None if the key is unknown)."""
+        entry = self.get(key)
+        return entry.get_name(lang) if entry is not None else None
+
+    def search(self, field_name: str, term: str, limit: int) -> list[ReferenceEntry]:
+        """Entries whose column contains term (case-insensitive, ILIKE '%term%')."""
+        folded = term.casefold()
+        matches = []
+        for entry in self._entries:
+            value = entry.get(field_name)
+            if value is not None and folded in str(value).casefold():
+                matches.append(entry)
+                if len(matches) >= limit:
+                    break
+        return matches
+
+
+@dataclass(frozen=True)
+class ReferenceCatalog:
+    """Immutable snapshot of the reference tables."""
+
+    version: int
+    tables: Mapping[str, ReferenceTable]
+    _derived: dict = field(default_factory=dict, compare=False, repr=False)
+
+    def table(self, name: str) -> ReferenceTable:
+        """Table by catalog name (KeyError if not part of the catalog)."""
+        return self.tables[name]
+
+    def get(self, table: str, key: Any) -> Optional[ReferenceEntry]:
+        return self.tables[table].get(key)
+
+    def find_by(self, table: str, field_name: str, value: Any) -> Optional[ReferenceEntry]:
+        return self.tables[table].find_by(field_name, value)
+
+    def translate(self, table: str, key: Any, lang: str = "en") -> Optional[str]:
+        return self.tables[table].label(key, lang)
+
+    def memo(self, key: str, builder: Callable[["ReferenceCatalog"], Any]) -> Any:
+        """
+        Structure derived from this snapshot, built once per version.
+
+        The result is shared: callers must not mutate it.
+        """
+        try:
+            return self._derived[key]
+        except KeyError:
+            value = builder(self)
+            return self._derived.setdefault(key, value)
+
+    @classmethod
+    def from_rows(cls, rows: Mapping[str, Iterable[dict]], version: int = 1) -> "ReferenceCatalog":
+        """Catalog built from plain rows (scripts, tests). Missing tables are empty."""
+        tables = {
+            name: ReferenceTable(name, _key_field(model), rows.get(name, ()))
+            for name, model in REFERENCE_TABLES.items()
+        }
+        return cls(version=version, tables=tables)
+
+
+def _key_field(model) -> str:
+    return sa_inspect(model).primary_key[0].key
+
+
+def load_reference_table(db: Session, name: str) -> ReferenceTable:
+    """Read one reference table (1 query)."""
+    model = REFERENCE_TABLES[name]
+    key_field = _key_field(model)
+    rows = db.execute(
+        sa_select(model.__table__).order_by(model.__table__.c[key_field])
+    ).mappings().all()
+    return ReferenceTable(name, key_field, rows)
+
+
+_catalog: Optional[ReferenceCatalog] = None
+_loaded_at = 0.0
+_version = 0
+_stale: set[str] = set(REFERENCE_TABLES)
+_lock = threading.Lock()
+_refresh_lock = threading.Lock()
+
+
+def get_reference_catalog(db: Session) -> ReferenceCatalog:
+    """
+    Return the shared catalog, reloading stale tables first.
+
+    Only invalidated tables are reloaded (all of them after the TTL). If
+    another thread is already refreshing, the current snapshot is returned.
+    """
+    global _catalog, _loaded_at, _version
+
+    with _lock:
+        expired = time.monotonic() - _loaded_at >= settings.reference_catalog_ttl_seconds
+        if _catalog is not None and not _stale and not expired:
+            return _catalog
+        current = _catalog
+
+    if current is not None:
+        if not _refresh_lock.acquire(blocking=False):
+            return current
+    else:
+        _refresh_lock.acquire()
+
+    try:
+        with _lock:
+            expired = time.monotonic() - _loaded_at >= settings.reference_catalog_ttl_seconds
+            if _catalog is not None and not _stale and not expired:
+                return _catalog
+            names = set(REFERENCE_TABLES) if expired or _catalog is None else set(_stale)
+            _stale.difference_update(names)
+
+        try:
+            loaded = {name: load_reference_table(db, name) for name in sorted(names)}
+        except Exception:
+            with _lock:
+                _stale.update(names)
+            raise
+
+        with _lock:
+            tables = dict(_catalog.tables) if _catalog is not None else {}
+            changed = sorted(name for name, table in loaded.items() if tables.get(name) != table)
+            if _catalog is not None and not changed:
+                catalog = _catalog
+            else:
+                tables.update(loaded)
+                _version += 1
+                catalog = ReferenceCatalog(version=_version, tables=tables)
+                logger.info(
+                    f"[ReferenceCatalog] Version {_version} "
+                    f"({', '.join(changed) if _catalog is not None else f'{len(tables)} tables'})"
+                )
+            _catalog = catalog
+            if expired:
+                _loaded_at = time.monotonic()
+        return catalog
+    finally:
+        _refresh_lock.release()
+
+
+def invalidate_reference_catalog(tables: Optional[Iterable[str]] = None) -> None:
+    """
+    Mark tables for reload on next use (all tables if None).
+
+    Unknown names are ignored. The version changes only if rows changed.
+    """
+    global _loaded_at
+
+    with _lock:
+        if tables is None:
+            _loaded_at = 0.0
+            _stale.update(REFERENCE_TABLES)
+            logger.info("[ReferenceCatalog] Invalidated (all tables)")
+            return
+        names = {name for name in tables if name in REFERENCE_TABLES}
+        _stale.update(names)
+
+    if names:
+        logger.info(f"[ReferenceCatalog] Invalidated: {', '.join(sorted(names))}")
+
+
+def reset_reference_catalog() -> None:
+    """Drop the snapshot entirely (tests)."""
+    global _catalog, _loaded_at, _version
+
+    with _lock:
+        _catalog = None
+        _loaded_at = 0.0
+        _version = 0
+        _stale.update(REFERENCE_TABLES)
+
+
+class ReferenceCatalogListener:
+    """
+    Background thread: LISTEN reference_data_changed, invalidate notified tables.
+
+    Uses its own autocommit psycopg2 connection (outside the SQLAlchemy pool).
+    On connection loss it reconnects with exponential backoff and invalidates
+    every table, since notifications sent meanwhile are lost.
+    """
+
+    POLL_SECONDS = 5.0
+    MAX_BACKOFF_SECONDS = 60.0
+
+    def __init__(self, dsn: Optional[str] = None):
+        self._dsn = dsn or settings.database_url.replace("postgresql+psycopg2://", "postgresql://")
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="reference-catalog-listener", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"[ReferenceCatalog] Listening on '{NOTIFY_CHANNEL}'")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @staticmethod
+    def handle_payloads(payloads: Iterable[str]) -> None:
+        """Invalidate the tables named in NOTIFY payloads (Postgres table names)."""
+        names = {_TABLES_BY_SQL_NAME.get(payload) for payload in payloads}
+        names.discard(None)
+        if names:
+            invalidate_reference_catalog(names)
+        if names & PRICING_COEFFICIENT_TABLES:
+            invalidate_pricing_coefficients()
+
+    def _run(self) -> None:
+        import psycopg2
+
+        backoff = 1.0
+        first = True
+        while not self._stop.is_set():
+            conn = None
+            try:
+                conn = psycopg2.connect(self._dsn)
+                conn.autocommit = True
+                with conn.cursor() as cursor:
+                    cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                if not first:
+                    # Notifications sent while disconnected are lost
+                    invalidate_reference_catalog()
+                    invalidate_pricing_coefficients()
+                first = False
+                backoff = 1.0
+
+                while not self._stop.is_set():
+                    if select.select([conn], [], [], self.POLL_SECONDS) == ([], [], []):
+                        continue
+                    conn.poll()
+                    payloads = [notify.payload for notify in conn.notifies]
+                    conn.notifies.clear()
+                    self.handle_payloads(payloads)
+            except Exception as e:
+                logger.warning(
+                    f"[ReferenceCatalog] Listener error: {e} (retry in {backoff:.0f}s)"
+                )
+                first = False
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, self.MAX_BACKOFF_SECONDS)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
@@ -0,0 +1,133 @@
+"""
+Text Templates - Precompiled line templates for listing texts
+
+Used by the description styles (description_builders.py), the title
+formats (product_text_generator.py), the Vinted sections and the eBay
+HTML blocks.
+
+A template is declared once at import as (field, format) pairs:
+
+    INFO = compile_lines([("brand", "Marque : {}"), ("model", "Modèle : {}")])
+
+and rendered per product against a mapping of field values:
+
+    INFO.render(values)  # ["Marque : Levi's", "Modèle : 501"]
+
+Compilation splits each format around its "{}" placeholder and generates
+a render function with the labels as constants (like Jinja2 compiles a
+template to Python code): no label, f-string or spec walked per product.
+Lines whose field is empty are skipped (missing attributes silently
+dropped, like the hand-written builders did).
+
+Format conventions:
+- "{}" is replaced by the field value
+- a format without "{}" is a constant, shown when the field is set
+  (ex: ("decade", "Vintage"))
+- a field ending with "[]" holds a sequence: one line per item
+  (ex: ("condition_sup[]", "→ {}"))
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence, Tuple
+
+# Line kinds
+_VALUE = 0
+_CONSTANT = 1
+_EACH = 2
+
+
+def _concat(*parts: str) -> str:
+    """Python expression concatenating literals (repr) and names, skipping empty literals."""
+    return " + ".join(part for part in parts if part != "''")
+
+
+def _generate_render(lines: Tuple[Tuple[str, str, str, int], ...]) -> Callable:
+    """
+    Generate the render function of compiled lines.
+
+    Labels become string constants of the generated code, so a render is
+    one dict lookup, one test and one concatenation per line.
+    """
+    source = ["def render(values):", "    rendered = []", "    append = rendered.append"]
+    for field, prefix, suffix, kind in lines:
+        source.append(f"    value = values[{field!r}]")
+        source.append("    if value:")
+        if kind == _VALUE:
+            source.append(f"        append({_concat(repr(prefix), 'value', repr(suffix))})")
+        elif kind == _CONSTANT:
+            source.append(f"        append({prefix!r})")
+        else:
+            item = _concat(repr(prefix), "item", repr(suffix))
+            source.append(f"        rendered.extend([{item} for item in value])")
+    source.append("    return rendered")
+
+    namespace: dict = {}
+    exec(compile("\n".join(source), "<text_template>", "exec"), namespace)
+    return namespace["render"]
+
+
+class LineTemplate:
+    """
+    Compiled lines: (field, prefix, suffix, kind) per declared format.
+
+    render(values) -> list[str]: rendered lines for the fields that are
+    set, in declaration order (generated at compile time).
+    """
+
+    __slots__ = ("lines", "render")
+
+    def __init__(self, lines: Tuple[Tuple[str, str, str, int], ...]):
+        self.lines = lines
+        self.render = _generate_render(lines)
+
+    def join(self, values: Mapping[str, Any], separator: str) -> str:
+        """Rendered lines joined with separator ("" if no field is set)."""
+        return separator.join(self.render(values))
+
+
+class SectionTemplate:
+    """Header line + compiled lines; no section at all when no line is set."""
+
+    __slots__ = ("header", "body")
+
+    def __init__(self, header: str, body: LineTemplate):
+        self.header = header
+        self.body = body
+
+    def render(self, values: Mapping[str, Any]) -> Optional[str]:
+        lines = self.body.render(values)
+        if not lines:
+            return None
+        return self.header + "\n" + "\n".join(lines)
+
+
+def compile_lines(spec: Iterable[Tuple[str, str]]) -> LineTemplate:
+    """Compile (field, format) pairs into a LineTemplate."""
+    lines = []
+    for field, line_format in spec:
+        prefix, placeholder, suffix = line_format.partition("{}")
+        if field.endswith("[]"):
+            kind = _EACH
+        elif placeholder:
+            kind = _VALUE
+        else:
+            kind = _CONSTANT
+        lines.append((field, prefix, suffix, kind))
+    return LineTemplate(tuple(lines))
+
+
+def compile_section(header: str, spec: Iterable[Tuple[str, str]]) -> SectionTemplate:
+    """Compile a section: header + (field, format) pairs."""
+    return SectionTemplate(header, compile_lines(spec))
+
+
+def render_sections(
+    sections: Sequence[SectionTemplate],
+    values: Mapping[str, Any],
+    separator: str = "\n\n",
+) -> str:
+    """Render sections in order, skipping empty ones."""
+    rendered = (section.render(values) for section in sections)
+    return separator.join(text for text in rendered if text)
@@ -12,6 +12,7 @@ Author: Claude
 Date: 2025-12-08
 Updated: 2025-12-11 - Added specific exception handling
 Updated: 2025-12-22 - Fixed to use template_tenant instead of public schema
+Updated: 2026-02-04 - product_list_items projection (table + triggers)
 """
 import logging
 
@@ -20,6 +21,7 @@ from sqlalchemy.exc import SQLAlchemyError, ProgrammingError, OperationalError
 from sqlalchemy.orm import Session
 
 from models.public.user import User
+from services.product_list_projection import ProductListProjection
 from shared.exceptions import SchemaCreationError, DatabaseError
 
 logger = logging.getLogger(__name__)
@@ -51,6 +53,7 @@ class UserSchemaService:
         # "ebay_promoted_listings",  # Removed (2026-01-20): Merged into ebay_products
         "vinted_orders",           # VintedOrder (migrated from vinted schema 2026-01-20)
         "vinted_order_products",   # VintedOrderProduct (migrated from vinted schema 2026-01-20)
+        "product_list_items",      # Projection de la liste produits (2026-02-04)
     ]
 
     @classmethod
@@ -107,6 +110,10 @@ class UserSchemaService:
                         f"Table template_tenant.{table_name} not found, skipping"
                     )
 
+            # 3. Triggers de la projection product_list_items (non copiés par LIKE)
+            ProductListProjection.install_triggers(db, schema_name)
+            db.commit()
+
             logger.info(f"Schema {schema_name} created successfully")
             return schema_name
 
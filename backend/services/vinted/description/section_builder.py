@@ -5,10 +5,13 @@ Construit les différentes sections d'une description Vinted.
 
 Author: Claude
 Date: 2025-12-11
+Updated: 2026-02-04 - Section "Informations" en template précompilé
 """
 
 from typing import Optional, List, TYPE_CHECKING
 
+from services.text_templates import compile_section
+
 from .translation_helper import TranslationHelper
 from .measurement_extractor import MeasurementExtractor
 from .hashtag_config import HashtagConfig
@@ -16,6 +19,18 @@ from .hashtag_config import HashtagConfig
 if TYPE_CHECKING:
     from models.user.product import Product
 
+# Section "Informations:" (template compilé une fois, lignes vides ignorées)
+_PRODUCT_INFO = compile_section("Informations:", [
+    ("brand", "* Marque: {}"),
+    ("model", "* Modèle: {}"),
+    ("category", "* Catégorie: {}"),
+    ("fit", "* Coupe: {}"),
+    ("size", "* Taille: {}"),
+    ("color", "* Couleur: {}"),
+    ("material", "* Matière: {}"),
+    ("decade", "* Époque: {}"),
+])
+
 
 class SectionBuilder:
     """
@@ -87,56 +102,24 @@ class SectionBuilder:
         * Matière: 100% Coton
         * Décennie: Vintage 90s
         """
-        lines = ["Informations:"]
-
-        # Marque
         brand = cls._safe_get(product, 'brand')
-        if brand and brand.lower() != 'unbranded':
-            lines.append(f"* Marque: {brand}")
-
-        # Modèle
-        model = cls._safe_get(product, 'model')
-        if model:
-            lines.append(f"* Modèle: {model}")
-
-        # Catégorie
         category = cls._safe_get(product, 'category')
-        if category:
-            category_fr = TranslationHelper.translate_category(category)
-            lines.append(f"* Catégorie: {category_fr}")
-
-        # Fit/Coupe
-        fit = cls._safe_get(product, 'fit')
-        if fit:
-            lines.append(f"* Coupe: {fit}")
-
-        # Taille (prefer size_original, fallback to size_normalized)
-        size = cls._safe_get(product, 'size_original') or cls._safe_get(product, 'size_normalized')
-        if size:
-            lines.append(f"* Taille: {size}")
-
-        # Couleur (en français)
         color = cls._safe_get(product, 'color')
-        if color:
-            color_fr = TranslationHelper.translate_color(color)
-            lines.append(f"* Couleur: {color_fr}")
-
-        # Matière
-        material = cls._safe_get(product, 'material')
-        if material:
-            lines.append(f"* Matière: {material}")
-
-        # Décennie
         decade = cls._safe_get(product, 'decade')
-        if decade:
-            decade_str = TranslationHelper.format_decade_fr(decade)
-            if decade_str:
-                lines.append(f"* Époque: {decade_str}")
 
-        if len(lines) > 1:  # Au moins une info en plus du titre
-            return "\n".join(lines)
-
-        return None
+        values = {
+            'brand': brand if brand and brand.lower() != 'unbranded' else None,
+            'model': cls._safe_get(product, 'model'),
+            'category': TranslationHelper.translate_category(category) if category else None,
+            'fit': cls._safe_get(product, 'fit'),
+            # Taille: size_original en priorité, sinon size_normalized
+            'size': cls._safe_get(product, 'size_original') or cls._safe_get(product, 'size_normalized'),
+            'color': TranslationHelper.translate_color(color) if color else None,
+            'material': cls._safe_get(product, 'material'),
+            'decade': TranslationHelper.format_decade_fr(decade) if decade else None,
+        }
+
+        return _PRODUCT_INFO.render(values)
 
     @classmethod
     def build_condition(cls, product: "Product") -> Optional[str]:
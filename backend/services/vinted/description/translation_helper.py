@@ -5,11 +5,16 @@ Gère les traductions FR/EN pour les descriptions Vinted.
 
 Author: Claude
 Date: 2025-12-11
+Updated: 2026-02-04 - Décennies: regex précompilée + parsing mémoïsé
 """
 
 import re
+from functools import lru_cache
 from typing import Optional
 
+# Chiffres d'une décennie ("1990s", "90s", "1980")
+_DECADE_PATTERN = re.compile(r'(\d{2,4})')
+
 
 class TranslationHelper:
     """Helper pour traduire les attributs produit en français."""
@@ -125,21 +130,8 @@ class TranslationHelper:
         if not decade:
             return None
 
-        decade_str = str(decade).strip().lower()
-
-        # Extraire les chiffres
-        match = re.search(r'(\d{2,4})', decade_str)
-        if not match:
-            return None
-
-        year = match.group(1)
-
-        # Convertir en format court (90s, 80s, etc.)
-        if len(year) == 4:
-            short_decade = year[2:] + "s"
-        elif len(year) == 2:
-            short_decade = year + "s"
-        else:
+        short_decade = _short_decade(str(decade))
+        if not short_decade:
             return None
 
         return f"Vintage {short_decade}"
@@ -157,22 +149,24 @@ class TranslationHelper:
         if not decade:
             return ""
 
-        decade_str = str(decade).strip().lower()
+        return _short_decade(str(decade))
 
-        # Extraire les chiffres
-        match = re.search(r'(\d{2,4})', decade_str)
-        if not match:
-            return ""
 
-        year = match.group(1)
+@lru_cache(maxsize=256)
+def _short_decade(decade: str) -> str:
+    """Décennie au format court ("1990s" → "90s"), "" si non reconnue (mémoïsé)."""
+    match = _DECADE_PATTERN.search(decade.strip().lower())
+    if not match:
+        return ""
 
-        # Convertir en format court
-        if len(year) == 4:
-            return year[2:] + "s"
-        elif len(year) == 2:
-            return year + "s"
+    year = match.group(1)
 
-        return ""
+    # Convertir en format court (90s, 80s, etc.)
+    if len(year) == 4:
+        return year[2:] + "s"
+    elif len(year) == 2:
+        return year + "s"
 
+    return ""
 
 __all__ = ["TranslationHelper"]
@@ -0,0 +1,405 @@
+"""
+Vinted Category Matcher
+
+In-memory, process-wide port of the PL/pgSQL function
+vinted.get_vinted_category() (Stoflow category + attributes → Vinted catalog id).
+
+The vinted.mapping table is loaded once into a decision index keyed by
+(category, gender): each entry holds the candidate rows of that couple with
+their attribute checks and weights precomputed, so matching a product is a
+short Python loop instead of one SQL round-trip per product.
+
+Matching rules (identical to the SQL function):
+- a row is a candidate if my_category matches and, for each attribute,
+  the product value is NULL, the row value is NULL, or both are equal
+- score: gender/fit/length/rise +10, material +5, pattern/neckline +3,
+  sleeve_length +2 for each equal (non-NULL) value
+- best candidate: highest score, then highest priority (NULL priority first,
+  as ORDER BY ... DESC in Postgres); remaining ties → lowest mapping id
+  (the SQL function leaves them unordered)
+- no candidate: first is_default row of the category (gender NULL, equal or
+  unspecified), lowest mapping id
+
+The snapshot is rebuilt when:
+- invalidate_vinted_category_matcher() is called
+- MATCHER_TTL_SECONDS elapses (edits made by migrations/SQL/other processes)
+
+version is a process-local number, incremented only when a rebuild finds
+different mapping rows.
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+MATCHER_TTL_SECONDS = 300
+
+# Attributes scored by get_vinted_category() (gender is part of the index key)
+ATTRIBUTE_WEIGHTS: Tuple[Tuple[str, int], ...] = (
+    ("fit", 10),
+    ("length", 10),
+    ("rise", 10),
+    ("material", 5),
+    ("pattern", 3),
+    ("neckline", 3),
+    ("sleeve_length", 2),
+)
+GENDER_WEIGHT = 10
+
+MATCH_FIELDS = ("category", "gender") + tuple(name for name, _ in ATTRIBUTE_WEIGHTS)
+
+_MAPPING_QUERY = text("""
+    SELECT id, vinted_id, my_category, my_gender, my_fit, my_length, my_rise,
+           my_material, my_pattern, my_neckline, my_sleeve_length,
+           is_default, priority
+    FROM vinted.mapping
+    ORDER BY id
+""")
+
+_CATEGORIES_QUERY = text("""
+    SELECT id, title, path, gender
+    FROM vinted.categories
+    WHERE id IN (SELECT vinted_id FROM vinted.mapping)
+""")
+
+
+@dataclass(frozen=True)
+class MappingRow:
+    """One vinted.mapping row (my_* columns without the prefix)."""
+
+    id: int
+    vinted_id: int
+    category: Optional[str]
+    gender: Optional[str] = None
+    fit: Optional[str] = None
+    length: Optional[str] = None
+    rise: Optional[str] = None
+    material: Optional[str] = None
+    pattern: Optional[str] = None
+    neckline: Optional[str] = None
+    sleeve_length: Optional[str] = None
+    is_default: bool = False
+    priority: Optional[int] = 0
+
+
+@dataclass(frozen=True)
+class _Candidate:
+    """A mapping row precompiled for one (category, gender) index key."""
+
+    row_id: int
+    vinted_id: int
+    base_score: int  # GENDER_WEIGHT if the row gender equals the key gender
+    rank: float  # priority, NULL first (+inf) as ORDER BY priority DESC
+    checks: Tuple[Tuple[int, str, int], ...]  # (attribute index, row value, weight)
+
+
+def _compile(row: MappingRow, gender: Optional[str]) -> _Candidate:
+    checks = tuple(
+        (index, getattr(row, name), weight)
+        for index, (name, weight) in enumerate(ATTRIBUTE_WEIGHTS)
+        if getattr(row, name) is not None
+    )
+    return _Candidate(
+        row_id=row.id,
+        vinted_id=row.vinted_id,
+        base_score=GENDER_WEIGHT if gender is not None and row.gender == gender else 0,
+        rank=float("inf") if row.priority is None else row.priority,
+        checks=checks,
+    )
+
+
+@dataclass(frozen=True)
+class VintedCategoryMatcher:
+    """
+    Immutable decision index over vinted.mapping.
+
+    Inputs are compared as-is: callers normalize them like the SQL call did
+    (lowercase, empty → None), see VintedMappingRepository.
+    """
+
+    version: int
+    rows: Tuple[MappingRow, ...]
+    categories: Mapping[int, Dict[str, Any]]  # vinted_id → {id, title, path, gender}
+    _rows_by_category: Dict[str, Tuple[MappingRow, ...]] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+    # (category, gender) → (candidates in id order, default vinted_id)
+    _index: Dict[Tuple[str, Optional[str]], Tuple[Tuple[_Candidate, ...], Optional[int]]] = field(
+        default_factory=dict, compare=False, repr=False
+    )
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[MappingRow],
+        categories: Optional[Mapping[int, Dict[str, Any]]] = None,
+        version: int = 1,
+    ) -> "VintedCategoryMatcher":
+        """Build the matcher and precompile every (category, gender) seen in the rows."""
+        rows = tuple(sorted(rows, key=lambda row: row.id))
+
+        by_category: Dict[str, List[MappingRow]] = {}
+        for row in rows:
+            if row.category is not None:
+                by_category.setdefault(row.category, []).append(row)
+
+        matcher = cls(
+            version=version,
+            rows=rows,
+            categories=dict(categories or {}),
+            _rows_by_category={category: tuple(group) for category, group in by_category.items()},
+        )
+        for category, group in matcher._rows_by_category.items():
+            for gender in {None, *(row.gender for row in group)}:
+                matcher._index[(category, gender)] = matcher._build_entry(category, gender)
+        return matcher
+
+    def _build_entry(
+        self, category: str, gender: Optional[str]
+    ) -> Tuple[Tuple[_Candidate, ...], Optional[int]]:
+        eligible = [
+            row for row in self._rows_by_category.get(category, ())
+            if gender is None or row.gender is None or row.gender == gender
+        ]
+        return (
+            tuple(_compile(row, gender) for row in eligible),
+            next((row.vinted_id for row in eligible if row.is_default), None),
+        )
+
+    def match(
+        self,
+        category: Optional[str],
+        gender: Optional[str] = None,
+        fit: Optional[str] = None,
+        length: Optional[str] = None,
+        rise: Optional[str] = None,
+        material: Optional[str] = None,
+        pattern: Optional[str] = None,
+        neckline: Optional[str] = None,
+        sleeve_length: Optional[str] = None,
+    ) -> Optional[int]:
+        """Return the Vinted catalog id get_vinted_category() would return."""
+        if category is None:
+            return None
+
+        # A gender absent from the category rows only gets its gender-less rows
+        # (compiled per call, not stored: the index stays bounded by the table)
+        candidates, default = (
+            self._index.get((category, gender)) or self._build_entry(category, gender)
+        )
+
+        values = (fit, length, rise, material, pattern, neckline, sleeve_length)
+        best: Optional[_Candidate] = None
+        best_key: Tuple[float, float] = (0, 0)
+
+        for candidate in candidates:
+            score = candidate.base_score
+            for index, expected, weight in candidate.checks:
+                value = values[index]
+                if value is None:
+                    continue
+                if value != expected:
+                    break
+                score += weight
+            else:
+                key = (score, candidate.rank)
+                # Candidates are in id order: strict > keeps the lowest id on ties
+                if best is None or key > best_key:
+                    best, best_key = candidate, key
+
+        return best.vinted_id if best is not None else default
+
+    def match_many(self, queries: Iterable[Mapping[str, Optional[str]]]) -> List[Optional[int]]:
+        """
+        Match a list of products at once (bulk publish).
+
+        Args:
+            queries: Dicts with MATCH_FIELDS keys (missing keys → None)
+
+        Returns:
+            Vinted catalog ids, in input order (None when no mapping)
+        """
+        results: List[Optional[int]] = []
+        seen: Dict[Tuple[Optional[str], ...], Optional[int]] = {}
+
+        for query in queries:
+            key = tuple(query.get(name) for name in MATCH_FIELDS)
+            if key not in seen:
+                seen[key] = self.match(*key)
+            results.append(seen[key])
+
+        return results
+
+    def details(self, vinted_id: Optional[int], gender: Optional[str] = None) -> Dict[str, Any]:
+        """vinted.categories details of a matched id (same shape as the repository)."""
+        if not vinted_id:
+            return {"vinted_id": None, "title": None, "path": None, "gender": gender}
+
+        category = self.categories.get(vinted_id)
+        if category is None:
+            return {"vinted_id": vinted_id, "title": None, "path": None, "gender": gender}
+
+        return {
+            "vinted_id": category["id"],
+            "title": category["title"],
+            "path": category["path"],
+            "gender": category["gender"],
+        }
+
+
+_matcher: Optional[VintedCategoryMatcher] = None
+_loaded_at = 0.0
+_version = 0
+_lock = threading.Lock()
+_refresh_lock = threading.Lock()
+
+
+def load_vinted_mapping(
+    db: Session,
+) -> Tuple[Tuple[MappingRow, ...], Dict[int, Dict[str, Any]]]:
+    """Read vinted.mapping and the mapped vinted.categories (2 queries)."""
+    rows = tuple(
+        MappingRow(
+            id=r.id,
+            vinted_id=r.vinted_id,
+            category=r.my_category,
+            gender=r.my_gender,
+            fit=r.my_fit,
+            length=r.my_length,
+            rise=r.my_rise,
+            material=r.my_material,
+            pattern=r.my_pattern,
+            neckline=r.my_neckline,
+            sleeve_length=r.my_sleeve_length,
+            is_default=bool(r.is_default),
+            priority=r.priority,
+        )
+        for r in db.execute(_MAPPING_QUERY)
+    )
+    categories = {
+        r.id: {"id": r.id, "title": r.title, "path": r.path, "gender": r.gender}
+        for r in db.execute(_CATEGORIES_QUERY)
+    }
+
+    logger.debug(
+        f"[VintedCategoryMatcher] Loaded {len(rows)} mapping rows, "
+        f"{len(categories)} categories"
+    )
+    return rows, categories
+
+
+def get_vinted_category_matcher(db: Session) -> VintedCategoryMatcher:
+    """Return the shared matcher, (re)loading it if missing or expired."""
+    global _matcher, _loaded_at, _version
+
+    with _lock:
+        if _matcher is not None and time.monotonic() - _loaded_at < MATCHER_TTL_SECONDS:
+            return _matcher
+
+    # Single flight: concurrent callers keep the current matcher meanwhile
+    if not _refresh_lock.acquire(blocking=_matcher is None):
+        return _matcher
+
+    try:
+        with _lock:
+            if _matcher is not None and time.monotonic() - _loaded_at < MATCHER_TTL_SECONDS:
+                return _matcher
+
+        rows, categories = load_vinted_mapping(db)
+
+        with _lock:
+            if (
+                _matcher is not None
+                and _matcher.rows == rows
+                and _matcher.categories == categories
+            ):
+                matcher = _matcher
+            else:
+                _version += 1
+                matcher = VintedCategoryMatcher.from_rows(rows, categories, version=_version)
+                logger.info(
+                    f"[VintedCategoryMatcher] Version {_version} ({len(rows)} mapping rows)"
+                )
+            _matcher = matcher
+            _loaded_at = time.monotonic()
+
+        return matcher
+    finally:
+        _refresh_lock.release()
+
+
+def invalidate_vinted_category_matcher() -> None:
+    """Force a reload on next use (the version changes only if data changed)."""
+    global _loaded_at
+
+    with _lock:
+        _loaded_at = 0.0
+
+    logger.info("[VintedCategoryMatcher] Invalidated")
+
+
+def reset_vinted_category_matcher() -> None:
+    """Drop the shared matcher (tests)."""
+    global _matcher, _loaded_at, _version
+
+    with _lock:
+        _matcher = None
+        _loaded_at = 0.0
+        _version = 0
+
+
+def reference_match(
+    rows: Sequence[MappingRow],
+    category: Optional[str],
+    gender: Optional[str] = None,
+    **attributes: Optional[str],
+) -> List[int]:
+    """
+    Literal port of get_vinted_category(): every vinted_id the SQL may return.
+
+    Several ids are returned when the best rows tie on (score, priority),
+    since the SQL function leaves their order undefined. Used by the parity
+    tests, not by the matching path.
+    """
+    values = {"gender": gender, **{name: attributes.get(name) for name, _ in ATTRIBUTE_WEIGHTS}}
+    weights = {"gender": GENDER_WEIGHT, **dict(ATTRIBUTE_WEIGHTS)}
+
+    def passes(row: MappingRow) -> bool:
+        return all(
+            values[name] is None
+            or getattr(row, name) is None
+            or getattr(row, name) == values[name]
+            for name in weights
+        )
+
+    def score(row: MappingRow) -> int:
+        return sum(
+            weight for name, weight in weights.items()
+            if values[name] is not None and getattr(row, name) == values[name]
+        )
+
+    matched = [row for row in rows if category is not None and row.category == category and passes(row)]
+    if matched:
+        def order(row: MappingRow) -> Tuple[int, float]:
+            return score(row), float("inf") if row.priority is None else row.priority
+
+        best = max(order(row) for row in matched)
+        return [row.vinted_id for row in matched if order(row) == best]
+
+    return [
+        row.vinted_id for row in rows
+        if row.category == category
+        and row.is_default
+        and (gender is None or row.gender is None or row.gender == gender)
+    ]
@@ -22,6 +22,8 @@ Author: Claude
 from typing import TYPE_CHECKING
 import logging
 
+from services.listing_render_cache import listing_render_cache
+
 from .description import SectionBuilder, HashtagConfig, TranslationHelper, MeasurementExtractor
 
 if TYPE_CHECKING:
@@ -84,6 +86,14 @@ class VintedDescriptionService:
         Returns:
             Description complète (max 2000 caractères)
         """
+        return listing_render_cache.get_or_render(
+            product, "vinted", "description",
+            lambda: VintedDescriptionService._render_description(product),
+        )
+
+    @staticmethod
+    def _render_description(product: "Product") -> str:
+        """Construit la description (sans cache, voir generate_description)."""
         sections = []
 
         # 1. Hook accrocheur
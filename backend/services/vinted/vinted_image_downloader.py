@@ -4,22 +4,35 @@ Vinted Image Downloader
 Service pour télécharger les images depuis Vinted et les uploader vers R2.
 Utilisé par LinkProductJobHandler pour le téléchargement en arrière-plan.
 
+Updated 2026-02-04: les photos d'un produit sont traitées en parallèle
+(vinted_image_download_concurrency) via un client HTTP partagé, au lieu
+d'une à une avec une pause fixe de 0.5s. Les variantes (thumbnail/medium)
+et métadonnées (taille, dimensions) sont enregistrées sur ProductImage.
+Les fichiers uploadés mais non rattachés au produit (limite d'images atteinte,
+échec d'enregistrement) sont supprimés de R2.
+
 Author: Claude
 Date: 2026-01-06
 """
 
 import asyncio
 import json
-from typing import Dict, Any
+from typing import Any, Dict, Optional
 
+import httpx
 from sqlalchemy.orm import Session
 
-from services.file_service import FileService
+from services.file_service import FileService, StoredImage
 from services.product_service import ProductService
+from shared.config import settings
 from shared.logging import get_logger
 
 logger = get_logger(__name__)
 
+MAX_RETRIES = 3
+RETRY_BASE_DELAY_SECONDS = 1.0
+DOWNLOAD_TIMEOUT_SECONDS = 45.0
+
 
 class VintedImageDownloader:
     """Downloads images from Vinted and uploads to R2."""
@@ -66,75 +79,122 @@ class VintedImageDownloader:
             f"for product {product_id}"
         )
 
-        for i, photo in enumerate(photos):
-            # Delay between downloads (except first)
-            if i > 0:
-                await asyncio.sleep(0.5)
+        # Photos are processed concurrently (bounded), through one HTTP client
+        semaphore = asyncio.Semaphore(max(1, settings.vinted_image_download_concurrency))
+        async with httpx.AsyncClient(timeout=DOWNLOAD_TIMEOUT_SECONDS, follow_redirects=True) as client:
+            stored_images = await asyncio.gather(*(
+                VintedImageDownloader._copy_photo(
+                    client, semaphore, user_id, product_id, photo, i, total_images
+                )
+                for i, photo in enumerate(photos)
+            ))
+
+        # Attach in the original photo order (DB session: sequential)
+        try:
+            for i, stored in enumerate(stored_images):
+                if not stored:
+                    images_failed += 1
+                    continue
+
+                r2_url = stored.url
+                try:
+                    ProductService.add_image(
+                        db=db,
+                        product_id=product_id,
+                        image_url=r2_url,
+                        display_order=images_copied,
+                        **stored.metadata(),
+                    )
+                except ValueError as e:
+                    # Image limit reached: the uploaded copy is not kept
+                    logger.warning(f"[ImageDownloader] Image {i+1}/{total_images} not attached: {e}")
+                    await VintedImageDownloader._delete_stored([stored])
+                    images_failed += 1
+                    continue
 
-            photo_url = photo.get("full_size_url") or photo.get("url")
-            if not photo_url:
-                logger.warning(
-                    f"[ImageDownloader] Photo {i} has no URL, "
-                    f"keys: {list(photo.keys()) if isinstance(photo, dict) else 'N/A'}"
+                images_copied += 1
+                logger.info(
+                    f"[ImageDownloader] Image {i+1}/{total_images} uploaded successfully: "
+                    f"{r2_url[:80]}..."
                 )
-                images_failed += 1
-                continue
+        except Exception:
+            # The caller rolls the session back: none of the uploads is recorded
+            await VintedImageDownloader._delete_stored([s for s in stored_images if s])
+            raise
 
+        logger.info(
+            f"[ImageDownloader] Completed: {images_copied} copied, "
+            f"{images_failed} failed for product {product_id}"
+        )
+
+        return {
+            "images_copied": images_copied,
+            "images_failed": images_failed,
+            "total_images": total_images
+        }
+
+    @staticmethod
+    async def _delete_stored(stored_images: list[StoredImage]) -> None:
+        """Delete uploaded images (and their variants) that are not recorded on the product."""
+        for stored in stored_images:
+            try:
+                await FileService.delete_product_image(stored.url, stored.variant_urls())
+            except Exception as e:
+                logger.warning(f"[ImageDownloader] Failed to delete orphan upload {stored.url}: {e}")
+
+    @staticmethod
+    async def _copy_photo(
+        client: httpx.AsyncClient,
+        semaphore: asyncio.Semaphore,
+        user_id: int,
+        product_id: int,
+        photo: Any,
+        index: int,
+        total_images: int,
+    ) -> Optional[StoredImage]:
+        """
+        Download one Vinted photo and upload it to R2 (with retries).
+
+        Returns:
+            Stored image (URLs + metadata), or None if the photo has no URL
+            or all attempts failed
+        """
+        photo_url = (photo.get("full_size_url") or photo.get("url")) if isinstance(photo, dict) else None
+        if not photo_url:
+            logger.warning(
+                f"[ImageDownloader] Photo {index} has no URL, "
+                f"keys: {list(photo.keys()) if isinstance(photo, dict) else 'N/A'}"
+            )
+            return None
+
+        async with semaphore:
             logger.info(
-                f"[ImageDownloader] Downloading image {i+1}/{total_images}: "
+                f"[ImageDownloader] Downloading image {index+1}/{total_images}: "
                 f"{photo_url[:100]}..."
             )
 
             # Retry logic with exponential backoff
-            max_retries = 3
-            r2_url = None
-
-            for attempt in range(max_retries):
+            for attempt in range(MAX_RETRIES):
                 try:
-                    r2_url = await FileService.download_and_upload_from_url(
+                    return await FileService.download_and_store_from_url(
                         user_id=user_id,
                         product_id=product_id,
                         image_url=photo_url,
-                        timeout=45.0
+                        timeout=DOWNLOAD_TIMEOUT_SECONDS,
+                        client=client,
                     )
-                    break  # Success
                 except Exception as retry_error:
-                    if attempt < max_retries - 1:
-                        delay = 1.0 * (2 ** attempt)  # 1s, 2s, 4s
+                    if attempt < MAX_RETRIES - 1:
+                        delay = RETRY_BASE_DELAY_SECONDS * (2 ** attempt)  # 1s, 2s
                         logger.warning(
-                            f"[ImageDownloader] Image {i+1} attempt {attempt+1} failed: "
+                            f"[ImageDownloader] Image {index+1} attempt {attempt+1} failed: "
                             f"{type(retry_error).__name__}: {retry_error}. "
                             f"Retrying in {delay}s..."
                         )
                         await asyncio.sleep(delay)
                     else:
                         logger.error(
-                            f"[ImageDownloader] Image {i+1} FAILED after {max_retries} attempts: "
+                            f"[ImageDownloader] Image {index+1} FAILED after {MAX_RETRIES} attempts: "
                             f"{type(retry_error).__name__}: {retry_error}"
                         )
-                        images_failed += 1
-
-            if r2_url:
-                # Add image to product
-                ProductService.add_image(
-                    db=db,
-                    product_id=product_id,
-                    image_url=r2_url,
-                    display_order=images_copied
-                )
-                images_copied += 1
-                logger.info(
-                    f"[ImageDownloader] Image {i+1}/{total_images} uploaded successfully: "
-                    f"{r2_url[:80]}..."
-                )
-
-        logger.info(
-            f"[ImageDownloader] Completed: {images_copied} copied, "
-            f"{images_failed} failed for product {product_id}"
-        )
-
-        return {
-            "images_copied": images_copied,
-            "images_failed": images_failed,
-            "total_images": total_images
-        }
+        return None
@@ -9,12 +9,13 @@ Business Rules (Updated 2026-01-05):
 - Color: mapping via color.vinted_id
 - Condition: mapping via condition.vinted_id (PK = note integer)
 - Size: mapping via size.vinted_women_id / size.vinted_men_id (gender-specific)
-- Category: mapping via vinted.mapping table + get_vinted_category() function
+- Category: mapping via vinted.mapping table (get_vinted_category() scoring, in memory)
 - Material: mapping via material.vinted_id
 
 Architecture:
-- Accès direct aux tables product_attributes (shared entre tenants)
-- Category mapping via VintedMappingRepository (calls PostgreSQL function)
+- Attributs lus dans le catalogue de référence en mémoire (product_attributes,
+  aucune requête une fois chargé, recherche insensible à la casse)
+- Category mapping via VintedMappingRepository (VintedCategoryMatcher, batch: map_categories)
 
 Created: 2024-12-10
 Updated: 2026-01-05 - Category mapping restored via VintedMappingRepository
@@ -24,11 +25,7 @@ Author: Claude
 from typing import Optional, Dict, Any, List, Tuple
 from sqlalchemy.orm import Session
 
-from models.public.brand import Brand
-from models.public.color import Color
-from models.public.condition import Condition
-from models.public.material import Material
-from models.public.size_normalized import SizeNormalized
+from services.reference_catalog import get_reference_catalog
 
 
 class VintedMappingService:
@@ -58,7 +55,7 @@ class VintedMappingService:
         if not brand_name:
             return None
 
-        brand = db.query(Brand).filter(Brand.name == brand_name).first()
+        brand = get_reference_catalog(db).get("brands", brand_name)
 
         if brand and brand.vinted_id:
             return int(brand.vinted_id)
@@ -86,7 +83,7 @@ class VintedMappingService:
         if not color_name:
             return None
 
-        color = db.query(Color).filter(Color.name_en == color_name).first()
+        color = get_reference_catalog(db).get("colors", color_name)
 
         if color and color.vinted_id:
             return int(color.vinted_id)
@@ -114,7 +111,7 @@ class VintedMappingService:
             return None
 
         # condition_note is an integer (note 0-10)
-        condition = db.query(Condition).filter(Condition.note == condition_note).first()
+        condition = get_reference_catalog(db).get("conditions", condition_note)
 
         if condition and condition.vinted_id:
             return int(condition.vinted_id)
@@ -141,9 +138,7 @@ class VintedMappingService:
         if vinted_condition_id is None:
             return None
 
-        condition = db.query(Condition).filter(
-            Condition.vinted_id == vinted_condition_id
-        ).first()
+        condition = get_reference_catalog(db).find_by("conditions", "vinted_id", vinted_condition_id)
 
         if condition:
             return condition.note
@@ -170,9 +165,7 @@ class VintedMappingService:
         if vinted_brand_id is None:
             return None
 
-        brand = db.query(Brand).filter(
-            Brand.vinted_id == str(vinted_brand_id)
-        ).first()
+        brand = get_reference_catalog(db).find_by("brands", "vinted_id", vinted_brand_id)
 
         if brand:
             return brand.name
@@ -199,9 +192,7 @@ class VintedMappingService:
         if vinted_color_id is None:
             return None
 
-        color = db.query(Color).filter(
-            Color.vinted_id == str(vinted_color_id)
-        ).first()
+        color = get_reference_catalog(db).find_by("colors", "vinted_id", vinted_color_id)
 
         if color:
             return color.name_en
@@ -230,18 +221,8 @@ class VintedMappingService:
         if not material_name:
             return None
 
-        # Try exact match first
-        material = db.query(Material).filter(
-            Material.name_en == material_name
-        ).first()
-
-        if material:
-            return material.name_en
-
-        # Try case-insensitive match
-        material = db.query(Material).filter(
-            Material.name_en.ilike(material_name)
-        ).first()
+        # Exact match first, then case-insensitive
+        material = get_reference_catalog(db).get("materials", material_name)
 
         if material:
             return material.name_en
@@ -271,18 +252,12 @@ class VintedMappingService:
         if vinted_size_id is None:
             return None
 
-        # Try women's size first
-        size = db.query(SizeNormalized).filter(
-            SizeNormalized.vinted_women_id == vinted_size_id
-        ).first()
-
-        if size:
-            return size.name_en
+        sizes = get_reference_catalog(db).table("sizes")
 
-        # Try men's size
-        size = db.query(SizeNormalized).filter(
-            SizeNormalized.vinted_men_id == vinted_size_id
-        ).first()
+        # Try women's size first, then men's size
+        size = sizes.find_by("vinted_women_id", vinted_size_id) or sizes.find_by(
+            "vinted_men_id", vinted_size_id
+        )
 
         if size:
             return size.name_en
@@ -309,7 +284,7 @@ class VintedMappingService:
         if not material_name:
             return None
 
-        material = db.query(Material).filter(Material.name_en == material_name).first()
+        material = get_reference_catalog(db).get("materials", material_name)
 
         if material and material.vinted_id:
             return int(material.vinted_id)
@@ -377,7 +352,7 @@ class VintedMappingService:
         if not size_name:
             return None
 
-        size = db.query(SizeNormalized).filter(SizeNormalized.name_en == size_name).first()
+        size = get_reference_catalog(db).get("sizes", size_name)
 
         if not size:
             return None
@@ -418,8 +393,8 @@ class VintedMappingService:
         """
         Map Stoflow category to Vinted category using vinted.mapping table.
 
-        Uses VintedMappingRepository which calls the PostgreSQL function
-        get_vinted_category() for intelligent matching with attribute scoring.
+        Uses VintedMappingRepository, which runs the matching of the PostgreSQL
+        function get_vinted_category() (attribute scoring) in memory.
 
         Args:
             db: Session SQLAlchemy
@@ -463,6 +438,72 @@ class VintedMappingService:
             details.get("path")
         )
 
+    @staticmethod
+    def map_categories(
+        db: Session,
+        products: list
+    ) -> list[Tuple[Optional[int], Optional[str], Optional[str]]]:
+        """
+        Batch version of map_category for a list of products (bulk publish).
+
+        All products are matched against the in-memory VintedCategoryMatcher
+        index: no query per product, identical results to map_category.
+
+        Args:
+            db: Session SQLAlchemy
+            products: Product instances
+
+        Returns:
+            List of (vinted_id, vinted_title, vinted_path), in input order
+        """
+        from repositories.vinted_mapping_repository import VintedMappingRepository
+
+        repo = VintedMappingRepository(db)
+        details = repo.get_vinted_categories_with_details(
+            [VintedMappingService._category_attributes(product) for product in products]
+        )
+
+        return [
+            (detail.get("vinted_id"), detail.get("title"), detail.get("path"))
+            for detail in details
+        ]
+
+    @staticmethod
+    def _category_attributes(product) -> dict:
+        """
+        Category matching inputs of a product (map_category keyword arguments).
+
+        Args:
+            product: Instance de Product
+
+        Returns:
+            Dict category, gender, fit, length, rise, material (first one),
+            pattern, neckline, sleeve_length
+        """
+        # Extract category name
+        category_name = product.category if isinstance(product.category, str) else (product.category.name_en if hasattr(product.category, 'name_en') else str(product.category))
+
+        # Get material name for category matching
+        material = getattr(product, 'material', None)
+        material_name_for_category = None
+        if material:
+            if isinstance(material, list) and len(material) > 0:
+                material_name_for_category = material[0]
+            elif isinstance(material, str):
+                material_name_for_category = material
+
+        return {
+            'category': category_name,
+            'gender': product.gender or 'unisex',
+            'fit': getattr(product, 'fit', None),
+            'length': getattr(product, 'length', None),
+            'rise': getattr(product, 'rise', None),
+            'material': material_name_for_category,
+            'pattern': getattr(product, 'pattern', None),
+            'neckline': getattr(product, 'neckline', None),
+            'sleeve_length': getattr(product, 'sleeve_length', None),
+        }
+
     @staticmethod
     def _normalize_gender(gender: str) -> str:
         """
@@ -551,43 +592,64 @@ class VintedMappingService:
                 'material_ids': [303]  # Denim
             }
         """
-        # Déterminer genre et catégorie parente
-        gender = product.gender or 'unisex'
-        parent_category = product.category.parent_category if hasattr(product, 'category') and hasattr(product.category, 'parent_category') else product.category
+        # Map category using all available attributes for best match
+        category = VintedMappingService.map_category(
+            db, **VintedMappingService._category_attributes(product)
+        )
 
-        # Extract category name
-        category_name = product.category if isinstance(product.category, str) else (product.category.name_en if hasattr(product.category, 'name_en') else str(product.category))
+        return VintedMappingService._map_product_attributes(db, product, category)
 
-        # Extract all optional attributes for intelligent matching
-        fit = getattr(product, 'fit', None)
-        length = getattr(product, 'length', None)
-        rise = getattr(product, 'rise', None)
-        pattern = getattr(product, 'pattern', None)
-        neckline = getattr(product, 'neckline', None)
-        sleeve_length = getattr(product, 'sleeve_length', None)
+    @staticmethod
+    def map_all_attributes_batch(db: Session, products: list) -> List[Dict[str, Any]]:
+        """
+        Batch version of map_all_attributes, for callers converting many
+        products in one session.
 
-        # Get material name for category matching
-        material = getattr(product, 'material', None)
-        material_name_for_category = None
-        if material:
-            if isinstance(material, list) and len(material) > 0:
-                material_name_for_category = material[0]
-            elif isinstance(material, str):
-                material_name_for_category = material
+        Categories are matched in one pass (map_categories), the other
+        attributes are read from the in-memory reference catalog: no query
+        per product once the catalog and the category index are loaded.
+        Publication currently runs one product per Temporal activity, which
+        uses map_all_attributes (same catalog lookups, one product).
 
-        # Map category using all available attributes for best match
-        category_id, vinted_category_name, category_path = VintedMappingService.map_category(
-            db,
-            category_name,
-            gender,
-            fit=fit,
-            length=length,
-            rise=rise,
-            material=material_name_for_category,
-            pattern=pattern,
-            neckline=neckline,
-            sleeve_length=sleeve_length
-        )
+        Args:
+            db: Session SQLAlchemy
+            products: Product instances
+
+        Returns:
+            One map_all_attributes dict per product, in input order
+        """
+        if not products:
+            return []
+
+        categories = VintedMappingService.map_categories(db, products)
+
+        return [
+            VintedMappingService._map_product_attributes(db, product, category)
+            for product, category in zip(products, categories)
+        ]
+
+    @staticmethod
+    def _map_product_attributes(
+        db: Session,
+        product,
+        category: Tuple[Optional[int], Optional[str], Optional[str]]
+    ) -> Dict[str, Any]:
+        """
+        map_all_attributes result of a product whose category is already mapped.
+
+        Args:
+            db: Session SQLAlchemy
+            product: Instance de Product
+            category: (vinted_id, vinted_title, vinted_path) from map_category(ies)
+
+        Returns:
+            Dictionnaire des attributs mappés (voir map_all_attributes)
+        """
+        # Déterminer genre et catégorie parente
+        gender = product.gender or 'unisex'
+        parent_category = product.category.parent_category if hasattr(product, 'category') and hasattr(product.category, 'parent_category') else product.category
+
+        category_id, vinted_category_name, category_path = category
 
         # Mapping taille
         size_id = VintedMappingService.map_size(
@@ -25,6 +25,8 @@ from typing import Optional, TYPE_CHECKING
 import logging
 import re
 
+from services.listing_render_cache import listing_render_cache
+
 if TYPE_CHECKING:
     from models.user.product import Product
 
@@ -92,6 +94,14 @@ class VintedTitleService:
             >>> title = VintedTitleService.generate_title(product)
             "Levi's 501 Jean Flare Taille 36 Très Bon État Bleu Vintage 90s (A3) [2726]"
         """
+        return listing_render_cache.get_or_render(
+            product, "vinted", "title",
+            lambda: VintedTitleService._render_title(product),
+        )
+
+    @staticmethod
+    def _render_title(product: "Product") -> str:
+        """Construit le titre (sans cache, voir generate_title)."""
         # 1. Extraire les valeurs des attributs
         attributes = VintedTitleService._extract_attributes(product)
 
@@ -124,6 +124,28 @@ class WebSocketService:
         finally:
             pending_requests.pop(request_id, None)
 
+    @staticmethod
+    async def emit_to_user(user_id: int, event: str, data: dict) -> bool:
+        """
+        Emit a fire-and-forget event to all clients of a user.
+
+        Args:
+            user_id: User ID (for room targeting)
+            event: Socket.IO event name
+            data: Event payload
+
+        Returns:
+            bool: True if emitted, False if the user has no connected client
+        """
+        room = f"user_{user_id}"
+        room_sids = sio.manager.rooms.get("/", {}).get(room, set())
+
+        if not room_sids:
+            return False
+
+        await sio.emit(event, data, room=room)
+        return True
+
 
 # ===== EVENT HANDLERS =====
 
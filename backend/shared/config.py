@@ -89,6 +89,7 @@ class Settings(BaseSettings):
     # AI Services
     ai_cache_ttl_seconds: int = 2592000
     ai_cache_enabled: bool = True
+    ai_cache_max_entries: int = 100000  # LRU bound of public.ai_analysis_cache
 
     # Google Gemini Vision
     gemini_api_key: str = ""
@@ -97,6 +98,26 @@ class Settings(BaseSettings):
     gemini_timeout_seconds: int = 90           # Timeout per API call (seconds)
     gemini_max_retries: int = 1               # Max retry attempts
     gemini_retry_backoff_factor: float = 2.0  # Exponential backoff multiplier
+    gemini_max_concurrent_calls: int = 8      # Concurrent Gemini calls per process
+    gemini_max_queued_calls: int = 50         # Calls waiting for a slot before rejecting
+    gemini_queue_timeout_seconds: float = 30.0  # Max wait for a slot (seconds)
+    ai_image_download_concurrency: int = 10   # Parallel image downloads (shared pool)
+    ai_image_downscale_enabled: bool = True   # Resize images before sending to Gemini
+    ai_image_max_side: int = 1536             # Longest side sent to Gemini (pixels)
+    ai_image_workers: int = 4                 # Thread pool for Pillow resize/re-encode
+
+    # Pricing generation (BrandGroup/Model via Gemini)
+    pricing_generation_lock_timeout_seconds: float = 120.0  # Max wait for another worker's generation
+    pricing_generation_negative_ttl_seconds: int = 300      # Fallback generations cached (seconds)
+
+    # Reference catalog (product_attributes tables cached in memory)
+    reference_catalog_ttl_seconds: int = 900       # Full reload safety net (seconds)
+    reference_catalog_listen_enabled: bool = True  # LISTEN reference_data_changed (instant reload)
+
+    # Listing render cache (titles/descriptions/aspects per product version)
+    listing_render_cache_enabled: bool = True
+    listing_render_cache_max_entries: int = 20000  # LRU bound (product x marketplace)
+    listing_render_cache_ttl_seconds: int = 3600   # Bounds staleness of ebay.* translation edits
 
     # HTTP Client (Centralized timeouts)
     http_timeout_connect: float = 10.0  # Connection timeout in seconds
@@ -190,6 +211,13 @@ class Settings(BaseSettings):
     r2_bucket_name: str = "stoflow-images"
     r2_endpoint: Optional[str] = None  # https://<account_id>.r2.cloudflarestorage.com
     r2_public_url: Optional[str] = None  # https://cdn.stoflow.io or R2 public URL
+    r2_max_pool_connections: int = 20  # Shared HTTP pool of the S3 client (parallel uploads)
+
+    # Image ingestion (uploads, marketplace imports)
+    image_processing_workers: int = 4          # Thread pool for Pillow decode/resize/encode
+    vinted_image_download_concurrency: int = 4  # Photos of one product processed in parallel
+    image_variants_enabled: bool = True        # Thumbnail/medium variants generated at ingest
+    image_variant_format: str = "webp"         # Variant encoding: webp or jpeg
 
     @property
     def r2_enabled(self) -> bool:
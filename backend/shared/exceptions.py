@@ -466,6 +466,11 @@ class AIGenerationError(AIError):
     pass
 
 
+class AIServiceBusyError(AIGenerationError):
+    """Trop d'appels IA en cours (file d'attente pleine ou délai d'attente dépassé)."""
+    pass
+
+
 # ===== PRICING EXCEPTIONS =====
 
 class PricingError(ServiceError):
@@ -714,6 +719,7 @@ __all__ = [
     "AIError",
     "AIQuotaExceededError",
     "AIGenerationError",
+    "AIServiceBusyError",
 
     # Pricing
     "PricingError",
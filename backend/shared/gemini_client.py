@@ -0,0 +1,161 @@
+"""
+Gemini Client (process-wide)
+
+One reusable genai.Client per process and a concurrency limiter for all
+outbound Gemini calls (AI vision, pricing generation).
+
+- Calls use the SDK async API (client.aio), so a multi-second model call
+  never blocks the event loop (Socket.IO pings, other requests).
+- At most gemini_max_concurrent_calls calls run at the same time; others
+  wait in a bounded queue (gemini_max_queued_calls) for at most
+  gemini_queue_timeout_seconds, then AIServiceBusyError is raised.
+- Each call is bounded by gemini_timeout_seconds.
+
+Usage:
+    >>> response = await generate_content(
+    ...     model=settings.gemini_model, contents=[prompt], config=config
+    ... )
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Any, Optional
+
+from google import genai
+from google.genai import types
+
+from shared.config import settings
+from shared.exceptions import AIGenerationError, AIServiceBusyError
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+_client: Optional[genai.Client] = None
+_client_lock = threading.Lock()
+
+
+def get_gemini_client() -> genai.Client:
+    """Return the process-wide Gemini client (created on first use)."""
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = genai.Client(
+                    api_key=settings.gemini_api_key,
+                    http_options=types.HttpOptions(
+                        timeout=settings.gemini_timeout_seconds * 1000
+                    ),
+                )
+    return _client
+
+
+class GeminiCallLimiter:
+    """
+    Bounded concurrency + bounded queue for Gemini calls.
+
+    asyncio primitives are bound to one event loop, so one semaphore is kept
+    per loop (API loop, Temporal worker loops, tests).
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int,
+        max_queued: int,
+        queue_timeout: float,
+    ):
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._waiting = 0
+        self._running = 0
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrent)
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def run(self, coro_factory, timeout: float) -> Any:
+        """
+        Run coro_factory() once a slot is free.
+
+        Raises:
+            AIServiceBusyError: Queue full or no slot within queue_timeout
+            AIGenerationError: Call timeout
+        """
+        semaphore = self._semaphore()
+
+        if semaphore.locked() and self._waiting >= self.max_queued:
+            raise AIServiceBusyError(
+                "Service IA saturé. Réessayez dans quelques instants."
+            )
+
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(semaphore.acquire(), timeout=self.queue_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"[Gemini] No slot after {self.queue_timeout}s "
+                f"(running={self._running}, waiting={self._waiting})"
+            )
+            raise AIServiceBusyError(
+                "Service IA saturé. Réessayez dans quelques instants."
+            )
+        finally:
+            self._waiting -= 1
+
+        self._running += 1
+        try:
+            return await asyncio.wait_for(coro_factory(), timeout=timeout)
+        except asyncio.TimeoutError:
+            raise AIGenerationError(f"Délai dépassé pour l'appel Gemini ({timeout}s)")
+        finally:
+            self._running -= 1
+            semaphore.release()
+
+    def stats(self) -> dict:
+        return {"running": self._running, "waiting": self._waiting}
+
+
+gemini_limiter = GeminiCallLimiter(
+    max_concurrent=settings.gemini_max_concurrent_calls,
+    max_queued=settings.gemini_max_queued_calls,
+    queue_timeout=settings.gemini_queue_timeout_seconds,
+)
+
+
+async def generate_content(
+    model: str,
+    contents: list,
+    config: Optional[types.GenerateContentConfig] = None,
+    client: Optional[genai.Client] = None,
+) -> types.GenerateContentResponse:
+    """
+    Non-blocking generate_content through the shared client and limiter.
+
+    Args:
+        model: Gemini model name
+        contents: Prompt parts (text, images)
+        config: Generation config
+        client: Client override (defaults to the process-wide client)
+
+    Returns:
+        GenerateContentResponse
+    """
+    gemini = client or get_gemini_client()
+    return await gemini_limiter.run(
+        lambda: gemini.aio.models.generate_content(
+            model=model, contents=contents, config=config
+        ),
+        timeout=settings.gemini_timeout_seconds,
+    )
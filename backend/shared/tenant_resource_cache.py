@@ -0,0 +1,122 @@
+"""
+Tenant Resource Cache
+
+Process-wide TTL cache for per-tenant setup data that is expensive to
+rebuild on every Temporal activity: marketplace credentials, marketplace
+configuration, reference mappings...
+
+Entries are keyed by (user_id, marketplace, name). user_id=None is used for
+reference data shared by all tenants.
+
+Only plain values or detached ORM objects must be stored: cached values
+outlive the DB session that loaded them.
+
+Invalidation:
+- TTL (default 5 min)
+- invalidate(user_id, marketplace) on credential change (OAuth connect,
+  disconnect, refresh token rotation)
+
+Author: Claude
+Date: 2026-02-03
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from shared.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+CacheKey = Tuple[Optional[int], str, str]
+
+
+class TenantResourceCache:
+    """
+    Thread-safe TTL cache (sync activities run in a thread pool).
+
+    Usage:
+        >>> creds = tenant_resource_cache.get_or_load(
+        ...     user_id, "ebay", "credentials", lambda: load_credentials(db)
+        ... )
+    """
+
+    DEFAULT_TTL_SECONDS = 300
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[CacheKey, Tuple[Any, float]] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._load_seconds = 0.0
+
+    def get_or_load(
+        self,
+        user_id: Optional[int],
+        marketplace: str,
+        name: str,
+        loader: Callable[[], T],
+    ) -> T:
+        """
+        Return the cached value or load it with loader().
+
+        Loader exceptions are propagated and nothing is cached.
+        """
+        key = (user_id, marketplace, name)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[1] < self.ttl_seconds:
+                self._hits += 1
+                return entry[0]
+
+        # Load outside the lock (DB query); concurrent loaders are harmless
+        start = time.perf_counter()
+        value = loader()
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._misses += 1
+            self._load_seconds += elapsed
+
+        return value
+
+    def invalidate(self, user_id: Optional[int], marketplace: Optional[str] = None) -> None:
+        """Drop all entries of a tenant (optionally for one marketplace only)."""
+        with self._lock:
+            for key in [
+                k for k in self._entries
+                if k[0] == user_id and (marketplace is None or k[1] == marketplace)
+            ]:
+                del self._entries[key]
+
+        logger.debug(f"[TenantResourceCache] Invalidated user={user_id} marketplace={marketplace}")
+
+    def clear(self) -> None:
+        """Drop all entries and reset stats."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._load_seconds = 0.0
+
+    def stats(self) -> dict:
+        """Hit/miss counters and average load time (setup overhead on miss)."""
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / total, 3) if total else 0.0,
+                "avg_load_ms": round(self._load_seconds * 1000 / self._misses, 2) if self._misses else 0.0,
+            }
+
+
+# Global instance (shared by the in-process Temporal workers)
+tenant_resource_cache = TenantResourceCache()
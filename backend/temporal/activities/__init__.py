@@ -21,6 +21,7 @@ from temporal.activities.ebay_activities import (
 from temporal.activities.vinted_activities import (
     fetch_and_sync_page as vinted_fetch_and_sync_page,
     get_vinted_ids_to_enrich,
+    count_vinted_ids_to_enrich,
     enrich_single_product as vinted_enrich_single_product,
     scan_pro_sellers_page,
     save_pro_sellers_batch,
@@ -72,6 +73,14 @@ from temporal.activities.etsy_action_activities import (
     ETSY_ACTION_ACTIVITIES,
 )
 
+# ── AI activities ───────────────────────────────────────────────
+
+from temporal.activities.ai_activities import (
+    ai_analyze_product,
+    ai_release_credits,
+    AI_ACTIVITIES,
+)
+
 __all__ = [
     # eBay sync activities
     "EBAY_ACTIVITIES",
@@ -89,6 +98,7 @@ __all__ = [
     "VINTED_ACTIVITIES",
     "vinted_fetch_and_sync_page",
     "get_vinted_ids_to_enrich",
+    "count_vinted_ids_to_enrich",
     "vinted_enrich_single_product",
     "vinted_check_plugin_connection",
     "vinted_sync_sold_status",
@@ -123,4 +133,8 @@ __all__ = [
     "etsy_publish_product",
     "etsy_update_product",
     "etsy_delete_product",
+    # AI activities
+    "AI_ACTIVITIES",
+    "ai_analyze_product",
+    "ai_release_credits",
 ]
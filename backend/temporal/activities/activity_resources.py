@@ -0,0 +1,102 @@
+"""
+Sticky per-tenant resources for Temporal activities.
+
+Every activity opens its own DB session, so eBay clients (which keep a
+reference to that session) cannot be shared between activities. What IS
+shared is everything needed to build them, cached in tenant_resource_cache:
+
+- eBay credentials snapshot (per user)       -> 1 query saved per client
+- MarketplaceConfig, detached (shared)        -> 1 query saved per client
+- AspectMapping reverse map (shared)          -> full table scan saved per importer
+
+With a warm cache, building an EbayImporter costs 0 queries instead of 5
+(2 clients x (credentials + marketplace config) + aspect mappings).
+
+Invalidation: TTL, OAuth callback/disconnect and refresh token rotation
+(see EbayBaseClient._update_refresh_token_in_db).
+
+Vinted activities have nothing to cache here: VintedDataExtractor is
+stateless (static parsing methods, no DB access) and Vinted calls go
+through the browser plugin, so there are no worker-side credentials or
+marketplace config to load.
+
+Author: Claude
+Date: 2026-02-03
+"""
+
+from typing import Optional, Type, TypeVar
+
+from sqlalchemy.orm import Session
+
+from models.public.ebay_aspect_mapping import AspectMapping
+from models.public.ebay_marketplace_config import MarketplaceConfig
+from models.user.ebay_credentials import EbayCredentials
+from services.ebay.ebay_base_client import EbayBaseClient, EbayCredentialsSnapshot
+from services.ebay.ebay_importer import EbayImporter
+from shared.tenant_resource_cache import tenant_resource_cache
+
+ClientT = TypeVar("ClientT", bound=EbayBaseClient)
+
+EBAY = "ebay"
+
+
+def get_ebay_credentials(db: Session, user_id: int) -> Optional[EbayCredentialsSnapshot]:
+    """Cached eBay credentials snapshot (None if the user has no eBay account)."""
+
+    def load() -> Optional[EbayCredentialsSnapshot]:
+        creds = db.query(EbayCredentials).first()
+        return EbayCredentialsSnapshot.from_model(creds) if creds else None
+
+    snapshot = tenant_resource_cache.get_or_load(user_id, EBAY, "credentials", load)
+    if snapshot is None:
+        # Do not keep a negative entry: the user may connect at any time
+        tenant_resource_cache.invalidate(user_id, EBAY)
+    return snapshot
+
+
+def get_marketplace_config(db: Session, marketplace_id: str) -> Optional[MarketplaceConfig]:
+    """Cached MarketplaceConfig, detached from the loading session."""
+
+    def load() -> Optional[MarketplaceConfig]:
+        config = (
+            db.query(MarketplaceConfig)
+            .filter(MarketplaceConfig.marketplace_id == marketplace_id)
+            .first()
+        )
+        if config is not None:
+            db.expunge(config)
+        return config
+
+    return tenant_resource_cache.get_or_load(None, EBAY, f"marketplace_config:{marketplace_id}", load)
+
+
+def get_aspect_reverse_map(db: Session) -> dict:
+    """Cached AspectMapping reverse map (localized aspect name -> aspect_key)."""
+    return tenant_resource_cache.get_or_load(
+        None, EBAY, "aspect_reverse_map", lambda: AspectMapping.get_reverse_mapping(db)
+    )
+
+
+def build_ebay_client(
+    client_cls: Type[ClientT], db: Session, user_id: int, marketplace_id: str
+) -> ClientT:
+    """Build an eBay client bound to db from cached credentials/config."""
+    return client_cls(
+        db,
+        user_id,
+        marketplace_id,
+        credentials=get_ebay_credentials(db, user_id),
+        marketplace_config=get_marketplace_config(db, marketplace_id),
+    )
+
+
+def build_ebay_importer(db: Session, user_id: int, marketplace_id: str) -> EbayImporter:
+    """Build an EbayImporter bound to db from cached resources."""
+    return EbayImporter(
+        db,
+        user_id,
+        marketplace_id,
+        credentials=get_ebay_credentials(db, user_id),
+        marketplace_config=get_marketplace_config(db, marketplace_id),
+        aspect_reverse_map=get_aspect_reverse_map(db),
+    )
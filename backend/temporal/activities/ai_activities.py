@@ -0,0 +1,151 @@
+"""
+AI Activities for Temporal.
+
+Activities of the AI batch analysis workflow (AIBatchAnalysisWorkflow):
+- ai_analyze_product: analyze one product with AIVisionService (credit
+  already reserved by the batch) and push the result to the user via Socket.IO
+- ai_release_credits: give back the reserved credits that were not consumed
+
+ai_analyze_product is an `async def` activity: the Gemini calls are async and
+go through the process-wide limiter (shared/gemini_client.py), so the batch
+never exceeds gemini_max_concurrent_calls whatever max_parallel is.
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+from sqlalchemy import text
+from temporalio import activity
+
+from shared.database import SessionLocal
+from shared.exceptions import AIError, AIServiceBusyError
+from shared.logging import get_logger
+from shared.schema import configure_schema_translate_map
+
+logger = get_logger(__name__)
+
+# Socket.IO event pushed for each analyzed product
+AI_BATCH_RESULT_EVENT = "ai_batch_result"
+
+
+def _get_schema_name(user_id: int) -> str:
+    """Get schema name for user."""
+    return f"user_{user_id}"
+
+
+def _configure_session(db, user_id: int) -> None:
+    """Configure DB session for user schema."""
+    schema_name = _get_schema_name(user_id)
+    configure_schema_translate_map(db, schema_name)
+    db.execute(text(f"SET search_path TO {schema_name}, public"))
+
+
+async def _emit_result(user_id: int, payload: dict) -> None:
+    """Push one item result to the user (best effort)."""
+    from services.websocket_service import WebSocketService
+
+    try:
+        await WebSocketService.emit_to_user(user_id, AI_BATCH_RESULT_EVENT, payload)
+    except Exception as e:
+        logger.warning(f"[ai_analyze_product] Socket.IO push failed for user {user_id}: {e}")
+
+
+@activity.defn(name="ai_analyze_product")
+async def ai_analyze_product(user_id: int, product_id: int, max_images: int = 5) -> dict:
+    """
+    Analyze the images of one product (credit reserved by the batch).
+
+    AIServiceBusyError is raised so that Temporal retries the item later;
+    other AI errors are returned as a failed item (retrying would not help).
+
+    Args:
+        user_id: User ID
+        product_id: Product ID
+        max_images: Max images per analysis (subscription)
+
+    Returns:
+        dict: {"success", "cached", "tokens_used", "error"}
+    """
+    from services.ai import AIVisionService
+    from services.product_service import ProductService
+
+    workflow_id = activity.info().workflow_id
+    db = SessionLocal()
+    try:
+        _configure_session(db, user_id)
+
+        product = ProductService.get_product_by_id(db, product_id)
+        if not product:
+            result = {"success": False, "cached": False, "tokens_used": 0,
+                      "error": f"Product {product_id} not found"}
+        else:
+            attributes, tokens_used, _, _ = await AIVisionService.analyze_images(
+                db=db,
+                product=product,
+                user_id=user_id,
+                max_images=max_images,
+                credits_reserved=True,
+            )
+            result = {"success": True, "cached": tokens_used == 0,
+                      "tokens_used": tokens_used, "error": None}
+            await _emit_result(user_id, {
+                "workflow_id": workflow_id,
+                "product_id": product_id,
+                "status": "completed",
+                "cached": result["cached"],
+                "attributes": attributes.model_dump(mode="json"),
+                "error": None,
+            })
+            return result
+
+    except AIServiceBusyError:
+        db.rollback()
+        raise
+    except AIError as e:
+        db.rollback()
+        logger.warning(f"[ai_analyze_product] product {product_id} failed: {e}")
+        result = {"success": False, "cached": False, "tokens_used": 0, "error": str(e)}
+    finally:
+        db.close()
+
+    await _emit_result(user_id, {
+        "workflow_id": workflow_id,
+        "product_id": product_id,
+        "status": "failed",
+        "cached": False,
+        "attributes": None,
+        "error": result["error"],
+    })
+    return result
+
+
+@activity.defn(name="ai_release_credits")
+def ai_release_credits(user_id: int, count: int) -> dict:
+    """
+    Give back reserved AI credits that the batch did not consume.
+
+    Args:
+        user_id: User ID
+        count: Number of credits to release
+
+    Returns:
+        dict: {"success", "released", "error"}
+    """
+    from services.ai import AIVisionService
+
+    db = SessionLocal()
+    try:
+        AIVisionService.release_credits(db, user_id, count)
+        return {"success": True, "released": max(count, 0), "error": None}
+    except Exception as e:
+        db.rollback()
+        logger.error(f"[ai_release_credits] user {user_id}: {e}", exc_info=True)
+        raise
+    finally:
+        db.close()
+
+
+AI_ACTIVITIES = [
+    ai_analyze_product,
+    ai_release_credits,
+]
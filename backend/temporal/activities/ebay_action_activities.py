@@ -28,6 +28,7 @@ from temporalio import activity
 from shared.database import SessionLocal
 from shared.logging import get_logger
 from shared.schema import configure_schema_translate_map
+from temporal.activities.activity_resources import build_ebay_importer
 
 logger = get_logger(__name__)
 
@@ -276,13 +277,7 @@ def ebay_import_inventory_page(
     try:
         _configure_session(db, user_id)
 
-        from services.ebay.ebay_importer import EbayImporter
-
-        importer = EbayImporter(
-            db=db,
-            user_id=user_id,
-            marketplace_id=marketplace_id,
-        )
+        importer = build_ebay_importer(db, user_id, marketplace_id)
 
         # Fetch one page of inventory
         result = importer.inventory_client.get_inventory_items(
@@ -384,14 +379,9 @@ def ebay_enrich_products_batch(
         _configure_session(db, user_id)
 
         from models.user.ebay_product import EbayProduct
-        from services.ebay.ebay_importer import EbayImporter
         from shared.datetime_utils import utc_now
 
-        importer = EbayImporter(
-            db=db,
-            user_id=user_id,
-            marketplace_id=marketplace_id,
-        )
+        importer = build_ebay_importer(db, user_id, marketplace_id)
 
         # Pre-fetch access token BEFORE parallel threads
         try:
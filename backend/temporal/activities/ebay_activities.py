@@ -27,6 +27,7 @@ from sqlalchemy import text
 from temporalio import activity
 
 from shared.database import SessionLocal
+from temporal.activities.activity_resources import build_ebay_client, build_ebay_importer
 from shared.logging import get_logger
 from shared.schema import configure_schema_translate_map
 
@@ -85,13 +86,12 @@ def fetch_and_sync_page(
         # Import here to avoid circular imports
         from models.user.ebay_product import EbayProduct
         from services.ebay.ebay_inventory_client import EbayInventoryClient
-        from services.ebay.ebay_importer import EbayImporter
 
         # Parse sync_start_time
         sync_time = datetime.fromisoformat(sync_start_time.replace("Z", "+00:00"))
 
         # Fetch page from eBay
-        client = EbayInventoryClient(db, user_id, marketplace_id)
+        client = build_ebay_client(EbayInventoryClient, db, user_id, marketplace_id)
         result = client.get_inventory_items(limit=limit, offset=offset)
 
         items = result.get("inventoryItems", [])
@@ -108,7 +108,7 @@ def fetch_and_sync_page(
             }
 
         # Initialize importer for data extraction
-        importer = EbayImporter(db, user_id, marketplace_id)
+        importer = build_ebay_importer(db, user_id, marketplace_id)
 
         synced = 0
         errors = 0
@@ -242,7 +242,7 @@ def enrich_single_product(
         if not product:
             return {"success": False, "sku": sku, "error": "not_found"}
 
-        client = EbayOfferClient(db, user_id, marketplace_id)
+        client = build_ebay_client(EbayOfferClient, db, user_id, marketplace_id)
 
         try:
             # Get offers for this SKU
@@ -405,7 +405,7 @@ def delete_single_product(
         if not product:
             return {"success": False, "sku": sku, "error": "not_found"}
 
-        client = EbayInventoryClient(db, user_id, marketplace_id)
+        client = build_ebay_client(EbayInventoryClient, db, user_id, marketplace_id)
 
         try:
             # Step 1: Delete from eBay inventory
@@ -666,7 +666,7 @@ def apply_policy_to_single_offer(
 
         from services.ebay.ebay_offer_client import EbayOfferClient
 
-        client = EbayOfferClient(db, user_id, marketplace_id)
+        client = build_ebay_client(EbayOfferClient, db, user_id, marketplace_id)
 
         # Fetch full offer from eBay
         offer = client.get_offer(offer_id)
@@ -738,7 +738,7 @@ def delete_ebay_listing(user_id: int, product_id: int, marketplace_id: str = "EB
             return {"success": False, "product_id": product_id, "error": "not_found"}
 
         sku = ebay_product.ebay_sku
-        client = EbayInventoryClient(db, user_id, marketplace_id)
+        client = build_ebay_client(EbayInventoryClient, db, user_id, marketplace_id)
 
         try:
             client.delete_inventory_item(sku)
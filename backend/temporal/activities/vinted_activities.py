@@ -11,7 +11,8 @@ Activities handle their own DB sessions since they run in the worker process.
 
 Architecture:
 - fetch_and_sync_page: Fetch one page from Vinted via plugin and upsert to DB
-- get_vinted_ids_to_enrich: Get batch of vinted_ids to enrich
+- get_vinted_ids_to_enrich: Get batch of vinted_ids to enrich (cursor-based)
+- count_vinted_ids_to_enrich: Count vinted_ids to enrich (progress total)
 - enrich_single_product: Enrich one product via item_upload API
 
 Job state management: see job_state_activities.py
@@ -332,22 +333,44 @@ def _extract_product_data(api_product: dict, extractor) -> dict:
     }
 
 
+def _enrich_candidates_query(db, sync_start_time: str):
+    """Query of vinted_ids synced in this session that still need enrichment."""
+    from models.user.vinted_product import VintedProduct
+
+    sync_time = datetime.fromisoformat(sync_start_time.replace("Z", "+00:00"))
+
+    return db.query(VintedProduct.vinted_id).filter(
+        VintedProduct.updated_at >= sync_time,
+        (VintedProduct.description.is_(None)) | (VintedProduct.description == ""),
+        VintedProduct.status.notin_(["sold", "deleted"]),
+        VintedProduct.is_closed == False,
+        VintedProduct.is_hidden == False,
+    )
+
+
 @activity.defn(name="vinted_get_ids_to_enrich")
 async def get_vinted_ids_to_enrich(
     user_id: int,
     sync_start_time: str,
+    after_vinted_id: int = 0,
+    limit: Optional[int] = None,
 ) -> list[int]:
     """
-    Get all vinted_ids to enrich from the current sync session.
+    Get vinted_ids to enrich from the current sync session.
 
     Filters products that:
     - Were synced in this session (last_synced_at >= sync_start_time)
     - Don't have a description yet
     - Are not sold/deleted/closed/hidden
 
+    IDs are returned in ascending order, so the workflow only needs the
+    last processed vinted_id as a cursor (after_vinted_id) to resume.
+
     Args:
         user_id: User ID for schema isolation
         sync_start_time: ISO timestamp
+        after_vinted_id: Only return vinted_ids greater than this cursor
+        limit: Max number of IDs (None = all)
 
     Returns:
         List of vinted_ids to enrich
@@ -358,22 +381,42 @@ async def get_vinted_ids_to_enrich(
 
         from models.user.vinted_product import VintedProduct
 
-        sync_time = datetime.fromisoformat(sync_start_time.replace("Z", "+00:00"))
-
-        products = (
-            db.query(VintedProduct.vinted_id)
-            .filter(
-                VintedProduct.updated_at >= sync_time,
-                (VintedProduct.description.is_(None)) | (VintedProduct.description == ""),
-                VintedProduct.status.notin_(["sold", "deleted"]),
-                VintedProduct.is_closed == False,
-                VintedProduct.is_hidden == False,
-            )
+        query = (
+            _enrich_candidates_query(db, sync_start_time)
+            .filter(VintedProduct.vinted_id > after_vinted_id)
             .order_by(VintedProduct.vinted_id)
-            .all()
         )
+        if limit is not None:
+            query = query.limit(limit)
 
-        return [p.vinted_id for p in products]
+        return [p.vinted_id for p in query.all()]
+
+    finally:
+        db.close()
+
+
+@activity.defn(name="vinted_count_ids_to_enrich")
+async def count_vinted_ids_to_enrich(
+    user_id: int,
+    sync_start_time: str,
+) -> int:
+    """
+    Count vinted_ids to enrich from the current sync session.
+
+    Used for progress (total) without putting the full ID list in the
+    workflow history.
+
+    Args:
+        user_id: User ID for schema isolation
+        sync_start_time: ISO timestamp
+
+    Returns:
+        Number of products to enrich
+    """
+    db = SessionLocal()
+    try:
+        configure_activity_session(db, user_id)
+        return _enrich_candidates_query(db, sync_start_time).count()
 
     finally:
         db.close()
@@ -729,8 +772,6 @@ async def update_keyword_scan_log(
     """
     from datetime import datetime, timezone
 
-    from sqlalchemy import text
-
     from shared.database import get_db_context
 
     with get_db_context() as db:
@@ -779,6 +820,7 @@ PRO_SELLER_ACTIVITIES = [
 VINTED_ACTIVITIES = [
     fetch_and_sync_page,
     get_vinted_ids_to_enrich,
+    count_vinted_ids_to_enrich,
     enrich_single_product,
     *JOB_STATE_ACTIVITIES,
     *VINTED_RECONCILIATION_ACTIVITIES,
@@ -10,6 +10,7 @@ from typing import Optional
 from temporalio.client import Client
 
 from temporal.config import get_temporal_config
+from temporal.search_attributes import SearchAttributesInterceptor, ensure_search_attributes
 
 logger = logging.getLogger(__name__)
 
@@ -50,8 +51,12 @@ async def get_temporal_client() -> Client:
             _temporal_client = await Client.connect(
                 config.temporal_host,
                 namespace=config.temporal_namespace,
+                interceptors=[SearchAttributesInterceptor()],
             )
             logger.info("Successfully connected to Temporal server")
+
+            # Indexed listing (UserId/Marketplace/ActionType search attributes)
+            await ensure_search_attributes(_temporal_client, config.temporal_namespace)
         except Exception as e:
             logger.error(
                 "Failed to connect to Temporal server",
@@ -98,6 +98,25 @@ class TemporalConfig(BaseSettings):
         description="Enable Temporal workflows (can disable for fallback)"
     )
 
+    # Progress push (Socket.IO)
+    temporal_progress_push_enabled: bool = Field(
+        default=True,
+        description="Push workflow progress to the user's Socket.IO room"
+    )
+    temporal_progress_push_min_interval_ms: int = Field(
+        default=250,
+        description="Min delay between two progress events of the same workflow (coalescing)"
+    )
+
+    # Workflow listing (custom search attributes)
+    temporal_list_legacy_executions: bool = Field(
+        default=True,
+        description=(
+            "Also list executions started before the search attributes were "
+            "registered (no UserId); disable once they are past the namespace retention"
+        )
+    )
+
     @property
     def worker_identity(self) -> str:
         """Get worker identity, auto-generate if not set."""
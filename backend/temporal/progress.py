@@ -0,0 +1,321 @@
+"""
+Workflow progress push module.
+
+Pushes Temporal workflow progress to the user's Socket.IO room instead of
+having the frontend poll GET /workflows/{workflow_id}/progress.
+
+How it works:
+- WorkflowProgressInterceptor is installed on every worker. Each activity
+  completion and each signal marks the workflow dirty; a background
+  workflow task waits on that flag with workflow.wait_condition(), which
+  Temporal only evaluates once the ready workflow code has run, so the
+  snapshot of the workflow's own get_progress() query handler includes the
+  counters updated for that activity. The end of the run is published
+  directly. Workflows therefore need no change.
+- WorkflowProgressPublisher coalesces snapshots per workflow (latest wins)
+  and emits at most one "workflow_progress" event per min interval.
+  Terminal statuses are flushed immediately. Throttle timestamps of
+  workflows that ended without a terminal snapshot are evicted by age.
+
+Nothing is recorded in workflow history (no activity, no side effect
+command), and nothing is emitted during replay. The poll endpoint remains
+the fallback when the socket is not connected.
+
+Author: Claude
+Date: 2026-02-02
+Updated: 2026-02-04 - Publish after workflow code runs, evict throttle timestamps by age
+"""
+
+import asyncio
+import logging
+import re
+import time
+from typing import Any, Dict, Optional, Tuple, Type
+
+from temporalio import workflow
+from temporalio.worker import (
+    ExecuteWorkflowInput,
+    HandleSignalInput,
+    Interceptor,
+    StartActivityInput,
+    WorkflowInboundInterceptor,
+    WorkflowInterceptorClassInput,
+    WorkflowOutboundInterceptor,
+)
+
+from temporal.config import get_temporal_config
+
+logger = logging.getLogger(__name__)
+
+# Socket.IO event name listened to by the frontend (useWorkflows.ts)
+WORKFLOW_PROGRESS_EVENT = "workflow_progress"
+
+# Statuses that end a workflow - always flushed without waiting
+TERMINAL_STATUSES = {"completed", "failed", "cancelled", "error"}
+
+# Interval between sweeps of stale throttle timestamps (_last_emit)
+LAST_EMIT_SWEEP_SECONDS = 60.0
+
+_USER_ID_PATTERN = re.compile(r"user-(\d+)")
+
+
+def extract_user_id(workflow_id: str, args: Tuple[Any, ...] = ()) -> Optional[int]:
+    """
+    Resolve the owner of a workflow.
+
+    Prefers the user_id of the workflow params dataclass, then falls back
+    to the workflow ID convention: {marketplace}-{action}-user-{id}-...
+
+    Args:
+        workflow_id: Temporal workflow ID
+        args: Workflow run arguments
+
+    Returns:
+        User ID or None if it cannot be determined
+    """
+    if args:
+        user_id = getattr(args[0], "user_id", None)
+        if isinstance(user_id, int):
+            return user_id
+
+    match = _USER_ID_PATTERN.search(workflow_id)
+    if match:
+        return int(match.group(1))
+    return None
+
+
+class WorkflowProgressPublisher:
+    """
+    Coalescing publisher for workflow progress events.
+
+    publish() is thread-safe: workflow code runs in worker threads, the
+    Socket.IO server lives on the application event loop.
+    """
+
+    def __init__(self, min_interval_seconds: float = 0.25):
+        self.min_interval_seconds = min_interval_seconds
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # workflow_id -> (user_id, payload) waiting to be emitted
+        self._pending: Dict[str, Tuple[int, dict]] = {}
+        # workflow_id -> monotonic time of last emit
+        self._last_emit: Dict[str, float] = {}
+        # workflow_id -> scheduled flush handle
+        self._scheduled: Dict[str, asyncio.TimerHandle] = {}
+        self._last_sweep = time.monotonic()
+
+    def bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Bind the event loop running the Socket.IO server."""
+        self._loop = loop
+
+    @property
+    def is_bound(self) -> bool:
+        return self._loop is not None and not self._loop.is_closed()
+
+    def publish(self, user_id: int, workflow_id: str, payload: dict) -> None:
+        """
+        Queue a progress snapshot (latest wins).
+
+        Safe to call from any thread. Silently ignored if no loop is bound.
+        """
+        if not self.is_bound:
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._enqueue, user_id, workflow_id, payload)
+        except RuntimeError:
+            # Loop closed during shutdown
+            pass
+
+    def _enqueue(self, user_id: int, workflow_id: str, payload: dict) -> None:
+        """Store snapshot and schedule a flush (runs on the bound loop)."""
+        self._pending[workflow_id] = (user_id, payload)
+
+        if payload.get("status") in TERMINAL_STATUSES:
+            handle = self._scheduled.pop(workflow_id, None)
+            if handle:
+                handle.cancel()
+            self._flush(workflow_id, final=True)
+            return
+
+        if workflow_id in self._scheduled:
+            return
+
+        elapsed = time.monotonic() - self._last_emit.get(workflow_id, 0.0)
+        delay = max(0.0, self.min_interval_seconds - elapsed)
+        self._scheduled[workflow_id] = self._loop.call_later(
+            delay, self._flush, workflow_id
+        )
+
+    def _flush(self, workflow_id: str, final: bool = False) -> None:
+        """Emit the latest pending snapshot for a workflow."""
+        self._scheduled.pop(workflow_id, None)
+        entry = self._pending.pop(workflow_id, None)
+
+        if final:
+            self._last_emit.pop(workflow_id, None)
+        else:
+            now = time.monotonic()
+            self._last_emit[workflow_id] = now
+            if now - self._last_sweep >= LAST_EMIT_SWEEP_SECONDS:
+                self._evict_stale(now)
+
+        if entry is None:
+            return
+
+        user_id, payload = entry
+        self._loop.create_task(self._emit(user_id, payload))
+
+    def _evict_stale(self, now: float) -> None:
+        """
+        Drop throttle timestamps older than the min interval.
+
+        They no longer delay anything; without this, workflows that end
+        without a terminal snapshot (worker restart, eviction) would stay
+        in _last_emit forever.
+        """
+        self._last_sweep = now
+        stale = [
+            workflow_id
+            for workflow_id, emitted_at in self._last_emit.items()
+            if now - emitted_at >= self.min_interval_seconds
+            and workflow_id not in self._scheduled
+        ]
+        for workflow_id in stale:
+            del self._last_emit[workflow_id]
+
+    async def _emit(self, user_id: int, payload: dict) -> None:
+        from services.websocket_service import WebSocketService
+
+        try:
+            await WebSocketService.emit_to_user(user_id, WORKFLOW_PROGRESS_EVENT, payload)
+        except Exception as e:
+            logger.debug(f"Failed to push progress for {payload.get('workflow_id')}: {e}")
+
+
+# Global publisher instance
+_publisher: Optional[WorkflowProgressPublisher] = None
+
+
+def get_progress_publisher() -> WorkflowProgressPublisher:
+    """Get or create the global progress publisher."""
+    global _publisher
+    if _publisher is None:
+        config = get_temporal_config()
+        _publisher = WorkflowProgressPublisher(
+            min_interval_seconds=config.temporal_progress_push_min_interval_ms / 1000
+        )
+    return _publisher
+
+
+# ===== INTERCEPTOR =====
+
+
+class _ProgressWorkflowInbound(WorkflowInboundInterceptor):
+    """Reads get_progress() at each meaningful workflow step and publishes it."""
+
+    def __init__(self, next: WorkflowInboundInterceptor, publisher: WorkflowProgressPublisher):
+        super().__init__(next)
+        self._publisher = publisher
+        self._instance: Any = None
+        self._user_id: Optional[int] = None
+        self._dirty = False
+
+    def init(self, outbound: WorkflowOutboundInterceptor) -> None:
+        super().init(_ProgressWorkflowOutbound(outbound, self))
+
+    async def execute_workflow(self, input: ExecuteWorkflowInput) -> Any:
+        self._instance = getattr(input.run_fn, "__self__", None)
+        self._user_id = extract_user_id(workflow.info().workflow_id, input.args)
+        publish_task = asyncio.create_task(self._publish_when_dirty())
+        try:
+            return await super().execute_workflow(input)
+        finally:
+            publish_task.cancel()
+            self.publish_progress()
+
+    async def handle_signal(self, input: HandleSignalInput) -> None:
+        await super().handle_signal(input)
+        self.mark_dirty()
+
+    def mark_dirty(self) -> None:
+        """Request a publish once the workflow code has handled the event."""
+        self._dirty = True
+
+    async def _publish_when_dirty(self) -> None:
+        """
+        Publish on the next dirty flag, after the ready workflow code ran.
+
+        wait_condition() adds no command to the history: it is evaluated by
+        the workflow event loop once no workflow coroutine is ready, i.e.
+        after the code awaiting the activity has updated its counters.
+        """
+        while True:
+            await workflow.wait_condition(lambda: self._dirty)
+            self._dirty = False
+            self.publish_progress()
+
+    def publish_progress(self) -> None:
+        """Snapshot get_progress() and hand it to the publisher (never raises)."""
+        if self._user_id is None or self._instance is None:
+            return
+        if workflow.unsafe.is_replaying():
+            return
+
+        get_progress = getattr(self._instance, "get_progress", None)
+        if get_progress is None:
+            return
+
+        try:
+            progress = dict(get_progress())
+        except Exception:
+            return
+
+        info = workflow.info()
+        progress["workflow_id"] = info.workflow_id
+        progress["workflow_type"] = info.workflow_type
+        self._publisher.publish(self._user_id, info.workflow_id, progress)
+
+
+class _ProgressWorkflowOutbound(WorkflowOutboundInterceptor):
+    """Marks progress dirty once each activity resolves."""
+
+    def __init__(self, next: WorkflowOutboundInterceptor, inbound: _ProgressWorkflowInbound):
+        super().__init__(next)
+        self._inbound = inbound
+
+    def start_activity(self, input: StartActivityInput) -> workflow.ActivityHandle:
+        handle = super().start_activity(input)
+        handle.add_done_callback(lambda _: self._inbound.mark_dirty())
+        return handle
+
+
+class WorkflowProgressInterceptor(Interceptor):
+    """Worker interceptor pushing workflow progress over Socket.IO."""
+
+    def __init__(self, publisher: Optional[WorkflowProgressPublisher] = None):
+        self._publisher = publisher or get_progress_publisher()
+
+    def workflow_interceptor_class(
+        self, input: WorkflowInterceptorClassInput
+    ) -> Optional[Type[WorkflowInboundInterceptor]]:
+        publisher = self._publisher
+
+        class _Inbound(_ProgressWorkflowInbound):
+            def __init__(self, next: WorkflowInboundInterceptor):
+                super().__init__(next, publisher)
+
+        return _Inbound
+
+
+def get_worker_interceptors() -> list:
+    """
+    Build the interceptor list for a Temporal Worker.
+
+    Must be called from the application event loop (binds the publisher).
+    """
+    config = get_temporal_config()
+    if not config.temporal_progress_push_enabled:
+        return []
+
+    publisher = get_progress_publisher()
+    publisher.bind_loop(asyncio.get_running_loop())
+    return [WorkflowProgressInterceptor(publisher)]
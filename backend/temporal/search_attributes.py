@@ -0,0 +1,234 @@
+"""
+Temporal custom search attributes module.
+
+Every workflow is started with three indexed search attributes:
+- UserId (Int): owner of the workflow
+- Marketplace (Keyword): vinted, ebay, etsy
+- ActionType (Keyword): action derived from the workflow type
+  (VintedPublishWorkflow -> "publish", EbayOrdersSyncWorkflow -> "orderssync")
+
+They are set by SearchAttributesInterceptor at start time (client side), so
+no call site has to pass them and they are visible as soon as the workflow
+exists. Listing then uses an indexed equality query instead of
+WorkflowId/WorkflowType LIKE scans.
+
+Executions started before the attributes were registered have no UserId:
+build_list_query() ORs a legacy clause (UserId IS NULL + WorkflowId LIKE +
+WorkflowType IN) for them until they age out of the namespace retention.
+
+Author: Claude
+Date: 2026-02-02
+Updated: 2026-02-04 - Legacy clause for executions without UserId, explicit types (AI)
+"""
+
+import logging
+import re
+from typing import Any, Iterable, Optional, Sequence, Tuple
+
+from temporalio.api.enums.v1 import IndexedValueType
+from temporalio.api.operatorservice.v1 import (
+    AddSearchAttributesRequest,
+    ListSearchAttributesRequest,
+)
+from temporalio.client import (
+    Client,
+    Interceptor,
+    OutboundInterceptor,
+    StartWorkflowInput,
+    WorkflowHandle,
+)
+from temporalio.common import SearchAttributeKey, SearchAttributePair, TypedSearchAttributes
+
+logger = logging.getLogger(__name__)
+
+USER_ID = SearchAttributeKey.for_int("UserId")
+MARKETPLACE = SearchAttributeKey.for_keyword("Marketplace")
+ACTION_TYPE = SearchAttributeKey.for_keyword("ActionType")
+
+# Registration types (operator API)
+_ATTRIBUTE_TYPES = {
+    USER_ID.name: IndexedValueType.INDEXED_VALUE_TYPE_INT,
+    MARKETPLACE.name: IndexedValueType.INDEXED_VALUE_TYPE_KEYWORD,
+    ACTION_TYPE.name: IndexedValueType.INDEXED_VALUE_TYPE_KEYWORD,
+}
+
+_WORKFLOW_TYPE_PATTERN = re.compile(r"^(Vinted|Ebay|Etsy)(\w+?)Workflow$")
+
+# Workflow types outside the {Marketplace}{Action}Workflow convention
+WORKFLOW_TYPE_ATTRIBUTES = {
+    "AIBatchAnalysisWorkflow": ("ai", "batchanalysis"),
+}
+
+# Set by ensure_search_attributes(); False keeps the legacy LIKE queries
+_indexed_enabled = False
+
+
+def is_indexed_listing_enabled() -> bool:
+    """True once the custom search attributes are registered on the namespace."""
+    return _indexed_enabled
+
+
+def parse_workflow_type(workflow_type: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Split a workflow type name into (marketplace, action).
+
+    Examples:
+        "VintedPublishWorkflow" -> ("vinted", "publish")
+        "VintedBatchCleanupWorkflow" -> ("vinted", "batchcleanup")
+        "AIBatchAnalysisWorkflow" -> ("ai", "batchanalysis")
+    """
+    if workflow_type in WORKFLOW_TYPE_ATTRIBUTES:
+        return WORKFLOW_TYPE_ATTRIBUTES[workflow_type]
+    match = _WORKFLOW_TYPE_PATTERN.match(workflow_type)
+    if not match:
+        return None, None
+    return match.group(1).lower(), match.group(2).lower()
+
+
+def build_search_attributes(
+    workflow_type: str, args: Sequence[Any]
+) -> Optional[TypedSearchAttributes]:
+    """
+    Build the search attributes for a workflow start.
+
+    Args:
+        workflow_type: Workflow type name
+        args: Workflow run arguments (first one is the params dataclass)
+
+    Returns:
+        TypedSearchAttributes or None if nothing can be derived
+    """
+    pairs = []
+
+    user_id = getattr(args[0], "user_id", None) if args else None
+    if isinstance(user_id, int):
+        pairs.append(SearchAttributePair(USER_ID, user_id))
+
+    marketplace, action = parse_workflow_type(workflow_type)
+    if marketplace:
+        pairs.append(SearchAttributePair(MARKETPLACE, marketplace))
+        pairs.append(SearchAttributePair(ACTION_TYPE, action))
+
+    return TypedSearchAttributes(pairs) if pairs else None
+
+
+def build_list_query(
+    user_id: int,
+    execution_status: str,
+    marketplace: Optional[str] = None,
+    action_type: Optional[str] = None,
+    legacy_workflow_types: Optional[Iterable[str]] = None,
+) -> str:
+    """
+    Build an indexed visibility query (equality filters only).
+
+    Args:
+        user_id: Owner of the workflows
+        execution_status: Temporal execution status (Running, Completed...)
+        marketplace: Marketplace filter (optional)
+        action_type: Action filter (optional)
+        legacy_workflow_types: Known workflow type names. When given, also
+            matches executions without UserId (started before registration)
+            by WorkflowId convention, filtered by WorkflowType instead of
+            Marketplace/ActionType.
+    """
+    marketplace = marketplace.lower() if marketplace else None
+    action_type = action_type.lower() if action_type else None
+
+    indexed = [f"{USER_ID.name} = {int(user_id)}"]
+    if marketplace:
+        indexed.append(f'{MARKETPLACE.name} = "{marketplace}"')
+    if action_type:
+        indexed.append(f'{ACTION_TYPE.name} = "{action_type}"')
+    owner = " AND ".join(indexed)
+
+    legacy = (
+        _build_legacy_clause(user_id, marketplace, action_type, legacy_workflow_types)
+        if legacy_workflow_types is not None
+        else None
+    )
+    if legacy:
+        owner = f"({owner}) OR ({legacy})"
+
+    return f'ExecutionStatus = "{execution_status}" AND ({owner})'
+
+
+def _build_legacy_clause(
+    user_id: int,
+    marketplace: Optional[str],
+    action_type: Optional[str],
+    workflow_types: Iterable[str],
+) -> Optional[str]:
+    """Clause for executions without search attributes (None if no type matches)."""
+    parts = [f"{USER_ID.name} IS NULL", f'WorkflowId LIKE "%user-{int(user_id)}%"']
+    if marketplace or action_type:
+        types = sorted(
+            workflow_type
+            for workflow_type in workflow_types
+            if _matches(parse_workflow_type(workflow_type), marketplace, action_type)
+        )
+        if not types:
+            return None
+        parts.append("WorkflowType IN ({})".format(", ".join(f'"{t}"' for t in types)))
+    return " AND ".join(parts)
+
+
+def _matches(
+    parsed: Tuple[Optional[str], Optional[str]],
+    marketplace: Optional[str],
+    action_type: Optional[str],
+) -> bool:
+    return (not marketplace or parsed[0] == marketplace) and (
+        not action_type or parsed[1] == action_type
+    )
+
+
+class _SearchAttributesOutbound(OutboundInterceptor):
+    async def start_workflow(self, input: StartWorkflowInput) -> WorkflowHandle[Any, Any]:
+        if _indexed_enabled and input.search_attributes is None:
+            input.search_attributes = build_search_attributes(input.workflow, input.args)
+        return await super().start_workflow(input)
+
+
+class SearchAttributesInterceptor(Interceptor):
+    """Client interceptor adding UserId/Marketplace/ActionType at workflow start."""
+
+    def intercept_client(self, next: OutboundInterceptor) -> OutboundInterceptor:
+        return _SearchAttributesOutbound(next)
+
+
+async def ensure_search_attributes(client: Client, namespace: str) -> bool:
+    """
+    Register missing custom search attributes on the namespace.
+
+    Enables indexed listing on success. On failure (no operator permission,
+    server without SQL/ES visibility), listing keeps the LIKE queries and
+    workflows are started without search attributes.
+
+    Returns:
+        True if all attributes are available
+    """
+    global _indexed_enabled
+
+    try:
+        existing = await client.operator_service.list_search_attributes(
+            ListSearchAttributesRequest(namespace=namespace)
+        )
+        missing = {
+            name: value_type
+            for name, value_type in _ATTRIBUTE_TYPES.items()
+            if name not in existing.custom_attributes
+        }
+        if missing:
+            await client.operator_service.add_search_attributes(
+                AddSearchAttributesRequest(namespace=namespace, search_attributes=missing)
+            )
+            logger.info(f"Registered Temporal search attributes: {sorted(missing)}")
+
+        _indexed_enabled = True
+
+    except Exception as e:
+        logger.warning(f"Custom search attributes unavailable, using LIKE listing: {e}")
+        _indexed_enabled = False
+
+    return _indexed_enabled
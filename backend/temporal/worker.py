@@ -13,6 +13,7 @@ from temporalio.worker import Worker, UnsandboxedWorkflowRunner
 
 from temporal.client import get_temporal_client
 from temporal.config import get_temporal_config
+from temporal.progress import get_worker_interceptors
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +101,7 @@ class TemporalWorkerManager:
                 max_concurrent_activities=config.temporal_max_concurrent_activities,
                 activity_executor=self._executor,  # Required for sync activities
                 workflow_runner=UnsandboxedWorkflowRunner(),  # Disable sandbox for simpler imports
+                interceptors=get_worker_interceptors(),  # Push progress via Socket.IO
             )
 
             # Start worker in background task
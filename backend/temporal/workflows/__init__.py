@@ -14,11 +14,13 @@ from temporal.workflows.vinted.cleanup_workflow import (
     VintedBatchCleanupParams,
 )
 from temporal.workflows.vinted.pro_seller_scan_workflow import VintedProSellerScanWorkflow
+from temporal.workflows.batch_action_workflow import BatchActionParams
 
 # New action workflow lists (for worker registration)
 from temporal.workflows.vinted import VINTED_ACTION_WORKFLOWS
 from temporal.workflows.ebay import EBAY_ACTION_WORKFLOWS
 from temporal.workflows.etsy import ETSY_ACTION_WORKFLOWS
+from temporal.workflows.ai import AI_WORKFLOWS, AIBatchAnalysisParams, AIBatchAnalysisWorkflow
 
 __all__ = [
     # Existing workflows
@@ -33,8 +35,13 @@ __all__ = [
     "VintedBatchCleanupWorkflow",
     "VintedBatchCleanupParams",
     "VintedProSellerScanWorkflow",
+    "BatchActionParams",
     # New action workflow lists
     "VINTED_ACTION_WORKFLOWS",
     "EBAY_ACTION_WORKFLOWS",
     "ETSY_ACTION_WORKFLOWS",
+    # AI workflows
+    "AI_WORKFLOWS",
+    "AIBatchAnalysisWorkflow",
+    "AIBatchAnalysisParams",
 ]
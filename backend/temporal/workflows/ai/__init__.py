@@ -0,0 +1,17 @@
+"""AI Temporal workflows."""
+
+from temporal.workflows.ai.batch_analysis_workflow import (
+    AIBatchAnalysisParams,
+    AIBatchAnalysisWorkflow,
+)
+
+# All AI workflows for worker registration
+AI_WORKFLOWS = [
+    AIBatchAnalysisWorkflow,
+]
+
+__all__ = [
+    "AIBatchAnalysisParams",
+    "AIBatchAnalysisWorkflow",
+    "AI_WORKFLOWS",
+]
@@ -0,0 +1,113 @@
+"""
+AI Batch Analysis Workflow — analyze the images of many products in one execution.
+
+Credits are reserved for the whole batch when it starts (API), so a batch
+never stops halfway for lack of credits. Each analysis runs with
+credits_reserved=True; when the batch ends (completed, cancelled by signal or
+by Temporal cancellation, failed), the credits that were not consumed are
+released:
+
+    released = reserved_credits - charged
+    charged  = successful analyses that were not served from the result cache
+
+On Temporal cancellation or failure, analyses already running are awaited
+(WAIT_CANCELLATION_COMPLETED) and their results recorded before the release,
+so a finished analysis is never refunded.
+
+Per-product results are pushed to the user as "ai_batch_result" Socket.IO
+events by the activity; pause/resume/cancel signals come from
+BatchActionWorkflowBase. The Gemini concurrency is bounded process-wide by
+the Gemini limiter, max_parallel only sizes the activity window.
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, List
+
+from temporalio import workflow
+from temporalio.common import RetryPolicy
+from temporalio.workflow import ActivityCancellationType
+
+from temporal.activities.ai_activities import ai_analyze_product, ai_release_credits
+from temporal.workflows.batch_action_workflow import BatchActionParams, BatchActionWorkflowBase
+
+
+@dataclass
+class AIBatchAnalysisParams(BatchActionParams):
+    """Parameters for AIBatchAnalysisWorkflow (action="analyze")."""
+
+    reserved_credits: int = 0
+    max_images: int = 5  # Subscription ai_max_images_per_analysis
+
+    # Continue-As-New support
+    accumulated_charged: int = 0
+
+
+@workflow.defn
+class AIBatchAnalysisWorkflow(BatchActionWorkflowBase):
+    """Analyze product images with AI, credits reserved upfront."""
+
+    ACTIONS = {
+        "analyze": ai_analyze_product,
+    }
+    # A cancelled analysis may already have consumed Gemini: wait for its outcome
+    ITEM_CANCELLATION_TYPE = ActivityCancellationType.WAIT_CANCELLATION_COMPLETED
+
+    def __init__(self):
+        super().__init__()
+        self._charged = 0
+        self._released = 0
+
+    def _activity_args(self, params: AIBatchAnalysisParams, product_id: int) -> List[Any]:
+        return [params.user_id, product_id, params.max_images]
+
+    def _retry_policy(self, params: AIBatchAnalysisParams) -> RetryPolicy:
+        # Retries mostly cover AIServiceBusyError (Gemini queue full): back off
+        return RetryPolicy(
+            initial_interval=timedelta(seconds=5),
+            maximum_interval=timedelta(seconds=60),
+            maximum_attempts=5,
+        )
+
+    def _on_item_result(self, params: AIBatchAnalysisParams, product_id: int, result: Any) -> None:
+        if not result.get("cached"):
+            self._charged += 1
+
+    def _continue_as_new_params(
+        self, params: AIBatchAnalysisParams, next_index: int
+    ) -> AIBatchAnalysisParams:
+        next_params = super()._continue_as_new_params(params, next_index)
+        next_params.accumulated_charged = self._charged
+        return next_params
+
+    async def _finalize(self, params: AIBatchAnalysisParams) -> None:
+        unused = max(0, params.reserved_credits - self._charged)
+        if unused == 0:
+            return
+
+        try:
+            await workflow.execute_activity(
+                ai_release_credits,
+                args=[params.user_id, unused],
+                start_to_close_timeout=timedelta(seconds=30),
+                retry_policy=RetryPolicy(maximum_attempts=5),
+            )
+            self._released = unused
+        except Exception as e:
+            self._error = f"Failed to release {unused} credits: {e}"
+            workflow.logger.error(f"[AIBatchAnalysis] {self._error}")
+
+    def _extra_result(self, params: AIBatchAnalysisParams) -> dict:
+        return {
+            "reserved_credits": params.reserved_credits,
+            "charged_credits": self._charged,
+            "released_credits": self._released,
+        }
+
+    @workflow.run
+    async def run(self, params: AIBatchAnalysisParams) -> dict:
+        self._charged = params.accumulated_charged
+        return await self._execute(params)
@@ -0,0 +1,323 @@
+"""
+Batch Action Workflow base for Temporal.
+
+Coalesces many per-product marketplace actions (publish, update, delete...)
+into ONE workflow execution instead of one workflow per product.
+
+Features:
+- Configurable parallelism (sliding window of activities)
+- Per-item results, queryable while running (get_progress, get_item_result)
+- Continue-as-new every CONTINUE_AS_NEW_EVERY items (or when Temporal
+  suggests it), carrying a compact state: the remaining product IDs only,
+  counters and failed items
+- Cooperative cancel via signal (in-flight activities finish)
+- Pause/resume via signals (no new item is scheduled while paused)
+
+Marketplace workflows (VintedBatchActionWorkflow, EbayBatchActionWorkflow,
+EtsyBatchActionWorkflow) subclass BatchActionWorkflowBase and only map
+an action name to an activity call.
+
+Author: Claude
+Date: 2026-02-03
+Updated: 2026-02-04 - Continue-as-new carries the remaining product IDs only
+Updated: 2026-02-04 - Cancel/failure path records in-flight items before _finalize
+"""
+
+import asyncio
+from dataclasses import dataclass, field, replace
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from temporalio import workflow
+from temporalio.common import RetryPolicy
+from temporalio.workflow import ActivityCancellationType
+
+# Max items processed by a single run before continue-as-new
+CONTINUE_AS_NEW_EVERY = 500
+
+# Default retry policy for batch item activities
+BATCH_ITEM_RETRY = RetryPolicy(
+    initial_interval=timedelta(seconds=2),
+    maximum_interval=timedelta(seconds=60),
+    maximum_attempts=3,
+)
+
+
+@dataclass
+class BatchActionParams:
+    """Parameters for marketplace batch action workflows."""
+
+    user_id: int
+    action: str  # publish, update, delete, cleanup (marketplace dependent)
+    product_ids: List[int] = field(default_factory=list)
+    max_parallel: int = 5
+
+    # Marketplace-specific options
+    shop_id: int = 0  # Vinted shop ID (vinted_user_id)
+    marketplace_id: str = "EBAY_FR"  # eBay marketplace
+    check_conditions: bool = True  # Vinted delete
+
+    # Continue-As-New support: product_ids holds the items not processed yet
+    previously_processed: int = 0  # Items of earlier runs (no longer in product_ids)
+    offset: int = 0  # Index in product_ids where this run starts (runs chained before 2026-02-04)
+    accumulated_succeeded: int = 0
+    accumulated_failed: int = 0
+    failed_items: Dict[str, str] = field(default_factory=dict)  # product_id -> error
+
+
+class BatchActionWorkflowBase:
+    """
+    Shared implementation of batch action workflows.
+
+    Subclasses must define ACTIONS (action -> activity) and implement
+    _activity_args(); their @workflow.run simply awaits self._execute().
+    Queries and the cancel/pause/resume signals are inherited.
+
+    Optional hooks: _on_item_result() (per-item bookkeeping),
+    _continue_as_new_params() (extra carried state), _finalize() (last
+    step of a completed, cancelled or failed batch) and _extra_result().
+    """
+
+    # action name -> activity function
+    ACTIONS: Dict[str, Callable] = {}
+    START_TO_CLOSE_TIMEOUT = timedelta(minutes=5)
+    # WAIT_CANCELLATION_COMPLETED: on Temporal cancellation, an item activity
+    # that still completes returns its result (recorded before _finalize)
+    ITEM_CANCELLATION_TYPE = ActivityCancellationType.TRY_CANCEL
+
+    def __init__(self):
+        self._status = "running"
+        self._error: Optional[str] = None
+        self._cancelled = False
+        self._paused = False
+        self._total = 0
+        self._processed = 0
+        self._succeeded = 0
+        self._failed = 0
+        self._in_flight = 0
+        # Per-item results of THIS run (previous runs are summarized)
+        self._items: Dict[str, dict] = {}
+        self._failed_items: Dict[str, str] = {}
+        self._offset = 0  # Items processed before this run
+        self._run_start = 0  # Index in _product_ids where this run starts
+        self._product_ids: List[int] = []
+        self._item_tasks: List[asyncio.Task] = []
+        self._finalized = False
+
+    def _activity_args(self, params: BatchActionParams, product_id: int) -> List[Any]:
+        """Arguments passed to the action activity for one product."""
+        raise NotImplementedError
+
+    def _retry_policy(self, params: BatchActionParams) -> RetryPolicy:
+        return BATCH_ITEM_RETRY
+
+    def _on_item_result(self, params: BatchActionParams, product_id: int, result: Any) -> None:
+        """Called with the raw activity result of each successful item."""
+
+    def _continue_as_new_params(self, params: BatchActionParams, next_index: int) -> BatchActionParams:
+        """Params of the next run (same type as params, compact state only)."""
+        return replace(
+            params,
+            product_ids=params.product_ids[next_index:],
+            previously_processed=params.previously_processed + next_index,
+            offset=0,
+            accumulated_succeeded=self._succeeded,
+            accumulated_failed=self._failed,
+            failed_items=self._failed_items,
+        )
+
+    async def _finalize(self, params: BatchActionParams) -> None:
+        """
+        Last step of the batch, called once per execution chain.
+
+        Runs when the batch completes, is cancelled by signal, is cancelled
+        through Temporal (handle.cancel()) or fails; not on continue-as-new.
+        Terminate and execution timeouts end the workflow without running
+        any workflow code.
+        """
+
+    def _extra_result(self, params: BatchActionParams) -> dict:
+        """Additional fields of the workflow result."""
+        return {}
+
+    async def _execute(self, params: BatchActionParams) -> dict:
+        try:
+            return await self._run_batch(params)
+        except workflow.ContinueAsNewError:
+            # Not the end of the batch: the next run carries the state
+            raise
+        except BaseException:
+            # Temporal cancellation (handle.cancel() raises CancelledError in
+            # the workflow) or failure: the normal end of _run_batch was
+            # skipped. Shielded so a cancellation cannot interrupt it.
+            if not self._finalized:
+                await asyncio.shield(self._finalize_after_items(params))
+            raise
+
+    async def _finalize_after_items(self, params: BatchActionParams) -> None:
+        """Record the items still in flight, then finalize."""
+        pending = [task for task in self._item_tasks if not task.done()]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        await self._finalize_once(params)
+
+    async def _finalize_once(self, params: BatchActionParams) -> None:
+        self._finalized = True
+        await self._finalize(params)
+
+    async def _run_batch(self, params: BatchActionParams) -> dict:
+        activity_fn = self.ACTIONS.get(params.action)
+        if activity_fn is None:
+            self._status = "failed"
+            self._error = f"Unsupported action: {params.action}"
+            return self._build_result(params)
+
+        self._product_ids = params.product_ids
+        self._total = params.previously_processed + len(params.product_ids)
+        self._offset = params.previously_processed + params.offset
+        self._processed = self._offset
+        self._run_start = params.offset
+        self._succeeded = params.accumulated_succeeded
+        self._failed = params.accumulated_failed
+        self._failed_items = dict(params.failed_items)
+
+        run_end = min(len(params.product_ids), params.offset + CONTINUE_AS_NEW_EVERY)
+        semaphore = asyncio.Semaphore(max(1, params.max_parallel))
+        tasks = []
+        next_index = params.offset
+
+        for index in range(params.offset, run_end):
+            await semaphore.acquire()
+            if self._paused and not self._cancelled:
+                await workflow.wait_condition(lambda: not self._paused or self._cancelled)
+            if self._cancelled or workflow.info().is_continue_as_new_suggested():
+                semaphore.release()
+                break
+            next_index = index + 1
+            task = asyncio.create_task(
+                self._process_item(activity_fn, params, params.product_ids[index], semaphore)
+            )
+            tasks.append(task)
+            self._item_tasks.append(task)
+
+        if tasks:
+            await asyncio.gather(*tasks)
+
+        if self._cancelled:
+            await self._finalize_once(params)
+            self._status = "cancelled"
+            return self._build_result(params)
+
+        if next_index < len(params.product_ids):
+            workflow.continue_as_new(self._continue_as_new_params(params, next_index))
+
+        await self._finalize_once(params)
+        self._status = "completed"
+        return self._build_result(params)
+
+    async def _process_item(
+        self,
+        activity_fn: Callable,
+        params: BatchActionParams,
+        product_id: int,
+        semaphore: asyncio.Semaphore,
+    ) -> None:
+        key = str(product_id)
+        self._in_flight += 1
+        self._items[key] = {"status": "running"}
+        try:
+            result = await workflow.execute_activity(
+                activity_fn,
+                args=self._activity_args(params, product_id),
+                start_to_close_timeout=self.START_TO_CLOSE_TIMEOUT,
+                retry_policy=self._retry_policy(params),
+                cancellation_type=self.ITEM_CANCELLATION_TYPE,
+            )
+            success = bool(result.get("success")) if isinstance(result, dict) else False
+            error = result.get("error") if isinstance(result, dict) else None
+        except Exception as e:
+            success = False
+            error = str(e)
+        finally:
+            self._in_flight -= 1
+            semaphore.release()
+
+        self._processed += 1
+        if success:
+            self._succeeded += 1
+            self._items[key] = {"status": "completed", "error": None}
+            self._on_item_result(params, product_id, result)
+        else:
+            self._failed += 1
+            self._failed_items[key] = error or "unknown error"
+            self._items[key] = {"status": "failed", "error": error}
+
+    def _build_result(self, params: BatchActionParams) -> dict:
+        return {
+            "status": self._status,
+            "action": params.action,
+            "total": self._total,
+            "processed": self._processed,
+            "succeeded": self._succeeded,
+            "failed": self._failed,
+            "failed_items": self._failed_items,
+            "error": self._error,
+            **self._extra_result(params),
+        }
+
+    # ===== Queries / signals (inherited by each @workflow.defn subclass) =====
+
+    @workflow.query
+    def get_progress(self) -> dict:
+        return {
+            "status": self._status,
+            "result": {
+                "total": self._total,
+                "processed": self._processed,
+                "succeeded": self._succeeded,
+                "failed": self._failed,
+                "in_flight": self._in_flight,
+                "run_offset": self._offset,
+            },
+            "error": self._error,
+        }
+
+    @workflow.query
+    def get_item_result(self, product_id: int) -> dict:
+        """
+        Per-item status: pending, running, completed, failed or unknown.
+
+        Items completed by an earlier run of the chain are no longer carried
+        (only failures are): they are reported as unknown.
+        """
+        key = str(product_id)
+        if key in self._items:
+            return {"product_id": product_id, **self._items[key]}
+        if key in self._failed_items:
+            return {"product_id": product_id, "status": "failed", "error": self._failed_items[key]}
+        if product_id in self._product_ids[: self._run_start]:
+            # Processed by a previous run and not failed
+            return {"product_id": product_id, "status": "completed", "error": None}
+        if product_id in self._product_ids:
+            return {"product_id": product_id, "status": "pending", "error": None}
+        return {"product_id": product_id, "status": "unknown", "error": None}
+
+    @workflow.signal
+    def cancel(self) -> None:
+        """Stop scheduling new items (in-flight items complete)."""
+        self._cancelled = True
+        self._status = "cancelling"
+
+    @workflow.signal
+    def pause(self) -> None:
+        """Stop scheduling new items until resume (in-flight items complete)."""
+        if not self._cancelled:
+            self._paused = True
+            self._status = "paused"
+
+    @workflow.signal
+    def resume(self) -> None:
+        """Resume scheduling after pause."""
+        if self._paused and not self._cancelled:
+            self._paused = False
+            self._status = "running"
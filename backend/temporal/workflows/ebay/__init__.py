@@ -20,6 +20,7 @@ from temporal.workflows.ebay.update_workflow import EbayUpdateWorkflow, EbayUpda
 from temporal.workflows.ebay.delete_workflow import EbayDeleteWorkflow, EbayDeleteParams
 from temporal.workflows.ebay.orders_sync_workflow import EbayOrdersSyncWorkflow, EbayOrdersSyncParams
 from temporal.workflows.ebay.import_workflow import EbayImportWorkflow, EbayImportParams, ImportProgress
+from temporal.workflows.ebay.batch_action_workflow import EbayBatchActionWorkflow
 
 # All new action workflows for worker registration
 EBAY_ACTION_WORKFLOWS = [
@@ -29,6 +30,7 @@ EBAY_ACTION_WORKFLOWS = [
     EbayOrdersSyncWorkflow,
     EbayImportWorkflow,
     EbayApplyPolicyWorkflow,
+    EbayBatchActionWorkflow,
 ]
 
 __all__ = [
@@ -52,5 +54,6 @@ __all__ = [
     "EbayImportWorkflow",
     "EbayImportParams",
     "ImportProgress",
+    "EbayBatchActionWorkflow",
     "EBAY_ACTION_WORKFLOWS",
 ]
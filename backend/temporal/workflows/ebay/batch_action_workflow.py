@@ -0,0 +1,40 @@
+"""
+eBay Batch Action Workflow — publish/update/delete many products in one execution.
+
+Also handles "cleanup" (confirmed DELETE_EBAY_LISTING pending actions),
+replacing one EbayCleanupWorkflow per product.
+
+Author: Claude
+Date: 2026-02-03
+"""
+
+from typing import Any, List
+
+from temporalio import workflow
+
+from temporal.activities.ebay_action_activities import (
+    ebay_delete_product,
+    ebay_publish_product,
+    ebay_update_product,
+)
+from temporal.activities.ebay_activities import delete_ebay_listing
+from temporal.workflows.batch_action_workflow import BatchActionParams, BatchActionWorkflowBase
+
+
+@workflow.defn
+class EbayBatchActionWorkflow(BatchActionWorkflowBase):
+    """Apply one action to a list of products on eBay."""
+
+    ACTIONS = {
+        "publish": ebay_publish_product,
+        "update": ebay_update_product,
+        "delete": ebay_delete_product,
+        "cleanup": delete_ebay_listing,
+    }
+
+    def _activity_args(self, params: BatchActionParams, product_id: int) -> List[Any]:
+        return [params.user_id, product_id, params.marketplace_id]
+
+    @workflow.run
+    async def run(self, params: BatchActionParams) -> dict:
+        return await self._execute(params)
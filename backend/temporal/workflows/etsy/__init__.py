@@ -3,12 +3,14 @@
 from temporal.workflows.etsy.publish_workflow import EtsyPublishWorkflow, EtsyPublishParams
 from temporal.workflows.etsy.update_workflow import EtsyUpdateWorkflow, EtsyUpdateParams
 from temporal.workflows.etsy.delete_workflow import EtsyDeleteWorkflow, EtsyDeleteParams
+from temporal.workflows.etsy.batch_action_workflow import EtsyBatchActionWorkflow
 
 # All Etsy action workflows for worker registration
 ETSY_ACTION_WORKFLOWS = [
     EtsyPublishWorkflow,
     EtsyUpdateWorkflow,
     EtsyDeleteWorkflow,
+    EtsyBatchActionWorkflow,
 ]
 
 __all__ = [
@@ -18,5 +20,6 @@ __all__ = [
     "EtsyUpdateParams",
     "EtsyDeleteWorkflow",
     "EtsyDeleteParams",
+    "EtsyBatchActionWorkflow",
     "ETSY_ACTION_WORKFLOWS",
 ]
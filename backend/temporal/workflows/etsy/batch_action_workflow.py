@@ -0,0 +1,36 @@
+"""
+Etsy Batch Action Workflow — update/delete many products in one execution.
+
+Publish is not supported in batch: it needs per-product listing options
+(taxonomy, shipping profile...), see EtsyPublishWorkflow.
+
+Author: Claude
+Date: 2026-02-03
+"""
+
+from typing import Any, List
+
+from temporalio import workflow
+
+from temporal.activities.etsy_action_activities import (
+    etsy_delete_product,
+    etsy_update_product,
+)
+from temporal.workflows.batch_action_workflow import BatchActionParams, BatchActionWorkflowBase
+
+
+@workflow.defn
+class EtsyBatchActionWorkflow(BatchActionWorkflowBase):
+    """Apply one action to a list of products on Etsy."""
+
+    ACTIONS = {
+        "update": etsy_update_product,
+        "delete": etsy_delete_product,
+    }
+
+    def _activity_args(self, params: BatchActionParams, product_id: int) -> List[Any]:
+        return [params.user_id, product_id]
+
+    @workflow.run
+    async def run(self, params: BatchActionParams) -> dict:
+        return await self._execute(params)
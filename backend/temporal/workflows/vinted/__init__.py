@@ -22,6 +22,7 @@ from temporal.workflows.vinted.message_workflow import VintedMessageWorkflow, Vi
 from temporal.workflows.vinted.link_product_workflow import VintedLinkProductWorkflow, VintedLinkProductParams
 from temporal.workflows.vinted.check_connection_workflow import VintedCheckConnectionWorkflow, VintedCheckConnectionParams
 from temporal.workflows.vinted.fetch_users_workflow import VintedFetchUsersWorkflow, VintedFetchUsersParams, FetchUsersProgress
+from temporal.workflows.vinted.batch_action_workflow import VintedBatchActionWorkflow
 
 # All new action workflows for worker registration
 VINTED_ACTION_WORKFLOWS = [
@@ -33,6 +34,7 @@ VINTED_ACTION_WORKFLOWS = [
     VintedLinkProductWorkflow,
     VintedCheckConnectionWorkflow,
     VintedFetchUsersWorkflow,
+    VintedBatchActionWorkflow,
 ]
 
 __all__ = [
@@ -65,5 +67,6 @@ __all__ = [
     "VintedFetchUsersWorkflow",
     "VintedFetchUsersParams",
     "FetchUsersProgress",
+    "VintedBatchActionWorkflow",
     "VINTED_ACTION_WORKFLOWS",
 ]
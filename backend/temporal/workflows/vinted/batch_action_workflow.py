@@ -0,0 +1,51 @@
+"""
+Vinted Batch Action Workflow — publish/update/delete many products in one execution.
+
+Runs on the Vinted task queue (max 1 concurrent activity), so items are
+effectively processed one by one whatever max_parallel is.
+
+Author: Claude
+Date: 2026-02-03
+"""
+
+from datetime import timedelta
+from typing import Any, List
+
+from temporalio import workflow
+from temporalio.common import RetryPolicy
+
+from temporal.activities.vinted_action_activities import (
+    vinted_delete_product,
+    vinted_publish_product,
+    vinted_update_product,
+)
+from temporal.workflows.batch_action_workflow import BatchActionParams, BatchActionWorkflowBase
+
+
+@workflow.defn
+class VintedBatchActionWorkflow(BatchActionWorkflowBase):
+    """Apply one action to a list of products on Vinted."""
+
+    ACTIONS = {
+        "publish": vinted_publish_product,
+        "update": vinted_update_product,
+        "delete": vinted_delete_product,
+    }
+
+    def _activity_args(self, params: BatchActionParams, product_id: int) -> List[Any]:
+        if params.action == "delete":
+            return [params.user_id, product_id, params.shop_id, params.check_conditions]
+        return [params.user_id, product_id, params.shop_id]
+
+    def _retry_policy(self, params: BatchActionParams) -> RetryPolicy:
+        # Same policy as the single-product Vinted workflows
+        return RetryPolicy(
+            initial_interval=timedelta(seconds=2),
+            maximum_interval=timedelta(seconds=30),
+            maximum_attempts=3,
+            non_retryable_error_types=["RuntimeError"],
+        )
+
+    @workflow.run
+    async def run(self, params: BatchActionParams) -> dict:
+        return await self._execute(params)
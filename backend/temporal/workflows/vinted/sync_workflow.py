@@ -20,6 +20,7 @@ Key differences from eBay:
 - Mark as "sold" instead of delete for missing products
 - Rate limiter with random delays between all requests
 - 3 phases (sync, enrich, sold_sync)
+- Continue-as-new checkpoints in every phase (bounded history)
 
 Author: Claude
 Date: 2026-01-22
@@ -27,7 +28,7 @@ Date: 2026-01-22
 
 import asyncio
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import timedelta
 from typing import Optional
 
@@ -38,6 +39,7 @@ from temporalio.common import RetryPolicy
 from temporal.activities.vinted_activities import (
     fetch_and_sync_page,
     get_vinted_ids_to_enrich,
+    count_vinted_ids_to_enrich,
     enrich_single_product,
     check_plugin_connection,
     sync_sold_status,
@@ -45,6 +47,25 @@ from temporal.activities.vinted_activities import (
 )
 
 
+# Continue-As-New checkpoints (keep history bounded whatever the wardrobe size)
+SYNC_PAGES_PER_RUN = 100  # Wardrobe pages fetched by a single run
+ENRICH_ITEMS_PER_RUN = 500  # Products enriched by a single run
+# Phase boundaries checkpoint when the current history is longer than this
+PHASE_CHECKPOINT_HISTORY_LENGTH = 500
+
+PHASES = ("sync", "enrich", "sold_sync", "cleanup_detect")
+
+# Patch ID of the phase/checkpoint rewrite (2026-02-03). Executions started
+# before it have no marker and replay _run_legacy. Once none is left, switch
+# to workflow.deprecate_patch() and delete _run_legacy.
+SYNC_PHASES_PATCH = "vinted-sync-phases"
+
+UNAUTHORIZED_MESSAGES = {
+    "unauthorized": "Session Vinted expirée. Veuillez vous reconnecter au plugin.",
+    "forbidden": "Accès bloqué par Vinted (403). Réessayez plus tard.",
+}
+
+
 @dataclass
 class VintedSyncParams:
     """Parameters for Vinted sync workflow."""
@@ -53,10 +74,19 @@ class VintedSyncParams:
     shop_id: int  # Vinted shop ID (vinted_user_id)
 
     # Continue-As-New support (for resuming after history limit)
+    phase: str = "sync"  # Phase to resume: sync, enrich, sold_sync, cleanup_detect
     start_offset: int = 0  # Resume from this page
     sync_start_time: Optional[str] = None  # ISO format, set on first run
     accumulated_synced: int = 0  # Count from previous runs
     accumulated_errors: int = 0  # Errors from previous runs
+    # Enrich phase cursor: IDs are processed in ascending order, so the last
+    # processed vinted_id is enough to resume (no ID list in the payload)
+    enrich_cursor: int = 0
+    enrich_total: Optional[int] = None
+    accumulated_enriched: int = 0
+    accumulated_enrich_errors: int = 0
+    # Sold sync result, carried to the cleanup phase
+    sold_updated: int = 0
 
 
 @dataclass
@@ -64,7 +94,7 @@ class VintedSyncProgress:
     """Progress tracking for the sync workflow."""
 
     status: str = "initializing"  # initializing, running, completed, failed, cancelled, paused, waiting_reconnection
-    phase: str = "sync"  # sync, enrich
+    phase: str = "sync"  # sync, enrich, sold_sync, cleanup_detect, done
     current_count: int = 0
     total_count: int = 0
     label: str = "initialisation..."
@@ -84,6 +114,12 @@ class VintedSyncWorkflow:
     - Phase 1 (SYNC): Fetch wardrobe pages SEQUENTIALLY and upsert to DB
     - Phase 2 (ENRICH): Fetch item_upload data sequentially
     - Phase 3 (SOLD_SYNC): Mark StoFlow products as SOLD when Vinted closed
+    - Phase 4 (CLEANUP_DETECT): Propose deletion of sold products still listed
+
+    Every phase can continue-as-new with a compact checkpoint
+    (VintedSyncParams: phase, page offset / vinted_id cursor, counters), so
+    history stays bounded: at most SYNC_PAGES_PER_RUN pages or
+    ENRICH_ITEMS_PER_RUN products per run.
 
     Features:
     - Survives crashes and restarts
@@ -101,26 +137,38 @@ class VintedSyncWorkflow:
         self._paused = False
         self._resume_requested = False
         self._waiting_for_reconnection = False
+        self._cleanup_count = 0
 
     @workflow.run
     async def run(self, params: VintedSyncParams) -> dict:
         """
         Execute the Vinted sync workflow.
 
+        Resumes at params.phase when started by continue-as-new.
+
+        Executions started before the SYNC_PHASES_PATCH deploy keep the
+        legacy single-run command sequence (replay determinism).
+
         Args:
-            params: Sync parameters (user_id, shop_id, etc.)
+            params: Sync parameters (user_id, shop_id, checkpoint, etc.)
 
         Returns:
             Dict with sync results (count, status, etc.)
         """
-        self._progress = VintedSyncProgress(status="running", phase="sync")
+        if not workflow.patched(SYNC_PHASES_PATCH):
+            return await self._run_legacy(params)
+
+        self._progress = VintedSyncProgress(
+            status="running",
+            phase=params.phase,
+            current_count=params.accumulated_synced + params.accumulated_enriched,
+            total_count=params.accumulated_synced,
+        )
 
         # Initialize sync_start_time on first run
         # IMPORTANT: Use workflow.now() for determinism (datetime.now() breaks replay)
         if params.sync_start_time is None:
-            sync_start_time = workflow.now().isoformat()
-        else:
-            sync_start_time = params.sync_start_time
+            params = replace(params, sync_start_time=workflow.now().isoformat())
 
         # Configure retry policy for activities
         retry_policy = RetryPolicy(
@@ -137,40 +185,110 @@ class VintedSyncWorkflow:
         }
 
         try:
+            phase_runners = {
+                "sync": self._run_sync_phase,
+                "enrich": self._run_enrich_phase,
+                "sold_sync": self._run_sold_sync_phase,
+                "cleanup_detect": self._run_cleanup_phase,
+            }
+
+            for phase in PHASES[PHASES.index(params.phase):]:
+                if phase != params.phase:
+                    # Phase boundary: start the next phase with a fresh history if needed
+                    params = replace(params, phase=phase)
+                    self._checkpoint_if_needed(params)
+
+                result = await phase_runners[phase](params, activity_options)
+                if isinstance(result, dict):
+                    # Terminal result (failed, cancelled)
+                    return result
+                params = result
+
+                if self._cancelled:
+                    return await self._handle_cancellation(
+                        params, activity_options, params.accumulated_synced
+                    )
+
             # ═══════════════════════════════════════════════════════════
-            # PHASE 1: Fetch pages SEQUENTIALLY and sync to DB
+            # DONE
             # ═══════════════════════════════════════════════════════════
+            final_count = params.accumulated_synced
+            total_enriched = params.accumulated_enriched
+            sold_count = params.sold_updated
+            cleanup_count = self._cleanup_count
+
+            self._progress.status = "completed"
+            self._progress.phase = "done"
+            self._progress.current_count = final_count
+            final_label = f"{final_count} sync, {total_enriched} enrichis, {sold_count} vendus"
+            if cleanup_count > 0:
+                final_label += f", {cleanup_count} suppressions proposées"
+            self._progress.label = final_label
+
+            return {
+                "status": "completed",
+                "final_count": final_count,
+                "enriched": total_enriched,
+                "sold_updated": sold_count,
+                "cleanup_proposed": cleanup_count,
+                "errors": params.accumulated_errors,
+            }
+
+        except Exception as e:
+            self._progress.status = "failed"
+            self._progress.error = str(e)
+
+            raise
+
+    async def _run_legacy(self, params: VintedSyncParams) -> dict:
+        """
+        Pre-SYNC_PHASES_PATCH workflow body: all phases in a single run.
+
+        Kept unchanged (same activities, same order, full enrich ID list) so
+        that executions started before the deploy replay deterministically.
+        Do not modify.
+        """
+        self._progress = VintedSyncProgress(status="running", phase="sync")
+
+        if params.sync_start_time is None:
+            sync_start_time = workflow.now().isoformat()
+        else:
+            sync_start_time = params.sync_start_time
+
+        retry_policy = RetryPolicy(
+            initial_interval=timedelta(seconds=2),
+            maximum_interval=timedelta(seconds=120),
+            backoff_coefficient=2.0,
+            maximum_attempts=3,
+        )
+        activity_options = {
+            "start_to_close_timeout": timedelta(minutes=10),
+            "retry_policy": retry_policy,
+        }
+
+        try:
+            # PHASE 1: Fetch pages SEQUENTIALLY and sync to DB
             self._progress.phase = "sync"
             self._progress.label = "synchronisation en cours..."
 
-            page = params.start_offset + 1  # Pages are 1-indexed
+            page = params.start_offset + 1
             total_synced = params.accumulated_synced
             total_errors = params.accumulated_errors
 
-            # Fetch pages sequentially (DataDome protection)
             while not self._cancelled:
-                # Check for pause signal
                 if self._paused:
                     if not await self._wait_while_paused(params, activity_options):
                         return await self._handle_cancellation(params, activity_options, total_synced)
-                    # Restore running status after resume
                     continue
 
                 result = await workflow.execute_activity(
                     fetch_and_sync_page,
-                    args=[
-                        params.user_id,
-                        params.shop_id,
-                        page,
-                        sync_start_time,
-                    ],
+                    args=[params.user_id, params.shop_id, page, sync_start_time],
                     **activity_options,
                 )
 
-                # Check for errors that require waiting/retry
                 error_type = result.get("error")
                 if error_type:
-                    # Errors that indicate plugin/connection issue - wait for reconnection
                     if error_type in ("disconnected", "timeout"):
                         workflow.logger.warning(f"Plugin connection issue during sync ({error_type}), waiting for reconnection")
                         if await self._wait_for_reconnection(params, activity_options):
@@ -183,28 +301,21 @@ class VintedSyncWorkflow:
                                 "message": "Plugin disconnected and reconnection timeout reached",
                             }
 
-                    # 401 Unauthorized / 403 Forbidden - STOP immediately (no retry)
                     if error_type in ("unauthorized", "forbidden"):
                         workflow.logger.error(f"{error_type.upper()} - stopping workflow immediately")
-                        error_messages = {
-                            "unauthorized": "Session Vinted expirée. Veuillez vous reconnecter au plugin.",
-                            "forbidden": "Accès bloqué par Vinted (403). Réessayez plus tard.",
-                        }
                         return {
                             "status": "failed",
                             "error": error_type,
                             "synced_count": total_synced,
-                            "message": error_messages.get(error_type, f"Erreur {error_type}"),
+                            "message": UNAUTHORIZED_MESSAGES.get(error_type, f"Erreur {error_type}"),
                         }
 
-                    # 429 Rate Limited - wait longer then retry
                     if error_type == "rate_limited":
                         workflow.logger.warning("Rate limited during sync, pausing 60s before retry")
                         self._progress.label = "pause anti-blocage (rate_limited)..."
                         await asyncio.sleep(60)
                         continue
 
-                    # 5xx Server Error - wait and retry
                     if error_type == "server_error":
                         workflow.logger.warning("Vinted server error, pausing 30s before retry")
                         self._progress.label = "erreur serveur Vinted, pause..."
@@ -215,48 +326,34 @@ class VintedSyncWorkflow:
                 total_errors += result.get("errors", 0)
                 total_pages = result.get("total_pages", 1)
 
-                # Update progress
                 self._progress.current_count = total_synced
-                self._progress.total_count = total_synced  # We don't know total in advance
-                label = f"{total_synced} produits synchronisés (page {page}/{total_pages})"
-                self._progress.label = label
+                self._progress.total_count = total_synced
+                self._progress.label = f"{total_synced} produits synchronisés (page {page}/{total_pages})"
 
-                # Check if more pages
                 if page >= total_pages:
                     break
 
                 page += 1
 
-            # Handle cancellation
             if self._cancelled:
                 return await self._handle_cancellation(params, activity_options, total_synced)
 
-            # NOTE: Phase 1.5 (mark_missing_as_sold) has been removed.
-            # Products are only marked as "sold" when Vinted API explicitly
-            # returns is_closed=true (handled in fetch_and_sync_page via map_api_status).
-            # This avoids false positives from incomplete syncs.
-
-            # ═══════════════════════════════════════════════════════════
-            # PHASE 2: Enrich products (sequential, rate limiter handles delays)
-            # ═══════════════════════════════════════════════════════════
+            # PHASE 2: Enrich products (full ID list, single run)
             self._progress.phase = "enrich"
             self._progress.label = "enrichissement en cours..."
             total_enriched = 0
             total_enrich_errors = 0
 
-            # Get all product IDs to enrich
             vinted_ids_to_enrich = await workflow.execute_activity(
                 get_vinted_ids_to_enrich,
                 args=[params.user_id, sync_start_time],
                 **activity_options,
             )
 
-            # Enrich products sequentially
             for i, vinted_id in enumerate(vinted_ids_to_enrich):
                 if self._cancelled:
                     break
 
-                # Check for pause signal
                 if self._paused:
                     if not await self._wait_while_paused(params, activity_options):
                         return await self._handle_cancellation(params, activity_options, total_synced)
@@ -273,11 +370,9 @@ class VintedSyncWorkflow:
                     total_enrich_errors += 1
                     error = result.get("error", "")
 
-                    # Handle disconnection or timeout with reconnection wait
                     if error in ("disconnected", "timeout"):
                         workflow.logger.warning(f"Plugin connection issue during enrich ({error}), waiting for reconnection")
                         if await self._wait_for_reconnection(params, activity_options):
-                            # Retry same product after reconnection
                             continue
                         else:
                             return {
@@ -288,52 +383,41 @@ class VintedSyncWorkflow:
                                 "message": "Plugin disconnected and reconnection timeout reached",
                             }
 
-                    # 401 Unauthorized / 403 Forbidden - STOP immediately
                     if error in ("unauthorized", "forbidden"):
                         workflow.logger.error(f"{error.upper()} during enrich - stopping workflow")
-                        error_messages = {
-                            "unauthorized": "Session Vinted expirée. Veuillez vous reconnecter au plugin.",
-                            "forbidden": "Accès bloqué par Vinted (403). Réessayez plus tard.",
-                        }
                         return {
                             "status": "failed",
                             "error": error,
                             "synced_count": total_synced,
                             "enriched": total_enriched,
-                            "message": error_messages.get(error, f"Erreur {error}"),
+                            "message": UNAUTHORIZED_MESSAGES.get(error, f"Erreur {error}"),
                         }
 
-                    # 429 Rate Limited - pause then continue
                     if error == "rate_limited":
                         workflow.logger.warning("Rate limited during enrich, pausing 60s")
                         self._progress.label = "pause anti-blocage (rate_limited)..."
                         await asyncio.sleep(60)
                         continue
 
-                    # 5xx Server Error - pause then continue
                     if error == "server_error":
                         workflow.logger.warning("Vinted server error during enrich, pausing 30s")
                         self._progress.label = "erreur serveur Vinted, pause..."
                         await asyncio.sleep(30)
                         continue
 
-                    # 404 not found - product sold/deleted, just skip
                     if error in ("not_found_vinted", "not_found_db"):
                         continue
 
-                # Update progress every 5 products
                 if (i + 1) % 5 == 0 or (i + 1) == len(vinted_ids_to_enrich):
-                    label = f"{total_synced} synchronisés, {total_enriched}/{len(vinted_ids_to_enrich)} enrichis..."
-                    self._progress.label = label
+                    self._progress.label = (
+                        f"{total_synced} synchronisés, {total_enriched}/{len(vinted_ids_to_enrich)} enrichis..."
+                    )
                     self._progress.current_count = total_synced + total_enriched
 
-            # Handle cancellation after enrich phase
             if self._cancelled:
                 return await self._handle_cancellation(params, activity_options, total_synced)
 
-            # ═══════════════════════════════════════════════════════════
-            # PHASE 3: Sync sold status (Vinted closed → StoFlow SOLD)
-            # ═══════════════════════════════════════════════════════════
+            # PHASE 3: Sync sold status
             self._progress.phase = "sold_sync"
             self._progress.label = "synchronisation des ventes..."
 
@@ -342,18 +426,12 @@ class VintedSyncWorkflow:
                 args=[params.user_id],
                 **activity_options,
             )
-
             sold_count = sold_result.get("updated_count", 0)
-            if sold_count > 0:
-                workflow.logger.info(f"Marked {sold_count} StoFlow products as SOLD")
 
-            # Handle cancellation after sold sync phase
             if self._cancelled:
                 return await self._handle_cancellation(params, activity_options, total_synced)
 
-            # ═══════════════════════════════════════════════════════════
             # PHASE 4: Detect SOLD products with active Vinted listings
-            # ═══════════════════════════════════════════════════════════
             self._progress.phase = "cleanup_detect"
             self._progress.label = "détection des annonces Vinted à supprimer..."
 
@@ -362,34 +440,22 @@ class VintedSyncWorkflow:
                 args=[params.user_id],
                 **activity_options,
             )
-
             cleanup_count = cleanup_result.get("pending_count", 0)
-            if cleanup_count > 0:
-                workflow.logger.info(
-                    f"Created {cleanup_count} pending actions for SOLD products "
-                    f"with active Vinted listings"
-                )
 
-            # Handle cancellation after cleanup detect phase
             if self._cancelled:
                 return await self._handle_cancellation(params, activity_options, total_synced)
 
-            # ═══════════════════════════════════════════════════════════
-            # DONE
-            # ═══════════════════════════════════════════════════════════
-            final_count = total_synced
-
             self._progress.status = "completed"
             self._progress.phase = "done"
-            self._progress.current_count = final_count
-            final_label = f"{final_count} sync, {total_enriched} enrichis, {sold_count} vendus"
+            self._progress.current_count = total_synced
+            final_label = f"{total_synced} sync, {total_enriched} enrichis, {sold_count} vendus"
             if cleanup_count > 0:
                 final_label += f", {cleanup_count} suppressions proposées"
             self._progress.label = final_label
 
             return {
                 "status": "completed",
-                "final_count": final_count,
+                "final_count": total_synced,
                 "enriched": total_enriched,
                 "sold_updated": sold_count,
                 "cleanup_proposed": cleanup_count,
@@ -402,6 +468,299 @@ class VintedSyncWorkflow:
 
             raise
 
+    def _checkpoint_if_needed(self, params: VintedSyncParams) -> None:
+        """Continue-as-new at a phase boundary when history is already long."""
+        info = workflow.info()
+        if (
+            info.get_current_history_length() > PHASE_CHECKPOINT_HISTORY_LENGTH
+            or info.is_continue_as_new_suggested()
+        ):
+            self._continue_as_new(params)
+
+    def _continue_as_new(self, params: VintedSyncParams) -> None:
+        """Restart the workflow from a compact checkpoint (raises, never returns)."""
+        workflow.logger.info(
+            f"Continue-as-new checkpoint: phase={params.phase}, "
+            f"page_offset={params.start_offset}, enrich_cursor={params.enrich_cursor}"
+        )
+        workflow.continue_as_new(params)
+
+    async def _run_sync_phase(self, params: VintedSyncParams, activity_options: dict):
+        """
+        PHASE 1: Fetch pages SEQUENTIALLY and sync to DB.
+
+        Returns:
+            Updated params on success, or a terminal result dict
+        """
+        self._progress.phase = "sync"
+        self._progress.label = "synchronisation en cours..."
+
+        page = params.start_offset + 1  # Pages are 1-indexed
+        total_synced = params.accumulated_synced
+        total_errors = params.accumulated_errors
+        pages_this_run = 0
+
+        # Fetch pages sequentially (DataDome protection)
+        while not self._cancelled:
+            # Check for pause signal
+            if self._paused:
+                if not await self._wait_while_paused(params, activity_options):
+                    return await self._handle_cancellation(params, activity_options, total_synced)
+                # Restore running status after resume
+                continue
+
+            # Checkpoint: bounded number of pages per run
+            if pages_this_run >= SYNC_PAGES_PER_RUN or workflow.info().is_continue_as_new_suggested():
+                self._continue_as_new(
+                    replace(
+                        params,
+                        start_offset=page - 1,
+                        accumulated_synced=total_synced,
+                        accumulated_errors=total_errors,
+                    )
+                )
+
+            result = await workflow.execute_activity(
+                fetch_and_sync_page,
+                args=[
+                    params.user_id,
+                    params.shop_id,
+                    page,
+                    params.sync_start_time,
+                ],
+                **activity_options,
+            )
+
+            # Check for errors that require waiting/retry
+            error_type = result.get("error")
+            if error_type:
+                # Errors that indicate plugin/connection issue - wait for reconnection
+                if error_type in ("disconnected", "timeout"):
+                    workflow.logger.warning(f"Plugin connection issue during sync ({error_type}), waiting for reconnection")
+                    if await self._wait_for_reconnection(params, activity_options):
+                        continue
+                    else:
+                        return {
+                            "status": "failed",
+                            "error": "disconnected_timeout",
+                            "synced_count": total_synced,
+                            "message": "Plugin disconnected and reconnection timeout reached",
+                        }
+
+                # 401 Unauthorized / 403 Forbidden - STOP immediately (no retry)
+                if error_type in ("unauthorized", "forbidden"):
+                    workflow.logger.error(f"{error_type.upper()} - stopping workflow immediately")
+                    return {
+                        "status": "failed",
+                        "error": error_type,
+                        "synced_count": total_synced,
+                        "message": UNAUTHORIZED_MESSAGES.get(error_type, f"Erreur {error_type}"),
+                    }
+
+                # 429 Rate Limited - wait longer then retry
+                if error_type == "rate_limited":
+                    workflow.logger.warning("Rate limited during sync, pausing 60s before retry")
+                    self._progress.label = "pause anti-blocage (rate_limited)..."
+                    await asyncio.sleep(60)
+                    continue
+
+                # 5xx Server Error - wait and retry
+                if error_type == "server_error":
+                    workflow.logger.warning("Vinted server error, pausing 30s before retry")
+                    self._progress.label = "erreur serveur Vinted, pause..."
+                    await asyncio.sleep(30)
+                    continue
+
+            pages_this_run += 1
+            total_synced += result.get("synced", 0)
+            total_errors += result.get("errors", 0)
+            total_pages = result.get("total_pages", 1)
+
+            # Update progress
+            self._progress.current_count = total_synced
+            self._progress.total_count = total_synced  # We don't know total in advance
+            label = f"{total_synced} produits synchronisés (page {page}/{total_pages})"
+            self._progress.label = label
+
+            # Check if more pages
+            if page >= total_pages:
+                break
+
+            page += 1
+
+        # NOTE: Phase 1.5 (mark_missing_as_sold) has been removed.
+        # Products are only marked as "sold" when Vinted API explicitly
+        # returns is_closed=true (handled in fetch_and_sync_page via map_api_status).
+        # This avoids false positives from incomplete syncs.
+
+        return replace(
+            params,
+            start_offset=page,
+            accumulated_synced=total_synced,
+            accumulated_errors=total_errors,
+        )
+
+    async def _run_enrich_phase(self, params: VintedSyncParams, activity_options: dict):
+        """
+        PHASE 2: Enrich products (sequential, rate limiter handles delays).
+
+        Processes at most ENRICH_ITEMS_PER_RUN products after params.enrich_cursor,
+        then continues-as-new with the last processed vinted_id as cursor.
+
+        Returns:
+            Updated params on success, or a terminal result dict
+        """
+        self._progress.phase = "enrich"
+        self._progress.label = "enrichissement en cours..."
+        total_synced = params.accumulated_synced
+        total_enriched = params.accumulated_enriched
+        total_enrich_errors = params.accumulated_enrich_errors
+        cursor = params.enrich_cursor
+
+        # Total count only (progress), the ID list is fetched per run
+        enrich_total = params.enrich_total
+        if enrich_total is None:
+            enrich_total = await workflow.execute_activity(
+                count_vinted_ids_to_enrich,
+                args=[params.user_id, params.sync_start_time],
+                **activity_options,
+            )
+
+        # Get the product IDs to enrich in this run
+        vinted_ids_to_enrich = await workflow.execute_activity(
+            get_vinted_ids_to_enrich,
+            args=[params.user_id, params.sync_start_time, cursor, ENRICH_ITEMS_PER_RUN],
+            **activity_options,
+        )
+
+        def checkpoint() -> VintedSyncParams:
+            return replace(
+                params,
+                enrich_cursor=cursor,
+                enrich_total=enrich_total,
+                accumulated_enriched=total_enriched,
+                accumulated_enrich_errors=total_enrich_errors,
+            )
+
+        # Enrich products sequentially
+        for i, vinted_id in enumerate(vinted_ids_to_enrich):
+            if self._cancelled:
+                break
+
+            if workflow.info().is_continue_as_new_suggested():
+                self._continue_as_new(checkpoint())
+
+            # Check for pause signal
+            if self._paused:
+                if not await self._wait_while_paused(params, activity_options):
+                    return await self._handle_cancellation(params, activity_options, total_synced)
+
+            result = await workflow.execute_activity(
+                enrich_single_product,
+                args=[params.user_id, vinted_id],
+                **activity_options,
+            )
+            cursor = vinted_id
+
+            if result.get("success"):
+                total_enriched += 1
+            else:
+                total_enrich_errors += 1
+                error = result.get("error", "")
+
+                # Handle disconnection or timeout with reconnection wait
+                if error in ("disconnected", "timeout"):
+                    workflow.logger.warning(f"Plugin connection issue during enrich ({error}), waiting for reconnection")
+                    if await self._wait_for_reconnection(params, activity_options):
+                        # Retry same product after reconnection
+                        continue
+                    else:
+                        return {
+                            "status": "failed",
+                            "error": "disconnected_timeout",
+                            "synced_count": total_synced,
+                            "enriched": total_enriched,
+                            "message": "Plugin disconnected and reconnection timeout reached",
+                        }
+
+                # 401 Unauthorized / 403 Forbidden - STOP immediately
+                if error in ("unauthorized", "forbidden"):
+                    workflow.logger.error(f"{error.upper()} during enrich - stopping workflow")
+                    return {
+                        "status": "failed",
+                        "error": error,
+                        "synced_count": total_synced,
+                        "enriched": total_enriched,
+                        "message": UNAUTHORIZED_MESSAGES.get(error, f"Erreur {error}"),
+                    }
+
+                # 429 Rate Limited - pause then continue
+                if error == "rate_limited":
+                    workflow.logger.warning("Rate limited during enrich, pausing 60s")
+                    self._progress.label = "pause anti-blocage (rate_limited)..."
+                    await asyncio.sleep(60)
+                    continue
+
+                # 5xx Server Error - pause then continue
+                if error == "server_error":
+                    workflow.logger.warning("Vinted server error during enrich, pausing 30s")
+                    self._progress.label = "erreur serveur Vinted, pause..."
+                    await asyncio.sleep(30)
+                    continue
+
+                # 404 not found - product sold/deleted, just skip
+                if error in ("not_found_vinted", "not_found_db"):
+                    continue
+
+            # Update progress every 5 products
+            if (i + 1) % 5 == 0 or (i + 1) == len(vinted_ids_to_enrich):
+                label = f"{total_synced} synchronisés, {total_enriched}/{enrich_total} enrichis..."
+                self._progress.label = label
+                self._progress.current_count = total_synced + total_enriched
+
+        # Full page: more products may remain after the cursor
+        if not self._cancelled and len(vinted_ids_to_enrich) >= ENRICH_ITEMS_PER_RUN:
+            self._continue_as_new(checkpoint())
+
+        return checkpoint()
+
+    async def _run_sold_sync_phase(self, params: VintedSyncParams, activity_options: dict):
+        """PHASE 3: Sync sold status (Vinted closed → StoFlow SOLD)."""
+        self._progress.phase = "sold_sync"
+        self._progress.label = "synchronisation des ventes..."
+
+        sold_result = await workflow.execute_activity(
+            sync_sold_status,
+            args=[params.user_id],
+            **activity_options,
+        )
+
+        sold_count = sold_result.get("updated_count", 0)
+        if sold_count > 0:
+            workflow.logger.info(f"Marked {sold_count} StoFlow products as SOLD")
+
+        return replace(params, sold_updated=sold_count)
+
+    async def _run_cleanup_phase(self, params: VintedSyncParams, activity_options: dict):
+        """PHASE 4: Detect SOLD products with active Vinted listings."""
+        self._progress.phase = "cleanup_detect"
+        self._progress.label = "détection des annonces Vinted à supprimer..."
+
+        cleanup_result = await workflow.execute_activity(
+            detect_sold_with_active_listing,
+            args=[params.user_id],
+            **activity_options,
+        )
+
+        self._cleanup_count = cleanup_result.get("pending_count", 0)
+        if self._cleanup_count > 0:
+            workflow.logger.info(
+                f"Created {self._cleanup_count} pending actions for SOLD products "
+                f"with active Vinted listings"
+            )
+
+        return params
+
     async def _handle_cancellation(
         self, params: VintedSyncParams, activity_options: dict, synced_count: int
     ) -> dict:
@@ -0,0 +1,75 @@
+"""
+Vinted Category Matcher Parity Tests
+
+Vérifie que VintedCategoryMatcher (matching en mémoire) retourne le même
+vinted_id que la fonction PostgreSQL get_vinted_category(), pour chaque ligne
+de vinted.mapping (requête avec les attributs de la ligne, sans le genre,
+avec le seul couple catégorie/genre).
+
+Les ex-aequo (score et priorité égaux) n'ont pas d'ordre défini en SQL:
+le vinted_id SQL doit alors faire partie des ex-aequo calculés par
+reference_match, et le matcher retourne le plus petit id de mapping.
+
+Author: Claude
+Date: 2026-02-04
+"""
+from sqlalchemy import text
+
+from services.vinted.vinted_category_matcher import (
+    ATTRIBUTE_WEIGHTS,
+    VintedCategoryMatcher,
+    load_vinted_mapping,
+    reference_match,
+)
+from shared.database import get_db_context
+
+ATTRIBUTES = [name for name, _ in ATTRIBUTE_WEIGHTS]
+
+
+def _sql_match(db, category, gender, **attributes):
+    return db.execute(
+        text("""
+            SELECT public.get_vinted_category(
+                :category, :gender, :fit, :length, :rise,
+                :material, :pattern, :neckline, :sleeve_length
+            )
+        """),
+        {"category": category, "gender": gender, **{name: attributes.get(name) for name in ATTRIBUTES}},
+    ).scalar()
+
+
+class TestVintedCategoryMatcherParity:
+    """Matcher en mémoire ↔ fonction SQL get_vinted_category()."""
+
+    def test_every_mapping_row_matches_sql_function(self):
+        """Chaque ligne de vinted.mapping donne le même résultat en SQL et en mémoire."""
+        with get_db_context() as db:
+            rows, categories = load_vinted_mapping(db)
+            matcher = VintedCategoryMatcher.from_rows(rows, categories)
+
+            mismatches = []
+            for row in rows:
+                attributes = {name: getattr(row, name) for name in ATTRIBUTES}
+                queries = [
+                    (row.gender, attributes),
+                    (None, attributes),
+                    (row.gender, {}),
+                ]
+
+                for gender, query in queries:
+                    expected = _sql_match(db, row.category, gender, **query)
+                    result = matcher.match(row.category, gender, **query)
+
+                    if result == expected:
+                        continue
+                    ties = reference_match(rows, row.category, gender, **query)
+                    if expected in ties and result in ties:
+                        continue
+                    mismatches.append(
+                        f"id={row.id} {row.category}/{gender} {query}: "
+                        f"sql={expected} matcher={result}"
+                    )
+
+            assert not mismatches, (
+                f"Résultats différents ({len(mismatches)}):\n" + "\n".join(mismatches[:20])
+            )
@@ -0,0 +1,37 @@
+"""
+Unit tests for the pending actions cleanup workflows (api/pending_actions.py).
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from api.pending_actions import _trigger_batch_cleanup_workflows
+from models.user.pending_action import PendingActionType
+
+
+@pytest.mark.asyncio
+async def test_batch_cleanup_workflow_ids_are_unique():
+    """Two confirmations of the same product count start two workflows."""
+    client = MagicMock()
+    client.start_workflow = AsyncMock()
+    config = SimpleNamespace(
+        temporal_enabled=True, temporal_task_queue="q", temporal_vinted_task_queue="vq"
+    )
+    actions = [
+        SimpleNamespace(product_id=product_id, action_type=PendingActionType.DELETE_EBAY_LISTING)
+        for product_id in (1, 2)
+    ]
+
+    with patch("api.pending_actions.get_temporal_config", return_value=config), \
+            patch("temporal.client.get_temporal_client", AsyncMock(return_value=client)), \
+            patch("api.pending_actions.time", MagicMock(time=MagicMock(side_effect=[1000.0, 1001.0]))):
+        await _trigger_batch_cleanup_workflows(actions, user_id=5)
+        await _trigger_batch_cleanup_workflows(actions, user_id=5)
+
+    ids = [call.kwargs["id"] for call in client.start_workflow.call_args_list]
+    assert ids == ["ebay-batch-cleanup-user-5-1000000", "ebay-batch-cleanup-user-5-1001000"]
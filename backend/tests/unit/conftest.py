@@ -52,3 +52,33 @@ def reset_rate_limit_store():
         rate_limit_store.store.clear()
     except ImportError:
         pass
+
+
+@pytest.fixture(autouse=True)
+def reset_reference_catalog():
+    """
+    Reset le catalogue de référence process-wide entre chaque test
+    (un test avec une session mockée ne doit pas le remplir pour les suivants).
+    """
+    from services.reference_catalog import reset_reference_catalog as reset
+    reset()
+    yield
+    reset()
+
+
+@pytest.fixture(autouse=True)
+def reset_vinted_category_matcher():
+    """Reset l'index vinted.mapping process-wide entre chaque test."""
+    from services.vinted.vinted_category_matcher import reset_vinted_category_matcher as reset
+    reset()
+    yield
+    reset()
+
+
+@pytest.fixture(autouse=True)
+def clear_listing_render_cache():
+    """Vide le cache de rendu des annonces entre chaque test."""
+    from services.listing_render_cache import listing_render_cache
+    listing_render_cache.clear()
+    yield
+    listing_render_cache.clear()
@@ -0,0 +1,61 @@
+"""
+Unit Tests - ProductRepository.bulk_update_versioned
+
+Tests:
+- Une requête UPDATE ... FROM (VALUES ...) par lot
+- Colonnes par produit, valeurs communes, conditions supplémentaires
+"""
+
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import Numeric
+
+from models.user.product import Product, ProductStatus
+from repositories import product_repository
+from repositories.product_repository import ProductRepository
+
+
+class TestBulkUpdateVersioned:
+    """Tests pour bulk_update_versioned."""
+
+    def test_one_statement_per_chunk(self):
+        """Test découpage en lots et union des IDs retournés."""
+        db = MagicMock()
+        db.execute.return_value.scalars.side_effect = [[1, 2], [3], [5]]
+        rows = [(product_id, 1, 10) for product_id in range(1, 6)]
+
+        with patch.object(product_repository, "BULK_UPDATE_CHUNK_SIZE", 2):
+            updated = ProductRepository.bulk_update_versioned(
+                db, rows, value_types={"price": Numeric(10, 2)}
+            )
+
+        assert updated == {1, 2, 3, 5}
+        assert db.execute.call_count == 3
+        sql = str(db.execute.call_args.args[0])
+        assert "FROM (VALUES (:param_1, :param_2, :param_3)) AS expected (id, version, price)" in sql
+        assert "price=expected.price" in sql
+        assert "tenant.products.version_number = expected.version" in sql
+
+    def test_set_values_and_conditions(self):
+        """Test valeurs communes et conditions WHERE supplémentaires."""
+        db = MagicMock()
+        db.execute.return_value.scalars.return_value = [7]
+
+        updated = ProductRepository.bulk_update_versioned(
+            db,
+            [(7, 2)],
+            set_values={"status": ProductStatus.ARCHIVED},
+            conditions=[Product.__table__.c.status != ProductStatus.SOLD],
+        )
+
+        assert updated == {7}
+        sql = str(db.execute.call_args.args[0])
+        assert "status=:status" in sql
+        assert "tenant.products.status != :status_1" in sql
+
+    def test_no_rows_no_query(self):
+        """Test aucune requête sans ligne."""
+        db = MagicMock()
+
+        assert ProductRepository.bulk_update_versioned(db, []) == set()
+        db.execute.assert_not_called()
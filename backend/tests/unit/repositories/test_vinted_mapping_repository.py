@@ -4,7 +4,7 @@ Tests unitaires pour VintedMappingRepository
 Tests pour l'accès à la table vinted_mapping et la fonction get_vinted_category.
 
 Business Rules Tested:
-- Stoflow → Vinted: utilise get_vinted_category() avec matching d'attributs
+- Stoflow → Vinted: matching d'attributs de get_vinted_category() (index en mémoire)
 - Vinted → Stoflow: lookup inverse dans vinted_mapping (vinted_id → my_category)
 - Fallback via is_default si pas de match exact
 
@@ -18,89 +18,78 @@ from unittest.mock import Mock, MagicMock, patch
 from repositories.vinted_mapping_repository import VintedMappingRepository
 
 
+MATCHER = "services.vinted.vinted_category_matcher.get_vinted_category_matcher"
+
+
 class TestGetVintedCategoryId:
-    """Tests pour get_vinted_category_id."""
+    """Tests pour get_vinted_category_id (matching en mémoire)."""
 
-    def test_get_vinted_category_id_basic(self):
-        """Test mapping basique category + gender."""
-        mock_db = Mock()
-        mock_result = Mock()
-        mock_result.scalar.return_value = 1193
+    @pytest.fixture
+    def matcher(self):
+        matcher = Mock()
+        with patch(MATCHER, return_value=matcher):
+            yield matcher
 
-        mock_db.execute.return_value = mock_result
+    def test_get_vinted_category_id_basic(self, matcher):
+        """Test mapping basique category + gender."""
+        matcher.match.return_value = 1193
 
-        repo = VintedMappingRepository(mock_db)
+        repo = VintedMappingRepository(Mock())
         result = repo.get_vinted_category_id("jeans", "men")
 
         assert result == 1193
 
-    def test_get_vinted_category_id_with_fit(self):
+    def test_get_vinted_category_id_with_fit(self, matcher):
         """Test mapping avec fit."""
-        mock_db = Mock()
-        mock_result = Mock()
-        mock_result.scalar.return_value = 1818
+        matcher.match.return_value = 1818
 
-        mock_db.execute.return_value = mock_result
-
-        repo = VintedMappingRepository(mock_db)
+        repo = VintedMappingRepository(Mock())
         result = repo.get_vinted_category_id("jeans", "men", fit="slim")
 
         assert result == 1818
 
-    def test_get_vinted_category_id_not_found(self):
+    def test_get_vinted_category_id_not_found(self, matcher):
         """Test mapping non trouvé."""
-        mock_db = Mock()
-        mock_result = Mock()
-        mock_result.scalar.return_value = None
+        matcher.match.return_value = None
 
-        mock_db.execute.return_value = mock_result
-
-        repo = VintedMappingRepository(mock_db)
+        repo = VintedMappingRepository(Mock())
         result = repo.get_vinted_category_id("unknown", "men")
 
         assert result is None
 
-    def test_get_vinted_category_id_normalizes_case(self):
+    def test_get_vinted_category_id_normalizes_case(self, matcher):
         """Test normalisation de la casse."""
         mock_db = Mock()
-        mock_result = Mock()
-        mock_result.scalar.return_value = 1193
-
-        mock_db.execute.return_value = mock_result
-
         repo = VintedMappingRepository(mock_db)
 
         # Call with uppercase
         repo.get_vinted_category_id("JEANS", "MEN", fit="SLIM")
 
-        # Verify the parameters were lowercased
-        call_args = mock_db.execute.call_args
-        params = call_args[0][1]  # Second positional arg is the params dict
-
-        assert params['category'] == 'jeans'
-        assert params['gender'] == 'men'
-        assert params['fit'] == 'slim'
-
-    def test_get_vinted_category_id_handles_none_attributes(self):
-        """Test avec attributs None."""
-        mock_db = Mock()
-        mock_result = Mock()
-        mock_result.scalar.return_value = 1193
+        # Verify the parameters were lowercased, no query per product
+        args, kwargs = matcher.match.call_args
+        assert args == ("jeans", "men")
+        assert kwargs["fit"] == "slim"
+        mock_db.execute.assert_not_called()
 
-        mock_db.execute.return_value = mock_result
+    def test_get_vinted_category_id_handles_none_attributes(self, matcher):
+        """Test avec attributs None (et chaînes vides → None)."""
+        matcher.match.return_value = 1193
 
-        repo = VintedMappingRepository(mock_db)
+        repo = VintedMappingRepository(Mock())
         result = repo.get_vinted_category_id(
             "jeans", "men",
             fit=None,
-            length=None,
+            length="",
             rise=None
         )
 
         assert result == 1193
+        kwargs = matcher.match.call_args.kwargs
+        assert kwargs["fit"] is None
+        assert kwargs["length"] is None
 
     def test_get_vinted_category_id_exception_handling(self):
-        """Test gestion des exceptions."""
+        """Test gestion des exceptions (chargement de l'index impossible)."""
         mock_db = Mock()
         mock_db.execute.side_effect = Exception("DB Error")
 
@@ -156,23 +145,16 @@ class TestGetVintedCategoryWithDetails:
 
     def test_get_vinted_category_with_details_found(self):
         """Test récupération avec détails."""
-        mock_db = Mock()
-
-        # Mock get_vinted_category_id
-        mock_result1 = Mock()
-        mock_result1.scalar.return_value = 1193
+        from services.vinted.vinted_category_matcher import MappingRow, VintedCategoryMatcher
 
-        # Mock vinted_categories lookup
-        mock_result2 = Mock()
-        mock_result2.id = 1193
-        mock_result2.title = "Jean slim"
-        mock_result2.path = "Hommes > Jeans > Slim"
-        mock_result2.gender = "men"
-
-        mock_db.execute.side_effect = [mock_result1, Mock(fetchone=Mock(return_value=mock_result2))]
+        matcher = VintedCategoryMatcher.from_rows(
+            [MappingRow(1, 1193, "jeans", "men", is_default=True)],
+            {1193: {"id": 1193, "title": "Jean slim", "path": "Hommes > Jeans > Slim", "gender": "men"}},
+        )
 
-        repo = VintedMappingRepository(mock_db)
-        result = repo.get_vinted_category_with_details("jeans", "men")
+        with patch(MATCHER, return_value=matcher):
+            repo = VintedMappingRepository(Mock())
+            result = repo.get_vinted_category_with_details("jeans", "men")
 
         assert result['vinted_id'] == 1193
         assert result['title'] == "Jean slim"
@@ -180,17 +162,15 @@ class TestGetVintedCategoryWithDetails:
 
     def test_get_vinted_category_with_details_not_found(self):
         """Test quand aucun mapping trouvé."""
-        mock_db = Mock()
-        mock_result = Mock()
-        mock_result.scalar.return_value = None
-
-        mock_db.execute.return_value = mock_result
+        from services.vinted.vinted_category_matcher import VintedCategoryMatcher
 
-        repo = VintedMappingRepository(mock_db)
-        result = repo.get_vinted_category_with_details("unknown", "men")
+        with patch(MATCHER, return_value=VintedCategoryMatcher.from_rows([])):
+            repo = VintedMappingRepository(Mock())
+            result = repo.get_vinted_category_with_details("unknown", "men")
 
         assert result['vinted_id'] is None
         assert result['title'] is None
+        assert result['gender'] == "men"
 
 
 class TestReverseMapCategoryWithDetails:
@@ -5,7 +5,7 @@ Coverage:
 - get_model, get_pk_field, get_name_field: configuration access
 - list_attributes: pagination, search, unknown type
 - get_attribute: found, not found, unknown type
-- create_attribute: success, duplicate, unknown type
+- create_attribute: success, duplicate, unknown type, AI vocabulary invalidation
 - update_attribute: success, not found, pk not modified
 - delete_attribute: success, not found, foreign key constraint
 - attribute_to_dict: all attribute types
@@ -243,6 +243,17 @@ class TestCreateAttribute:
         with pytest.raises(ValueError, match="Unknown attribute type"):
             AdminAttributeService.create_attribute(mock_db, "unknown", {"name": "test"})
 
+    @patch("services.admin_attribute_service.invalidate_attribute_vocabulary")
+    def test_create_attribute_invalidates_ai_vocabulary(self, mock_invalidate, mock_db):
+        """Test creating a color drops the cached AI vocabulary (brands do not)."""
+        mock_db.query.return_value.filter.return_value.first.return_value = None
+
+        AdminAttributeService.create_attribute(mock_db, "brands", {"name": "NewBrand"})
+        mock_invalidate.assert_not_called()
+
+        AdminAttributeService.create_attribute(mock_db, "colors", {"name_en": "Teal"})
+        mock_invalidate.assert_called_once()
+
     def test_create_attribute_without_pk_value(self, mock_db):
         """Test create_attribute works without pk in data (model handles default)."""
         data = {"name_fr": "Rouge"}  # No name_en for color
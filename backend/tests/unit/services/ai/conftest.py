@@ -32,6 +32,23 @@ def cleanup_data(request):
     yield
 
 
+@pytest.fixture(autouse=True)
+def reset_ai_caches():
+    """
+    Tests mock _fetch_product_attributes and reuse the same fake images:
+    never reuse a cached vocabulary or a cached analysis result.
+    """
+    from unittest.mock import patch
+
+    from services.ai.attribute_vocabulary import invalidate_attribute_vocabulary
+    from shared.config import settings
+
+    invalidate_attribute_vocabulary()
+    with patch.object(settings, "ai_cache_enabled", False):
+        yield
+    invalidate_attribute_vocabulary()
+
+
 @pytest.fixture(scope="function")
 def test_user():
     """
@@ -244,8 +244,8 @@ class TestAIVisionServiceAnalyzeImages:
     """Test the full analyze_images flow with mocked Gemini."""
 
     @pytest.mark.asyncio
-    @patch('services.ai.vision_service.httpx.AsyncClient')
-    @patch('services.ai.vision_service.genai.Client')
+    @patch('services.ai.image_loader.get_http_client')
+    @patch('services.ai.vision_service.get_gemini_client')
     @patch('services.ai.vision_service.AIVisionService._fetch_product_attributes')
     async def test_analyze_images_success(
         self,
@@ -299,7 +299,7 @@ class TestAIVisionServiceAnalyzeImages:
         mock_http_response.headers = MagicMock()
         mock_http_response.headers.get = MagicMock(return_value="image/jpeg")
         mock_http_client.get = AsyncMock(return_value=mock_http_response)
-        mock_httpx.return_value.__aenter__.return_value = mock_http_client
+        mock_httpx.return_value = mock_http_client
 
         # Mock Gemini response
         mock_response = MagicMock()
@@ -317,7 +317,7 @@ class TestAIVisionServiceAnalyzeImages:
         mock_response.usage_metadata.total_token_count = 250
 
         mock_client_instance = MagicMock()
-        mock_client_instance.models.generate_content.return_value = mock_response
+        mock_client_instance.aio.models.generate_content = AsyncMock(return_value=mock_response)
         mock_genai_client.return_value = mock_client_instance
 
         # Mock image URLs
@@ -395,8 +395,8 @@ class TestAIVisionServiceAnalyzeImages:
         assert "pas d'images" in str(exc_info.value).lower()
 
     @pytest.mark.asyncio
-    @patch('services.ai.vision_service.httpx.AsyncClient')
-    @patch('services.ai.vision_service.genai.Client')
+    @patch('services.ai.image_loader.get_http_client')
+    @patch('services.ai.vision_service.get_gemini_client')
     @patch('services.ai.vision_service.AIVisionService._fetch_product_attributes')
     async def test_analyze_images_respects_max_images_limit(
         self,
@@ -455,7 +455,7 @@ class TestAIVisionServiceAnalyzeImages:
         mock_http_response.headers = MagicMock()
         mock_http_response.headers.get = MagicMock(return_value="image/jpeg")
         mock_http_client.get = AsyncMock(return_value=mock_http_response)
-        mock_httpx.return_value.__aenter__.return_value = mock_http_client
+        mock_httpx.return_value = mock_http_client
 
         # Mock Gemini response
         mock_response = MagicMock()
@@ -466,7 +466,7 @@ class TestAIVisionServiceAnalyzeImages:
         mock_response.usage_metadata.total_token_count = 150
 
         mock_client_instance = MagicMock()
-        mock_client_instance.models.generate_content.return_value = mock_response
+        mock_client_instance.aio.models.generate_content = AsyncMock(return_value=mock_response)
         mock_genai_client.return_value = mock_client_instance
 
         # Act
@@ -490,7 +490,7 @@ class TestAIVisionServiceAnalyzeImagesDirect:
     """Test the analyze_images_direct flow."""
 
     @pytest.mark.asyncio
-    @patch('services.ai.vision_service.genai.Client')
+    @patch('services.ai.vision_service.get_gemini_client')
     @patch('services.ai.vision_service.AIVisionService._fetch_product_attributes')
     async def test_analyze_images_direct_success(
         self,
@@ -542,7 +542,7 @@ class TestAIVisionServiceAnalyzeImagesDirect:
         mock_response.usage_metadata.total_token_count = 150
 
         mock_client_instance = MagicMock()
-        mock_client_instance.models.generate_content.return_value = mock_response
+        mock_client_instance.aio.models.generate_content = AsyncMock(return_value=mock_response)
         mock_genai_client.return_value = mock_client_instance
 
         # Act
@@ -0,0 +1,134 @@
+"""
+Unit tests for EbayAspectValueService.
+
+Coverage:
+- GB reference value read from the in-memory reference catalog (no query)
+- marketplace translation with GB fallback, aspect rows cached per instance
+- get_aspect_values: one IN query per aspect table for N values x N marketplaces
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from models.ebay.aspect_value import AspectColour, AspectMaterial
+from services.ebay.ebay_aspect_value_service import EbayAspectValueService
+from services.reference_catalog import ReferenceCatalog
+
+ROWS = {
+    "colors": [
+        {"name_en": "Blue", "name_fr": "Bleu", "ebay_gb_color": "Blue"},
+        {"name_en": "Red", "name_fr": "Rouge", "ebay_gb_color": "Red"},
+        {"name_en": "Teal", "name_fr": "Sarcelle", "ebay_gb_color": None},
+    ],
+    "materials": [{"name_en": "Cotton", "name_fr": "Coton", "ebay_gb_material": "Cotton"}],
+    "sizes": [{"name_en": "W32/L30", "ebay_gb_waist_size": "82 cm"}],
+}
+
+ASPECTS = {
+    AspectColour: [
+        AspectColour(ebay_gb="Blue", ebay_fr="Bleu", ebay_de="Blau"),
+        AspectColour(ebay_gb="Red", ebay_fr="Rouge", ebay_de=None),
+    ],
+    AspectMaterial: [AspectMaterial(ebay_gb="Cotton", ebay_fr="Coton", ebay_de="Baumwolle")],
+}
+ASPECTS_BY_GB = {row.ebay_gb: row for row in ASPECTS[AspectColour]}
+
+
+@pytest.fixture(autouse=True)
+def catalog():
+    with patch(
+        "services.ebay.ebay_aspect_value_service.get_reference_catalog",
+        return_value=ReferenceCatalog.from_rows(ROWS),
+    ):
+        yield
+
+
+@pytest.fixture
+def session():
+    """Session serving ASPECTS rows for query(model).filter(...).all()."""
+    session = MagicMock()
+
+    def query(model):
+        q = MagicMock()
+        q.filter.return_value.all.side_effect = lambda: list(ASPECTS.get(model, []))
+        return q
+
+    session.query.side_effect = query
+    return session
+
+
+class TestGetAspectValue:
+    def test_translates_via_gb_value(self, session):
+        service = EbayAspectValueService(session)
+
+        assert service.get_aspect_value("bleu", "color", "EBAY_DE") == "Blau"
+        assert service.get_aspect_value("BLUE", "colour", "EBAY_FR") == "Bleu"
+        # Missing translation → GB value
+        assert service.get_aspect_value("rouge", "color", "EBAY_DE") == "Red"
+        session.execute.assert_not_called()
+
+    def test_unknown_or_untranslatable_value(self, session):
+        service = EbayAspectValueService(session)
+
+        assert service.get_aspect_value("purple", "color", "EBAY_DE") is None
+        assert service.get_aspect_value("teal", "color", "EBAY_DE") is None
+        assert service.get_aspect_value("bleu", "unknown_aspect", "EBAY_DE") is None
+        session.query.assert_not_called()
+
+    def test_aspect_rows_cached_per_instance(self, session):
+        service = EbayAspectValueService(session)
+
+        service.get_aspect_value("bleu", "color", "EBAY_DE")
+        service.get_aspect_value("bleu", "color", "EBAY_IT")
+
+        assert session.query.call_count == 1
+
+    def test_waist_size_from_catalog(self, session):
+        service = EbayAspectValueService(session)
+
+        assert service.get_waist_size("w32/l30") == "82 cm"
+        assert service.get_inside_leg("W32/L30") is None
+        session.execute.assert_not_called()
+
+
+class TestGetAspectValues:
+    def test_one_query_per_aspect_table(self, session):
+        service = EbayAspectValueService(session)
+        marketplaces = ["EBAY_FR", "EBAY_DE", "EBAY_GB", "EBAY_IT"]
+        requests = [
+            (value, aspect, marketplace)
+            for value, aspect in [("bleu", "color"), ("Red", "color"), ("coton", "material"),
+                                  ("purple", "color"), ("Men", "department")]
+            for marketplace in marketplaces
+        ]
+
+        results = service.get_aspect_values(requests * 2)
+
+        # colour, material, department (no aspect row: value kept)
+        assert session.query.call_count == 3
+        assert results[("bleu", "color", "EBAY_DE")] == "Blau"
+        assert results[("bleu", "color", "EBAY_GB")] == "Blue"
+        assert results[("Red", "color", "EBAY_FR")] == "Rouge"
+        assert results[("coton", "material", "EBAY_DE")] == "Baumwolle"
+        assert results[("purple", "color", "EBAY_FR")] is None
+        assert results[("Men", "department", "EBAY_FR")] == "Men"
+        assert len(results) == len(requests)
+
+    def test_batch_matches_single_lookups(self, session):
+        requests = [("bleu", "color", "EBAY_DE"), ("coton", "material", "EBAY_FR"), ("", "color", "EBAY_FR")]
+
+        batch = EbayAspectValueService(session).get_aspect_values(requests)
+        single = EbayAspectValueService(session)
+
+        assert batch == {request: single.get_aspect_value(*request) for request in requests}
+
+    def test_failed_prefetch_falls_back_to_single_lookups(self, session):
+        service = EbayAspectValueService(session)
+        with patch.object(service, "_load_aspects", side_effect=[RuntimeError("db"), ASPECTS_BY_GB]):
+            results = service.get_aspect_values([("bleu", "color", "EBAY_DE")])
+
+        assert results == {("bleu", "color", "EBAY_DE"): "Blau"}
@@ -11,6 +11,24 @@ from services.ebay.ebay_description_service import (
     EbayDescriptionService,
     MAX_DESCRIPTION_LENGTH,
 )
+from services.reference_catalog import ReferenceCatalog
+
+REFERENCE_ROWS = {
+    "categories": [{"name_en": "Jeans", "name_fr": "Jean", "parent_category": "Pants"}],
+    "colors": [{"name_en": "Blue", "name_fr": "Bleu"}],
+    "conditions": [{"note": 3, "name_en": "Very good", "name_fr": "Très bon état"}],
+    "genders": [{"name_en": "men", "name_fr": "Homme"}],
+}
+
+
+@pytest.fixture(autouse=True)
+def reference_catalog():
+    """Patch the reference catalog (translations, category hierarchy)."""
+    with patch(
+        "services.ebay.ebay_description_service.get_reference_catalog",
+        return_value=ReferenceCatalog.from_rows(REFERENCE_ROWS),
+    ) as mock:
+        yield mock
 
 
 @pytest.fixture
@@ -86,32 +104,15 @@ def mock_marketplace_config_fr():
     return config
 
 
-@pytest.fixture
-def mock_condition():
-    """Mock condition object."""
-    condition = MagicMock()
-    condition.note = 3
-    condition.get_name.return_value = "Very good"
-    return condition
-
-
 class TestEbayDescriptionService:
     """Tests for EbayDescriptionService.generate_description."""
 
     def test_generate_description_en_contains_all_sections(
-        self, mock_service, mock_product, mock_marketplace_config_en, mock_condition,
+        self, mock_service, mock_product, mock_marketplace_config_en
     ):
         """Full EN description contains header, characteristics, measurements, footer, tags."""
         # Setup DB mocks
-        mock_service.db.query.return_value.filter.return_value.first.side_effect = [
-            mock_marketplace_config_en,  # _get_language
-            None,  # _get_category_type (Category lookup)
-            None,  # _translate_attribute for category in seo_intro
-            mock_condition,  # _get_condition_text in seo_intro
-            None,  # _translate_attribute Color in characteristics
-            mock_condition,  # _get_condition_text in characteristics
-            None,  # _translate_attribute Gender in characteristics
-        ]
+        mock_service.db.query.return_value.filter.return_value.first.return_value = mock_marketplace_config_en
 
         result = mock_service.generate_description(mock_product, "EBAY_GB")
 
@@ -137,20 +138,10 @@ class TestEbayDescriptionService:
         assert "#vintage" in result
 
     def test_generate_description_fr_uses_french_labels(
-        self, mock_service, mock_product, mock_marketplace_config_fr, mock_condition,
+        self, mock_service, mock_product, mock_marketplace_config_fr
     ):
         """FR description uses French section labels."""
-        mock_condition.get_name.return_value = "Très bon état"
-
-        mock_service.db.query.return_value.filter.return_value.first.side_effect = [
-            mock_marketplace_config_fr,  # _get_language
-            None,  # _get_category_type
-            None,  # _translate_attribute category
-            mock_condition,  # _get_condition_text seo_intro
-            None,  # _translate_attribute Color
-            mock_condition,  # _get_condition_text characteristics
-            None,  # _translate_attribute Gender
-        ]
+        mock_service.db.query.return_value.filter.return_value.first.return_value = mock_marketplace_config_fr
 
         result = mock_service.generate_description(mock_product, "EBAY_FR")
 
@@ -158,15 +149,15 @@ class TestEbayDescriptionService:
         assert "Mesures" in result
         assert "Expédition rapide" in result
         assert "Mode seconde main" in result
+        # Attributes translated via the reference catalog
+        assert "Bleu" in result
+        assert "Très bon état" in result
 
     def test_custom_shop_name_in_header(
-        self, mock_service, mock_product, mock_marketplace_config_en, mock_condition,
+        self, mock_service, mock_product, mock_marketplace_config_en
     ):
         """Custom shop name appears in the header."""
-        mock_service.db.query.return_value.filter.return_value.first.side_effect = [
-            mock_marketplace_config_en,
-            None, None, mock_condition, None, mock_condition, None,
-        ]
+        mock_service.db.query.return_value.filter.return_value.first.return_value = mock_marketplace_config_en
 
         result = mock_service.generate_description(
             mock_product, "EBAY_GB", shop_name="MY VINTAGE STORE"
@@ -176,13 +167,10 @@ class TestEbayDescriptionService:
         assert "SHOP TON OUTFIT" not in result
 
     def test_seo_intro_contains_brand_and_category(
-        self, mock_service, mock_product, mock_marketplace_config_en, mock_condition,
+        self, mock_service, mock_product, mock_marketplace_config_en
     ):
         """SEO intro paragraph includes brand and category."""
-        mock_service.db.query.return_value.filter.return_value.first.side_effect = [
-            mock_marketplace_config_en,
-            None, None, mock_condition, None, mock_condition, None,
-        ]
+        mock_service.db.query.return_value.filter.return_value.first.return_value = mock_marketplace_config_en
 
         result = mock_service.generate_description(mock_product, "EBAY_GB")
 
@@ -192,13 +180,10 @@ class TestEbayDescriptionService:
         assert "Jeans" in result
 
     def test_measurements_shown_when_dims_present(
-        self, mock_service, mock_product, mock_marketplace_config_en, mock_condition,
+        self, mock_service, mock_product, mock_marketplace_config_en
     ):
         """Measurements displayed when dim1/dim2 etc. are present."""
-        mock_service.db.query.return_value.filter.return_value.first.side_effect = [
-            mock_marketplace_config_en,
-            None, None, mock_condition, None, mock_condition, None,
-        ]
+        mock_service.db.query.return_value.filter.return_value.first.return_value = mock_marketplace_config_en
 
         result = mock_service.generate_description(mock_product, "EBAY_GB")
 
@@ -207,7 +192,7 @@ class TestEbayDescriptionService:
         assert "82 cm" in result
 
     def test_measurements_hidden_when_no_dims(
-        self, mock_service, mock_product, mock_marketplace_config_en, mock_condition,
+        self, mock_service, mock_product, mock_marketplace_config_en
     ):
         """No measurement lines when dimensions are all None."""
         mock_product.dim1 = None
@@ -217,10 +202,7 @@ class TestEbayDescriptionService:
         mock_product.dim5 = None
         mock_product.dim6 = None
 
-        mock_service.db.query.return_value.filter.return_value.first.side_effect = [
-            mock_marketplace_config_en,
-            None, None, mock_condition, None, mock_condition, None,
-        ]
+        mock_service.db.query.return_value.filter.return_value.first.return_value = mock_marketplace_config_en
 
         result = mock_service.generate_description(mock_product, "EBAY_GB")
 
@@ -228,49 +210,43 @@ class TestEbayDescriptionService:
         assert "cm</p>" not in result
 
     def test_category_type_jeans_has_six_dim_labels(
-        self, mock_service, mock_product,
+        self, mock_service, mock_product, reference_catalog,
     ):
         """Jeans category type returns 6 measurement label pairs."""
-        # Mock category DB lookup to return a jeans-related category
-        mock_category = MagicMock()
-        mock_category.parent_category = "Pants"
-
-        mock_service.db.query.return_value.filter.return_value.first.return_value = mock_category
-        mock_product.category = "Jeans"
+        # Category hierarchy from the reference catalog (parent = Pants)
+        reference_catalog.return_value = ReferenceCatalog.from_rows({
+            "categories": [{"name_en": "Chinos", "parent_category": "Pants"}],
+        })
+        mock_product.category = "Chinos"
 
         result = mock_service._get_category_type(mock_product)
         assert result == "jeans"
 
-    def test_category_type_shorts_detected(self, mock_service, mock_product):
+    def test_category_type_shorts_detected(self, mock_service, mock_product, reference_catalog):
         """Shorts category type correctly detected."""
-        mock_category = MagicMock()
-        mock_category.parent_category = "Shorts"
-
-        mock_service.db.query.return_value.filter.return_value.first.return_value = mock_category
-        mock_product.category = "Cargo Shorts"
+        reference_catalog.return_value = ReferenceCatalog.from_rows({
+            "categories": [{"name_en": "Bermuda", "parent_category": "Shorts"}],
+        })
+        mock_product.category = "Bermuda"
 
         result = mock_service._get_category_type(mock_product)
         assert result == "shorts"
 
-    def test_category_type_tops_is_default(self, mock_service, mock_product):
+    def test_category_type_tops_is_default(self, mock_service, mock_product, reference_catalog):
         """Tops is the default category type for unrecognized categories."""
-        mock_category = MagicMock()
-        mock_category.parent_category = "Outerwear"
-
-        mock_service.db.query.return_value.filter.return_value.first.return_value = mock_category
+        reference_catalog.return_value = ReferenceCatalog.from_rows({
+            "categories": [{"name_en": "Jacket", "parent_category": "Outerwear"}],
+        })
         mock_product.category = "Jacket"
 
         result = mock_service._get_category_type(mock_product)
         assert result == "tops"
 
     def test_tags_present_in_description(
-        self, mock_service, mock_product, mock_marketplace_config_en, mock_condition,
+        self, mock_service, mock_product, mock_marketplace_config_en
     ):
         """SEO tags section is present in the output."""
-        mock_service.db.query.return_value.filter.return_value.first.side_effect = [
-            mock_marketplace_config_en,
-            None, None, mock_condition, None, mock_condition, None,
-        ]
+        mock_service.db.query.return_value.filter.return_value.first.return_value = mock_marketplace_config_en
 
         result = mock_service.generate_description(mock_product, "EBAY_GB")
 
@@ -279,13 +255,10 @@ class TestEbayDescriptionService:
         assert "#" in result
 
     def test_truncation_at_max_length(
-        self, mock_service, mock_product, mock_marketplace_config_en, mock_condition,
+        self, mock_service, mock_product, mock_marketplace_config_en
     ):
         """Description is truncated if it exceeds MAX_DESCRIPTION_LENGTH."""
-        mock_service.db.query.return_value.filter.return_value.first.side_effect = [
-            mock_marketplace_config_en,
-            None, None, mock_condition, None, mock_condition, None,
-        ]
+        mock_service.db.query.return_value.filter.return_value.first.return_value = mock_marketplace_config_en
 
         # Make description very long by adding many unique features
         mock_product.unique_feature = [f"feature_{i}" for i in range(500)]
@@ -314,27 +287,21 @@ class TestEbayDescriptionService:
         assert EbayDescriptionService._format_era("1990", "es", t) == "Años 1990"
 
     def test_no_brand_shows_vintage_in_intro(
-        self, mock_service, mock_product, mock_marketplace_config_en, mock_condition,
+        self, mock_service, mock_product, mock_marketplace_config_en
     ):
         """When brand is unbranded, SEO intro uses 'vintage' instead."""
         mock_product.brand = "unbranded"
 
-        mock_service.db.query.return_value.filter.return_value.first.side_effect = [
-            mock_marketplace_config_en,
-            None, None, mock_condition, None, mock_condition, None,
-        ]
+        mock_service.db.query.return_value.filter.return_value.first.return_value = mock_marketplace_config_en
 
         result = mock_service.generate_description(mock_product, "EBAY_GB")
 
         assert "vintage" in result.lower()
 
-    def test_language_fallback_to_english(self, mock_service, mock_product, mock_condition):
+    def test_language_fallback_to_english(self, mock_service, mock_product):
         """Unknown marketplace falls back to English."""
         # No marketplace config found
-        mock_service.db.query.return_value.filter.return_value.first.side_effect = [
-            None,  # _get_language returns "en" (fallback)
-            None, None, mock_condition, None, mock_condition, None,
-        ]
+        mock_service.db.query.return_value.filter.return_value.first.return_value = None
 
         result = mock_service.generate_description(mock_product, "EBAY_UNKNOWN")
 
@@ -7,6 +7,16 @@ Tests SEO title generation with multilingual translations and priority truncatio
 import pytest
 from unittest.mock import MagicMock, patch
 
+from services.reference_catalog import ReferenceCatalog
+
+# Model class name -> (reference catalog table, primary key field)
+CATALOG_TABLES = {
+    "Category": ("categories", "name_en"),
+    "Color": ("colors", "name_en"),
+    "Condition": ("conditions", "note"),
+    "Gender": ("genders", "name_en"),
+}
+
 
 class TestEbaySeoTitleService:
     """Tests for SEO title generation."""
@@ -16,6 +26,16 @@ class TestEbaySeoTitleService:
         """Create a mock DB session."""
         return MagicMock()
 
+    @pytest.fixture(autouse=True)
+    def reference_catalog(self):
+        """Patch the reference catalog (attribute translations)."""
+        with patch(
+            "services.ebay.ebay_seo_title_service.get_reference_catalog",
+            return_value=ReferenceCatalog.from_rows({}),
+        ) as mock:
+            self._reference_catalog = mock
+            yield mock
+
     @pytest.fixture
     def service(self, mock_db):
         """Create service instance with mocked __init__ dependencies."""
@@ -62,14 +82,20 @@ class TestEbaySeoTitleService:
 
     def _setup_db_mocks(self, mock_db, marketplace_config, translations=None):
         """
-        Configure mock_db to return appropriate objects for queries.
+        Configure mock_db (MarketplaceConfig) and the reference catalog.
 
         Args:
-            translations: dict mapping (model_class_name, name_en) -> mock object
+            translations: dict mapping (model_class_name, pk) -> catalog row columns
         """
         if translations is None:
             translations = {}
 
+        rows = {}
+        for (class_name, key), columns in translations.items():
+            table, key_field = CATALOG_TABLES[class_name]
+            rows.setdefault(table, []).append({key_field: key, **columns})
+        self._reference_catalog.return_value = ReferenceCatalog.from_rows(rows)
+
         def query_side_effect(model_class):
             mock_query = MagicMock()
             class_name = model_class.__name__
@@ -81,18 +107,6 @@ class TestEbaySeoTitleService:
                     # MarketplaceConfig
                     if class_name == "MarketplaceConfig":
                         return marketplace_config
-
-                    # Condition (PK = note int)
-                    if class_name == "Condition":
-                        for key, obj in translations.items():
-                            if key[0] == "Condition":
-                                return obj
-                        return None
-
-                    # Other attribute models (PK = name_en)
-                    for key, obj in translations.items():
-                        if key[0] == class_name:
-                            return obj
                     return None
 
                 mock_filter.first = first_side_effect
@@ -175,9 +189,7 @@ class TestEbaySeoTitleService:
     ):
         """Test fallback to English when translation column is empty."""
         # Category with no name_fr (e.g., NL/PL not available for Category)
-        mock_cat = MagicMock()
-        mock_cat.name_en = "jeans"
-        mock_cat.name_fr = None  # No French translation
+        mock_cat = self._mock_attr(name_en="jeans", name_fr=None)  # No French translation
 
         self._setup_db_mocks(mock_db, mock_marketplace_config_fr, {
             ("Category", "jeans"): mock_cat,
@@ -354,15 +366,10 @@ class TestEbaySeoTitleService:
 
     @staticmethod
     def _mock_attr(**kwargs):
-        """Create a mock attribute model (Color, Category, Gender)."""
-        obj = MagicMock()
-        for key, value in kwargs.items():
-            setattr(obj, key, value)
-        return obj
+        """Catalog row columns of an attribute (Color, Category, Gender)."""
+        return dict(kwargs)
 
     @staticmethod
     def _mock_condition(name_value: str, lang: str):
-        """Create a mock Condition with get_name support."""
-        obj = MagicMock()
-        obj.get_name.return_value = name_value
-        return obj
+        """Catalog row columns of a Condition translated in lang."""
+        return {f"name_{lang}": name_value}
@@ -0,0 +1,204 @@
+"""
+Unit Tests for BulkPricingService (services/pricing/bulk_pricing.py).
+
+Bulk results must match PricingService.calculate_price() to the cent.
+"""
+
+import asyncio
+from decimal import Decimal
+from types import MappingProxyType
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from models.product_attributes.model import Model
+from models.public.brand_group import BrandGroup
+from repositories.brand_group_repository import BrandGroupRepository
+from repositories.model_repository import ModelRepository
+from schemas.pricing import PriceInput
+from services.pricing.adjustment_calculators import calculatePriceLevels
+from services.pricing.bulk_pricing import BulkPricingItem, BulkPricingResult, BulkPricingService
+from services.pricing.coefficient_snapshot import PricingCoefficients
+from services.pricing.pricing_generation_service import PricingGenerationService
+from services.pricing_service import PricingService
+
+COEFFICIENTS = PricingCoefficients(
+    version=1,
+    condition=MappingProxyType({10: Decimal("1.15"), 7: Decimal("0.93"), 3: Decimal("0.55")}),
+    origin=MappingProxyType({"Italy": Decimal("0.15"), "USA": Decimal("0.10"), "China": Decimal("-0.05")}),
+    decade=MappingProxyType({"1990s": Decimal("0.05"), "1970s": Decimal("0.20")}),
+    trend=MappingProxyType({"Y2K": Decimal("0.08"), "Workwear": Decimal("0.12")}),
+    feature=MappingProxyType({"Selvedge": Decimal("0.15"), "Deadstock": Decimal("0.20")}),
+    fit=MappingProxyType({"Slim": Decimal("0.03"), "Loose": Decimal("-0.02")}),
+)
+
+BRAND_GROUPS = {
+    ("Levi's", "jeans"): BrandGroup(
+        id=1, brand="Levi's", group="jeans", base_price=Decimal("37.00"),
+        expected_origins=["USA"], expected_decades=["1990s"], expected_trends=["Workwear"],
+    ),
+    ("Levi's", "tshirt"): BrandGroup(
+        id=2, brand="Levi's", group="tshirt", base_price=Decimal("13.00"),
+        expected_origins=[], expected_decades=[], expected_trends=[],
+    ),
+}
+
+MODELS = {
+    ("Levi's", "jeans", "501"): Model(
+        brand="Levi's", group="jeans", name="501",
+        coefficient=Decimal("1.35"), expected_features=["Selvedge"],
+    ),
+}
+
+ITEMS = [
+    BulkPricingItem(product_id=1, brand="Levi's", category="jeans", materials=("denim",),
+                    model_name="501", condition=7, origin="Italy", decade="1970s", trend="Y2K",
+                    unique_features=("Deadstock",), fit="Slim"),
+    BulkPricingItem(product_id=2, brand="Levi's", category="jeans", materials=("denim",),
+                    model_name=None, condition=3, origin="China", decade="1990s", trend=None,
+                    fit="Loose"),
+    BulkPricingItem(product_id=3, brand="Levi's", category="t-shirt", materials=("cotton",),
+                    model_name="Unknown model", condition=10, origin="USA", decade="1990s",
+                    trend="Workwear", unique_features=("Selvedge", "Deadstock")),
+]
+
+
+class TestCalculatePriceLevels:
+    def test_levels_and_rounding(self):
+        quick, standard, premium = calculatePriceLevels(
+            Decimal("37.00"), Decimal("1.35"), Decimal("0.93"), Decimal("0.125")
+        )
+
+        # 37 × 1.35 × 0.93 × 1.125 = 52.2604...
+        assert standard == Decimal("52.26")
+        assert quick == Decimal("39.20")
+        assert premium == Decimal("67.94")
+
+
+class TestCompute:
+    def test_parity_with_pricing_service(self):
+        """Same 3 prices as PricingService.calculate_price() for every item."""
+        brand_group_repo = MagicMock(spec=BrandGroupRepository)
+        brand_group_repo.get_by_brand_and_group.side_effect = (
+            lambda db, brand, group: BRAND_GROUPS.get((brand, group))
+        )
+        model_repo = MagicMock(spec=ModelRepository)
+        model_repo.get_by_brand_group_and_name.side_effect = (
+            lambda db, brand, group, name: MODELS.get((brand, group, name))
+        )
+        service = PricingService(
+            db=MagicMock(),
+            brand_group_repo=brand_group_repo,
+            model_repo=model_repo,
+            generation_service=MagicMock(spec=PricingGenerationService),
+        )
+
+        bulk = BulkPricingService.compute(ITEMS[:2], BRAND_GROUPS, MODELS, COEFFICIENTS)
+
+        with patch("services.pricing_service.get_pricing_coefficients", return_value=COEFFICIENTS):
+            for item, result in zip(ITEMS[:2], bulk):
+                output = asyncio.run(service.calculate_price(PriceInput(
+                    brand=item.brand,
+                    category=item.category,
+                    materials=list(item.materials),
+                    model_name=item.model_name,
+                    condition_score=item.condition,
+                    condition_sensitivity=Decimal("1.0"),
+                    actual_origin=item.origin,
+                    actual_decade=item.decade,
+                    actual_trends=[item.trend] if item.trend else [],
+                    actual_features=list(item.unique_features),
+                    actual_fit=item.fit,
+                )))
+                assert result.status == "OK"
+                assert (result.quick_price, result.standard_price, result.premium_price) == (
+                    output.quick_price, output.standard_price, output.premium_price
+                )
+                assert result.total_adjustment + result.condition_mult - 1 == output.adjustments.total
+
+    def test_missing_model_keeps_default_coefficient(self):
+        result = BulkPricingService.compute([ITEMS[2]], BRAND_GROUPS, MODELS, COEFFICIENTS)[0]
+
+        assert result.status == "OK"
+        assert result.group == "tshirt"
+        assert result.model_coeff == Decimal("1.0")
+        # Features: max(0.15, 0.20) - 0 expected = +0.20
+        assert result.feature_adj == Decimal("0.20")
+
+    def test_missing_brand_group(self):
+        item = BulkPricingItem(product_id=4, brand="Nike", category="jeans", materials=("denim",))
+
+        result = BulkPricingService.compute([item], BRAND_GROUPS, MODELS, COEFFICIENTS)[0]
+
+        assert result.status == "NO_BRAND_GROUP"
+        assert result.group == "jeans"
+        assert result.standard_price is None
+
+    def test_unknown_category(self):
+        item = BulkPricingItem(product_id=5, brand="Levi's", category="sneakers")
+
+        result = BulkPricingService.compute([item], BRAND_GROUPS, MODELS, COEFFICIENTS)[0]
+
+        assert result.status == "ERROR"
+        assert "Group determination failed" in result.error
+
+    def test_identical_attributes_share_results(self):
+        items = [
+            BulkPricingItem(product_id=i, brand="Levi's", category="jeans", materials=("denim",),
+                            condition=7, origin="Italy")
+            for i in range(1, 4)
+        ]
+
+        results = BulkPricingService.compute(items, BRAND_GROUPS, MODELS, COEFFICIENTS)
+
+        assert [r.item.product_id for r in results] == [1, 2, 3]
+        assert len({r.standard_price for r in results}) == 1
+
+
+class TestPriceItems:
+    def test_set_based_lookups(self):
+        db = MagicMock()
+        with patch.object(BrandGroupRepository, "get_by_brand_group_pairs", return_value=BRAND_GROUPS) as bg_lookup, \
+                patch.object(ModelRepository, "get_by_keys", return_value=MODELS) as model_lookup, \
+                patch("services.pricing.bulk_pricing.get_pricing_coefficients", return_value=COEFFICIENTS):
+            results = BulkPricingService.price_items(db, ITEMS)
+
+        assert len(results) == 3
+        bg_lookup.assert_called_once()
+        assert bg_lookup.call_args.args[1] == {("Levi's", "jeans"), ("Levi's", "tshirt")}
+        model_lookup.assert_called_once()
+        assert model_lookup.call_args.args[1] == {
+            ("Levi's", "jeans", "501"), ("Levi's", "tshirt", "Unknown model")
+        }
+
+
+class TestApplyPrices:
+    def _result(self, product_id, price, current, status="OK"):
+        item = BulkPricingItem(product_id=product_id, brand="Levi's", category="jeans",
+                               current_price=current, version_number=3)
+        return BulkPricingResult(item=item, status=status, standard_price=price)
+
+    def test_updates_changed_prices_and_reports_conflicts(self):
+        db = MagicMock()
+        db.execute.return_value.scalars.return_value = [1]
+        results = [
+            self._result(1, Decimal("40.00"), Decimal("35.00")),
+            self._result(2, Decimal("50.00"), Decimal("45.00")),  # Modified concurrently
+            self._result(3, Decimal("20.00"), Decimal("20.00")),  # Unchanged
+            self._result(4, None, Decimal("20.00"), status="NO_BRAND_GROUP"),
+        ]
+
+        updated, conflicts = BulkPricingService.apply_prices(db, results)
+
+        assert updated == {1}
+        assert conflicts == {2}
+        db.execute.assert_called_once()
+        db.commit.assert_not_called()
+        # SOLD products are immutable
+        sql = str(db.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "tenant.products.status != %(status_1)s" in sql
+
+    def test_unknown_level(self):
+        with pytest.raises(ValueError):
+            BulkPricingService.apply_prices(MagicMock(), [], level="luxury")
@@ -0,0 +1,99 @@
+"""
+Unit Tests for the pricing coefficient snapshot (services/pricing/coefficient_snapshot.py).
+"""
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from services.pricing import coefficient_snapshot
+from services.pricing.coefficient_snapshot import (
+    get_pricing_coefficients,
+    invalidate_pricing_coefficients,
+    load_pricing_coefficients,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_snapshot(monkeypatch):
+    monkeypatch.setattr(coefficient_snapshot, "_snapshot", None)
+    monkeypatch.setattr(coefficient_snapshot, "_loaded_at", 0.0)
+    monkeypatch.setattr(coefficient_snapshot, "_version", 0)
+
+
+def _db(origin_coef: str = "0.10"):
+    """Session mock returning the 6 coefficient tables (conditions first)."""
+    db = MagicMock()
+
+    def execute(_stmt):
+        result = MagicMock()
+        index = db.execute.call_count - 1
+        rows = [
+            [(10, Decimal("1.15")), (5, Decimal("0.80")), (0, None)],  # conditions
+            [("Italy", Decimal(origin_coef))],  # origins
+            [("1990s", Decimal("0.05"))],  # decades
+            [("y2k", Decimal("0.08"))],  # trends
+            [("deadstock", Decimal("0.20"))],  # features
+            [("slim", Decimal("0.00"))],  # fits
+        ][index % 6]
+        result.all.return_value = rows
+        return result
+
+    db.execute.side_effect = execute
+    return db
+
+
+class TestLoadPricingCoefficients:
+    def test_loads_all_tables(self):
+        snapshot = load_pricing_coefficients(_db())
+
+        assert snapshot.condition == {10: Decimal("1.15"), 5: Decimal("0.80")}
+        assert snapshot.origin == {"Italy": Decimal("0.10")}
+        assert snapshot.feature == {"deadstock": Decimal("0.20")}
+        assert snapshot.fit == {"slim": Decimal("0.00")}
+
+    def test_snapshot_is_immutable(self):
+        snapshot = load_pricing_coefficients(_db())
+
+        with pytest.raises(TypeError):
+            snapshot.origin["Italy"] = Decimal("9")
+        with pytest.raises(AttributeError):
+            snapshot.version = 2
+
+
+class TestGetPricingCoefficients:
+    def test_shared_until_invalidated(self):
+        db = _db()
+
+        first = get_pricing_coefficients(db)
+        second = get_pricing_coefficients(db)
+
+        assert first is second
+        assert first.version == 1
+        assert db.execute.call_count == 6  # one load for both calls
+
+    def test_reload_with_same_content_keeps_version(self):
+        first = get_pricing_coefficients(_db())
+        invalidate_pricing_coefficients()
+        second = get_pricing_coefficients(_db())
+
+        assert second is first
+        assert second.version == 1
+
+    def test_reload_with_new_content_bumps_version(self):
+        get_pricing_coefficients(_db(origin_coef="0.10"))
+        invalidate_pricing_coefficients()
+        snapshot = get_pricing_coefficients(_db(origin_coef="0.25"))
+
+        assert snapshot.version == 2
+        assert snapshot.origin["Italy"] == Decimal("0.25")
+
+    def test_ttl_expiry_reloads(self, monkeypatch):
+        db = _db()
+        get_pricing_coefficients(db)
+        monkeypatch.setattr(coefficient_snapshot, "COEFFICIENTS_TTL_SECONDS", 0)
+
+        get_pricing_coefficients(db)
+
+        assert db.execute.call_count == 12
@@ -0,0 +1,249 @@
+"""
+Unit Tests for PricingGenerationCoordinator
+
+Single-flight generation of pricing data (in-process + advisory lock) and
+negative caching of fallbacks, plus its use by PricingService.
+"""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from models.public.brand_group import BrandGroup
+from models.product_attributes.model import Model
+from repositories.brand_group_repository import BrandGroupRepository
+from repositories.model_repository import ModelRepository
+from services.pricing.generation_coordinator import (
+    GenerationOutcome,
+    PricingGenerationCoordinator,
+    advisory_lock_id,
+    pricing_generation_coordinator,
+)
+from services.pricing.pricing_generation_service import GenerationResult, PricingGenerationService
+from services.pricing_service import PricingService
+from shared.exceptions import BrandGroupGenerationError
+
+KEY = ("brand_group", "Levi's", "jeans")
+
+
+@pytest.fixture(autouse=True)
+def clear_global_coordinator():
+    pricing_generation_coordinator.clear()
+    yield
+    pricing_generation_coordinator.clear()
+
+
+def _db(lock_results=None):
+    """Session mock: pg_try_advisory_xact_lock returns lock_results in order (default: acquired)."""
+    db = MagicMock()
+    if lock_results is not None:
+        db.execute.return_value.scalar.side_effect = list(lock_results)
+    else:
+        db.execute.return_value.scalar.return_value = True
+    return db
+
+
+class TestAdvisoryLockId:
+    def test_stable_signed_64_bit(self):
+        lock_id = advisory_lock_id(KEY)
+        assert lock_id == advisory_lock_id(KEY)
+        assert -(2 ** 63) <= lock_id < 2 ** 63
+        assert lock_id != advisory_lock_id(("brand_group", "Levi's", "pants"))
+
+
+class TestSingleFlight:
+    def test_concurrent_requests_generate_once(self):
+        coordinator = PricingGenerationCoordinator()
+        saved = {}
+        calls = []
+
+        async def generate():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            saved["row"] = "row"
+            return GenerationOutcome("row", persisted=True)
+
+        async def scenario():
+            return await asyncio.gather(*(
+                coordinator.get_or_generate(_db(), KEY, lambda: saved.get("row"), generate)
+                for _ in range(5)
+            ))
+
+        results = asyncio.run(scenario())
+
+        assert calls == [1]
+        assert results == ["row"] * 5
+
+    def test_waiters_receive_leader_error(self):
+        coordinator = PricingGenerationCoordinator()
+        calls = []
+
+        async def generate():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            raise BrandGroupGenerationError("Levi's", "jeans", "boom")
+
+        async def scenario():
+            return await asyncio.gather(
+                *(coordinator.get_or_generate(_db(), KEY, lambda: None, generate) for _ in range(3)),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(scenario())
+
+        assert calls == [1]
+        assert all(isinstance(r, BrandGroupGenerationError) for r in results)
+        # One instance per request, same message and attributes
+        assert len({id(r) for r in results}) == 3
+        assert {str(r) for r in results} == {str(results[0])}
+        assert all(r.brand == "Levi's" and r.group == "jeans" for r in results)
+
+    def test_other_worker_generates_while_locked(self):
+        coordinator = PricingGenerationCoordinator()
+        rows = iter([None, "row-from-other-worker"])
+        generate = AsyncMock()
+
+        with patch("services.pricing.generation_coordinator.LOCK_POLL_SECONDS", 0):
+            result = asyncio.run(coordinator.get_or_generate(
+                _db(lock_results=[False, False]), KEY, lambda: next(rows), generate
+            ))
+
+        assert result == "row-from-other-worker"
+        generate.assert_not_awaited()
+
+    def test_recheck_under_lock_releases_it(self):
+        coordinator = PricingGenerationCoordinator()
+        db = _db()
+        generate = AsyncMock()
+
+        result = asyncio.run(coordinator.get_or_generate(db, KEY, lambda: "row", generate))
+
+        assert result == "row"
+        generate.assert_not_awaited()
+        db.commit.assert_called_once()
+
+
+class TestNegativeCache:
+    def test_fallback_is_cached(self):
+        coordinator = PricingGenerationCoordinator()
+        generate = AsyncMock(return_value=GenerationOutcome("fallback", persisted=False))
+
+        first = asyncio.run(coordinator.get_or_generate(_db(), KEY, lambda: None, generate))
+        second = asyncio.run(coordinator.get_or_generate(_db(), KEY, lambda: None, generate))
+
+        assert first == second == "fallback"
+        assert generate.await_count == 1
+
+    def test_error_is_not_cached(self):
+        """Save/DB errors may be transient: the next request generates again."""
+        coordinator = PricingGenerationCoordinator()
+        generate = AsyncMock(side_effect=[
+            BrandGroupGenerationError("Levi's", "jeans", "connection reset"),
+            GenerationOutcome("row", persisted=True),
+        ])
+
+        with pytest.raises(BrandGroupGenerationError):
+            asyncio.run(coordinator.get_or_generate(_db(), KEY, lambda: None, generate))
+        result = asyncio.run(coordinator.get_or_generate(_db(), KEY, lambda: None, generate))
+
+        assert result == "row"
+        assert generate.await_count == 2
+        assert KEY not in coordinator._negative
+
+    def test_retries_after_ttl(self):
+        coordinator = PricingGenerationCoordinator()
+        generate = AsyncMock(return_value=GenerationOutcome("fallback", persisted=False))
+
+        asyncio.run(coordinator.get_or_generate(_db(), KEY, lambda: None, generate))
+        # Expire the entry
+        _, value = coordinator._negative[KEY]
+        coordinator._negative[KEY] = (0.0, value)
+        asyncio.run(coordinator.get_or_generate(_db(), KEY, lambda: None, generate))
+
+        assert generate.await_count == 2
+
+    def test_disabled_with_zero_ttl(self):
+        coordinator = PricingGenerationCoordinator()
+        generate = AsyncMock(return_value=GenerationOutcome("fallback", persisted=False))
+
+        with patch("services.pricing.generation_coordinator.settings.pricing_generation_negative_ttl_seconds", 0):
+            for _ in range(2):
+                asyncio.run(coordinator.get_or_generate(_db(), KEY, lambda: None, generate))
+
+        assert generate.await_count == 2
+
+
+class TestPricingServiceGeneration:
+    @pytest.fixture
+    def service(self):
+        return PricingService(
+            db=_db(),
+            brand_group_repo=MagicMock(spec=BrandGroupRepository),
+            model_repo=MagicMock(spec=ModelRepository),
+            generation_service=MagicMock(spec=PricingGenerationService),
+        )
+
+    def test_generated_brand_group_is_saved(self, service):
+        generated = BrandGroup(id=1, brand="Levi's", group="jeans", base_price=Decimal("40.00"))
+        service.brand_group_repo.get_by_brand_and_group.return_value = None
+        service.brand_group_repo.create.return_value = generated
+        service.generation_service.generate_brand_group = AsyncMock(
+            return_value=GenerationResult(brand_group=generated)
+        )
+
+        data = asyncio.run(service.fetch_or_generate_pricing_data("Levi's", "jeans", ["denim"]))
+
+        assert data["base_price"] == Decimal("40.00")
+        service.brand_group_repo.create.assert_called_once()
+        service.db.commit.assert_called_once()
+
+    def test_fallback_brand_group_not_saved_and_model_skipped(self, service):
+        fallback = PricingGenerationService._get_fallback_brand_group("Levi's", "jeans")
+        service.brand_group_repo.get_by_brand_and_group.return_value = None
+        service.generation_service.generate_brand_group = AsyncMock(
+            return_value=GenerationResult(brand_group=fallback, is_fallback=True)
+        )
+        service.generation_service.generate_model = AsyncMock()
+
+        data = asyncio.run(service.fetch_or_generate_pricing_data(
+            "Levi's", "jeans", ["denim"], model_name="501"
+        ))
+
+        assert data["base_price"] == Decimal("30.00")
+        assert data["model"] is None
+        assert data["model_coeff"] == Decimal("1.0")
+        service.brand_group_repo.create.assert_not_called()
+        service.generation_service.generate_model.assert_not_awaited()
+
+    def test_fallback_model_not_saved(self, service):
+        brand_group = BrandGroup(id=1, brand="Levi's", group="jeans", base_price=Decimal("40.00"))
+        service.brand_group_repo.get_by_brand_and_group.return_value = brand_group
+        service.model_repo.get_by_brand_group_and_name.return_value = None
+        service.generation_service.generate_model = AsyncMock(
+            return_value=PricingGenerationService._get_fallback_model("Levi's", "jeans", "501")
+        )
+
+        data = asyncio.run(service.fetch_or_generate_pricing_data(
+            "Levi's", "jeans", ["denim"], model_name="501"
+        ))
+
+        assert data["model_coeff"] == Decimal("1.0")
+        service.model_repo.create.assert_not_called()
+
+    def test_generated_model_is_saved(self, service):
+        brand_group = BrandGroup(id=1, brand="Levi's", group="jeans", base_price=Decimal("40.00"))
+        generated = Model(brand="Levi's", group="jeans", name="501",
+                          coefficient=Decimal("1.4"), generated_by_ai=True)
+        service.brand_group_repo.get_by_brand_and_group.return_value = brand_group
+        service.model_repo.get_by_brand_group_and_name.return_value = None
+        service.model_repo.create.return_value = generated
+        service.generation_service.generate_model = AsyncMock(return_value=generated)
+
+        data = asyncio.run(service.fetch_or_generate_pricing_data(
+            "Levi's", "jeans", ["denim"], model_name="501"
+        ))
+
+        assert data["model_coeff"] == Decimal("1.4")
+        service.model_repo.create.assert_called_once()
@@ -7,7 +7,7 @@ Covers success paths, validation, fallbacks, and error handling.
 
 import json
 from decimal import Decimal
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 from google import genai
@@ -36,9 +36,9 @@ VALID_RESPONSE_JSON = json.dumps(VALID_RESPONSE_DATA)
 @pytest.fixture
 def mock_gemini_client():
     """Mock Gemini client for testing."""
-    with patch("services.pricing.pricing_generation_service.genai.Client") as MockClient:
+    with patch("services.pricing.pricing_generation_service.get_gemini_client") as get_client:
         mock_client = MagicMock()
-        MockClient.return_value = mock_client
+        get_client.return_value = mock_client
 
         # Setup default valid response
         mock_response = Mock()
@@ -48,7 +48,7 @@ def mock_gemini_client():
             candidates_token_count=50,
         )
 
-        mock_client.models.generate_content.return_value = mock_response
+        mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
 
         yield mock_client
 
@@ -77,7 +77,7 @@ class TestGenerateBrandGroupSuccess:
         assert result.expected_trends == ["vintage", "workwear"]
 
         # Verify API called once
-        mock_gemini_client.models.generate_content.assert_called_once()
+        mock_gemini_client.aio.models.generate_content.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_generate_brand_group_with_empty_lists(self, mock_gemini_client):
@@ -89,7 +89,7 @@ class TestGenerateBrandGroupSuccess:
             "expected_trends": [],
             "condition_sensitivity": 1.0,
         }
-        mock_gemini_client.models.generate_content.return_value.text = json.dumps(
+        mock_gemini_client.aio.models.generate_content.return_value.text = json.dumps(
             response_data
         )
 
@@ -110,7 +110,7 @@ class TestGenerateBrandGroupSuccess:
             "expected_trends": ["T1", "T2", "T3", "T4", "T5"],  # Max 5
             "condition_sensitivity": 0.5,  # Min
         }
-        mock_gemini_client.models.generate_content.return_value.text = json.dumps(
+        mock_gemini_client.aio.models.generate_content.return_value.text = json.dumps(
             response_data
         )
 
@@ -133,7 +133,7 @@ class TestGenerateBrandGroupValidation:
         """Test fallback when base_price < 5€."""
         response_data = VALID_RESPONSE_DATA.copy()
         response_data["base_price"] = 4.0  # Too low
-        mock_gemini_client.models.generate_content.return_value.text = json.dumps(
+        mock_gemini_client.aio.models.generate_content.return_value.text = json.dumps(
             response_data
         )
 
@@ -149,7 +149,7 @@ class TestGenerateBrandGroupValidation:
         """Test fallback when base_price > 500€."""
         response_data = VALID_RESPONSE_DATA.copy()
         response_data["base_price"] = 501.0  # Too high
-        mock_gemini_client.models.generate_content.return_value.text = json.dumps(
+        mock_gemini_client.aio.models.generate_content.return_value.text = json.dumps(
             response_data
         )
 
@@ -163,7 +163,7 @@ class TestGenerateBrandGroupValidation:
         """Test fallback when condition_sensitivity < 0.5."""
         response_data = VALID_RESPONSE_DATA.copy()
         response_data["condition_sensitivity"] = 0.4  # Too low
-        mock_gemini_client.models.generate_content.return_value.text = json.dumps(
+        mock_gemini_client.aio.models.generate_content.return_value.text = json.dumps(
             response_data
         )
 
@@ -177,7 +177,7 @@ class TestGenerateBrandGroupValidation:
         """Test fallback when condition_sensitivity > 1.5."""
         response_data = VALID_RESPONSE_DATA.copy()
         response_data["condition_sensitivity"] = 1.6  # Too high
-        mock_gemini_client.models.generate_content.return_value.text = json.dumps(
+        mock_gemini_client.aio.models.generate_content.return_value.text = json.dumps(
             response_data
         )
 
@@ -191,7 +191,7 @@ class TestGenerateBrandGroupValidation:
         """Test fallback when expected_origins is not a list."""
         response_data = VALID_RESPONSE_DATA.copy()
         response_data["expected_origins"] = "USA,Mexico"  # String instead of list
-        mock_gemini_client.models.generate_content.return_value.text = json.dumps(
+        mock_gemini_client.aio.models.generate_content.return_value.text = json.dumps(
             response_data
         )
 
@@ -205,7 +205,7 @@ class TestGenerateBrandGroupValidation:
         """Test fallback when expected_origins has > 5 items."""
         response_data = VALID_RESPONSE_DATA.copy()
         response_data["expected_origins"] = ["A", "B", "C", "D", "E", "F"]  # 6 items
-        mock_gemini_client.models.generate_content.return_value.text = json.dumps(
+        mock_gemini_client.aio.models.generate_content.return_value.text = json.dumps(
             response_data
         )
 
@@ -219,7 +219,7 @@ class TestGenerateBrandGroupValidation:
         """Test fallback when list contains empty strings."""
         response_data = VALID_RESPONSE_DATA.copy()
         response_data["expected_origins"] = ["USA", "", "Mexico"]  # Empty string
-        mock_gemini_client.models.generate_content.return_value.text = json.dumps(
+        mock_gemini_client.aio.models.generate_content.return_value.text = json.dumps(
             response_data
         )
 
@@ -238,7 +238,7 @@ class TestGenerateBrandGroupValidation:
             "expected_trends": [],
             "condition_sensitivity": 1.0,
         }
-        mock_gemini_client.models.generate_content.return_value.text = json.dumps(
+        mock_gemini_client.aio.models.generate_content.return_value.text = json.dumps(
             response_data
         )
 
@@ -258,7 +258,7 @@ class TestGenerateBrandGroupFallback:
     async def test_gemini_connection_error(self, mock_gemini_client):
         """Test fallback on connection errors (simulates ClientError behavior)."""
         # Connection errors trigger fallback just like Gemini errors
-        mock_gemini_client.models.generate_content.side_effect = ConnectionError(
+        mock_gemini_client.aio.models.generate_content.side_effect = ConnectionError(
             "Failed to connect to Gemini API"
         )
 
@@ -275,7 +275,7 @@ class TestGenerateBrandGroupFallback:
     async def test_gemini_timeout_error(self, mock_gemini_client):
         """Test fallback on timeout errors (simulates ServerError behavior)."""
         # Timeout errors trigger fallback just like Gemini errors
-        mock_gemini_client.models.generate_content.side_effect = TimeoutError(
+        mock_gemini_client.aio.models.generate_content.side_effect = TimeoutError(
             "Request to Gemini API timed out"
         )
 
@@ -288,7 +288,7 @@ class TestGenerateBrandGroupFallback:
     async def test_gemini_value_error(self, mock_gemini_client):
         """Test fallback on value errors (simulates APIError behavior)."""
         # Value errors (e.g., quota exceeded) trigger fallback
-        mock_gemini_client.models.generate_content.side_effect = ValueError(
+        mock_gemini_client.aio.models.generate_content.side_effect = ValueError(
             "API quota exceeded"
         )
 
@@ -300,7 +300,7 @@ class TestGenerateBrandGroupFallback:
     @pytest.mark.asyncio
     async def test_unexpected_exception(self, mock_gemini_client):
         """Test fallback on unexpected exception."""
-        mock_gemini_client.models.generate_content.side_effect = RuntimeError(
+        mock_gemini_client.aio.models.generate_content.side_effect = RuntimeError(
             "Unexpected error"
         )
 
@@ -312,7 +312,7 @@ class TestGenerateBrandGroupFallback:
     @pytest.mark.asyncio
     async def test_invalid_json_response(self, mock_gemini_client):
         """Test fallback when LLM returns invalid JSON."""
-        mock_gemini_client.models.generate_content.return_value.text = "not valid json {{"
+        mock_gemini_client.aio.models.generate_content.return_value.text = "not valid json {{"
 
         result = await PricingGenerationService.generate_brand_group("Brand", "group")
 
@@ -345,7 +345,7 @@ class TestGenerateBrandGroupPrompt:
         await PricingGenerationService.generate_brand_group("Nike", "sneakers")
 
         # Get the actual call arguments
-        call_args = mock_gemini_client.models.generate_content.call_args
+        call_args = mock_gemini_client.aio.models.generate_content.call_args
         prompt_contents = call_args.kwargs["contents"]
 
         assert isinstance(prompt_contents, list)
@@ -358,7 +358,7 @@ class TestGenerateBrandGroupPrompt:
         """Test that prompt mentions secondhand/vintage context."""
         await PricingGenerationService.generate_brand_group("Hermès", "bags")
 
-        call_args = mock_gemini_client.models.generate_content.call_args
+        call_args = mock_gemini_client.aio.models.generate_content.call_args
         prompt_text = call_args.kwargs["contents"][0]
 
         assert "secondhand" in prompt_text.lower()
@@ -368,7 +368,7 @@ class TestGenerateBrandGroupPrompt:
         """Test that prompt specifies JSON output format."""
         await PricingGenerationService.generate_brand_group("Zara", "dress")
 
-        call_args = mock_gemini_client.models.generate_content.call_args
+        call_args = mock_gemini_client.aio.models.generate_content.call_args
         prompt_text = call_args.kwargs["contents"][0]
 
         # Check that all required fields are mentioned
@@ -383,7 +383,7 @@ class TestGenerateBrandGroupPrompt:
         """Test that prompt includes examples for guidance."""
         await PricingGenerationService.generate_brand_group("Adidas", "sneakers")
 
-        call_args = mock_gemini_client.models.generate_content.call_args
+        call_args = mock_gemini_client.aio.models.generate_content.call_args
         prompt_text = call_args.kwargs["contents"][0]
 
         # Check for example patterns
@@ -394,7 +394,7 @@ class TestGenerateBrandGroupPrompt:
         """Test that gemini-2.5-flash model is used."""
         await PricingGenerationService.generate_brand_group("Brand", "group")
 
-        call_args = mock_gemini_client.models.generate_content.call_args
+        call_args = mock_gemini_client.aio.models.generate_content.call_args
         assert call_args.kwargs["model"] == "gemini-2.5-flash"
 
     @pytest.mark.asyncio
@@ -402,7 +402,7 @@ class TestGenerateBrandGroupPrompt:
         """Test that JSON response MIME type is set."""
         await PricingGenerationService.generate_brand_group("Brand", "group")
 
-        call_args = mock_gemini_client.models.generate_content.call_args
+        call_args = mock_gemini_client.aio.models.generate_content.call_args
         config = call_args.kwargs["config"]
 
         assert config.response_mime_type == "application/json"
@@ -426,7 +426,7 @@ class TestGenerateModelSuccess:
     @pytest.mark.asyncio
     async def test_generate_model_valid_response(self, mock_gemini_client):
         """Test generate_model with valid LLM response."""
-        mock_gemini_client.models.generate_content.return_value.text = VALID_MODEL_RESPONSE_JSON
+        mock_gemini_client.aio.models.generate_content.return_value.text = VALID_MODEL_RESPONSE_JSON
 
         brand = "Nike"
         group = "sneakers"
@@ -444,18 +444,18 @@ class TestGenerateModelSuccess:
         assert result.expected_features == ["original_box", "limited_edition"]
 
         # Verify API called once
-        mock_gemini_client.models.generate_content.assert_called_once()
+        mock_gemini_client.aio.models.generate_content.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_generate_model_with_base_price_context(self, mock_gemini_client):
         """Test that base_price is included in prompt for context."""
-        mock_gemini_client.models.generate_content.return_value.text = VALID_MODEL_RESPONSE_JSON
+        mock_gemini_client.aio.models.generate_content.return_value.text = VALID_MODEL_RESPONSE_JSON
 
         base_price = Decimal("100.50")
         await PricingGenerationService.generate_model("Hermès", "bags", "Birkin", base_price)
 
         # Get the actual call arguments
-        call_args = mock_gemini_client.models.generate_content.call_args
+        call_args = mock_gemini_client.aio.models.generate_content.call_args
         prompt_text = call_args.kwargs["contents"][0]
 
         # Verify base_price is in prompt
@@ -468,7 +468,7 @@ class TestGenerateModelSuccess:
             "coefficient": 1.0,
             "expected_features": [],
         }
-        mock_gemini_client.models.generate_content.return_value.text = json.dumps(response_data)
+        mock_gemini_client.aio.models.generate_content.return_value.text = json.dumps(response_data)
 
         result = await PricingGenerationService.generate_model(
             "Generic", "t-shirt", "Basic", Decimal("10.0")
@@ -484,7 +484,7 @@ class TestGenerateModelSuccess:
             "coefficient": 0.5,  # Min
             "expected_features": ["f1", "f2", "f3", "f4", "f5", "f6", "f7", "f8", "f9", "f10"],  # Max 10
         }
-        mock_gemini_client.models.generate_content.return_value.text = json.dumps(response_data)
+        mock_gemini_client.aio.models.generate_content.return_value.text = json.dumps(response_data)
 
         result = await PricingGenerationService.generate_model(
             "Budget", "basics", "Entry", Decimal("5.0")
@@ -504,7 +504,7 @@ class TestGenerateModelValidation:
         """Test fallback when coefficient < 0.5."""
         response_data = VALID_MODEL_RESPONSE_DATA.copy()
         response_data["coefficient"] = 0.4  # Too low
-        mock_gemini_client.models.generate_content.return_value.text = json.dumps(response_data)
+        mock_gemini_client.aio.models.generate_content.return_value.text = json.dumps(response_data)
 
         result = await PricingGenerationService.generate_model(
             "Brand", "group", "model", Decimal("30.0")
@@ -519,7 +519,7 @@ class TestGenerateModelValidation:
         """Test fallback when coefficient > 3.0."""
         response_data = VALID_MODEL_RESPONSE_DATA.copy()
         response_data["coefficient"] = 3.1  # Too high
-        mock_gemini_client.models.generate_content.return_value.text = json.dumps(response_data)
+        mock_gemini_client.aio.models.generate_content.return_value.text = json.dumps(response_data)
 
         result = await PricingGenerationService.generate_model(
             "Brand", "group", "model", Decimal("30.0")
@@ -533,7 +533,7 @@ class TestGenerateModelValidation:
         """Test fallback when expected_features is not a list."""
         response_data = VALID_MODEL_RESPONSE_DATA.copy()
         response_data["expected_features"] = "not_a_list"  # String instead of list
-        mock_gemini_client.models.generate_content.return_value.text = json.dumps(response_data)
+        mock_gemini_client.aio.models.generate_content.return_value.text = json.dumps(response_data)
 
         result = await PricingGenerationService.generate_model(
             "Brand", "group", "model", Decimal("30.0")
@@ -547,7 +547,7 @@ class TestGenerateModelValidation:
         """Test fallback when features list contains empty strings."""
         response_data = VALID_MODEL_RESPONSE_DATA.copy()
         response_data["expected_features"] = ["valid", "", "another"]  # Empty string
-        mock_gemini_client.models.generate_content.return_value.text = json.dumps(response_data)
+        mock_gemini_client.aio.models.generate_content.return_value.text = json.dumps(response_data)
 
         result = await PricingGenerationService.generate_model(
             "Brand", "group", "model", Decimal("30.0")
@@ -561,7 +561,7 @@ class TestGenerateModelValidation:
         """Test fallback when expected_features has > 10 items."""
         response_data = VALID_MODEL_RESPONSE_DATA.copy()
         response_data["expected_features"] = [f"feature{i}" for i in range(11)]  # 11 items
-        mock_gemini_client.models.generate_content.return_value.text = json.dumps(response_data)
+        mock_gemini_client.aio.models.generate_content.return_value.text = json.dumps(response_data)
 
         result = await PricingGenerationService.generate_model(
             "Brand", "group", "model", Decimal("30.0")
@@ -577,7 +577,7 @@ class TestGenerateModelValidation:
             "coefficient": 1.0,
             # Missing expected_features
         }
-        mock_gemini_client.models.generate_content.return_value.text = json.dumps(response_data)
+        mock_gemini_client.aio.models.generate_content.return_value.text = json.dumps(response_data)
 
         result = await PricingGenerationService.generate_model(
             "Brand", "group", "model", Decimal("30.0")
@@ -596,7 +596,7 @@ class TestGenerateModelFallback:
     @pytest.mark.asyncio
     async def test_gemini_connection_error_model(self, mock_gemini_client):
         """Test fallback on connection errors for Model generation."""
-        mock_gemini_client.models.generate_content.side_effect = ConnectionError(
+        mock_gemini_client.aio.models.generate_content.side_effect = ConnectionError(
             "Failed to connect to Gemini API"
         )
 
@@ -611,7 +611,7 @@ class TestGenerateModelFallback:
     @pytest.mark.asyncio
     async def test_unexpected_exception_model(self, mock_gemini_client):
         """Test fallback on unexpected exception for Model."""
-        mock_gemini_client.models.generate_content.side_effect = RuntimeError(
+        mock_gemini_client.aio.models.generate_content.side_effect = RuntimeError(
             "Unexpected error"
         )
 
@@ -625,7 +625,7 @@ class TestGenerateModelFallback:
     @pytest.mark.asyncio
     async def test_invalid_json_response_model(self, mock_gemini_client):
         """Test fallback when LLM returns invalid JSON for Model."""
-        mock_gemini_client.models.generate_content.return_value.text = "not valid json {{"
+        mock_gemini_client.aio.models.generate_content.return_value.text = "not valid json {{"
 
         result = await PricingGenerationService.generate_model(
             "Brand", "group", "model", Decimal("30.0")
@@ -661,14 +661,14 @@ class TestGenerateModelPrompt:
     @pytest.mark.asyncio
     async def test_prompt_includes_brand_group_model(self, mock_gemini_client):
         """Test that prompt contains brand, group, and model names."""
-        mock_gemini_client.models.generate_content.return_value.text = VALID_MODEL_RESPONSE_JSON
+        mock_gemini_client.aio.models.generate_content.return_value.text = VALID_MODEL_RESPONSE_JSON
 
         await PricingGenerationService.generate_model(
             "Levi's", "jeans", "501", Decimal("25.0")
         )
 
         # Get the actual call arguments
-        call_args = mock_gemini_client.models.generate_content.call_args
+        call_args = mock_gemini_client.aio.models.generate_content.call_args
         prompt_text = call_args.kwargs["contents"][0]
 
         assert "Levi's" in prompt_text
@@ -678,13 +678,13 @@ class TestGenerateModelPrompt:
     @pytest.mark.asyncio
     async def test_prompt_includes_base_price(self, mock_gemini_client):
         """Test that prompt includes base_price for context."""
-        mock_gemini_client.models.generate_content.return_value.text = VALID_MODEL_RESPONSE_JSON
+        mock_gemini_client.aio.models.generate_content.return_value.text = VALID_MODEL_RESPONSE_JSON
 
         await PricingGenerationService.generate_model(
             "Nike", "sneakers", "Jordan", Decimal("75.50")
         )
 
-        call_args = mock_gemini_client.models.generate_content.call_args
+        call_args = mock_gemini_client.aio.models.generate_content.call_args
         prompt_text = call_args.kwargs["contents"][0]
 
         # Check base_price is mentioned
@@ -693,13 +693,13 @@ class TestGenerateModelPrompt:
     @pytest.mark.asyncio
     async def test_prompt_explains_coefficient_meaning(self, mock_gemini_client):
         """Test that prompt explains what coefficient means."""
-        mock_gemini_client.models.generate_content.return_value.text = VALID_MODEL_RESPONSE_JSON
+        mock_gemini_client.aio.models.generate_content.return_value.text = VALID_MODEL_RESPONSE_JSON
 
         await PricingGenerationService.generate_model(
             "Brand", "group", "model", Decimal("30.0")
         )
 
-        call_args = mock_gemini_client.models.generate_content.call_args
+        call_args = mock_gemini_client.aio.models.generate_content.call_args
         prompt_text = call_args.kwargs["contents"][0]
 
         # Check coefficient explanation keywords
@@ -709,13 +709,13 @@ class TestGenerateModelPrompt:
     @pytest.mark.asyncio
     async def test_prompt_specifies_expected_features(self, mock_gemini_client):
         """Test that prompt specifies expected_features field."""
-        mock_gemini_client.models.generate_content.return_value.text = VALID_MODEL_RESPONSE_JSON
+        mock_gemini_client.aio.models.generate_content.return_value.text = VALID_MODEL_RESPONSE_JSON
 
         await PricingGenerationService.generate_model(
             "Brand", "group", "model", Decimal("30.0")
         )
 
-        call_args = mock_gemini_client.models.generate_content.call_args
+        call_args = mock_gemini_client.aio.models.generate_content.call_args
         prompt_text = call_args.kwargs["contents"][0]
 
         assert "expected_features" in prompt_text
@@ -0,0 +1,64 @@
+"""
+Tests for AIVisionService.reserve_credits / release_credits (batch analysis).
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from services.ai.vision_service import AIVisionService
+from shared.exceptions import AIQuotaExceededError
+
+
+def _db_with_user(user):
+    db = MagicMock()
+    db.query.return_value.filter.return_value.with_for_update.return_value.first.return_value = user
+    return db
+
+
+def _user(used: int, remaining: int):
+    user = MagicMock()
+    user.ai_credits_used_this_month = used
+    user.get_remaining_ai_credits.return_value = remaining
+    return user
+
+
+class TestReserveCredits:
+    def test_reserves_whole_batch(self):
+        user = _user(used=5, remaining=20)
+        db = _db_with_user(user)
+
+        assert AIVisionService.reserve_credits(db, 1, 25, 10) == 10
+        assert user.ai_credits_used_this_month == 15
+        db.commit.assert_called_once()
+
+    def test_insufficient_credits_reserves_nothing(self):
+        user = _user(used=5, remaining=3)
+        db = _db_with_user(user)
+
+        with pytest.raises(AIQuotaExceededError):
+            AIVisionService.reserve_credits(db, 1, 8, 10)
+
+        assert user.ai_credits_used_this_month == 5
+        db.commit.assert_not_called()
+        db.rollback.assert_called_once()
+
+    def test_unknown_user(self):
+        with pytest.raises(AIQuotaExceededError):
+            AIVisionService.reserve_credits(_db_with_user(None), 1, 10, 1)
+
+
+class TestReleaseCredits:
+    def test_releases_with_floor_at_zero(self):
+        user = _user(used=2, remaining=0)
+        db = _db_with_user(user)
+
+        AIVisionService.release_credits(db, 1, 5)
+
+        assert user.ai_credits_used_this_month == 0
+        db.commit.assert_called_once()
+
+    def test_zero_is_noop(self):
+        db = MagicMock()
+        AIVisionService.release_credits(db, 1, 0)
+        db.query.assert_not_called()
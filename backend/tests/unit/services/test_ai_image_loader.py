@@ -0,0 +1,116 @@
+"""
+Unit tests for the AI image loader (concurrent download + downscale).
+
+Coverage:
+- download_images: concurrency, failed downloads skipped, order kept
+- downscale_image: resize, small/invalid images untouched
+- build_image_parts: thread pool downscale, disabled setting
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+import asyncio
+import time
+from io import BytesIO
+from unittest.mock import patch
+
+import httpx
+import pytest
+from PIL import Image
+
+from services.ai import image_loader
+from services.ai.image_loader import build_image_parts, download_images, downscale_image
+
+
+def _jpeg(width: int, height: int) -> bytes:
+    output = BytesIO()
+    Image.new("RGB", (width, height), (120, 60, 30)).save(output, format="JPEG")
+    return output.getvalue()
+
+
+def _size(content: bytes) -> tuple[int, int]:
+    return Image.open(BytesIO(content)).size
+
+
+class TestDownloadImages:
+    @pytest.mark.asyncio
+    async def test_downloads_concurrently_and_keeps_order(self):
+        async def handler(request: httpx.Request) -> httpx.Response:
+            await asyncio.sleep(0.1)
+            if request.url.path == "/missing.jpg":
+                return httpx.Response(404)
+            return httpx.Response(
+                200, content=request.url.path.encode(), headers={"content-type": "image/png"}
+            )
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        urls = [f"https://cdn.test/{i}.jpg" for i in range(5)]
+        urls.insert(2, "https://cdn.test/missing.jpg")
+
+        with patch.object(image_loader, "get_http_client", return_value=client):
+            start = time.perf_counter()
+            images = await download_images(urls + [""])
+            elapsed = time.perf_counter() - start
+
+        await client.aclose()
+
+        assert [content for content, _ in images] == [f"/{i}.jpg".encode() for i in range(5)]
+        assert all(mime == "image/png" for _, mime in images)
+        # 6 requests of 100ms each: sequential would take >= 600ms
+        assert elapsed < 0.4
+
+    @pytest.mark.asyncio
+    async def test_shared_client_per_loop(self):
+        first = image_loader.get_http_client()
+        second = image_loader.get_http_client()
+
+        assert first is second
+        await first.aclose()
+        assert image_loader.get_http_client() is not first
+
+
+class TestDownscaleImage:
+    def test_large_image_resized(self):
+        content, mime = downscale_image(_jpeg(4000, 3000), "image/jpeg", 1536)
+
+        assert _size(content) == (1536, 1152)
+        assert mime == "image/jpeg"
+
+    def test_small_image_untouched(self):
+        original = _jpeg(800, 600)
+
+        assert downscale_image(original, "image/jpeg", 1536) == (original, "image/jpeg")
+
+    def test_invalid_image_untouched(self):
+        assert downscale_image(b"not an image", "image/webp", 1536) == (b"not an image", "image/webp")
+
+    def test_png_converted_to_jpeg(self):
+        output = BytesIO()
+        Image.effect_noise((1500, 1000), 60).convert("RGBA").save(output, format="PNG")
+
+        content, mime = downscale_image(output.getvalue(), "image/png", 500)
+
+        assert mime == "image/jpeg"
+        assert _size(content) == (500, 333)
+
+
+class TestBuildImageParts:
+    @pytest.mark.asyncio
+    async def test_parts_downscaled(self):
+        with patch.object(image_loader.settings, "ai_image_downscale_enabled", True), \
+             patch.object(image_loader.settings, "ai_image_max_side", 1024):
+            parts = await build_image_parts([(_jpeg(3000, 2000), "image/jpeg"), (b"raw", "image/gif")])
+
+        assert _size(parts[0].inline_data.data) == (1024, 683)
+        assert parts[1].inline_data.data == b"raw"
+        assert parts[1].inline_data.mime_type == "image/gif"
+
+    @pytest.mark.asyncio
+    async def test_downscale_disabled(self):
+        original = _jpeg(3000, 2000)
+
+        with patch.object(image_loader.settings, "ai_image_downscale_enabled", False):
+            parts = await build_image_parts([(original, "image/jpeg")])
+
+        assert parts[0].inline_data.data == original
@@ -0,0 +1,187 @@
+"""
+Unit tests for the content-addressed AI result cache.
+
+Coverage:
+- compute_cache_key: content, order, model and vocabulary sensitivity
+- AIResultCache.get/put: hit, miss, TTL expiry, errors never raised
+- AIVisionService._analyze_with_cache: hit without model call nor credit,
+  miss stored, user opt-out
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from models.public.ai_analysis_cache import AIAnalysisCache
+from schemas.ai_schemas import VisionExtractedAttributes
+from services.ai.result_cache import AIResultCache, compute_cache_key
+from services.ai.vision_service import AIVisionService
+from shared.config import settings
+from shared.datetime_utils import utc_now
+
+RESULT = {"category": "Jeans", "brand": "Levi's", "confidence": 0.9}
+
+
+def _entry(age_seconds: float = 0) -> AIAnalysisCache:
+    return AIAnalysisCache(
+        cache_key="k" * 64,
+        model="gemini",
+        vocabulary_version="v1",
+        result=RESULT,
+        hit_count=0,
+        last_used_at=utc_now() - timedelta(seconds=age_seconds),
+    )
+
+
+class TestComputeCacheKey:
+    def test_same_content_same_key(self):
+        assert compute_cache_key([b"a", b"b"], "gemini", "v1") == compute_cache_key([b"a", b"b"], "gemini", "v1")
+
+    @pytest.mark.parametrize("images, model, version", [
+        ([b"b", b"a"], "gemini", "v1"),
+        ([b"a", b"c"], "gemini", "v1"),
+        ([b"a", b"b"], "gemini-pro", "v1"),
+        ([b"a", b"b"], "gemini", "v2"),
+        ([b"ab"], "gemini", "v1"),
+    ])
+    def test_any_change_changes_key(self, images, model, version):
+        assert compute_cache_key(images, model, version) != compute_cache_key([b"a", b"b"], "gemini", "v1")
+
+
+class TestAIResultCache:
+    def test_hit_refreshes_entry(self):
+        cache = AIResultCache()
+        entry = _entry(age_seconds=3600)
+        db = MagicMock()
+        db.get.return_value = entry
+
+        result = cache.get(db, entry.cache_key)
+
+        assert result == VisionExtractedAttributes(**RESULT)
+        assert entry.hit_count == 1
+        assert utc_now() - entry.last_used_at < timedelta(seconds=5)
+        db.commit.assert_called_once()
+        assert cache.stats() == {"hits": 1, "misses": 0, "hit_rate": 1.0}
+
+    def test_missing_entry_is_miss(self):
+        cache = AIResultCache()
+        db = MagicMock()
+        db.get.return_value = None
+
+        assert cache.get(db, "x" * 64) is None
+        assert cache.stats()["misses"] == 1
+
+    def test_expired_entry_is_miss(self):
+        cache = AIResultCache()
+        db = MagicMock()
+        db.get.return_value = _entry(age_seconds=10_000)
+
+        with patch("services.ai.result_cache.settings.ai_cache_ttl_seconds", 60):
+            assert cache.get(db, "k" * 64) is None
+
+    def test_lookup_error_is_miss(self):
+        cache = AIResultCache()
+        db = MagicMock()
+        db.get.side_effect = RuntimeError("relation does not exist")
+
+        assert cache.get(db, "k" * 64) is None
+        db.rollback.assert_called_once()
+
+    def test_put_upserts(self):
+        cache = AIResultCache()
+        db = MagicMock()
+
+        cache.put(db, "k" * 64, "gemini", "v1", VisionExtractedAttributes(**RESULT))
+
+        stmt = db.execute.call_args.args[0]
+        assert "ON CONFLICT (cache_key) DO UPDATE" in str(stmt.compile(dialect=postgresql.dialect()))
+        db.commit.assert_called_once()
+
+    def test_put_error_not_raised(self):
+        cache = AIResultCache()
+        db = MagicMock()
+        db.execute.side_effect = RuntimeError("boom")
+
+        cache.put(db, "k" * 64, "gemini", "v1", VisionExtractedAttributes(**RESULT))
+
+        db.rollback.assert_called_once()
+
+    def test_put_purges_periodically(self):
+        cache = AIResultCache()
+        db = MagicMock()
+
+        with patch("services.ai.result_cache.PURGE_EVERY_PUTS", 2), \
+             patch.object(AIResultCache, "purge") as mock_purge:
+            for _ in range(4):
+                cache.put(db, "k" * 64, "gemini", "v1", VisionExtractedAttributes(**RESULT))
+
+        assert mock_purge.call_count == 2
+
+
+class TestAnalyzeWithCache:
+    @pytest.fixture
+    def vocabulary(self):
+        with patch(
+            "services.ai.vision_service.get_attribute_vocabulary",
+            return_value=SimpleNamespace(version="v1"),
+        ):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_hit_skips_model_and_credit(self, vocabulary):
+        db = MagicMock()
+        user = SimpleNamespace(id=1, ai_result_cache_enabled=True)
+        cached = VisionExtractedAttributes(**RESULT)
+
+        with patch("services.ai.vision_service.ai_result_cache") as mock_cache, \
+             patch.object(AIVisionService, "_call_gemini_and_process", new=AsyncMock()) as mock_call, \
+             patch.object(AIVisionService, "_consume_credit") as mock_credit:
+            mock_cache.get.return_value = cached
+            result = await AIVisionService._analyze_with_cache(
+                db, [(b"img", "image/jpeg")], user, 42, 1, 0.0
+            )
+
+        assert result == (cached, 0, Decimal("0"), 1)
+        mock_call.assert_not_called()
+        mock_credit.assert_not_called()
+        log = db.add.call_args.args[0]
+        assert log.cached is True and log.total_tokens == 0 and log.product_id == 42
+
+    @pytest.mark.asyncio
+    async def test_miss_runs_pipeline_and_stores(self, vocabulary):
+        db = MagicMock()
+        user = SimpleNamespace(id=1, ai_result_cache_enabled=True)
+        fresh = VisionExtractedAttributes(**RESULT)
+        pipeline_result = (fresh, 300, Decimal("0.01"), 1)
+
+        with patch("services.ai.vision_service.ai_result_cache") as mock_cache, \
+             patch.object(AIVisionService, "_call_gemini_and_process", new=AsyncMock(return_value=pipeline_result)):
+            mock_cache.get.return_value = None
+            result = await AIVisionService._analyze_with_cache(
+                db, [(b"img", "image/jpeg")], user, 42, 1, 0.0
+            )
+
+        assert result == pipeline_result
+        key = compute_cache_key([b"img"], settings.gemini_model, "v1")
+        mock_cache.put.assert_called_once_with(db, key, settings.gemini_model, "v1", fresh)
+
+    @pytest.mark.asyncio
+    async def test_user_opt_out_bypasses_cache(self, vocabulary):
+        user = SimpleNamespace(id=1, ai_result_cache_enabled=False)
+        pipeline_result = (VisionExtractedAttributes(**RESULT), 300, Decimal("0.01"), 1)
+
+        with patch("services.ai.vision_service.ai_result_cache") as mock_cache, \
+             patch.object(AIVisionService, "_call_gemini_and_process", new=AsyncMock(return_value=pipeline_result)):
+            await AIVisionService._analyze_with_cache(
+                MagicMock(), [(b"img", "image/jpeg")], user, 42, 1, 0.0
+            )
+
+        mock_cache.get.assert_not_called()
+        mock_cache.put.assert_not_called()
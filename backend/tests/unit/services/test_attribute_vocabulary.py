@@ -0,0 +1,177 @@
+"""
+Unit tests for the cached AI attribute vocabulary.
+
+Coverage:
+- build: router schema, category -> parent map, per-group Expert prompts
+- cache: zero reference queries when warm, invalidation, TTL
+- version: deterministic content hash
+- AIVisionService pipeline uses the precomputed prompts (no query)
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from services.ai import attribute_vocabulary
+from services.ai.attribute_vocabulary import (
+    get_attribute_vocabulary,
+    invalidate_attribute_vocabulary,
+)
+from services.ai.vision_service import AIVisionService
+
+ATTRIBUTES = {
+    "categories": ["T-shirt", "Jeans"],
+    "colors": ["Blue", "Red"],
+    "conditions": ["Good"],
+    "materials": ["Cotton"],
+    "fits": ["Slim"],
+    "genders": ["Men"],
+    "seasons": ["Summer"],
+    "patterns": ["Solid"],
+    "lengths": ["Short"],
+    "necklines": ["Crew"],
+    "sports": [],
+    "closures": ["Zip"],
+    "rises": ["High"],
+    "sleeve_lengths": ["Short sleeves"],
+    "stretches": [],
+    "linings": [],
+    "decades": ["90s"],
+    "origins": [],
+    "trends": [],
+    "condition_sups": [],
+    "unique_features": [],
+}
+
+
+def _mock_db():
+    db = MagicMock()
+    db.query.return_value.filter.return_value.all.return_value = [
+        SimpleNamespace(name_en="T-shirt", parent_category="Tops"),
+        SimpleNamespace(name_en="Jeans", parent_category="Bottoms"),
+    ]
+    return db
+
+
+@pytest.fixture(autouse=True)
+def fresh_vocabulary():
+    invalidate_attribute_vocabulary()
+    with patch.object(
+        AIVisionService, "_fetch_product_attributes", return_value=ATTRIBUTES
+    ) as mock_fetch:
+        yield mock_fetch
+    invalidate_attribute_vocabulary()
+
+
+class TestBuild:
+    def test_router_schema_and_parent_map(self):
+        vocabulary = get_attribute_vocabulary(_mock_db())
+
+        assert vocabulary.router_schema["properties"]["category"]["enum"] == ["T-shirt", "Jeans"]
+        assert vocabulary.parent_group("Jeans") == "bottoms"
+        assert vocabulary.parent_group("Unknown") is None
+
+    def test_expert_prompts_match_filtered_attributes(self):
+        vocabulary = get_attribute_vocabulary(_mock_db())
+
+        for group in ("tops", "bottoms", None):
+            db_keys = AIVisionService._get_filtered_db_keys(group)
+            subset = {k: v for k, v in ATTRIBUTES.items() if k in db_keys}
+            expert = vocabulary.expert_prompt(group)
+
+            assert expert.prompt == AIVisionService._build_prompt(subset)
+            assert expert.response_schema == AIVisionService._build_response_schema(subset)
+
+    def test_unknown_group_uses_shared_prompt(self):
+        vocabulary = get_attribute_vocabulary(_mock_db())
+
+        assert vocabulary.expert_prompt("spaceships") is vocabulary.expert_prompt(None)
+
+    def test_full_prompt_has_all_attributes(self):
+        vocabulary = get_attribute_vocabulary(_mock_db())
+
+        assert vocabulary.full_prompt.prompt == AIVisionService._build_prompt(ATTRIBUTES)
+        assert "decades" in vocabulary.full_prompt.db_keys
+        assert "decades" not in vocabulary.expert_prompt("tops").db_keys
+
+
+class TestCache:
+    def test_warm_cache_runs_no_query(self, fresh_vocabulary):
+        first = get_attribute_vocabulary(_mock_db())
+
+        db = MagicMock()
+        second = get_attribute_vocabulary(db)
+
+        assert second is first
+        db.query.assert_not_called()
+        assert fresh_vocabulary.call_count == 1
+
+    def test_invalidate_rebuilds(self, fresh_vocabulary):
+        first = get_attribute_vocabulary(_mock_db())
+        invalidate_attribute_vocabulary()
+        second = get_attribute_vocabulary(_mock_db())
+
+        assert second is not first
+        assert fresh_vocabulary.call_count == 2
+
+    def test_ttl_expiry_rebuilds(self, fresh_vocabulary):
+        get_attribute_vocabulary(_mock_db())
+
+        with patch.object(attribute_vocabulary, "VOCABULARY_TTL_SECONDS", 0):
+            get_attribute_vocabulary(_mock_db())
+
+        assert fresh_vocabulary.call_count == 2
+
+
+class TestVersion:
+    def test_same_content_same_version(self):
+        first = get_attribute_vocabulary(_mock_db())
+        invalidate_attribute_vocabulary()
+        second = get_attribute_vocabulary(_mock_db())
+
+        assert first.version == second.version
+
+    def test_content_change_changes_version(self, fresh_vocabulary):
+        first = get_attribute_vocabulary(_mock_db())
+        invalidate_attribute_vocabulary()
+        fresh_vocabulary.return_value = {**ATTRIBUTES, "colors": ["Blue", "Red", "Teal"]}
+        second = get_attribute_vocabulary(_mock_db())
+
+        assert first.version != second.version
+
+
+class TestVisionPipeline:
+    @pytest.mark.asyncio
+    async def test_analysis_uses_precomputed_expert_prompt(self):
+        vocabulary = get_attribute_vocabulary(_mock_db())
+        db = MagicMock()
+
+        router_response = MagicMock(text='{"category": "Jeans", "confidence": 0.95}')
+        router_response.usage_metadata.prompt_token_count = 10
+        router_response.usage_metadata.candidates_token_count = 5
+        expert_response = MagicMock(text='{"category": "Jeans"}')
+        expert_response.usage_metadata.prompt_token_count = 100
+        expert_response.usage_metadata.candidates_token_count = 50
+
+        client = MagicMock()
+        client.aio.models.generate_content = AsyncMock(
+            side_effect=[router_response, expert_response]
+        )
+
+        with patch("services.ai.vision_service.get_gemini_client", return_value=client), \
+             patch.object(AIVisionService, "_process_brand", side_effect=lambda _db, data: data):
+            attributes, *_ = await AIVisionService._call_gemini_and_process(
+                db, ["img1", "img2"], user_id=1, product_id=None,
+                images_analyzed=2, start_time=0.0,
+            )
+
+        assert attributes.category == "Jeans"
+        expert_call = client.aio.models.generate_content.call_args_list[1]
+        assert expert_call.kwargs["contents"][-1] == vocabulary.expert_prompt("bottoms").prompt
+        # Only the credit consumption query (User), no reference data query
+        from models.public.user import User
+        assert [c.args[0] for c in db.query.call_args_list] == [User]
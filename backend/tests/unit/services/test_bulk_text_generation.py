@@ -0,0 +1,243 @@
+"""
+Unit tests for BulkTextGenerationService (services/bulk_text_generation.py).
+
+Coverage:
+- one SELECT with the M2M relations eager-loaded
+- texts identical to ProductTextGeneratorService.generate_all, format/style filter
+- NOT_FOUND results for missing IDs
+- limit only for filter selections, chunked processing (iter_chunks)
+- bulk UPDATE: unchanged skipped, conflicts reported, SOLD reported as errors, no commit
+- /products/text/generate-bulk schema validation
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+
+from models.user.product import ProductStatus
+from schemas.text_generator import TextBulkGenerateInput
+from services.bulk_text_generation import BulkTextGenerationService, BulkTextResult
+from services.product_text_generator import ProductTextGeneratorService
+
+ATTRIBUTES = [
+    "brand", "model", "category", "gender", "size_normalized", "size_original",
+    "material", "materials", "fit", "decade", "rise", "closure", "pattern", "trend",
+    "season", "origin", "stretch", "length", "neckline", "sleeve_length", "lining",
+    "sport", "marking", "location", "condition", "colors", "condition_sup",
+    "unique_feature", "dim1", "dim2", "dim3", "dim4", "dim5", "dim6",
+    "title", "description",
+]
+
+
+def make_product(product_id, **values):
+    return SimpleNamespace(
+        **{
+            **dict.fromkeys(ATTRIBUTES), "id": product_id, "version_number": 2,
+            "status": ProductStatus.DRAFT, **values,
+        }
+    )
+
+
+PRODUCTS = [
+    make_product(1, brand="Levi's", category="Jean", colors=["Bleu"], size_normalized="W32"),
+    make_product(2, brand="Nike", category="Sweat", title="Nike Sweat"),
+]
+
+
+class TestLoadProducts:
+    def test_single_query_with_m2m_eager_loaded(self):
+        db = MagicMock()
+        db.execute.return_value.scalars.return_value.all.return_value = PRODUCTS
+
+        products = BulkTextGenerationService.load_products(db, product_ids=[1, 2], brand="Nike")
+
+        assert products == PRODUCTS
+        db.execute.assert_called_once()
+        sql = str(db.execute.call_args.args[0])
+        assert "deleted_at IS NULL" in sql
+        assert "products.id IN" in sql
+        assert "ORDER BY tenant.products.id" in sql
+        options = db.execute.call_args.args[0]._with_options
+        assert {opt.path[1].key for opt in options} == {
+            "product_colors", "product_materials", "product_condition_sups",
+        }
+
+
+    def test_limit_ignored_with_product_ids(self):
+        """Every requested product is loaded, whatever the limit."""
+        db = MagicMock()
+
+        BulkTextGenerationService.load_products(db, product_ids=list(range(1, 1001)), limit=500)
+
+        assert "LIMIT" not in str(db.execute.call_args.args[0])
+
+    def test_filter_selection_limited_after_id(self):
+        db = MagicMock()
+
+        BulkTextGenerationService.load_products(db, brand="Nike", limit=50, after_id=10)
+
+        stmt = db.execute.call_args.args[0]
+        sql = str(stmt)
+        assert "tenant.products.id > :id_1" in sql
+        assert "LIMIT :param_1" in sql
+        assert stmt.compile().params["param_1"] == 50
+
+
+class TestIterChunks:
+    def test_product_ids_chunked_in_request_order(self, monkeypatch):
+        loaded = []
+
+        def load_products(db, product_ids=None, **filters):
+            loaded.append(product_ids)
+            return [make_product(i) for i in sorted(product_ids) if i != 4]
+
+        monkeypatch.setattr(BulkTextGenerationService, "load_products", staticmethod(load_products))
+        db = MagicMock()
+
+        chunks = list(BulkTextGenerationService.iter_chunks(
+            db, product_ids=[5, 4, 3, 2, 1, 5], title_format=1, chunk_size=2
+        ))
+
+        assert loaded == [[5, 4], [3, 2], [1]]
+        assert [[(r.product_id, r.error) for r in chunk] for chunk in chunks] == [
+            [(5, None), (4, "NOT_FOUND")], [(2, None), (3, None)], [(1, None)],
+        ]
+        db.commit.assert_not_called()
+
+    def test_filter_selection_keyset_until_limit(self, monkeypatch):
+        calls = []
+
+        def load_products(db, limit, after_id, **filters):
+            calls.append((after_id, limit))
+            start = (after_id or 0) + 1
+            return [make_product(i) for i in range(start, min(start + limit, 8))]
+
+        monkeypatch.setattr(BulkTextGenerationService, "load_products", staticmethod(load_products))
+
+        chunks = list(BulkTextGenerationService.iter_chunks(MagicMock(), limit=5, chunk_size=2))
+
+        assert calls == [(None, 2), (2, 2), (4, 1)]
+        assert [[r.product_id for r in chunk] for chunk in chunks] == [[1, 2], [3, 4], [5]]
+
+    def test_apply_commits_each_chunk_before_yielding(self, monkeypatch):
+        monkeypatch.setattr(
+            BulkTextGenerationService, "load_products",
+            staticmethod(lambda db, product_ids=None, **filters: [make_product(i) for i in product_ids]),
+        )
+        applied = []
+        monkeypatch.setattr(
+            BulkTextGenerationService, "apply_texts",
+            staticmethod(lambda db, results, *args: applied.append([r.product_id for r in results])),
+        )
+        db = MagicMock()
+
+        chunks = BulkTextGenerationService.iter_chunks(
+            db, product_ids=[1, 2, 3], title_format=1, apply=True, chunk_size=2
+        )
+        next(chunks)
+
+        assert applied == [[1, 2]]
+        db.commit.assert_called_once()
+        list(chunks)
+        assert applied == [[1, 2], [3]]
+        assert db.commit.call_count == 2
+
+
+class TestGenerate:
+    def test_matches_single_product_generation(self):
+        results = BulkTextGenerationService.generate(PRODUCTS)
+
+        for product, result in zip(PRODUCTS, results):
+            expected = ProductTextGeneratorService.generate_all(product)
+            assert (result.titles, result.descriptions) == (
+                expected["titles"], expected["descriptions"]
+            )
+            assert result.version_number == 2
+
+    def test_format_and_style_filter(self):
+        result = BulkTextGenerationService.generate(PRODUCTS[:1], title_format=1, description_style=3)[0]
+
+        assert list(result.titles) == ["minimaliste"]
+        assert list(result.descriptions) == ["fiche_technique"]
+
+    def test_missing_ids_reported(self):
+        results = BulkTextGenerationService.generate(PRODUCTS, product_ids=[2, 9, 1, 9])
+
+        assert [(r.product_id, r.error) for r in results] == [
+            (1, None), (2, None), (9, "NOT_FOUND"),
+        ]
+
+
+class TestApplyTexts:
+    def _result(self, product_id, title, current_title, status=ProductStatus.DRAFT):
+        return BulkTextResult(
+            product_id=product_id, version_number=3, status=status,
+            current_title=current_title, current_description="desc",
+            titles={"minimaliste": title}, descriptions={},
+        )
+
+    def test_updates_changed_texts_and_reports_conflicts(self):
+        db = MagicMock()
+        db.execute.return_value.scalars.return_value = [1]
+        results = [
+            self._result(1, "Levi's Jean", "Jean"),
+            self._result(2, "Nike Sweat", "Sweat"),  # Modified concurrently
+            self._result(3, "Adidas", "Adidas"),  # Unchanged
+            self._result(4, "", "Old title"),  # Nothing generated: kept
+            BulkTextResult(product_id=5, error="NOT_FOUND"),
+        ]
+
+        updated, conflicts = BulkTextGenerationService.apply_texts(db, results, title_format=1)
+
+        assert updated == {1}
+        assert conflicts == {2}
+        assert [(r.applied, r.conflict) for r in results[:2]] == [(True, False), (False, True)]
+        db.execute.assert_called_once()
+        db.commit.assert_not_called()
+
+    def test_sold_products_reported_as_errors(self):
+        db = MagicMock()
+        db.execute.return_value.scalars.return_value = [1]
+        results = [
+            self._result(1, "Levi's Jean", "Jean"),
+            self._result(2, "Nike Sweat", "Sweat", status=ProductStatus.SOLD),
+        ]
+
+        updated, conflicts = BulkTextGenerationService.apply_texts(db, results, title_format=1)
+
+        assert (updated, conflicts) == ({1}, set())
+        assert (results[1].error, results[1].applied, results[1].conflict) == ("SOLD", False, False)
+        stmt = db.execute.call_args.args[0]
+        params = stmt.compile().params
+        assert [params[k] for k in sorted(params) if k.startswith("param")] == [1, 3, "Levi's Jean", "desc"]
+        # Sold between load and apply: skipped by the UPDATE
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "tenant.products.status != %(status_1)s" in sql
+
+    def test_format_or_style_required(self):
+        with pytest.raises(ValueError):
+            BulkTextGenerationService.apply_texts(MagicMock(), [])
+
+
+class TestSchema:
+    def test_apply_requires_format_or_style(self):
+        with pytest.raises(ValidationError):
+            TextBulkGenerateInput(product_ids=[1], apply=True)
+
+        assert TextBulkGenerateInput(product_ids=[1], apply=True, description_style=2).apply
+
+    def test_apply_rejects_sold_status(self):
+        with pytest.raises(ValidationError):
+            TextBulkGenerateInput(status="sold", apply=True, title_format=1)
+
+        assert TextBulkGenerateInput(status="sold", title_format=1).status == "sold"
+
+    def test_status_filter_values(self):
+        with pytest.raises(ValidationError):
+            TextBulkGenerateInput(status="deleted")
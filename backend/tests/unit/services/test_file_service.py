@@ -16,6 +16,8 @@ Coverage:
 - _optimize_image: resize, compress, RGBA->RGB conversion
 - upload_image: validation and upload flow
 - download_and_upload_from_url: external URL import
+- Responsive variants: build (Pillow), upload keys, best-effort failure
+  (NULL + cleanup of partial uploads)
 
 Created: 2026-01-08
 Phase 1.1: Unit testing
@@ -25,7 +27,10 @@ import pytest
 from io import BytesIO
 from unittest.mock import Mock, MagicMock, patch, AsyncMock
 
-from services.file_service import FileService
+from PIL import Image
+
+from services.file_service import FileService, StoredImage
+from services.r2_service import R2Service
 
 
 # =============================================================================
@@ -681,6 +686,129 @@ class TestDownloadAndUploadFromUrl:
 # =============================================================================
 
 
+# =============================================================================
+# RESPONSIVE VARIANTS TESTS
+# =============================================================================
+
+
+def _jpeg(width: int, height: int) -> bytes:
+    output = BytesIO()
+    Image.new("RGB", (width, height), (120, 60, 30)).save(output, format="JPEG")
+    return output.getvalue()
+
+
+class TestImageVariants:
+    """Tests for thumbnail/medium variants generated at ingest."""
+
+    def test_build_variants_sizes_and_format(self):
+        """Should keep aspect ratio and encode each variant in the requested format."""
+        size, variants = FileService._build_variants(_jpeg(1600, 1200), "webp")
+
+        assert size == (1600, 1200)
+        assert [name for name, _ in variants] == ["medium", "thumbnail"]
+        dimensions = {name: Image.open(BytesIO(data)).size for name, data in variants}
+        assert dimensions == {"medium": (800, 600), "thumbnail": (320, 240)}
+        assert all(Image.open(BytesIO(data)).format == "WEBP" for _, data in variants)
+
+    def test_build_variants_skips_larger_than_image(self):
+        """Variants bigger than the image itself are not generated."""
+        size, variants = FileService._build_variants(_jpeg(600, 400), "jpeg")
+
+        assert size == (600, 400)
+        assert [name for name, _ in variants] == ["thumbnail"]
+
+    def test_variant_object_key(self):
+        """Variant keys sit next to the original object."""
+        r2 = R2Service.__new__(R2Service)
+
+        key = r2.variant_object_key(
+            "https://cdn.stoflow.io/1/products/5/abc123.jpeg", "thumbnail", "webp"
+        )
+
+        assert key == "1/products/5/abc123_thumbnail.webp"
+
+    @pytest.mark.asyncio
+    async def test_save_product_image_with_variants(
+        self, mock_r2_service, mock_upload_file
+    ):
+        """Should upload the image and its variants, and return their URLs + metadata."""
+        content = _jpeg(1200, 1600)
+        mock_upload_file.read.side_effect = [content[:512], content]
+        mock_r2_service.variant_object_key.side_effect = (
+            lambda url, name, ext: f"1/products/1/abc123_{name}.{ext}"
+        )
+        mock_r2_service.upload_object = AsyncMock(
+            side_effect=lambda key, data, content_type: f"https://cdn.stoflow.io/{key}"
+        )
+
+        with patch('services.file_service.settings.image_variant_format', "webp"):
+            stored = await FileService.save_product_image_with_variants(1, 1, mock_upload_file)
+
+        assert stored.url == "https://cdn.stoflow.io/1/products/1/abc123.jpeg"
+        assert stored.variants == {
+            "medium": "https://cdn.stoflow.io/1/products/1/abc123_medium.webp",
+            "thumbnail": "https://cdn.stoflow.io/1/products/1/abc123_thumbnail.webp",
+        }
+        assert (stored.width, stored.height) == (1200, 1600)
+        assert mock_r2_service.upload_object.call_args.args[2] == "image/webp"
+        assert stored.metadata()["variants"] == stored.variants
+
+    @pytest.mark.asyncio
+    async def test_variant_failure_keeps_image(self, mock_r2_service, mock_upload_file, jpeg_magic_bytes):
+        """Undecodable optimized bytes: image stored without variants (NULL)."""
+        mock_upload_file.read.side_effect = [jpeg_magic_bytes[:512], jpeg_magic_bytes]
+
+        with patch.object(FileService, '_optimize_image', return_value=(b'optimized', 'jpeg')):
+            stored = await FileService.save_product_image_with_variants(1, 1, mock_upload_file)
+
+        assert stored.url == "https://cdn.stoflow.io/1/products/1/abc123.jpeg"
+        assert stored.variants is None
+        assert stored.metadata()["variants"] is None
+
+    @pytest.mark.asyncio
+    async def test_variant_upload_failure_deletes_uploaded_siblings(self, mock_r2_service):
+        """One failed upload: the other variant is deleted and variants stay NULL."""
+        mock_r2_service.variant_object_key.side_effect = (
+            lambda url, name, ext: f"1/products/1/abc123_{name}.{ext}"
+        )
+
+        async def upload(key, data, content_type):
+            if "thumbnail" in key:
+                raise RuntimeError("R2 unavailable")
+            return f"https://cdn.stoflow.io/{key}"
+
+        mock_r2_service.upload_object = AsyncMock(side_effect=upload)
+        mock_r2_service.delete_image = AsyncMock(return_value=True)
+
+        size, variants = await FileService.store_variants(
+            "https://cdn.stoflow.io/1/products/1/abc123.jpeg", _jpeg(1600, 1200)
+        )
+
+        assert size == (1600, 1200)
+        assert variants is None
+        mock_r2_service.delete_image.assert_awaited_once_with(
+            "https://cdn.stoflow.io/1/products/1/abc123_medium.webp"
+        )
+
+    @pytest.mark.asyncio
+    async def test_small_image_needs_no_variant(self, mock_r2_service):
+        """Image smaller than every variant: {} (nothing to backfill)."""
+        size, variants = await FileService.store_variants(
+            "https://cdn.stoflow.io/1/products/1/abc123.jpeg", _jpeg(300, 200)
+        )
+
+        assert (size, variants) == ((300, 200), {})
+        mock_r2_service.upload_object.assert_not_called()
+
+    def test_stored_image_metadata(self):
+        stored = StoredImage(url="u", file_size=10, width=4, height=3, variants={})
+
+        assert stored.metadata() == {
+            "mime_type": "image/jpeg", "file_size": 10, "width": 4, "height": 3, "variants": {},
+        }
+        assert StoredImage(url="u", file_size=10, width=4, height=3).metadata()["variants"] is None
+
+
 class TestFileServiceConstants:
     """Tests for FileService constants and configuration."""
 
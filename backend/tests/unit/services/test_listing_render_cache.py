@@ -0,0 +1,171 @@
+"""
+Unit tests for the listing render cache.
+
+Coverage:
+- key: tenant, product version, marketplace, template/catalog version
+- bypass: non-ORM objects, transient or modified rows, no tenant, disabled
+- hits/misses, copies of mutable parts, LRU bound, TTL, stats
+- renderers: eBay title/description, Vinted title, text generator
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from services import listing_render_cache as module
+from services.listing_render_cache import RENDER_TEMPLATE_VERSION, ListingRenderCache
+
+
+def make_product(product_id=1, version=1, tenant="user_1", persistent=True, modified=False):
+    """Product stand-in with the ORM state read by key_for."""
+    session = MagicMock()
+    session.get_bind.return_value.get_execution_options.return_value = (
+        {"schema_translate_map": {"tenant": tenant}} if tenant else {}
+    )
+    product = SimpleNamespace(id=product_id, version_number=version)
+    product._state = SimpleNamespace(session=session, persistent=persistent, modified=modified)
+    return product
+
+
+@pytest.fixture(autouse=True)
+def orm_state():
+    """inspect() → the product's _state, catalog version 7."""
+    def fake_inspect(obj):
+        if not hasattr(obj, "_state"):
+            raise module.NoInspectionAvailable()
+        return obj._state
+
+    with patch.object(module, "inspect", side_effect=fake_inspect), patch.object(
+        module, "get_reference_catalog", return_value=Mock(version=7)
+    ):
+        yield
+
+
+@pytest.fixture
+def cache():
+    return ListingRenderCache()
+
+
+class TestKey:
+    def test_key_fields(self):
+        key = ListingRenderCache.key_for(make_product(42, 3), "EBAY_FR")
+
+        assert key == ("user_1", 42, 3, "EBAY_FR", f"{RENDER_TEMPLATE_VERSION}.7")
+
+    @pytest.mark.parametrize("product", [
+        Mock(id=1, version_number=1),
+        make_product(persistent=False),
+        make_product(modified=True),
+        make_product(tenant=None),
+    ])
+    def test_not_cacheable(self, product):
+        assert ListingRenderCache.key_for(product, "EBAY_FR") is None
+
+
+class TestGetOrRender:
+    def test_hit_after_miss(self, cache):
+        product = make_product()
+        render = Mock(return_value="Levi's 501")
+
+        assert cache.get_or_render(product, "EBAY_FR", "title", render) == "Levi's 501"
+        assert cache.get_or_render(product, "EBAY_FR", "title", render) == "Levi's 501"
+
+        render.assert_called_once()
+        assert cache.stats() == {"entries": 1, "hits": 1, "misses": 1, "hit_rate": 0.5}
+
+    def test_new_version_or_marketplace_misses(self, cache):
+        render = Mock(return_value="x")
+
+        cache.get_or_render(make_product(version=1), "EBAY_FR", "title", render)
+        cache.get_or_render(make_product(version=2), "EBAY_FR", "title", render)
+        cache.get_or_render(make_product(version=2), "EBAY_DE", "title", render)
+        cache.get_or_render(make_product(version=2), "EBAY_DE", "description", render)
+
+        assert render.call_count == 4
+        assert cache.stats()["entries"] == 3
+
+    def test_not_cacheable_always_renders(self, cache):
+        render = Mock(return_value="x")
+
+        for _ in range(2):
+            cache.get_or_render(Mock(), "vinted", "title", render)
+
+        assert render.call_count == 2
+        assert cache.stats()["entries"] == 0
+
+    def test_disabled(self, cache):
+        render = Mock(return_value="x")
+
+        with patch.object(module.settings, "listing_render_cache_enabled", False):
+            cache.get_or_render(make_product(), "vinted", "title", render)
+            cache.get_or_render(make_product(), "vinted", "title", render)
+
+        assert render.call_count == 2
+
+    def test_mutable_parts_are_copied(self, cache):
+        product = make_product()
+
+        first = cache.get_or_render(product, "stoflow", "texts", lambda: {"titles": {"a": "b"}})
+        first["titles"]["a"] = "edited"
+
+        assert cache.get_or_render(product, "stoflow", "texts", Mock())["titles"]["a"] == "b"
+
+    def test_lru_bound(self, cache):
+        with patch.object(module.settings, "listing_render_cache_max_entries", 2):
+            for product_id in (1, 2, 1, 3):
+                cache.get_or_render(make_product(product_id), "vinted", "title", lambda: "x")
+
+            render = Mock(return_value="x")
+            cache.get_or_render(make_product(1), "vinted", "title", render)
+            cache.get_or_render(make_product(2), "vinted", "title", render)
+
+        # 2 was the least recently used when 3 was stored
+        assert render.call_count == 1
+
+    def test_ttl_expiry(self, cache):
+        render = Mock(return_value="x")
+
+        cache.get_or_render(make_product(), "vinted", "title", render)
+        with patch.object(module.settings, "listing_render_cache_ttl_seconds", 0):
+            cache.get_or_render(make_product(), "vinted", "title", render)
+
+        assert render.call_count == 2
+
+
+class TestRenderers:
+    def test_vinted_title_rendered_once(self):
+        from services.vinted.vinted_title_service import VintedTitleService
+
+        product = make_product()
+        with patch.object(VintedTitleService, "_render_title", return_value="Jean Levi's") as render:
+            assert VintedTitleService.generate_title(product) == "Jean Levi's"
+            assert VintedTitleService.generate_title(product) == "Jean Levi's"
+
+        render.assert_called_once_with(product)
+
+    def test_ebay_description_keyed_by_shop(self):
+        from services.ebay.ebay_description_service import EbayDescriptionService
+
+        service = EbayDescriptionService.__new__(EbayDescriptionService)
+        product = make_product()
+        with patch.object(service, "_render_description", side_effect=lambda p, m, shop: shop) as render:
+            assert service.generate_description(product, "EBAY_FR", "Shop A") == "Shop A"
+            assert service.generate_description(product, "EBAY_FR", "Shop B") == "Shop B"
+            assert service.generate_description(product, "EBAY_FR", "Shop A") == "Shop A"
+
+        assert render.call_count == 2
+
+    def test_text_generator_rendered_once(self):
+        from services.product_text_generator import ProductTextGeneratorService
+
+        product = make_product()
+        texts = {"titles": {}, "descriptions": {}}
+        with patch.object(ProductTextGeneratorService, "_render_all", return_value=texts) as render:
+            ProductTextGeneratorService.generate_all(product)
+            ProductTextGeneratorService.generate_all(product)
+
+        render.assert_called_once()
@@ -0,0 +1,139 @@
+"""
+Unit tests for the streaming catalog export (services/product_export.py).
+
+Coverage:
+- query: one row per product, aggregates, marketplace outer joins, filters
+- records: fiche technique values, all materials, marketplace links
+- server-side cursor (yield_per), CSV/NDJSON chunking, gzip stream
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+import csv
+import gzip
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy.dialects import postgresql
+
+from models.user.product import ProductStatus
+from services import product_export
+from services.description_builders import FICHE_TECHNIQUE_COLUMNS, build_fiche_technique
+from services.product_export import EXPORT_COLUMNS, ProductExportService
+
+COLUMNS = [
+    "id", "status", "title", "description", "price", "stock_quantity", "brand", "model",
+    "category", "gender", "size_normalized", "size_original", "fit", "rise", "length",
+    "sleeve_length", "neckline", "closure", "pattern", "trend", "season", "sport",
+    "lining", "stretch", "unique_feature", "marking", "decade", "origin", "location",
+    "condition", "dim1", "dim2", "dim3", "dim4", "dim5", "dim6", "created_at",
+    "updated_at", "colors", "materials", "condition_sup", "images", "vinted_id",
+    "vinted_status", "vinted_url", "ebay_listing_id", "ebay_marketplace", "ebay_status",
+]
+
+
+def make_row(product_id=1, **values):
+    """Export row stand-in (attribute access, like a Row)."""
+    return SimpleNamespace(**{
+        **dict.fromkeys(COLUMNS),
+        "id": product_id, "status": ProductStatus.PUBLISHED, "title": "Jean Levi's 501",
+        "description": "Ligne 1\nLigne 2", "price": Decimal("35.00"), "stock_quantity": 1,
+        "brand": "Levi's", "category": "Jean", "condition": 8, "dim1": 42,
+        "colors": ["Bleu", "Noir"], "materials": ["Coton", "Élasthanne"],
+        "condition_sup": ["Légère décoloration"], "images": ["https://cdn/1.jpg", "https://cdn/2.jpg"],
+        "vinted_id": 123456, "vinted_url": "https://www.vinted.fr/items/123456",
+        "created_at": datetime(2026, 2, 1, 10, 30),
+        **values,
+    })
+
+
+class TestBuildQuery:
+    def test_one_row_per_product(self):
+        sql = str(ProductExportService.build_query(
+            status=ProductStatus.DRAFT, brand="Levi's",
+        ).compile(dialect=postgresql.dialect()))
+
+        assert "LEFT OUTER JOIN tenant.vinted_products" in sql
+        assert "LEFT OUTER JOIN tenant.ebay_products" in sql
+        # One-to-many children aggregated, not joined
+        assert "JOIN tenant.product_images" not in sql
+        assert 'array_agg(tenant.product_images.url ORDER BY tenant.product_images."order")' in sql
+        assert "deleted_at IS NULL" in sql
+        assert "tenant.products.status = " in sql
+        assert sql.rstrip().endswith("ORDER BY tenant.products.id")
+
+
+class TestRecord:
+    def test_fiche_technique_values(self):
+        row = make_row(materials=None)
+        record = ProductExportService.record(row)
+
+        assert list(record) == [key for key, _ in EXPORT_COLUMNS]
+        fiche = build_fiche_technique(row)
+        for key, label in FICHE_TECHNIQUE_COLUMNS:
+            if record[key]:
+                assert f"{label} : {record[key]}" in fiche
+        assert record["colors_list"] == "Bleu, Noir"
+        assert record["condition_text"] == "Excellent état"
+        assert record["status"] == "published"
+
+    def test_all_materials_and_links(self):
+        record = ProductExportService.record(make_row())
+
+        assert record["material"] == "Coton, Élasthanne"
+        assert record["images"] == ["https://cdn/1.jpg", "https://cdn/2.jpg"]
+        assert record["vinted_id"] == 123456
+        assert record["ebay_listing_id"] is None
+
+
+class TestStreaming:
+    def test_server_side_cursor(self):
+        db = MagicMock()
+        db.execute.return_value = iter([make_row(1), make_row(2)])
+        stmt = ProductExportService.build_query()
+
+        records = ProductExportService.iter_records(db, stmt, yield_per=50)
+        db.execute.assert_not_called()  # Lazy: runs when the response streams
+
+        assert [r["id"] for r in records] == [1, 2]
+        db.execute.assert_called_once_with(stmt, execution_options={"yield_per": 50})
+
+    def test_csv_chunks(self):
+        records = [ProductExportService.record(make_row(i)) for i in range(1, 6)]
+
+        with patch.object(product_export, "EXPORT_FLUSH_ROWS", 2):
+            chunks = list(ProductExportService.iter_csv(records))
+
+        assert len(chunks) == 3
+        rows = list(csv.reader(io.StringIO("".join(chunks))))
+        assert rows[0] == [header for _, header in EXPORT_COLUMNS]
+        assert [row[0] for row in rows[1:]] == ["1", "2", "3", "4", "5"]
+        values = dict(zip(rows[0], rows[1]))
+        assert values["Description"] == "Ligne 1\nLigne 2"
+        assert values["Images"] == "https://cdn/1.jpg | https://cdn/2.jpg"
+        assert values["Prix"] == "35.00"
+        assert values["Créé le"] == "2026-02-01T10:30:00"
+        assert values["eBay listing ID"] == ""
+
+    def test_ndjson_lines(self):
+        records = [ProductExportService.record(make_row(i)) for i in (1, 2)]
+
+        lines = "".join(ProductExportService.iter_ndjson(records)).splitlines()
+
+        first = json.loads(lines[0])
+        assert len(lines) == 2
+        assert first["price"] == "35.00"
+        assert first["images"] == ["https://cdn/1.jpg", "https://cdn/2.jpg"]
+        assert first["material"] == "Coton, Élasthanne"
+
+    def test_gzip_stream(self):
+        chunks = ["id,titre\n", "1,Jean Levi's\n", "2,Veste été\n"]
+
+        compressed = b"".join(ProductExportService.gzip_chunks(iter(chunks)))
+
+        assert gzip.decompress(compressed).decode("utf-8") == "".join(chunks)
@@ -0,0 +1,139 @@
+"""
+Unit tests for the product list projection (services/product_list_projection.py).
+
+Coverage:
+- list_items: filters, search, sort, empty result
+- install_triggers / rebuild: SQL issued
+- ProductListItemResponse.from_row: row -> grid item
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from models.user.product import ProductStatus
+from schemas.product_schemas import ProductGridResponse, ProductListItemResponse
+from services.product_list_projection import PROJECTION_SOURCES, ProductListProjection
+
+
+def compile_sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def make_row(**overrides):
+    now = datetime(2026, 2, 4, tzinfo=timezone.utc)
+    values = dict(
+        product_id=7, title="Jean 501", brand="Levi's", category="Jeans", price=Decimal("35.00"),
+        status=ProductStatus.PUBLISHED, stock_quantity=1, size_normalized="W32", condition=8,
+        image_url="https://cdn/7.jpg", thumbnail_url="https://cdn/7_thumb.jpg",
+        colors=["Blue", "Black"], materials=["Cotton"], vinted_id=123456789012,
+        vinted_status="published", ebay_id=None, ebay_status=None, created_at=now, updated_at=now,
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+class TestListItems:
+    def test_filters_and_order(self):
+        db = MagicMock()
+        db.execute.return_value.scalar_one.return_value = 42
+        db.execute.return_value.all.return_value = [make_row()]
+
+        rows, total = ProductListProjection.list_items(
+            db, skip=20, limit=20, status=ProductStatus.DRAFT, brand="Levi's", search="42"
+        )
+
+        count_sql, page_sql = [compile_sql(call.args[0]) for call in db.execute.call_args_list]
+        assert total == 42
+        assert len(rows) == 1
+        assert count_sql.startswith("SELECT count(*) AS count_1 \nFROM tenant.product_list_items")
+        assert "tenant.product_list_items.status = %(status_1)s" in page_sql
+        assert "tenant.product_list_items.brand = %(brand_1)s" in page_sql
+        assert "tenant.product_list_items.product_id = %(product_id_1)s" in page_sql
+        assert (
+            "ORDER BY tenant.product_list_items.created_at DESC, "
+            "tenant.product_list_items.product_id DESC" in page_sql
+        )
+        # Single table: no join, no relationship loading
+        assert "JOIN" not in page_sql
+
+    def test_empty_skips_page_query(self):
+        db = MagicMock()
+        db.execute.return_value.scalar_one.return_value = 0
+
+        assert ProductListProjection.list_items(db) == ([], 0)
+        assert db.execute.call_count == 1
+
+
+class TestMaintenance:
+    def test_install_triggers(self):
+        db = MagicMock()
+        db.execute.return_value.scalars.return_value = ["products", "product_images"]
+
+        ProductListProjection.install_triggers(db, "user_1")
+
+        sqls = [str(call.args[0]) for call in db.execute.call_args_list[1:]]
+        creates = [sql for sql in sqls if sql.startswith("CREATE TRIGGER")]
+        assert len(creates) == 6  # 2 existing tables x 3 events
+        assert (
+            'CREATE TRIGGER trg_product_list_items_upd AFTER UPDATE ON "user_1".products '
+            "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows FOR EACH STATEMENT "
+            "EXECUTE FUNCTION public.product_list_items_trigger('id')"
+        ) in creates
+        assert any("product_images" in sql and "('product_id')" in sql for sql in creates)
+
+    def test_rebuild_ids(self):
+        db = MagicMock()
+        with patch("services.product_list_projection.get_tenant_schema", return_value="user_1"):
+            ProductListProjection.rebuild(db, [3, 1])
+            ProductListProjection.rebuild(db, [])
+
+        assert db.execute.call_count == 1
+        assert db.execute.call_args.args[1] == {"schema": "user_1", "ids": [3, 1]}
+
+    def test_rebuild_requires_tenant(self):
+        with patch("services.product_list_projection.get_tenant_schema", return_value=None):
+            with pytest.raises(ValueError):
+                ProductListProjection.rebuild(MagicMock())
+
+    def test_sources_match_migration(self):
+        from importlib import import_module
+
+        migration = import_module("migrations.versions.20260204_1300_add_product_list_items_projection")
+
+        assert migration.SOURCE_TABLES == PROJECTION_SOURCES
+
+    def test_copied_text_columns_not_narrower_than_source(self):
+        """vinted_products.status is VARCHAR(50): copied text columns are TEXT."""
+        from importlib import import_module
+
+        migration = import_module("migrations.versions.20260204_1300_add_product_list_items_projection")
+
+        assert "VARCHAR" not in migration.CREATE_TABLE_SQL
+        for column in ("title", "brand", "category", "size_normalized", "vinted_status", "ebay_status"):
+            assert f"    {column} TEXT," in migration.CREATE_TABLE_SQL
+
+
+class TestGridResponse:
+    def test_from_row(self):
+        item = ProductListItemResponse.from_row(make_row())
+
+        assert item.id == 7
+        assert item.status == "published"
+        assert item.primary_color == "Blue"
+        assert item.vinted_id == 123456789012
+
+    def test_json_matches_validated_model(self):
+        row = make_row(colors=[], materials=[], image_url=None, thumbnail_url=None)
+        item = ProductListItemResponse.from_row(row)
+        grid = ProductGridResponse.model_construct(items=[item], total=1, page=1, page_size=20, total_pages=1)
+
+        assert item.primary_color is None
+        assert grid.model_dump_json() == ProductGridResponse.model_validate(grid.model_dump()).model_dump_json()
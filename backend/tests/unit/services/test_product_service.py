@@ -21,6 +21,7 @@ Phase 1.1: Unit testing
 
 import pytest
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock, patch, call
 
 from models.user.product import Product, ProductStatus
@@ -818,65 +819,193 @@ class TestCreateProductConditionSups:
         mock_db.add.assert_not_called()
 
 
+def _executed_sql(mock_db) -> list[str]:
+    """SQL of the statements executed on the mock session."""
+    return [str(c.args[0]) for c in mock_db.execute.call_args_list]
+
+
 class TestReplaceProductColors:
-    """Tests for ProductService._replace_product_colors."""
+    """Tests for ProductService._replace_product_colors (diff strategy)."""
+
+    def test_replace_product_colors_writes_only_delta(self, mock_db):
+        """Should delete removed colors, insert added ones, move the primary flag."""
+        mock_db.execute.return_value.all.return_value = [("Blue", True), ("Red", False)]
+
+        changed = ProductService._replace_product_colors(
+            mock_db, product_id=1, new_colors=["Red", "Green"]
+        )
 
-    def test_replace_product_colors_deletes_existing(self, mock_db):
-        """Should delete existing colors before creating new ones."""
-        # Mock query chain
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_query.filter.return_value = mock_filter
-        mock_db.query.return_value = mock_query
+        assert changed is True
+        sqls = _executed_sql(mock_db)
+        assert sqls[1].startswith("DELETE FROM tenant.product_colors")
+        assert mock_db.execute.call_args_list[2].args[1] == [
+            {"product_id": 1, "color": "Red", "is_primary": True},
+        ]
+        assert mock_db.execute.call_args_list[3].args[1] == [
+            {"product_id": 1, "color": "Green", "is_primary": False},
+        ]
+        mock_db.add.assert_not_called()
+
+    def test_replace_product_colors_unchanged(self, mock_db):
+        """Should not write anything when the colors are unchanged."""
+        mock_db.execute.return_value.all.return_value = [("Blue", True), ("Red", False)]
 
-        with patch.object(ProductService, '_create_product_colors') as mock_create:
-            ProductService._replace_product_colors(mock_db, product_id=1, new_colors=["Red"])
+        changed = ProductService._replace_product_colors(
+            mock_db, product_id=1, new_colors=["Blue", "Red"]
+        )
 
-            mock_filter.delete.assert_called_once()
-            mock_create.assert_called_once_with(mock_db, 1, ["Red"])
+        assert changed is False
+        mock_db.execute.assert_called_once()  # SELECT only
 
 
 class TestReplaceProductMaterials:
-    """Tests for ProductService._replace_product_materials."""
-
-    def test_replace_product_materials_deletes_existing(self, mock_db):
-        """Should delete existing materials before creating new ones."""
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_query.filter.return_value = mock_filter
-        mock_db.query.return_value = mock_query
-
-        with patch.object(ProductService, '_create_product_materials') as mock_create:
-            ProductService._replace_product_materials(
-                mock_db,
-                product_id=1,
-                new_materials=["Cotton"],
-                percentages={"Cotton": 100}
-            )
+    """Tests for ProductService._replace_product_materials (diff strategy)."""
+
+    def test_replace_product_materials_updates_percentages(self, mock_db):
+        """Should update changed percentages and insert new materials."""
+        mock_db.execute.return_value.all.return_value = [("Cotton", 100)]
 
-            mock_filter.delete.assert_called_once()
-            mock_create.assert_called_once()
+        changed = ProductService._replace_product_materials(
+            mock_db,
+            product_id=1,
+            new_materials=["Cotton", "Elastane"],
+            percentages={"Cotton": 98, "Elastane": 2}
+        )
+
+        assert changed is True
+        assert mock_db.execute.call_count == 3  # SELECT, UPDATE, INSERT (no DELETE)
+        assert mock_db.execute.call_args_list[1].args[1] == [
+            {"product_id": 1, "material": "Cotton", "percentage": 98},
+        ]
+        assert mock_db.execute.call_args_list[2].args[1] == [
+            {"product_id": 1, "material": "Elastane", "percentage": 2},
+        ]
 
 
 class TestReplaceProductConditionSups:
-    """Tests for ProductService._replace_product_condition_sups."""
-
-    def test_replace_product_condition_sups_deletes_existing(self, mock_db):
-        """Should delete existing condition_sups before creating new ones."""
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_query.filter.return_value = mock_filter
-        mock_db.query.return_value = mock_query
-
-        with patch.object(ProductService, '_create_product_condition_sups') as mock_create:
-            ProductService._replace_product_condition_sups(
-                mock_db,
-                product_id=1,
-                new_condition_sups=["Vintage wear"]
+    """Tests for ProductService._replace_product_condition_sups (diff strategy)."""
+
+    def test_replace_product_condition_sups_deletes_removed(self, mock_db):
+        """Should delete only the removed condition_sups."""
+        mock_db.execute.return_value.scalars.return_value = ["Vintage wear", "Small hole"]
+
+        changed = ProductService._replace_product_condition_sups(
+            mock_db,
+            product_id=1,
+            new_condition_sups=["Vintage wear"]
+        )
+
+        assert changed is True
+        assert mock_db.execute.call_count == 2  # SELECT, DELETE
+        assert _executed_sql(mock_db)[1].startswith("DELETE FROM tenant.product_condition_sups")
+
+
+class TestBulkUpdate:
+    """Tests for ProductService.bulk_update."""
+
+    def _product(self, product_id, status=ProductStatus.DRAFT, version=3, stock=1):
+        return Product(
+            id=product_id, title="Jean", description="Jean", price=20, category="Jeans",
+            condition=8, stock_quantity=stock, status=status, version_number=version,
+        )
+
+    @patch('services.product_service.AttributeValidator')
+    def test_bulk_update_single_statement(self, mock_validator, mock_db):
+        """Should update all eligible products in one UPDATE with version checks."""
+        products = [
+            self._product(1),
+            self._product(2),
+            self._product(3, status=ProductStatus.SOLD),
+        ]
+        select_result, update_result = MagicMock(), MagicMock()
+        select_result.scalars.return_value = products
+        update_result.scalars.return_value = [1]  # Product 2 modified concurrently
+        current_rows = [SimpleNamespace(id=2, status=ProductStatus.DRAFT, stock_quantity=1)]
+        mock_db.execute.side_effect = [select_result, update_result, current_rows]
+
+        updated, errors = ProductService.bulk_update(
+            mock_db, [1, 2, 3, 4], {"price": 25}, expected_versions={2: 2}
+        )
+
+        assert updated == {1}
+        assert set(errors) == {2, 3, 4}
+        assert "modified by another user" in errors[2]
+        assert "Cannot modify SOLD product" in errors[3]
+        assert "not found" in errors[4]
+        assert mock_db.execute.call_count == 3
+        stmt = mock_db.execute.call_args_list[1].args[0]
+        params = stmt.compile().params
+        assert [params[k] for k in sorted(params) if k.startswith("param")] == [1, 3, 2, 2]
+        assert "version_number = expected.version" in str(stmt)
+        mock_validator.validate_product_attributes.assert_called_once_with(
+            mock_db, {"price": 25}, partial=True
+        )
+
+    @patch('services.product_service.AttributeValidator')
+    def test_bulk_update_status_rules(self, mock_validator, mock_db):
+        """Should check transitions and stock before marking SOLD."""
+        products = [
+            self._product(1, status=ProductStatus.PUBLISHED),
+            self._product(2, status=ProductStatus.PUBLISHED, stock=0),
+            self._product(3, status=ProductStatus.DRAFT),
+        ]
+        select_result, update_result = MagicMock(), MagicMock()
+        select_result.scalars.return_value = products
+        update_result.scalars.return_value = [1]
+        mock_db.execute.side_effect = [select_result, update_result]
+
+        updated, errors = ProductService.bulk_update(
+            mock_db, [1, 2, 3], new_status=ProductStatus.SOLD
+        )
+
+        assert updated == {1}
+        assert "out of stock" in errors[2]
+        assert errors[3] == "Invalid transition: draft -> sold"
+        sql = str(mock_db.execute.call_args_list[1].args[0])
+        assert "stock_quantity > " in sql
+        assert "sold_at=now()" in sql
+
+    @patch('services.product_service.AttributeValidator')
+    def test_bulk_update_rows_rejected_by_update_conditions(self, mock_validator, mock_db):
+        """Sold meanwhile / out of stock: same errors as ProductStatusManager."""
+        products = [self._product(i, status=ProductStatus.PUBLISHED) for i in (1, 2, 3)]
+        select_result, update_result = MagicMock(), MagicMock()
+        select_result.scalars.return_value = products
+        update_result.scalars.return_value = []
+        current_rows = [
+            SimpleNamespace(id=1, status=ProductStatus.SOLD, stock_quantity=0),
+            SimpleNamespace(id=2, status=ProductStatus.PUBLISHED, stock_quantity=0),
+            SimpleNamespace(id=3, status=ProductStatus.PUBLISHED, stock_quantity=1),
+        ]
+        mock_db.execute.side_effect = [select_result, update_result, current_rows]
+
+        _, errors = ProductService.bulk_update(
+            mock_db, [1, 2, 3], {"price": 25}, new_status=ProductStatus.SOLD
+        )
+
+        assert "Cannot modify SOLD product" in errors[1]
+        assert errors[2] == "Cannot mark product as SOLD: already out of stock."
+        assert "modified by another user" in errors[3]
+
+    @patch('services.product_service.AttributeValidator')
+    def test_bulk_update_publication_checks_updated_values(self, mock_validator, mock_db):
+        """Publication requirements apply to the values after the update."""
+        product = self._product(1, stock=0)
+        product.title = ""
+        with patch.object(Product, "images", new=["https://cdn.test/1.jpeg"]):
+            ProductService._check_bulk_update(
+                product, {"title": "Levi's 501", "stock_quantity": 1}, ProductStatus.PUBLISHED
             )
+            with pytest.raises(ValueError, match="Price must be greater than 0"):
+                ProductService._check_bulk_update(product, {"price": 0}, ProductStatus.PUBLISHED)
+
+    def test_bulk_update_rejects_m2m_fields(self, mock_db):
+        """Should reject M2M fields (per-product diffs)."""
+        with pytest.raises(ValueError, match="not supported"):
+            ProductService.bulk_update(mock_db, [1], {"colors": ["Red"]})
 
-            mock_filter.delete.assert_called_once()
-            mock_create.assert_called_once_with(mock_db, 1, ["Vintage wear"])
+        with pytest.raises(ValueError, match="No field or status"):
+            ProductService.bulk_update(mock_db, [1])
 
 
 # =============================================================================
@@ -0,0 +1,252 @@
+"""
+Unit tests for the process-wide reference catalog.
+
+Coverage:
+- lookups: case-insensitive by key and by column, translations, search
+- cache: zero queries when warm, per-table invalidation, TTL, version
+- NOTIFY payloads mapped to catalog tables
+- consumers: ProductAttributeRepository, api/attributes, AttributeMappingService
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from services import reference_catalog
+from services.reference_catalog import (
+    REFERENCE_TABLES,
+    ReferenceCatalog,
+    ReferenceCatalogListener,
+    ReferenceTable,
+    get_reference_catalog,
+    invalidate_reference_catalog,
+)
+
+ROWS = {
+    "brands": [
+        {"name": "Levi's", "vinted_id": "53"},
+        {"name": "Nike", "vinted_id": "14"},
+    ],
+    "colors": [
+        {"name_en": "Blue", "name_fr": "Bleu", "name_de": None, "vinted_id": 9},
+    ],
+    "conditions": [
+        {"note": 8, "name_en": "Very good", "name_fr": "Très bon état", "ebay_condition": "USED_EXCELLENT"},
+        {"note": 0, "name_en": None, "ebay_condition": None},
+    ],
+    "sizes": [{"name_en": "M", "vinted_women_id": 4, "vinted_men_id": 208}],
+}
+
+
+@pytest.fixture
+def loader():
+    """Patch the table loader: serves ROWS and counts queries."""
+    rows = {name: list(ROWS.get(name, [])) for name in REFERENCE_TABLES}
+
+    def load(db, name):
+        key_field = ReferenceCatalog.from_rows({}).table(name).key_field
+        return ReferenceTable(name, key_field, rows[name])
+
+    with patch.object(reference_catalog, "load_reference_table", side_effect=load) as mock:
+        mock.rows = rows
+        yield mock
+
+
+class TestLookups:
+    catalog = ReferenceCatalog.from_rows(ROWS)
+
+    def test_get_by_key_case_insensitive(self):
+        assert self.catalog.get("brands", "Levi's")["vinted_id"] == "53"
+        assert self.catalog.get("brands", "  LEVI'S ").vinted_id == "53"
+        assert self.catalog.get("brands", "Adidas") is None
+        assert self.catalog.get("conditions", 8).name_en == "Very good"
+
+    def test_find_by_column(self):
+        assert self.catalog.find_by("brands", "vinted_id", 14).name == "Nike"
+        assert self.catalog.find_by("colors", "name_fr", "bleu").name_en == "Blue"
+        assert self.catalog.find_by("sizes", "vinted_men_id", 208).name_en == "M"
+        assert self.catalog.find_by("sizes", "vinted_men_id", 999) is None
+
+    def test_translate_with_fallbacks(self):
+        assert self.catalog.translate("colors", "blue", "fr") == "Bleu"
+        assert self.catalog.translate("colors", "Blue", "de") == "Blue"
+        assert self.catalog.translate("brands", "Nike", "fr") == "Nike"
+        # Condition.get_name() fallback
+        assert self.catalog.translate("conditions", 0, "fr") == "Condition 0"
+        assert self.catalog.translate("colors", "Purple", "fr") is None
+
+    def test_entries_are_read_only(self):
+        entry = self.catalog.get("colors", "Blue")
+        with pytest.raises(AttributeError):
+            entry.name_fr = "Rouge"
+        assert getattr(entry, "hex_code", None) is None
+
+    def test_search(self):
+        assert [e.name for e in self.catalog.table("brands").search("name", "nik", 10)] == ["Nike"]
+        assert len(self.catalog.table("brands").search("name", "", 1)) == 1
+
+    def test_memo_built_once_per_snapshot(self):
+        builder = MagicMock(return_value={"x": 1})
+        catalog = ReferenceCatalog.from_rows(ROWS)
+
+        assert catalog.memo("key", builder) is catalog.memo("key", builder)
+        builder.assert_called_once_with(catalog)
+
+
+class TestCache:
+    def test_warm_catalog_runs_no_query(self, loader):
+        first = get_reference_catalog(MagicMock())
+        assert loader.call_count == len(REFERENCE_TABLES)
+
+        second = get_reference_catalog(MagicMock())
+
+        assert second is first
+        assert loader.call_count == len(REFERENCE_TABLES)
+
+    def test_invalidation_reloads_only_named_tables(self, loader):
+        first = get_reference_catalog(MagicMock())
+        loader.reset_mock()
+
+        loader.rows["brands"].append({"name": "Adidas", "vinted_id": "2"})
+        invalidate_reference_catalog(["brands", "unknown_table"])
+        catalog = get_reference_catalog(MagicMock())
+
+        assert [c.args[1] for c in loader.call_args_list] == ["brands"]
+        assert catalog.version == first.version + 1
+        assert catalog.get("brands", "adidas") is not None
+        # Unchanged tables are shared with the previous snapshot
+        assert catalog.table("colors") is first.table("colors")
+
+    def test_reload_without_change_keeps_version(self, loader):
+        first = get_reference_catalog(MagicMock())
+
+        invalidate_reference_catalog()
+        catalog = get_reference_catalog(MagicMock())
+
+        assert catalog is first
+        assert loader.call_count == 2 * len(REFERENCE_TABLES)
+
+    def test_ttl_expiry_reloads_all_tables(self, loader):
+        get_reference_catalog(MagicMock())
+        loader.reset_mock()
+
+        with patch.object(reference_catalog.settings, "reference_catalog_ttl_seconds", 0):
+            get_reference_catalog(MagicMock())
+
+        assert loader.call_count == len(REFERENCE_TABLES)
+
+    def test_failed_reload_keeps_tables_stale(self, loader):
+        get_reference_catalog(MagicMock())
+        invalidate_reference_catalog(["colors"])
+        loader.side_effect = RuntimeError("connection lost")
+
+        with pytest.raises(RuntimeError):
+            get_reference_catalog(MagicMock())
+
+        assert "colors" in reference_catalog._stale
+
+    def test_notify_payload_maps_sql_table_names(self, loader):
+        get_reference_catalog(MagicMock())
+        loader.reset_mock()
+
+        ReferenceCatalogListener.handle_payloads(["sizes_normalized", "users"])
+        get_reference_catalog(MagicMock())
+
+        assert [c.args[1] for c in loader.call_args_list] == ["sizes"]
+
+    def test_notify_on_coefficient_table_invalidates_pricing(self, loader):
+        with patch.object(reference_catalog, "invalidate_pricing_coefficients") as invalidate:
+            ReferenceCatalogListener.handle_payloads(["sizes_normalized"])
+            invalidate.assert_not_called()
+
+            ReferenceCatalogListener.handle_payloads(["origins"])
+            invalidate.assert_called_once_with()
+
+    def test_admin_write_on_coefficient_table_invalidates_pricing(self):
+        from services import admin_attribute_service
+        from services.admin_attribute_service import AdminAttributeService
+
+        with patch.object(admin_attribute_service, "invalidate_pricing_coefficients") as invalidate:
+            AdminAttributeService._invalidate_caches("colors")
+            invalidate.assert_not_called()
+
+            AdminAttributeService._invalidate_caches("fits")
+            invalidate.assert_called_once_with()
+
+
+class TestConsumers:
+    @pytest.fixture(autouse=True)
+    def catalog(self):
+        with patch(
+            "services.reference_catalog.get_reference_catalog",
+            return_value=ReferenceCatalog.from_rows(ROWS),
+        ), patch(
+            "api.attributes.get_reference_catalog",
+            return_value=ReferenceCatalog.from_rows(ROWS),
+        ), patch(
+            "services.attribute_mapping_service.get_reference_catalog",
+            return_value=ReferenceCatalog.from_rows(ROWS),
+        ):
+            yield
+
+    def test_repository_unknown_name_runs_no_query(self):
+        from repositories.product_attribute_repository import ProductAttributeRepository
+
+        db = MagicMock()
+
+        assert ProductAttributeRepository.get_color_by_name(db, "Purple") is None
+        db.get.assert_not_called()
+        db.execute.assert_not_called()
+
+    def test_repository_loads_by_primary_key(self):
+        from models.public.color import Color
+        from models.public.condition import Condition
+        from repositories.product_attribute_repository import ProductAttributeRepository
+
+        db = MagicMock()
+
+        ProductAttributeRepository.get_color_by_name(db, "blue")
+        db.get.assert_called_with(Color, "Blue")
+
+        ProductAttributeRepository.get_condition_by_name(db, "Very good")
+        db.get.assert_called_with(Condition, 8)
+
+    def test_attribute_exists(self):
+        from repositories.product_attribute_repository import ProductAttributeRepository
+
+        db = MagicMock()
+
+        assert ProductAttributeRepository.attribute_exists(db, "brand", "nike") is True
+        assert ProductAttributeRepository.attribute_exists(db, "condition", "Very good") is True
+        assert ProductAttributeRepository.attribute_exists(db, "size", "XXL") is False
+        db.execute.assert_not_called()
+
+    def test_api_attributes_from_catalog(self):
+        from api.attributes import get_attributes
+
+        db = MagicMock()
+
+        conditions = get_attributes("conditions", lang="fr", search=None, limit=100, db=db)
+        brands = get_attributes("brands", lang="en", search="lev", limit=100, db=db)
+
+        assert conditions[1]["label"] == "Condition 0"
+        assert conditions[0] == {
+            "value": 8, "label": "Très bon état",
+            "coefficient": None, "vinted_id": None, "ebay_condition": "USED_EXCELLENT",
+        }
+        assert brands == [{"value": "Levi's", "label": "Levi's"}]
+        db.query.assert_not_called()
+
+    def test_attribute_mapping_fr_en(self):
+        from services.attribute_mapping_service import AttributeMappingService
+
+        mapper = AttributeMappingService(MagicMock())
+
+        assert mapper.to_db_value("color", "Bleu") == "Blue"
+        assert mapper.to_display_value("color", "Blue") == "Bleu"
+        assert mapper.to_display_value("brand", "Nike") == "Nike"
+        # Mappings shared between instances of the same snapshot
+        assert AttributeMappingService(MagicMock()).mappings is mapper.mappings
@@ -0,0 +1,174 @@
+"""
+Unit tests for the precompiled text templates.
+
+Coverage:
+- engine: value, constant and per-item lines, empty fields skipped, sections
+- ProductFields snapshot (safe_get semantics, lists, measures, lowercase)
+- description styles and titles rendered from the templates
+- generate_all_batch, eBay language lookup and page shell compiled once
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from services.description_builders import (
+    ProductFields,
+    build_descriptif_redige,
+    build_fiche_technique,
+    build_vendeur_pro,
+)
+from services.product_text_generator import ProductTextGeneratorService, TitleFormat
+from services.text_templates import compile_lines, compile_section, render_sections
+
+ATTRIBUTES = [
+    "brand", "model", "category", "gender", "size_normalized", "material",
+    "fit", "decade", "rise", "closure", "pattern", "trend", "season",
+    "origin", "stretch", "length", "neckline", "sleeve_length", "lining",
+    "sport", "marking", "location", "condition", "colors", "condition_sup",
+    "unique_feature", "size_original", "materials",
+    "dim1", "dim2", "dim3", "dim4", "dim5", "dim6",
+]
+
+
+def make_product(**values):
+    return SimpleNamespace(**{**dict.fromkeys(ATTRIBUTES), **values})
+
+
+class TestEngine:
+    def test_lines_skip_empty_fields(self):
+        template = compile_lines([("brand", "Marque : {}"), ("model", "Modèle : {}"), ("dim1", "PTP {}cm")])
+
+        assert template.render({"brand": "Levi's", "model": "", "dim1": "42"}) == [
+            "Marque : Levi's", "PTP 42cm",
+        ]
+        assert template.join({"brand": None, "model": "", "dim1": ""}, "\n") == ""
+
+    def test_constant_and_per_item_lines(self):
+        template = compile_lines([("decade", "Vintage"), ("decade", "{}"), ("sups[]", "→ {} !")])
+
+        assert template.render({"decade": "90s", "sups[]": ("Tache", "Trou")}) == [
+            "Vintage", "90s", "→ Tache !", "→ Trou !",
+        ]
+        assert template.render({"decade": "", "sups[]": ()}) == []
+
+    def test_labels_are_literal(self):
+        template = compile_lines([("name", "{}'s \"{}\" \\ {x}")])
+
+        assert template.render({"name": "{a}"}) == ["{a}'s \"{}\" \\ {x}"]
+
+    def test_sections(self):
+        sections = (
+            compile_section("INFOS", [("brand", "Marque : {}")]),
+            compile_section("VIDE", [("model", "Modèle : {}")]),
+            compile_section("MESURES", [("dim1", "PTP : {} cm")]),
+        )
+
+        assert render_sections(sections, {"brand": "Nike", "model": "", "dim1": "50"}) == (
+            "INFOS\nMarque : Nike\n\nMESURES\nPTP : 50 cm"
+        )
+
+
+class TestProductFields:
+    def test_snapshot_values(self):
+        fields = ProductFields(make_product(
+            brand="Levi's", colors=["Bleu", "Noir", "Blanc"], unique_feature=["Selvedge"],
+            condition_sup="Tache", condition=7, dim1=42, dim2=0, decade=1990,
+        ))
+
+        assert fields["brand"] == "Levi's"
+        assert fields["colors"] == "Bleu/Noir"
+        assert fields["colors_list"] == "Bleu, Noir, Blanc"
+        assert fields["unique_feature"] == "Selvedge"
+        # Not a list: no items
+        assert fields["condition_sup[]"] == ()
+        assert fields["condition_text"] == "Très bon état"
+        assert (fields["dim1"], fields["dim2"]) == ("42", "")
+        assert fields["decade"] == "1990"
+        assert fields["brand:lower"] == "levi's"
+        assert ProductFields.of(fields) is fields
+
+    def test_unknown_attribute_read_on_demand(self):
+        fields = ProductFields(make_product())
+        fields.product.size_original = "W32"
+
+        assert fields["size_original"] == "W32"
+
+
+class TestStyles:
+    product = make_product(
+        brand="Levi's", model="501", category="Jean", gender="Homme", size_normalized="W32",
+        colors=["Bleu"], material="Denim", fit="Slim", pattern="Uni", condition=8,
+        condition_sup=["Légère décoloration", "Ourlet refait"], decade="90s", origin="USA",
+        dim1=42, dim6=80,
+    )
+
+    def test_fiche_technique(self):
+        assert build_fiche_technique(self.product) == "\n".join([
+            "Marque : Levi's", "Modèle : 501", "Type : Jean", "Genre : Homme",
+            "Taille : W32", "Couleur(s) : Bleu", "Matière : Denim", "Coupe : Slim",
+            "Motif : Uni", "État : Excellent état",
+            "Détails état : Légère décoloration, Ourlet refait",
+            "Origine : USA", "Époque : 90s", "PTP (cm) : 42", "Entrejambe (cm) : 80",
+        ])
+
+    def test_vendeur_pro_condition_details_one_per_line(self):
+        text = build_vendeur_pro(self.product)
+
+        assert "🔎 ÉTAT DÉTAILLÉ\nÉtat général : Excellent état\n  → Légère décoloration\n  → Ourlet refait" in text
+        assert "📏 DIMENSIONS\nTaille étiquette : W32\nPoitrine (PTP) : 42 cm\nEntrejambe : 80 cm" in text
+
+    def test_descriptif_redige(self):
+        assert build_descriptif_redige(self.product) == "\n\n".join([
+            "Voici ce Jean de la marque Levi's, modèle 501, pour homme.",
+            "Cette pièce coupe slim, dans des tons bleu.",
+            "La matière principale est le denim.",
+            "Pièce des années 90s, origine USA.",
+            "État : Excellent état (Légère décoloration, Ourlet refait). Taille : W32.",
+            "Mesures : Poitrine : 42 cm | Entrejambe : 80 cm.",
+        ])
+
+    def test_titles(self):
+        service = ProductTextGeneratorService
+
+        assert service.generate_title(self.product, TitleFormat.VINTAGE_COLLECTIONNEUR) == (
+            "Vintage 90s Levi's Jean USA W32"
+        )
+        assert service.generate_title(self.product, TitleFormat.TECHNIQUE_PROFESSIONNEL) == (
+            "Levi's Jean 501 Denim Bleu W32 Excellent état PTP 42cm"
+        )
+        assert service.generate_title(self.product, 99) == ""
+
+    def test_generate_all_batch(self):
+        products = [self.product, make_product(brand="Nike")]
+
+        results = ProductTextGeneratorService.generate_all_batch(products)
+
+        assert results == [ProductTextGeneratorService.generate_all(p) for p in products]
+        assert results[1]["titles"]["minimaliste"] == "Nike"
+
+
+class TestEbayDescription:
+    def test_language_queried_once_per_marketplace(self):
+        from services.ebay import ebay_description_service
+        from services.ebay.ebay_description_service import EbayDescriptionService
+        from services.reference_catalog import ReferenceCatalog
+
+        db = MagicMock()
+        db.query.return_value.filter.return_value.first.return_value.get_language.return_value = "fr"
+        service = EbayDescriptionService(db)
+        product = make_product(brand="Levi's", category="Jeans", colors=["Blue"], materials=["denim"])
+
+        with patch.object(
+            ebay_description_service, "get_reference_catalog",
+            return_value=ReferenceCatalog.from_rows({}),
+        ):
+            first = service.generate_description(product, "EBAY_FR", "MY SHOP")
+            second = service.generate_description(product, "EBAY_FR", "MY SHOP")
+
+        assert first == second
+        assert db.query.call_count == 1
+        assert "<b>Marque:</b> Levi's</p>" in first
+        assert ">MY SHOP</h1>" in first
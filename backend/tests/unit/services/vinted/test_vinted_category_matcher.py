@@ -0,0 +1,233 @@
+"""
+Unit tests for the in-memory Vinted category matcher.
+
+Coverage:
+- parity with get_vinted_category() (literal port in reference_match) for
+  every mapping row, with partial, mismatching and gender-less queries
+- tie-breaks: priority, NULL priority, lowest id, is_default fallback
+- batch API (match_many, repository, VintedMappingService.map_categories)
+- cache: zero queries when warm, version kept when data is unchanged
+
+Author: Claude
+Date: 2026-02-04
+"""
+
+import itertools
+import random
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from services.vinted import vinted_category_matcher
+from services.vinted.vinted_category_matcher import (
+    ATTRIBUTE_WEIGHTS,
+    MappingRow,
+    VintedCategoryMatcher,
+    get_vinted_category_matcher,
+    invalidate_vinted_category_matcher,
+    reference_match,
+)
+
+ATTRIBUTES = [name for name, _ in ATTRIBUTE_WEIGHTS]
+
+ROWS = [
+    # jeans: gender-specific rows, fits, rises, a default per gender
+    MappingRow(1, 1193, "jeans", "men", is_default=True),
+    MappingRow(2, 1818, "jeans", "men", fit="slim"),
+    MappingRow(3, 1817, "jeans", "men", fit="skinny"),
+    MappingRow(4, 1820, "jeans", "men", fit="straight", rise="high"),
+    MappingRow(5, 10, "jeans", "women", is_default=True),
+    MappingRow(6, 1844, "jeans", "women", fit="skinny"),
+    MappingRow(7, 1845, "jeans", "women", fit="flare", length="long"),
+    MappingRow(8, 1846, "jeans", "women", rise="high", material="denim", priority=5),
+    MappingRow(9, 1847, "jeans", "women", rise="high", material="denim", priority=2),
+    # t-shirt: gender-less rows and equal-score ties
+    MappingRow(10, 77, "t-shirt", None, neckline="v-neck"),
+    MappingRow(11, 1203, "t-shirt", "men", is_default=True),
+    MappingRow(12, 221, "t-shirt", "women", is_default=True),
+    MappingRow(13, 1204, "t-shirt", "men", sleeve_length="long"),
+    MappingRow(14, 1205, "t-shirt", "men", pattern="striped"),
+    MappingRow(15, 1206, "t-shirt", "men", pattern="striped"),
+    # NULL priority sorts first (ORDER BY priority DESC)
+    MappingRow(16, 300, "jacket", "men", fit="regular", priority=9),
+    MappingRow(17, 301, "jacket", "men", fit="regular", priority=None),
+    MappingRow(18, 302, "jacket", None, is_default=True),
+    # Only attribute-specific rows: no candidate → default (none here)
+    MappingRow(19, 400, "skirt", "women", length="mini"),
+    MappingRow(20, 401, "skirt", "women", length="midi", is_default=True),
+]
+
+VALUES = {
+    "gender": [None, "men", "women", "unisex"],
+    "fit": [None, "slim", "skinny", "straight", "flare", "regular"],
+    "length": [None, "long", "mini", "midi"],
+    "rise": [None, "high", "low"],
+    "material": [None, "denim", "cotton"],
+    "pattern": [None, "striped"],
+    "neckline": [None, "v-neck"],
+    "sleeve_length": [None, "long"],
+}
+
+
+@pytest.fixture
+def matcher():
+    return VintedCategoryMatcher.from_rows(reversed(ROWS))
+
+
+def assert_parity(matcher, category, gender=None, **attributes):
+    expected = reference_match(ROWS, category, gender, **attributes)
+    result = matcher.match(category, gender, **attributes)
+
+    if expected:
+        # Ties left unordered by the SQL: the matcher picks the lowest id
+        assert result in expected, (category, gender, attributes)
+        assert result == expected[0]
+    else:
+        assert result is None
+
+
+class TestParity:
+    def test_every_mapping_row(self, matcher):
+        """Querying with the attributes of a row returns what the SQL returns."""
+        for row in ROWS:
+            attributes = {name: getattr(row, name) for name in ATTRIBUTES}
+
+            assert_parity(matcher, row.category, row.gender, **attributes)
+            assert_parity(matcher, row.category, None, **attributes)
+            assert_parity(matcher, row.category, row.gender)
+            # Each attribute alone, dropped, or contradicted
+            for name in ATTRIBUTES:
+                assert_parity(matcher, row.category, row.gender, **{name: getattr(row, name)})
+                assert_parity(matcher, row.category, row.gender, **{**attributes, name: None})
+                assert_parity(matcher, row.category, row.gender, **{**attributes, name: "other"})
+
+    def test_attribute_space_sweep(self, matcher):
+        rng = random.Random(42)
+        categories = sorted({row.category for row in ROWS}) + ["unknown"]
+
+        for _ in range(3000):
+            category = rng.choice(categories)
+            values = {name: rng.choice(choices) for name, choices in VALUES.items()}
+            assert_parity(matcher, category, **values)
+
+    def test_exact_ids(self, matcher):
+        assert matcher.match("jeans", "men") == 1193
+        assert matcher.match("jeans", "men", fit="slim") == 1818
+        assert matcher.match("jeans", "men", fit="bootcut") == 1193
+        assert matcher.match("jeans", "women", rise="high", material="denim") == 1846
+        assert matcher.match("jacket", "men", fit="regular") == 301
+        assert matcher.match("t-shirt", "men", pattern="striped") == 1205
+        assert matcher.match("t-shirt", "unisex", neckline="v-neck") == 77
+        assert matcher.match("skirt", "women", length="maxi") == 401
+        assert matcher.match("skirt", "men") is None
+        assert matcher.match("unknown", "men") is None
+        assert matcher.match(None, "men") is None
+
+    def test_index_keyed_by_category_and_gender(self, matcher):
+        assert {key for key in matcher._index if key[0] == "t-shirt"} == {
+            ("t-shirt", None), ("t-shirt", "men"), ("t-shirt", "women"),
+        }
+        candidates, default = matcher._index[("t-shirt", "women")]
+        assert [c.row_id for c in candidates] == [10, 12]
+        assert default == 221
+
+
+class TestBatch:
+    def test_match_many_equals_match(self, matcher):
+        queries = [
+            {"category": row.category, "gender": row.gender, "fit": row.fit}
+            for row in ROWS
+        ] * 3
+
+        results = matcher.match_many(queries)
+
+        assert results == [matcher.match(q["category"], q["gender"], fit=q["fit"]) for q in queries]
+
+    def test_repository_batch_normalizes_and_keeps_order(self, matcher):
+        from repositories.vinted_mapping_repository import VintedMappingRepository
+
+        categories = {1818: {"id": 1818, "title": "Jean slim", "path": "Hommes > Jeans > Slim", "gender": "men"}}
+        matcher = VintedCategoryMatcher.from_rows(ROWS, categories)
+
+        with patch.object(vinted_category_matcher, "get_vinted_category_matcher", return_value=matcher):
+            details = VintedMappingRepository(Mock()).get_vinted_categories_with_details([
+                {"category": "JEANS", "gender": "Men", "fit": "Slim"},
+                {"category": "jeans", "gender": "men", "fit": ""},
+                {"category": "boots", "gender": "women"},
+            ])
+
+        assert details == [
+            {"vinted_id": 1818, "title": "Jean slim", "path": "Hommes > Jeans > Slim", "gender": "men"},
+            {"vinted_id": 1193, "title": None, "path": None, "gender": "men"},
+            {"vinted_id": None, "title": None, "path": None, "gender": "women"},
+        ]
+
+    def test_map_categories(self, matcher):
+        from services.vinted.vinted_mapping_service import VintedMappingService
+
+        products = [
+            Mock(category="Jeans", gender="women", fit="Skinny", length=None, rise=None,
+                 material=["Cotton"], pattern=None, neckline=None, sleeve_length=None),
+            Mock(category="Jeans", gender=None, fit=None, length=None, rise=None,
+                 material=None, pattern=None, neckline=None, sleeve_length=None),
+        ]
+
+        with patch.object(vinted_category_matcher, "get_vinted_category_matcher", return_value=matcher):
+            result = VintedMappingService.map_categories(Mock(), products)
+
+        # gender None → "unisex", like map_all_attributes
+        assert result == [(1844, None, None), (None, None, None)]
+
+
+class TestCache:
+    @pytest.fixture
+    def db(self):
+        db = MagicMock()
+        mapping = [
+            Mock(id=row.id, vinted_id=row.vinted_id, my_category=row.category, my_gender=row.gender,
+                 **{f"my_{name}": getattr(row, name) for name in ATTRIBUTES},
+                 is_default=row.is_default, priority=row.priority)
+            for row in ROWS
+        ]
+        db.execute.side_effect = lambda query: mapping if "vinted.mapping\n" in str(query) else []
+        return db
+
+    def test_warm_matcher_runs_no_query(self, db):
+        first = get_vinted_category_matcher(db)
+        assert db.execute.call_count == 2
+
+        assert get_vinted_category_matcher(db) is first
+        assert db.execute.call_count == 2
+        assert first.match("jeans", "men", fit="slim") == 1818
+
+    def test_reload_without_change_keeps_version(self, db):
+        first = get_vinted_category_matcher(db)
+
+        invalidate_vinted_category_matcher()
+        second = get_vinted_category_matcher(db)
+
+        assert second is first
+        assert db.execute.call_count == 4
+
+    def test_changed_rows_bump_version(self, db):
+        first = get_vinted_category_matcher(db)
+
+        invalidate_vinted_category_matcher()
+        with patch.object(
+            vinted_category_matcher, "load_vinted_mapping", return_value=(tuple(ROWS[:3]), {})
+        ):
+            second = get_vinted_category_matcher(db)
+
+        assert second.version == first.version + 1
+        assert second.match("jeans", "women") is None
+
+
+@pytest.mark.parametrize("gender,fit", itertools.product(["men", "women", None], [None, "skinny"]))
+def test_rows_order_does_not_matter(gender, fit):
+    shuffled = list(ROWS)
+    random.Random(7).shuffle(shuffled)
+
+    assert (
+        VintedCategoryMatcher.from_rows(shuffled).match("jeans", gender, fit=fit)
+        == VintedCategoryMatcher.from_rows(ROWS).match("jeans", gender, fit=fit)
+    )
@@ -0,0 +1,150 @@
+"""
+Unit Tests for VintedImageDownloader
+
+Concurrent download/upload of a product's Vinted photos (bounded
+parallelism, original order kept, retries, cleanup of unattached uploads).
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from services.file_service import StoredImage
+from services.vinted.vinted_image_downloader import VintedImageDownloader
+
+
+def _photos(count: int) -> str:
+    return json.dumps([{"full_size_url": f"https://vinted.test/{i}.webp"} for i in range(count)])
+
+
+@pytest.fixture
+def add_image():
+    with patch("services.vinted.vinted_image_downloader.ProductService.add_image") as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def no_retry_delay():
+    with patch("services.vinted.vinted_image_downloader.RETRY_BASE_DELAY_SECONDS", 0):
+        yield
+
+
+class TestDownloadAndAttachImages:
+    @pytest.mark.asyncio
+    async def test_photos_processed_concurrently_with_bound(self, add_image):
+        running = 0
+        max_running = 0
+
+        async def upload(user_id, product_id, image_url, timeout, client):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return StoredImage(url=image_url.replace("vinted.test", "cdn.test"), file_size=100)
+
+        with patch("services.vinted.vinted_image_downloader.settings.vinted_image_download_concurrency", 2), \
+                patch("services.vinted.vinted_image_downloader.FileService.download_and_store_from_url",
+                      side_effect=upload):
+            result = await VintedImageDownloader.download_and_attach_images(
+                db=None, user_id=1, product_id=10, photos_data=_photos(5)
+            )
+
+        assert result == {"images_copied": 5, "images_failed": 0, "total_images": 5}
+        assert 1 < max_running <= 2
+        urls = [c.kwargs["image_url"] for c in add_image.call_args_list]
+        assert urls == [f"https://cdn.test/{i}.webp" for i in range(5)]
+        assert [c.kwargs["display_order"] for c in add_image.call_args_list] == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_variants_and_metadata_recorded(self, add_image):
+        stored = StoredImage(
+            url="https://cdn.test/a.jpeg", file_size=2048, width=1200, height=1600,
+            variants={"thumbnail": "https://cdn.test/a_thumbnail.webp"},
+        )
+
+        with patch("services.vinted.vinted_image_downloader.FileService.download_and_store_from_url",
+                   new=AsyncMock(return_value=stored)):
+            await VintedImageDownloader.download_and_attach_images(
+                db=None, user_id=1, product_id=10, photos_data=_photos(1)
+            )
+
+        kwargs = add_image.call_args.kwargs
+        assert kwargs["variants"] == {"thumbnail": "https://cdn.test/a_thumbnail.webp"}
+        assert (kwargs["width"], kwargs["height"], kwargs["file_size"]) == (1200, 1600, 2048)
+
+    @pytest.mark.asyncio
+    async def test_failed_photo_keeps_order_of_others(self, add_image):
+        async def upload(user_id, product_id, image_url, timeout, client):
+            if image_url.endswith("/1.webp"):
+                raise RuntimeError("HTTP error 404")
+            return StoredImage(url=image_url, file_size=100)
+
+        with patch("services.vinted.vinted_image_downloader.FileService.download_and_store_from_url",
+                   side_effect=upload) as mock_upload:
+            result = await VintedImageDownloader.download_and_attach_images(
+                db=None, user_id=1, product_id=10, photos_data=_photos(3)
+            )
+
+        assert result == {"images_copied": 2, "images_failed": 1, "total_images": 3}
+        # 1 call for photos 0 and 2, 3 attempts for photo 1
+        assert mock_upload.await_count == 5
+        assert [c.kwargs["display_order"] for c in add_image.call_args_list] == [0, 1]
+        assert add_image.call_args_list[1].kwargs["image_url"].endswith("/2.webp")
+
+    @pytest.mark.asyncio
+    async def test_photo_without_url_is_failed(self, add_image):
+        photos = json.dumps([{"id": 1}, {"url": "https://vinted.test/ok.jpg"}])
+
+        with patch("services.vinted.vinted_image_downloader.FileService.download_and_store_from_url",
+                   new=AsyncMock(return_value=StoredImage(url="https://cdn.test/ok.jpg", file_size=100))):
+            result = await VintedImageDownloader.download_and_attach_images(
+                db=None, user_id=1, product_id=10, photos_data=photos
+            )
+
+        assert result == {"images_copied": 1, "images_failed": 1, "total_images": 2}
+
+    @pytest.mark.asyncio
+    async def test_uploads_over_image_limit_are_deleted(self, add_image):
+        add_image.side_effect = [None, ValueError("Product already has 20 images (max 20)"),
+                                 ValueError("Product already has 20 images (max 20)")]
+        stored = [
+            StoredImage(url=f"https://cdn.test/{i}.jpeg", file_size=100,
+                        variants={"thumbnail": f"https://cdn.test/{i}_thumbnail.webp"})
+            for i in range(3)
+        ]
+
+        with patch("services.vinted.vinted_image_downloader.FileService.download_and_store_from_url",
+                   new=AsyncMock(side_effect=stored)), \
+                patch("services.vinted.vinted_image_downloader.FileService.delete_product_image",
+                      new=AsyncMock(return_value=True)) as delete:
+            result = await VintedImageDownloader.download_and_attach_images(
+                db=None, user_id=1, product_id=10, photos_data=_photos(3)
+            )
+
+        assert result == {"images_copied": 1, "images_failed": 2, "total_images": 3}
+        assert [c.args for c in delete.await_args_list] == [
+            ("https://cdn.test/1.jpeg", ["https://cdn.test/1_thumbnail.webp"]),
+            ("https://cdn.test/2.jpeg", ["https://cdn.test/2_thumbnail.webp"]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_attach_error_deletes_all_uploads(self, add_image):
+        add_image.side_effect = [None, RuntimeError("connection lost")]
+
+        with patch("services.vinted.vinted_image_downloader.FileService.download_and_store_from_url",
+                   side_effect=lambda user_id, product_id, image_url, timeout, client:
+                   StoredImage(url=image_url, file_size=100)), \
+                patch("services.vinted.vinted_image_downloader.FileService.delete_product_image",
+                      new=AsyncMock(return_value=True)) as delete:
+            with pytest.raises(RuntimeError):
+                await VintedImageDownloader.download_and_attach_images(
+                    db=None, user_id=1, product_id=10, photos_data=_photos(3)
+                )
+
+        # The caller rolls back: the attached photo is dropped too
+        assert sorted(c.args[0] for c in delete.await_args_list) == [
+            f"https://vinted.test/{i}.webp" for i in range(3)
+        ]
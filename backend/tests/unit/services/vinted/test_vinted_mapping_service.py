@@ -18,40 +18,75 @@ Date: 2025-12-18
 import pytest
 from unittest.mock import Mock, MagicMock, patch
 
+from services.reference_catalog import ReferenceCatalog
 from services.vinted.vinted_mapping_service import VintedMappingService
 
 
+def _catalog(**tables):
+    """Patch le catalogue de référence avec les lignes données."""
+    return patch(
+        "services.vinted.vinted_mapping_service.get_reference_catalog",
+        return_value=ReferenceCatalog.from_rows(tables),
+    )
+
+
+BRANDS = [
+    {"name": "Levi's", "vinted_id": "53"},
+    {"name": "No Vinted", "vinted_id": None},
+]
+COLORS = [{"name_en": "Blue", "vinted_id": 12}]
+CONDITIONS = [{"note": 8, "name_en": "Very good", "vinted_id": 2}]
+MATERIALS = [
+    {"name_en": "Cotton", "vinted_id": 44},
+    {"name_en": "Polyester", "vinted_id": 45},
+    {"name_en": "Wool", "vinted_id": 46},
+    {"name_en": "Silk", "vinted_id": 47},
+    {"name_en": "Linen", "vinted_id": 48},
+    {"name_en": "Denim", "vinted_id": 303},
+    {"name_en": "Hemp", "vinted_id": None},
+]
+SIZES = [
+    {"name_en": "M", "vinted_women_id": 206, "vinted_men_id": None},
+    {"name_en": "L", "vinted_women_id": None, "vinted_men_id": 210},
+    {"name_en": "32", "vinted_women_id": None, "vinted_men_id": 207},
+]
+
+
 class TestMapBrand:
     """Tests pour map_brand."""
 
     def test_map_brand_found(self):
         """Test mapping marque existante."""
         mock_db = Mock()
-        mock_brand = Mock()
-        mock_brand.vinted_id = 53
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_brand
 
-        result = VintedMappingService.map_brand(mock_db, "Levi's")
+        with _catalog(brands=BRANDS):
+            result = VintedMappingService.map_brand(mock_db, "Levi's")
+
+        assert result == 53
+        mock_db.query.assert_not_called()
+
+    def test_map_brand_case_insensitive(self):
+        """Test recherche insensible à la casse."""
+        with _catalog(brands=BRANDS):
+            result = VintedMappingService.map_brand(Mock(), "levi's")
 
         assert result == 53
 
     def test_map_brand_not_found(self):
         """Test mapping marque inexistante."""
         mock_db = Mock()
-        mock_db.query.return_value.filter.return_value.first.return_value = None
 
-        result = VintedMappingService.map_brand(mock_db, "UnknownBrand")
+        with _catalog(brands=BRANDS):
+            result = VintedMappingService.map_brand(mock_db, "UnknownBrand")
 
         assert result is None
 
     def test_map_brand_no_vinted_id(self):
         """Test marque sans vinted_id."""
         mock_db = Mock()
-        mock_brand = Mock()
-        mock_brand.vinted_id = None
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_brand
 
-        result = VintedMappingService.map_brand(mock_db, "Levi's")
+        with _catalog(brands=BRANDS):
+            result = VintedMappingService.map_brand(mock_db, "No Vinted")
 
         assert result is None
 
@@ -72,6 +107,12 @@ class TestMapBrand:
 
         assert result is None
 
+    def test_reverse_map_brand(self):
+        """Test reverse lookup par vinted_id (stocké en texte)."""
+        with _catalog(brands=BRANDS):
+            assert VintedMappingService.reverse_map_brand(Mock(), 53) == "Levi's"
+            assert VintedMappingService.reverse_map_brand(Mock(), 99) is None
+
 
 class TestMapColor:
     """Tests pour map_color."""
@@ -79,20 +120,18 @@ class TestMapColor:
     def test_map_color_found(self):
         """Test mapping couleur existante."""
         mock_db = Mock()
-        mock_color = Mock()
-        mock_color.vinted_id = 12
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_color
 
-        result = VintedMappingService.map_color(mock_db, "Blue")
+        with _catalog(colors=COLORS):
+            result = VintedMappingService.map_color(mock_db, "Blue")
 
         assert result == 12
 
     def test_map_color_not_found(self):
         """Test mapping couleur inexistante."""
         mock_db = Mock()
-        mock_db.query.return_value.filter.return_value.first.return_value = None
 
-        result = VintedMappingService.map_color(mock_db, "Rainbow")
+        with _catalog(colors=COLORS):
+            result = VintedMappingService.map_color(mock_db, "Rainbow")
 
         assert result is None
 
@@ -111,20 +150,18 @@ class TestMapCondition:
     def test_map_condition_found(self):
         """Test mapping condition existante."""
         mock_db = Mock()
-        mock_condition = Mock()
-        mock_condition.vinted_id = 2
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_condition
 
-        result = VintedMappingService.map_condition(mock_db, "EXCELLENT")
+        with _catalog(conditions=CONDITIONS):
+            result = VintedMappingService.map_condition(mock_db, 8)
 
         assert result == 2
 
     def test_map_condition_not_found(self):
         """Test mapping condition inexistante."""
         mock_db = Mock()
-        mock_db.query.return_value.filter.return_value.first.return_value = None
 
-        result = VintedMappingService.map_condition(mock_db, "UNKNOWN")
+        with _catalog(conditions=CONDITIONS):
+            result = VintedMappingService.map_condition(mock_db, 3)
 
         assert result is None
 
@@ -136,6 +173,11 @@ class TestMapCondition:
 
         assert result is None
 
+    def test_reverse_map_condition(self):
+        """Test reverse lookup vinted_id → note."""
+        with _catalog(conditions=CONDITIONS):
+            assert VintedMappingService.reverse_map_condition(Mock(), 2) == 8
+
 
 class TestMapMaterial:
     """Tests pour map_material (NEW)."""
@@ -143,42 +185,36 @@ class TestMapMaterial:
     def test_map_material_found(self):
         """Test mapping matériau existant."""
         mock_db = Mock()
-        mock_material = Mock()
-        mock_material.vinted_id = 44
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_material
 
-        result = VintedMappingService.map_material(mock_db, "Cotton")
+        with _catalog(materials=MATERIALS):
+            result = VintedMappingService.map_material(mock_db, "Cotton")
 
         assert result == 44
 
     def test_map_material_denim(self):
         """Test mapping Denim → 303."""
         mock_db = Mock()
-        mock_material = Mock()
-        mock_material.vinted_id = 303
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_material
 
-        result = VintedMappingService.map_material(mock_db, "Denim")
+        with _catalog(materials=MATERIALS):
+            result = VintedMappingService.map_material(mock_db, "Denim")
 
         assert result == 303
 
     def test_map_material_not_found(self):
         """Test mapping matériau inexistant."""
         mock_db = Mock()
-        mock_db.query.return_value.filter.return_value.first.return_value = None
 
-        result = VintedMappingService.map_material(mock_db, "Unobtainium")
+        with _catalog(materials=MATERIALS):
+            result = VintedMappingService.map_material(mock_db, "Unobtainium")
 
         assert result is None
 
     def test_map_material_no_vinted_id(self):
         """Test matériau sans vinted_id."""
         mock_db = Mock()
-        mock_material = Mock()
-        mock_material.vinted_id = None
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_material
 
-        result = VintedMappingService.map_material(mock_db, "Hemp")
+        with _catalog(materials=MATERIALS):
+            result = VintedMappingService.map_material(mock_db, "Hemp")
 
         assert result is None
 
@@ -190,6 +226,12 @@ class TestMapMaterial:
 
         assert result is None
 
+    def test_reverse_map_material_case_insensitive(self):
+        """Test validation du nom, insensible à la casse."""
+        with _catalog(materials=MATERIALS):
+            assert VintedMappingService.reverse_map_material(Mock(), "cotton") == "Cotton"
+            assert VintedMappingService.reverse_map_material(Mock(), "Kevlar") is None
+
 
 class TestMapMaterials:
     """Tests pour map_materials (liste de matériaux)."""
@@ -197,11 +239,9 @@ class TestMapMaterials:
     def test_map_materials_single(self):
         """Test mapping d'un seul matériau."""
         mock_db = Mock()
-        mock_material = Mock()
-        mock_material.vinted_id = 44
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_material
 
-        result = VintedMappingService.map_materials(mock_db, ["Cotton"])
+        with _catalog(materials=MATERIALS):
+            result = VintedMappingService.map_materials(mock_db, ["Cotton"])
 
         assert result == [44]
 
@@ -209,27 +249,8 @@ class TestMapMaterials:
         """Test mapping de plusieurs matériaux."""
         mock_db = Mock()
 
-        # Setup mock to return different vinted_ids
-        def mock_filter_side_effect(*args, **kwargs):
-            mock_result = Mock()
-            # Simulate different materials
-            filter_call = mock_db.query.return_value.filter.call_args
-            if filter_call:
-                # Return different mock based on call count
-                call_count = mock_db.query.return_value.filter.call_count
-                if call_count == 1:
-                    mock_mat = Mock()
-                    mock_mat.vinted_id = 44  # Cotton
-                    mock_result.first.return_value = mock_mat
-                elif call_count == 2:
-                    mock_mat = Mock()
-                    mock_mat.vinted_id = 45  # Polyester
-                    mock_result.first.return_value = mock_mat
-            return mock_result
-
-        mock_db.query.return_value.filter.side_effect = mock_filter_side_effect
-
-        result = VintedMappingService.map_materials(mock_db, ["Cotton", "Polyester"])
+        with _catalog(materials=MATERIALS):
+            result = VintedMappingService.map_materials(mock_db, ["Cotton", "Polyester"])
 
         assert len(result) == 2
         assert 44 in result
@@ -238,17 +259,15 @@ class TestMapMaterials:
     def test_map_materials_max_three(self):
         """Test limite de 3 matériaux (règle Vinted)."""
         mock_db = Mock()
-        mock_material = Mock()
-        mock_material.vinted_id = 44
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_material
 
         # Pass 5 materials, should only process 3
-        result = VintedMappingService.map_materials(
-            mock_db, ["Cotton", "Polyester", "Wool", "Silk", "Linen"]
-        )
+        with _catalog(materials=MATERIALS):
+            result = VintedMappingService.map_materials(
+                mock_db, ["Cotton", "Polyester", "Wool", "Silk", "Linen"]
+            )
 
-        # Only 3 calls should have been made
-        assert mock_db.query.call_count == 3
+        assert result == [44, 45, 46]
+        mock_db.query.assert_not_called()
 
     def test_map_materials_empty_list(self):
         """Test avec liste vide."""
@@ -269,11 +288,9 @@ class TestMapMaterials:
     def test_map_materials_deduplication(self):
         """Test déduplication des IDs."""
         mock_db = Mock()
-        mock_material = Mock()
-        mock_material.vinted_id = 44  # Same ID for all
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_material
 
-        result = VintedMappingService.map_materials(mock_db, ["Cotton", "Cotton", "Cotton"])
+        with _catalog(materials=MATERIALS):
+            result = VintedMappingService.map_materials(mock_db, ["Cotton", "Cotton", "Cotton"])
 
         # Should only have one 44, not three
         assert result == [44]
@@ -285,36 +302,27 @@ class TestMapSize:
     def test_map_size_woman(self):
         """Test mapping taille femme."""
         mock_db = Mock()
-        mock_size = Mock()
-        mock_size.vinted_women_id = 206
-        mock_size.vinted_men_id = None
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_size
 
-        result = VintedMappingService.map_size(mock_db, "M", "female", "T-shirt")
+        with _catalog(sizes=SIZES):
+            result = VintedMappingService.map_size(mock_db, "M", "female", "T-shirt")
 
         assert result == 206
 
     def test_map_size_man_top(self):
         """Test mapping taille homme haut."""
         mock_db = Mock()
-        mock_size = Mock()
-        mock_size.vinted_women_id = None
-        mock_size.vinted_men_id = 210
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_size
 
-        result = VintedMappingService.map_size(mock_db, "L", "male", "Sweater")
+        with _catalog(sizes=SIZES):
+            result = VintedMappingService.map_size(mock_db, "L", "male", "Sweater")
 
         assert result == 210
 
     def test_map_size_man_bottom(self):
         """Test mapping taille homme bas."""
         mock_db = Mock()
-        mock_size = Mock()
-        mock_size.vinted_women_id = None
-        mock_size.vinted_men_id = 207
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_size
 
-        result = VintedMappingService.map_size(mock_db, "32", "male", "Jeans")
+        with _catalog(sizes=SIZES):
+            result = VintedMappingService.map_size(mock_db, "32", "male", "Jeans")
 
         assert result == 207
 
@@ -326,6 +334,12 @@ class TestMapSize:
 
         assert result is None
 
+    def test_reverse_map_size_women_then_men(self):
+        """Test reverse lookup: colonne femmes puis hommes."""
+        with _catalog(sizes=SIZES):
+            assert VintedMappingService.reverse_map_size(Mock(), 206) == "M"
+            assert VintedMappingService.reverse_map_size(Mock(), 207) == "32"
+
 
 class TestIsBottomCategory:
     """Tests pour _is_bottom_category."""
@@ -511,3 +525,57 @@ class TestMapAllAttributes:
         result = VintedMappingService.map_all_attributes(mock_db, mock_product)
 
         assert result['material_ids'] == [44, 45]
+
+
+class TestMapAllAttributesBatch:
+    """Tests pour map_all_attributes_batch."""
+
+    def _product(self, **fields):
+        product = Mock(
+            brand="Levi's", color="Blue", condition=8, size="32", category="Jeans",
+            gender="men", fit=None, length=None, rise=None, material=["Denim"],
+            pattern=None, neckline=None, sleeve_length=None,
+        )
+        for name, value in fields.items():
+            setattr(product, name, value)
+        return product
+
+    def test_batch_equals_single_product_mapping(self):
+        """Chaque résultat du batch est identique à map_all_attributes."""
+        from services.vinted import vinted_category_matcher
+        from services.vinted.vinted_category_matcher import MappingRow, VintedCategoryMatcher
+
+        matcher = VintedCategoryMatcher.from_rows(
+            [
+                MappingRow(1, 1193, "jeans", "men", is_default=True),
+                MappingRow(2, 1818, "jeans", "men", fit="slim"),
+                MappingRow(3, 1844, "jeans", "women", fit="skinny"),
+            ],
+            {1818: {"id": 1818, "title": "Jean slim", "path": "Hommes > Jeans > Slim", "gender": "men"}},
+        )
+        products = [
+            self._product(),
+            self._product(fit="Slim"),
+            self._product(gender="women", fit="Skinny", size="M", material=None),
+            self._product(brand="Unknown", color=None, condition=None, category="Boots"),
+        ]
+        mock_db = Mock()
+
+        with _catalog(
+            brands=BRANDS, colors=COLORS, conditions=CONDITIONS, materials=MATERIALS, sizes=SIZES
+        ), patch.object(vinted_category_matcher, "get_vinted_category_matcher", return_value=matcher):
+            batch = VintedMappingService.map_all_attributes_batch(mock_db, products)
+            single = [VintedMappingService.map_all_attributes(mock_db, p) for p in products]
+
+        assert batch == single
+        assert [r['category_id'] for r in batch] == [1193, 1818, 1844, None]
+        assert batch[1]['category_name'] == "Jean slim"
+        assert batch[0]['brand_id'] == 53
+        assert batch[0]['material_ids'] == [303]
+        assert batch[2]['size_id'] == 206
+        assert batch[3]['brand_id'] is None
+        mock_db.execute.assert_not_called()
+
+    def test_batch_empty(self):
+        """Test liste vide: aucun chargement."""
+        assert VintedMappingService.map_all_attributes_batch(Mock(), []) == []
@@ -0,0 +1,110 @@
+"""
+Tests for the process-wide Gemini client and call limiter (shared/gemini_client.py).
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from shared import gemini_client
+from shared.exceptions import AIGenerationError, AIServiceBusyError
+from shared.gemini_client import GeminiCallLimiter, generate_content, get_gemini_client
+
+
+class TestGetGeminiClient:
+    """Tests for get_gemini_client."""
+
+    def test_single_client_per_process(self):
+        with patch.object(gemini_client, "_client", None), \
+             patch("shared.gemini_client.genai.Client") as MockClient:
+            first = get_gemini_client()
+            second = get_gemini_client()
+
+        assert first is second
+        MockClient.assert_called_once()
+
+
+class TestGeminiCallLimiter:
+    """Tests for GeminiCallLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrency(self):
+        limiter = GeminiCallLimiter(max_concurrent=2, max_queued=10, queue_timeout=5)
+        state = {"running": 0, "max": 0}
+
+        async def call():
+            state["running"] += 1
+            state["max"] = max(state["max"], state["running"])
+            await asyncio.sleep(0.01)
+            state["running"] -= 1
+            return "ok"
+
+        results = await asyncio.gather(*(limiter.run(call, timeout=5) for _ in range(6)))
+
+        assert results == ["ok"] * 6
+        assert state["max"] == 2
+        assert limiter.stats() == {"running": 0, "waiting": 0}
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self):
+        limiter = GeminiCallLimiter(max_concurrent=1, max_queued=1, queue_timeout=5)
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+
+        running = asyncio.create_task(limiter.run(slow, timeout=5))
+        queued = asyncio.create_task(limiter.run(slow, timeout=5))
+        while limiter.stats() != {"running": 1, "waiting": 1}:
+            await asyncio.sleep(0)
+
+        with pytest.raises(AIServiceBusyError):
+            await limiter.run(slow, timeout=5)
+
+        release.set()
+        await asyncio.gather(running, queued)
+
+    @pytest.mark.asyncio
+    async def test_queue_timeout(self):
+        limiter = GeminiCallLimiter(max_concurrent=1, max_queued=5, queue_timeout=0.01)
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+
+        running = asyncio.create_task(limiter.run(slow, timeout=5))
+        while limiter.stats()["running"] != 1:
+            await asyncio.sleep(0)
+
+        with pytest.raises(AIServiceBusyError):
+            await limiter.run(slow, timeout=5)
+
+        release.set()
+        await running
+
+    @pytest.mark.asyncio
+    async def test_call_timeout_releases_slot(self):
+        limiter = GeminiCallLimiter(max_concurrent=1, max_queued=5, queue_timeout=1)
+
+        with pytest.raises(AIGenerationError):
+            await limiter.run(lambda: asyncio.sleep(1), timeout=0.01)
+
+        assert await limiter.run(AsyncMock(return_value="ok"), timeout=1) == "ok"
+
+
+class TestGenerateContent:
+    """Tests for generate_content."""
+
+    @pytest.mark.asyncio
+    async def test_uses_async_api(self):
+        client = MagicMock()
+        client.aio.models.generate_content = AsyncMock(return_value="response")
+
+        result = await generate_content(model="m", contents=["prompt"], client=client)
+
+        assert result == "response"
+        client.aio.models.generate_content.assert_awaited_once_with(
+            model="m", contents=["prompt"], config=None
+        )
+        client.models.generate_content.assert_not_called()
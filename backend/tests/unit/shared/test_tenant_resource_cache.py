@@ -0,0 +1,62 @@
+"""
+Tests for the process-wide tenant resource cache (shared/tenant_resource_cache.py).
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from shared.tenant_resource_cache import TenantResourceCache
+
+
+class TestTenantResourceCache:
+    """Tests for TenantResourceCache."""
+
+    def test_loads_once_then_hits(self):
+        cache = TenantResourceCache()
+        loader = MagicMock(return_value="creds")
+
+        assert cache.get_or_load(1, "ebay", "credentials", loader) == "creds"
+        assert cache.get_or_load(1, "ebay", "credentials", loader) == "creds"
+
+        loader.assert_called_once()
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_keys_are_per_tenant(self):
+        cache = TenantResourceCache()
+
+        cache.get_or_load(1, "ebay", "credentials", lambda: "a")
+        value = cache.get_or_load(2, "ebay", "credentials", lambda: "b")
+
+        assert value == "b"
+
+    def test_ttl_expiry_reloads(self):
+        cache = TenantResourceCache(ttl_seconds=10)
+        loader = MagicMock(side_effect=["v1", "v2"])
+
+        with patch("shared.tenant_resource_cache.time.monotonic", side_effect=[0, 0, 20, 20]):
+            assert cache.get_or_load(1, "ebay", "credentials", loader) == "v1"
+            assert cache.get_or_load(1, "ebay", "credentials", loader) == "v2"
+
+    def test_invalidate_marketplace_only(self):
+        cache = TenantResourceCache()
+        cache.get_or_load(1, "ebay", "credentials", lambda: "ebay")
+        cache.get_or_load(1, "etsy", "credentials", lambda: "etsy")
+        cache.get_or_load(None, "ebay", "aspect_reverse_map", lambda: {})
+
+        cache.invalidate(1, "ebay")
+
+        assert cache.get_or_load(1, "ebay", "credentials", lambda: "new") == "new"
+        assert cache.get_or_load(1, "etsy", "credentials", lambda: "new") == "etsy"
+        assert cache.get_or_load(None, "ebay", "aspect_reverse_map", lambda: "new") == {}
+
+    def test_loader_error_not_cached(self):
+        cache = TenantResourceCache()
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_load(1, "ebay", "credentials", MagicMock(side_effect=RuntimeError("db down")))
+
+        assert cache.get_or_load(1, "ebay", "credentials", lambda: "ok") == "ok"
@@ -0,0 +1,94 @@
+"""
+Tests for cached eBay activity resources (temporal/activities/activity_resources.py).
+
+Per-activity setup overhead is measured as the number of DB queries needed
+to build an EbayImporter: 5 without cache, 0 with a warm cache.
+"""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from models.public.ebay_aspect_mapping import AspectMapping
+from models.public.ebay_marketplace_config import MarketplaceConfig
+from models.user.ebay_credentials import EbayCredentials
+from services.ebay.ebay_importer import EbayImporter
+from shared.tenant_resource_cache import tenant_resource_cache
+from temporal.activities.activity_resources import (
+    build_ebay_importer,
+    get_ebay_credentials,
+)
+
+
+def _make_db():
+    """Mock session answering the setup queries, counting them."""
+    creds = MagicMock(spec=EbayCredentials)
+    creds.id = 1
+    creds.refresh_token = "refresh"
+    creds.refresh_token_expires_at = datetime(2099, 1, 1, tzinfo=timezone.utc)
+
+    config = MagicMock(spec=MarketplaceConfig)
+    config.marketplace_id = "EBAY_FR"
+
+    def query(model):
+        q = MagicMock()
+        if model is EbayCredentials:
+            q.first.return_value = creds
+        elif model is MarketplaceConfig:
+            q.filter.return_value.first.return_value = config
+        elif model is AspectMapping:
+            q.all.return_value = []
+        return q
+
+    db = MagicMock()
+    db.query.side_effect = query
+    return db
+
+
+@pytest.fixture(autouse=True)
+def clear_cache(monkeypatch):
+    monkeypatch.setenv("EBAY_CLIENT_ID", "client")
+    monkeypatch.setenv("EBAY_CLIENT_SECRET", "secret")
+    tenant_resource_cache.clear()
+    yield
+    tenant_resource_cache.clear()
+
+
+class TestActivityResources:
+    """Setup overhead of eBay importers built by activities."""
+
+    def test_uncached_importer_setup_queries(self):
+        db = _make_db()
+
+        EbayImporter(db, 1, "EBAY_FR")
+
+        assert db.query.call_count == 5
+
+    def test_warm_cache_needs_no_query(self):
+        build_ebay_importer(_make_db(), 1, "EBAY_FR")
+
+        db = _make_db()
+        importer = build_ebay_importer(db, 1, "EBAY_FR")
+
+        assert db.query.call_count == 0
+        assert importer.offer_client.refresh_token == "refresh"
+        assert importer.inventory_client.marketplace_config.marketplace_id == "EBAY_FR"
+
+    def test_invalidation_reloads_credentials(self):
+        build_ebay_importer(_make_db(), 1, "EBAY_FR")
+        tenant_resource_cache.invalidate(1, "ebay")
+
+        db = _make_db()
+        build_ebay_importer(db, 1, "EBAY_FR")
+
+        queried = [call.args[0] for call in db.query.call_args_list]
+        assert queried == [EbayCredentials]
+
+    def test_missing_credentials_not_cached(self):
+        db = MagicMock()
+        db.query.return_value.first.return_value = None
+
+        assert get_ebay_credentials(db, 1) is None
+        assert get_ebay_credentials(db, 1) is None
+        assert db.query.call_count == 2
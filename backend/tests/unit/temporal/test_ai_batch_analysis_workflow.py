@@ -0,0 +1,213 @@
+"""
+Tests for AIBatchAnalysisWorkflow (temporal/workflows/ai/batch_analysis_workflow.py).
+
+The workflow runtime is mocked: execute_activity, info(), wait_condition
+and continue_as_new are patched on the temporalio workflow module.
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from temporalio import workflow
+from temporalio.workflow import ActivityCancellationType
+
+from temporal.activities.ai_activities import ai_analyze_product, ai_release_credits
+from temporal.workflows.ai import AIBatchAnalysisParams, AIBatchAnalysisWorkflow
+
+
+class _ContinueAsNew(workflow.ContinueAsNewError):
+    def __init__(self, params):
+        self.params = params
+
+
+@pytest.fixture
+def workflow_runtime():
+    """Analysis result by product_id: %10 == 0 fails, %3 == 0 is a cache hit."""
+    state = {"analyzed": [], "released": []}
+
+    async def fake_execute_activity(activity_fn, args, **kwargs):
+        await asyncio.sleep(0)
+        if activity_fn is ai_release_credits:
+            state["released"].append(args[1])
+            return {"success": True, "released": args[1], "error": None}
+
+        assert activity_fn is ai_analyze_product
+        product_id = args[1]
+        state["analyzed"].append(product_id)
+        if product_id % 10 == 0:
+            return {"success": False, "cached": False, "tokens_used": 0, "error": "boom"}
+        cached = product_id % 3 == 0
+        return {"success": True, "cached": cached, "tokens_used": 0 if cached else 100, "error": None}
+
+    async def fake_wait_condition(fn):
+        while not fn():
+            await asyncio.sleep(0)
+
+    def fake_continue_as_new(params):
+        raise _ContinueAsNew(params)
+
+    info = MagicMock()
+    info.is_continue_as_new_suggested.return_value = False
+
+    with patch("temporalio.workflow.execute_activity", side_effect=fake_execute_activity), \
+         patch("temporalio.workflow.info", return_value=info), \
+         patch("temporalio.workflow.wait_condition", side_effect=fake_wait_condition), \
+         patch("temporalio.workflow.continue_as_new", side_effect=fake_continue_as_new), \
+         patch("temporalio.workflow.logger"):
+        yield state
+
+
+def _params(product_ids, **kwargs) -> AIBatchAnalysisParams:
+    return AIBatchAnalysisParams(
+        user_id=1,
+        action="analyze",
+        product_ids=product_ids,
+        max_parallel=3,
+        reserved_credits=len(product_ids),
+        **kwargs,
+    )
+
+
+class TestAIBatchAnalysisWorkflow:
+    """Credit accounting, pause/resume and cancel."""
+
+    def test_activity_args(self):
+        params = _params([7], max_images=8)
+        assert AIBatchAnalysisWorkflow()._activity_args(params, 7) == [1, 7, 8]
+
+    def test_releases_credits_not_charged(self, workflow_runtime):
+        # 1..10: 10 fails, 3/6/9 are cache hits -> 6 charged, 4 released
+        result = asyncio.run(AIBatchAnalysisWorkflow().run(_params(list(range(1, 11)))))
+
+        assert result["status"] == "completed"
+        assert result["succeeded"] == 9
+        assert result["failed"] == 1
+        assert result["charged_credits"] == 6
+        assert result["released_credits"] == 4
+        assert workflow_runtime["released"] == [4]
+
+    def test_nothing_released_when_all_charged(self, workflow_runtime):
+        result = asyncio.run(AIBatchAnalysisWorkflow().run(_params([1, 2, 4])))
+
+        assert result["charged_credits"] == 3
+        assert workflow_runtime["released"] == []
+
+    def test_cancel_releases_unprocessed_credits(self, workflow_runtime):
+        wf = AIBatchAnalysisWorkflow()
+        wf.cancel()
+
+        result = asyncio.run(wf.run(_params([1, 2, 4])))
+
+        assert result["status"] == "cancelled"
+        assert workflow_runtime["analyzed"] == []
+        assert workflow_runtime["released"] == [3]
+
+    def test_pause_then_resume(self, workflow_runtime):
+        wf = AIBatchAnalysisWorkflow()
+
+        async def scenario():
+            wf.pause()
+            task = asyncio.create_task(wf.run(_params([1, 2, 4, 5])))
+            for _ in range(20):
+                await asyncio.sleep(0)
+            paused_status = wf.get_progress()["status"]
+            analyzed_while_paused = list(workflow_runtime["analyzed"])
+            wf.resume()
+            return paused_status, analyzed_while_paused, await task
+
+        paused_status, analyzed_while_paused, result = asyncio.run(scenario())
+
+        assert paused_status == "paused"
+        assert analyzed_while_paused == []
+        assert result["status"] == "completed"
+        assert result["succeeded"] == 4
+
+    def test_continue_as_new_carries_charged(self, workflow_runtime):
+        with patch("temporal.workflows.batch_action_workflow.CONTINUE_AS_NEW_EVERY", 4):
+            with pytest.raises(_ContinueAsNew) as exc:
+                asyncio.run(AIBatchAnalysisWorkflow().run(_params([1, 2, 3, 4, 5, 6], max_images=3)))
+
+        next_params = exc.value.params
+        assert isinstance(next_params, AIBatchAnalysisParams)
+        assert (next_params.product_ids, next_params.previously_processed) == ([5, 6], 4)
+        assert next_params.accumulated_charged == 3  # 1, 2, 4 (3 is cached)
+        assert next_params.reserved_credits == 6
+        assert next_params.max_images == 3
+        # Credits are released by the last run only
+        assert workflow_runtime["released"] == []
+
+    def test_resumed_run_releases_with_accumulated_charge(self, workflow_runtime):
+        params = _params([1, 2, 3, 4, 5, 6], offset=4, accumulated_succeeded=4, accumulated_charged=3)
+
+        result = asyncio.run(AIBatchAnalysisWorkflow().run(params))
+
+        # 5 charged -> 4 total, 6 cached
+        assert result["charged_credits"] == 4
+        assert workflow_runtime["released"] == [2]
+
+    def test_temporal_cancellation_releases_credits(self, workflow_runtime):
+        # handle.cancel() raises CancelledError in the workflow (no cancel signal)
+        wf = AIBatchAnalysisWorkflow()
+
+        async def scenario():
+            task = asyncio.create_task(wf.run(_params([1, 2, 4, 5, 7, 8])))
+            for _ in range(3):
+                await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(scenario())
+
+        assert workflow_runtime["released"] == [6 - wf._charged]
+        assert wf._released == 6 - wf._charged
+
+    def test_temporal_cancellation_keeps_finished_analyses_charged(self, workflow_runtime):
+        """Analyses running at cancellation are recorded before the release."""
+        finish = asyncio.Event()
+        item_kwargs = []
+        release_calls = workflow_runtime["released"]
+
+        async def fake_execute_activity(activity_fn, args, **kwargs):
+            if activity_fn is ai_release_credits:
+                release_calls.append(args[1])
+                return {"success": True, "released": args[1], "error": None}
+            item_kwargs.append(kwargs)
+            # WAIT_CANCELLATION_COMPLETED: the activity outcome is still awaited
+            while not finish.is_set():
+                try:
+                    await finish.wait()
+                except asyncio.CancelledError:
+                    pass
+            return {"success": True, "cached": False, "tokens_used": 100, "error": None}
+
+        wf = AIBatchAnalysisWorkflow()
+
+        async def scenario():
+            task = asyncio.create_task(wf.run(_params([1, 2])))
+            for _ in range(5):
+                await asyncio.sleep(0)
+            task.cancel()
+            for _ in range(5):
+                await asyncio.sleep(0)
+            finish.set()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        with patch("temporalio.workflow.execute_activity", side_effect=fake_execute_activity):
+            asyncio.run(scenario())
+
+        assert {k["cancellation_type"] for k in item_kwargs} == {
+            ActivityCancellationType.WAIT_CANCELLATION_COMPLETED
+        }
+        assert wf._charged == 2
+        assert release_calls == []  # Both analyses ran: nothing to refund
+
+    def test_failure_releases_credits_once(self, workflow_runtime):
+        wf = AIBatchAnalysisWorkflow()
+        with patch.object(wf, "_on_item_result", side_effect=RuntimeError("bug")):
+            with pytest.raises(RuntimeError):
+                asyncio.run(wf.run(_params([1, 2, 4])))
+
+        assert workflow_runtime["released"] == [3]
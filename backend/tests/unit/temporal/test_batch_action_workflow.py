@@ -0,0 +1,154 @@
+"""
+Tests for batch action workflows (temporal/workflows/batch_action_workflow.py).
+
+The workflow runtime is mocked: execute_activity, info() and
+continue_as_new are patched on the temporalio workflow module.
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from temporalio import workflow
+
+from temporal.workflows.batch_action_workflow import BatchActionParams
+from temporal.workflows.ebay.batch_action_workflow import EbayBatchActionWorkflow
+from temporal.workflows.etsy.batch_action_workflow import EtsyBatchActionWorkflow
+from temporal.workflows.vinted.batch_action_workflow import VintedBatchActionWorkflow
+
+
+class _ContinueAsNew(workflow.ContinueAsNewError):
+    def __init__(self, params):
+        self.params = params
+
+
+@pytest.fixture
+def workflow_runtime():
+    """Patch the Temporal workflow runtime used by the base class."""
+    state = {"in_flight": 0, "max_in_flight": 0, "calls": []}
+
+    async def fake_execute_activity(activity_fn, args, **kwargs):
+        state["calls"].append((activity_fn, args))
+        state["in_flight"] += 1
+        state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        await asyncio.sleep(0)
+        state["in_flight"] -= 1
+        product_id = args[1]
+        if product_id % 10 == 0:
+            return {"success": False, "error": f"boom {product_id}"}
+        return {"success": True}
+
+    def fake_continue_as_new(params):
+        raise _ContinueAsNew(params)
+
+    info = MagicMock()
+    info.is_continue_as_new_suggested.return_value = False
+
+    with patch("temporalio.workflow.execute_activity", side_effect=fake_execute_activity), \
+         patch("temporalio.workflow.info", return_value=info), \
+         patch("temporalio.workflow.continue_as_new", side_effect=fake_continue_as_new):
+        yield state
+
+
+class TestActivityArgs:
+    """Tests for per-marketplace activity arguments."""
+
+    def test_vinted_delete_args(self):
+        params = BatchActionParams(user_id=1, action="delete", shop_id=99, check_conditions=False)
+        assert VintedBatchActionWorkflow()._activity_args(params, 5) == [1, 5, 99, False]
+
+    def test_vinted_publish_args(self):
+        params = BatchActionParams(user_id=1, action="publish", shop_id=99)
+        assert VintedBatchActionWorkflow()._activity_args(params, 5) == [1, 5, 99]
+
+    def test_ebay_args(self):
+        params = BatchActionParams(user_id=1, action="cleanup", marketplace_id="EBAY_DE")
+        assert EbayBatchActionWorkflow()._activity_args(params, 5) == [1, 5, "EBAY_DE"]
+
+    def test_etsy_args(self):
+        params = BatchActionParams(user_id=1, action="update")
+        assert EtsyBatchActionWorkflow()._activity_args(params, 5) == [1, 5]
+
+
+class TestBatchExecution:
+    """Tests for BatchActionWorkflowBase._execute."""
+
+    @pytest.mark.asyncio
+    async def test_unsupported_action(self, workflow_runtime):
+        wf = EtsyBatchActionWorkflow()
+        result = await wf.run(BatchActionParams(user_id=1, action="publish", product_ids=[1]))
+
+        assert result["status"] == "failed"
+        assert "Unsupported action" in result["error"]
+        assert workflow_runtime["calls"] == []
+
+    @pytest.mark.asyncio
+    async def test_processes_all_items_with_results(self, workflow_runtime):
+        wf = EbayBatchActionWorkflow()
+        params = BatchActionParams(user_id=1, action="delete", product_ids=list(range(1, 21)), max_parallel=4)
+
+        result = await wf.run(params)
+
+        assert result["status"] == "completed"
+        assert result["processed"] == 20
+        assert result["succeeded"] == 18
+        assert result["failed_items"] == {"10": "boom 10", "20": "boom 20"}
+        assert 1 < workflow_runtime["max_in_flight"] <= 4
+        assert wf.get_item_result(3)["status"] == "completed"
+        assert wf.get_item_result(10) == {"product_id": 10, "status": "failed", "error": "boom 10"}
+        assert wf.get_item_result(999)["status"] == "unknown"
+
+    @pytest.mark.asyncio
+    async def test_continue_as_new_carries_compact_state(self, workflow_runtime):
+        with patch("temporal.workflows.batch_action_workflow.CONTINUE_AS_NEW_EVERY", 15):
+            wf = EbayBatchActionWorkflow()
+            params = BatchActionParams(user_id=1, action="update", product_ids=list(range(1, 41)))
+
+            with pytest.raises(_ContinueAsNew) as exc:
+                await wf.run(params)
+
+        next_params = exc.value.params
+        # Only the remaining IDs are carried, not the whole batch
+        assert next_params.product_ids == list(range(16, 41))
+        assert (next_params.previously_processed, next_params.offset) == (15, 0)
+        assert next_params.accumulated_succeeded == 14
+        assert next_params.accumulated_failed == 1
+        assert next_params.failed_items == {"10": "boom 10"}
+
+        # Next run processes the remaining IDs and finishes
+        wf2 = EbayBatchActionWorkflow()
+        with patch("temporal.workflows.batch_action_workflow.CONTINUE_AS_NEW_EVERY", 100):
+            result = await wf2.run(next_params)
+
+        assert (result["total"], result["processed"]) == (40, 40)
+        assert result["failed"] == 4
+        assert wf2.get_item_result(30)["status"] == "failed"
+        assert wf2.get_item_result(31)["status"] == "completed"
+        assert wf2.get_item_result(10)["status"] == "failed"
+        assert wf2.get_item_result(2)["status"] == "unknown"  # Completed by the first run
+
+    @pytest.mark.asyncio
+    async def test_run_chained_with_offset_resumes(self, workflow_runtime):
+        """Runs continued before the remaining-IDs format carry the full list + offset."""
+        wf = EbayBatchActionWorkflow()
+        params = BatchActionParams(
+            user_id=1, action="update", product_ids=list(range(1, 41)), offset=15,
+            accumulated_succeeded=14, accumulated_failed=1, failed_items={"10": "boom 10"},
+        )
+
+        result = await wf.run(params)
+
+        assert (result["total"], result["processed"], result["failed"]) == (40, 40, 4)
+        assert wf.get_item_result(2)["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_scheduling(self, workflow_runtime):
+        wf = EtsyBatchActionWorkflow()
+        wf.cancel()
+        params = BatchActionParams(user_id=1, action="delete", product_ids=[1, 2, 3])
+
+        result = await wf.run(params)
+
+        assert result["status"] == "cancelled"
+        assert result["processed"] == 0
+        assert wf.get_item_result(2)["status"] == "pending"
@@ -0,0 +1,162 @@
+"""
+Tests for Temporal custom search attributes (temporal/search_attributes.py).
+"""
+
+from dataclasses import dataclass
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from temporal import search_attributes
+from temporal.search_attributes import (
+    ACTION_TYPE,
+    MARKETPLACE,
+    USER_ID,
+    SearchAttributesInterceptor,
+    build_list_query,
+    build_search_attributes,
+    ensure_search_attributes,
+    parse_workflow_type,
+)
+
+
+@dataclass
+class _Params:
+    user_id: int
+    product_id: int = 1
+
+
+class TestParseWorkflowType:
+    """Tests for parse_workflow_type."""
+
+    @pytest.mark.parametrize(
+        "workflow_type,expected",
+        [
+            ("VintedPublishWorkflow", ("vinted", "publish")),
+            ("VintedBatchCleanupWorkflow", ("vinted", "batchcleanup")),
+            ("EbayOrdersSyncWorkflow", ("ebay", "orderssync")),
+            ("EtsyDeleteWorkflow", ("etsy", "delete")),
+            ("AIBatchAnalysisWorkflow", ("ai", "batchanalysis")),
+            ("SomethingElse", (None, None)),
+        ],
+    )
+    def test_parse(self, workflow_type, expected):
+        assert parse_workflow_type(workflow_type) == expected
+
+
+class TestBuildSearchAttributes:
+    """Tests for build_search_attributes."""
+
+    def test_all_attributes(self):
+        attrs = build_search_attributes("EbayPublishWorkflow", [_Params(user_id=42)])
+
+        assert attrs[USER_ID] == 42
+        assert attrs[MARKETPLACE] == "ebay"
+        assert attrs[ACTION_TYPE] == "publish"
+
+    def test_without_params(self):
+        attrs = build_search_attributes("VintedSyncWorkflow", [])
+
+        assert attrs.get(USER_ID) is None
+        assert attrs[MARKETPLACE] == "vinted"
+
+    def test_nothing_derivable(self):
+        assert build_search_attributes("Unknown", []) is None
+
+
+class TestBuildListQuery:
+    """Tests for build_list_query."""
+
+    def test_user_and_status_only(self):
+        assert build_list_query(5, "Running") == 'ExecutionStatus = "Running" AND (UserId = 5)'
+
+    def test_with_filters(self):
+        query = build_list_query(5, "Completed", marketplace="Vinted", action_type="Publish")
+
+        assert 'Marketplace = "vinted"' in query
+        assert 'ActionType = "publish"' in query
+        assert "LIKE" not in query
+
+    def test_legacy_executions_without_user_id(self):
+        """Executions started before registration (no UserId) are still listed."""
+        types = ["VintedPublishWorkflow", "VintedSyncWorkflow", "EbayPublishWorkflow"]
+
+        query = build_list_query(5, "Running", legacy_workflow_types=types)
+
+        assert query == (
+            'ExecutionStatus = "Running" AND ((UserId = 5) OR '
+            '(UserId IS NULL AND WorkflowId LIKE "%user-5%"))'
+        )
+
+    def test_legacy_clause_filters_by_workflow_type(self):
+        types = ["VintedPublishWorkflow", "VintedSyncWorkflow", "EbayPublishWorkflow"]
+
+        query = build_list_query(5, "Running", action_type="publish", legacy_workflow_types=types)
+
+        assert 'WorkflowType IN ("EbayPublishWorkflow", "VintedPublishWorkflow")' in query
+        assert build_list_query(
+            5, "Running", marketplace="etsy", legacy_workflow_types=types
+        ) == 'ExecutionStatus = "Running" AND (UserId = 5 AND Marketplace = "etsy")'
+
+    def test_ai_workflow_attributes(self):
+        attrs = build_search_attributes("AIBatchAnalysisWorkflow", [_Params(user_id=3)])
+
+        assert attrs[MARKETPLACE] == "ai"
+        assert attrs[ACTION_TYPE] == "batchanalysis"
+
+
+class TestSearchAttributesInterceptor:
+    """Tests for the client interceptor."""
+
+    @pytest.mark.asyncio
+    async def test_adds_attributes_when_enabled(self):
+        next_outbound = MagicMock()
+        next_outbound.start_workflow = AsyncMock()
+        outbound = SearchAttributesInterceptor().intercept_client(next_outbound)
+
+        input = MagicMock(workflow="EtsyPublishWorkflow", args=[_Params(user_id=3)], search_attributes=None)
+        with patch.object(search_attributes, "_indexed_enabled", True):
+            await outbound.start_workflow(input)
+
+        assert input.search_attributes[USER_ID] == 3
+        next_outbound.start_workflow.assert_awaited_once_with(input)
+
+    @pytest.mark.asyncio
+    async def test_untouched_when_disabled(self):
+        next_outbound = MagicMock()
+        next_outbound.start_workflow = AsyncMock()
+        outbound = SearchAttributesInterceptor().intercept_client(next_outbound)
+
+        input = MagicMock(workflow="EtsyPublishWorkflow", args=[_Params(user_id=3)], search_attributes=None)
+        with patch.object(search_attributes, "_indexed_enabled", False):
+            await outbound.start_workflow(input)
+
+        assert input.search_attributes is None
+
+
+class TestEnsureSearchAttributes:
+    """Tests for ensure_search_attributes."""
+
+    @pytest.mark.asyncio
+    async def test_registers_missing_only(self):
+        client = MagicMock()
+        client.operator_service.list_search_attributes = AsyncMock(
+            return_value=MagicMock(custom_attributes={"UserId": 2})
+        )
+        client.operator_service.add_search_attributes = AsyncMock()
+
+        with patch.object(search_attributes, "_indexed_enabled", False):
+            assert await ensure_search_attributes(client, "stoflow") is True
+            assert search_attributes.is_indexed_listing_enabled() is True
+
+        request = client.operator_service.add_search_attributes.await_args.args[0]
+        assert set(request.search_attributes.keys()) == {"Marketplace", "ActionType"}
+
+    @pytest.mark.asyncio
+    async def test_failure_keeps_legacy_listing(self):
+        client = MagicMock()
+        client.operator_service.list_search_attributes = AsyncMock(side_effect=RuntimeError("denied"))
+
+        with patch.object(search_attributes, "_indexed_enabled", True):
+            assert await ensure_search_attributes(client, "stoflow") is False
+            assert search_attributes.is_indexed_listing_enabled() is False
@@ -0,0 +1,202 @@
+"""
+Tests for Vinted Sync Workflow continue-as-new checkpoints.
+
+The workflow runtime is mocked (execute_activity, info, now, logger,
+continue_as_new, patched)
+and continue-as-new is emulated by starting a fresh workflow instance with
+the checkpoint params, exactly like Temporal does.
+
+The history-length test counts the history events of every run: replay cost
+is proportional to the history of the current run, so it must stay bounded
+whatever the wardrobe size.
+
+Replay compatibility is checked with the real Temporal Replayer against
+histories of executions started before the phase rewrite
+(histories/vinted_sync_legacy.json). To add one from a running cluster:
+    temporal workflow show --workflow-id <id> --output json > histories/<name>.json
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from temporalio.client import WorkflowHistory
+from temporalio.worker import Replayer, UnsandboxedWorkflowRunner
+
+from temporal.activities.vinted_activities import (
+    count_vinted_ids_to_enrich,
+    detect_sold_with_active_listing,
+    enrich_single_product,
+    fetch_and_sync_page,
+    get_vinted_ids_to_enrich,
+    sync_sold_status,
+)
+from temporal.workflows.vinted import sync_workflow
+from temporal.workflows.vinted.sync_workflow import VintedSyncParams, VintedSyncWorkflow
+
+HISTORIES_DIR = Path(__file__).parent / "histories"
+
+ITEMS_PER_PAGE = 96
+# Events recorded per activity (scheduled, started, completed)
+EVENTS_PER_ACTIVITY = 3
+
+
+class _ContinueAsNew(Exception):
+    def __init__(self, params):
+        self.params = params
+
+
+class _FakeVinted:
+    """Fake activities for a wardrobe of `size` products."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.ids = list(range(1000, 1000 + size))
+        self.enriched = []
+        self.pages = []
+        self.history_length = 0
+
+    async def execute_activity(self, activity_fn, args, **kwargs):
+        self.history_length += EVENTS_PER_ACTIVITY
+
+        if activity_fn is fetch_and_sync_page:
+            page = args[2]
+            self.pages.append(page)
+            total_pages = max(1, -(-self.size // ITEMS_PER_PAGE))
+            synced = len(self.ids[(page - 1) * ITEMS_PER_PAGE: page * ITEMS_PER_PAGE])
+            return {"synced": synced, "errors": 0, "total_pages": total_pages}
+        if activity_fn is count_vinted_ids_to_enrich:
+            return len(self.ids)
+        if activity_fn is get_vinted_ids_to_enrich:
+            _, _, cursor, limit = args
+            return [i for i in self.ids if i > cursor][:limit]
+        if activity_fn is enrich_single_product:
+            self.enriched.append(args[1])
+            return {"success": True}
+        if activity_fn is sync_sold_status:
+            return {"updated_count": 2}
+        if activity_fn is detect_sold_with_active_listing:
+            return {"pending_count": 1}
+        raise AssertionError(f"unexpected activity {activity_fn}")
+
+
+async def _run_to_completion(fake: _FakeVinted, params: VintedSyncParams):
+    """Run the workflow, following continue-as-new. Returns (result, runs)."""
+    info = MagicMock()
+    info.is_continue_as_new_suggested.return_value = False
+    info.get_current_history_length.side_effect = lambda: fake.history_length
+
+    def fake_continue_as_new(next_params):
+        raise _ContinueAsNew(next_params)
+
+    runs = []
+    with patch("temporalio.workflow.execute_activity", side_effect=fake.execute_activity), \
+         patch("temporalio.workflow.info", return_value=info), \
+         patch("temporalio.workflow.now", return_value=datetime(2026, 2, 3, tzinfo=timezone.utc)), \
+         patch("temporalio.workflow.continue_as_new", side_effect=fake_continue_as_new), \
+         patch("temporalio.workflow.patched", return_value=True), \
+         patch("temporalio.workflow.logger"):
+        while True:
+            fake.history_length = 0
+            try:
+                result = await VintedSyncWorkflow().run(params)
+                runs.append((params.phase, fake.history_length))
+                return result, runs
+            except _ContinueAsNew as exc:
+                runs.append((params.phase, fake.history_length))
+                params = exc.params
+
+
+class TestVintedSyncCheckpoints:
+    """Continue-as-new checkpoints in every phase."""
+
+    @pytest.mark.asyncio
+    async def test_small_wardrobe_single_run(self):
+        fake = _FakeVinted(50)
+
+        result, runs = await _run_to_completion(fake, VintedSyncParams(user_id=1, shop_id=2))
+
+        assert len(runs) == 1
+        assert result["status"] == "completed"
+        assert result["final_count"] == 50
+        assert result["enriched"] == 50
+        assert result["sold_updated"] == 2
+        assert result["cleanup_proposed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_enrich_resumes_from_cursor_without_duplicates(self):
+        fake = _FakeVinted(1200)
+
+        result, runs = await _run_to_completion(fake, VintedSyncParams(user_id=1, shop_id=2))
+
+        assert result["enriched"] == 1200
+        assert fake.enriched == fake.ids  # each product enriched exactly once, in order
+        # Run 1: sync + first 500, runs 2-3: next chunks, then sold_sync/cleanup
+        assert [phase for phase, _ in runs] == ["sync", "enrich", "enrich", "sold_sync"]
+
+    @pytest.mark.asyncio
+    async def test_sync_phase_checkpoint_keeps_pages_sequential(self):
+        fake = _FakeVinted(ITEMS_PER_PAGE * 250)
+
+        with patch.object(sync_workflow, "ENRICH_ITEMS_PER_RUN", 10_000):
+            result, runs = await _run_to_completion(fake, VintedSyncParams(user_id=1, shop_id=2))
+
+        assert fake.pages == list(range(1, 251))
+        assert result["final_count"] == ITEMS_PER_PAGE * 250
+        assert [phase for phase, _ in runs][:3] == ["sync", "sync", "sync"]
+
+    @pytest.mark.asyncio
+    async def test_resume_at_phase(self):
+        fake = _FakeVinted(10)
+        params = VintedSyncParams(
+            user_id=1, shop_id=2, phase="sold_sync",
+            sync_start_time="2026-02-03T00:00:00+00:00",
+            accumulated_synced=10, accumulated_enriched=10,
+        )
+
+        result, _ = await _run_to_completion(fake, params)
+
+        assert fake.pages == []
+        assert fake.enriched == []
+        assert result["final_count"] == 10
+        assert result["sold_updated"] == 2
+
+
+class TestHistoryLength:
+    """History per run (= replay cost) is bounded whatever the wardrobe size."""
+
+    @pytest.mark.asyncio
+    async def test_history_bounded_for_large_wardrobes(self):
+        # A phase may start in a run whose history is below the boundary threshold
+        bound = sync_workflow.PHASE_CHECKPOINT_HISTORY_LENGTH + (
+            max(sync_workflow.SYNC_PAGES_PER_RUN, sync_workflow.ENRICH_ITEMS_PER_RUN) + 4
+        ) * EVENTS_PER_ACTIVITY
+
+        runs_by_size = {}
+        for size in (500, 5_000, 20_000):
+            fake = _FakeVinted(size)
+            result, runs = await _run_to_completion(fake, VintedSyncParams(user_id=1, shop_id=2))
+
+            assert result["enriched"] == size
+            assert max(length for _, length in runs) <= bound
+            runs_by_size[size] = len(runs)
+
+        # More runs, not longer ones
+        assert runs_by_size[20_000] > runs_by_size[5_000] > runs_by_size[500]
+
+
+class TestReplayCompatibility:
+    """Executions started before the phase rewrite still replay."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("history_file", sorted(HISTORIES_DIR.glob("vinted_sync_*.json")))
+    async def test_legacy_history_replays(self, history_file):
+        history = WorkflowHistory.from_json(history_file.stem, history_file.read_text())
+
+        result = await Replayer(
+            workflows=[VintedSyncWorkflow],
+            workflow_runner=UnsandboxedWorkflowRunner(),
+        ).replay_workflow(history, raise_on_replay_failure=False)
+
+        assert result.replay_failure is None
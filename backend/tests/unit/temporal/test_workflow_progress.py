@@ -0,0 +1,185 @@
+"""
+Tests for workflow progress push (temporal/progress.py).
+
+Covers user resolution, per-workflow coalescing of progress events, and
+publication after the workflow code has handled an activity result.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from temporalio.client import WorkflowHistory
+from temporalio.worker import Replayer, UnsandboxedWorkflowRunner
+
+from temporal import progress
+from temporal.progress import (
+    WORKFLOW_PROGRESS_EVENT,
+    WorkflowProgressPublisher,
+    WorkflowProgressInterceptor,
+    _ProgressWorkflowInbound,
+    extract_user_id,
+)
+from temporal.workflows.vinted.sync_workflow import VintedSyncWorkflow
+
+HISTORY = Path(__file__).parent / "histories" / "vinted_sync_legacy.json"
+
+
+@dataclass
+class _Params:
+    user_id: int
+
+
+class TestExtractUserId:
+    """Tests for extract_user_id."""
+
+    def test_from_params(self):
+        assert extract_user_id("vinted-cleanup-product-9", (_Params(user_id=7),)) == 7
+
+    def test_from_workflow_id(self):
+        assert extract_user_id("ebay-publish-user-42-product-3") == 42
+
+    def test_unknown(self):
+        assert extract_user_id("ebay-cleanup-product-3") is None
+
+
+@pytest.fixture
+def mock_emit():
+    with patch(
+        "services.websocket_service.WebSocketService.emit_to_user",
+        new_callable=AsyncMock,
+    ) as mock:
+        yield mock
+
+
+class TestWorkflowProgressPublisher:
+    """Tests for WorkflowProgressPublisher coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_unbound_publisher_is_noop(self, mock_emit):
+        publisher = WorkflowProgressPublisher(min_interval_seconds=0.01)
+        publisher.publish(1, "wf-user-1", {"status": "running"})
+        await asyncio.sleep(0.05)
+        mock_emit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_burst_is_coalesced_to_latest(self, mock_emit):
+        publisher = WorkflowProgressPublisher(min_interval_seconds=0.05)
+        publisher.bind_loop(asyncio.get_running_loop())
+
+        for i in range(20):
+            publisher.publish(1, "wf-user-1", {"status": "running", "current": i})
+        await asyncio.sleep(0.15)
+
+        assert mock_emit.await_count == 1
+        user_id, event, payload = mock_emit.await_args.args
+        assert user_id == 1
+        assert event == WORKFLOW_PROGRESS_EVENT
+        assert payload["current"] == 19
+
+    @pytest.mark.asyncio
+    async def test_rate_is_bounded(self, mock_emit):
+        publisher = WorkflowProgressPublisher(min_interval_seconds=0.05)
+        publisher.bind_loop(asyncio.get_running_loop())
+
+        for i in range(30):
+            publisher.publish(1, "wf-user-1", {"status": "running", "current": i})
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+
+        # ~0.3s of updates at 1 event / 0.05s => far fewer than 30 events
+        assert 2 <= mock_emit.await_count <= 10
+        assert mock_emit.await_args.args[2]["current"] == 29
+
+    @pytest.mark.asyncio
+    async def test_terminal_status_flushed_immediately(self, mock_emit):
+        publisher = WorkflowProgressPublisher(min_interval_seconds=10)
+        publisher.bind_loop(asyncio.get_running_loop())
+
+        publisher.publish(1, "wf-user-1", {"status": "running"})
+        publisher.publish(1, "wf-user-1", {"status": "completed"})
+        await asyncio.sleep(0.05)
+
+        assert mock_emit.await_count == 1
+        assert mock_emit.await_args.args[2]["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_workflows_are_coalesced_independently(self, mock_emit):
+        publisher = WorkflowProgressPublisher(min_interval_seconds=0.02)
+        publisher.bind_loop(asyncio.get_running_loop())
+
+        publisher.publish(1, "wf-a-user-1", {"status": "running"})
+        publisher.publish(2, "wf-b-user-2", {"status": "running"})
+        await asyncio.sleep(0.1)
+
+        assert {call.args[0] for call in mock_emit.await_args_list} == {1, 2}
+
+    @pytest.mark.asyncio
+    async def test_stale_throttle_timestamps_evicted(self, mock_emit):
+        publisher = WorkflowProgressPublisher(min_interval_seconds=0.01)
+        publisher.bind_loop(asyncio.get_running_loop())
+
+        # Workflows ending without a terminal snapshot
+        for i in range(5):
+            publisher.publish(1, f"wf-{i}-user-1", {"status": "running"})
+        await asyncio.sleep(0.05)
+        assert len(publisher._last_emit) == 5
+
+        with patch.object(progress, "LAST_EMIT_SWEEP_SECONDS", 0):
+            publisher.publish(1, "wf-new-user-1", {"status": "running"})
+            await asyncio.sleep(0.05)
+
+        assert list(publisher._last_emit) == ["wf-new-user-1"]
+
+
+class TestProgressInterceptor:
+    """Tests for the publication point of _ProgressWorkflowInbound."""
+
+    @pytest.mark.asyncio
+    async def test_publishes_after_workflow_code_updates_counters(self):
+        publisher = MagicMock()
+        workflow_instance = SimpleNamespace(current=0)
+        workflow_instance.get_progress = lambda: {"status": "running", "current": workflow_instance.current}
+        inbound = _ProgressWorkflowInbound(MagicMock(), publisher)
+        inbound._instance = workflow_instance
+        inbound._user_id = 1
+
+        async def wait_condition(condition):
+            # Temporal checks conditions once no workflow coroutine is ready
+            while not condition():
+                await asyncio.sleep(0)
+
+        fake_workflow = MagicMock(wait_condition=wait_condition)
+        fake_workflow.unsafe.is_replaying.return_value = False
+        fake_workflow.info.return_value = SimpleNamespace(workflow_id="wf-user-1", workflow_type="Wf")
+
+        with patch.object(progress, "workflow", fake_workflow):
+            task = asyncio.create_task(inbound._publish_when_dirty())
+            await asyncio.sleep(0)
+
+            # Activity resolves (done callback), then the workflow code updates its counters
+            inbound.mark_dirty()
+            workflow_instance.current = 1
+            await asyncio.sleep(0.01)
+            task.cancel()
+
+        publisher.publish.assert_called_once()
+        assert publisher.publish.call_args.args[2]["current"] == 1
+
+    @pytest.mark.asyncio
+    async def test_interceptor_keeps_replay_deterministic(self):
+        """The publish task adds no command: recorded histories still replay."""
+        history = WorkflowHistory.from_json(HISTORY.stem, HISTORY.read_text())
+        publisher = MagicMock()
+
+        result = await Replayer(
+            workflows=[VintedSyncWorkflow],
+            workflow_runner=UnsandboxedWorkflowRunner(),
+            interceptors=[WorkflowProgressInterceptor(publisher)],
+        ).replay_workflow(history, raise_on_replay_failure=False)
+
+        assert result.replay_failure is None
+        publisher.publish.assert_not_called()  # Nothing emitted during replay
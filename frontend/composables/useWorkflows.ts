@@ -1,15 +1,19 @@
 /**
- * Composable for managing Temporal workflows with polling
+ * Composable for managing Temporal workflows
  *
- * Replaces usePlatformJobs.ts — polls Temporal workflow status
+ * Replaces usePlatformJobs.ts — tracks Temporal workflow status
  * instead of MarketplaceJob database rows.
  *
+ * Progress is pushed by the backend as `workflow_progress` Socket.IO events.
+ * HTTP polling is kept as a fallback and slowed down while the socket is up.
+ *
  * API endpoints:
  * - GET /api/workflows?marketplace={platform}&workflow_status=Running
  * - GET /api/workflows/{workflow_id}/progress
  * - POST /api/workflows/{workflow_id}/cancel
  */
 import { platformLogger } from '~/utils/logger'
+import { useWebSocket } from './useWebSocket'
 
 export type PlatformCode = 'vinted' | 'ebay' | 'etsy'
 
@@ -28,9 +32,22 @@ export interface WorkflowProgress {
   error: string | null
 }
 
+/** Payload of the `workflow_progress` Socket.IO event (get_progress() + ids) */
+export interface WorkflowProgressEvent extends Record<string, any> {
+  workflow_id: string
+  workflow_type: string
+  status: string
+}
+
+const WORKFLOW_PROGRESS_EVENT = 'workflow_progress'
+const TERMINAL_STATUSES = ['completed', 'failed', 'cancelled', 'error']
+// While the socket is connected, only 1 poll out of N is sent (safety net)
+const SOCKET_POLL_DIVIDER = 10
+
 interface WorkflowListResponse {
   workflows: WorkflowSummary[]
   total: number
+  next_page_token: string | null
 }
 
 interface CancelResponse {
@@ -75,6 +92,7 @@ function extractAction(workflowType: string): string {
 
 export const useWorkflows = (platformCode: PlatformCode) => {
   const { get, post } = useApi()
+  const { socket, isConnected: isSocketConnected } = useWebSocket()
   const config = PLATFORM_CONFIGS[platformCode]
 
   // State
@@ -84,6 +102,9 @@ export const useWorkflows = (platformCode: PlatformCode) => {
   const error = ref<string | null>(null)
   const pollingInterval = ref<ReturnType<typeof setInterval> | null>(null)
   const isPolling = ref(false)
+  const progressById = ref<Record<string, WorkflowProgressEvent>>({})
+  let pollTick = 0
+  let stopSocketWatch: (() => void) | null = null
 
   /**
    * Fetch active (running) workflows for this marketplace
@@ -158,7 +179,34 @@ export const useWorkflows = (platformCode: PlatformCode) => {
   }
 
   /**
-   * Start polling for active workflows (client-side only)
+   * Handle a pushed progress event (Socket.IO)
+   */
+  const handleProgressEvent = (data: WorkflowProgressEvent): void => {
+    if (!data?.workflow_id?.startsWith(platformCode)) return
+
+    progressById.value = { ...progressById.value, [data.workflow_id]: data }
+
+    const idx = workflows.value.findIndex(w => w.workflow_id === data.workflow_id)
+    const isTerminal = TERMINAL_STATUSES.includes(String(data.status).toLowerCase())
+
+    if (isTerminal) {
+      if (idx !== -1) workflows.value.splice(idx, 1)
+    } else if (idx === -1) {
+      workflows.value.push({
+        workflow_id: data.workflow_id,
+        workflow_type: data.workflow_type,
+        status: 'Running',
+        start_time: null,
+        marketplace: platformCode,
+      })
+    }
+    activeWorkflowsCount.value = workflows.value.length
+  }
+
+  /**
+   * Start tracking active workflows (client-side only)
+   *
+   * Listens to pushed progress events and polls as a fallback.
    */
   const startPolling = (intervalMs = 3000): void => {
     if (!import.meta.client) return
@@ -168,23 +216,35 @@ export const useWorkflows = (platformCode: PlatformCode) => {
     }
 
     isPolling.value = true
+    // The socket may be created (login, session restore) or replaced after
+    // tracking starts: follow the current instance
+    stopSocketWatch = watch(socket, (current, previous) => {
+      previous?.off(WORKFLOW_PROGRESS_EVENT, handleProgressEvent)
+      current?.on(WORKFLOW_PROGRESS_EVENT, handleProgressEvent)
+    }, { immediate: true })
 
     // Initial fetch
     fetchActiveWorkflows()
 
+    pollTick = 0
     pollingInterval.value = setInterval(() => {
+      pollTick++
+      if (isSocketConnected.value && pollTick % SOCKET_POLL_DIVIDER !== 0) return
       fetchActiveWorkflows()
     }, intervalMs)
   }
 
   /**
-   * Stop polling
+   * Stop tracking
    */
   const stopPolling = (): void => {
     if (pollingInterval.value) {
       clearInterval(pollingInterval.value)
       pollingInterval.value = null
     }
+    stopSocketWatch?.()
+    stopSocketWatch = null
+    socket.value?.off(WORKFLOW_PROGRESS_EVENT, handleProgressEvent)
     isPolling.value = false
   }
 
@@ -241,6 +301,7 @@ export const useWorkflows = (platformCode: PlatformCode) => {
       cleanup: 'Nettoyage',
       batchcleanup: 'Nettoyage batch',
       prosellerscan: 'Scan vendeurs pro',
+      batchaction: 'Action groupée',
     }
     return labels[action] || action
   }
@@ -262,6 +323,7 @@ export const useWorkflows = (platformCode: PlatformCode) => {
     isLoading,
     error,
     isPolling,
+    progressById,
 
     // Methods
     fetchActiveWorkflows,